@@ -305,6 +305,40 @@ class SimilarityABC(utils.SaveLoad):
         """
         raise NotImplementedError("cannot instantiate Abstract Base Class")
 
+    # least-recently-used cache of query results, if enabled, see enable_cache()
+    query_cache = None
+
+    def enable_cache(self, max_entries=1024, max_bytes=64 * 1024 ** 2):
+        """Start caching the results of single-document queries.
+
+        Repeated queries are answered from the cache, without scanning the index again. Queries are matched by
+        content, so a bag-of-words query with the same non-zero entries in a different order is a repeat too.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of cached results.
+        max_bytes : int, optional
+            Maximum (estimated) total size of the cached results, in bytes.
+
+        Returns
+        -------
+        :class:`~gensim.utils.QueryResultCache`
+            The cache, with its hit and miss counters in :meth:`~gensim.utils.QueryResultCache.stats`.
+
+        """
+        self.query_cache = utils.QueryResultCache(max_entries=max_entries, max_bytes=max_bytes)
+        return self.query_cache
+
+    def disable_cache(self):
+        """Stop caching query results and drop the cache."""
+        self.query_cache = None
+
+    def invalidate_cache(self):
+        """Drop all cached query results. Must be called whenever the indexed documents change."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate()
+
     def __getitem__(self, query):
         """Get similarities of the given document or corpus against this index.
 
@@ -315,6 +349,52 @@ class SimilarityABC(utils.SaveLoad):
         Passing an entire corpus as `query` can be more efficient than passing its documents one after another,
         because it will issue queries in batches internally.
 
+        The results of single-document queries are cached if
+        :meth:`~gensim.interfaces.SimilarityABC.enable_cache` was called.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number)}
+            Document in the sparse Gensim bag-of-words format, or a streamed corpus of such documents.
+
+        Returns
+        -------
+        {`scipy.sparse.csr.csr_matrix`, list of (int, float)}
+            Similarities given document or corpus and objects corpus, depends on `query`.
+
+        """
+        cache = self.query_cache
+        if cache is None:
+            return self._query(query)
+        key = cache.make_key(query, *self._cache_params())
+        if key is None:
+            return self._query(query)
+        result = cache.get(key)
+        if result is None:
+            result = self._query(query)
+            cache.put(key, result)
+        return result
+
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, made part of the cache key of every query.
+
+        Indexes with more such settings (such as the number of probed lists of an inverted file index) add them
+        to the tuple, so that changing any of them never answers a query from a stale cached result.
+
+        Returns
+        -------
+        tuple
+            Hashable settings.
+
+        """
+        return (
+            self.num_best, getattr(self, 'normalize', None), getattr(self, 'norm', None),
+            getattr(self, 'maintain_sparsity', False)
+        )
+
+    def _query(self, query):
+        """Get similarities of the given document or corpus against this index, bypassing the cache.
+
         Parameters
         ----------
         query : {list of (int, number), iterable of list of (int, number)}
@@ -373,7 +453,7 @@ class SimilarityABC(utils.SaveLoad):
         # bigger query of N documents is faster than N small queries of one
         # document.
         #
-        # After computing similarities of the bigger query in `self[chunk]`,
+        # After computing similarities of the bigger query in `self._query(chunk)` (bypassing the query cache),
         # yield the resulting similarities one after another, so that it looks
         # exactly the same as if they had been computed with many small queries.
         try:
@@ -391,11 +471,11 @@ class SimilarityABC(utils.SaveLoad):
                 # scipy.sparse happy
                 chunk_end = min(self.index.shape[0], chunk_start + self.chunksize)
                 chunk = self.index[chunk_start: chunk_end]
-                for sim in self[chunk]:
+                for sim in self._query(chunk):
                     yield sim
         else:
             for doc in self.index:
-                yield self[doc]
+                yield self._query(doc)
 
         # restore old normalization value
         self.normalize = norm
@@ -36,10 +36,13 @@ from gensim import utils
 import logging
 from timeit import default_timer
 import threading
+import itertools
+import mmap
+import multiprocessing
 from six.moves import xrange
 from six import itervalues, string_types
 from gensim import matutils
-from numpy import float32 as REAL, ones, random, dtype, zeros
+from numpy import float32 as REAL, ones, random, dtype, zeros, frombuffer, memmap
 from types import GeneratorType
 from gensim.utils import deprecated
 import warnings
@@ -48,13 +51,56 @@ import copy
 
 
 try:
-    from queue import Queue
+    from queue import Queue, Empty
 except ImportError:
-    from Queue import Queue
+    from Queue import Queue, Empty
 
 logger = logging.getLogger(__name__)
 
 
+def _fork_context():
+    """Get a multiprocessing context that forks its worker processes, so that they inherit the parent's memory maps."""
+    if os.name == 'nt':
+        raise RuntimeError("worker processes require fork(), which is not available on Windows")
+    if hasattr(multiprocessing, 'get_context'):
+        return multiprocessing.get_context('fork')
+    return multiprocessing  # Python 2 always forks on POSIX
+
+
+def _in_shared_memory(array):
+    """Check whether `array` lives in a shared memory mapping, so that forked processes update it in place."""
+    base = array
+    while base is not None:
+        if isinstance(base, memmap):
+            return base.mode in ('r+', 'w+')  # 'c' maps are private to each process, 'r' maps are read-only
+        if isinstance(base, mmap.mmap):
+            return True
+        base = base.obj if isinstance(base, memoryview) else getattr(base, 'base', None)
+    return False
+
+
+def _to_shared_memory(array):
+    """Copy `array` to anonymous shared memory, unless it is already shared.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Input array.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with the same shape, type and content as `array`, whose memory is shared with forked child processes.
+
+    """
+    if _in_shared_memory(array):
+        return array
+    shared = frombuffer(mmap.mmap(-1, max(array.nbytes, 1)), dtype=array.dtype, count=array.size)
+    shared = shared.reshape(array.shape)
+    shared[...] = array
+    return shared
+
+
 class BaseAny2VecModel(utils.SaveLoad):
     r"""Base class for training, using and evaluating \*2vec model.
 
@@ -137,6 +183,15 @@ class BaseAny2VecModel(utils.SaveLoad):
         """Check that the training parameters provided make sense. e.g. raise error if `epochs` not provided."""
         raise NotImplementedError()
 
+    def _shared_memory_arrays(self):
+        """Get the arrays read and updated by training, as a list of (object, attribute name) pairs."""
+        raise NotImplementedError("training with worker processes is not supported by %s" % self.__class__.__name__)
+
+    def _share_memory(self):
+        """Move the arrays updated by training to shared memory, so that worker processes can update them in place."""
+        for owner, attr in self._shared_memory_arrays():
+            setattr(owner, attr, _to_shared_memory(getattr(owner, attr)))
+
     def _check_input_data_sanity(self, data_iterable=None, corpus_file=None):
         """Check that only one argument is None."""
         if not (data_iterable is None) ^ (corpus_file is None):
@@ -151,12 +206,13 @@ class BaseAny2VecModel(utils.SaveLoad):
 
         Parameters
         ----------
-        corpus_file : str
-            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+        corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
         thread_id : int
             Thread index starting from 0 to `number of workers - 1`.
         offset : int
-            Offset (in bytes) in the `corpus_file` for particular worker.
+            Offset in the `corpus_file` for particular worker: in bytes for a path, in sentences for a pre-indexed
+            corpus.
         cython_vocab : :class:`~gensim.models.word2vec_inner.CythonVocab`
             Copy of the vocabulary in order to access it without GIL.
         progress_queue : Queue of (int, int, int)
@@ -217,6 +273,79 @@ class BaseAny2VecModel(utils.SaveLoad):
             jobs_processed += 1
         logger.debug("worker exiting, processed %i jobs", jobs_processed)
 
+    def _worker_loop_slice(self, data_iterable, worker_id, progress_queue, epoch_progress, cur_epoch=0,
+                           total_examples=None, total_words=None):
+        """Train the model on every `self.workers`-th example of `data_iterable`, starting from example `worker_id`.
+
+        This function will be called in parallel by multiple worker processes, each iterating over the input on its
+        own, instead of waiting for the jobs of :meth:`~gensim.models.base_any2vec.BaseAny2VecModel._job_producer`.
+
+        Parameters
+        ----------
+        data_iterable : iterable of list of objects
+            The input corpus.
+        worker_id : int
+            Worker index starting from 0 to `number of workers - 1`.
+        progress_queue : Queue of (int, int, int)
+            A queue of progress reports. Each report is represented as a tuple of these 3 elements:
+                * Size of data chunk processed, for example number of sentences in the corpus chunk.
+                * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
+                * Total word count used in training.
+        epoch_progress : :class:`multiprocessing.Value`
+            Number of examples (or raw words, if `total_examples` is not known) processed by all workers in the
+            current epoch so far, used to decay the learning rate.
+        cur_epoch : int, optional
+            The current training epoch, needed to compute the training parameters for each job.
+        total_examples : int, optional
+            Count of objects in the `data_iterable`, used for the learning rate decay.
+        total_words : int, optional
+            Count of raw words in the `data_iterable`, used for the learning rate decay if `total_examples` is None.
+
+        """
+        def job_batches():
+            job_batch, batch_size = [], 0
+            for data in itertools.islice(data_iterable, worker_id, None, self.workers):
+                data_length = self._raw_word_count([data])
+                if job_batch and batch_size + data_length > self.batch_words:
+                    yield job_batch
+                    job_batch, batch_size = [], 0
+                job_batch.append(data)
+                batch_size += data_length
+            if job_batch:
+                yield job_batch
+
+        thread_private_mem = self._get_thread_working_mem()
+        job_params = self._get_job_params(cur_epoch)
+        jobs_processed = 0
+        for job_batch in job_batches():
+            tally, raw_tally = self._do_train_job(job_batch, job_params, thread_private_mem)
+            progress_queue.put((len(job_batch), tally, raw_tally))  # report back progress
+            jobs_processed += 1
+
+            # update the learning rate for the next job, from the progress of all workers
+            with epoch_progress.get_lock():
+                epoch_progress.value += len(job_batch) if total_examples else raw_tally
+                progress = epoch_progress.value / (total_examples or total_words)
+            job_params = self._update_job_params(job_params, progress, cur_epoch)
+
+        progress_queue.put(None)
+        logger.debug("worker %i exiting, processed %i jobs", worker_id, jobs_processed)
+
+    def _worker_process(self, worker_loop, args, kwargs, progress_queue, training_loss, seed):
+        """Run `worker_loop(*args, **kwargs)` in a worker process and add its share of the loss to `training_loss`."""
+        if hasattr(self, 'random'):
+            # the copy of the parent's random state would be the same in every epoch
+            self.random = random.RandomState(seed)
+        initial_loss = getattr(self, 'running_training_loss', 0.0)
+        try:
+            worker_loop(*args, **kwargs)
+        except BaseException:
+            logger.exception("worker process failed")
+            progress_queue.put(None)  # don't let the parent wait for this worker forever
+            raise
+        with training_loss.get_lock():
+            training_loss.value += getattr(self, 'running_training_loss', 0.0) - initial_loss
+
     def _job_producer(self, data_iterator, job_queue, cur_epoch=0, total_examples=None, total_words=None):
         """Fill the jobs queue using the data found in the input stream.
 
@@ -300,7 +429,7 @@ class BaseAny2VecModel(utils.SaveLoad):
         raise NotImplementedError()
 
     def _log_epoch_progress(self, progress_queue=None, job_queue=None, cur_epoch=0, total_examples=None,
-                            total_words=None, report_delay=1.0, is_corpus_file_mode=None):
+                            total_words=None, report_delay=1.0, is_corpus_file_mode=None, processes=None):
         """Get the progress report for a single training epoch.
 
         Parameters
@@ -327,6 +456,9 @@ class BaseAny2VecModel(utils.SaveLoad):
             Number of seconds between two consecutive progress report messages in the logger.
         is_corpus_file_mode : bool, optional
             Whether training is file-based (corpus_file argument) or not.
+        processes : list of :class:`multiprocessing.Process`, optional
+            Worker processes that report to `progress_queue`. They are checked while waiting for reports, so that
+            a worker killed before reporting its end doesn't block training forever.
 
         Returns
         -------
@@ -336,6 +468,11 @@ class BaseAny2VecModel(utils.SaveLoad):
                 * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
                 * Total word count used in training.
 
+        Raises
+        ------
+        RuntimeError
+            If one of the worker `processes` died. The other ones are terminated.
+
         """
         example_count, trained_word_count, raw_word_count = 0, 0, 0
         start, next_report = default_timer() - 0.00001, 1.0
@@ -343,7 +480,14 @@ class BaseAny2VecModel(utils.SaveLoad):
         unfinished_worker_count = self.workers
 
         while unfinished_worker_count > 0:
-            report = progress_queue.get()  # blocks if workers too slow
+            if processes is None:
+                report = progress_queue.get()  # blocks if workers too slow
+            else:
+                try:
+                    report = progress_queue.get(timeout=1.0)
+                except Empty:
+                    self._check_worker_processes(processes)
+                    continue
             if report is None:  # a thread reporting that it finished
                 unfinished_worker_count -= 1
                 logger.info("worker thread finished; awaiting finish of %i more threads", unfinished_worker_count)
@@ -371,6 +515,64 @@ class BaseAny2VecModel(utils.SaveLoad):
         self.total_train_time += elapsed
         return trained_word_count, raw_word_count, job_tally
 
+    def _check_worker_processes(self, processes):
+        """Raise if a worker process died, after terminating the other ones.
+
+        Parameters
+        ----------
+        processes : list of :class:`multiprocessing.Process`
+            The worker processes of the current epoch.
+
+        Raises
+        ------
+        RuntimeError
+            If a worker process exited with an error, or was killed.
+
+        """
+        failed = [process for process in processes if process.exitcode]
+        if not failed:
+            return
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        raise RuntimeError(
+            "%i of %i worker processes failed (exit codes %s), see the log for details" %
+            (len(failed), len(processes), ", ".join(str(process.exitcode) for process in failed))
+        )
+
+    def _prepare_corpusfile(self, corpus_file):
+        """Get what the workers need to train on `corpus_file`.
+
+        Parameters
+        ----------
+        corpus_file : str
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or to an
+            :class:`~gensim.models.word2vec.IndexedCorpusFile`.
+
+        Returns
+        -------
+        (:class:`~gensim.models.word2vec_corpusfile.CythonVocab`, object, list of int)
+            Copy of the vocabulary accessible without GIL, the corpus to pass to the workers (the path itself, or
+            the opened :class:`~gensim.models.word2vec.IndexedCorpusFile`) and the starting offset of every worker.
+
+        """
+        from gensim.models.word2vec_corpusfile import CythonVocab
+        from gensim.models.word2vec import IndexedCorpusFile
+        from gensim.models.fasttext import FastText
+        cython_vocab = CythonVocab(self.wv, hs=self.hs, fasttext=isinstance(self, FastText))
+
+        if IndexedCorpusFile.is_indexed(corpus_file):
+            # pre-indexed corpus: workers start at sentence boundaries, with about the same number of words each
+            corpus_file = IndexedCorpusFile(corpus_file)
+            corpus_file.check_vocab(self.wv)
+            offsets = corpus_file.worker_offsets(self.workers)
+        else:
+            corpus_file_size = os.path.getsize(corpus_file)
+            offsets = [corpus_file_size / self.workers * thread_id for thread_id in range(self.workers)]
+        return cython_vocab, corpus_file, offsets
+
     def _train_epoch_corpusfile(self, corpus_file, cur_epoch=0, total_examples=None, total_words=None, **kwargs):
         """Train the model for a single epoch.
 
@@ -402,14 +604,9 @@ class BaseAny2VecModel(utils.SaveLoad):
         if not total_words:
             raise ValueError("total_words must be provided alongside corpus_file argument.")
 
-        from gensim.models.word2vec_corpusfile import CythonVocab
-        from gensim.models.fasttext import FastText
-        cython_vocab = CythonVocab(self.wv, hs=self.hs, fasttext=isinstance(self, FastText))
-
+        cython_vocab, corpus_file, offsets = self._prepare_corpusfile(corpus_file)
         progress_queue = Queue()
 
-        corpus_file_size = os.path.getsize(corpus_file)
-
         thread_kwargs = copy.copy(kwargs)
         thread_kwargs['cur_epoch'] = cur_epoch
         thread_kwargs['total_examples'] = total_examples
@@ -417,9 +614,7 @@ class BaseAny2VecModel(utils.SaveLoad):
         workers = [
             threading.Thread(
                 target=self._worker_loop_corpusfile,
-                args=(
-                    corpus_file, thread_id, corpus_file_size / self.workers * thread_id, cython_vocab, progress_queue
-                ),
+                args=(corpus_file, thread_id, offsets[thread_id], cython_vocab, progress_queue),
                 kwargs=thread_kwargs
             ) for thread_id in range(self.workers)
         ]
@@ -490,8 +685,90 @@ class BaseAny2VecModel(utils.SaveLoad):
 
         return trained_word_count, raw_word_count, job_tally
 
+    def _train_epoch_processes(self, data_iterable=None, corpus_file=None, cur_epoch=0, total_examples=None,
+                               total_words=None, report_delay=1.0, **kwargs):
+        """Train the model for a single epoch with worker processes, which update the weights in shared memory.
+
+        The weights must already be in shared memory, see
+        :meth:`~gensim.models.base_any2vec.BaseAny2VecModel._share_memory`.
+
+        Parameters
+        ----------
+        data_iterable : iterable of list of object, optional
+            The input corpus. Every worker process iterates over it, training on its own share of the examples.
+        corpus_file : str, optional
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or to an
+            :class:`~gensim.models.word2vec.IndexedCorpusFile`. Every worker process trains on its own part of it.
+        cur_epoch : int, optional
+            The current training epoch, needed to compute the training parameters for each job.
+        total_examples : int, optional
+            Count of objects in the input, used for the learning rate decay and to log progress.
+        total_words : int, optional
+            Count of raw words in the input, used for the learning rate decay and to log progress.
+        report_delay : float, optional
+            Number of seconds between two consecutive progress report messages in the logger.
+        **kwargs : object
+            Additional key word parameters for the specific model inheriting from this class.
+
+        Returns
+        -------
+        (int, int, int)
+            The training report for this epoch consisting of three elements:
+                * Size of data chunk processed, for example number of sentences in the corpus chunk.
+                * Effective word count used in training (after ignoring unknown words and trimming the sentence length).
+                * Total word count used in training.
+
+        """
+        context = _fork_context()
+        progress_queue = context.Queue()
+        training_loss = context.Value('d', 0.0)
+
+        worker_kwargs = {'cur_epoch': cur_epoch, 'total_examples': total_examples, 'total_words': total_words}
+        if corpus_file is not None:
+            if not total_words:
+                raise ValueError("total_words must be provided alongside corpus_file argument.")
+            cython_vocab, corpus_file, offsets = self._prepare_corpusfile(corpus_file)
+            worker_kwargs.update(kwargs)
+            worker_loops = [
+                (
+                    self._worker_loop_corpusfile,
+                    (corpus_file, worker_id, offsets[worker_id], cython_vocab, progress_queue)
+                ) for worker_id in range(self.workers)
+            ]
+        else:
+            epoch_progress = context.Value('d', 0.0)
+            worker_loops = [
+                (self._worker_loop_slice, (data_iterable, worker_id, progress_queue, epoch_progress))
+                for worker_id in range(self.workers)
+            ]
+
+        seeds = getattr(self, 'random', random).randint(0, 2 ** 31 - 1, size=self.workers)
+        workers = [
+            context.Process(
+                target=self._worker_process,
+                args=(worker_loop, args, worker_kwargs, progress_queue, training_loss, seed))
+            for (worker_loop, args), seed in zip(worker_loops, seeds)
+        ]
+        for process in workers:
+            process.daemon = True  # make interrupting the parent process with ctrl+c easier
+            process.start()
+
+        trained_word_count, raw_word_count, job_tally = self._log_epoch_progress(
+            progress_queue, None, cur_epoch=cur_epoch, total_examples=total_examples, total_words=total_words,
+            report_delay=report_delay, is_corpus_file_mode=corpus_file is not None, processes=workers)
+
+        for process in workers:
+            process.join()
+        self._check_worker_processes(workers)
+
+        if hasattr(self, 'running_training_loss'):
+            self.running_training_loss += training_loss.value
+        if data_iterable is not None:
+            self._update_job_params(None, 1.0, cur_epoch)  # the learning rate reached by the workers
+        return trained_word_count, raw_word_count, job_tally
+
     def train(self, data_iterable=None, corpus_file=None, epochs=None, total_examples=None,
-              total_words=None, queue_factor=2, report_delay=1.0, callbacks=(), **kwargs):
+              total_words=None, queue_factor=2, report_delay=1.0, callbacks=(), processes=False, **kwargs):
         """Train the model for multiple epochs using multiple workers.
 
         Parameters
@@ -500,6 +777,8 @@ class BaseAny2VecModel(utils.SaveLoad):
             The input corpus. This will be split in chunks and these chunks will be pushed to the queue.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            Can also be the path of an :class:`~gensim.models.word2vec.IndexedCorpusFile` built from it,
+            which skips tokenization and vocabulary lookups in every epoch.
             If you use this argument instead of `data_iterable`, you must provide `total_words` argument as well.
         epochs : int, optional
             Number of epochs (training iterations over the whole input) of training.
@@ -515,6 +794,9 @@ class BaseAny2VecModel(utils.SaveLoad):
             Number of seconds between two consecutive progress report messages in the logger.
         callbacks : list of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             List of callbacks to execute at specific stages during training.
+        processes : bool, optional
+            If True, the workers are forked processes instead of threads, see
+            :meth:`~gensim.models.base_any2vec.BaseAny2VecModel._train_epoch_processes`.
         **kwargs : object
             Additional key word parameters for the specific model inheriting from this class.
 
@@ -535,6 +817,9 @@ class BaseAny2VecModel(utils.SaveLoad):
             total_examples=total_examples,
             total_words=total_words, **kwargs)
 
+        if processes:
+            self._share_memory()
+
         for callback in self.callbacks:
             callback.on_train_begin(self)
 
@@ -547,7 +832,11 @@ class BaseAny2VecModel(utils.SaveLoad):
             for callback in self.callbacks:
                 callback.on_epoch_begin(self)
 
-            if data_iterable is not None:
+            if processes:
+                trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch_processes(
+                    data_iterable, corpus_file, cur_epoch=cur_epoch, total_examples=total_examples,
+                    total_words=total_words, report_delay=report_delay, **kwargs)
+            elif data_iterable is not None:
                 trained_word_count_epoch, raw_word_count_epoch, job_tally_epoch = self._train_epoch(
                     data_iterable, cur_epoch=cur_epoch, total_examples=total_examples,
                     total_words=total_words, queue_factor=queue_factor, report_delay=report_delay)
@@ -894,7 +1183,7 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
         )
 
     def build_vocab(self, sentences=None, corpus_file=None, update=False, progress_per=10000,
-                    keep_raw_vocab=False, trim_rule=None, **kwargs):
+                    keep_raw_vocab=False, trim_rule=None, sketch=None, workers=None, **kwargs):
         """Build vocabulary from a sequence of sentences (can be a once-only generator stream).
 
         Parameters
@@ -928,12 +1217,27 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
                 * `count` (int) - the word's frequency count in the corpus
                 * `min_count` (int) - the minimum count threshold.
 
+        sketch : :class:`~gensim.models.vocab_sketch.CountMinSketch`, optional
+            If given, count words within the fixed memory of this sketch, instead of a dictionary of all words:
+            the corpus is read twice, and only the words whose estimated count reaches `min_count` (or that
+            `trim_rule` keeps) are counted exactly. The resulting vocabulary is the same, but the raw vocabulary
+            only holds these candidates: a later `prepare_vocab` with a lower `min_count` (including a `dry_run`
+            exploring lower thresholds) raises a ValueError, and `trim_rule` applies at scan time.
+            As the corpus is read twice, `sentences` must be a restartable iterable (such as a list or a
+            :class:`~gensim.models.word2vec.LineSentence`), not an iterator or a generator.
+        workers : int, optional
+            If greater than 1, count the words of a sharded corpus in this many worker processes, one shard at a time,
+            such as the files of a :class:`~gensim.models.word2vec.PathLineSentences`, or the shards of a
+            :class:`~gensim.models.word2vec.ShardedSentences`. The counts of the shards are merged into the same
+            vocabulary as that of a single-process scan (except for the words pruned to respect `max_vocab_size`,
+            which are pruned in each shard, then after each merge). Not supported on Windows.
         **kwargs : object
             Key word arguments propagated to `self.vocabulary.prepare_vocab`
 
         """
         total_words, corpus_count = self.vocabulary.scan_vocab(
-            sentences=sentences, corpus_file=corpus_file, progress_per=progress_per, trim_rule=trim_rule)
+            sentences=sentences, corpus_file=corpus_file, progress_per=progress_per, workers=workers,
+            trim_rule=trim_rule, sketch=sketch)
         self.corpus_count = corpus_count
         self.corpus_total_words = total_words
         report_values = self.vocabulary.prepare_vocab(
@@ -1025,7 +1329,7 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
 
     def train(self, sentences=None, corpus_file=None, total_examples=None, total_words=None,
               epochs=None, start_alpha=None, end_alpha=None, word_count=0,
-              queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(), **kwargs):
+              queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(), processes=False, **kwargs):
         """Train the model. If the hyper-parameters are passed, they override the ones set in the constructor.
 
         Parameters
@@ -1037,6 +1341,8 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
             or :class:`~gensim.models.word2vec.LineSentence` module for such examples.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            Can also be the path of an :class:`~gensim.models.word2vec.IndexedCorpusFile` built from it,
+            which skips tokenization and vocabulary lookups in every epoch.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
             `corpus_file` arguments need to be passed (not both of them).
         total_examples : int, optional
@@ -1060,6 +1366,9 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
             :attr:`~gensim.models.base_any2vec.BaseWordEmbeddingsModel.running_training_loss`.
         callbacks : list of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             List of callbacks that need to be executed/run at specific stages during training.
+        processes : bool, optional
+            If True, the workers are forked processes instead of threads. They update the weights in shared memory
+            without locking ("Hogwild"), each training on its own part of the input. Not available on Windows.
         **kwargs : object
             Additional key word parameters for the specific model inheriting from this class.
 
@@ -1078,7 +1387,7 @@ class BaseWordEmbeddingsModel(BaseAny2VecModel):
             data_iterable=sentences, corpus_file=corpus_file, total_examples=total_examples,
             total_words=total_words, epochs=epochs, start_alpha=start_alpha, end_alpha=end_alpha, word_count=word_count,
             queue_factor=queue_factor, report_delay=report_delay, compute_loss=compute_loss, callbacks=callbacks,
-            **kwargs)
+            processes=processes, **kwargs)
 
     def _get_job_params(self, cur_epoch):
         """Get the learning rate used in the current epoch.
@@ -80,7 +80,7 @@ from numpy import zeros, float32 as REAL, empty, ones, \
 from gensim.utils import call_on_class_only
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
 from gensim.models.word2vec import Word2VecKeyedVectors, Word2VecVocab, Word2VecTrainables, train_cbow_pair,\
-    train_sg_pair, train_batch_sg
+    train_sg_pair, train_batch_sg, IndexedCorpusFile
 from six.moves import xrange
 from six import string_types, integer_types, itervalues
 from gensim.models.base_any2vec import BaseWordEmbeddingsModel
@@ -760,6 +760,8 @@ class Doc2Vec(BaseWordEmbeddingsModel):
             left uninitialized -- use if you plan to initialize it in some other way.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            Can also be the path of an :class:`~gensim.models.word2vec.IndexedCorpusFile` built from it,
+            which skips tokenization and vocabulary lookups in every epoch.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
             `corpus_file` arguments need to be passed (not both of them).
         total_examples : int, optional
@@ -791,7 +793,12 @@ class Doc2Vec(BaseWordEmbeddingsModel):
 
         """
         kwargs = {}
-        if corpus_file is not None:
+        if corpus_file is not None and IndexedCorpusFile.is_indexed(corpus_file):
+            # sentences of a pre-indexed corpus are its lines, the first sentence of each worker is its first doctag
+            offsets = start_doctags = IndexedCorpusFile(corpus_file).worker_offsets(self.workers)
+            kwargs['offsets'] = offsets
+            kwargs['start_doctags'] = start_doctags
+        elif corpus_file is not None:
             # Calculate offsets for each worker along with initial doctags (doctag ~ document/line number in a file)
             offsets, start_doctags = self._get_offsets_and_start_doctags_for_corpusfile(corpus_file, self.workers)
             kwargs['offsets'] = offsets
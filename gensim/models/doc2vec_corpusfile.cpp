@@ -1067,6 +1067,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 /*--- Type declarations ---*/
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence;
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab;
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
 
 /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":769
  * ctypedef npy_longdouble longdouble_t
@@ -1147,7 +1148,7 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
- * 
+ * ctypedef void (*sgemm_ptr) (
  */
 typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *, float const *, int const *);
 
@@ -1155,12 +1156,21 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
- * 
- * cdef scopy_ptr scopy
+ * ctypedef void (*sgemm_ptr) (
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *, float const *, float const *, int const *);
 
-/* "word2vec_inner.pxd":44
+/* "word2vec_inner.pxd":28
+ * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
+ * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
+ * ctypedef void (*sgemm_ptr) (             # <<<<<<<<<<<<<<
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
+ *     const float *A, const int *ldA, const float *B, const int *ldB, const float *beta, float *C, const int *ldC) nogil
+ */
+typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr)(char const *, char const *, int const *, int const *, int const *, float const *, float const *, int const *, float const *, int const *, float const *, float *, int const *);
+
+/* "word2vec_inner.pxd":48
  * 
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1169,7 +1179,7 @@ typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *,
  */
 typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr)(int const *, float const *, int const *, float const *, int const *);
 
-/* "word2vec_inner.pxd":45
+/* "word2vec_inner.pxd":49
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef void (*our_saxpy_ptr) (const int *N, const float *alpha, const float *X, const int *incX, float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1178,11 +1188,11 @@ typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6model
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr)(int const *, float const *, float const *, int const *, float *, int const *);
 
-/* "word2vec_inner.pxd":51
+/* "word2vec_inner.pxd":55
  * 
  * 
  * cdef struct Word2VecConfig:             # <<<<<<<<<<<<<<
- *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers
+ *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers, shared_negatives
  *     REAL_t running_training_loss, alpha
  */
 struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
@@ -1194,6 +1204,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   int window;
   int cbow_mean;
   int workers;
+  int shared_negatives;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t running_training_loss;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *syn0;
@@ -1213,7 +1224,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   unsigned PY_LONG_LONG next_random;
 };
 
-/* "word2vec_inner.pxd":125
+/* "word2vec_inner.pxd":137
  * 
  * 
  * cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1=*)             # <<<<<<<<<<<<<<
@@ -1340,16 +1351,40 @@ struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence {
  * 
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
  *     cdef cvocab_t vocab
- *     cdef subword_arrays
+ *     cdef vector[VocabItem] items
  */
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   PyObject_HEAD
   struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtab;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t vocab;
+  std::vector<struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem>  items;
   PyObject *subword_arrays;
 };
 
 
+/* "gensim/models/word2vec_corpusfile.pxd":69
+ * 
+ * 
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     cdef public object corpus
+ *     cdef np.int32_t *ids
+ */
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtab;
+  PyObject *corpus;
+  __pyx_t_5numpy_int32_t *ids;
+  __pyx_t_5numpy_int64_t *offsets;
+  PY_LONG_LONG num_sentences;
+  PY_LONG_LONG start;
+  PY_LONG_LONG sentence;
+  PY_LONG_LONG position;
+  size_t max_sentence_length;
+  std::vector<__pyx_t_5numpy_int32_t *>  batch_words;
+  std::vector<int>  batch_lengths;
+};
+
+
 
 /* "gensim/models/word2vec_corpusfile.pxd":33
  * 
@@ -1375,14 +1410,32 @@ static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineS
  * 
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
  *     cdef cvocab_t vocab
- *     cdef subword_arrays
+ *     cdef vector[VocabItem] items
  */
 
 struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *(*get_vocab_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *(*get_items_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
 };
 static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab;
 
+
+/* "gensim/models/word2vec_corpusfile.pxd":69
+ * 
+ * 
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     cdef public object corpus
+ *     cdef np.int32_t *ids
+ */
+
+struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  bool (*is_eof)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  void (*reset)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*next_batch)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*read_document)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *, __pyx_t_5numpy_int32_t **);
+};
+static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -1469,6 +1522,27 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+/* GetModuleGlobalName.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
 /* PyObjectCall.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
@@ -1518,24 +1592,6 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
-#else
-#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
-#endif
-#endif
-
 /* PyObjectCallMethO.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
@@ -1635,9 +1691,6 @@ static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void); /* proto */
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
-/* None.proto */
-#include <new>
-
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -1739,6 +1792,9 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value);
 
+/* None.proto */
+#include <new>
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
@@ -1834,6 +1890,8 @@ static __pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr *__pyx_vp_6gensim_6mod
 #define __pyx_v_6gensim_6models_14word2vec_inner_snrm2 (*__pyx_vp_6gensim_6models_14word2vec_inner_snrm2)
 static __pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sscal = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_sscal (*__pyx_vp_6gensim_6models_14word2vec_inner_sscal)
+static __pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sgemm = 0;
+#define __pyx_v_6gensim_6models_14word2vec_inner_sgemm (*__pyx_vp_6gensim_6models_14word2vec_inner_sgemm)
 static __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)[0x3E8] = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_EXP_TABLE (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)
 static __pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_our_dot = 0;
@@ -1860,6 +1918,7 @@ static PyObject *(*__pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config)(stru
 /* Module declarations from 'gensim.models.word2vec_corpusfile' */
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = 0;
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = 0;
+static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = 0;
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t (*__pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha)(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int); /*proto*/
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t (*__pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha)(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int, int, int, int, int); /*proto*/
 
@@ -1867,6 +1926,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t (*__pyx_f_6gensim_6m
 static int __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE;
 static __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF;
 static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(std::vector<std::string>  &, int, int, int, int *, int *, unsigned PY_LONG_LONG *, __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *, int *, int, int, int); /*proto*/
+static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_id_document(__pyx_t_5numpy_int32_t *, int, int, int, int, int *, int *, unsigned PY_LONG_LONG *, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *, int *, int, int, int); /*proto*/
 #define __Pyx_MODULE_NAME "gensim.models.doc2vec_corpusfile"
 extern int __pyx_module_is_main_gensim__models__doc2vec_corpusfile;
 int __pyx_module_is_main_gensim__models__doc2vec_corpusfile = 0;
@@ -1899,12 +1959,16 @@ static const char __pyx_k_epochs[] = "epochs";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_offset[] = "offset";
 static const char __pyx_k_alpha_2[] = "_alpha";
+static const char __pyx_k_doc_ids[] = "doc_ids";
+static const char __pyx_k_doc_len[] = "doc_len";
 static const char __pyx_k_doc_tag[] = "_doc_tag";
 static const char __pyx_k_idx_end[] = "idx_end";
+static const char __pyx_k_indexed[] = "indexed";
 static const char __pyx_k_sent_idx[] = "sent_idx";
 static const char __pyx_k_cur_epoch[] = "_cur_epoch";
 static const char __pyx_k_doc_words[] = "doc_words";
 static const char __pyx_k_end_alpha[] = "end_alpha";
+static const char __pyx_k_id_stream[] = "id_stream";
 static const char __pyx_k_idx_start[] = "idx_start";
 static const char __pyx_k_inv_count[] = "inv_count";
 static const char __pyx_k_min_alpha[] = "min_alpha";
@@ -1935,6 +1999,7 @@ static const char __pyx_k_effective_words[] = "effective_words";
 static const char __pyx_k_total_documents[] = "total_documents";
 static const char __pyx_k_expected_words_2[] = "expected_words";
 static const char __pyx_k_expected_examples[] = "_expected_examples";
+static const char __pyx_k_id_corpus_or_none[] = "id_corpus_or_none";
 static const char __pyx_k_scipy_linalg_blas[] = "scipy.linalg.blas";
 static const char __pyx_k_CORPUSFILE_VERSION[] = "CORPUSFILE_VERSION";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
@@ -1950,6 +2015,7 @@ static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string al
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
 static const char __pyx_k_Optimized_cython_functions_for_f[] = "Optimized cython functions for file-based training :class:`~gensim.models.doc2vec.Doc2Vec` model.";
 static const char __pyx_k_gensim_models_doc2vec_corpusfile[] = "gensim/models/doc2vec_corpusfile.pyx";
+static const char __pyx_k_gensim_models_word2vec_corpusfil[] = "gensim.models.word2vec_corpusfile";
 static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
@@ -1974,6 +2040,8 @@ static PyObject *__pyx_n_s_cython_vocab;
 static PyObject *__pyx_n_s_d2v_train_epoch_dbow;
 static PyObject *__pyx_n_s_d2v_train_epoch_dm;
 static PyObject *__pyx_n_s_d2v_train_epoch_dm_concat;
+static PyObject *__pyx_n_s_doc_ids;
+static PyObject *__pyx_n_s_doc_len;
 static PyObject *__pyx_n_s_doc_tag;
 static PyObject *__pyx_n_s_doc_words;
 static PyObject *__pyx_n_s_doctag_locks;
@@ -1990,10 +2058,14 @@ static PyObject *__pyx_n_s_expected_words_2;
 static PyObject *__pyx_n_s_fblas;
 static PyObject *__pyx_kp_s_gensim_models_doc2vec_corpusfile;
 static PyObject *__pyx_n_s_gensim_models_doc2vec_corpusfile_2;
+static PyObject *__pyx_n_s_gensim_models_word2vec_corpusfil;
 static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_id_corpus_or_none;
+static PyObject *__pyx_n_s_id_stream;
 static PyObject *__pyx_n_s_idx_end;
 static PyObject *__pyx_n_s_idx_start;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_indexed;
 static PyObject *__pyx_n_s_input_stream;
 static PyObject *__pyx_n_s_inv_count;
 static PyObject *__pyx_n_s_j;
@@ -2054,7 +2126,7 @@ static PyObject *__pyx_codeobj__14;
 static PyObject *__pyx_codeobj__16;
 /* Late includes */
 
-/* "gensim/models/doc2vec_corpusfile.pyx":57
+/* "gensim/models/doc2vec_corpusfile.pyx":59
  * 
  * 
  * cdef void prepare_c_structures_for_batch(vector[string] &doc_words, int sample, int hs, int window, int *total_words,             # <<<<<<<<<<<<<<
@@ -2078,7 +2150,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   int __pyx_t_10;
   int __pyx_t_11;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":64
+  /* "gensim/models/doc2vec_corpusfile.pyx":66
  *     cdef VocabItem predict_word
  *     cdef string token
  *     cdef int i = 0             # <<<<<<<<<<<<<<
@@ -2087,7 +2159,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
   __pyx_v_i = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":66
+  /* "gensim/models/doc2vec_corpusfile.pyx":68
  *     cdef int i = 0
  * 
  *     total_words[0] += doc_words.size()             # <<<<<<<<<<<<<<
@@ -2097,7 +2169,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   __pyx_t_1 = 0;
   (__pyx_v_total_words[__pyx_t_1]) = ((__pyx_v_total_words[__pyx_t_1]) + __pyx_v_doc_words.size());
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":68
+  /* "gensim/models/doc2vec_corpusfile.pyx":70
  *     total_words[0] += doc_words.size()
  * 
  *     for token in doc_words:             # <<<<<<<<<<<<<<
@@ -2111,7 +2183,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     ++__pyx_t_2;
     __pyx_v_token = __pyx_t_3;
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":69
+    /* "gensim/models/doc2vec_corpusfile.pyx":71
  * 
  *     for token in doc_words:
  *         if vocab[0].find(token) == vocab[0].end():  # shrink document to leave out word             # <<<<<<<<<<<<<<
@@ -2121,7 +2193,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_4 = (((__pyx_v_vocab[0]).find(__pyx_v_token) == (__pyx_v_vocab[0]).end()) != 0);
     if (__pyx_t_4) {
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":70
+      /* "gensim/models/doc2vec_corpusfile.pyx":72
  *     for token in doc_words:
  *         if vocab[0].find(token) == vocab[0].end():  # shrink document to leave out word
  *             continue  # leaving i unchanged             # <<<<<<<<<<<<<<
@@ -2130,7 +2202,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
       goto __pyx_L3_continue;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":69
+      /* "gensim/models/doc2vec_corpusfile.pyx":71
  * 
  *     for token in doc_words:
  *         if vocab[0].find(token) == vocab[0].end():  # shrink document to leave out word             # <<<<<<<<<<<<<<
@@ -2139,7 +2211,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     }
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":72
+    /* "gensim/models/doc2vec_corpusfile.pyx":74
  *             continue  # leaving i unchanged
  * 
  *         predict_word = vocab[0][token]             # <<<<<<<<<<<<<<
@@ -2148,7 +2220,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     __pyx_v_predict_word = ((__pyx_v_vocab[0])[__pyx_v_token]);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":73
+    /* "gensim/models/doc2vec_corpusfile.pyx":75
  * 
  *         predict_word = vocab[0][token]
  *         if sample and predict_word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
@@ -2166,7 +2238,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_L7_bool_binop_done:;
     if (__pyx_t_4) {
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":74
+      /* "gensim/models/doc2vec_corpusfile.pyx":76
  *         predict_word = vocab[0][token]
  *         if sample and predict_word.sample_int < random_int32(next_random):
  *             continue             # <<<<<<<<<<<<<<
@@ -2175,7 +2247,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
       goto __pyx_L3_continue;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":73
+      /* "gensim/models/doc2vec_corpusfile.pyx":75
  * 
  *         predict_word = vocab[0][token]
  *         if sample and predict_word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
@@ -2184,7 +2256,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     }
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":75
+    /* "gensim/models/doc2vec_corpusfile.pyx":77
  *         if sample and predict_word.sample_int < random_int32(next_random):
  *             continue
  *         indexes[i] = predict_word.index             # <<<<<<<<<<<<<<
@@ -2194,7 +2266,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_6 = __pyx_v_predict_word.index;
     (__pyx_v_indexes[__pyx_v_i]) = __pyx_t_6;
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":76
+    /* "gensim/models/doc2vec_corpusfile.pyx":78
  *             continue
  *         indexes[i] = predict_word.index
  *         if hs:             # <<<<<<<<<<<<<<
@@ -2204,7 +2276,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_4 = (__pyx_v_hs != 0);
     if (__pyx_t_4) {
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":77
+      /* "gensim/models/doc2vec_corpusfile.pyx":79
  *         indexes[i] = predict_word.index
  *         if hs:
  *             codelens[i] = predict_word.code_len             # <<<<<<<<<<<<<<
@@ -2214,7 +2286,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
       __pyx_t_7 = __pyx_v_predict_word.code_len;
       (__pyx_v_codelens[__pyx_v_i]) = __pyx_t_7;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":78
+      /* "gensim/models/doc2vec_corpusfile.pyx":80
  *         if hs:
  *             codelens[i] = predict_word.code_len
  *             codes[i] = predict_word.code             # <<<<<<<<<<<<<<
@@ -2224,7 +2296,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
       __pyx_t_8 = __pyx_v_predict_word.code;
       (__pyx_v_codes[__pyx_v_i]) = __pyx_t_8;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":79
+      /* "gensim/models/doc2vec_corpusfile.pyx":81
  *             codelens[i] = predict_word.code_len
  *             codes[i] = predict_word.code
  *             points[i] = predict_word.point             # <<<<<<<<<<<<<<
@@ -2234,7 +2306,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
       __pyx_t_9 = __pyx_v_predict_word.point;
       (__pyx_v_points[__pyx_v_i]) = __pyx_t_9;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":76
+      /* "gensim/models/doc2vec_corpusfile.pyx":78
  *             continue
  *         indexes[i] = predict_word.index
  *         if hs:             # <<<<<<<<<<<<<<
@@ -2243,7 +2315,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     }
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":81
+    /* "gensim/models/doc2vec_corpusfile.pyx":83
  *             points[i] = predict_word.point
  * 
  *         effective_words[0] += 1             # <<<<<<<<<<<<<<
@@ -2253,7 +2325,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_1 = 0;
     (__pyx_v_effective_words[__pyx_t_1]) = ((__pyx_v_effective_words[__pyx_t_1]) + 1);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":82
+    /* "gensim/models/doc2vec_corpusfile.pyx":84
  * 
  *         effective_words[0] += 1
  *         i += 1             # <<<<<<<<<<<<<<
@@ -2262,7 +2334,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     __pyx_v_i = (__pyx_v_i + 1);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":83
+    /* "gensim/models/doc2vec_corpusfile.pyx":85
  *         effective_words[0] += 1
  *         i += 1
  *         if i == MAX_DOCUMENT_LEN:             # <<<<<<<<<<<<<<
@@ -2272,7 +2344,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_4 = ((__pyx_v_i == 0x2710) != 0);
     if (__pyx_t_4) {
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":84
+      /* "gensim/models/doc2vec_corpusfile.pyx":86
  *         i += 1
  *         if i == MAX_DOCUMENT_LEN:
  *             break  # TODO: log warning, tally overflow?             # <<<<<<<<<<<<<<
@@ -2281,7 +2353,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
       goto __pyx_L4_break;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":83
+      /* "gensim/models/doc2vec_corpusfile.pyx":85
  *         effective_words[0] += 1
  *         i += 1
  *         if i == MAX_DOCUMENT_LEN:             # <<<<<<<<<<<<<<
@@ -2290,7 +2362,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
     }
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":68
+    /* "gensim/models/doc2vec_corpusfile.pyx":70
  *     total_words[0] += doc_words.size()
  * 
  *     for token in doc_words:             # <<<<<<<<<<<<<<
@@ -2301,7 +2373,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   }
   __pyx_L4_break:;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":85
+  /* "gensim/models/doc2vec_corpusfile.pyx":87
  *         if i == MAX_DOCUMENT_LEN:
  *             break  # TODO: log warning, tally overflow?
  *     document_len[0] = i             # <<<<<<<<<<<<<<
@@ -2310,7 +2382,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
   (__pyx_v_document_len[0]) = __pyx_v_i;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":87
+  /* "gensim/models/doc2vec_corpusfile.pyx":89
  *     document_len[0] = i
  * 
  *     if train_words and reduced_windows != NULL:             # <<<<<<<<<<<<<<
@@ -2328,7 +2400,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   __pyx_L12_bool_binop_done:;
   if (__pyx_t_4) {
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":88
+    /* "gensim/models/doc2vec_corpusfile.pyx":90
  * 
  *     if train_words and reduced_windows != NULL:
  *         for i in range(document_len[0]):             # <<<<<<<<<<<<<<
@@ -2340,7 +2412,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_i = __pyx_t_11;
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":89
+      /* "gensim/models/doc2vec_corpusfile.pyx":91
  *     if train_words and reduced_windows != NULL:
  *         for i in range(document_len[0]):
  *             reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
@@ -2350,7 +2422,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
       (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
     }
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":87
+    /* "gensim/models/doc2vec_corpusfile.pyx":89
  *     document_len[0] = i
  * 
  *     if train_words and reduced_windows != NULL:             # <<<<<<<<<<<<<<
@@ -2359,7 +2431,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":91
+  /* "gensim/models/doc2vec_corpusfile.pyx":93
  *             reduced_windows[i] = random_int32(next_random) % window
  * 
  *     if doc_tag < docvecs_count:             # <<<<<<<<<<<<<<
@@ -2369,7 +2441,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   __pyx_t_4 = ((__pyx_v_doc_tag < __pyx_v_docvecs_count) != 0);
   if (__pyx_t_4) {
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":92
+    /* "gensim/models/doc2vec_corpusfile.pyx":94
  * 
  *     if doc_tag < docvecs_count:
  *         effective_words[0] += 1             # <<<<<<<<<<<<<<
@@ -2379,7 +2451,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
     __pyx_t_1 = 0;
     (__pyx_v_effective_words[__pyx_t_1]) = ((__pyx_v_effective_words[__pyx_t_1]) + 1);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":91
+    /* "gensim/models/doc2vec_corpusfile.pyx":93
  *             reduced_windows[i] = random_int32(next_random) % window
  * 
  *     if doc_tag < docvecs_count:             # <<<<<<<<<<<<<<
@@ -2388,7 +2460,7 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
  */
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":57
+  /* "gensim/models/doc2vec_corpusfile.pyx":59
  * 
  * 
  * cdef void prepare_c_structures_for_batch(vector[string] &doc_words, int sample, int hs, int window, int *total_words,             # <<<<<<<<<<<<<<
@@ -2399,191 +2471,525 @@ static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_fo
   /* function exit code */
 }
 
-/* "gensim/models/doc2vec_corpusfile.pyx":95
+/* "gensim/models/doc2vec_corpusfile.pyx":97
  * 
  * 
- * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
- *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
- *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
+ * cdef void prepare_c_structures_for_id_document(np.int32_t *doc_words, int doc_len, int sample, int hs, int window,             # <<<<<<<<<<<<<<
+ *                                                int *total_words, int *effective_words, unsigned long long *next_random,
+ *                                                VocabItem *vocab, np.uint32_t *indexes, int *codelens,
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_dbow[] = "d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed bag of words model (\"PV-DBOW\") by training on a corpus file.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : str\n        Path to corpus file.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    train_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both** `learn_words`\n        and `train_words` are set to True.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarray, optional\n        A learning lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks"" : numpy.ndarray, optional\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
-static PyMethodDef __pyx_mdef_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow = {"d2v_train_epoch_dbow", (PyCFunction)__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_dbow};
-static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_model = 0;
-  PyObject *__pyx_v_corpus_file = 0;
-  PyObject *__pyx_v_offset = 0;
-  PyObject *__pyx_v_start_doctag = 0;
-  PyObject *__pyx_v__cython_vocab = 0;
-  PyObject *__pyx_v__cur_epoch = 0;
-  PyObject *__pyx_v__expected_examples = 0;
-  PyObject *__pyx_v__expected_words = 0;
-  PyObject *__pyx_v_work = 0;
-  PyObject *__pyx_v_neu1 = 0;
-  PyObject *__pyx_v_docvecs_count = 0;
-  PyObject *__pyx_v_word_vectors = 0;
-  PyObject *__pyx_v_word_locks = 0;
-  PyObject *__pyx_v_train_words = 0;
-  PyObject *__pyx_v_learn_doctags = 0;
-  PyObject *__pyx_v_learn_words = 0;
-  PyObject *__pyx_v_learn_hidden = 0;
-  PyObject *__pyx_v_doctag_vectors = 0;
-  PyObject *__pyx_v_doctag_locks = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("d2v_train_epoch_dbow (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_start_doctag,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_neu1,&__pyx_n_s_docvecs_count,&__pyx_n_s_word_vectors,&__pyx_n_s_word_locks,&__pyx_n_s_train_words,&__pyx_n_s_learn_doctags,&__pyx_n_s_learn_words,&__pyx_n_s_learn_hidden,&__pyx_n_s_doctag_vectors,&__pyx_n_s_doctag_locks,0};
-    PyObject* values[19] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+static void __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_id_document(__pyx_t_5numpy_int32_t *__pyx_v_doc_words, int __pyx_v_doc_len, int __pyx_v_sample, int __pyx_v_hs, int __pyx_v_window, int *__pyx_v_total_words, int *__pyx_v_effective_words, unsigned PY_LONG_LONG *__pyx_v_next_random, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_vocab, __pyx_t_5numpy_uint32_t *__pyx_v_indexes, int *__pyx_v_codelens, __pyx_t_5numpy_uint8_t **__pyx_v_codes, __pyx_t_5numpy_uint32_t **__pyx_v_points, __pyx_t_5numpy_uint32_t *__pyx_v_reduced_windows, int *__pyx_v_document_len, int __pyx_v_train_words, int __pyx_v_docvecs_count, int __pyx_v_doc_tag) {
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_predict_word;
+  int __pyx_v_pos;
+  int __pyx_v_i;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  __pyx_t_5numpy_uint32_t __pyx_t_7;
+  int __pyx_t_8;
+  __pyx_t_5numpy_uint8_t *__pyx_t_9;
+  __pyx_t_5numpy_uint32_t *__pyx_t_10;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":105
+ *     cdef VocabItem *predict_word
+ *     cdef int pos
+ *     cdef int i = 0             # <<<<<<<<<<<<<<
+ * 
+ *     total_words[0] += doc_len
+ */
+  __pyx_v_i = 0;
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":96
+  /* "gensim/models/doc2vec_corpusfile.pyx":107
+ *     cdef int i = 0
  * 
- * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
- *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,             # <<<<<<<<<<<<<<
- *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
- *                          doctag_vectors=None, doctag_locks=None):
+ *     total_words[0] += doc_len             # <<<<<<<<<<<<<<
+ * 
+ *     for pos in range(doc_len):
  */
-    values[11] = ((PyObject *)Py_None);
-    values[12] = ((PyObject *)Py_None);
+  __pyx_t_1 = 0;
+  (__pyx_v_total_words[__pyx_t_1]) = ((__pyx_v_total_words[__pyx_t_1]) + __pyx_v_doc_len);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":97
- * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
- *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
- *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,             # <<<<<<<<<<<<<<
- *                          doctag_vectors=None, doctag_locks=None):
- *     """Train distributed bag of words model ("PV-DBOW") by training on a corpus file.
+  /* "gensim/models/doc2vec_corpusfile.pyx":109
+ *     total_words[0] += doc_len
+ * 
+ *     for pos in range(doc_len):             # <<<<<<<<<<<<<<
+ *         if doc_words[pos] < 0:  # out of vocabulary: shrink document to leave out word
+ *             continue  # leaving i unchanged
  */
-    values[13] = ((PyObject *)Py_False);
-    values[14] = ((PyObject *)Py_True);
-    values[15] = ((PyObject *)Py_True);
-    values[16] = ((PyObject *)Py_True);
+  __pyx_t_2 = __pyx_v_doc_len;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_pos = __pyx_t_4;
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":98
- *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
- *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
- *                          doctag_vectors=None, doctag_locks=None):             # <<<<<<<<<<<<<<
- *     """Train distributed bag of words model ("PV-DBOW") by training on a corpus file.
+    /* "gensim/models/doc2vec_corpusfile.pyx":110
+ * 
+ *     for pos in range(doc_len):
+ *         if doc_words[pos] < 0:  # out of vocabulary: shrink document to leave out word             # <<<<<<<<<<<<<<
+ *             continue  # leaving i unchanged
  * 
  */
-    values[17] = ((PyObject *)Py_None);
-    values[18] = ((PyObject *)Py_None);
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case 19: values[18] = PyTuple_GET_ITEM(__pyx_args, 18);
-        CYTHON_FALLTHROUGH;
-        case 18: values[17] = PyTuple_GET_ITEM(__pyx_args, 17);
-        CYTHON_FALLTHROUGH;
-        case 17: values[16] = PyTuple_GET_ITEM(__pyx_args, 16);
-        CYTHON_FALLTHROUGH;
-        case 16: values[15] = PyTuple_GET_ITEM(__pyx_args, 15);
-        CYTHON_FALLTHROUGH;
-        case 15: values[14] = PyTuple_GET_ITEM(__pyx_args, 14);
-        CYTHON_FALLTHROUGH;
-        case 14: values[13] = PyTuple_GET_ITEM(__pyx_args, 13);
-        CYTHON_FALLTHROUGH;
-        case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
-        CYTHON_FALLTHROUGH;
-        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
-        CYTHON_FALLTHROUGH;
-        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
-        CYTHON_FALLTHROUGH;
-        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
-        CYTHON_FALLTHROUGH;
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        CYTHON_FALLTHROUGH;
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        CYTHON_FALLTHROUGH;
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_model)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 1); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 2); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_start_doctag)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 3); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 4); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 5); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 6); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  7:
-        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 7); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  8:
-        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 8); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  9:
-        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 9); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case 10:
-        if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_docvecs_count)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 10); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case 11:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word_vectors);
-          if (value) { values[11] = value; kw_args--; }
+    __pyx_t_5 = (((__pyx_v_doc_words[__pyx_v_pos]) < 0) != 0);
+    if (__pyx_t_5) {
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":111
+ *     for pos in range(doc_len):
+ *         if doc_words[pos] < 0:  # out of vocabulary: shrink document to leave out word
+ *             continue  # leaving i unchanged             # <<<<<<<<<<<<<<
+ * 
+ *         predict_word = &vocab[doc_words[pos]]
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":110
+ * 
+ *     for pos in range(doc_len):
+ *         if doc_words[pos] < 0:  # out of vocabulary: shrink document to leave out word             # <<<<<<<<<<<<<<
+ *             continue  # leaving i unchanged
+ * 
+ */
+    }
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":113
+ *             continue  # leaving i unchanged
+ * 
+ *         predict_word = &vocab[doc_words[pos]]             # <<<<<<<<<<<<<<
+ *         if sample and predict_word.sample_int < random_int32(next_random):
+ *             continue
+ */
+    __pyx_v_predict_word = (&(__pyx_v_vocab[(__pyx_v_doc_words[__pyx_v_pos])]));
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":114
+ * 
+ *         predict_word = &vocab[doc_words[pos]]
+ *         if sample and predict_word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *             continue
+ *         indexes[i] = predict_word.index
+ */
+    __pyx_t_6 = (__pyx_v_sample != 0);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_predict_word->sample_int < __pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random)) != 0);
+    __pyx_t_5 = __pyx_t_6;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":115
+ *         predict_word = &vocab[doc_words[pos]]
+ *         if sample and predict_word.sample_int < random_int32(next_random):
+ *             continue             # <<<<<<<<<<<<<<
+ *         indexes[i] = predict_word.index
+ *         if hs:
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":114
+ * 
+ *         predict_word = &vocab[doc_words[pos]]
+ *         if sample and predict_word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *             continue
+ *         indexes[i] = predict_word.index
+ */
+    }
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":116
+ *         if sample and predict_word.sample_int < random_int32(next_random):
+ *             continue
+ *         indexes[i] = predict_word.index             # <<<<<<<<<<<<<<
+ *         if hs:
+ *             codelens[i] = predict_word.code_len
+ */
+    __pyx_t_7 = __pyx_v_predict_word->index;
+    (__pyx_v_indexes[__pyx_v_i]) = __pyx_t_7;
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":117
+ *             continue
+ *         indexes[i] = predict_word.index
+ *         if hs:             # <<<<<<<<<<<<<<
+ *             codelens[i] = predict_word.code_len
+ *             codes[i] = predict_word.code
+ */
+    __pyx_t_5 = (__pyx_v_hs != 0);
+    if (__pyx_t_5) {
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":118
+ *         indexes[i] = predict_word.index
+ *         if hs:
+ *             codelens[i] = predict_word.code_len             # <<<<<<<<<<<<<<
+ *             codes[i] = predict_word.code
+ *             points[i] = predict_word.point
+ */
+      __pyx_t_8 = __pyx_v_predict_word->code_len;
+      (__pyx_v_codelens[__pyx_v_i]) = __pyx_t_8;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":119
+ *         if hs:
+ *             codelens[i] = predict_word.code_len
+ *             codes[i] = predict_word.code             # <<<<<<<<<<<<<<
+ *             points[i] = predict_word.point
+ * 
+ */
+      __pyx_t_9 = __pyx_v_predict_word->code;
+      (__pyx_v_codes[__pyx_v_i]) = __pyx_t_9;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":120
+ *             codelens[i] = predict_word.code_len
+ *             codes[i] = predict_word.code
+ *             points[i] = predict_word.point             # <<<<<<<<<<<<<<
+ * 
+ *         effective_words[0] += 1
+ */
+      __pyx_t_10 = __pyx_v_predict_word->point;
+      (__pyx_v_points[__pyx_v_i]) = __pyx_t_10;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":117
+ *             continue
+ *         indexes[i] = predict_word.index
+ *         if hs:             # <<<<<<<<<<<<<<
+ *             codelens[i] = predict_word.code_len
+ *             codes[i] = predict_word.code
+ */
+    }
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":122
+ *             points[i] = predict_word.point
+ * 
+ *         effective_words[0] += 1             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         if i == MAX_DOCUMENT_LEN:
+ */
+    __pyx_t_1 = 0;
+    (__pyx_v_effective_words[__pyx_t_1]) = ((__pyx_v_effective_words[__pyx_t_1]) + 1);
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":123
+ * 
+ *         effective_words[0] += 1
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         if i == MAX_DOCUMENT_LEN:
+ *             break
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":124
+ *         effective_words[0] += 1
+ *         i += 1
+ *         if i == MAX_DOCUMENT_LEN:             # <<<<<<<<<<<<<<
+ *             break
+ *     document_len[0] = i
+ */
+    __pyx_t_5 = ((__pyx_v_i == 0x2710) != 0);
+    if (__pyx_t_5) {
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":125
+ *         i += 1
+ *         if i == MAX_DOCUMENT_LEN:
+ *             break             # <<<<<<<<<<<<<<
+ *     document_len[0] = i
+ * 
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":124
+ *         effective_words[0] += 1
+ *         i += 1
+ *         if i == MAX_DOCUMENT_LEN:             # <<<<<<<<<<<<<<
+ *             break
+ *     document_len[0] = i
+ */
+    }
+    __pyx_L3_continue:;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":126
+ *         if i == MAX_DOCUMENT_LEN:
+ *             break
+ *     document_len[0] = i             # <<<<<<<<<<<<<<
+ * 
+ *     if train_words and reduced_windows != NULL:
+ */
+  (__pyx_v_document_len[0]) = __pyx_v_i;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":128
+ *     document_len[0] = i
+ * 
+ *     if train_words and reduced_windows != NULL:             # <<<<<<<<<<<<<<
+ *         for i in range(document_len[0]):
+ *             reduced_windows[i] = random_int32(next_random) % window
+ */
+  __pyx_t_6 = (__pyx_v_train_words != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_5 = __pyx_t_6;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_6 = ((__pyx_v_reduced_windows != NULL) != 0);
+  __pyx_t_5 = __pyx_t_6;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_5) {
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":129
+ * 
+ *     if train_words and reduced_windows != NULL:
+ *         for i in range(document_len[0]):             # <<<<<<<<<<<<<<
+ *             reduced_windows[i] = random_int32(next_random) % window
+ * 
+ */
+    __pyx_t_2 = (__pyx_v_document_len[0]);
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_i = __pyx_t_4;
+
+      /* "gensim/models/doc2vec_corpusfile.pyx":130
+ *     if train_words and reduced_windows != NULL:
+ *         for i in range(document_len[0]):
+ *             reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
+ * 
+ *     if doc_tag < docvecs_count:
+ */
+      (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
+    }
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":128
+ *     document_len[0] = i
+ * 
+ *     if train_words and reduced_windows != NULL:             # <<<<<<<<<<<<<<
+ *         for i in range(document_len[0]):
+ *             reduced_windows[i] = random_int32(next_random) % window
+ */
+  }
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":132
+ *             reduced_windows[i] = random_int32(next_random) % window
+ * 
+ *     if doc_tag < docvecs_count:             # <<<<<<<<<<<<<<
+ *         effective_words[0] += 1
+ * 
+ */
+  __pyx_t_5 = ((__pyx_v_doc_tag < __pyx_v_docvecs_count) != 0);
+  if (__pyx_t_5) {
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":133
+ * 
+ *     if doc_tag < docvecs_count:
+ *         effective_words[0] += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_t_1 = 0;
+    (__pyx_v_effective_words[__pyx_t_1]) = ((__pyx_v_effective_words[__pyx_t_1]) + 1);
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":132
+ *             reduced_windows[i] = random_int32(next_random) % window
+ * 
+ *     if doc_tag < docvecs_count:             # <<<<<<<<<<<<<<
+ *         effective_words[0] += 1
+ * 
+ */
+  }
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":97
+ * 
+ * 
+ * cdef void prepare_c_structures_for_id_document(np.int32_t *doc_words, int doc_len, int sample, int hs, int window,             # <<<<<<<<<<<<<<
+ *                                                int *total_words, int *effective_words, unsigned long long *next_random,
+ *                                                VocabItem *vocab, np.uint32_t *indexes, int *codelens,
+ */
+
+  /* function exit code */
+}
+
+/* "gensim/models/doc2vec_corpusfile.pyx":136
+ * 
+ * 
+ * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
+ *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
+ *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_dbow[] = "d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed bag of words model (\"PV-DBOW\") by training on a corpus file.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.\n    start_doctag : int\n        Tag of the first document read.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    train_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both** `learn_words`\n        and `train_words` are set to True.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarra""y, optional\n        A learning lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks : numpy.ndarray, optional\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
+static PyMethodDef __pyx_mdef_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow = {"d2v_train_epoch_dbow", (PyCFunction)__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_dbow};
+static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_model = 0;
+  PyObject *__pyx_v_corpus_file = 0;
+  PyObject *__pyx_v_offset = 0;
+  PyObject *__pyx_v_start_doctag = 0;
+  PyObject *__pyx_v__cython_vocab = 0;
+  PyObject *__pyx_v__cur_epoch = 0;
+  PyObject *__pyx_v__expected_examples = 0;
+  PyObject *__pyx_v__expected_words = 0;
+  PyObject *__pyx_v_work = 0;
+  PyObject *__pyx_v_neu1 = 0;
+  PyObject *__pyx_v_docvecs_count = 0;
+  PyObject *__pyx_v_word_vectors = 0;
+  PyObject *__pyx_v_word_locks = 0;
+  PyObject *__pyx_v_train_words = 0;
+  PyObject *__pyx_v_learn_doctags = 0;
+  PyObject *__pyx_v_learn_words = 0;
+  PyObject *__pyx_v_learn_hidden = 0;
+  PyObject *__pyx_v_doctag_vectors = 0;
+  PyObject *__pyx_v_doctag_locks = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("d2v_train_epoch_dbow (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_start_doctag,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_neu1,&__pyx_n_s_docvecs_count,&__pyx_n_s_word_vectors,&__pyx_n_s_word_locks,&__pyx_n_s_train_words,&__pyx_n_s_learn_doctags,&__pyx_n_s_learn_words,&__pyx_n_s_learn_hidden,&__pyx_n_s_doctag_vectors,&__pyx_n_s_doctag_locks,0};
+    PyObject* values[19] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":137
+ * 
+ * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
+ *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,             # <<<<<<<<<<<<<<
+ *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
+ *                          doctag_vectors=None, doctag_locks=None):
+ */
+    values[11] = ((PyObject *)Py_None);
+    values[12] = ((PyObject *)Py_None);
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":138
+ * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
+ *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
+ *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,             # <<<<<<<<<<<<<<
+ *                          doctag_vectors=None, doctag_locks=None):
+ *     """Train distributed bag of words model ("PV-DBOW") by training on a corpus file.
+ */
+    values[13] = ((PyObject *)Py_False);
+    values[14] = ((PyObject *)Py_True);
+    values[15] = ((PyObject *)Py_True);
+    values[16] = ((PyObject *)Py_True);
+
+    /* "gensim/models/doc2vec_corpusfile.pyx":139
+ *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
+ *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
+ *                          doctag_vectors=None, doctag_locks=None):             # <<<<<<<<<<<<<<
+ *     """Train distributed bag of words model ("PV-DBOW") by training on a corpus file.
+ * 
+ */
+    values[17] = ((PyObject *)Py_None);
+    values[18] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 19: values[18] = PyTuple_GET_ITEM(__pyx_args, 18);
+        CYTHON_FALLTHROUGH;
+        case 18: values[17] = PyTuple_GET_ITEM(__pyx_args, 17);
+        CYTHON_FALLTHROUGH;
+        case 17: values[16] = PyTuple_GET_ITEM(__pyx_args, 16);
+        CYTHON_FALLTHROUGH;
+        case 16: values[15] = PyTuple_GET_ITEM(__pyx_args, 15);
+        CYTHON_FALLTHROUGH;
+        case 15: values[14] = PyTuple_GET_ITEM(__pyx_args, 14);
+        CYTHON_FALLTHROUGH;
+        case 14: values[13] = PyTuple_GET_ITEM(__pyx_args, 13);
+        CYTHON_FALLTHROUGH;
+        case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
+        CYTHON_FALLTHROUGH;
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_model)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 1); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 2); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_start_doctag)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 3); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 4); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 5); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 6); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 7); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 8); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 9); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_docvecs_count)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, 10); __PYX_ERR(0, 136, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 11:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_word_vectors);
+          if (value) { values[11] = value; kw_args--; }
         }
         CYTHON_FALLTHROUGH;
         case 12:
@@ -2629,7 +3035,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dbow") < 0)) __PYX_ERR(0, 95, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dbow") < 0)) __PYX_ERR(0, 136, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2686,7 +3092,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 95, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dbow", 0, 11, 19, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 136, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2694,7 +3100,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_dbow(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v_start_doctag, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v_work, __pyx_v_neu1, __pyx_v_docvecs_count, __pyx_v_word_vectors, __pyx_v_word_locks, __pyx_v_train_words, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, __pyx_v_doctag_vectors, __pyx_v_doctag_locks);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":95
+  /* "gensim/models/doc2vec_corpusfile.pyx":136
  * 
  * 
  * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -2716,7 +3122,9 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -2726,6 +3134,8 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   int __pyx_v_total_documents;
   int __pyx_v_total_words;
   std::vector<std::string>  __pyx_v_doc_words;
+  __pyx_t_5numpy_int32_t *__pyx_v_doc_ids;
+  int __pyx_v_doc_len;
   int __pyx_v__doc_tag;
   long __pyx_v_k;
   PyObject *__pyx_r = NULL;
@@ -2737,42 +3147,44 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_t_5;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_8;
-  int __pyx_t_9;
-  std::vector<std::string>  __pyx_t_10;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_11;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_10;
+  bool __pyx_t_11;
   int __pyx_t_12;
-  long __pyx_t_13;
-  long __pyx_t_14;
-  int __pyx_t_15;
-  PyObject *__pyx_t_16 = NULL;
-  PyObject *__pyx_t_17 = NULL;
+  PY_LONG_LONG __pyx_t_13;
+  std::vector<std::string>  __pyx_t_14;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_15;
+  int __pyx_t_16;
+  long __pyx_t_17;
+  long __pyx_t_18;
+  int __pyx_t_19;
   __Pyx_RefNannySetupContext("d2v_train_epoch_dbow", 0);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":143
+  /* "gensim/models/doc2vec_corpusfile.pyx":188
  *     cdef Doc2VecConfig c
  * 
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 188, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":144
+  /* "gensim/models/doc2vec_corpusfile.pyx":189
  * 
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":145
+  /* "gensim/models/doc2vec_corpusfile.pyx":190
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -2783,12 +3195,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 190, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":146
+  /* "gensim/models/doc2vec_corpusfile.pyx":191
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -2799,85 +3211,161 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 191, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":147
+  /* "gensim/models/doc2vec_corpusfile.pyx":192
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 192, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":148
+  /* "gensim/models/doc2vec_corpusfile.pyx":193
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":149
+  /* "gensim/models/doc2vec_corpusfile.pyx":194
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 194, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":151
+  /* "gensim/models/doc2vec_corpusfile.pyx":196
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 196, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  __pyx_t_8 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":197
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_offset);
+    __pyx_t_9 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":152
+  /* "gensim/models/doc2vec_corpusfile.pyx":198
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":199
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, document_len
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 152, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 199, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":155
+  /* "gensim/models/doc2vec_corpusfile.pyx":202
  * 
  *     cdef int i, j, document_len
  *     cdef int effective_words = 0             # <<<<<<<<<<<<<<
@@ -2886,7 +3374,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
   __pyx_v_effective_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":156
+  /* "gensim/models/doc2vec_corpusfile.pyx":203
  *     cdef int i, j, document_len
  *     cdef int effective_words = 0
  *     cdef int total_effective_words = 0, total_documents = 0, total_words = 0             # <<<<<<<<<<<<<<
@@ -2897,53 +3385,53 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   __pyx_v_total_documents = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":160
- * 
- *     cdef vector[string] doc_words
+  /* "gensim/models/doc2vec_corpusfile.pyx":209
+ *     cdef np.int32_t *doc_ids
+ *     cdef int doc_len
  *     cdef int _doc_tag = start_doctag             # <<<<<<<<<<<<<<
  * 
  *     init_d2v_config(
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 160, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
   __pyx_v__doc_tag = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":163
+  /* "gensim/models/doc2vec_corpusfile.pyx":212
  * 
  *     init_d2v_config(
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=train_words,             # <<<<<<<<<<<<<<
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  *         doctag_vectors=doctag_vectors, doctag_locks=doctag_locks, docvecs_count=docvecs_count)
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 212, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":162
+  /* "gensim/models/doc2vec_corpusfile.pyx":211
  *     cdef int _doc_tag = start_doctag
  * 
  *     init_d2v_config(             # <<<<<<<<<<<<<<
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=train_words,
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  */
-  __pyx_t_8.__pyx_n = 8;
-  __pyx_t_8.train_words = __pyx_v_train_words;
-  __pyx_t_8.work = __pyx_v_work;
-  __pyx_t_8.neu1 = __pyx_v_neu1;
-  __pyx_t_8.word_vectors = __pyx_v_word_vectors;
-  __pyx_t_8.word_locks = __pyx_v_word_locks;
-  __pyx_t_8.doctag_vectors = __pyx_v_doctag_vectors;
-  __pyx_t_8.doctag_locks = __pyx_v_doctag_locks;
-  __pyx_t_8.docvecs_count = __pyx_v_docvecs_count;
-  __pyx_t_2 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_7, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 162, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_10.__pyx_n = 8;
+  __pyx_t_10.train_words = __pyx_v_train_words;
+  __pyx_t_10.work = __pyx_v_work;
+  __pyx_t_10.neu1 = __pyx_v_neu1;
+  __pyx_t_10.word_vectors = __pyx_v_word_vectors;
+  __pyx_t_10.word_locks = __pyx_v_word_locks;
+  __pyx_t_10.doctag_vectors = __pyx_v_doctag_vectors;
+  __pyx_t_10.doctag_locks = __pyx_v_doctag_locks;
+  __pyx_t_10.docvecs_count = __pyx_v_docvecs_count;
+  __pyx_t_9 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":168
+  /* "gensim/models/doc2vec_corpusfile.pyx":217
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -2953,102 +3441,234 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
       #endif
       /*try:*/ {
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":169
+        /* "gensim/models/doc2vec_corpusfile.pyx":218
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_words = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":219
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
  */
-        ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->reset(__pyx_v_id_stream);
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":170
+          /* "gensim/models/doc2vec_corpusfile.pyx":218
+ *     # release GIL & train on the full corpus, document by document
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":221
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":222
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_words = 0
- * 
  */
         while (1) {
-          __pyx_t_9 = (((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_9) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_12 = (__pyx_t_11 != 0);
+          if (!__pyx_t_12) {
           } else {
-            __pyx_t_3 = __pyx_t_9;
-            goto __pyx_L8_bool_binop_done;
+            __pyx_t_3 = __pyx_t_12;
+            goto __pyx_L9_bool_binop_done;
           }
-          __pyx_t_9 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_9;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_9 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_9) break;
-
-          /* "gensim/models/doc2vec_corpusfile.pyx":171
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":223
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_words = 0
+ * 
+ */
+          __pyx_t_12 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_12;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":222
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_words = 0
+ */
+          __pyx_t_12 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_12) break;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":224
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             doc_words = input_stream.read_sentence()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":173
+          /* "gensim/models/doc2vec_corpusfile.pyx":226
  *             effective_words = 0
  * 
- *             doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ */
+          __pyx_t_12 = (__pyx_v_indexed != 0);
+          if (__pyx_t_12) {
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":228
+ *             if indexed:
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence             # <<<<<<<<<<<<<<
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:
+ */
+            __pyx_t_13 = __pyx_v_id_stream->sentence;
+            __pyx_v__doc_tag = __pyx_t_13;
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":229
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)             # <<<<<<<<<<<<<<
+ *                 if doc_len == 0:
+ *                     continue
+ */
+            __pyx_v_doc_len = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->read_document(__pyx_v_id_stream, (&__pyx_v_doc_ids));
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":230
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 prepare_c_structures_for_id_document(
+ */
+            __pyx_t_12 = ((__pyx_v_doc_len == 0) != 0);
+            if (__pyx_t_12) {
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":231
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_document(
+ *                     doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+ */
+              goto __pyx_L7_continue;
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":230
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 prepare_c_structures_for_id_document(
+ */
+            }
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":232
+ *                 if doc_len == 0:
+ *                     continue
+ *                 prepare_c_structures_for_id_document(             # <<<<<<<<<<<<<<
+ *                     doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points,
+ */
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_id_document(__pyx_v_doc_ids, __pyx_v_doc_len, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_items_ptr(__pyx_v_vocab), __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":226
+ *             effective_words = 0
+ * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":237
+ *                     c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+ *             else:
+ *                 doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
  * 
- *             if doc_words.empty():
+ *                 if doc_words.empty():
  */
-          __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 173, __pyx_L4_error)
-          __pyx_v_doc_words = __pyx_t_10;
+          /*else*/ {
+            __pyx_t_14 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 237, __pyx_L4_error)
+            __pyx_v_doc_words = __pyx_t_14;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":175
- *             doc_words = input_stream.read_sentence()
+            /* "gensim/models/doc2vec_corpusfile.pyx":239
+ *                 doc_words = input_stream.read_sentence()
  * 
- *             if doc_words.empty():             # <<<<<<<<<<<<<<
- *                 continue
+ *                 if doc_words.empty():             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          __pyx_t_9 = (__pyx_v_doc_words.empty() != 0);
-          if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_doc_words.empty() != 0);
+            if (__pyx_t_12) {
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":176
+              /* "gensim/models/doc2vec_corpusfile.pyx":240
  * 
- *             if doc_words.empty():
- *                 continue             # <<<<<<<<<<<<<<
+ *                 if doc_words.empty():
+ *                     continue             # <<<<<<<<<<<<<<
  * 
- *             prepare_c_structures_for_batch(
+ *                 prepare_c_structures_for_batch(
  */
-            goto __pyx_L6_continue;
+              goto __pyx_L7_continue;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":175
- *             doc_words = input_stream.read_sentence()
+              /* "gensim/models/doc2vec_corpusfile.pyx":239
+ *                 doc_words = input_stream.read_sentence()
  * 
- *             if doc_words.empty():             # <<<<<<<<<<<<<<
- *                 continue
+ *                 if doc_words.empty():             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          }
+            }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":180
- *             prepare_c_structures_for_batch(
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,             # <<<<<<<<<<<<<<
- *                 c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            /* "gensim/models/doc2vec_corpusfile.pyx":244
+ *                 prepare_c_structures_for_batch(
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,             # <<<<<<<<<<<<<<
+ *                     c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  */
-          __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 180, __pyx_L4_error)
+            __pyx_t_15 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 244, __pyx_L4_error)
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":178
- *                 continue
+            /* "gensim/models/doc2vec_corpusfile.pyx":242
+ *                     continue
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
  */
-          __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_11, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_15, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":183
- *                 c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+          /* "gensim/models/doc2vec_corpusfile.pyx":247
+ *                     c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  *             for i in range(document_len):             # <<<<<<<<<<<<<<
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training
@@ -3056,20 +3676,20 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
           __pyx_t_1 = __pyx_v_document_len;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
-            __pyx_v_i = __pyx_t_12;
+          for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_4; __pyx_t_16+=1) {
+            __pyx_v_i = __pyx_t_16;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":184
+            /* "gensim/models/doc2vec_corpusfile.pyx":248
  * 
  *             for i in range(document_len):
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training             # <<<<<<<<<<<<<<
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < 0:
  */
-            __pyx_t_9 = (__pyx_v_c.train_words != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.train_words != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":185
+              /* "gensim/models/doc2vec_corpusfile.pyx":249
  *             for i in range(document_len):
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training
  *                     j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -3078,17 +3698,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":186
+              /* "gensim/models/doc2vec_corpusfile.pyx":250
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < 0:             # <<<<<<<<<<<<<<
  *                         j = 0
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  */
-              __pyx_t_9 = ((__pyx_v_j < 0) != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = ((__pyx_v_j < 0) != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":187
+                /* "gensim/models/doc2vec_corpusfile.pyx":251
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < 0:
  *                         j = 0             # <<<<<<<<<<<<<<
@@ -3097,7 +3717,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 __pyx_v_j = 0;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":186
+                /* "gensim/models/doc2vec_corpusfile.pyx":250
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < 0:             # <<<<<<<<<<<<<<
@@ -3106,7 +3726,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":188
+              /* "gensim/models/doc2vec_corpusfile.pyx":252
  *                     if j < 0:
  *                         j = 0
  *                     k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -3115,17 +3735,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":189
+              /* "gensim/models/doc2vec_corpusfile.pyx":253
  *                         j = 0
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > document_len:             # <<<<<<<<<<<<<<
  *                         k = document_len
  *                     for j in range(j, k):
  */
-              __pyx_t_9 = ((__pyx_v_k > __pyx_v_document_len) != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = ((__pyx_v_k > __pyx_v_document_len) != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":190
+                /* "gensim/models/doc2vec_corpusfile.pyx":254
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > document_len:
  *                         k = document_len             # <<<<<<<<<<<<<<
@@ -3134,7 +3754,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 __pyx_v_k = __pyx_v_document_len;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":189
+                /* "gensim/models/doc2vec_corpusfile.pyx":253
  *                         j = 0
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > document_len:             # <<<<<<<<<<<<<<
@@ -3143,38 +3763,38 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":191
+              /* "gensim/models/doc2vec_corpusfile.pyx":255
  *                     if k > document_len:
  *                         k = document_len
  *                     for j in range(j, k):             # <<<<<<<<<<<<<<
  *                         if j == i:
  *                             continue
  */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_14 = __pyx_t_13;
-              for (__pyx_t_15 = __pyx_v_j; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-                __pyx_v_j = __pyx_t_15;
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_t_17;
+              for (__pyx_t_19 = __pyx_v_j; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+                __pyx_v_j = __pyx_t_19;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":192
+                /* "gensim/models/doc2vec_corpusfile.pyx":256
  *                         k = document_len
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
  *                             continue
  *                         if c.hs:
  */
-                __pyx_t_9 = ((__pyx_v_j == __pyx_v_i) != 0);
-                if (__pyx_t_9) {
+                __pyx_t_12 = ((__pyx_v_j == __pyx_v_i) != 0);
+                if (__pyx_t_12) {
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":193
+                  /* "gensim/models/doc2vec_corpusfile.pyx":257
  *                     for j in range(j, k):
  *                         if j == i:
  *                             continue             # <<<<<<<<<<<<<<
  *                         if c.hs:
  *                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
  */
-                  goto __pyx_L16_continue;
+                  goto __pyx_L19_continue;
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":192
+                  /* "gensim/models/doc2vec_corpusfile.pyx":256
  *                         k = document_len
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
@@ -3183,17 +3803,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 }
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":194
+                /* "gensim/models/doc2vec_corpusfile.pyx":258
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
  *                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
  *                             fast_document_dbow_hs(
  */
-                __pyx_t_9 = (__pyx_v_c.hs != 0);
-                if (__pyx_t_9) {
+                __pyx_t_12 = (__pyx_v_c.hs != 0);
+                if (__pyx_t_12) {
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":196
+                  /* "gensim/models/doc2vec_corpusfile.pyx":260
  *                         if c.hs:
  *                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
  *                             fast_document_dbow_hs(             # <<<<<<<<<<<<<<
@@ -3202,7 +3822,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                   __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dbow_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), (__pyx_v_c.codelens[__pyx_v_i]), __pyx_v_c.word_vectors, __pyx_v_c.syn1, __pyx_v_c.layer1_size, (__pyx_v_c.indexes[__pyx_v_j]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.learn_words, __pyx_v_c.learn_hidden, __pyx_v_c.word_locks);
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":194
+                  /* "gensim/models/doc2vec_corpusfile.pyx":258
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
@@ -3211,17 +3831,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 }
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":200
+                /* "gensim/models/doc2vec_corpusfile.pyx":264
  *                                 c.indexes[j], c.alpha, c.work, c.learn_words, c.learn_hidden, c.word_locks)
  * 
  *                         if c.negative:             # <<<<<<<<<<<<<<
  *                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
  *                             c.next_random = fast_document_dbow_neg(
  */
-                __pyx_t_9 = (__pyx_v_c.negative != 0);
-                if (__pyx_t_9) {
+                __pyx_t_12 = (__pyx_v_c.negative != 0);
+                if (__pyx_t_12) {
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":202
+                  /* "gensim/models/doc2vec_corpusfile.pyx":266
  *                         if c.negative:
  *                             # we reuse the DBOW function, as it is equivalent to skip-gram for this purpose
  *                             c.next_random = fast_document_dbow_neg(             # <<<<<<<<<<<<<<
@@ -3230,7 +3850,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                   __pyx_v_c.next_random = __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dbow_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.word_vectors, __pyx_v_c.syn1neg, __pyx_v_c.layer1_size, (__pyx_v_c.indexes[__pyx_v_i]), (__pyx_v_c.indexes[__pyx_v_j]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.next_random, __pyx_v_c.learn_words, __pyx_v_c.learn_hidden, __pyx_v_c.word_locks);
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":200
+                  /* "gensim/models/doc2vec_corpusfile.pyx":264
  *                                 c.indexes[j], c.alpha, c.work, c.learn_words, c.learn_hidden, c.word_locks)
  * 
  *                         if c.negative:             # <<<<<<<<<<<<<<
@@ -3238,10 +3858,10 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  *                             c.next_random = fast_document_dbow_neg(
  */
                 }
-                __pyx_L16_continue:;
+                __pyx_L19_continue:;
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":184
+              /* "gensim/models/doc2vec_corpusfile.pyx":248
  * 
  *             for i in range(document_len):
  *                 if c.train_words:  # simultaneous skip-gram wordvec-training             # <<<<<<<<<<<<<<
@@ -3250,27 +3870,27 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":208
+            /* "gensim/models/doc2vec_corpusfile.pyx":272
  * 
  *                 # docvec-training
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
  *                     if c.hs:
  *                         fast_document_dbow_hs(
  */
-            __pyx_t_9 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":209
+              /* "gensim/models/doc2vec_corpusfile.pyx":273
  *                 # docvec-training
  *                 if _doc_tag < c.docvecs_count:
  *                     if c.hs:             # <<<<<<<<<<<<<<
  *                         fast_document_dbow_hs(
  *                             c.points[i], c.codes[i], c.codelens[i], c.doctag_vectors, c.syn1, c.layer1_size,
  */
-              __pyx_t_9 = (__pyx_v_c.hs != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = (__pyx_v_c.hs != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":210
+                /* "gensim/models/doc2vec_corpusfile.pyx":274
  *                 if _doc_tag < c.docvecs_count:
  *                     if c.hs:
  *                         fast_document_dbow_hs(             # <<<<<<<<<<<<<<
@@ -3279,7 +3899,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dbow_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), (__pyx_v_c.codelens[__pyx_v_i]), __pyx_v_c.doctag_vectors, __pyx_v_c.syn1, __pyx_v_c.layer1_size, __pyx_v__doc_tag, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.learn_doctags, __pyx_v_c.learn_hidden, __pyx_v_c.doctag_locks);
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":209
+                /* "gensim/models/doc2vec_corpusfile.pyx":273
  *                 # docvec-training
  *                 if _doc_tag < c.docvecs_count:
  *                     if c.hs:             # <<<<<<<<<<<<<<
@@ -3288,17 +3908,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":214
+              /* "gensim/models/doc2vec_corpusfile.pyx":278
  *                             _doc_tag, c.alpha, c.work, c.learn_doctags, c.learn_hidden, c.doctag_locks)
  * 
  *                     if c.negative:             # <<<<<<<<<<<<<<
  *                         c.next_random = fast_document_dbow_neg(
  *                             c.negative, c.cum_table, c.cum_table_len, c.doctag_vectors, c.syn1neg,
  */
-              __pyx_t_9 = (__pyx_v_c.negative != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = (__pyx_v_c.negative != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":215
+                /* "gensim/models/doc2vec_corpusfile.pyx":279
  * 
  *                     if c.negative:
  *                         c.next_random = fast_document_dbow_neg(             # <<<<<<<<<<<<<<
@@ -3307,7 +3927,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
                 __pyx_v_c.next_random = __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dbow_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.doctag_vectors, __pyx_v_c.syn1neg, __pyx_v_c.layer1_size, (__pyx_v_c.indexes[__pyx_v_i]), __pyx_v__doc_tag, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.next_random, __pyx_v_c.learn_doctags, __pyx_v_c.learn_hidden, __pyx_v_c.doctag_locks);
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":214
+                /* "gensim/models/doc2vec_corpusfile.pyx":278
  *                             _doc_tag, c.alpha, c.work, c.learn_doctags, c.learn_hidden, c.doctag_locks)
  * 
  *                     if c.negative:             # <<<<<<<<<<<<<<
@@ -3316,7 +3936,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":208
+              /* "gensim/models/doc2vec_corpusfile.pyx":272
  * 
  *                 # docvec-training
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -3326,7 +3946,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
             }
           }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":220
+          /* "gensim/models/doc2vec_corpusfile.pyx":284
  *                             c.learn_doctags, c.learn_hidden, c.doctag_locks)
  * 
  *             total_documents += 1             # <<<<<<<<<<<<<<
@@ -3335,7 +3955,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
           __pyx_v_total_documents = (__pyx_v_total_documents + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":221
+          /* "gensim/models/doc2vec_corpusfile.pyx":285
  * 
  *             total_documents += 1
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
@@ -3344,7 +3964,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":222
+          /* "gensim/models/doc2vec_corpusfile.pyx":286
  *             total_documents += 1
  *             total_effective_words += effective_words
  *             _doc_tag += 1             # <<<<<<<<<<<<<<
@@ -3353,7 +3973,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  */
           __pyx_v__doc_tag = (__pyx_v__doc_tag + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":224
+          /* "gensim/models/doc2vec_corpusfile.pyx":288
  *             _doc_tag += 1
  * 
  *             c.alpha = get_next_alpha(             # <<<<<<<<<<<<<<
@@ -3361,16 +3981,16 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  *                 expected_examples, expected_words, cur_epoch, num_epochs)
  */
           __pyx_v_c.alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha(__pyx_v_start_alpha, __pyx_v_end_alpha, __pyx_v_total_documents, __pyx_v_total_words, __pyx_v_expected_examples, __pyx_v_expected_words, __pyx_v_cur_epoch, __pyx_v_num_epochs);
-          __pyx_L6_continue:;
+          __pyx_L7_continue:;
         }
       }
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":168
+      /* "gensim/models/doc2vec_corpusfile.pyx":217
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -3391,7 +4011,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
       }
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":228
+  /* "gensim/models/doc2vec_corpusfile.pyx":292
  *                 expected_examples, expected_words, cur_epoch, num_epochs)
  * 
  *     return total_documents, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -3399,28 +4019,28 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_16 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 228, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_17);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_17, 1, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_16);
-  PyTuple_SET_ITEM(__pyx_t_17, 2, __pyx_t_16);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+  __pyx_t_9 = 0;
   __pyx_t_2 = 0;
   __pyx_t_7 = 0;
-  __pyx_t_16 = 0;
-  __pyx_r = __pyx_t_17;
-  __pyx_t_17 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":95
+  /* "gensim/models/doc2vec_corpusfile.pyx":136
  * 
  * 
  * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -3432,11 +4052,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -3444,7 +4065,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
   return __pyx_r;
 }
 
-/* "gensim/models/doc2vec_corpusfile.pyx":231
+/* "gensim/models/doc2vec_corpusfile.pyx":295
  * 
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -3454,7 +4075,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_d2v_train_epoch_d
 
 /* Python wrapper */
 static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_dm[] = "d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed memory model (\"PV-DM\") by training on a corpus file.\n    This method implements the DM model with a projection (input) layer that is either the sum or mean of the context\n    vectors, depending on the model's `dm_mean` configuration field.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : str\n        Path to corpus file.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarray, optional\n        A learning lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks : numpy.ndarray, optional""\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
+static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_dm[] = "d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed memory model (\"PV-DM\") by training on a corpus file.\n    This method implements the DM model with a projection (input) layer that is either the sum or mean of the context\n    vectors, depending on the model's `dm_mean` configuration field.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.\n    start_doctag : int\n        Tag of the first document read.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarray, optional\n        A learnin""g lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks : numpy.ndarray, optional\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
 static PyMethodDef __pyx_mdef_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm = {"d2v_train_epoch_dm", (PyCFunction)__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_dm};
 static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_model = 0;
@@ -3482,7 +4103,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_start_doctag,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_neu1,&__pyx_n_s_docvecs_count,&__pyx_n_s_word_vectors,&__pyx_n_s_word_locks,&__pyx_n_s_learn_doctags,&__pyx_n_s_learn_words,&__pyx_n_s_learn_hidden,&__pyx_n_s_doctag_vectors,&__pyx_n_s_doctag_locks,0};
     PyObject* values[18] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":232
+    /* "gensim/models/doc2vec_corpusfile.pyx":296
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
  *                        _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,             # <<<<<<<<<<<<<<
@@ -3492,7 +4113,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
     values[11] = ((PyObject *)Py_None);
     values[12] = ((PyObject *)Py_None);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":233
+    /* "gensim/models/doc2vec_corpusfile.pyx":297
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
  *                        _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                        learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None):             # <<<<<<<<<<<<<<
@@ -3556,61 +4177,61 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 1); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 1); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 2); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 2); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_start_doctag)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 3); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 3); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 4); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 4); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 5); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 5); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 6); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 6); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 7); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 7); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 8); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 8); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 9); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 9); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 10:
         if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_docvecs_count)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 10); __PYX_ERR(0, 231, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, 10); __PYX_ERR(0, 295, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 11:
@@ -3656,7 +4277,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dm") < 0)) __PYX_ERR(0, 231, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dm") < 0)) __PYX_ERR(0, 295, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3710,7 +4331,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 231, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm", 0, 11, 18, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 295, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dm", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3718,7 +4339,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_dm(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v_start_doctag, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v_work, __pyx_v_neu1, __pyx_v_docvecs_count, __pyx_v_word_vectors, __pyx_v_word_locks, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, __pyx_v_doctag_vectors, __pyx_v_doctag_locks);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":231
+  /* "gensim/models/doc2vec_corpusfile.pyx":295
  * 
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -3740,7 +4361,9 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -3754,6 +4377,8 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_count;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_inv_count;
   std::vector<std::string>  __pyx_v_doc_words;
+  __pyx_t_5numpy_int32_t *__pyx_v_doc_ids;
+  int __pyx_v_doc_len;
   int __pyx_v__doc_tag;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -3764,42 +4389,44 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_t_5;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_8;
-  int __pyx_t_9;
-  std::vector<std::string>  __pyx_t_10;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_11;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_10;
+  bool __pyx_t_11;
   int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  PyObject *__pyx_t_16 = NULL;
-  PyObject *__pyx_t_17 = NULL;
+  PY_LONG_LONG __pyx_t_13;
+  std::vector<std::string>  __pyx_t_14;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
   __Pyx_RefNannySetupContext("d2v_train_epoch_dm", 0);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":277
+  /* "gensim/models/doc2vec_corpusfile.pyx":345
  *     cdef Doc2VecConfig c
  * 
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 345, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":278
+  /* "gensim/models/doc2vec_corpusfile.pyx":346
  * 
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 346, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 278, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 346, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":279
+  /* "gensim/models/doc2vec_corpusfile.pyx":347
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -3810,12 +4437,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 279, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 347, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":280
+  /* "gensim/models/doc2vec_corpusfile.pyx":348
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -3826,85 +4453,161 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 348, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":281
+  /* "gensim/models/doc2vec_corpusfile.pyx":349
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 349, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":282
+  /* "gensim/models/doc2vec_corpusfile.pyx":350
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 350, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 350, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":283
+  /* "gensim/models/doc2vec_corpusfile.pyx":351
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 283, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 351, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":285
+  /* "gensim/models/doc2vec_corpusfile.pyx":353
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 285, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 353, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  __pyx_t_8 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(0, 353, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":354
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_offset);
+    __pyx_t_9 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":286
+  /* "gensim/models/doc2vec_corpusfile.pyx":355
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":356
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k, m, document_len
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 286, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 356, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":289
+  /* "gensim/models/doc2vec_corpusfile.pyx":359
  * 
  *     cdef int i, j, k, m, document_len
  *     cdef int effective_words = 0             # <<<<<<<<<<<<<<
@@ -3913,7 +4616,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
   __pyx_v_effective_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":290
+  /* "gensim/models/doc2vec_corpusfile.pyx":360
  *     cdef int i, j, k, m, document_len
  *     cdef int effective_words = 0
  *     cdef int total_effective_words = 0, total_documents = 0, total_words = 0             # <<<<<<<<<<<<<<
@@ -3924,7 +4627,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   __pyx_v_total_documents = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":292
+  /* "gensim/models/doc2vec_corpusfile.pyx":362
  *     cdef int total_effective_words = 0, total_documents = 0, total_words = 0
  *     cdef int sent_idx, idx_start, idx_end
  *     cdef REAL_t count, inv_count = 1.0             # <<<<<<<<<<<<<<
@@ -3933,53 +4636,53 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
   __pyx_v_inv_count = 1.0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":295
- * 
- *     cdef vector[string] doc_words
+  /* "gensim/models/doc2vec_corpusfile.pyx":367
+ *     cdef np.int32_t *doc_ids
+ *     cdef int doc_len
  *     cdef int _doc_tag = start_doctag             # <<<<<<<<<<<<<<
  * 
  *     init_d2v_config(
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 295, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 367, __pyx_L1_error)
   __pyx_v__doc_tag = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":298
+  /* "gensim/models/doc2vec_corpusfile.pyx":370
  * 
  *     init_d2v_config(
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=False,             # <<<<<<<<<<<<<<
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  *         doctag_vectors=doctag_vectors, doctag_locks=doctag_locks, docvecs_count=docvecs_count)
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":297
+  /* "gensim/models/doc2vec_corpusfile.pyx":369
  *     cdef int _doc_tag = start_doctag
  * 
  *     init_d2v_config(             # <<<<<<<<<<<<<<
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=False,
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  */
-  __pyx_t_8.__pyx_n = 8;
-  __pyx_t_8.train_words = Py_False;
-  __pyx_t_8.work = __pyx_v_work;
-  __pyx_t_8.neu1 = __pyx_v_neu1;
-  __pyx_t_8.word_vectors = __pyx_v_word_vectors;
-  __pyx_t_8.word_locks = __pyx_v_word_locks;
-  __pyx_t_8.doctag_vectors = __pyx_v_doctag_vectors;
-  __pyx_t_8.doctag_locks = __pyx_v_doctag_locks;
-  __pyx_t_8.docvecs_count = __pyx_v_docvecs_count;
-  __pyx_t_2 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_7, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_10.__pyx_n = 8;
+  __pyx_t_10.train_words = Py_False;
+  __pyx_t_10.work = __pyx_v_work;
+  __pyx_t_10.neu1 = __pyx_v_neu1;
+  __pyx_t_10.word_vectors = __pyx_v_word_vectors;
+  __pyx_t_10.word_locks = __pyx_v_word_locks;
+  __pyx_t_10.doctag_vectors = __pyx_v_doctag_vectors;
+  __pyx_t_10.doctag_locks = __pyx_v_doctag_locks;
+  __pyx_t_10.docvecs_count = __pyx_v_docvecs_count;
+  __pyx_t_9 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":303
+  /* "gensim/models/doc2vec_corpusfile.pyx":375
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -3989,102 +4692,234 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
       #endif
       /*try:*/ {
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":304
+        /* "gensim/models/doc2vec_corpusfile.pyx":376
+ *     # release GIL & train on the full corpus, document by document
+ *     with nogil:
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":377
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
+ */
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->reset(__pyx_v_id_stream);
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":376
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":379
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":380
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_words = 0
+ */
+        while (1) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_12 = (__pyx_t_11 != 0);
+          if (!__pyx_t_12) {
+          } else {
+            __pyx_t_3 = __pyx_t_12;
+            goto __pyx_L9_bool_binop_done;
+          }
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":381
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_words = 0
+ * 
+ */
+          __pyx_t_12 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_12;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":380
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_words = 0
  */
-        ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+          __pyx_t_12 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_12) break;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":382
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ *             effective_words = 0             # <<<<<<<<<<<<<<
+ * 
+ *             if indexed:
+ */
+          __pyx_v_effective_words = 0;
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":305
- *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+          /* "gensim/models/doc2vec_corpusfile.pyx":384
  *             effective_words = 0
  * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ */
+          __pyx_t_12 = (__pyx_v_indexed != 0);
+          if (__pyx_t_12) {
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":386
+ *             if indexed:
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence             # <<<<<<<<<<<<<<
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:
+ */
+            __pyx_t_13 = __pyx_v_id_stream->sentence;
+            __pyx_v__doc_tag = __pyx_t_13;
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":387
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)             # <<<<<<<<<<<<<<
+ *                 if doc_len == 0:
+ *                     continue
+ */
+            __pyx_v_doc_len = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->read_document(__pyx_v_id_stream, (&__pyx_v_doc_ids));
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":388
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 prepare_c_structures_for_id_document(
+ */
+            __pyx_t_12 = ((__pyx_v_doc_len == 0) != 0);
+            if (__pyx_t_12) {
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":389
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_document(
+ *                     doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+ */
+              goto __pyx_L7_continue;
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":388
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 if doc_len == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 prepare_c_structures_for_id_document(
  */
-        while (1) {
-          __pyx_t_9 = (((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_9) {
-          } else {
-            __pyx_t_3 = __pyx_t_9;
-            goto __pyx_L8_bool_binop_done;
-          }
-          __pyx_t_9 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_9;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_9 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_9) break;
-
-          /* "gensim/models/doc2vec_corpusfile.pyx":306
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_words = 0             # <<<<<<<<<<<<<<
- * 
- *             doc_words = input_stream.read_sentence()
+            }
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":390
+ *                 if doc_len == 0:
+ *                     continue
+ *                 prepare_c_structures_for_id_document(             # <<<<<<<<<<<<<<
+ *                     doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+ *                     vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
  */
-          __pyx_v_effective_words = 0;
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_id_document(__pyx_v_doc_ids, __pyx_v_doc_len, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_items_ptr(__pyx_v_vocab), __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":308
+            /* "gensim/models/doc2vec_corpusfile.pyx":384
  *             effective_words = 0
  * 
- *             doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":395
+ *                     &document_len, c.train_words, c.docvecs_count, _doc_tag)
+ *             else:
+ *                 doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
  * 
- *             if doc_words.empty():
+ *                 if doc_words.empty():
  */
-          __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 308, __pyx_L4_error)
-          __pyx_v_doc_words = __pyx_t_10;
+          /*else*/ {
+            __pyx_t_14 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 395, __pyx_L4_error)
+            __pyx_v_doc_words = __pyx_t_14;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":310
- *             doc_words = input_stream.read_sentence()
+            /* "gensim/models/doc2vec_corpusfile.pyx":397
+ *                 doc_words = input_stream.read_sentence()
  * 
- *             if doc_words.empty():             # <<<<<<<<<<<<<<
- *                 continue
+ *                 if doc_words.empty():             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          __pyx_t_9 = (__pyx_v_doc_words.empty() != 0);
-          if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_doc_words.empty() != 0);
+            if (__pyx_t_12) {
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":311
+              /* "gensim/models/doc2vec_corpusfile.pyx":398
  * 
- *             if doc_words.empty():
- *                 continue             # <<<<<<<<<<<<<<
+ *                 if doc_words.empty():
+ *                     continue             # <<<<<<<<<<<<<<
  * 
- *             prepare_c_structures_for_batch(
+ *                 prepare_c_structures_for_batch(
  */
-            goto __pyx_L6_continue;
+              goto __pyx_L7_continue;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":310
- *             doc_words = input_stream.read_sentence()
+              /* "gensim/models/doc2vec_corpusfile.pyx":397
+ *                 doc_words = input_stream.read_sentence()
  * 
- *             if doc_words.empty():             # <<<<<<<<<<<<<<
- *                 continue
+ *                 if doc_words.empty():             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          }
+            }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":315
- *             prepare_c_structures_for_batch(
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
- *                 vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,             # <<<<<<<<<<<<<<
- *                 &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            /* "gensim/models/doc2vec_corpusfile.pyx":402
+ *                 prepare_c_structures_for_batch(
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+ *                     vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,             # <<<<<<<<<<<<<<
+ *                     &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  */
-          __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 315, __pyx_L4_error)
+            __pyx_t_15 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 402, __pyx_L4_error)
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":313
- *                 continue
+            /* "gensim/models/doc2vec_corpusfile.pyx":400
+ *                     continue
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
- *                 vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+ *                     vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
  */
-          __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_11, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_15, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":318
- *                 &document_len, c.train_words, c.docvecs_count, _doc_tag)
+          /* "gensim/models/doc2vec_corpusfile.pyx":405
+ *                     &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  *             for i in range(document_len):             # <<<<<<<<<<<<<<
  *                 j = i - c.window + c.reduced_windows[i]
@@ -4092,10 +4927,10 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
           __pyx_t_1 = __pyx_v_document_len;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
-            __pyx_v_i = __pyx_t_12;
+          for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_4; __pyx_t_16+=1) {
+            __pyx_v_i = __pyx_t_16;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":319
+            /* "gensim/models/doc2vec_corpusfile.pyx":406
  * 
  *             for i in range(document_len):
  *                 j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -4104,17 +4939,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":320
+            /* "gensim/models/doc2vec_corpusfile.pyx":407
  *             for i in range(document_len):
  *                 j = i - c.window + c.reduced_windows[i]
  *                 if j < 0:             # <<<<<<<<<<<<<<
  *                     j = 0
  *                 k = i + c.window + 1 - c.reduced_windows[i]
  */
-            __pyx_t_9 = ((__pyx_v_j < 0) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v_j < 0) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":321
+              /* "gensim/models/doc2vec_corpusfile.pyx":408
  *                 j = i - c.window + c.reduced_windows[i]
  *                 if j < 0:
  *                     j = 0             # <<<<<<<<<<<<<<
@@ -4123,7 +4958,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_j = 0;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":320
+              /* "gensim/models/doc2vec_corpusfile.pyx":407
  *             for i in range(document_len):
  *                 j = i - c.window + c.reduced_windows[i]
  *                 if j < 0:             # <<<<<<<<<<<<<<
@@ -4132,7 +4967,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":322
+            /* "gensim/models/doc2vec_corpusfile.pyx":409
  *                 if j < 0:
  *                     j = 0
  *                 k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -4141,17 +4976,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":323
+            /* "gensim/models/doc2vec_corpusfile.pyx":410
  *                     j = 0
  *                 k = i + c.window + 1 - c.reduced_windows[i]
  *                 if k > document_len:             # <<<<<<<<<<<<<<
  *                     k = document_len
  * 
  */
-            __pyx_t_9 = ((__pyx_v_k > __pyx_v_document_len) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v_k > __pyx_v_document_len) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":324
+              /* "gensim/models/doc2vec_corpusfile.pyx":411
  *                 k = i + c.window + 1 - c.reduced_windows[i]
  *                 if k > document_len:
  *                     k = document_len             # <<<<<<<<<<<<<<
@@ -4160,7 +4995,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_k = __pyx_v_document_len;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":323
+              /* "gensim/models/doc2vec_corpusfile.pyx":410
  *                     j = 0
  *                 k = i + c.window + 1 - c.reduced_windows[i]
  *                 if k > document_len:             # <<<<<<<<<<<<<<
@@ -4169,7 +5004,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":327
+            /* "gensim/models/doc2vec_corpusfile.pyx":414
  * 
  *                 # compose l1 (in _neu1) & clear _work
  *                 memset(c.neu1, 0, c.layer1_size * cython.sizeof(REAL_t))             # <<<<<<<<<<<<<<
@@ -4178,7 +5013,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             (void)(memset(__pyx_v_c.neu1, 0, (__pyx_v_c.layer1_size * (sizeof(__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)))));
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":328
+            /* "gensim/models/doc2vec_corpusfile.pyx":415
  *                 # compose l1 (in _neu1) & clear _work
  *                 memset(c.neu1, 0, c.layer1_size * cython.sizeof(REAL_t))
  *                 count = <REAL_t>0.0             # <<<<<<<<<<<<<<
@@ -4187,38 +5022,38 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             __pyx_v_count = ((__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)0.0);
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":329
+            /* "gensim/models/doc2vec_corpusfile.pyx":416
  *                 memset(c.neu1, 0, c.layer1_size * cython.sizeof(REAL_t))
  *                 count = <REAL_t>0.0
  *                 for m in range(j, k):             # <<<<<<<<<<<<<<
  *                     if m == i:
  *                         continue
  */
-            __pyx_t_13 = __pyx_v_k;
-            __pyx_t_14 = __pyx_t_13;
-            for (__pyx_t_15 = __pyx_v_j; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-              __pyx_v_m = __pyx_t_15;
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_t_17;
+            for (__pyx_t_19 = __pyx_v_j; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+              __pyx_v_m = __pyx_t_19;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":330
+              /* "gensim/models/doc2vec_corpusfile.pyx":417
  *                 count = <REAL_t>0.0
  *                 for m in range(j, k):
  *                     if m == i:             # <<<<<<<<<<<<<<
  *                         continue
  *                     else:
  */
-              __pyx_t_9 = ((__pyx_v_m == __pyx_v_i) != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = ((__pyx_v_m == __pyx_v_i) != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":331
+                /* "gensim/models/doc2vec_corpusfile.pyx":418
  *                 for m in range(j, k):
  *                     if m == i:
  *                         continue             # <<<<<<<<<<<<<<
  *                     else:
  *                         count += ONEF
  */
-                goto __pyx_L15_continue;
+                goto __pyx_L18_continue;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":330
+                /* "gensim/models/doc2vec_corpusfile.pyx":417
  *                 count = <REAL_t>0.0
  *                 for m in range(j, k):
  *                     if m == i:             # <<<<<<<<<<<<<<
@@ -4227,7 +5062,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":333
+              /* "gensim/models/doc2vec_corpusfile.pyx":420
  *                         continue
  *                     else:
  *                         count += ONEF             # <<<<<<<<<<<<<<
@@ -4237,7 +5072,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
               /*else*/ {
                 __pyx_v_count = (__pyx_v_count + __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF);
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":334
+                /* "gensim/models/doc2vec_corpusfile.pyx":421
  *                     else:
  *                         count += ONEF
  *                         our_saxpy(&c.layer1_size, &ONEF, &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)             # <<<<<<<<<<<<<<
@@ -4246,20 +5081,20 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
                 __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.layer1_size), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF), (&(__pyx_v_c.word_vectors[((__pyx_v_c.indexes[__pyx_v_m]) * __pyx_v_c.layer1_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), __pyx_v_c.neu1, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
               }
-              __pyx_L15_continue:;
+              __pyx_L18_continue:;
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":336
+            /* "gensim/models/doc2vec_corpusfile.pyx":423
  *                         our_saxpy(&c.layer1_size, &ONEF, &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
  * 
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
  *                     count += ONEF
  *                     our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE, c.neu1, &ONE)
  */
-            __pyx_t_9 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":337
+              /* "gensim/models/doc2vec_corpusfile.pyx":424
  * 
  *                 if _doc_tag < c.docvecs_count:
  *                     count += ONEF             # <<<<<<<<<<<<<<
@@ -4268,7 +5103,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_count = (__pyx_v_count + __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":338
+              /* "gensim/models/doc2vec_corpusfile.pyx":425
  *                 if _doc_tag < c.docvecs_count:
  *                     count += ONEF
  *                     our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE, c.neu1, &ONE)             # <<<<<<<<<<<<<<
@@ -4277,7 +5112,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.layer1_size), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF), (&(__pyx_v_c.doctag_vectors[(__pyx_v__doc_tag * __pyx_v_c.layer1_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), __pyx_v_c.neu1, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":336
+              /* "gensim/models/doc2vec_corpusfile.pyx":423
  *                         our_saxpy(&c.layer1_size, &ONEF, &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE, c.neu1, &ONE)
  * 
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -4286,17 +5121,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":339
+            /* "gensim/models/doc2vec_corpusfile.pyx":426
  *                     count += ONEF
  *                     our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE, c.neu1, &ONE)
  *                 if count > (<REAL_t>0.5):             # <<<<<<<<<<<<<<
  *                     inv_count = ONEF/count
  *                 if c.cbow_mean:
  */
-            __pyx_t_9 = ((__pyx_v_count > ((__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)0.5)) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v_count > ((__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)0.5)) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":340
+              /* "gensim/models/doc2vec_corpusfile.pyx":427
  *                     our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE, c.neu1, &ONE)
  *                 if count > (<REAL_t>0.5):
  *                     inv_count = ONEF/count             # <<<<<<<<<<<<<<
@@ -4305,7 +5140,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_inv_count = (__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF / __pyx_v_count);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":339
+              /* "gensim/models/doc2vec_corpusfile.pyx":426
  *                     count += ONEF
  *                     our_saxpy(&c.layer1_size, &ONEF, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE, c.neu1, &ONE)
  *                 if count > (<REAL_t>0.5):             # <<<<<<<<<<<<<<
@@ -4314,17 +5149,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":341
+            /* "gensim/models/doc2vec_corpusfile.pyx":428
  *                 if count > (<REAL_t>0.5):
  *                     inv_count = ONEF/count
  *                 if c.cbow_mean:             # <<<<<<<<<<<<<<
  *                     sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  */
-            __pyx_t_9 = (__pyx_v_c.cbow_mean != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.cbow_mean != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":342
+              /* "gensim/models/doc2vec_corpusfile.pyx":429
  *                     inv_count = ONEF/count
  *                 if c.cbow_mean:
  *                     sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)             # <<<<<<<<<<<<<<
@@ -4333,7 +5168,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_6gensim_6models_14word2vec_inner_sscal((&__pyx_v_c.layer1_size), (&__pyx_v_inv_count), __pyx_v_c.neu1, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":341
+              /* "gensim/models/doc2vec_corpusfile.pyx":428
  *                 if count > (<REAL_t>0.5):
  *                     inv_count = ONEF/count
  *                 if c.cbow_mean:             # <<<<<<<<<<<<<<
@@ -4342,7 +5177,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":343
+            /* "gensim/models/doc2vec_corpusfile.pyx":430
  *                 if c.cbow_mean:
  *                     sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error             # <<<<<<<<<<<<<<
@@ -4351,17 +5186,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             (void)(memset(__pyx_v_c.work, 0, (__pyx_v_c.layer1_size * (sizeof(__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)))));
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":344
+            /* "gensim/models/doc2vec_corpusfile.pyx":431
  *                     sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  *                 if c.hs:             # <<<<<<<<<<<<<<
  *                     fast_document_dm_hs(
  *                         c.points[i], c.codes[i], c.codelens[i], c.neu1,
  */
-            __pyx_t_9 = (__pyx_v_c.hs != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.hs != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":345
+              /* "gensim/models/doc2vec_corpusfile.pyx":432
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  *                 if c.hs:
  *                     fast_document_dm_hs(             # <<<<<<<<<<<<<<
@@ -4370,7 +5205,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dm_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), (__pyx_v_c.codelens[__pyx_v_i]), __pyx_v_c.neu1, __pyx_v_c.syn1, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.layer1_size, __pyx_v_c.learn_hidden);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":344
+              /* "gensim/models/doc2vec_corpusfile.pyx":431
  *                     sscal(&c.layer1_size, &inv_count, c.neu1, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  *                 if c.hs:             # <<<<<<<<<<<<<<
@@ -4379,17 +5214,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":349
+            /* "gensim/models/doc2vec_corpusfile.pyx":436
  *                         c.syn1, c.alpha, c.work, c.layer1_size, c.learn_hidden)
  * 
  *                 if c.negative:             # <<<<<<<<<<<<<<
  *                     c.next_random = fast_document_dm_neg(
  *                         c.negative, c.cum_table, c.cum_table_len, c.next_random, c.neu1,
  */
-            __pyx_t_9 = (__pyx_v_c.negative != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.negative != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":350
+              /* "gensim/models/doc2vec_corpusfile.pyx":437
  * 
  *                 if c.negative:
  *                     c.next_random = fast_document_dm_neg(             # <<<<<<<<<<<<<<
@@ -4398,7 +5233,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_c.next_random = __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dm_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.next_random, __pyx_v_c.neu1, __pyx_v_c.syn1neg, (__pyx_v_c.indexes[__pyx_v_i]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.layer1_size, __pyx_v_c.learn_hidden);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":349
+              /* "gensim/models/doc2vec_corpusfile.pyx":436
  *                         c.syn1, c.alpha, c.work, c.layer1_size, c.learn_hidden)
  * 
  *                 if c.negative:             # <<<<<<<<<<<<<<
@@ -4407,17 +5242,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":354
+            /* "gensim/models/doc2vec_corpusfile.pyx":441
  *                         c.syn1neg, c.indexes[i], c.alpha, c.work, c.layer1_size, c.learn_hidden)
  * 
  *                 if not c.cbow_mean:             # <<<<<<<<<<<<<<
  *                     sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 # apply accumulated error in work
  */
-            __pyx_t_9 = ((!(__pyx_v_c.cbow_mean != 0)) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((!(__pyx_v_c.cbow_mean != 0)) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":355
+              /* "gensim/models/doc2vec_corpusfile.pyx":442
  * 
  *                 if not c.cbow_mean:
  *                     sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)             # <<<<<<<<<<<<<<
@@ -4426,7 +5261,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_6gensim_6models_14word2vec_inner_sscal((&__pyx_v_c.layer1_size), (&__pyx_v_inv_count), __pyx_v_c.work, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":354
+              /* "gensim/models/doc2vec_corpusfile.pyx":441
  *                         c.syn1neg, c.indexes[i], c.alpha, c.work, c.layer1_size, c.learn_hidden)
  * 
  *                 if not c.cbow_mean:             # <<<<<<<<<<<<<<
@@ -4435,7 +5270,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":357
+            /* "gensim/models/doc2vec_corpusfile.pyx":444
  *                     sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 # apply accumulated error in work
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -4445,15 +5280,15 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
             __pyx_t_3 = (__pyx_v_c.learn_doctags != 0);
             if (__pyx_t_3) {
             } else {
-              __pyx_t_9 = __pyx_t_3;
-              goto __pyx_L25_bool_binop_done;
+              __pyx_t_12 = __pyx_t_3;
+              goto __pyx_L28_bool_binop_done;
             }
             __pyx_t_3 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
-            __pyx_t_9 = __pyx_t_3;
-            __pyx_L25_bool_binop_done:;
-            if (__pyx_t_9) {
+            __pyx_t_12 = __pyx_t_3;
+            __pyx_L28_bool_binop_done:;
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":358
+              /* "gensim/models/doc2vec_corpusfile.pyx":445
  *                 # apply accumulated error in work
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:
  *                     our_saxpy(&c.layer1_size, &c.doctag_locks[_doc_tag], c.work,             # <<<<<<<<<<<<<<
@@ -4462,7 +5297,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
               __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.layer1_size), (&(__pyx_v_c.doctag_locks[__pyx_v__doc_tag])), __pyx_v_c.work, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), (&(__pyx_v_c.doctag_vectors[(__pyx_v__doc_tag * __pyx_v_c.layer1_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":357
+              /* "gensim/models/doc2vec_corpusfile.pyx":444
  *                     sscal(&c.layer1_size, &inv_count, c.work, &ONE)  # (does this need BLAS-variants like saxpy?)
  *                 # apply accumulated error in work
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -4471,48 +5306,48 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":360
+            /* "gensim/models/doc2vec_corpusfile.pyx":447
  *                     our_saxpy(&c.layer1_size, &c.doctag_locks[_doc_tag], c.work,
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE)
  *                 if c.learn_words:             # <<<<<<<<<<<<<<
  *                     for m in range(j, k):
  *                         if m == i:
  */
-            __pyx_t_9 = (__pyx_v_c.learn_words != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.learn_words != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":361
+              /* "gensim/models/doc2vec_corpusfile.pyx":448
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE)
  *                 if c.learn_words:
  *                     for m in range(j, k):             # <<<<<<<<<<<<<<
  *                         if m == i:
  *                             continue
  */
-              __pyx_t_13 = __pyx_v_k;
-              __pyx_t_14 = __pyx_t_13;
-              for (__pyx_t_15 = __pyx_v_j; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-                __pyx_v_m = __pyx_t_15;
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_t_17;
+              for (__pyx_t_19 = __pyx_v_j; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+                __pyx_v_m = __pyx_t_19;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":362
+                /* "gensim/models/doc2vec_corpusfile.pyx":449
  *                 if c.learn_words:
  *                     for m in range(j, k):
  *                         if m == i:             # <<<<<<<<<<<<<<
  *                             continue
  *                         else:
  */
-                __pyx_t_9 = ((__pyx_v_m == __pyx_v_i) != 0);
-                if (__pyx_t_9) {
+                __pyx_t_12 = ((__pyx_v_m == __pyx_v_i) != 0);
+                if (__pyx_t_12) {
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":363
+                  /* "gensim/models/doc2vec_corpusfile.pyx":450
  *                     for m in range(j, k):
  *                         if m == i:
  *                             continue             # <<<<<<<<<<<<<<
  *                         else:
  *                              our_saxpy(&c.layer1_size, &c.word_locks[c.indexes[m]], c.work, &ONE,
  */
-                  goto __pyx_L28_continue;
+                  goto __pyx_L31_continue;
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":362
+                  /* "gensim/models/doc2vec_corpusfile.pyx":449
  *                 if c.learn_words:
  *                     for m in range(j, k):
  *                         if m == i:             # <<<<<<<<<<<<<<
@@ -4521,7 +5356,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
                 }
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":365
+                /* "gensim/models/doc2vec_corpusfile.pyx":452
  *                             continue
  *                         else:
  *                              our_saxpy(&c.layer1_size, &c.word_locks[c.indexes[m]], c.work, &ONE,             # <<<<<<<<<<<<<<
@@ -4530,7 +5365,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
                 /*else*/ {
 
-                  /* "gensim/models/doc2vec_corpusfile.pyx":366
+                  /* "gensim/models/doc2vec_corpusfile.pyx":453
  *                         else:
  *                              our_saxpy(&c.layer1_size, &c.word_locks[c.indexes[m]], c.work, &ONE,
  *                                        &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE)             # <<<<<<<<<<<<<<
@@ -4539,10 +5374,10 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
                   __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.layer1_size), (&(__pyx_v_c.word_locks[(__pyx_v_c.indexes[__pyx_v_m])])), __pyx_v_c.work, (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), (&(__pyx_v_c.word_vectors[((__pyx_v_c.indexes[__pyx_v_m]) * __pyx_v_c.layer1_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
                 }
-                __pyx_L28_continue:;
+                __pyx_L31_continue:;
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":360
+              /* "gensim/models/doc2vec_corpusfile.pyx":447
  *                     our_saxpy(&c.layer1_size, &c.doctag_locks[_doc_tag], c.work,
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.layer1_size], &ONE)
  *                 if c.learn_words:             # <<<<<<<<<<<<<<
@@ -4552,7 +5387,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
             }
           }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":368
+          /* "gensim/models/doc2vec_corpusfile.pyx":455
  *                                        &c.word_vectors[c.indexes[m] * c.layer1_size], &ONE)
  * 
  *             total_documents += 1             # <<<<<<<<<<<<<<
@@ -4561,7 +5396,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
           __pyx_v_total_documents = (__pyx_v_total_documents + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":369
+          /* "gensim/models/doc2vec_corpusfile.pyx":456
  * 
  *             total_documents += 1
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
@@ -4570,7 +5405,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":370
+          /* "gensim/models/doc2vec_corpusfile.pyx":457
  *             total_documents += 1
  *             total_effective_words += effective_words
  *             _doc_tag += 1             # <<<<<<<<<<<<<<
@@ -4579,7 +5414,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  */
           __pyx_v__doc_tag = (__pyx_v__doc_tag + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":372
+          /* "gensim/models/doc2vec_corpusfile.pyx":459
  *             _doc_tag += 1
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_documents, total_words, expected_examples,             # <<<<<<<<<<<<<<
@@ -4587,16 +5422,16 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  * 
  */
           __pyx_v_c.alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha(__pyx_v_start_alpha, __pyx_v_end_alpha, __pyx_v_total_documents, __pyx_v_total_words, __pyx_v_expected_examples, __pyx_v_expected_words, __pyx_v_cur_epoch, __pyx_v_num_epochs);
-          __pyx_L6_continue:;
+          __pyx_L7_continue:;
         }
       }
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":303
+      /* "gensim/models/doc2vec_corpusfile.pyx":375
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -4617,7 +5452,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
       }
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":375
+  /* "gensim/models/doc2vec_corpusfile.pyx":462
  *                                     expected_words, cur_epoch, num_epochs)
  * 
  *     return total_documents, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -4625,28 +5460,28 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 462, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 462, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_16 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 375, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 375, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_17);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_17, 1, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_16);
-  PyTuple_SET_ITEM(__pyx_t_17, 2, __pyx_t_16);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+  __pyx_t_9 = 0;
   __pyx_t_2 = 0;
   __pyx_t_7 = 0;
-  __pyx_t_16 = 0;
-  __pyx_r = __pyx_t_17;
-  __pyx_t_17 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":231
+  /* "gensim/models/doc2vec_corpusfile.pyx":295
  * 
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -4658,11 +5493,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dm", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -4670,7 +5506,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
   return __pyx_r;
 }
 
-/* "gensim/models/doc2vec_corpusfile.pyx":378
+/* "gensim/models/doc2vec_corpusfile.pyx":465
  * 
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -4680,7 +5516,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_2d2v_train_epoch_
 
 /* Python wrapper */
 static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_dm_concat[] = "d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed memory model (\"PV-DM\") by training on a corpus file, using a concatenation of the context\n     window word vectors (rather than a sum or average).\n     This might be slower since the input at each batch will be significantly larger.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : str\n        Path to corpus file.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarray, optional\n        A learning lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks : numpy.ndarray, optional""\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
+static char __pyx_doc_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_dm_concat[] = "d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None, learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None)\nTrain distributed memory model (\"PV-DM\") by training on a corpus file, using a concatenation of the context\n     window word vectors (rather than a sum or average).\n     This might be slower since the input at each batch will be significantly larger.\n\n    Called internally from :meth:`~gensim.models.doc2vec.Doc2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.doc2vec.Doc2Vec`\n        The FastText model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.\n    start_doctag : int\n        Tag of the first document read.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    work : np.ndarray\n        Private working memory for each worker.\n    neu1 : np.ndarray\n        Private working memory for each worker.\n    learn_doctags : bool, optional\n        Whether the tag vectors should be updated.\n    learn_words : bool, optional\n        Word vectors will be updated exactly as per Word2Vec skip-gram training only if **both**\n        `learn_words` and `train_words` are set to True.\n    learn_hidden : bool, optional\n        Whether or not the weights of the hidden layer will be updated.\n    word_vectors : numpy.ndarray, optional\n        The vector representation for each word in the vocabulary. If None, these will be retrieved from the model.\n    word_locks : numpy.ndarray, optional\n        A learnin""g lock factor for each weight in the hidden layer for words, value 0 completely blocks updates,\n        a value of 1 allows to update word-vectors.\n    doctag_vectors : numpy.ndarray, optional\n        Vector representations of the tags. If None, these will be retrieved from the model.\n    doctag_locks : numpy.ndarray, optional\n        The lock factors for each tag, same as `word_locks`, but for document-vectors.\n\n    Returns\n    -------\n    int\n        Number of words in the input document that were actually used for training.\n\n    ";
 static PyMethodDef __pyx_mdef_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat = {"d2v_train_epoch_dm_concat", (PyCFunction)__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_dm_concat};
 static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_model = 0;
@@ -4708,7 +5544,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_start_doctag,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_neu1,&__pyx_n_s_docvecs_count,&__pyx_n_s_word_vectors,&__pyx_n_s_word_locks,&__pyx_n_s_learn_doctags,&__pyx_n_s_learn_words,&__pyx_n_s_learn_hidden,&__pyx_n_s_doctag_vectors,&__pyx_n_s_doctag_locks,0};
     PyObject* values[18] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":379
+    /* "gensim/models/doc2vec_corpusfile.pyx":466
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
  *                               _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,             # <<<<<<<<<<<<<<
@@ -4718,7 +5554,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
     values[11] = ((PyObject *)Py_None);
     values[12] = ((PyObject *)Py_None);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":380
+    /* "gensim/models/doc2vec_corpusfile.pyx":467
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
  *                               _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                               learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None,             # <<<<<<<<<<<<<<
@@ -4730,7 +5566,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
     values[15] = ((PyObject *)Py_True);
     values[16] = ((PyObject *)Py_None);
 
-    /* "gensim/models/doc2vec_corpusfile.pyx":381
+    /* "gensim/models/doc2vec_corpusfile.pyx":468
  *                               _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                               learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None,
  *                               doctag_locks=None):             # <<<<<<<<<<<<<<
@@ -4790,61 +5626,61 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 1); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 1); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 2); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 2); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_start_doctag)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 3); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 3); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 4); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 4); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 5); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 5); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 6); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 6); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 7); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 7); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 8); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 8); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 9); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 9); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 10:
         if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_docvecs_count)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 10); __PYX_ERR(0, 378, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, 10); __PYX_ERR(0, 465, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 11:
@@ -4890,7 +5726,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dm_concat") < 0)) __PYX_ERR(0, 378, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "d2v_train_epoch_dm_concat") < 0)) __PYX_ERR(0, 465, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4944,7 +5780,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 378, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("d2v_train_epoch_dm_concat", 0, 11, 18, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 465, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dm_concat", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -4952,7 +5788,7 @@ static PyObject *__pyx_pw_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_dm_concat(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v_start_doctag, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v_work, __pyx_v_neu1, __pyx_v_docvecs_count, __pyx_v_word_vectors, __pyx_v_word_locks, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, __pyx_v_doctag_vectors, __pyx_v_doctag_locks);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":378
+  /* "gensim/models/doc2vec_corpusfile.pyx":465
  * 
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -4974,7 +5810,9 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -4987,6 +5825,8 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   int __pyx_v_total_documents;
   int __pyx_v_total_words;
   std::vector<std::string>  __pyx_v_doc_words;
+  __pyx_t_5numpy_int32_t *__pyx_v_doc_ids;
+  int __pyx_v_doc_len;
   int __pyx_v__doc_tag;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -4997,45 +5837,47 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t __pyx_t_5;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_8;
-  int __pyx_t_9;
-  std::vector<std::string>  __pyx_t_10;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_11;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  struct __pyx_opt_args_6gensim_6models_13doc2vec_inner_init_d2v_config __pyx_t_10;
+  bool __pyx_t_11;
   int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
+  PY_LONG_LONG __pyx_t_13;
+  std::vector<std::string>  __pyx_t_14;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_15;
   int __pyx_t_16;
-  long __pyx_t_17;
-  long __pyx_t_18;
-  PyObject *__pyx_t_19 = NULL;
-  PyObject *__pyx_t_20 = NULL;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  long __pyx_t_21;
+  long __pyx_t_22;
   __Pyx_RefNannySetupContext("d2v_train_epoch_dm_concat", 0);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":425
+  /* "gensim/models/doc2vec_corpusfile.pyx":516
  *     cdef Doc2VecConfig c
  * 
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 425, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 516, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":426
+  /* "gensim/models/doc2vec_corpusfile.pyx":517
  * 
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 426, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 517, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 426, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 517, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":427
+  /* "gensim/models/doc2vec_corpusfile.pyx":518
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -5046,12 +5888,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 427, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 518, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":428
+  /* "gensim/models/doc2vec_corpusfile.pyx":519
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -5062,85 +5904,161 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 428, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 519, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":429
+  /* "gensim/models/doc2vec_corpusfile.pyx":520
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 429, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 520, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":430
+  /* "gensim/models/doc2vec_corpusfile.pyx":521
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 521, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 430, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 521, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":431
+  /* "gensim/models/doc2vec_corpusfile.pyx":522
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 431, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 522, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 431, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 522, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":433
+  /* "gensim/models/doc2vec_corpusfile.pyx":524
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 433, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 524, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  __pyx_t_8 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 524, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(0, 524, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":525
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_offset);
+    __pyx_t_9 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":434
+  /* "gensim/models/doc2vec_corpusfile.pyx":526
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":527
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k, m, n, document_len
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 434, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 527, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":437
+  /* "gensim/models/doc2vec_corpusfile.pyx":530
  * 
  *     cdef int i, j, k, m, n, document_len
  *     cdef int effective_words = 0             # <<<<<<<<<<<<<<
@@ -5149,7 +6067,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
   __pyx_v_effective_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":438
+  /* "gensim/models/doc2vec_corpusfile.pyx":531
  *     cdef int i, j, k, m, n, document_len
  *     cdef int effective_words = 0
  *     cdef int total_effective_words = 0, total_documents = 0, total_words = 0             # <<<<<<<<<<<<<<
@@ -5160,53 +6078,53 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   __pyx_v_total_documents = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":442
- * 
- *     cdef vector[string] doc_words
+  /* "gensim/models/doc2vec_corpusfile.pyx":537
+ *     cdef np.int32_t *doc_ids
+ *     cdef int doc_len
  *     cdef int _doc_tag = start_doctag             # <<<<<<<<<<<<<<
  * 
  *     init_d2v_config(
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 442, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_start_doctag); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 537, __pyx_L1_error)
   __pyx_v__doc_tag = __pyx_t_1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":445
+  /* "gensim/models/doc2vec_corpusfile.pyx":540
  * 
  *     init_d2v_config(
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=False,             # <<<<<<<<<<<<<<
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  *         doctag_vectors=doctag_vectors, doctag_locks=doctag_locks, docvecs_count=docvecs_count)
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 445, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 540, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":444
+  /* "gensim/models/doc2vec_corpusfile.pyx":539
  *     cdef int _doc_tag = start_doctag
  * 
  *     init_d2v_config(             # <<<<<<<<<<<<<<
  *         &c, model, _alpha, learn_doctags, learn_words, learn_hidden, train_words=False,
  *         work=work, neu1=neu1, word_vectors=word_vectors, word_locks=word_locks,
  */
-  __pyx_t_8.__pyx_n = 8;
-  __pyx_t_8.train_words = Py_False;
-  __pyx_t_8.work = __pyx_v_work;
-  __pyx_t_8.neu1 = __pyx_v_neu1;
-  __pyx_t_8.word_vectors = __pyx_v_word_vectors;
-  __pyx_t_8.word_locks = __pyx_v_word_locks;
-  __pyx_t_8.doctag_vectors = __pyx_v_doctag_vectors;
-  __pyx_t_8.doctag_locks = __pyx_v_doctag_locks;
-  __pyx_t_8.docvecs_count = __pyx_v_docvecs_count;
-  __pyx_t_2 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_7, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 444, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_10.__pyx_n = 8;
+  __pyx_t_10.train_words = Py_False;
+  __pyx_t_10.work = __pyx_v_work;
+  __pyx_t_10.neu1 = __pyx_v_neu1;
+  __pyx_t_10.word_vectors = __pyx_v_word_vectors;
+  __pyx_t_10.word_locks = __pyx_v_word_locks;
+  __pyx_t_10.doctag_vectors = __pyx_v_doctag_vectors;
+  __pyx_t_10.doctag_locks = __pyx_v_doctag_locks;
+  __pyx_t_10.docvecs_count = __pyx_v_docvecs_count;
+  __pyx_t_9 = __pyx_f_6gensim_6models_13doc2vec_inner_init_d2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v_learn_doctags, __pyx_v_learn_words, __pyx_v_learn_hidden, &__pyx_t_10); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":450
+  /* "gensim/models/doc2vec_corpusfile.pyx":545
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -5216,128 +6134,277 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
       #endif
       /*try:*/ {
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":451
+        /* "gensim/models/doc2vec_corpusfile.pyx":546
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_words = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":547
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
  */
-        ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->reset(__pyx_v_id_stream);
 
-        /* "gensim/models/doc2vec_corpusfile.pyx":452
+          /* "gensim/models/doc2vec_corpusfile.pyx":546
+ *     # release GIL & train on the full corpus, document by document
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":549
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/doc2vec_corpusfile.pyx":550
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_words = 0
- * 
  */
         while (1) {
-          __pyx_t_9 = (((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_9) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_12 = (__pyx_t_11 != 0);
+          if (!__pyx_t_12) {
           } else {
-            __pyx_t_3 = __pyx_t_9;
-            goto __pyx_L8_bool_binop_done;
+            __pyx_t_3 = __pyx_t_12;
+            goto __pyx_L9_bool_binop_done;
           }
-          __pyx_t_9 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_9;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_9 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_9) break;
-
-          /* "gensim/models/doc2vec_corpusfile.pyx":453
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":551
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_words = 0
+ * 
+ */
+          __pyx_t_12 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_12;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":550
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_words = 0
+ */
+          __pyx_t_12 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_12) break;
+
+          /* "gensim/models/doc2vec_corpusfile.pyx":552
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             doc_words = input_stream.read_sentence()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":455
+          /* "gensim/models/doc2vec_corpusfile.pyx":554
  *             effective_words = 0
  * 
- *             doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
- *             _doc_tag = total_documents
- *             c.doctag_len = _doc_tag < c.docvecs_count
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
  */
-          __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 455, __pyx_L4_error)
-          __pyx_v_doc_words = __pyx_t_10;
+          __pyx_t_12 = (__pyx_v_indexed != 0);
+          if (__pyx_t_12) {
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":456
+            /* "gensim/models/doc2vec_corpusfile.pyx":556
+ *             if indexed:
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence             # <<<<<<<<<<<<<<
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 c.doctag_len = _doc_tag < c.docvecs_count
+ */
+            __pyx_t_13 = __pyx_v_id_stream->sentence;
+            __pyx_v__doc_tag = __pyx_t_13;
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":557
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)             # <<<<<<<<<<<<<<
+ *                 c.doctag_len = _doc_tag < c.docvecs_count
  * 
- *             doc_words = input_stream.read_sentence()
- *             _doc_tag = total_documents             # <<<<<<<<<<<<<<
- *             c.doctag_len = _doc_tag < c.docvecs_count
+ */
+            __pyx_v_doc_len = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->read_document(__pyx_v_id_stream, (&__pyx_v_doc_ids));
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":558
+ *                 _doc_tag = id_stream.sentence
+ *                 doc_len = id_stream.read_document(&doc_ids)
+ *                 c.doctag_len = _doc_tag < c.docvecs_count             # <<<<<<<<<<<<<<
  * 
+ *                 # skip doc either empty or without expected number of tags
  */
-          __pyx_v__doc_tag = __pyx_v_total_documents;
+            __pyx_v_c.doctag_len = (__pyx_v__doc_tag < __pyx_v_c.docvecs_count);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":457
- *             doc_words = input_stream.read_sentence()
- *             _doc_tag = total_documents
- *             c.doctag_len = _doc_tag < c.docvecs_count             # <<<<<<<<<<<<<<
+            /* "gensim/models/doc2vec_corpusfile.pyx":561
+ * 
+ *                 # skip doc either empty or without expected number of tags
+ *                 if doc_len == 0 or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+ */
+            __pyx_t_3 = ((__pyx_v_doc_len == 0) != 0);
+            if (!__pyx_t_3) {
+            } else {
+              __pyx_t_12 = __pyx_t_3;
+              goto __pyx_L13_bool_binop_done;
+            }
+            __pyx_t_3 = ((__pyx_v_c.expected_doctag_len != __pyx_v_c.doctag_len) != 0);
+            __pyx_t_12 = __pyx_t_3;
+            __pyx_L13_bool_binop_done:;
+            if (__pyx_t_12) {
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":562
+ *                 # skip doc either empty or without expected number of tags
+ *                 if doc_len == 0 or c.expected_doctag_len != c.doctag_len:
+ *                     continue             # <<<<<<<<<<<<<<
  * 
- *              # skip doc either empty or without expected number of tags
+ *                 prepare_c_structures_for_id_document(
  */
-          __pyx_v_c.doctag_len = (__pyx_v__doc_tag < __pyx_v_c.docvecs_count);
+              goto __pyx_L7_continue;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":460
+              /* "gensim/models/doc2vec_corpusfile.pyx":561
  * 
- *              # skip doc either empty or without expected number of tags
- *             if doc_words.empty() or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
- *                 continue
+ *                 # skip doc either empty or without expected number of tags
+ *                 if doc_len == 0 or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          __pyx_t_3 = (__pyx_v_doc_words.empty() != 0);
-          if (!__pyx_t_3) {
-          } else {
-            __pyx_t_9 = __pyx_t_3;
-            goto __pyx_L11_bool_binop_done;
+            }
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":564
+ *                     continue
+ * 
+ *                 prepare_c_structures_for_id_document(             # <<<<<<<<<<<<<<
+ *                     doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes,
+ */
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_id_document(__pyx_v_doc_ids, __pyx_v_doc_len, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_items_ptr(__pyx_v_vocab), __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, NULL, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":554
+ *             effective_words = 0
+ * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+ *                 _doc_tag = id_stream.sentence
+ */
+            goto __pyx_L11;
           }
-          __pyx_t_3 = ((__pyx_v_c.expected_doctag_len != __pyx_v_c.doctag_len) != 0);
-          __pyx_t_9 = __pyx_t_3;
-          __pyx_L11_bool_binop_done:;
-          if (__pyx_t_9) {
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":461
- *              # skip doc either empty or without expected number of tags
- *             if doc_words.empty() or c.expected_doctag_len != c.doctag_len:
- *                 continue             # <<<<<<<<<<<<<<
+          /* "gensim/models/doc2vec_corpusfile.pyx":569
+ *                     c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+ *             else:
+ *                 doc_words = input_stream.read_sentence()             # <<<<<<<<<<<<<<
+ *                 _doc_tag = total_documents
+ *                 c.doctag_len = _doc_tag < c.docvecs_count
+ */
+          /*else*/ {
+            __pyx_t_14 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->read_sentence(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 569, __pyx_L4_error)
+            __pyx_v_doc_words = __pyx_t_14;
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":570
+ *             else:
+ *                 doc_words = input_stream.read_sentence()
+ *                 _doc_tag = total_documents             # <<<<<<<<<<<<<<
+ *                 c.doctag_len = _doc_tag < c.docvecs_count
+ * 
+ */
+            __pyx_v__doc_tag = __pyx_v_total_documents;
+
+            /* "gensim/models/doc2vec_corpusfile.pyx":571
+ *                 doc_words = input_stream.read_sentence()
+ *                 _doc_tag = total_documents
+ *                 c.doctag_len = _doc_tag < c.docvecs_count             # <<<<<<<<<<<<<<
  * 
- *             prepare_c_structures_for_batch(
+ *                  # skip doc either empty or without expected number of tags
  */
-            goto __pyx_L6_continue;
+            __pyx_v_c.doctag_len = (__pyx_v__doc_tag < __pyx_v_c.docvecs_count);
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":460
+            /* "gensim/models/doc2vec_corpusfile.pyx":574
  * 
- *              # skip doc either empty or without expected number of tags
- *             if doc_words.empty() or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
- *                 continue
+ *                  # skip doc either empty or without expected number of tags
+ *                 if doc_words.empty() or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
+ *                     continue
  * 
  */
-          }
+            __pyx_t_3 = (__pyx_v_doc_words.empty() != 0);
+            if (!__pyx_t_3) {
+            } else {
+              __pyx_t_12 = __pyx_t_3;
+              goto __pyx_L16_bool_binop_done;
+            }
+            __pyx_t_3 = ((__pyx_v_c.expected_doctag_len != __pyx_v_c.doctag_len) != 0);
+            __pyx_t_12 = __pyx_t_3;
+            __pyx_L16_bool_binop_done:;
+            if (__pyx_t_12) {
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":575
+ *                  # skip doc either empty or without expected number of tags
+ *                 if doc_words.empty() or c.expected_doctag_len != c.doctag_len:
+ *                     continue             # <<<<<<<<<<<<<<
+ * 
+ *                 prepare_c_structures_for_batch(
+ */
+              goto __pyx_L7_continue;
+
+              /* "gensim/models/doc2vec_corpusfile.pyx":574
+ * 
+ *                  # skip doc either empty or without expected number of tags
+ *                 if doc_words.empty() or c.expected_doctag_len != c.doctag_len:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+ */
+            }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":465
- *             prepare_c_structures_for_batch(
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,             # <<<<<<<<<<<<<<
- *                 c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            /* "gensim/models/doc2vec_corpusfile.pyx":579
+ *                 prepare_c_structures_for_batch(
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,             # <<<<<<<<<<<<<<
+ *                     c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  */
-          __pyx_t_11 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 465, __pyx_L4_error)
+            __pyx_t_15 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 579, __pyx_L4_error)
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":463
- *                 continue
+            /* "gensim/models/doc2vec_corpusfile.pyx":577
+ *                     continue
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
  */
-          __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_11, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, NULL, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+            __pyx_f_6gensim_6models_18doc2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_doc_words, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_c.next_random), __pyx_t_15, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, NULL, (&__pyx_v_document_len), __pyx_v_c.train_words, __pyx_v_c.docvecs_count, __pyx_v__doc_tag);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":468
- *                 c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+          /* "gensim/models/doc2vec_corpusfile.pyx":582
+ *                     c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
  * 
  *             for i in range(document_len):             # <<<<<<<<<<<<<<
  *                 j = i - c.window      # negative OK: will pad with null word
@@ -5345,10 +6412,10 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
           __pyx_t_1 = __pyx_v_document_len;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
-            __pyx_v_i = __pyx_t_12;
+          for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_4; __pyx_t_16+=1) {
+            __pyx_v_i = __pyx_t_16;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":469
+            /* "gensim/models/doc2vec_corpusfile.pyx":583
  * 
  *             for i in range(document_len):
  *                 j = i - c.window      # negative OK: will pad with null word             # <<<<<<<<<<<<<<
@@ -5357,7 +6424,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             __pyx_v_j = (__pyx_v_i - __pyx_v_c.window);
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":470
+            /* "gensim/models/doc2vec_corpusfile.pyx":584
  *             for i in range(document_len):
  *                 j = i - c.window      # negative OK: will pad with null word
  *                 k = i + c.window + 1  # past document end OK: will pad with null word             # <<<<<<<<<<<<<<
@@ -5366,17 +6433,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             __pyx_v_k = ((__pyx_v_i + __pyx_v_c.window) + 1);
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":473
+            /* "gensim/models/doc2vec_corpusfile.pyx":587
  * 
  *                 # compose l1 & clear work
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
  *                     # doc vector(s)
  *                     memcpy(&c.neu1[0], &c.doctag_vectors[_doc_tag * c.vector_size],
  */
-            __pyx_t_9 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":475
+              /* "gensim/models/doc2vec_corpusfile.pyx":589
  *                 if _doc_tag < c.docvecs_count:
  *                     # doc vector(s)
  *                     memcpy(&c.neu1[0], &c.doctag_vectors[_doc_tag * c.vector_size],             # <<<<<<<<<<<<<<
@@ -5385,7 +6452,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
               (void)(memcpy((&(__pyx_v_c.neu1[0])), (&(__pyx_v_c.doctag_vectors[(__pyx_v__doc_tag * __pyx_v_c.vector_size)])), (__pyx_v_c.vector_size * (sizeof(__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)))));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":473
+              /* "gensim/models/doc2vec_corpusfile.pyx":587
  * 
  *                 # compose l1 & clear work
  *                 if _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -5394,7 +6461,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":477
+            /* "gensim/models/doc2vec_corpusfile.pyx":591
  *                     memcpy(&c.neu1[0], &c.doctag_vectors[_doc_tag * c.vector_size],
  *                            c.vector_size * cython.sizeof(REAL_t))
  *                 n = 0             # <<<<<<<<<<<<<<
@@ -5403,38 +6470,38 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             __pyx_v_n = 0;
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":478
+            /* "gensim/models/doc2vec_corpusfile.pyx":592
  *                            c.vector_size * cython.sizeof(REAL_t))
  *                 n = 0
  *                 for m in range(j, k):             # <<<<<<<<<<<<<<
  *                     # word vectors in window
  *                     if m == i:
  */
-            __pyx_t_13 = __pyx_v_k;
-            __pyx_t_14 = __pyx_t_13;
-            for (__pyx_t_15 = __pyx_v_j; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-              __pyx_v_m = __pyx_t_15;
+            __pyx_t_17 = __pyx_v_k;
+            __pyx_t_18 = __pyx_t_17;
+            for (__pyx_t_19 = __pyx_v_j; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+              __pyx_v_m = __pyx_t_19;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":480
+              /* "gensim/models/doc2vec_corpusfile.pyx":594
  *                 for m in range(j, k):
  *                     # word vectors in window
  *                     if m == i:             # <<<<<<<<<<<<<<
  *                         continue
  *                     if m < 0 or m >= document_len:
  */
-              __pyx_t_9 = ((__pyx_v_m == __pyx_v_i) != 0);
-              if (__pyx_t_9) {
+              __pyx_t_12 = ((__pyx_v_m == __pyx_v_i) != 0);
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":481
+                /* "gensim/models/doc2vec_corpusfile.pyx":595
  *                     # word vectors in window
  *                     if m == i:
  *                         continue             # <<<<<<<<<<<<<<
  *                     if m < 0 or m >= document_len:
  *                         c.window_indexes[n] = c.null_word_index
  */
-                goto __pyx_L16_continue;
+                goto __pyx_L21_continue;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":480
+                /* "gensim/models/doc2vec_corpusfile.pyx":594
  *                 for m in range(j, k):
  *                     # word vectors in window
  *                     if m == i:             # <<<<<<<<<<<<<<
@@ -5443,7 +6510,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":482
+              /* "gensim/models/doc2vec_corpusfile.pyx":596
  *                     if m == i:
  *                         continue
  *                     if m < 0 or m >= document_len:             # <<<<<<<<<<<<<<
@@ -5453,35 +6520,35 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
               __pyx_t_3 = ((__pyx_v_m < 0) != 0);
               if (!__pyx_t_3) {
               } else {
-                __pyx_t_9 = __pyx_t_3;
-                goto __pyx_L20_bool_binop_done;
+                __pyx_t_12 = __pyx_t_3;
+                goto __pyx_L25_bool_binop_done;
               }
               __pyx_t_3 = ((__pyx_v_m >= __pyx_v_document_len) != 0);
-              __pyx_t_9 = __pyx_t_3;
-              __pyx_L20_bool_binop_done:;
-              if (__pyx_t_9) {
+              __pyx_t_12 = __pyx_t_3;
+              __pyx_L25_bool_binop_done:;
+              if (__pyx_t_12) {
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":483
+                /* "gensim/models/doc2vec_corpusfile.pyx":597
  *                         continue
  *                     if m < 0 or m >= document_len:
  *                         c.window_indexes[n] = c.null_word_index             # <<<<<<<<<<<<<<
  *                     else:
  *                         c.window_indexes[n] = c.indexes[m]
  */
-                __pyx_t_16 = __pyx_v_c.null_word_index;
-                (__pyx_v_c.window_indexes[__pyx_v_n]) = __pyx_t_16;
+                __pyx_t_20 = __pyx_v_c.null_word_index;
+                (__pyx_v_c.window_indexes[__pyx_v_n]) = __pyx_t_20;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":482
+                /* "gensim/models/doc2vec_corpusfile.pyx":596
  *                     if m == i:
  *                         continue
  *                     if m < 0 or m >= document_len:             # <<<<<<<<<<<<<<
  *                         c.window_indexes[n] = c.null_word_index
  *                     else:
  */
-                goto __pyx_L19;
+                goto __pyx_L24;
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":485
+              /* "gensim/models/doc2vec_corpusfile.pyx":599
  *                         c.window_indexes[n] = c.null_word_index
  *                     else:
  *                         c.window_indexes[n] = c.indexes[m]             # <<<<<<<<<<<<<<
@@ -5491,9 +6558,9 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
               /*else*/ {
                 (__pyx_v_c.window_indexes[__pyx_v_n]) = (__pyx_v_c.indexes[__pyx_v_m]);
               }
-              __pyx_L19:;
+              __pyx_L24:;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":486
+              /* "gensim/models/doc2vec_corpusfile.pyx":600
  *                     else:
  *                         c.window_indexes[n] = c.indexes[m]
  *                     n += 1             # <<<<<<<<<<<<<<
@@ -5501,22 +6568,22 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  *                     memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],
  */
               __pyx_v_n = (__pyx_v_n + 1);
-              __pyx_L16_continue:;
+              __pyx_L21_continue:;
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":487
+            /* "gensim/models/doc2vec_corpusfile.pyx":601
  *                         c.window_indexes[n] = c.indexes[m]
  *                     n += 1
  *                 for m in range(2 * c.window):             # <<<<<<<<<<<<<<
  *                     memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],
  *                            c.vector_size * cython.sizeof(REAL_t))
  */
-            __pyx_t_17 = (2 * __pyx_v_c.window);
-            __pyx_t_18 = __pyx_t_17;
-            for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_18; __pyx_t_13+=1) {
-              __pyx_v_m = __pyx_t_13;
+            __pyx_t_21 = (2 * __pyx_v_c.window);
+            __pyx_t_22 = __pyx_t_21;
+            for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_22; __pyx_t_17+=1) {
+              __pyx_v_m = __pyx_t_17;
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":488
+              /* "gensim/models/doc2vec_corpusfile.pyx":602
  *                     n += 1
  *                 for m in range(2 * c.window):
  *                     memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],             # <<<<<<<<<<<<<<
@@ -5526,7 +6593,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
               (void)(memcpy((&(__pyx_v_c.neu1[((__pyx_v_c.doctag_len + __pyx_v_m) * __pyx_v_c.vector_size)])), (&(__pyx_v_c.word_vectors[((__pyx_v_c.window_indexes[__pyx_v_m]) * __pyx_v_c.vector_size)])), (__pyx_v_c.vector_size * (sizeof(__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)))));
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":490
+            /* "gensim/models/doc2vec_corpusfile.pyx":604
  *                     memcpy(&c.neu1[(c.doctag_len + m) * c.vector_size], &c.word_vectors[c.window_indexes[m] * c.vector_size],
  *                            c.vector_size * cython.sizeof(REAL_t))
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error             # <<<<<<<<<<<<<<
@@ -5535,17 +6602,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             (void)(memset(__pyx_v_c.work, 0, (__pyx_v_c.layer1_size * (sizeof(__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)))));
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":492
+            /* "gensim/models/doc2vec_corpusfile.pyx":606
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  * 
  *                 if c.hs:             # <<<<<<<<<<<<<<
  *                     fast_document_dmc_hs(
  *                         c.points[i], c.codes[i], c.codelens[i], c.neu1, c.syn1,
  */
-            __pyx_t_9 = (__pyx_v_c.hs != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.hs != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":493
+              /* "gensim/models/doc2vec_corpusfile.pyx":607
  * 
  *                 if c.hs:
  *                     fast_document_dmc_hs(             # <<<<<<<<<<<<<<
@@ -5554,7 +6621,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
               __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dmc_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), (__pyx_v_c.codelens[__pyx_v_i]), __pyx_v_c.neu1, __pyx_v_c.syn1, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.layer1_size, __pyx_v_c.vector_size, __pyx_v_c.learn_hidden);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":492
+              /* "gensim/models/doc2vec_corpusfile.pyx":606
  *                 memset(c.work, 0, c.layer1_size * cython.sizeof(REAL_t))  # work to accumulate l1 error
  * 
  *                 if c.hs:             # <<<<<<<<<<<<<<
@@ -5563,17 +6630,17 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":497
+            /* "gensim/models/doc2vec_corpusfile.pyx":611
  *                         c.alpha, c.work, c.layer1_size, c.vector_size, c.learn_hidden)
  * 
  *                 if c.negative:             # <<<<<<<<<<<<<<
  *                     c.next_random = fast_document_dmc_neg(
  *                         c.negative, c.cum_table, c.cum_table_len, c.next_random, c.neu1, c.syn1neg,
  */
-            __pyx_t_9 = (__pyx_v_c.negative != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.negative != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":498
+              /* "gensim/models/doc2vec_corpusfile.pyx":612
  * 
  *                 if c.negative:
  *                     c.next_random = fast_document_dmc_neg(             # <<<<<<<<<<<<<<
@@ -5582,7 +6649,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
               __pyx_v_c.next_random = __pyx_f_6gensim_6models_13doc2vec_inner_fast_document_dmc_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.next_random, __pyx_v_c.neu1, __pyx_v_c.syn1neg, (__pyx_v_c.indexes[__pyx_v_i]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.layer1_size, __pyx_v_c.vector_size, __pyx_v_c.learn_hidden);
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":497
+              /* "gensim/models/doc2vec_corpusfile.pyx":611
  *                         c.alpha, c.work, c.layer1_size, c.vector_size, c.learn_hidden)
  * 
  *                 if c.negative:             # <<<<<<<<<<<<<<
@@ -5591,7 +6658,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":502
+            /* "gensim/models/doc2vec_corpusfile.pyx":616
  *                         c.indexes[i], c.alpha, c.work, c.layer1_size, c.vector_size, c.learn_hidden)
  * 
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -5601,15 +6668,15 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
             __pyx_t_3 = (__pyx_v_c.learn_doctags != 0);
             if (__pyx_t_3) {
             } else {
-              __pyx_t_9 = __pyx_t_3;
-              goto __pyx_L27_bool_binop_done;
+              __pyx_t_12 = __pyx_t_3;
+              goto __pyx_L32_bool_binop_done;
             }
             __pyx_t_3 = ((__pyx_v__doc_tag < __pyx_v_c.docvecs_count) != 0);
-            __pyx_t_9 = __pyx_t_3;
-            __pyx_L27_bool_binop_done:;
-            if (__pyx_t_9) {
+            __pyx_t_12 = __pyx_t_3;
+            __pyx_L32_bool_binop_done:;
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":503
+              /* "gensim/models/doc2vec_corpusfile.pyx":617
  * 
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:
  *                     our_saxpy(&c.vector_size, &c.doctag_locks[_doc_tag], &c.work[m * c.vector_size],             # <<<<<<<<<<<<<<
@@ -5618,7 +6685,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
               __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.vector_size), (&(__pyx_v_c.doctag_locks[__pyx_v__doc_tag])), (&(__pyx_v_c.work[(__pyx_v_m * __pyx_v_c.vector_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), (&(__pyx_v_c.doctag_vectors[(__pyx_v__doc_tag * __pyx_v_c.vector_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":502
+              /* "gensim/models/doc2vec_corpusfile.pyx":616
  *                         c.indexes[i], c.alpha, c.work, c.layer1_size, c.vector_size, c.learn_hidden)
  * 
  *                 if c.learn_doctags and _doc_tag < c.docvecs_count:             # <<<<<<<<<<<<<<
@@ -5627,29 +6694,29 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
             }
 
-            /* "gensim/models/doc2vec_corpusfile.pyx":505
+            /* "gensim/models/doc2vec_corpusfile.pyx":619
  *                     our_saxpy(&c.vector_size, &c.doctag_locks[_doc_tag], &c.work[m * c.vector_size],
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.vector_size], &ONE)
  *                 if c.learn_words:             # <<<<<<<<<<<<<<
  *                     for m in range(2 * c.window):
  *                         our_saxpy(&c.vector_size, &c.word_locks[c.window_indexes[m]], &c.work[(c.doctag_len + m) * c.vector_size],
  */
-            __pyx_t_9 = (__pyx_v_c.learn_words != 0);
-            if (__pyx_t_9) {
+            __pyx_t_12 = (__pyx_v_c.learn_words != 0);
+            if (__pyx_t_12) {
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":506
+              /* "gensim/models/doc2vec_corpusfile.pyx":620
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.vector_size], &ONE)
  *                 if c.learn_words:
  *                     for m in range(2 * c.window):             # <<<<<<<<<<<<<<
  *                         our_saxpy(&c.vector_size, &c.word_locks[c.window_indexes[m]], &c.work[(c.doctag_len + m) * c.vector_size],
  *                                   &ONE, &c.word_vectors[c.window_indexes[m] * c.vector_size], &ONE)
  */
-              __pyx_t_17 = (2 * __pyx_v_c.window);
-              __pyx_t_18 = __pyx_t_17;
-              for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_18; __pyx_t_13+=1) {
-                __pyx_v_m = __pyx_t_13;
+              __pyx_t_21 = (2 * __pyx_v_c.window);
+              __pyx_t_22 = __pyx_t_21;
+              for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_22; __pyx_t_17+=1) {
+                __pyx_v_m = __pyx_t_17;
 
-                /* "gensim/models/doc2vec_corpusfile.pyx":507
+                /* "gensim/models/doc2vec_corpusfile.pyx":621
  *                 if c.learn_words:
  *                     for m in range(2 * c.window):
  *                         our_saxpy(&c.vector_size, &c.word_locks[c.window_indexes[m]], &c.work[(c.doctag_len + m) * c.vector_size],             # <<<<<<<<<<<<<<
@@ -5659,7 +6726,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
                 __pyx_v_6gensim_6models_14word2vec_inner_our_saxpy((&__pyx_v_c.vector_size), (&(__pyx_v_c.word_locks[(__pyx_v_c.window_indexes[__pyx_v_m])])), (&(__pyx_v_c.work[((__pyx_v_c.doctag_len + __pyx_v_m) * __pyx_v_c.vector_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE), (&(__pyx_v_c.word_vectors[((__pyx_v_c.window_indexes[__pyx_v_m]) * __pyx_v_c.vector_size)])), (&__pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE));
               }
 
-              /* "gensim/models/doc2vec_corpusfile.pyx":505
+              /* "gensim/models/doc2vec_corpusfile.pyx":619
  *                     our_saxpy(&c.vector_size, &c.doctag_locks[_doc_tag], &c.work[m * c.vector_size],
  *                               &ONE, &c.doctag_vectors[_doc_tag * c.vector_size], &ONE)
  *                 if c.learn_words:             # <<<<<<<<<<<<<<
@@ -5669,7 +6736,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
             }
           }
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":510
+          /* "gensim/models/doc2vec_corpusfile.pyx":624
  *                                   &ONE, &c.word_vectors[c.window_indexes[m] * c.vector_size], &ONE)
  * 
  *             total_documents += 1             # <<<<<<<<<<<<<<
@@ -5678,7 +6745,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
           __pyx_v_total_documents = (__pyx_v_total_documents + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":511
+          /* "gensim/models/doc2vec_corpusfile.pyx":625
  * 
  *             total_documents += 1
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
@@ -5687,7 +6754,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":512
+          /* "gensim/models/doc2vec_corpusfile.pyx":626
  *             total_documents += 1
  *             total_effective_words += effective_words
  *             _doc_tag += 1             # <<<<<<<<<<<<<<
@@ -5696,7 +6763,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  */
           __pyx_v__doc_tag = (__pyx_v__doc_tag + 1);
 
-          /* "gensim/models/doc2vec_corpusfile.pyx":514
+          /* "gensim/models/doc2vec_corpusfile.pyx":628
  *             _doc_tag += 1
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_documents, total_words, expected_examples,             # <<<<<<<<<<<<<<
@@ -5704,16 +6771,16 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  * 
  */
           __pyx_v_c.alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha(__pyx_v_start_alpha, __pyx_v_end_alpha, __pyx_v_total_documents, __pyx_v_total_words, __pyx_v_expected_examples, __pyx_v_expected_words, __pyx_v_cur_epoch, __pyx_v_num_epochs);
-          __pyx_L6_continue:;
+          __pyx_L7_continue:;
         }
       }
 
-      /* "gensim/models/doc2vec_corpusfile.pyx":450
+      /* "gensim/models/doc2vec_corpusfile.pyx":545
  * 
  *     # release GIL & train on the full corpus, document by document
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -5734,7 +6801,7 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
       }
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":517
+  /* "gensim/models/doc2vec_corpusfile.pyx":631
  *                                     expected_words, cur_epoch, num_epochs)
  * 
  *     return total_documents, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -5742,28 +6809,28 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_total_documents); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 631, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_19 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 517, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_19);
-  __pyx_t_20 = PyTuple_New(3); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 517, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 631, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_20, 1, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_19);
-  PyTuple_SET_ITEM(__pyx_t_20, 2, __pyx_t_19);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+  __pyx_t_9 = 0;
   __pyx_t_2 = 0;
   __pyx_t_7 = 0;
-  __pyx_t_19 = 0;
-  __pyx_r = __pyx_t_20;
-  __pyx_t_20 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":378
+  /* "gensim/models/doc2vec_corpusfile.pyx":465
  * 
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
@@ -5775,11 +6842,12 @@ static PyObject *__pyx_pf_6gensim_6models_18doc2vec_corpusfile_4d2v_train_epoch_
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_19);
-  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("gensim.models.doc2vec_corpusfile.d2v_train_epoch_dm_concat", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -8306,6 +9374,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_d2v_train_epoch_dbow, __pyx_k_d2v_train_epoch_dbow, sizeof(__pyx_k_d2v_train_epoch_dbow), 0, 0, 1, 1},
   {&__pyx_n_s_d2v_train_epoch_dm, __pyx_k_d2v_train_epoch_dm, sizeof(__pyx_k_d2v_train_epoch_dm), 0, 0, 1, 1},
   {&__pyx_n_s_d2v_train_epoch_dm_concat, __pyx_k_d2v_train_epoch_dm_concat, sizeof(__pyx_k_d2v_train_epoch_dm_concat), 0, 0, 1, 1},
+  {&__pyx_n_s_doc_ids, __pyx_k_doc_ids, sizeof(__pyx_k_doc_ids), 0, 0, 1, 1},
+  {&__pyx_n_s_doc_len, __pyx_k_doc_len, sizeof(__pyx_k_doc_len), 0, 0, 1, 1},
   {&__pyx_n_s_doc_tag, __pyx_k_doc_tag, sizeof(__pyx_k_doc_tag), 0, 0, 1, 1},
   {&__pyx_n_s_doc_words, __pyx_k_doc_words, sizeof(__pyx_k_doc_words), 0, 0, 1, 1},
   {&__pyx_n_s_doctag_locks, __pyx_k_doctag_locks, sizeof(__pyx_k_doctag_locks), 0, 0, 1, 1},
@@ -8322,10 +9392,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_fblas, __pyx_k_fblas, sizeof(__pyx_k_fblas), 0, 0, 1, 1},
   {&__pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_k_gensim_models_doc2vec_corpusfile, sizeof(__pyx_k_gensim_models_doc2vec_corpusfile), 0, 0, 1, 0},
   {&__pyx_n_s_gensim_models_doc2vec_corpusfile_2, __pyx_k_gensim_models_doc2vec_corpusfile_2, sizeof(__pyx_k_gensim_models_doc2vec_corpusfile_2), 0, 0, 1, 1},
+  {&__pyx_n_s_gensim_models_word2vec_corpusfil, __pyx_k_gensim_models_word2vec_corpusfil, sizeof(__pyx_k_gensim_models_word2vec_corpusfil), 0, 0, 1, 1},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_id_corpus_or_none, __pyx_k_id_corpus_or_none, sizeof(__pyx_k_id_corpus_or_none), 0, 0, 1, 1},
+  {&__pyx_n_s_id_stream, __pyx_k_id_stream, sizeof(__pyx_k_id_stream), 0, 0, 1, 1},
   {&__pyx_n_s_idx_end, __pyx_k_idx_end, sizeof(__pyx_k_idx_end), 0, 0, 1, 1},
   {&__pyx_n_s_idx_start, __pyx_k_idx_start, sizeof(__pyx_k_idx_start), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_indexed, __pyx_k_indexed, sizeof(__pyx_k_indexed), 0, 0, 1, 1},
   {&__pyx_n_s_input_stream, __pyx_k_input_stream, sizeof(__pyx_k_input_stream), 0, 0, 1, 1},
   {&__pyx_n_s_inv_count, __pyx_k_inv_count, sizeof(__pyx_k_inv_count), 0, 0, 1, 1},
   {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
@@ -8367,7 +9441,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
 };
 static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 25, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 90, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 229, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 810, __pyx_L1_error)
   return 0;
@@ -8476,41 +9550,41 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":95
+  /* "gensim/models/doc2vec_corpusfile.pyx":136
  * 
  * 
  * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
  */
-  __pyx_tuple__11 = PyTuple_Pack(42, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_train_words, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_doc_words, __pyx_n_s_doc_tag, __pyx_n_s_k); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(46, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_train_words, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_doc_words, __pyx_n_s_doc_ids, __pyx_n_s_doc_len, __pyx_n_s_doc_tag, __pyx_n_s_k); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__11);
   __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(19, 0, 42, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dbow, 95, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(19, 0, 46, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dbow, 136, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 136, __pyx_L1_error)
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":231
+  /* "gensim/models/doc2vec_corpusfile.pyx":295
  * 
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                        _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                        learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None):
  */
-  __pyx_tuple__13 = PyTuple_Pack(44, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_m, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_count, __pyx_n_s_inv_count, __pyx_n_s_doc_words, __pyx_n_s_doc_tag); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_tuple__13 = PyTuple_Pack(48, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_m, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_count, __pyx_n_s_inv_count, __pyx_n_s_doc_words, __pyx_n_s_doc_ids, __pyx_n_s_doc_len, __pyx_n_s_doc_tag); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 295, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__13);
   __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(18, 0, 44, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dm, 231, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 231, __pyx_L1_error)
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(18, 0, 48, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dm, 295, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 295, __pyx_L1_error)
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":378
+  /* "gensim/models/doc2vec_corpusfile.pyx":465
  * 
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                               _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                               learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None,
  */
-  __pyx_tuple__15 = PyTuple_Pack(43, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_m, __pyx_n_s_n, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_doc_words, __pyx_n_s_doc_tag); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(47, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_start_doctag, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_docvecs_count, __pyx_n_s_word_vectors, __pyx_n_s_word_locks, __pyx_n_s_learn_doctags, __pyx_n_s_learn_words, __pyx_n_s_learn_hidden, __pyx_n_s_doctag_vectors, __pyx_n_s_doctag_locks, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_m, __pyx_n_s_n, __pyx_n_s_document_len, __pyx_n_s_effective_words, __pyx_n_s_total_effective_words, __pyx_n_s_total_documents, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_doc_words, __pyx_n_s_doc_ids, __pyx_n_s_doc_len, __pyx_n_s_doc_tag); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 465, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__15);
   __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(18, 0, 43, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dm_concat, 378, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(18, 0, 47, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_doc2vec_corpusfile, __pyx_n_s_d2v_train_epoch_dm_concat, 465, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 465, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8586,6 +9660,8 @@ static int __Pyx_modinit_type_import_code(void) {
   __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence)) __PYX_ERR(3, 33, __pyx_L1_error)
   __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = __Pyx_ImportType("gensim.models.word2vec_corpusfile", "CythonVocab", sizeof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab), 1); if (unlikely(!__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab)) __PYX_ERR(3, 61, __pyx_L1_error)
   __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab)) __PYX_ERR(3, 61, __pyx_L1_error)
+  __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = __Pyx_ImportType("gensim.models.word2vec_corpusfile", "CythonIdCorpus", sizeof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus), 1); if (unlikely(!__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus)) __PYX_ERR(3, 69, __pyx_L1_error)
+  __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus)) __PYX_ERR(3, 69, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8605,6 +9681,7 @@ static int __Pyx_modinit_variable_import_code(void) {
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "dsdot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_dsdot, "__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "snrm2", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_snrm2, "__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "sscal", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sscal, "__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr(__pyx_t_1, "sgemm", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sgemm, "__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "EXP_TABLE", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE, "__pyx_t_6gensim_6models_14word2vec_inner_REAL_t [0x3E8]") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_dot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_dot, "__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_saxpy", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_saxpy, "__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -8956,7 +10033,28 @@ if (!__Pyx_RefNanny) {
     __pyx_L7_try_end:;
   }
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":53
+  /* "gensim/models/doc2vec_corpusfile.pyx":51
+ *     cvocab_t
+ * )
+ * from gensim.models.word2vec_corpusfile import id_corpus_or_none             # <<<<<<<<<<<<<<
+ * 
+ * DEF MAX_DOCUMENT_LEN = 10000
+ */
+  __pyx_t_7 = PyList_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_INCREF(__pyx_n_s_id_corpus_or_none);
+  __Pyx_GIVEREF(__pyx_n_s_id_corpus_or_none);
+  PyList_SET_ITEM(__pyx_t_7, 0, __pyx_n_s_id_corpus_or_none);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_gensim_models_word2vec_corpusfil, __pyx_t_7, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_id_corpus_or_none, __pyx_t_7) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/models/doc2vec_corpusfile.pyx":55
  * DEF MAX_DOCUMENT_LEN = 10000
  * 
  * cdef int ONE = 1             # <<<<<<<<<<<<<<
@@ -8965,7 +10063,7 @@ if (!__Pyx_RefNanny) {
  */
   __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONE = 1;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":54
+  /* "gensim/models/doc2vec_corpusfile.pyx":56
  * 
  * cdef int ONE = 1
  * cdef REAL_t ONEF = <REAL_t>1.0             # <<<<<<<<<<<<<<
@@ -8974,58 +10072,58 @@ if (!__Pyx_RefNanny) {
  */
   __pyx_v_6gensim_6models_18doc2vec_corpusfile_ONEF = ((__pyx_t_6gensim_6models_14word2vec_inner_REAL_t)1.0);
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":95
+  /* "gensim/models/doc2vec_corpusfile.pyx":136
  * 
  * 
  * def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
  */
-  __pyx_t_7 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dbow, __pyx_t_7) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_1d2v_train_epoch_dbow, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dbow, __pyx_t_1) < 0) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":231
+  /* "gensim/models/doc2vec_corpusfile.pyx":295
  * 
  * 
  * def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                        _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                        learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None, doctag_locks=None):
  */
-  __pyx_t_7 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dm, __pyx_t_7) < 0) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_3d2v_train_epoch_dm, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dm, __pyx_t_1) < 0) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":378
+  /* "gensim/models/doc2vec_corpusfile.pyx":465
  * 
  * 
  * def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,             # <<<<<<<<<<<<<<
  *                               _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
  *                               learn_doctags=True, learn_words=True, learn_hidden=True, doctag_vectors=None,
  */
-  __pyx_t_7 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 378, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dm_concat, __pyx_t_7) < 0) __PYX_ERR(0, 378, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_18doc2vec_corpusfile_5d2v_train_epoch_dm_concat, NULL, __pyx_n_s_gensim_models_doc2vec_corpusfile_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 465, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_d2v_train_epoch_dm_concat, __pyx_t_1) < 0) __PYX_ERR(0, 465, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/doc2vec_corpusfile.pyx":520
+  /* "gensim/models/doc2vec_corpusfile.pyx":634
  * 
  * 
  * CORPUSFILE_VERSION = 1             # <<<<<<<<<<<<<<
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(0, 520, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(0, 634, __pyx_L1_error)
 
   /* "gensim/models/doc2vec_corpusfile.pyx":1
  * #!/usr/bin/env cython             # <<<<<<<<<<<<<<
  * # cython: boundscheck=False
  * # cython: wraparound=False
  */
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_7) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1008
  *         raise ImportError("numpy.core.umath failed to import")
@@ -9230,29 +10328,199 @@ static int __Pyx_ParseOptionalKeywords(
             goto invalid_keyword;
         }
     }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* GetModuleGlobalName */
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        result = NULL;
+    } else {
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else {
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    if (!result) {
+        PyErr_Clear();
+#endif
+        result = __Pyx_GetBuiltinName(name);
+    }
+    return result;
+}
+
+/* PyFunctionFastCall */
+    #if CYTHON_FAST_PYCALL
+#include "frameobject.h"
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = f->f_localsplus;
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyCFunctionFastCall */
+    #if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
+    }
 }
+#endif
 
 /* PyObjectCall */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
     ternaryfunc call = func->ob_type->tp_call;
@@ -9272,7 +10540,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #endif
 
 /* ExtTypeTest */
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
         return 0;
@@ -9285,7 +10553,7 @@ static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
 }
 
 /* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     tmp_type = tstate->curexc_type;
@@ -9309,7 +10577,7 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #endif
 
 /* RaiseException */
-#if PY_MAJOR_VERSION < 3
+    #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -9467,151 +10735,8 @@ bad:
 }
 #endif
 
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
-    }
-}
-#endif
-
-/* PyFunctionFastCall */
-#if CYTHON_FAST_PYCALL
-#include "frameobject.h"
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = f->f_localsplus;
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
-        return NULL;
-    }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
-#endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
-        }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
-        }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
-        }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
-        }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
-    }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
-}
-#endif
-#endif
-
 /* PyObjectCallMethO */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
     PyObject *self, *result;
     PyCFunction cfunc;
@@ -9631,7 +10756,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 #endif
 
 /* PyObjectCallOneArg */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
     PyObject *result;
     PyObject *args = PyTuple_New(1);
@@ -9671,7 +10796,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 #endif
 
 /* DictGetItem */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
     PyObject *value;
     value = PyDict_GetItemWithError(d, key);
@@ -9690,25 +10815,25 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
 #endif
 
 /* RaiseTooManyValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
 /* RaiseNoneIterError */
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* SaveResetException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     #if PY_VERSION_HEX >= 0x030700A3
     *type = tstate->exc_state.exc_type;
@@ -9747,7 +10872,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyErrExceptionMatches */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
     Py_ssize_t i, n;
     n = PyTuple_GET_SIZE(tuple);
@@ -9772,7 +10897,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
 #else
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
@@ -9842,7 +10967,7 @@ bad:
 }
 
 /* GetVTable */
-  static void* __Pyx_GetVtable(PyObject *dict) {
+      static void* __Pyx_GetVtable(PyObject *dict) {
     void* ptr;
     PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
     if (!ob)
@@ -9862,7 +10987,7 @@ bad:
 }
 
 /* Import */
-  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+      static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -9927,7 +11052,7 @@ bad:
 }
 
 /* ImportFrom */
-  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+      static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -9941,7 +11066,7 @@ bad:
 }
 
 /* CLineInTraceback */
-  #ifndef CYTHON_CLINE_IN_TRACEBACK
+      #ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -9981,7 +11106,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+      static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -10061,7 +11186,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-  #include "compile.h"
+      #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -10146,7 +11271,7 @@ bad:
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10177,7 +11302,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+      #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -10199,7 +11324,7 @@ bad:
     }
 
 /* None */
-  static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
+      static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
   int err;
   #ifdef WITH_THREAD
   PyGILState_STATE _save = PyGILState_Ensure();
@@ -10212,7 +11337,7 @@ bad:
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10243,7 +11368,7 @@ bad:
 }
 
 /* Declarations */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
       return ::std::complex< float >(x, y);
@@ -10263,7 +11388,7 @@ bad:
 #endif
 
 /* Arithmetic */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10398,7 +11523,7 @@ bad:
 #endif
 
 /* Declarations */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
       return ::std::complex< double >(x, y);
@@ -10418,7 +11543,7 @@ bad:
 #endif
 
 /* Arithmetic */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -10553,7 +11678,7 @@ bad:
 #endif
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
     const enum NPY_TYPES neg_one = (enum NPY_TYPES) -1, const_zero = (enum NPY_TYPES) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -10584,7 +11709,7 @@ bad:
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+      static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -10773,7 +11898,7 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+      static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -10962,7 +12087,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-  #if CYTHON_COMPILING_IN_CPYTHON
+      #if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -11062,7 +12187,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-  static int __Pyx_check_binary_version(void) {
+      static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -11078,7 +12203,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* ModuleImport */
-  #ifndef __PYX_HAVE_RT_ImportModule
+      #ifndef __PYX_HAVE_RT_ImportModule
 #define __PYX_HAVE_RT_ImportModule
 static PyObject *__Pyx_ImportModule(const char *name) {
     PyObject *py_name = 0;
@@ -11096,7 +12221,7 @@ bad:
 #endif
 
 /* TypeImport */
-  #ifndef __PYX_HAVE_RT_ImportType
+      #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
     size_t size, int strict)
@@ -11161,7 +12286,7 @@ bad:
 #endif
 
 /* VoidPtrImport */
-  #ifndef __PYX_HAVE_RT_ImportVoidPtr
+      #ifndef __PYX_HAVE_RT_ImportVoidPtr
 #define __PYX_HAVE_RT_ImportVoidPtr
 static int __Pyx_ImportVoidPtr(PyObject *module, const char *name, void **p, const char *sig) {
     PyObject *d = 0;
@@ -11210,7 +12335,7 @@ bad:
 #endif
 
 /* FunctionImport */
-  #ifndef __PYX_HAVE_RT_ImportFunction
+      #ifndef __PYX_HAVE_RT_ImportFunction
 #define __PYX_HAVE_RT_ImportFunction
 static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
     PyObject *d = 0;
@@ -11264,7 +12389,7 @@ bad:
 #endif
 
 /* InitStrings */
-  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+      static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
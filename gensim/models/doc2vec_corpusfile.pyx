@@ -43,10 +43,12 @@ from gensim.models.word2vec_corpusfile cimport (
     VocabItem,
     CythonVocab,
     CythonLineSentence,
+    CythonIdCorpus,
     get_alpha,
     get_next_alpha,
     cvocab_t
 )
+from gensim.models.word2vec_corpusfile import id_corpus_or_none
 
 DEF MAX_DOCUMENT_LEN = 10000
 
@@ -92,6 +94,45 @@ cdef void prepare_c_structures_for_batch(vector[string] &doc_words, int sample,
         effective_words[0] += 1
 
 
+cdef void prepare_c_structures_for_id_document(np.int32_t *doc_words, int doc_len, int sample, int hs, int window,
+                                               int *total_words, int *effective_words, unsigned long long *next_random,
+                                               VocabItem *vocab, np.uint32_t *indexes, int *codelens,
+                                               np.uint8_t **codes, np.uint32_t **points, np.uint32_t *reduced_windows,
+                                               int *document_len, int train_words, int docvecs_count,
+                                               int doc_tag) nogil:
+    cdef VocabItem *predict_word
+    cdef int pos
+    cdef int i = 0
+
+    total_words[0] += doc_len
+
+    for pos in range(doc_len):
+        if doc_words[pos] < 0:  # out of vocabulary: shrink document to leave out word
+            continue  # leaving i unchanged
+
+        predict_word = &vocab[doc_words[pos]]
+        if sample and predict_word.sample_int < random_int32(next_random):
+            continue
+        indexes[i] = predict_word.index
+        if hs:
+            codelens[i] = predict_word.code_len
+            codes[i] = predict_word.code
+            points[i] = predict_word.point
+
+        effective_words[0] += 1
+        i += 1
+        if i == MAX_DOCUMENT_LEN:
+            break
+    document_len[0] = i
+
+    if train_words and reduced_windows != NULL:
+        for i in range(document_len[0]):
+            reduced_windows[i] = random_int32(next_random) % window
+
+    if doc_tag < docvecs_count:
+        effective_words[0] += 1
+
+
 def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab, _cur_epoch, _expected_examples,
                          _expected_words, work, neu1, docvecs_count, word_vectors=None, word_locks=None,
                          train_words=False, learn_doctags=True, learn_words=True, learn_hidden=True,
@@ -104,8 +145,12 @@ def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.
+    start_doctag : int
+        Tag of the first document read.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -148,7 +193,9 @@ def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, document_len
@@ -157,6 +204,8 @@ def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab
     cdef int sent_idx, idx_start, idx_end
 
     cdef vector[string] doc_words
+    cdef np.int32_t *doc_ids
+    cdef int doc_len
     cdef int _doc_tag = start_doctag
 
     init_d2v_config(
@@ -166,19 +215,34 @@ def d2v_train_epoch_dbow(model, corpus_file, offset, start_doctag, _cython_vocab
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
-
-            if doc_words.empty():
-                continue
-
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
-                c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if indexed:
+                # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+                _doc_tag = id_stream.sentence
+                doc_len = id_stream.read_document(&doc_ids)
+                if doc_len == 0:
+                    continue
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points,
+                    c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                doc_words = input_stream.read_sentence()
+
+                if doc_words.empty():
+                    continue
+
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens,  c.codes, c.points,
+                    c.reduced_windows, &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 if c.train_words:  # simultaneous skip-gram wordvec-training
@@ -241,8 +305,12 @@ def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab,
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.
+    start_doctag : int
+        Tag of the first document read.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -282,7 +350,9 @@ def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab,
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k, m, document_len
@@ -292,6 +362,8 @@ def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab,
     cdef REAL_t count, inv_count = 1.0
 
     cdef vector[string] doc_words
+    cdef np.int32_t *doc_ids
+    cdef int doc_len
     cdef int _doc_tag = start_doctag
 
     init_d2v_config(
@@ -301,19 +373,34 @@ def d2v_train_epoch_dm(model, corpus_file, offset, start_doctag, _cython_vocab,
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
-
-            if doc_words.empty():
-                continue
-
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
-                vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
-                &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if indexed:
+                # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+                _doc_tag = id_stream.sentence
+                doc_len = id_stream.read_document(&doc_ids)
+                if doc_len == 0:
+                    continue
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+                    vocab.get_items_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+                    &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                doc_words = input_stream.read_sentence()
+
+                if doc_words.empty():
+                    continue
+
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words, &c.next_random,
+                    vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+                    &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 j = i - c.window + c.reduced_windows[i]
@@ -389,8 +476,12 @@ def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_
     ----------
     model : :class:`~gensim.models.doc2vec.Doc2Vec`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in documents for a pre-indexed corpus.
+    start_doctag : int
+        Tag of the first document read.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     work : np.ndarray
@@ -430,7 +521,9 @@ def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k, m, n, document_len
@@ -439,6 +532,8 @@ def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_
     cdef int sent_idx, idx_start, idx_end
 
     cdef vector[string] doc_words
+    cdef np.int32_t *doc_ids
+    cdef int doc_len
     cdef int _doc_tag = start_doctag
 
     init_d2v_config(
@@ -448,22 +543,41 @@ def d2v_train_epoch_dm_concat(model, corpus_file, offset, start_doctag, _cython_
 
     # release GIL & train on the full corpus, document by document
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_words = 0
 
-            doc_words = input_stream.read_sentence()
-            _doc_tag = total_documents
-            c.doctag_len = _doc_tag < c.docvecs_count
-
-             # skip doc either empty or without expected number of tags
-            if doc_words.empty() or c.expected_doctag_len != c.doctag_len:
-                continue
-
-            prepare_c_structures_for_batch(
-                doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
-                c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            if indexed:
+                # pre-indexed corpus: the document number is its tag, no tokenization or vocabulary lookups
+                _doc_tag = id_stream.sentence
+                doc_len = id_stream.read_document(&doc_ids)
+                c.doctag_len = _doc_tag < c.docvecs_count
+
+                # skip doc either empty or without expected number of tags
+                if doc_len == 0 or c.expected_doctag_len != c.doctag_len:
+                    continue
+
+                prepare_c_structures_for_id_document(
+                    doc_ids, doc_len, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_items_ptr(), c.indexes, c.codelens, c.codes,
+                    c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
+            else:
+                doc_words = input_stream.read_sentence()
+                _doc_tag = total_documents
+                c.doctag_len = _doc_tag < c.docvecs_count
+
+                 # skip doc either empty or without expected number of tags
+                if doc_words.empty() or c.expected_doctag_len != c.doctag_len:
+                    continue
+
+                prepare_c_structures_for_batch(
+                    doc_words, c.sample, c.hs, c.window, &total_words, &effective_words,
+                    &c.next_random, vocab.get_vocab_ptr(), c.indexes, c.codelens, c.codes,
+                    c.points, NULL, &document_len, c.train_words, c.docvecs_count, _doc_tag)
 
             for i in range(document_len):
                 j = i - c.window      # negative OK: will pad with null word
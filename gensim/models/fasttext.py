@@ -636,6 +636,8 @@ class FastText(BaseWordEmbeddingsModel):
             or :class:`~gensim.models.word2vec.LineSentence` in :mod:`~gensim.models.word2vec` module for such examples.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            Can also be the path of an :class:`~gensim.models.word2vec.IndexedCorpusFile` built from it,
+            which skips tokenization and vocabulary lookups in every epoch.
             If you use this argument instead of `sentences`, you must provide `total_words` argument as well. Only one
             of `sentences` or `corpus_file` arguments need to be passed (not both of them).
         total_examples : int
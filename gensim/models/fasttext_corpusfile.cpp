@@ -1040,8 +1040,8 @@ typedef __pyx_t_5numpy_float32_t __pyx_t_6gensim_6models_14word2vec_inner_REAL_t
  */
 typedef __pyx_t_5numpy_float32_t __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t;
 
-/* "gensim/models/fasttext_corpusfile.pyx":40
- * )
+/* "gensim/models/fasttext_corpusfile.pyx":42
+ * from gensim.models.word2vec_corpusfile import id_corpus_or_none
  * 
  * ctypedef np.float32_t REAL_t             # <<<<<<<<<<<<<<
  * DEF MAX_SENTENCE_LEN = 10000
@@ -1076,6 +1076,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 /*--- Type declarations ---*/
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence;
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab;
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
 
 /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":769
  * ctypedef npy_longdouble longdouble_t
@@ -1156,7 +1157,7 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
- * 
+ * ctypedef void (*sgemm_ptr) (
  */
 typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *, float const *, int const *);
 
@@ -1164,12 +1165,21 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
- * 
- * cdef scopy_ptr scopy
+ * ctypedef void (*sgemm_ptr) (
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *, float const *, float const *, int const *);
 
-/* "word2vec_inner.pxd":44
+/* "word2vec_inner.pxd":28
+ * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
+ * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
+ * ctypedef void (*sgemm_ptr) (             # <<<<<<<<<<<<<<
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
+ *     const float *A, const int *ldA, const float *B, const int *ldB, const float *beta, float *C, const int *ldC) nogil
+ */
+typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr)(char const *, char const *, int const *, int const *, int const *, float const *, float const *, int const *, float const *, int const *, float const *, float *, int const *);
+
+/* "word2vec_inner.pxd":48
  * 
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1178,7 +1188,7 @@ typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *,
  */
 typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr)(int const *, float const *, int const *, float const *, int const *);
 
-/* "word2vec_inner.pxd":45
+/* "word2vec_inner.pxd":49
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef void (*our_saxpy_ptr) (const int *N, const float *alpha, const float *X, const int *incX, float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1187,11 +1197,11 @@ typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6model
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr)(int const *, float const *, float const *, int const *, float *, int const *);
 
-/* "word2vec_inner.pxd":51
+/* "word2vec_inner.pxd":55
  * 
  * 
  * cdef struct Word2VecConfig:             # <<<<<<<<<<<<<<
- *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers
+ *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers, shared_negatives
  *     REAL_t running_training_loss, alpha
  */
 struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
@@ -1203,6 +1213,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   int window;
   int cbow_mean;
   int workers;
+  int shared_negatives;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t running_training_loss;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *syn0;
@@ -1222,7 +1233,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   unsigned PY_LONG_LONG next_random;
 };
 
-/* "word2vec_inner.pxd":125
+/* "word2vec_inner.pxd":137
  * 
  * 
  * cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1=*)             # <<<<<<<<<<<<<<
@@ -1321,16 +1332,40 @@ struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence {
  * 
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
  *     cdef cvocab_t vocab
- *     cdef subword_arrays
+ *     cdef vector[VocabItem] items
  */
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   PyObject_HEAD
   struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtab;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t vocab;
+  std::vector<struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem>  items;
   PyObject *subword_arrays;
 };
 
 
+/* "gensim/models/word2vec_corpusfile.pxd":69
+ * 
+ * 
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     cdef public object corpus
+ *     cdef np.int32_t *ids
+ */
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtab;
+  PyObject *corpus;
+  __pyx_t_5numpy_int32_t *ids;
+  __pyx_t_5numpy_int64_t *offsets;
+  PY_LONG_LONG num_sentences;
+  PY_LONG_LONG start;
+  PY_LONG_LONG sentence;
+  PY_LONG_LONG position;
+  size_t max_sentence_length;
+  std::vector<__pyx_t_5numpy_int32_t *>  batch_words;
+  std::vector<int>  batch_lengths;
+};
+
+
 
 /* "gensim/models/word2vec_corpusfile.pxd":33
  * 
@@ -1356,14 +1391,32 @@ static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineS
  * 
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
  *     cdef cvocab_t vocab
- *     cdef subword_arrays
+ *     cdef vector[VocabItem] items
  */
 
 struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *(*get_vocab_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *(*get_items_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
 };
 static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab;
 
+
+/* "gensim/models/word2vec_corpusfile.pxd":69
+ * 
+ * 
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     cdef public object corpus
+ *     cdef np.int32_t *ids
+ */
+
+struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  bool (*is_eof)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  void (*reset)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*next_batch)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*read_document)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *, __pyx_t_5numpy_int32_t **);
+};
+static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -1450,6 +1503,27 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+/* GetModuleGlobalName.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
 /* PyObjectCall.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
@@ -1499,24 +1573,6 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
-#else
-#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
-#endif
-#endif
-
 /* PyObjectCallMethO.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
@@ -1578,6 +1634,9 @@ static void* __Pyx_GetVtable(PyObject *dict);
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
 /* CLineInTraceback.proto */
 #ifdef CYTHON_CLINE_IN_TRACEBACK
 #define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
@@ -1610,9 +1669,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 /* None.proto */
 static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void); /* proto */
 
-/* None.proto */
-#include <new>
-
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -1714,9 +1770,15 @@ static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void); /* proto */
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value);
 
+/* None.proto */
+#include <new>
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -1810,6 +1872,8 @@ static __pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr *__pyx_vp_6gensim_6mod
 #define __pyx_v_6gensim_6models_14word2vec_inner_snrm2 (*__pyx_vp_6gensim_6models_14word2vec_inner_snrm2)
 static __pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sscal = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_sscal (*__pyx_vp_6gensim_6models_14word2vec_inner_sscal)
+static __pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sgemm = 0;
+#define __pyx_v_6gensim_6models_14word2vec_inner_sgemm (*__pyx_vp_6gensim_6models_14word2vec_inner_sgemm)
 static __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)[0x3E8] = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_EXP_TABLE (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)
 static __pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_our_dot = 0;
@@ -1834,11 +1898,13 @@ static PyObject *(*__pyx_f_6gensim_6models_14fasttext_inner_init_ft_config)(stru
 /* Module declarations from 'gensim.models.word2vec_corpusfile' */
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = 0;
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = 0;
+static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = 0;
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t (*__pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha)(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int); /*proto*/
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t (*__pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha)(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int, int, int, int, int); /*proto*/
 
 /* Module declarations from 'gensim.models.fasttext_corpusfile' */
 static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_batch(std::vector<std::vector<std::string> >  &, int, int, int, int *, int *, int *, unsigned PY_LONG_LONG *, __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *, int *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint32_t **); /*proto*/
+static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_id_batch(std::vector<__pyx_t_5numpy_int32_t *>  &, std::vector<int>  &, int, int, int, int *, int *, int *, unsigned PY_LONG_LONG *, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *, int *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint32_t **); /*proto*/
 #define __Pyx_MODULE_NAME "gensim.models.fasttext_corpusfile"
 extern int __pyx_module_is_main_gensim__models__fasttext_corpusfile;
 int __pyx_module_is_main_gensim__models__fasttext_corpusfile = 0;
@@ -1868,9 +1934,11 @@ static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_offset[] = "offset";
 static const char __pyx_k_alpha_2[] = "_alpha";
 static const char __pyx_k_idx_end[] = "idx_end";
+static const char __pyx_k_indexed[] = "indexed";
 static const char __pyx_k_sent_idx[] = "sent_idx";
 static const char __pyx_k_cur_epoch[] = "_cur_epoch";
 static const char __pyx_k_end_alpha[] = "end_alpha";
+static const char __pyx_k_id_stream[] = "id_stream";
 static const char __pyx_k_idx_start[] = "idx_start";
 static const char __pyx_k_min_alpha[] = "min_alpha";
 static const char __pyx_k_sentences[] = "sentences";
@@ -1885,6 +1953,7 @@ static const char __pyx_k_total_words[] = "total_words";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_cython_vocab[] = "_cython_vocab";
 static const char __pyx_k_input_stream[] = "input_stream";
+static const char __pyx_k_num_sentences[] = "num_sentences";
 static const char __pyx_k_expected_words[] = "_expected_words";
 static const char __pyx_k_train_epoch_sg[] = "train_epoch_sg";
 static const char __pyx_k_effective_words[] = "effective_words";
@@ -1892,6 +1961,7 @@ static const char __pyx_k_total_sentences[] = "total_sentences";
 static const char __pyx_k_expected_words_2[] = "expected_words";
 static const char __pyx_k_train_epoch_cbow[] = "train_epoch_cbow";
 static const char __pyx_k_expected_examples[] = "_expected_examples";
+static const char __pyx_k_id_corpus_or_none[] = "id_corpus_or_none";
 static const char __pyx_k_CORPUSFILE_VERSION[] = "CORPUSFILE_VERSION";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_effective_sentences[] = "effective_sentences";
@@ -1904,6 +1974,7 @@ static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string al
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
 static const char __pyx_k_Optimized_cython_functions_for_f[] = "Optimized cython functions for file-based training :class:`~gensim.models.fasttext.FastText` model.";
 static const char __pyx_k_gensim_models_fasttext_corpusfil[] = "gensim/models/fasttext_corpusfile.pyx";
+static const char __pyx_k_gensim_models_word2vec_corpusfil[] = "gensim.models.word2vec_corpusfile";
 static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
@@ -1933,10 +2004,14 @@ static PyObject *__pyx_n_s_expected_words;
 static PyObject *__pyx_n_s_expected_words_2;
 static PyObject *__pyx_kp_s_gensim_models_fasttext_corpusfil;
 static PyObject *__pyx_n_s_gensim_models_fasttext_corpusfil_2;
+static PyObject *__pyx_n_s_gensim_models_word2vec_corpusfil;
 static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_id_corpus_or_none;
+static PyObject *__pyx_n_s_id_stream;
 static PyObject *__pyx_n_s_idx_end;
 static PyObject *__pyx_n_s_idx_start;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_indexed;
 static PyObject *__pyx_n_s_input_stream;
 static PyObject *__pyx_n_s_j;
 static PyObject *__pyx_n_s_k;
@@ -1949,6 +2024,7 @@ static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_neu1;
 static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_num_epochs;
+static PyObject *__pyx_n_s_num_sentences;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
 static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
@@ -1987,7 +2063,7 @@ static PyObject *__pyx_codeobj__11;
 static PyObject *__pyx_codeobj__13;
 /* Late includes */
 
-/* "gensim/models/fasttext_corpusfile.pyx":45
+/* "gensim/models/fasttext_corpusfile.pyx":47
  * 
  * 
  * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
@@ -2014,7 +2090,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
   int __pyx_t_12;
   int __pyx_t_13;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":54
+  /* "gensim/models/fasttext_corpusfile.pyx":56
  *     cdef vector[string] sent
  * 
  *     sentence_idx[0] = 0  # indices of the first sentence always start at 0             # <<<<<<<<<<<<<<
@@ -2023,7 +2099,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
   (__pyx_v_sentence_idx[0]) = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":55
+  /* "gensim/models/fasttext_corpusfile.pyx":57
  * 
  *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
  *     for sent in sentences:             # <<<<<<<<<<<<<<
@@ -2037,7 +2113,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     ++__pyx_t_1;
     __pyx_v_sent = __pyx_t_2;
 
-    /* "gensim/models/fasttext_corpusfile.pyx":56
+    /* "gensim/models/fasttext_corpusfile.pyx":58
  *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
  *     for sent in sentences:
  *         if sent.empty():             # <<<<<<<<<<<<<<
@@ -2047,7 +2123,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     __pyx_t_3 = (__pyx_v_sent.empty() != 0);
     if (__pyx_t_3) {
 
-      /* "gensim/models/fasttext_corpusfile.pyx":57
+      /* "gensim/models/fasttext_corpusfile.pyx":59
  *     for sent in sentences:
  *         if sent.empty():
  *             continue # ignore empty sentences; leave effective_sentences unchanged             # <<<<<<<<<<<<<<
@@ -2056,7 +2132,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       goto __pyx_L3_continue;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":56
+      /* "gensim/models/fasttext_corpusfile.pyx":58
  *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
  *     for sent in sentences:
  *         if sent.empty():             # <<<<<<<<<<<<<<
@@ -2065,7 +2141,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
     }
 
-    /* "gensim/models/fasttext_corpusfile.pyx":58
+    /* "gensim/models/fasttext_corpusfile.pyx":60
  *         if sent.empty():
  *             continue # ignore empty sentences; leave effective_sentences unchanged
  *         total_words[0] += sent.size()             # <<<<<<<<<<<<<<
@@ -2075,7 +2151,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     __pyx_t_4 = 0;
     (__pyx_v_total_words[__pyx_t_4]) = ((__pyx_v_total_words[__pyx_t_4]) + __pyx_v_sent.size());
 
-    /* "gensim/models/fasttext_corpusfile.pyx":60
+    /* "gensim/models/fasttext_corpusfile.pyx":62
  *         total_words[0] += sent.size()
  * 
  *         for token in sent:             # <<<<<<<<<<<<<<
@@ -2089,7 +2165,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       ++__pyx_t_5;
       __pyx_v_token = __pyx_t_6;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":62
+      /* "gensim/models/fasttext_corpusfile.pyx":64
  *         for token in sent:
  *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
  *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
@@ -2099,7 +2175,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_3 = (((__pyx_v_vocab[0]).find(__pyx_v_token) == (__pyx_v_vocab[0]).end()) != 0);
       if (__pyx_t_3) {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":63
+        /* "gensim/models/fasttext_corpusfile.pyx":65
  *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
  *             if vocab[0].find(token) == vocab[0].end():
  *                 continue             # <<<<<<<<<<<<<<
@@ -2108,7 +2184,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
         goto __pyx_L6_continue;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":62
+        /* "gensim/models/fasttext_corpusfile.pyx":64
  *         for token in sent:
  *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
  *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
@@ -2117,7 +2193,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":65
+      /* "gensim/models/fasttext_corpusfile.pyx":67
  *                 continue
  * 
  *             word = vocab[0][token]             # <<<<<<<<<<<<<<
@@ -2126,7 +2202,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       __pyx_v_word = ((__pyx_v_vocab[0])[__pyx_v_token]);
 
-      /* "gensim/models/fasttext_corpusfile.pyx":66
+      /* "gensim/models/fasttext_corpusfile.pyx":68
  * 
  *             word = vocab[0][token]
  *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
@@ -2144,7 +2220,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_L10_bool_binop_done:;
       if (__pyx_t_3) {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":67
+        /* "gensim/models/fasttext_corpusfile.pyx":69
  *             word = vocab[0][token]
  *             if sample and word.sample_int < random_int32(next_random):
  *                 continue             # <<<<<<<<<<<<<<
@@ -2153,7 +2229,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
         goto __pyx_L6_continue;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":66
+        /* "gensim/models/fasttext_corpusfile.pyx":68
  * 
  *             word = vocab[0][token]
  *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
@@ -2162,7 +2238,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":68
+      /* "gensim/models/fasttext_corpusfile.pyx":70
  *             if sample and word.sample_int < random_int32(next_random):
  *                 continue
  *             indexes[effective_words[0]] = word.index             # <<<<<<<<<<<<<<
@@ -2172,7 +2248,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_8 = __pyx_v_word.index;
       (__pyx_v_indexes[(__pyx_v_effective_words[0])]) = __pyx_t_8;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":69
+      /* "gensim/models/fasttext_corpusfile.pyx":71
  *                 continue
  *             indexes[effective_words[0]] = word.index
  *             subwords_idx_len[effective_words[0]] = word.subword_idx_len             # <<<<<<<<<<<<<<
@@ -2182,7 +2258,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_9 = __pyx_v_word.subword_idx_len;
       (__pyx_v_subwords_idx_len[(__pyx_v_effective_words[0])]) = __pyx_t_9;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":70
+      /* "gensim/models/fasttext_corpusfile.pyx":72
  *             indexes[effective_words[0]] = word.index
  *             subwords_idx_len[effective_words[0]] = word.subword_idx_len
  *             subwords_idx[effective_words[0]] = word.subword_idx             # <<<<<<<<<<<<<<
@@ -2192,7 +2268,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_10 = __pyx_v_word.subword_idx;
       (__pyx_v_subwords_idx[(__pyx_v_effective_words[0])]) = __pyx_t_10;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":72
+      /* "gensim/models/fasttext_corpusfile.pyx":74
  *             subwords_idx[effective_words[0]] = word.subword_idx
  * 
  *             if hs:             # <<<<<<<<<<<<<<
@@ -2202,7 +2278,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_3 = (__pyx_v_hs != 0);
       if (__pyx_t_3) {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":73
+        /* "gensim/models/fasttext_corpusfile.pyx":75
  * 
  *             if hs:
  *                 codelens[effective_words[0]] = word.code_len             # <<<<<<<<<<<<<<
@@ -2212,7 +2288,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
         __pyx_t_9 = __pyx_v_word.code_len;
         (__pyx_v_codelens[(__pyx_v_effective_words[0])]) = __pyx_t_9;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":74
+        /* "gensim/models/fasttext_corpusfile.pyx":76
  *             if hs:
  *                 codelens[effective_words[0]] = word.code_len
  *                 codes[effective_words[0]] = word.code             # <<<<<<<<<<<<<<
@@ -2222,7 +2298,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
         __pyx_t_11 = __pyx_v_word.code;
         (__pyx_v_codes[(__pyx_v_effective_words[0])]) = __pyx_t_11;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":75
+        /* "gensim/models/fasttext_corpusfile.pyx":77
  *                 codelens[effective_words[0]] = word.code_len
  *                 codes[effective_words[0]] = word.code
  *                 points[effective_words[0]] = word.point             # <<<<<<<<<<<<<<
@@ -2232,7 +2308,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
         __pyx_t_10 = __pyx_v_word.point;
         (__pyx_v_points[(__pyx_v_effective_words[0])]) = __pyx_t_10;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":72
+        /* "gensim/models/fasttext_corpusfile.pyx":74
  *             subwords_idx[effective_words[0]] = word.subword_idx
  * 
  *             if hs:             # <<<<<<<<<<<<<<
@@ -2241,7 +2317,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":77
+      /* "gensim/models/fasttext_corpusfile.pyx":79
  *                 points[effective_words[0]] = word.point
  * 
  *             effective_words[0] += 1             # <<<<<<<<<<<<<<
@@ -2251,7 +2327,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_4 = 0;
       (__pyx_v_effective_words[__pyx_t_4]) = ((__pyx_v_effective_words[__pyx_t_4]) + 1);
 
-      /* "gensim/models/fasttext_corpusfile.pyx":78
+      /* "gensim/models/fasttext_corpusfile.pyx":80
  * 
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
@@ -2261,7 +2337,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
       __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
       if (__pyx_t_3) {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":79
+        /* "gensim/models/fasttext_corpusfile.pyx":81
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:
  *                 break             # <<<<<<<<<<<<<<
@@ -2270,7 +2346,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
         goto __pyx_L7_break;
 
-        /* "gensim/models/fasttext_corpusfile.pyx":78
+        /* "gensim/models/fasttext_corpusfile.pyx":80
  * 
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
@@ -2279,7 +2355,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":60
+      /* "gensim/models/fasttext_corpusfile.pyx":62
  *         total_words[0] += sent.size()
  * 
  *         for token in sent:             # <<<<<<<<<<<<<<
@@ -2290,7 +2366,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     }
     __pyx_L7_break:;
 
-    /* "gensim/models/fasttext_corpusfile.pyx":84
+    /* "gensim/models/fasttext_corpusfile.pyx":86
  *         # across sentence boundaries.
  *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
  *         effective_sentences[0] += 1             # <<<<<<<<<<<<<<
@@ -2300,7 +2376,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     __pyx_t_4 = 0;
     (__pyx_v_effective_sentences[__pyx_t_4]) = ((__pyx_v_effective_sentences[__pyx_t_4]) + 1);
 
-    /* "gensim/models/fasttext_corpusfile.pyx":85
+    /* "gensim/models/fasttext_corpusfile.pyx":87
  *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
  *         effective_sentences[0] += 1
  *         sentence_idx[effective_sentences[0]] = effective_words[0]             # <<<<<<<<<<<<<<
@@ -2309,7 +2385,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
     (__pyx_v_sentence_idx[(__pyx_v_effective_sentences[0])]) = (__pyx_v_effective_words[0]);
 
-    /* "gensim/models/fasttext_corpusfile.pyx":87
+    /* "gensim/models/fasttext_corpusfile.pyx":89
  *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
@@ -2319,7 +2395,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
     if (__pyx_t_3) {
 
-      /* "gensim/models/fasttext_corpusfile.pyx":88
+      /* "gensim/models/fasttext_corpusfile.pyx":90
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:
  *             break             # <<<<<<<<<<<<<<
@@ -2328,7 +2404,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
       goto __pyx_L4_break;
 
-      /* "gensim/models/fasttext_corpusfile.pyx":87
+      /* "gensim/models/fasttext_corpusfile.pyx":89
  *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
@@ -2337,7 +2413,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
  */
     }
 
-    /* "gensim/models/fasttext_corpusfile.pyx":55
+    /* "gensim/models/fasttext_corpusfile.pyx":57
  * 
  *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
  *     for sent in sentences:             # <<<<<<<<<<<<<<
@@ -2348,7 +2424,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
   }
   __pyx_L4_break:;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":91
+  /* "gensim/models/fasttext_corpusfile.pyx":93
  * 
  *     # precompute "reduced window" offsets in a single randint() call
  *     for i in range(effective_words[0]):             # <<<<<<<<<<<<<<
@@ -2360,7 +2436,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
   for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
     __pyx_v_i = __pyx_t_13;
 
-    /* "gensim/models/fasttext_corpusfile.pyx":92
+    /* "gensim/models/fasttext_corpusfile.pyx":94
  *     # precompute "reduced window" offsets in a single randint() call
  *     for i in range(effective_words[0]):
  *         reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
@@ -2370,7 +2446,7 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
     (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
   }
 
-  /* "gensim/models/fasttext_corpusfile.pyx":45
+  /* "gensim/models/fasttext_corpusfile.pyx":47
  * 
  * 
  * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
@@ -2381,224 +2457,612 @@ static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_f
   /* function exit code */
 }
 
-/* "gensim/models/fasttext_corpusfile.pyx":95
+/* "gensim/models/fasttext_corpusfile.pyx":97
  * 
  * 
- * def train_epoch_sg(             # <<<<<<<<<<<<<<
- *         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
- *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
+ * cdef void prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *         vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
+ *         int *effective_words, int *effective_sentences, unsigned long long *next_random, VocabItem *vocab,
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_19fasttext_corpusfile_train_epoch_sg[] = "train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1)\nTrain Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.fasttext.FastText.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.fasttext.FastText`\n        The FastText model instance to train.\n    corpus_file : str\n        Path to corpus file.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _l1 : np.ndarray\n        Private working memory for each worker.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
-static PyMethodDef __pyx_mdef_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg = {"train_epoch_sg", (PyCFunction)__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19fasttext_corpusfile_train_epoch_sg};
-static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_model = 0;
-  PyObject *__pyx_v_corpus_file = 0;
-  PyObject *__pyx_v_offset = 0;
-  PyObject *__pyx_v__cython_vocab = 0;
-  PyObject *__pyx_v__cur_epoch = 0;
-  PyObject *__pyx_v__expected_examples = 0;
-  PyObject *__pyx_v__expected_words = 0;
-  PyObject *__pyx_v__work = 0;
-  PyObject *__pyx_v__l1 = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("train_epoch_sg (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_l1,0};
-    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        CYTHON_FALLTHROUGH;
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        CYTHON_FALLTHROUGH;
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_model)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 1); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 2); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 3); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 4); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 5); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 6); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  7:
-        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 7); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  8:
-        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_l1)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 8); __PYX_ERR(0, 95, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_sg") < 0)) __PYX_ERR(0, 95, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-    }
-    __pyx_v_model = values[0];
-    __pyx_v_corpus_file = values[1];
-    __pyx_v_offset = values[2];
-    __pyx_v__cython_vocab = values[3];
-    __pyx_v__cur_epoch = values[4];
-    __pyx_v__expected_examples = values[5];
-    __pyx_v__expected_words = values[6];
-    __pyx_v__work = values[7];
-    __pyx_v__l1 = values[8];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 95, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("gensim.models.fasttext_corpusfile.train_epoch_sg", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__l1);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__l1) {
-  struct __pyx_t_6gensim_6models_14fasttext_inner_FastTextConfig __pyx_v_c;
-  int __pyx_v_cur_epoch;
-  int __pyx_v_num_epochs;
-  int __pyx_v_expected_examples;
-  int __pyx_v_expected_words;
-  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_start_alpha;
-  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_end_alpha;
-  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v__alpha;
-  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
-  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
+static void __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_id_batch(std::vector<__pyx_t_5numpy_int32_t *>  &__pyx_v_sentences, std::vector<int>  &__pyx_v_lengths, int __pyx_v_sample, int __pyx_v_hs, int __pyx_v_window, int *__pyx_v_total_words, int *__pyx_v_effective_words, int *__pyx_v_effective_sentences, unsigned PY_LONG_LONG *__pyx_v_next_random, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_vocab, int *__pyx_v_sentence_idx, __pyx_t_5numpy_uint32_t *__pyx_v_indexes, int *__pyx_v_codelens, __pyx_t_5numpy_uint8_t **__pyx_v_codes, __pyx_t_5numpy_uint32_t **__pyx_v_points, __pyx_t_5numpy_uint32_t *__pyx_v_reduced_windows, int *__pyx_v_subwords_idx_len, __pyx_t_5numpy_uint32_t **__pyx_v_subwords_idx) {
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_word;
+  __pyx_t_5numpy_int32_t *__pyx_v_sent;
+  size_t __pyx_v_sent_no;
+  int __pyx_v_pos;
   int __pyx_v_i;
-  int __pyx_v_j;
-  int __pyx_v_k;
-  int __pyx_v_effective_words;
-  int __pyx_v_effective_sentences;
-  int __pyx_v_total_effective_words;
-  int __pyx_v_total_sentences;
-  int __pyx_v_total_words;
-  int __pyx_v_sent_idx;
-  int __pyx_v_idx_start;
-  int __pyx_v_idx_end;
-  std::vector<std::vector<std::string> >  __pyx_v_sentences;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  std::vector<__pyx_t_5numpy_int32_t *> ::size_type __pyx_t_1;
+  std::vector<__pyx_t_5numpy_int32_t *> ::size_type __pyx_t_2;
+  size_t __pyx_t_3;
   int __pyx_t_4;
-  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_t_5;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
   int __pyx_t_8;
-  std::vector<std::vector<std::string> >  __pyx_t_9;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_10;
+  int __pyx_t_9;
+  __pyx_t_5numpy_uint32_t __pyx_t_10;
   int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  int __pyx_t_16;
+  __pyx_t_5numpy_uint32_t *__pyx_t_12;
+  __pyx_t_5numpy_uint8_t *__pyx_t_13;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":107
+ *     cdef int pos
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0             # <<<<<<<<<<<<<<
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:
+ */
+  (__pyx_v_sentence_idx[0]) = 0;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":108
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):             # <<<<<<<<<<<<<<
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ */
+  __pyx_t_1 = __pyx_v_sentences.size();
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_sent_no = __pyx_t_3;
+
+    /* "gensim/models/fasttext_corpusfile.pyx":109
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:             # <<<<<<<<<<<<<<
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ */
+    __pyx_t_4 = (((__pyx_v_lengths[__pyx_v_sent_no]) == 0) != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/models/fasttext_corpusfile.pyx":110
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged             # <<<<<<<<<<<<<<
+ *         sent = sentences[sent_no]
+ *         total_words[0] += lengths[sent_no]
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":109
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:             # <<<<<<<<<<<<<<
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ */
+    }
+
+    /* "gensim/models/fasttext_corpusfile.pyx":111
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]             # <<<<<<<<<<<<<<
+ *         total_words[0] += lengths[sent_no]
+ * 
+ */
+    __pyx_v_sent = (__pyx_v_sentences[__pyx_v_sent_no]);
+
+    /* "gensim/models/fasttext_corpusfile.pyx":112
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ *         total_words[0] += lengths[sent_no]             # <<<<<<<<<<<<<<
+ * 
+ *         for pos in range(lengths[sent_no]):
+ */
+    __pyx_t_5 = 0;
+    (__pyx_v_total_words[__pyx_t_5]) = ((__pyx_v_total_words[__pyx_t_5]) + (__pyx_v_lengths[__pyx_v_sent_no]));
+
+    /* "gensim/models/fasttext_corpusfile.pyx":114
+ *         total_words[0] += lengths[sent_no]
+ * 
+ *         for pos in range(lengths[sent_no]):             # <<<<<<<<<<<<<<
+ *             if sent[pos] < 0:
+ *                 continue  # out of vocabulary, same as a missing token
+ */
+    __pyx_t_6 = (__pyx_v_lengths[__pyx_v_sent_no]);
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_pos = __pyx_t_8;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":115
+ * 
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:             # <<<<<<<<<<<<<<
+ *                 continue  # out of vocabulary, same as a missing token
+ * 
+ */
+      __pyx_t_4 = (((__pyx_v_sent[__pyx_v_pos]) < 0) != 0);
+      if (__pyx_t_4) {
+
+        /* "gensim/models/fasttext_corpusfile.pyx":116
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:
+ *                 continue  # out of vocabulary, same as a missing token             # <<<<<<<<<<<<<<
+ * 
+ *             word = &vocab[sent[pos]]
+ */
+        goto __pyx_L6_continue;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":115
+ * 
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:             # <<<<<<<<<<<<<<
+ *                 continue  # out of vocabulary, same as a missing token
+ * 
+ */
+      }
+
+      /* "gensim/models/fasttext_corpusfile.pyx":118
+ *                 continue  # out of vocabulary, same as a missing token
+ * 
+ *             word = &vocab[sent[pos]]             # <<<<<<<<<<<<<<
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue
+ */
+      __pyx_v_word = (&(__pyx_v_vocab[(__pyx_v_sent[__pyx_v_pos])]));
+
+      /* "gensim/models/fasttext_corpusfile.pyx":119
+ * 
+ *             word = &vocab[sent[pos]]
+ *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ */
+      __pyx_t_9 = (__pyx_v_sample != 0);
+      if (__pyx_t_9) {
+      } else {
+        __pyx_t_4 = __pyx_t_9;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_9 = ((__pyx_v_word->sample_int < __pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random)) != 0);
+      __pyx_t_4 = __pyx_t_9;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "gensim/models/fasttext_corpusfile.pyx":120
+ *             word = &vocab[sent[pos]]
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue             # <<<<<<<<<<<<<<
+ *             indexes[effective_words[0]] = word.index
+ *             subwords_idx_len[effective_words[0]] = word.subword_idx_len
+ */
+        goto __pyx_L6_continue;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":119
+ * 
+ *             word = &vocab[sent[pos]]
+ *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ */
+      }
+
+      /* "gensim/models/fasttext_corpusfile.pyx":121
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue
+ *             indexes[effective_words[0]] = word.index             # <<<<<<<<<<<<<<
+ *             subwords_idx_len[effective_words[0]] = word.subword_idx_len
+ *             subwords_idx[effective_words[0]] = word.subword_idx
+ */
+      __pyx_t_10 = __pyx_v_word->index;
+      (__pyx_v_indexes[(__pyx_v_effective_words[0])]) = __pyx_t_10;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":122
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ *             subwords_idx_len[effective_words[0]] = word.subword_idx_len             # <<<<<<<<<<<<<<
+ *             subwords_idx[effective_words[0]] = word.subword_idx
+ * 
+ */
+      __pyx_t_11 = __pyx_v_word->subword_idx_len;
+      (__pyx_v_subwords_idx_len[(__pyx_v_effective_words[0])]) = __pyx_t_11;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":123
+ *             indexes[effective_words[0]] = word.index
+ *             subwords_idx_len[effective_words[0]] = word.subword_idx_len
+ *             subwords_idx[effective_words[0]] = word.subword_idx             # <<<<<<<<<<<<<<
+ * 
+ *             if hs:
+ */
+      __pyx_t_12 = __pyx_v_word->subword_idx;
+      (__pyx_v_subwords_idx[(__pyx_v_effective_words[0])]) = __pyx_t_12;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":125
+ *             subwords_idx[effective_words[0]] = word.subword_idx
+ * 
+ *             if hs:             # <<<<<<<<<<<<<<
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
+ */
+      __pyx_t_4 = (__pyx_v_hs != 0);
+      if (__pyx_t_4) {
+
+        /* "gensim/models/fasttext_corpusfile.pyx":126
+ * 
+ *             if hs:
+ *                 codelens[effective_words[0]] = word.code_len             # <<<<<<<<<<<<<<
+ *                 codes[effective_words[0]] = word.code
+ *                 points[effective_words[0]] = word.point
+ */
+        __pyx_t_11 = __pyx_v_word->code_len;
+        (__pyx_v_codelens[(__pyx_v_effective_words[0])]) = __pyx_t_11;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":127
+ *             if hs:
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code             # <<<<<<<<<<<<<<
+ *                 points[effective_words[0]] = word.point
+ * 
+ */
+        __pyx_t_13 = __pyx_v_word->code;
+        (__pyx_v_codes[(__pyx_v_effective_words[0])]) = __pyx_t_13;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":128
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
+ *                 points[effective_words[0]] = word.point             # <<<<<<<<<<<<<<
+ * 
+ *             effective_words[0] += 1
+ */
+        __pyx_t_12 = __pyx_v_word->point;
+        (__pyx_v_points[(__pyx_v_effective_words[0])]) = __pyx_t_12;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":125
+ *             subwords_idx[effective_words[0]] = word.subword_idx
+ * 
+ *             if hs:             # <<<<<<<<<<<<<<
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
+ */
+      }
+
+      /* "gensim/models/fasttext_corpusfile.pyx":130
+ *                 points[effective_words[0]] = word.point
+ * 
+ *             effective_words[0] += 1             # <<<<<<<<<<<<<<
+ *             if effective_words[0] == MAX_SENTENCE_LEN:
+ *                 break
+ */
+      __pyx_t_5 = 0;
+      (__pyx_v_effective_words[__pyx_t_5]) = ((__pyx_v_effective_words[__pyx_t_5]) + 1);
+
+      /* "gensim/models/fasttext_corpusfile.pyx":131
+ * 
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      __pyx_t_4 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+      if (__pyx_t_4) {
+
+        /* "gensim/models/fasttext_corpusfile.pyx":132
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *         effective_sentences[0] += 1
+ */
+        goto __pyx_L7_break;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":131
+ * 
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      }
+      __pyx_L6_continue:;
+    }
+    __pyx_L7_break:;
+
+    /* "gensim/models/fasttext_corpusfile.pyx":134
+ *                 break
+ * 
+ *         effective_sentences[0] += 1             # <<<<<<<<<<<<<<
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
+ * 
+ */
+    __pyx_t_5 = 0;
+    (__pyx_v_effective_sentences[__pyx_t_5]) = ((__pyx_v_effective_sentences[__pyx_t_5]) + 1);
+
+    /* "gensim/models/fasttext_corpusfile.pyx":135
+ * 
+ *         effective_sentences[0] += 1
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]             # <<<<<<<<<<<<<<
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:
+ */
+    (__pyx_v_sentence_idx[(__pyx_v_effective_sentences[0])]) = (__pyx_v_effective_words[0]);
+
+    /* "gensim/models/fasttext_corpusfile.pyx":137
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    __pyx_t_4 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/models/fasttext_corpusfile.pyx":138
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     # precompute "reduced window" offsets in a single randint() call
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/models/fasttext_corpusfile.pyx":137
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+    }
+    __pyx_L3_continue:;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":141
+ * 
+ *     # precompute "reduced window" offsets in a single randint() call
+ *     for i in range(effective_words[0]):             # <<<<<<<<<<<<<<
+ *         reduced_windows[i] = random_int32(next_random) % window
+ * 
+ */
+  __pyx_t_6 = (__pyx_v_effective_words[0]);
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "gensim/models/fasttext_corpusfile.pyx":142
+ *     # precompute "reduced window" offsets in a single randint() call
+ *     for i in range(effective_words[0]):
+ *         reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
+  }
+
+  /* "gensim/models/fasttext_corpusfile.pyx":97
+ * 
+ * 
+ * cdef void prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *         vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
+ *         int *effective_words, int *effective_sentences, unsigned long long *next_random, VocabItem *vocab,
+ */
+
+  /* function exit code */
+}
+
+/* "gensim/models/fasttext_corpusfile.pyx":145
+ * 
+ * 
+ * def train_epoch_sg(             # <<<<<<<<<<<<<<
+ *         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
+ *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_6models_19fasttext_corpusfile_train_epoch_sg[] = "train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1)\nTrain Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.fasttext.FastText.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.fasttext.FastText`\n        The FastText model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _l1 : np.ndarray\n        Private working memory for each worker.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
+static PyMethodDef __pyx_mdef_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg = {"train_epoch_sg", (PyCFunction)__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19fasttext_corpusfile_train_epoch_sg};
+static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_model = 0;
+  PyObject *__pyx_v_corpus_file = 0;
+  PyObject *__pyx_v_offset = 0;
+  PyObject *__pyx_v__cython_vocab = 0;
+  PyObject *__pyx_v__cur_epoch = 0;
+  PyObject *__pyx_v__expected_examples = 0;
+  PyObject *__pyx_v__expected_words = 0;
+  PyObject *__pyx_v__work = 0;
+  PyObject *__pyx_v__l1 = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("train_epoch_sg (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_model,&__pyx_n_s_corpus_file,&__pyx_n_s_offset,&__pyx_n_s_cython_vocab,&__pyx_n_s_cur_epoch,&__pyx_n_s_expected_examples,&__pyx_n_s_expected_words,&__pyx_n_s_work,&__pyx_n_s_l1,0};
+    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_model)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 1); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 2); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 3); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 4); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 5); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 6); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 7); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_l1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, 8); __PYX_ERR(0, 145, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_sg") < 0)) __PYX_ERR(0, 145, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+    }
+    __pyx_v_model = values[0];
+    __pyx_v_corpus_file = values[1];
+    __pyx_v_offset = values[2];
+    __pyx_v__cython_vocab = values[3];
+    __pyx_v__cur_epoch = values[4];
+    __pyx_v__expected_examples = values[5];
+    __pyx_v__expected_words = values[6];
+    __pyx_v__work = values[7];
+    __pyx_v__l1 = values[8];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 145, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("gensim.models.fasttext_corpusfile.train_epoch_sg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__l1);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__l1) {
+  struct __pyx_t_6gensim_6models_14fasttext_inner_FastTextConfig __pyx_v_c;
+  int __pyx_v_cur_epoch;
+  int __pyx_v_num_epochs;
+  int __pyx_v_expected_examples;
+  int __pyx_v_expected_words;
+  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_start_alpha;
+  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_end_alpha;
+  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_effective_words;
+  int __pyx_v_effective_sentences;
+  int __pyx_v_total_effective_words;
+  int __pyx_v_total_sentences;
+  int __pyx_v_total_words;
+  int __pyx_v_sent_idx;
+  int __pyx_v_idx_start;
+  int __pyx_v_idx_end;
+  int __pyx_v_num_sentences;
+  std::vector<std::vector<std::string> >  __pyx_v_sentences;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_t_5;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  bool __pyx_t_10;
+  int __pyx_t_11;
+  std::vector<std::vector<std::string> >  __pyx_t_12;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
   int __pyx_t_17;
-  PyObject *__pyx_t_18 = NULL;
-  PyObject *__pyx_t_19 = NULL;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
   __Pyx_RefNannySetupContext("train_epoch_sg", 0);
 
-  /* "gensim/models/fasttext_corpusfile.pyx":123
+  /* "gensim/models/fasttext_corpusfile.pyx":175
  * 
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 123, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 175, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":124
+  /* "gensim/models/fasttext_corpusfile.pyx":176
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 124, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 176, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":125
+  /* "gensim/models/fasttext_corpusfile.pyx":177
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -2609,12 +3073,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 125, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 177, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":126
+  /* "gensim/models/fasttext_corpusfile.pyx":178
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -2625,125 +3089,201 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 178, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":127
+  /* "gensim/models/fasttext_corpusfile.pyx":179
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":128
+  /* "gensim/models/fasttext_corpusfile.pyx":180
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":129
+  /* "gensim/models/fasttext_corpusfile.pyx":181
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/fasttext_corpusfile.pyx":131
+  /* "gensim/models/fasttext_corpusfile.pyx":183
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 183, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  __pyx_t_8 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":132
+  /* "gensim/models/fasttext_corpusfile.pyx":184
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 184, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_offset);
+    __pyx_t_9 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 184, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":185
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
+ * 
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":186
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 132, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":135
+  /* "gensim/models/fasttext_corpusfile.pyx":189
  * 
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0             # <<<<<<<<<<<<<<
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  */
   __pyx_v_effective_words = 0;
   __pyx_v_effective_sentences = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":136
+  /* "gensim/models/fasttext_corpusfile.pyx":190
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0             # <<<<<<<<<<<<<<
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  */
   __pyx_v_total_effective_words = 0;
   __pyx_v_total_sentences = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":139
- *     cdef int sent_idx, idx_start, idx_end
+  /* "gensim/models/fasttext_corpusfile.pyx":193
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  *     init_ft_config(&c, model, _alpha, _work, _l1)             # <<<<<<<<<<<<<<
  * 
  *     # for preparing batches & training
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 139, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_2 = __pyx_f_6gensim_6models_14fasttext_inner_init_ft_config((&__pyx_v_c), __pyx_v_model, __pyx_t_7, __pyx_v__work, __pyx_v__l1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 193, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_9 = __pyx_f_6gensim_6models_14fasttext_inner_init_ft_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v__work, __pyx_v__l1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":144
+  /* "gensim/models/fasttext_corpusfile.pyx":198
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -2753,83 +3293,186 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
       #endif
       /*try:*/ {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":145
+        /* "gensim/models/fasttext_corpusfile.pyx":199
  * 
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_sentences = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/fasttext_corpusfile.pyx":200
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
  */
-        ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->reset(__pyx_v_id_stream);
 
-        /* "gensim/models/fasttext_corpusfile.pyx":146
+          /* "gensim/models/fasttext_corpusfile.pyx":199
+ * 
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/fasttext_corpusfile.pyx":202
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":203
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
- *             effective_words = 0
  */
         while (1) {
-          __pyx_t_8 = (((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_8) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_11 = (__pyx_t_10 != 0);
+          if (!__pyx_t_11) {
           } else {
-            __pyx_t_3 = __pyx_t_8;
-            goto __pyx_L8_bool_binop_done;
+            __pyx_t_3 = __pyx_t_11;
+            goto __pyx_L9_bool_binop_done;
           }
-          __pyx_t_8 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_8;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_8 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_8) break;
-
-          /* "gensim/models/fasttext_corpusfile.pyx":147
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+
+          /* "gensim/models/fasttext_corpusfile.pyx":204
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_sentences = 0
+ *             effective_words = 0
+ */
+          __pyx_t_11 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_11;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/fasttext_corpusfile.pyx":203
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_sentences = 0
+ */
+          __pyx_t_11 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_11) break;
+
+          /* "gensim/models/fasttext_corpusfile.pyx":205
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0             # <<<<<<<<<<<<<<
  *             effective_words = 0
  * 
  */
           __pyx_v_effective_sentences = 0;
 
-          /* "gensim/models/fasttext_corpusfile.pyx":148
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+          /* "gensim/models/fasttext_corpusfile.pyx":206
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             sentences = input_stream.next_batch()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/fasttext_corpusfile.pyx":150
+          /* "gensim/models/fasttext_corpusfile.pyx":208
  *             effective_words = 0
  * 
- *             sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
- * 
- *             prepare_c_structures_for_batch(
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+          __pyx_t_11 = (__pyx_v_indexed != 0);
+          if (__pyx_t_11) {
+
+            /* "gensim/models/fasttext_corpusfile.pyx":210
+ *             if indexed:
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_batch(
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ */
+            __pyx_v_num_sentences = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->next_batch(__pyx_v_id_stream);
+
+            /* "gensim/models/fasttext_corpusfile.pyx":211
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ *                 prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ *                     &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
  */
-          __pyx_t_9 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 150, __pyx_L4_error)
-          __pyx_v_sentences = __pyx_t_9;
+            __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_id_batch(__pyx_v_id_stream->batch_words, __pyx_v_id_stream->batch_lengths, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_items_ptr(__pyx_v_vocab), __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
 
-          /* "gensim/models/fasttext_corpusfile.pyx":154
- *             prepare_c_structures_for_batch(
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,             # <<<<<<<<<<<<<<
- *                 c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            /* "gensim/models/fasttext_corpusfile.pyx":208
+ *             effective_words = 0
  * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/fasttext_corpusfile.pyx":217
+ *                     c.subwords_idx_len, c.subwords_idx)
+ *             else:
+ *                 sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(
+ */
+          /*else*/ {
+            __pyx_t_12 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 217, __pyx_L4_error)
+            __pyx_v_sentences = __pyx_t_12;
+
+            /* "gensim/models/fasttext_corpusfile.pyx":218
+ *             else:
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
  */
-          __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 154, __pyx_L4_error)
+            __pyx_v_num_sentences = __pyx_v_sentences.size();
 
-          /* "gensim/models/fasttext_corpusfile.pyx":152
- *             sentences = input_stream.next_batch()
+            /* "gensim/models/fasttext_corpusfile.pyx":221
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,             # <<<<<<<<<<<<<<
+ *                     c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
  */
-          __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_10, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
+            __pyx_t_13 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 221, __pyx_L4_error)
+
+            /* "gensim/models/fasttext_corpusfile.pyx":219
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+ */
+            __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_13, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/fasttext_corpusfile.pyx":157
- *                 c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+          /* "gensim/models/fasttext_corpusfile.pyx":224
+ *                     c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
  * 
  *             for sent_idx in range(effective_sentences):             # <<<<<<<<<<<<<<
  *                 idx_start = c.sentence_idx[sent_idx]
@@ -2837,10 +3480,10 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
           __pyx_t_1 = __pyx_v_effective_sentences;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_4; __pyx_t_11+=1) {
-            __pyx_v_sent_idx = __pyx_t_11;
+          for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_4; __pyx_t_14+=1) {
+            __pyx_v_sent_idx = __pyx_t_14;
 
-            /* "gensim/models/fasttext_corpusfile.pyx":158
+            /* "gensim/models/fasttext_corpusfile.pyx":225
  * 
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]             # <<<<<<<<<<<<<<
@@ -2849,7 +3492,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
             __pyx_v_idx_start = (__pyx_v_c.sentence_idx[__pyx_v_sent_idx]);
 
-            /* "gensim/models/fasttext_corpusfile.pyx":159
+            /* "gensim/models/fasttext_corpusfile.pyx":226
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]             # <<<<<<<<<<<<<<
@@ -2858,19 +3501,19 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
             __pyx_v_idx_end = (__pyx_v_c.sentence_idx[(__pyx_v_sent_idx + 1)]);
 
-            /* "gensim/models/fasttext_corpusfile.pyx":160
+            /* "gensim/models/fasttext_corpusfile.pyx":227
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):             # <<<<<<<<<<<<<<
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  */
-            __pyx_t_12 = __pyx_v_idx_end;
-            __pyx_t_13 = __pyx_t_12;
-            for (__pyx_t_14 = __pyx_v_idx_start; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
-              __pyx_v_i = __pyx_t_14;
+            __pyx_t_15 = __pyx_v_idx_end;
+            __pyx_t_16 = __pyx_t_15;
+            for (__pyx_t_17 = __pyx_v_idx_start; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+              __pyx_v_i = __pyx_t_17;
 
-              /* "gensim/models/fasttext_corpusfile.pyx":161
+              /* "gensim/models/fasttext_corpusfile.pyx":228
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -2879,17 +3522,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
               __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/fasttext_corpusfile.pyx":162
+              /* "gensim/models/fasttext_corpusfile.pyx":229
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  */
-              __pyx_t_8 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":163
+                /* "gensim/models/fasttext_corpusfile.pyx":230
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  *                         j = idx_start             # <<<<<<<<<<<<<<
@@ -2898,7 +3541,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                 __pyx_v_j = __pyx_v_idx_start;
 
-                /* "gensim/models/fasttext_corpusfile.pyx":162
+                /* "gensim/models/fasttext_corpusfile.pyx":229
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
@@ -2907,7 +3550,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
               }
 
-              /* "gensim/models/fasttext_corpusfile.pyx":164
+              /* "gensim/models/fasttext_corpusfile.pyx":231
  *                     if j < idx_start:
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -2916,17 +3559,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
               __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/fasttext_corpusfile.pyx":165
+              /* "gensim/models/fasttext_corpusfile.pyx":232
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
  *                         k = idx_end
  *                     for j in range(j, k):
  */
-              __pyx_t_8 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":166
+                /* "gensim/models/fasttext_corpusfile.pyx":233
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:
  *                         k = idx_end             # <<<<<<<<<<<<<<
@@ -2935,7 +3578,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                 __pyx_v_k = __pyx_v_idx_end;
 
-                /* "gensim/models/fasttext_corpusfile.pyx":165
+                /* "gensim/models/fasttext_corpusfile.pyx":232
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
@@ -2944,38 +3587,38 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
               }
 
-              /* "gensim/models/fasttext_corpusfile.pyx":167
+              /* "gensim/models/fasttext_corpusfile.pyx":234
  *                     if k > idx_end:
  *                         k = idx_end
  *                     for j in range(j, k):             # <<<<<<<<<<<<<<
  *                         if j == i:
  *                             continue
  */
-              __pyx_t_15 = __pyx_v_k;
-              __pyx_t_16 = __pyx_t_15;
-              for (__pyx_t_17 = __pyx_v_j; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
-                __pyx_v_j = __pyx_t_17;
+              __pyx_t_18 = __pyx_v_k;
+              __pyx_t_19 = __pyx_t_18;
+              for (__pyx_t_20 = __pyx_v_j; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+                __pyx_v_j = __pyx_t_20;
 
-                /* "gensim/models/fasttext_corpusfile.pyx":168
+                /* "gensim/models/fasttext_corpusfile.pyx":235
  *                         k = idx_end
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
  *                             continue
  *                         if c.hs:
  */
-                __pyx_t_8 = ((__pyx_v_j == __pyx_v_i) != 0);
-                if (__pyx_t_8) {
+                __pyx_t_11 = ((__pyx_v_j == __pyx_v_i) != 0);
+                if (__pyx_t_11) {
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":169
+                  /* "gensim/models/fasttext_corpusfile.pyx":236
  *                     for j in range(j, k):
  *                         if j == i:
  *                             continue             # <<<<<<<<<<<<<<
  *                         if c.hs:
  *                             fasttext_fast_sentence_sg_hs(
  */
-                  goto __pyx_L16_continue;
+                  goto __pyx_L18_continue;
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":168
+                  /* "gensim/models/fasttext_corpusfile.pyx":235
  *                         k = idx_end
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
@@ -2984,17 +3627,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                 }
 
-                /* "gensim/models/fasttext_corpusfile.pyx":170
+                /* "gensim/models/fasttext_corpusfile.pyx":237
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
  *                             fasttext_fast_sentence_sg_hs(
  *                                 c.points[j], c.codes[j], c.codelens[j], c.syn0_vocab, c.syn0_ngrams, c.syn1, c.size,
  */
-                __pyx_t_8 = (__pyx_v_c.hs != 0);
-                if (__pyx_t_8) {
+                __pyx_t_11 = (__pyx_v_c.hs != 0);
+                if (__pyx_t_11) {
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":171
+                  /* "gensim/models/fasttext_corpusfile.pyx":238
  *                             continue
  *                         if c.hs:
  *                             fasttext_fast_sentence_sg_hs(             # <<<<<<<<<<<<<<
@@ -3003,7 +3646,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                   __pyx_f_6gensim_6models_14fasttext_inner_fasttext_fast_sentence_sg_hs((__pyx_v_c.points[__pyx_v_j]), (__pyx_v_c.codes[__pyx_v_j]), (__pyx_v_c.codelens[__pyx_v_j]), __pyx_v_c.syn0_vocab, __pyx_v_c.syn0_ngrams, __pyx_v_c.syn1, __pyx_v_c.size, (__pyx_v_c.indexes[__pyx_v_i]), (__pyx_v_c.subwords_idx[__pyx_v_i]), (__pyx_v_c.subwords_idx_len[__pyx_v_i]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.neu1, __pyx_v_c.word_locks_vocab, __pyx_v_c.word_locks_ngrams);
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":170
+                  /* "gensim/models/fasttext_corpusfile.pyx":237
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
@@ -3012,17 +3655,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                 }
 
-                /* "gensim/models/fasttext_corpusfile.pyx":175
+                /* "gensim/models/fasttext_corpusfile.pyx":242
  *                                 c.indexes[i], c.subwords_idx[i], c.subwords_idx_len[i], c.alpha, c.work, c.neu1,
  *                                 c.word_locks_vocab, c.word_locks_ngrams)
  *                         if c.negative:             # <<<<<<<<<<<<<<
  *                             c.next_random = fasttext_fast_sentence_sg_neg(
  *                                 c.negative, c.cum_table, c.cum_table_len, c.syn0_vocab, c.syn0_ngrams, c.syn1neg, c.size,
  */
-                __pyx_t_8 = (__pyx_v_c.negative != 0);
-                if (__pyx_t_8) {
+                __pyx_t_11 = (__pyx_v_c.negative != 0);
+                if (__pyx_t_11) {
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":176
+                  /* "gensim/models/fasttext_corpusfile.pyx":243
  *                                 c.word_locks_vocab, c.word_locks_ngrams)
  *                         if c.negative:
  *                             c.next_random = fasttext_fast_sentence_sg_neg(             # <<<<<<<<<<<<<<
@@ -3031,7 +3674,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  */
                   __pyx_v_c.next_random = __pyx_f_6gensim_6models_14fasttext_inner_fasttext_fast_sentence_sg_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.syn0_vocab, __pyx_v_c.syn0_ngrams, __pyx_v_c.syn1neg, __pyx_v_c.size, (__pyx_v_c.indexes[__pyx_v_j]), (__pyx_v_c.indexes[__pyx_v_i]), (__pyx_v_c.subwords_idx[__pyx_v_i]), (__pyx_v_c.subwords_idx_len[__pyx_v_i]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.neu1, __pyx_v_c.next_random, __pyx_v_c.word_locks_vocab, __pyx_v_c.word_locks_ngrams);
 
-                  /* "gensim/models/fasttext_corpusfile.pyx":175
+                  /* "gensim/models/fasttext_corpusfile.pyx":242
  *                                 c.indexes[i], c.subwords_idx[i], c.subwords_idx_len[i], c.alpha, c.work, c.neu1,
  *                                 c.word_locks_vocab, c.word_locks_ngrams)
  *                         if c.negative:             # <<<<<<<<<<<<<<
@@ -3039,30 +3682,30 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  *                                 c.negative, c.cum_table, c.cum_table_len, c.syn0_vocab, c.syn0_ngrams, c.syn1neg, c.size,
  */
                 }
-                __pyx_L16_continue:;
+                __pyx_L18_continue:;
               }
             }
           }
 
-          /* "gensim/models/fasttext_corpusfile.pyx":181
+          /* "gensim/models/fasttext_corpusfile.pyx":248
  *                                 c.neu1, c.next_random, c.word_locks_vocab, c.word_locks_ngrams)
  * 
- *             total_sentences += sentences.size()             # <<<<<<<<<<<<<<
+ *             total_sentences += num_sentences             # <<<<<<<<<<<<<<
  *             total_effective_words += effective_words
  * 
  */
-          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_sentences.size());
+          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_num_sentences);
 
-          /* "gensim/models/fasttext_corpusfile.pyx":182
+          /* "gensim/models/fasttext_corpusfile.pyx":249
  * 
- *             total_sentences += sentences.size()
+ *             total_sentences += num_sentences
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/fasttext_corpusfile.pyx":184
+          /* "gensim/models/fasttext_corpusfile.pyx":251
  *             total_effective_words += effective_words
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,             # <<<<<<<<<<<<<<
@@ -3073,12 +3716,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
         }
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":144
+      /* "gensim/models/fasttext_corpusfile.pyx":198
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -3099,7 +3742,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
       }
   }
 
-  /* "gensim/models/fasttext_corpusfile.pyx":187
+  /* "gensim/models/fasttext_corpusfile.pyx":254
  *                                      expected_examples, expected_words, cur_epoch, num_epochs)
  * 
  *     return total_sentences, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -3107,28 +3750,28 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_18 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 187, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_18);
-  __pyx_t_19 = PyTuple_New(3); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 187, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_18);
-  PyTuple_SET_ITEM(__pyx_t_19, 2, __pyx_t_18);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+  __pyx_t_9 = 0;
   __pyx_t_2 = 0;
   __pyx_t_7 = 0;
-  __pyx_t_18 = 0;
-  __pyx_r = __pyx_t_19;
-  __pyx_t_19 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":95
+  /* "gensim/models/fasttext_corpusfile.pyx":145
  * 
  * 
  * def train_epoch_sg(             # <<<<<<<<<<<<<<
@@ -3140,11 +3783,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_18);
-  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("gensim.models.fasttext_corpusfile.train_epoch_sg", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -3152,7 +3796,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
   return __pyx_r;
 }
 
-/* "gensim/models/fasttext_corpusfile.pyx":190
+/* "gensim/models/fasttext_corpusfile.pyx":257
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -3162,7 +3806,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_train_epoch_sg(C
 
 /* Python wrapper */
 static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbow[] = "train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1)\nTrain CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.fasttext.FastText.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.fasttext.FastText`\n        The FastText model instance to train.\n    corpus_file : str\n        Path to a corpus file.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
+static char __pyx_doc_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbow[] = "train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1)\nTrain CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.fasttext.FastText.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.fasttext.FastText`\n        The FastText model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
 static PyMethodDef __pyx_mdef_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow = {"train_epoch_cbow", (PyCFunction)__pyx_pw_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbow};
 static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_model = 0;
@@ -3214,53 +3858,53 @@ static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbo
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 1); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 1); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 2); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 2); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 3); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 3); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 4); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 4); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 5); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 5); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 6); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 6); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 7); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 7); __PYX_ERR(0, 257, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 8); __PYX_ERR(0, 190, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, 8); __PYX_ERR(0, 257, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_cbow") < 0)) __PYX_ERR(0, 190, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_cbow") < 0)) __PYX_ERR(0, 257, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
       goto __pyx_L5_argtuple_error;
@@ -3287,7 +3931,7 @@ static PyObject *__pyx_pw_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbo
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 190, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 257, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.fasttext_corpusfile.train_epoch_cbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3309,7 +3953,9 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -3322,6 +3968,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   int __pyx_v_sent_idx;
   int __pyx_v_idx_start;
   int __pyx_v_idx_end;
+  int __pyx_v_num_sentences;
   std::vector<std::vector<std::string> >  __pyx_v_sentences;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -3332,41 +3979,42 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   __pyx_t_6gensim_6models_19fasttext_corpusfile_REAL_t __pyx_t_5;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  std::vector<std::vector<std::string> >  __pyx_t_9;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_10;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  bool __pyx_t_10;
   int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
+  std::vector<std::vector<std::string> >  __pyx_t_12;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_13;
   int __pyx_t_14;
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
   __Pyx_RefNannySetupContext("train_epoch_cbow", 0);
 
-  /* "gensim/models/fasttext_corpusfile.pyx":218
+  /* "gensim/models/fasttext_corpusfile.pyx":287
  * 
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 218, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 287, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":219
+  /* "gensim/models/fasttext_corpusfile.pyx":288
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 288, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 219, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 288, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":220
+  /* "gensim/models/fasttext_corpusfile.pyx":289
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -3377,12 +4025,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 220, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 289, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":221
+  /* "gensim/models/fasttext_corpusfile.pyx":290
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -3393,125 +4041,201 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 221, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":222
+  /* "gensim/models/fasttext_corpusfile.pyx":291
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 291, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 291, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":223
+  /* "gensim/models/fasttext_corpusfile.pyx":292
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 223, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":224
+  /* "gensim/models/fasttext_corpusfile.pyx":293
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_6 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(0, 293, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/fasttext_corpusfile.pyx":226
+  /* "gensim/models/fasttext_corpusfile.pyx":295
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 295, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  __pyx_t_8 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_9 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(0, 295, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":296
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_v_offset);
+    __pyx_t_9 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_2 = __pyx_t_9;
+    __pyx_t_9 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":227
+  /* "gensim/models/fasttext_corpusfile.pyx":297
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":298
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 227, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_7);
-  __pyx_t_7 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(0, 298, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":230
+  /* "gensim/models/fasttext_corpusfile.pyx":301
  * 
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0             # <<<<<<<<<<<<<<
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  */
   __pyx_v_effective_words = 0;
   __pyx_v_effective_sentences = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":231
+  /* "gensim/models/fasttext_corpusfile.pyx":302
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0             # <<<<<<<<<<<<<<
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  */
   __pyx_v_total_effective_words = 0;
   __pyx_v_total_sentences = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":234
- *     cdef int sent_idx, idx_start, idx_end
+  /* "gensim/models/fasttext_corpusfile.pyx":305
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  *     init_ft_config(&c, model, _alpha, _work, _neu1)             # <<<<<<<<<<<<<<
  * 
  *     # for preparing batches & training
  */
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 234, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_2 = __pyx_f_6gensim_6models_14fasttext_inner_init_ft_config((&__pyx_v_c), __pyx_v_model, __pyx_t_7, __pyx_v__work, __pyx_v__neu1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 305, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_9 = __pyx_f_6gensim_6models_14fasttext_inner_init_ft_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v__work, __pyx_v__neu1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":239
+  /* "gensim/models/fasttext_corpusfile.pyx":310
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -3521,83 +4245,186 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
       #endif
       /*try:*/ {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":240
+        /* "gensim/models/fasttext_corpusfile.pyx":311
  * 
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_sentences = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
  */
-        ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
 
-        /* "gensim/models/fasttext_corpusfile.pyx":241
+          /* "gensim/models/fasttext_corpusfile.pyx":312
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
+ */
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->reset(__pyx_v_id_stream);
+
+          /* "gensim/models/fasttext_corpusfile.pyx":311
+ * 
+ *     with nogil:
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/fasttext_corpusfile.pyx":314
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/fasttext_corpusfile.pyx":315
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
- *             effective_words = 0
  */
         while (1) {
-          __pyx_t_8 = (((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_8) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_11 = (__pyx_t_10 != 0);
+          if (!__pyx_t_11) {
           } else {
-            __pyx_t_3 = __pyx_t_8;
-            goto __pyx_L8_bool_binop_done;
+            __pyx_t_3 = __pyx_t_11;
+            goto __pyx_L9_bool_binop_done;
           }
-          __pyx_t_8 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_8;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_8 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_8) break;
-
-          /* "gensim/models/fasttext_corpusfile.pyx":242
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+
+          /* "gensim/models/fasttext_corpusfile.pyx":316
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_sentences = 0
+ *             effective_words = 0
+ */
+          __pyx_t_11 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_11;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/fasttext_corpusfile.pyx":315
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_sentences = 0
+ */
+          __pyx_t_11 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_11) break;
+
+          /* "gensim/models/fasttext_corpusfile.pyx":317
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0             # <<<<<<<<<<<<<<
  *             effective_words = 0
  * 
  */
           __pyx_v_effective_sentences = 0;
 
-          /* "gensim/models/fasttext_corpusfile.pyx":243
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+          /* "gensim/models/fasttext_corpusfile.pyx":318
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             sentences = input_stream.next_batch()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/fasttext_corpusfile.pyx":245
+          /* "gensim/models/fasttext_corpusfile.pyx":320
  *             effective_words = 0
  * 
- *             sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
- * 
- *             prepare_c_structures_for_batch(
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
  */
-          __pyx_t_9 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 245, __pyx_L4_error)
-          __pyx_v_sentences = __pyx_t_9;
+          __pyx_t_11 = (__pyx_v_indexed != 0);
+          if (__pyx_t_11) {
 
-          /* "gensim/models/fasttext_corpusfile.pyx":249
- *             prepare_c_structures_for_batch(
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,             # <<<<<<<<<<<<<<
- *                 c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            /* "gensim/models/fasttext_corpusfile.pyx":322
+ *             if indexed:
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_batch(
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ */
+            __pyx_v_num_sentences = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_id_stream->__pyx_vtab)->next_batch(__pyx_v_id_stream);
+
+            /* "gensim/models/fasttext_corpusfile.pyx":323
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ *                 prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ *                     &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+ */
+            __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_id_batch(__pyx_v_id_stream->batch_words, __pyx_v_id_stream->batch_lengths, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_items_ptr(__pyx_v_vocab), __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
+
+            /* "gensim/models/fasttext_corpusfile.pyx":320
+ *             effective_words = 0
  * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/fasttext_corpusfile.pyx":329
+ *                     c.subwords_idx_len, c.subwords_idx)
+ *             else:
+ *                 sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(
+ */
+          /*else*/ {
+            __pyx_t_12 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_v_input_stream->__pyx_vtab)->next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 329, __pyx_L4_error)
+            __pyx_v_sentences = __pyx_t_12;
+
+            /* "gensim/models/fasttext_corpusfile.pyx":330
+ *             else:
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
  */
-          __pyx_t_10 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 249, __pyx_L4_error)
+            __pyx_v_num_sentences = __pyx_v_sentences.size();
 
-          /* "gensim/models/fasttext_corpusfile.pyx":247
- *             sentences = input_stream.next_batch()
+            /* "gensim/models/fasttext_corpusfile.pyx":333
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,             # <<<<<<<<<<<<<<
+ *                     c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
  */
-          __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_10, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
+            __pyx_t_13 = ((struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_v_vocab->__pyx_vtab)->get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 333, __pyx_L4_error)
 
-          /* "gensim/models/fasttext_corpusfile.pyx":252
- *                 c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            /* "gensim/models/fasttext_corpusfile.pyx":331
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+ */
+            __pyx_f_6gensim_6models_19fasttext_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_13, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows, __pyx_v_c.subwords_idx_len, __pyx_v_c.subwords_idx);
+          }
+          __pyx_L11:;
+
+          /* "gensim/models/fasttext_corpusfile.pyx":336
+ *                     c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
  * 
  *             for sent_idx in range(effective_sentences):             # <<<<<<<<<<<<<<
  *                 idx_start = c.sentence_idx[sent_idx]
@@ -3605,10 +4432,10 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
           __pyx_t_1 = __pyx_v_effective_sentences;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_4; __pyx_t_11+=1) {
-            __pyx_v_sent_idx = __pyx_t_11;
+          for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_4; __pyx_t_14+=1) {
+            __pyx_v_sent_idx = __pyx_t_14;
 
-            /* "gensim/models/fasttext_corpusfile.pyx":253
+            /* "gensim/models/fasttext_corpusfile.pyx":337
  * 
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]             # <<<<<<<<<<<<<<
@@ -3617,7 +4444,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
             __pyx_v_idx_start = (__pyx_v_c.sentence_idx[__pyx_v_sent_idx]);
 
-            /* "gensim/models/fasttext_corpusfile.pyx":254
+            /* "gensim/models/fasttext_corpusfile.pyx":338
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]             # <<<<<<<<<<<<<<
@@ -3626,19 +4453,19 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
             __pyx_v_idx_end = (__pyx_v_c.sentence_idx[(__pyx_v_sent_idx + 1)]);
 
-            /* "gensim/models/fasttext_corpusfile.pyx":255
+            /* "gensim/models/fasttext_corpusfile.pyx":339
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):             # <<<<<<<<<<<<<<
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  */
-            __pyx_t_12 = __pyx_v_idx_end;
-            __pyx_t_13 = __pyx_t_12;
-            for (__pyx_t_14 = __pyx_v_idx_start; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
-              __pyx_v_i = __pyx_t_14;
+            __pyx_t_15 = __pyx_v_idx_end;
+            __pyx_t_16 = __pyx_t_15;
+            for (__pyx_t_17 = __pyx_v_idx_start; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+              __pyx_v_i = __pyx_t_17;
 
-              /* "gensim/models/fasttext_corpusfile.pyx":256
+              /* "gensim/models/fasttext_corpusfile.pyx":340
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -3647,17 +4474,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
               __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/fasttext_corpusfile.pyx":257
+              /* "gensim/models/fasttext_corpusfile.pyx":341
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  */
-              __pyx_t_8 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":258
+                /* "gensim/models/fasttext_corpusfile.pyx":342
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  *                         j = idx_start             # <<<<<<<<<<<<<<
@@ -3666,7 +4493,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
                 __pyx_v_j = __pyx_v_idx_start;
 
-                /* "gensim/models/fasttext_corpusfile.pyx":257
+                /* "gensim/models/fasttext_corpusfile.pyx":341
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
@@ -3675,7 +4502,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
               }
 
-              /* "gensim/models/fasttext_corpusfile.pyx":259
+              /* "gensim/models/fasttext_corpusfile.pyx":343
  *                     if j < idx_start:
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -3684,17 +4511,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
               __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/fasttext_corpusfile.pyx":260
+              /* "gensim/models/fasttext_corpusfile.pyx":344
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
  *                         k = idx_end
  * 
  */
-              __pyx_t_8 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":261
+                /* "gensim/models/fasttext_corpusfile.pyx":345
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:
  *                         k = idx_end             # <<<<<<<<<<<<<<
@@ -3703,7 +4530,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
                 __pyx_v_k = __pyx_v_idx_end;
 
-                /* "gensim/models/fasttext_corpusfile.pyx":260
+                /* "gensim/models/fasttext_corpusfile.pyx":344
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
@@ -3712,17 +4539,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
               }
 
-              /* "gensim/models/fasttext_corpusfile.pyx":263
+              /* "gensim/models/fasttext_corpusfile.pyx":347
  *                         k = idx_end
  * 
  *                     if c.hs:             # <<<<<<<<<<<<<<
  *                         fasttext_fast_sentence_cbow_hs(
  *                             c.points[i], c.codes[i], c.codelens, c.neu1, c.syn0_vocab, c.syn0_ngrams, c.syn1, c.size,
  */
-              __pyx_t_8 = (__pyx_v_c.hs != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = (__pyx_v_c.hs != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":264
+                /* "gensim/models/fasttext_corpusfile.pyx":348
  * 
  *                     if c.hs:
  *                         fasttext_fast_sentence_cbow_hs(             # <<<<<<<<<<<<<<
@@ -3731,7 +4558,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
                 __pyx_f_6gensim_6models_14fasttext_inner_fasttext_fast_sentence_cbow_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), __pyx_v_c.codelens, __pyx_v_c.neu1, __pyx_v_c.syn0_vocab, __pyx_v_c.syn0_ngrams, __pyx_v_c.syn1, __pyx_v_c.size, __pyx_v_c.indexes, __pyx_v_c.subwords_idx, __pyx_v_c.subwords_idx_len, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_i, __pyx_v_j, __pyx_v_k, __pyx_v_c.cbow_mean, __pyx_v_c.word_locks_vocab, __pyx_v_c.word_locks_ngrams);
 
-                /* "gensim/models/fasttext_corpusfile.pyx":263
+                /* "gensim/models/fasttext_corpusfile.pyx":347
  *                         k = idx_end
  * 
  *                     if c.hs:             # <<<<<<<<<<<<<<
@@ -3740,17 +4567,17 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
               }
 
-              /* "gensim/models/fasttext_corpusfile.pyx":268
+              /* "gensim/models/fasttext_corpusfile.pyx":352
  *                             c.indexes, c.subwords_idx, c.subwords_idx_len, c.alpha, c.work, i, j, k, c.cbow_mean,
  *                             c.word_locks_vocab, c.word_locks_ngrams)
  *                     if c.negative:             # <<<<<<<<<<<<<<
  *                         c.next_random = fasttext_fast_sentence_cbow_neg(
  *                             c.negative, c.cum_table, c.cum_table_len, c.codelens, c.neu1, c.syn0_vocab, c.syn0_ngrams,
  */
-              __pyx_t_8 = (__pyx_v_c.negative != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = (__pyx_v_c.negative != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/fasttext_corpusfile.pyx":269
+                /* "gensim/models/fasttext_corpusfile.pyx":353
  *                             c.word_locks_vocab, c.word_locks_ngrams)
  *                     if c.negative:
  *                         c.next_random = fasttext_fast_sentence_cbow_neg(             # <<<<<<<<<<<<<<
@@ -3759,7 +4586,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  */
                 __pyx_v_c.next_random = __pyx_f_6gensim_6models_14fasttext_inner_fasttext_fast_sentence_cbow_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.codelens, __pyx_v_c.neu1, __pyx_v_c.syn0_vocab, __pyx_v_c.syn0_ngrams, __pyx_v_c.syn1neg, __pyx_v_c.size, __pyx_v_c.indexes, __pyx_v_c.subwords_idx, __pyx_v_c.subwords_idx_len, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_i, __pyx_v_j, __pyx_v_k, __pyx_v_c.cbow_mean, __pyx_v_c.next_random, __pyx_v_c.word_locks_vocab, __pyx_v_c.word_locks_ngrams);
 
-                /* "gensim/models/fasttext_corpusfile.pyx":268
+                /* "gensim/models/fasttext_corpusfile.pyx":352
  *                             c.indexes, c.subwords_idx, c.subwords_idx_len, c.alpha, c.work, i, j, k, c.cbow_mean,
  *                             c.word_locks_vocab, c.word_locks_ngrams)
  *                     if c.negative:             # <<<<<<<<<<<<<<
@@ -3770,25 +4597,25 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
             }
           }
 
-          /* "gensim/models/fasttext_corpusfile.pyx":274
+          /* "gensim/models/fasttext_corpusfile.pyx":358
  *                             c.cbow_mean, c.next_random, c.word_locks_vocab, c.word_locks_ngrams)
  * 
- *             total_sentences += sentences.size()             # <<<<<<<<<<<<<<
+ *             total_sentences += num_sentences             # <<<<<<<<<<<<<<
  *             total_effective_words += effective_words
  * 
  */
-          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_sentences.size());
+          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_num_sentences);
 
-          /* "gensim/models/fasttext_corpusfile.pyx":275
+          /* "gensim/models/fasttext_corpusfile.pyx":359
  * 
- *             total_sentences += sentences.size()
+ *             total_sentences += num_sentences
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/fasttext_corpusfile.pyx":277
+          /* "gensim/models/fasttext_corpusfile.pyx":361
  *             total_effective_words += effective_words
  * 
  *             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,             # <<<<<<<<<<<<<<
@@ -3799,12 +4626,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
         }
       }
 
-      /* "gensim/models/fasttext_corpusfile.pyx":239
+      /* "gensim/models/fasttext_corpusfile.pyx":310
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -3825,7 +4652,7 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
       }
   }
 
-  /* "gensim/models/fasttext_corpusfile.pyx":280
+  /* "gensim/models/fasttext_corpusfile.pyx":364
  *                                      expected_examples, expected_words, cur_epoch, num_epochs)
  * 
  *     return total_sentences, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -3833,28 +4660,28 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 364, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 364, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 280, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_15);
-  __pyx_t_16 = PyTuple_New(3); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 280, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_9);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_t_7);
-  __Pyx_GIVEREF(__pyx_t_15);
-  PyTuple_SET_ITEM(__pyx_t_16, 2, __pyx_t_15);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+  __pyx_t_9 = 0;
   __pyx_t_2 = 0;
   __pyx_t_7 = 0;
-  __pyx_t_15 = 0;
-  __pyx_r = __pyx_t_16;
-  __pyx_t_16 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":190
+  /* "gensim/models/fasttext_corpusfile.pyx":257
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -3866,11 +4693,12 @@ static PyObject *__pyx_pf_6gensim_6models_19fasttext_corpusfile_2train_epoch_cbo
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_AddTraceback("gensim.models.fasttext_corpusfile.train_epoch_cbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -6402,10 +7230,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_expected_words_2, __pyx_k_expected_words_2, sizeof(__pyx_k_expected_words_2), 0, 0, 1, 1},
   {&__pyx_kp_s_gensim_models_fasttext_corpusfil, __pyx_k_gensim_models_fasttext_corpusfil, sizeof(__pyx_k_gensim_models_fasttext_corpusfil), 0, 0, 1, 0},
   {&__pyx_n_s_gensim_models_fasttext_corpusfil_2, __pyx_k_gensim_models_fasttext_corpusfil_2, sizeof(__pyx_k_gensim_models_fasttext_corpusfil_2), 0, 0, 1, 1},
+  {&__pyx_n_s_gensim_models_word2vec_corpusfil, __pyx_k_gensim_models_word2vec_corpusfil, sizeof(__pyx_k_gensim_models_word2vec_corpusfil), 0, 0, 1, 1},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_id_corpus_or_none, __pyx_k_id_corpus_or_none, sizeof(__pyx_k_id_corpus_or_none), 0, 0, 1, 1},
+  {&__pyx_n_s_id_stream, __pyx_k_id_stream, sizeof(__pyx_k_id_stream), 0, 0, 1, 1},
   {&__pyx_n_s_idx_end, __pyx_k_idx_end, sizeof(__pyx_k_idx_end), 0, 0, 1, 1},
   {&__pyx_n_s_idx_start, __pyx_k_idx_start, sizeof(__pyx_k_idx_start), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_indexed, __pyx_k_indexed, sizeof(__pyx_k_indexed), 0, 0, 1, 1},
   {&__pyx_n_s_input_stream, __pyx_k_input_stream, sizeof(__pyx_k_input_stream), 0, 0, 1, 1},
   {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
   {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
@@ -6418,6 +7250,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_neu1, __pyx_k_neu1, sizeof(__pyx_k_neu1), 0, 0, 1, 1},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_num_epochs, __pyx_k_num_epochs, sizeof(__pyx_k_num_epochs), 0, 0, 1, 1},
+  {&__pyx_n_s_num_sentences, __pyx_k_num_sentences, sizeof(__pyx_k_num_sentences), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
   {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
@@ -6439,7 +7272,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 93, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 229, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 810, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 1000, __pyx_L1_error)
@@ -6549,29 +7382,29 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "gensim/models/fasttext_corpusfile.pyx":95
+  /* "gensim/models/fasttext_corpusfile.pyx":145
  * 
  * 
  * def train_epoch_sg(             # <<<<<<<<<<<<<<
  *         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
  *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_tuple__10 = PyTuple_Pack(31, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_l1, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(34, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_l1, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_num_sentences, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__10);
   __Pyx_GIVEREF(__pyx_tuple__10);
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(9, 0, 31, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_fasttext_corpusfil, __pyx_n_s_train_epoch_sg, 95, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(9, 0, 34, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_fasttext_corpusfil, __pyx_n_s_train_epoch_sg, 145, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 145, __pyx_L1_error)
 
-  /* "gensim/models/fasttext_corpusfile.pyx":190
+  /* "gensim/models/fasttext_corpusfile.pyx":257
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                      _neu1):
  *     """Train CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_tuple__12 = PyTuple_Pack(31, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(34, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_num_sentences, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 257, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__12);
   __Pyx_GIVEREF(__pyx_tuple__12);
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(9, 0, 31, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_fasttext_corpusfil, __pyx_n_s_train_epoch_cbow, 190, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(9, 0, 34, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_fasttext_corpusfil, __pyx_n_s_train_epoch_cbow, 257, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 257, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -6647,6 +7480,8 @@ static int __Pyx_modinit_type_import_code(void) {
   __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonLineSentence*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence)) __PYX_ERR(3, 33, __pyx_L1_error)
   __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = __Pyx_ImportType("gensim.models.word2vec_corpusfile", "CythonVocab", sizeof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab), 1); if (unlikely(!__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab)) __PYX_ERR(3, 61, __pyx_L1_error)
   __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab)) __PYX_ERR(3, 61, __pyx_L1_error)
+  __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = __Pyx_ImportType("gensim.models.word2vec_corpusfile", "CythonIdCorpus", sizeof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus), 1); if (unlikely(!__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus)) __PYX_ERR(3, 69, __pyx_L1_error)
+  __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = (struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus*)__Pyx_GetVtable(__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus->tp_dict); if (unlikely(!__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus)) __PYX_ERR(3, 69, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -6666,6 +7501,7 @@ static int __Pyx_modinit_variable_import_code(void) {
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "dsdot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_dsdot, "__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "snrm2", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_snrm2, "__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "sscal", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sscal, "__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr(__pyx_t_1, "sgemm", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sgemm, "__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "EXP_TABLE", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE, "__pyx_t_6gensim_6models_14word2vec_inner_REAL_t [0x3E8]") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_dot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_dot, "__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_saxpy", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_saxpy, "__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -6784,6 +7620,7 @@ static int __pyx_pymod_exec_fasttext_corpusfile(PyObject *__pyx_pyinit_module)
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
@@ -6894,46 +7731,67 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":95
+  /* "gensim/models/fasttext_corpusfile.pyx":40
+ *     cvocab_t
+ * )
+ * from gensim.models.word2vec_corpusfile import id_corpus_or_none             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef np.float32_t REAL_t
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_id_corpus_or_none);
+  __Pyx_GIVEREF(__pyx_n_s_id_corpus_or_none);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_id_corpus_or_none);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_gensim_models_word2vec_corpusfil, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_id_corpus_or_none, __pyx_t_1) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "gensim/models/fasttext_corpusfile.pyx":145
  * 
  * 
  * def train_epoch_sg(             # <<<<<<<<<<<<<<
  *         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
  *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg, NULL, __pyx_n_s_gensim_models_fasttext_corpusfil_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_sg, __pyx_t_1) < 0) __PYX_ERR(0, 95, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19fasttext_corpusfile_1train_epoch_sg, NULL, __pyx_n_s_gensim_models_fasttext_corpusfil_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_sg, __pyx_t_2) < 0) __PYX_ERR(0, 145, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":190
+  /* "gensim/models/fasttext_corpusfile.pyx":257
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                      _neu1):
  *     """Train CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow, NULL, __pyx_n_s_gensim_models_fasttext_corpusfil_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_cbow, __pyx_t_1) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19fasttext_corpusfile_3train_epoch_cbow, NULL, __pyx_n_s_gensim_models_fasttext_corpusfil_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_cbow, __pyx_t_2) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "gensim/models/fasttext_corpusfile.pyx":283
+  /* "gensim/models/fasttext_corpusfile.pyx":367
  * 
  * 
  * CORPUSFILE_VERSION = 1             # <<<<<<<<<<<<<<
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(0, 283, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(0, 367, __pyx_L1_error)
 
   /* "gensim/models/fasttext_corpusfile.pyx":1
  * #!/usr/bin/env cython             # <<<<<<<<<<<<<<
  * # distutils: language = c++
  * # cython: boundscheck=False
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1008
  *         raise ImportError("numpy.core.umath failed to import")
@@ -6948,6 +7806,7 @@ if (!__Pyx_RefNanny) {
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init gensim.models.fasttext_corpusfile", 0, __pyx_lineno, __pyx_filename);
@@ -7134,29 +7993,199 @@ static int __Pyx_ParseOptionalKeywords(
             goto invalid_keyword;
         }
     }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* GetModuleGlobalName */
+static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        result = NULL;
+    } else {
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    if (likely(result)) {
+        Py_INCREF(result);
+    } else {
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    if (!result) {
+        PyErr_Clear();
+#endif
+        result = __Pyx_GetBuiltinName(name);
+    }
+    return result;
+}
+
+/* PyFunctionFastCall */
+    #if CYTHON_FAST_PYCALL
+#include "frameobject.h"
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = f->f_localsplus;
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyCFunctionFastCall */
+    #if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
+    }
 }
+#endif
 
 /* PyObjectCall */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
     ternaryfunc call = func->ob_type->tp_call;
@@ -7176,7 +8205,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #endif
 
 /* ExtTypeTest */
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
         return 0;
@@ -7189,7 +8218,7 @@ static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
 }
 
 /* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     tmp_type = tstate->curexc_type;
@@ -7213,7 +8242,7 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #endif
 
 /* RaiseException */
-#if PY_MAJOR_VERSION < 3
+    #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -7295,227 +8324,84 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
                 } else if (unlikely(is_subclass == -1)) {
                     goto bad;
                 } else {
-                    type = instance_class;
-                }
-            }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
-    }
-}
-#endif
-
-/* PyFunctionFastCall */
-#if CYTHON_FAST_PYCALL
-#include "frameobject.h"
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = f->f_localsplus;
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
-        return NULL;
-    }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
-#endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
+                    type = instance_class;
+                }
+            }
         }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
         }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
     }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
-        }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
         }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
+        PyException_SetCause(value, fixed_cause);
     }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_COMPILING_IN_PYPY
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
 #endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
 #endif
-#endif
 
 /* PyObjectCallMethO */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
     PyObject *self, *result;
     PyCFunction cfunc;
@@ -7535,7 +8421,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 #endif
 
 /* PyObjectCallOneArg */
-#if CYTHON_COMPILING_IN_CPYTHON
+    #if CYTHON_COMPILING_IN_CPYTHON
 static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
     PyObject *result;
     PyObject *args = PyTuple_New(1);
@@ -7575,7 +8461,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 #endif
 
 /* DictGetItem */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
     PyObject *value;
     value = PyDict_GetItemWithError(d, key);
@@ -7594,25 +8480,25 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
 #endif
 
 /* RaiseTooManyValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
 /* RaiseNoneIterError */
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* SaveResetException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     #if PY_VERSION_HEX >= 0x030700A3
     *type = tstate->exc_state.exc_type;
@@ -7651,7 +8537,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyErrExceptionMatches */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
     Py_ssize_t i, n;
     n = PyTuple_GET_SIZE(tuple);
@@ -7676,7 +8562,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetException */
-#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_FAST_THREAD_STATE
 static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
 #else
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
@@ -7746,7 +8632,7 @@ bad:
 }
 
 /* GetVTable */
-  static void* __Pyx_GetVtable(PyObject *dict) {
+      static void* __Pyx_GetVtable(PyObject *dict) {
     void* ptr;
     PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
     if (!ob)
@@ -7766,7 +8652,7 @@ bad:
 }
 
 /* Import */
-  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+      static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -7830,8 +8716,22 @@ bad:
     return module;
 }
 
+/* ImportFrom */
+      static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
 /* CLineInTraceback */
-  #ifndef CYTHON_CLINE_IN_TRACEBACK
+      #ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -7871,7 +8771,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+      static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -7951,7 +8851,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-  #include "compile.h"
+      #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
@@ -8036,7 +8936,7 @@ bad:
 }
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -8067,7 +8967,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+      #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -8089,7 +8989,7 @@ bad:
     }
 
 /* None */
-  static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
+      static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
   int err;
   #ifdef WITH_THREAD
   PyGILState_STATE _save = PyGILState_Ensure();
@@ -8102,7 +9002,7 @@ bad:
 }
 
 /* Declarations */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
       return ::std::complex< float >(x, y);
@@ -8122,7 +9022,7 @@ bad:
 #endif
 
 /* Arithmetic */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -8257,7 +9157,7 @@ bad:
 #endif
 
 /* Declarations */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
       return ::std::complex< double >(x, y);
@@ -8277,7 +9177,7 @@ bad:
 #endif
 
 /* Arithmetic */
-  #if CYTHON_CCOMPLEX
+      #if CYTHON_CCOMPLEX
 #else
     static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
        return (a.real == b.real) && (a.imag == b.imag);
@@ -8412,7 +9312,7 @@ bad:
 #endif
 
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__NPY_TYPES(enum NPY_TYPES value) {
     const enum NPY_TYPES neg_one = (enum NPY_TYPES) -1, const_zero = (enum NPY_TYPES) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -8443,7 +9343,7 @@ bad:
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+      static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
     const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -8631,8 +9531,197 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* CIntFromPy */
+      static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
+        }
+    } else {
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
 /* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
@@ -8663,7 +9752,7 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+      static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) -1, const_zero = (long) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
@@ -8852,7 +9941,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-  #if CYTHON_COMPILING_IN_CPYTHON
+      #if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -8952,7 +10041,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-  static int __Pyx_check_binary_version(void) {
+      static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
     PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
@@ -8968,7 +10057,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* ModuleImport */
-  #ifndef __PYX_HAVE_RT_ImportModule
+      #ifndef __PYX_HAVE_RT_ImportModule
 #define __PYX_HAVE_RT_ImportModule
 static PyObject *__Pyx_ImportModule(const char *name) {
     PyObject *py_name = 0;
@@ -8986,7 +10075,7 @@ bad:
 #endif
 
 /* TypeImport */
-  #ifndef __PYX_HAVE_RT_ImportType
+      #ifndef __PYX_HAVE_RT_ImportType
 #define __PYX_HAVE_RT_ImportType
 static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
     size_t size, int strict)
@@ -9051,7 +10140,7 @@ bad:
 #endif
 
 /* VoidPtrImport */
-  #ifndef __PYX_HAVE_RT_ImportVoidPtr
+      #ifndef __PYX_HAVE_RT_ImportVoidPtr
 #define __PYX_HAVE_RT_ImportVoidPtr
 static int __Pyx_ImportVoidPtr(PyObject *module, const char *name, void **p, const char *sig) {
     PyObject *d = 0;
@@ -9100,7 +10189,7 @@ bad:
 #endif
 
 /* FunctionImport */
-  #ifndef __PYX_HAVE_RT_ImportFunction
+      #ifndef __PYX_HAVE_RT_ImportFunction
 #define __PYX_HAVE_RT_ImportFunction
 static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
     PyObject *d = 0;
@@ -9154,7 +10243,7 @@ bad:
 #endif
 
 /* InitStrings */
-  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+      static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -32,10 +32,12 @@ from gensim.models.word2vec_corpusfile cimport (
     VocabItem,
     CythonVocab,
     CythonLineSentence,
+    CythonIdCorpus,
     get_alpha,
     get_next_alpha,
     cvocab_t
 )
+from gensim.models.word2vec_corpusfile import id_corpus_or_none
 
 ctypedef np.float32_t REAL_t
 DEF MAX_SENTENCE_LEN = 10000
@@ -92,6 +94,54 @@ cdef void prepare_c_structures_for_batch(
         reduced_windows[i] = random_int32(next_random) % window
 
 
+cdef void prepare_c_structures_for_id_batch(
+        vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
+        int *effective_words, int *effective_sentences, unsigned long long *next_random, VocabItem *vocab,
+        int *sentence_idx, np.uint32_t *indexes, int *codelens, np.uint8_t **codes, np.uint32_t **points,
+        np.uint32_t *reduced_windows, int *subwords_idx_len, np.uint32_t **subwords_idx) nogil:
+    cdef VocabItem *word
+    cdef np.int32_t *sent
+    cdef size_t sent_no
+    cdef int pos
+
+    sentence_idx[0] = 0  # indices of the first sentence always start at 0
+    for sent_no in range(sentences.size()):
+        if lengths[sent_no] == 0:
+            continue  # ignore empty sentences; leave effective_sentences unchanged
+        sent = sentences[sent_no]
+        total_words[0] += lengths[sent_no]
+
+        for pos in range(lengths[sent_no]):
+            if sent[pos] < 0:
+                continue  # out of vocabulary, same as a missing token
+
+            word = &vocab[sent[pos]]
+            if sample and word.sample_int < random_int32(next_random):
+                continue
+            indexes[effective_words[0]] = word.index
+            subwords_idx_len[effective_words[0]] = word.subword_idx_len
+            subwords_idx[effective_words[0]] = word.subword_idx
+
+            if hs:
+                codelens[effective_words[0]] = word.code_len
+                codes[effective_words[0]] = word.code
+                points[effective_words[0]] = word.point
+
+            effective_words[0] += 1
+            if effective_words[0] == MAX_SENTENCE_LEN:
+                break
+
+        effective_sentences[0] += 1
+        sentence_idx[effective_sentences[0]] = effective_words[0]
+
+        if effective_words[0] == MAX_SENTENCE_LEN:
+            break
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i in range(effective_words[0]):
+        reduced_windows[i] = random_int32(next_random) % window
+
+
 def train_epoch_sg(
         model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _l1):
     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
@@ -102,8 +152,10 @@ def train_epoch_sg(
     ----------
     model : :class:`~gensim.models.fasttext.FastText`
         The FastText model instance to train.
-    corpus_file : str
-        Path to corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -128,13 +180,15 @@ def train_epoch_sg(
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
-    cdef int sent_idx, idx_start, idx_end
+    cdef int sent_idx, idx_start, idx_end, num_sentences
 
     init_ft_config(&c, model, _alpha, _work, _l1)
 
@@ -142,17 +196,30 @@ def train_epoch_sg(
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
-
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
-                c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            if indexed:
+                # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+                num_sentences = id_stream.next_batch()
+                prepare_c_structures_for_id_batch(
+                    id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+                    &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+                    c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+                    c.subwords_idx_len, c.subwords_idx)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -178,7 +245,7 @@ def train_epoch_sg(
                                 c.indexes[j], c.indexes[i], c.subwords_idx[i], c.subwords_idx_len[i], c.alpha, c.work,
                                 c.neu1, c.next_random, c.word_locks_vocab, c.word_locks_ngrams)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
@@ -197,8 +264,10 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     ----------
     model : :class:`~gensim.models.fasttext.FastText`
         The FastText model instance to train.
-    corpus_file : str
-        Path to a corpus file.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -223,13 +292,15 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
-    cdef int sent_idx, idx_start, idx_end
+    cdef int sent_idx, idx_start, idx_end, num_sentences
 
     init_ft_config(&c, model, _alpha, _work, _neu1)
 
@@ -237,17 +308,30 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
-
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
-                c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
+            if indexed:
+                # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+                num_sentences = id_stream.next_batch()
+                prepare_c_structures_for_id_batch(
+                    id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+                    &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+                    c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows,
+                    c.subwords_idx_len, c.subwords_idx)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes, c.codelens,
+                    c.codes, c.points, c.reduced_windows, c.subwords_idx_len, c.subwords_idx)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -271,7 +355,7 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
                             c.syn1neg, c.size, c.indexes, c.subwords_idx, c.subwords_idx_len, c.alpha, c.work, i, j, k,
                             c.cbow_mean, c.next_random, c.word_locks_vocab, c.word_locks_ngrams)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(start_alpha, end_alpha, total_sentences, total_words,
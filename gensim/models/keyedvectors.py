@@ -158,9 +158,9 @@ and so on.
 
 from __future__ import division  # py3 "true division"
 
-from collections import deque
 from itertools import chain
 import logging
+from multiprocessing.pool import ThreadPool
 
 try:
     from queue import Queue, Empty
@@ -505,6 +505,9 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
             are searched for most-similar values. For example, restrict_vocab=10000 would
             only check the first 10000 word vectors in the vocabulary order. (This may be
             meaningful if you've sorted the vocabulary by descending frequency.)
+        indexer : object, optional
+            Approximate nearest neighbour index, such as :class:`~gensim.similarities.index.AnnoyIndexer` or
+            :class:`~gensim.similarities.hnsw.HnswIndexer`, to query instead of scanning all vectors.
 
         Returns
         -------
@@ -606,7 +609,8 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
         """
         return self.most_similar(positive=[vector], topn=topn, restrict_vocab=restrict_vocab)
 
-    def similarity_matrix(self, dictionary, tfidf=None, threshold=0.0, exponent=2.0, nonzero_limit=100, dtype=REAL):
+    def similarity_matrix(self, dictionary, tfidf=None, threshold=0.0, exponent=2.0, nonzero_limit=100, dtype=REAL,
+                          chunksize=256, workers=1):
         """Construct a term similarity matrix for computing Soft Cosine Measure.
 
         This creates a sparse term similarity matrix in the :class:`scipy.sparse.csc_matrix` format for computing
@@ -633,6 +637,11 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
             length rather than quadratic.
         dtype : numpy.dtype, optional
             Data-type of the term similarity matrix.
+        chunksize : int, optional
+            Number of rows whose similarities to the whole vocabulary are computed at once, by a single matrix product.
+            Each chunk takes `chunksize` * `len(self.vocab)` floats of memory.
+        workers : int, optional
+            Number of worker threads computing the chunks.
 
         Returns
         -------
@@ -655,65 +664,125 @@ class WordEmbeddingsKeyedVectors(BaseKeyedVectors):
 
         """
         logger.info("constructing a term similarity matrix")
+        self.init_sims()
         matrix_order = len(dictionary)
-        matrix_nonzero = [1] * matrix_order
-        matrix = sparse.identity(matrix_order, dtype=dtype, format="dok")
-        num_skipped = 0
+        matrix_nonzero = np.ones(matrix_order, dtype=np.int64)
         # Decide the order of rows.
         if tfidf is None:
-            word_indices = deque(sorted(dictionary.keys()))
+            word_indices = sorted(dictionary.keys())
         else:
             assert max(tfidf.idfs) < matrix_order
-            word_indices = deque([
+            word_indices = [
                 index for index, _
                 in sorted(tfidf.idfs.items(), key=lambda x: (x[1], -x[0]), reverse=True)
-            ])
+            ]
+        in_vocab = [w_index for w_index in word_indices if dictionary[w_index] in self.vocab]
+        num_skipped = len(word_indices) - len(in_vocab)
+        rows, columns, elements = [], [], []
+
+        if matrix_order <= nonzero_limit + 1:
+            # No row can reach `nonzero_limit`, so all pairs of words more similar than `threshold` make it in.
+            vectors = self.vectors_norm[[self.vocab[dictionary[w_index]].index for w_index in in_vocab]]
+            similarities = dot(vectors, vectors.T)
+            w1_positions, w2_positions = np.nonzero(np.triu(similarities > threshold, 1))
+            in_vocab = np.array(in_vocab, dtype=np.int64)
+            element = similarities[w1_positions, w2_positions] ** exponent
+            rows.extend([in_vocab[w1_positions], in_vocab[w2_positions]])
+            columns.extend([in_vocab[w2_positions], in_vocab[w1_positions]])
+            elements.extend([element, element])
+        else:
+            # Traverse only columns corresponding to the embeddings closest to each row. Their similarities
+            # are computed by chunks of rows, the columns are then admitted row by row in the order of importance,
+            # so that we don't exceed `nonzero_limit` by mirroring the upper triangle.
+            vocab2dictionary = np.full(len(self.index2word), -1, dtype=np.int64)
+            for w_index in in_vocab:
+                vocab2dictionary[self.vocab[dictionary[w_index]].index] = w_index
+            chunks = utils.chunkize_serial(in_vocab, chunksize)
+            if workers > 1:
+                pool = ThreadPool(workers)
+                candidates = pool.imap(
+                    lambda chunk: (chunk, self._similarity_matrix_candidates(chunk, dictionary, nonzero_limit)), chunks
+                )
+            else:
+                pool = None
+                candidates = (
+                    (chunk, self._similarity_matrix_candidates(chunk, dictionary, nonzero_limit)) for chunk in chunks
+                )
 
-        # Traverse rows.
-        for row_number, w1_index in enumerate(list(word_indices)):
-            word_indices.popleft()
-            if row_number % 1000 == 0:
+            row_number = 0
+            for chunk, (chunk_candidates, chunk_similarities) in candidates:
                 logger.info(
-                    "PROGRESS: at %.02f%% rows (%d / %d, %d skipped, %.06f%% density)",
-                    100.0 * (row_number + 1) / matrix_order, row_number + 1, matrix_order,
-                    num_skipped, 100.0 * matrix.getnnz() / matrix_order**2)
-            w1 = dictionary[w1_index]
-            if w1 not in self.vocab:
-                num_skipped += 1
-                continue  # A word from the dictionary is not present in the word2vec model.
-
-            # Traverse upper triangle columns.
-            if matrix_order <= nonzero_limit + 1:  # Traverse all columns.
-                columns = (
-                    (w2_index, self.similarity(w1, dictionary[w2_index]))
-                    for w2_index in word_indices
-                    if dictionary[w2_index] in self.vocab)
-            else:  # Traverse only columns corresponding to the embeddings closest to w1.
-                num_nonzero = matrix_nonzero[w1_index] - 1
-                columns = (
-                    (dictionary.token2id[w2], similarity)
-                    for _, (w2, similarity)
-                    in zip(
-                        range(nonzero_limit - num_nonzero),
-                        self.most_similar(positive=[w1], topn=nonzero_limit - num_nonzero)
-                    )
-                    if w2 in dictionary.token2id
+                    "PROGRESS: at %.02f%% rows (%d / %d, %d skipped)",
+                    100.0 * (row_number + 1) / matrix_order, row_number + 1, matrix_order, num_skipped
                 )
-                columns = sorted(columns, key=lambda x: x[0])
-
-            for w2_index, similarity in columns:
-                # Ensure that we don't exceed `nonzero_limit` by mirroring the upper triangle.
-                if similarity > threshold and matrix_nonzero[w2_index] <= nonzero_limit:
-                    element = similarity**exponent
-                    matrix[w1_index, w2_index] = element
-                    matrix_nonzero[w1_index] += 1
-                    matrix[w2_index, w1_index] = element
-                    matrix_nonzero[w2_index] += 1
+                row_number += len(chunk)
+                chunk_columns = vocab2dictionary[chunk_candidates]
+                for w1_index, w1_columns, w1_similarities in zip(chunk, chunk_columns, chunk_similarities):
+                    num_nonzero = matrix_nonzero[w1_index] - 1
+                    topn = max(nonzero_limit - num_nonzero, 0)
+                    w1_columns, w1_similarities = w1_columns[:topn], w1_similarities[:topn]
+                    in_dictionary = w1_columns >= 0
+                    w1_columns, w1_similarities = w1_columns[in_dictionary], w1_similarities[in_dictionary]
+                    # The columns of a row are distinct, so admitting one doesn't change the admission of the others.
+                    admitted = (w1_similarities > threshold) & (matrix_nonzero[w1_columns] <= nonzero_limit)
+                    w2_indices, element = w1_columns[admitted], w1_similarities[admitted]**exponent
+                    rows.extend([np.full(len(w2_indices), w1_index, dtype=np.int64), w2_indices])
+                    columns.extend([w2_indices, np.full(len(w2_indices), w1_index, dtype=np.int64)])
+                    elements.extend([element, element])
+                    matrix_nonzero[w1_index] += len(w2_indices)
+                    matrix_nonzero[w2_indices] += 1
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        diagonal = np.arange(matrix_order)
+        rows = np.concatenate([np.asarray(part, dtype=np.int64).ravel() for part in rows] + [diagonal])
+        columns = np.concatenate([np.asarray(part, dtype=np.int64).ravel() for part in columns] + [diagonal])
+        elements = np.concatenate(
+            [np.asarray(part, dtype=dtype).ravel() for part in elements] + [np.ones(matrix_order, dtype=dtype)]
+        )
+        # A pair may have been admitted twice (once from each of its words); keep the later value, like an assignment.
+        _, last = np.unique((rows * matrix_order + columns)[::-1], return_index=True)
+        last = len(rows) - 1 - last
+        matrix = sparse.csc_matrix(
+            (elements[last], (rows[last], columns[last])), shape=(matrix_order, matrix_order), dtype=dtype
+        )
         logger.info(
             "constructed a term similarity matrix with %0.6f %% nonzero elements",
             100.0 * matrix.getnnz() / matrix_order**2
         )
-        return matrix.tocsc()
+        return matrix
+
+    def _similarity_matrix_candidates(self, chunk, dictionary, topn):
+        """Get the `topn` words most similar to each word in `chunk`, in decreasing order of similarity.
+
+        Parameters
+        ----------
+        chunk : list of int
+            Dictionary ids of words in the vocabulary.
+        dictionary : :class:`~gensim.corpora.dictionary.Dictionary`
+            Dictionary of the term similarity matrix.
+        topn : int
+            Number of most similar words.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Vocabulary indices of the most similar words to each word in `chunk` and their similarities
+            (one row per word), excluding the word itself, like
+            :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar`.
+
+        """
+        indices = np.array([self.vocab[dictionary[w_index]].index for w_index in chunk])
+        similarities = dot(self.vectors_norm[indices], self.vectors_norm.T)
+        similarities[np.arange(len(indices)), indices] = -np.inf
+        topn = min(topn, similarities.shape[1] - 1)
+        if topn <= 0:
+            return np.zeros((len(indices), 0), dtype=np.int64), np.zeros((len(indices), 0), dtype=similarities.dtype)
+        positions = np.arange(len(indices))[:, newaxis]
+        candidates = np.argpartition(-similarities, topn - 1, axis=1)[:, :topn]
+        candidates = candidates[positions, np.argsort(-similarities[positions, candidates], axis=1, kind='mergesort')]
+        return candidates, similarities[positions, candidates]
 
     def wmdistance(self, document1, document2):
         """Compute the Word Mover's Distance between two documents.
@@ -1608,7 +1677,8 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
                 np_divide(
                     self.vectors_docs, sqrt((self.vectors_docs ** 2).sum(-1))[..., newaxis], self.vectors_docs_norm)
 
-    def most_similar(self, positive=None, negative=None, topn=10, clip_start=0, clip_end=None, indexer=None):
+    def most_similar(self, positive=None, negative=None, topn=10, clip_start=0, clip_end=None, indexer=None,
+                     chunksize=None):
         """Find the top-N most similar docvecs from the training set.
         Positive docvecs contribute positively towards the similarity, negative docvecs negatively.
 
@@ -1631,6 +1701,14 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
             Start clipping index.
         clip_end : int
             End clipping index.
+        indexer : object, optional
+            Approximate nearest neighbour index, such as :class:`~gensim.similarities.index.AnnoyIndexer` or
+            :class:`~gensim.similarities.hnsw.HnswIndexer`, to query instead of scanning all vectors.
+        chunksize : int, optional
+            If set, don't precompute the normalized vectors with
+            :meth:`~gensim.models.keyedvectors.Doc2VecKeyedVectors.init_sims`. Instead, scan the (possibly mmapped)
+            vectors in chunks of `chunksize` docvecs, normalizing each chunk on the fly and keeping only the running
+            top-N. Memory use then stays bounded by the chunk size, no matter how many docvecs there are.
 
         Returns
         -------
@@ -1643,8 +1721,13 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
         if negative is None:
             negative = []
 
-        self.init_sims()
-        clip_end = clip_end or len(self.vectors_docs_norm)
+        if chunksize is None:
+            self.init_sims()
+            vectors = self.vectors_docs_norm
+        else:
+            # reuse the normalized vectors if they're already there, but don't create them
+            vectors = self.vectors_docs_norm if getattr(self, 'vectors_docs_norm', None) is not None else None
+        clip_end = clip_end or len(self.vectors_docs)
 
         if isinstance(positive, string_types + integer_types + (integer,)) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
@@ -1666,8 +1749,10 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
             if isinstance(doc, ndarray):
                 mean.append(weight * doc)
             elif doc in self.doctags or doc < self.count:
-                mean.append(weight * self.vectors_docs_norm[self._int_index(doc, self.doctags, self.max_rawint)])
-                all_docs.add(self._int_index(doc, self.doctags, self.max_rawint))
+                index = self._int_index(doc, self.doctags, self.max_rawint)
+                vector = matutils.unitvec(self.vectors_docs[index]) if vectors is None else vectors[index]
+                mean.append(weight * vector)
+                all_docs.add(index)
             else:
                 raise KeyError("doc '%s' not in trained set" % doc)
         if not mean:
@@ -1677,6 +1762,9 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
         if indexer is not None:
             return indexer.most_similar(mean, topn)
 
+        if chunksize is not None:
+            return self._most_similar_chunked(mean, topn, all_docs, clip_start, clip_end, chunksize)
+
         dists = dot(self.vectors_docs_norm[clip_start:clip_end], mean)
         if not topn:
             return dists
@@ -1689,6 +1777,60 @@ class Doc2VecKeyedVectors(BaseKeyedVectors):
         ]
         return result[:topn]
 
+    def _most_similar_chunked(self, mean, topn, all_docs, clip_start, clip_end, chunksize):
+        """Scan the docvecs between `clip_start` and `clip_end` in chunks, for
+        :meth:`~gensim.models.keyedvectors.Doc2VecKeyedVectors.most_similar`.
+
+        Parameters
+        ----------
+        mean : numpy.ndarray
+            Normalized query vector.
+        topn : int
+            Number of top-N similar docvecs to return, all similarities are returned if falsy.
+        all_docs : set of int
+            Indexes of input docs, left out of the result.
+        clip_start : int
+            Start clipping index.
+        clip_end : int
+            End clipping index.
+        chunksize : int
+            Number of docvecs scanned at once.
+
+        Returns
+        -------
+        {list of ({str, int}, float), numpy.ndarray}
+            Sequence of (doctag/index, similarity), or similarities to all docvecs in the clip range if `topn` is falsy.
+
+        """
+        vectors = self.vectors_docs
+        clip_end = min(clip_end, len(vectors))
+        num_best = topn + len(all_docs) if topn else 0
+        dists = []
+        best_indexes, best_sims = empty(0, dtype=np.int64), empty(0, dtype=REAL)
+        for start in xrange(clip_start, clip_end, chunksize):
+            chunk = vectors[start: min(start + chunksize, clip_end)]
+            norms = sqrt((chunk ** 2).sum(-1))
+            norms[norms == 0.0] = 1.0
+            sims = (dot(chunk, mean) / norms).astype(REAL)
+            if not topn:
+                dists.append(sims)
+                continue
+            # merge the chunk into the running top-N
+            best_indexes = np.concatenate([best_indexes, np.arange(start, start + len(chunk))])
+            best_sims = np.concatenate([best_sims, sims])
+            if len(best_sims) > num_best:
+                keep = np.argpartition(-best_sims, num_best - 1)[:num_best]
+                best_indexes, best_sims = best_indexes[keep], best_sims[keep]
+        if not topn:
+            return np.concatenate(dists) if dists else empty(0, dtype=REAL)
+        order = np.argsort(-best_sims, kind='mergesort')
+        result = [
+            (self._index_to_doctag(index, self.offset2doctag, self.max_rawint), float(sim))
+            for index, sim in zip(best_indexes[order], best_sims[order])
+            if index not in all_docs
+        ]
+        return result[:topn]
+
     def doesnt_match(self, docs):
         """Which document from the given list doesn't go with the others from the training set?
 
@@ -1006,13 +1006,132 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             )
         )
 
-    def closest_child(self, node):
+    @staticmethod
+    def vector_distance_matrix(vectors_1, vectors_2):
+        """Compute poincare distances between each of `vectors_1` and each of `vectors_2`.
+
+        Parameters
+        ----------
+        vectors_1 : numpy.array
+            Vectors from which Poincare distances are to be computed, expected shape (num_vectors_1, dim).
+        vectors_2 : numpy.array
+            Vectors to which Poincare distances are to be computed, expected shape (num_vectors_2, dim).
+
+        Returns
+        -------
+        numpy.array
+            Poincare distances of shape (num_vectors_1, num_vectors_2).
+
+        Notes
+        -----
+        The squared euclidean distances are expanded as :math:`|u|^2 + |v|^2 - 2 u \\cdot v`, so that all of them
+        come out of a single matrix product. The computation is done in double precision, to keep the distances
+        of nearby vectors accurate.
+
+        """
+        vectors_1 = np.asarray(vectors_1, dtype=np.float64)
+        vectors_2 = np.asarray(vectors_2, dtype=np.float64)
+        sq_norms_1 = (vectors_1 ** 2).sum(axis=1)
+        sq_norms_2 = (vectors_2 ** 2).sum(axis=1)
+        sq_dists = sq_norms_1[:, np.newaxis] + sq_norms_2[np.newaxis, :] - 2 * np.dot(vectors_1, vectors_2.T)
+        np.maximum(sq_dists, 0, out=sq_dists)
+        return np.arccosh(
+            1 + 2 * sq_dists / ((1 - sq_norms_1)[:, np.newaxis] * (1 - sq_norms_2)[np.newaxis, :])
+        )
+
+    def _input_vectors(self, nodes_or_vectors):
+        """Get the vectors of nodes and/or vectors, and the vocabulary indices of the nodes (None for vectors)."""
+        vectors, indices = [], []
+        for node_or_vector in nodes_or_vectors:
+            if isinstance(node_or_vector, string_types):
+                index = self.vocab[node_or_vector].index
+                vectors.append(self.syn0[index])
+                indices.append(index)
+            else:
+                vectors.append(node_or_vector)
+                indices.append(None)
+        return np.array(vectors, dtype=self.syn0.dtype).reshape(len(vectors), self.vector_size), indices
+
+    def _closest_batch(self, nodes, lower, indexer=None, all_norms=None, blocksize=256):
+        """Get the closest node lower (or higher) in the hierarchy than each of `nodes`.
+
+        Used internally by :meth:`~gensim.models.poincare.PoincareKeyedVectors.closest_child_batch` and
+        :meth:`~gensim.models.poincare.PoincareKeyedVectors.closest_parent_batch`.
+
+        """
+        vectors, indices = self._input_vectors(nodes)
+        if all_norms is None:
+            all_norms = np.linalg.norm(self.syn0, axis=1)
+        node_norms = all_norms[indices]
+        result = []
+        if indexer is not None:
+            for vector, node_index, node_norm in zip(vectors, indices, node_norms):
+                norm_range = (node_norm, None) if lower else (None, node_norm)
+                closest = indexer.search(vector, 1, norm_range=norm_range, exclude=node_index)
+                result.append(self.index2word[closest[0][0]] if closest else None)
+            return result
+
+        for start in range(0, len(vectors), blocksize):
+            all_distances = self.vector_distance_matrix(vectors[start:start + blocksize], self.syn0)
+            block_norms = node_norms[start:start + blocksize, np.newaxis]
+            mask = block_norms >= all_norms if lower else block_norms <= all_norms
+            all_distances[mask] = np.inf
+            closest_indices = np.argmin(all_distances, axis=1)
+            for closest_index, masked in zip(closest_indices, mask.all(axis=1)):
+                result.append(None if masked else self.index2word[closest_index])
+        return result
+
+    def closest_child_batch(self, nodes, indexer=None, blocksize=256):
+        """Get the closest child of each of `nodes`,
+        see :meth:`~gensim.models.poincare.PoincareKeyedVectors.closest_child`.
+
+        Parameters
+        ----------
+        nodes : iterable of str
+            Keys of the nodes for which closest children are to be found.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
+        blocksize : int, optional
+            Number of nodes whose distances to the whole vocabulary are computed at once.
+
+        Returns
+        -------
+        list of {str, None}
+            Closest child of each node, None for nodes with no nodes lower in the hierarchy.
+
+        """
+        return self._closest_batch(nodes, True, indexer=indexer, blocksize=blocksize)
+
+    def closest_parent_batch(self, nodes, indexer=None, blocksize=256):
+        """Get the closest parent of each of `nodes`,
+        see :meth:`~gensim.models.poincare.PoincareKeyedVectors.closest_parent`.
+
+        Parameters
+        ----------
+        nodes : iterable of str
+            Keys of the nodes for which closest parents are to be found.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
+        blocksize : int, optional
+            Number of nodes whose distances to the whole vocabulary are computed at once.
+
+        Returns
+        -------
+        list of {str, None}
+            Closest parent of each node, None for nodes with no nodes higher in the hierarchy.
+
+        """
+        return self._closest_batch(nodes, False, indexer=indexer, blocksize=blocksize)
+
+    def closest_child(self, node, indexer=None):
         """Get the node closest to `node` that is lower in the hierarchy than `node`.
 
         Parameters
         ----------
         node : {str, int}
             Key for node for which closest child is to be found.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
 
         Returns
         -------
@@ -1021,23 +1140,17 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             If there are no nodes lower in the hierarchy, None is returned.
 
         """
-        all_distances = self.distances(node)
-        all_norms = np.linalg.norm(self.syn0, axis=1)
-        node_norm = all_norms[self.vocab[node].index]
-        mask = node_norm >= all_norms
-        if mask.all():  # No nodes lower in the hierarchy
-            return None
-        all_distances = np.ma.array(all_distances, mask=mask)
-        closest_child_index = np.ma.argmin(all_distances)
-        return self.index2word[closest_child_index]
-
-    def closest_parent(self, node):
+        return self.closest_child_batch([node], indexer=indexer)[0]
+
+    def closest_parent(self, node, indexer=None):
         """Get the node closest to `node` that is higher in the hierarchy than `node`.
 
         Parameters
         ----------
         node : {str, int}
             Key for node for which closest parent is to be found.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
 
         Returns
         -------
@@ -1046,17 +1159,9 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             If there are no nodes higher in the hierarchy, None is returned.
 
         """
-        all_distances = self.distances(node)
-        all_norms = np.linalg.norm(self.syn0, axis=1)
-        node_norm = all_norms[self.vocab[node].index]
-        mask = node_norm <= all_norms
-        if mask.all():  # No nodes higher in the hierarchy
-            return None
-        all_distances = np.ma.array(all_distances, mask=mask)
-        closest_child_index = np.ma.argmin(all_distances)
-        return self.index2word[closest_child_index]
-
-    def descendants(self, node, max_depth=5):
+        return self.closest_parent_batch([node], indexer=indexer)[0]
+
+    def descendants(self, node, max_depth=5, indexer=None):
         """Get the list of recursively closest children from the given node, up to a max depth of `max_depth`.
 
         Parameters
@@ -1065,29 +1170,35 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             Key for node for which descendants are to be found.
         max_depth : int
             Maximum number of descendants to return.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
 
         Returns
         -------
         list of str
-            Descendant nodes from the node `node`.
+            Descendant nodes from the node `node`. Shorter than `max_depth` if the lowest level of the hierarchy
+            is reached first.
 
         """
-        depth = 0
+        all_norms = np.linalg.norm(self.syn0, axis=1)  # computed once for the whole traversal
         descendants = []
         current_node = node
-        while depth < max_depth:
-            descendants.append(self.closest_child(current_node))
-            current_node = descendants[-1]
-            depth += 1
+        while len(descendants) < max_depth:
+            current_node = self._closest_batch([current_node], True, indexer=indexer, all_norms=all_norms)[0]
+            if current_node is None:
+                break
+            descendants.append(current_node)
         return descendants
 
-    def ancestors(self, node):
+    def ancestors(self, node, indexer=None):
         """Get the list of recursively closest parents from the given node.
 
         Parameters
         ----------
         node : {str, int}
             Key for node for which ancestors are to be found.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes.
 
         Returns
         -------
@@ -1095,12 +1206,12 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             Ancestor nodes of the node `node`.
 
         """
+        all_norms = np.linalg.norm(self.syn0, axis=1)  # computed once for the whole traversal
         ancestors = []
-        current_node = node
-        ancestor = self.closest_parent(current_node)
+        ancestor = self._closest_batch([node], False, indexer=indexer, all_norms=all_norms)[0]
         while ancestor is not None:
             ancestors.append(ancestor)
-            ancestor = self.closest_parent(ancestors[-1])
+            ancestor = self._closest_batch([ancestor], False, indexer=indexer, all_norms=all_norms)[0]
         return ancestors
 
     def distance(self, w1, w2):
@@ -1181,7 +1292,7 @@ class PoincareKeyedVectors(BaseKeyedVectors):
         """
         return 1 / (1 + self.distance(w1, w2))
 
-    def most_similar(self, node_or_vector, topn=10, restrict_vocab=None):
+    def most_similar(self, node_or_vector, topn=10, restrict_vocab=None, indexer=None):
         """Find the top-N most similar nodes to the given node or vector, sorted in increasing order of distance.
 
         Parameters
@@ -1194,6 +1305,8 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             Optional integer which limits the range of vectors which are searched for most-similar values.
             For example, restrict_vocab=10000 would only check the first 10000 node vectors in the vocabulary order.
             This may be meaningful if vocabulary is sorted by descending frequency.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes. Cannot be combined with `restrict_vocab`.
 
         Returns
         --------
@@ -1216,6 +1329,10 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             [(u'kangaroo.n.01', 0.0), (u'marsupial.n.01', 0.26524229460827725)]
 
         """
+        if indexer is not None:
+            return self.most_similar_batch(
+                [node_or_vector], topn=topn, restrict_vocab=restrict_vocab, indexer=indexer
+            )[0]
         if not restrict_vocab:
             all_distances = self.distances(node_or_vector)
         else:
@@ -1232,12 +1349,64 @@ class PoincareKeyedVectors(BaseKeyedVectors):
             closest_indices = matutils.argsort(all_distances, topn=1 + topn)
         result = [
             (self.index2word[index], float(all_distances[index]))
-            for index in closest_indices if (not node_index or index != node_index)  # ignore the input node
+            for index in closest_indices if index != node_index  # ignore the input node
         ]
         if topn:
             result = result[:topn]
         return result
 
+    def most_similar_batch(self, nodes_or_vectors, topn=10, restrict_vocab=None, indexer=None, blocksize=256):
+        """Find the top-N most similar nodes to each of the given nodes or vectors.
+
+        Same as calling :meth:`~gensim.models.poincare.PoincareKeyedVectors.most_similar` for each of them, but the
+        distances of `blocksize` queries to all nodes are computed at once, with a single matrix product.
+
+        Parameters
+        ----------
+        nodes_or_vectors : iterable of {str, numpy.array}
+            Node keys or vectors for which similar nodes are to be found.
+        topn : int or None, optional
+            Number of similar nodes to return per query, if `None`, returns all.
+        restrict_vocab : int or None, optional
+            Only search the first `restrict_vocab` node vectors in the vocabulary order.
+        indexer : :class:`~gensim.models.poincare.PoincareIndexer`, optional
+            Index used to avoid computing the distances to all nodes. Cannot be combined with `restrict_vocab`.
+        blocksize : int, optional
+            Number of queries whose distances to the whole vocabulary are computed at once.
+
+        Returns
+        -------
+        list of list of (str, float)
+            For each query, (node, distance) pairs in increasing order of distance, leaving out the query node itself.
+
+        """
+        vectors, indices = self._input_vectors(nodes_or_vectors)
+        if indexer is not None:
+            if restrict_vocab:
+                raise ValueError("restrict_vocab cannot be combined with an indexer")
+            if not topn:
+                raise ValueError("topn must be set when searching with an indexer")
+            return [
+                [
+                    (self.index2word[index], distance)
+                    for index, distance in indexer.search(vector, topn + 1, exclude=node_index)[:topn]
+                ]
+                for vector, node_index in zip(vectors, indices)
+            ]
+
+        other_vectors = self.syn0[:restrict_vocab] if restrict_vocab else self.syn0
+        result = []
+        for start in range(0, len(vectors), blocksize):
+            all_distances = self.vector_distance_matrix(vectors[start:start + blocksize], other_vectors)
+            for distances, node_index in zip(all_distances, indices[start:start + blocksize]):
+                closest_indices = matutils.argsort(distances, topn=1 + topn if topn else None)
+                similar = [
+                    (self.index2word[index], float(distances[index]))
+                    for index in closest_indices if index != node_index  # ignore the input node
+                ]
+                result.append(similar[:topn] if topn else similar)
+        return result
+
     def distances(self, node_or_vector, other_nodes=()):
         """Compute Poincare distances from given `node_or_vector` to all nodes in `other_nodes`.
         If `other_nodes` is empty, return distance between `node_or_vector` and all nodes in vocab.
@@ -1375,6 +1544,194 @@ class PoincareKeyedVectors(BaseKeyedVectors):
         return self.norm(node_or_vector_2) - self.norm(node_or_vector_1)
 
 
+class PoincareIndexer(utils.SaveLoad):
+    """Index over the vectors of :class:`~gensim.models.poincare.PoincareKeyedVectors`, to find the nodes closest
+    to a query without computing the distances to all nodes.
+
+    The nodes are grouped into cells by their direction (angular buckets, found by spherical k-means) and their
+    norm (bands of equal size, i.e. levels of the hierarchy). From the angle between the query and the bucket
+    centroid, the angular radius of the cell and the range of norms in it, a lower bound on the Poincare distance
+    of the query to any node in the cell follows. Cells are searched in increasing order of their bound, until the
+    bound exceeds the distance of the `topn`-th closest node found so far, so the results are exact.
+
+    Searches restricted to nodes lower or higher in the hierarchy (as in
+    :meth:`~gensim.models.poincare.PoincareKeyedVectors.closest_child`) skip whole bands of norms.
+
+    The index has to be rebuilt if the vectors change, e.g. by further training.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import datapath
+        >>> from gensim.models.poincare import PoincareKeyedVectors, PoincareIndexer
+        >>>
+        >>> kv = PoincareKeyedVectors.load_word2vec_format(datapath('poincare_vectors.bin'), binary=True)
+        >>> indexer = PoincareIndexer(kv)
+        >>> similar = kv.most_similar('dog.n.01', topn=5, indexer=indexer)
+        >>> descendants = kv.descendants('dog.n.01', indexer=indexer)
+
+    """
+    def __init__(self, kv, num_buckets=None, num_bands=8, iterations=5, seed=0):
+        """
+
+        Parameters
+        ----------
+        kv : :class:`~gensim.models.poincare.PoincareKeyedVectors`
+            Vectors to index.
+        num_buckets : int, optional
+            Number of angular buckets. If None, use the square root of the number of nodes.
+        num_bands : int, optional
+            Number of bands of norms.
+        iterations : int, optional
+            Number of k-means iterations for the bucket centroids.
+        seed : int, optional
+            Seed for picking the initial bucket centroids.
+
+        """
+        self.vectors = kv.syn0
+        self.norms = np.linalg.norm(self.vectors, axis=1)
+        num_nodes = len(self.vectors)
+        if num_buckets is None:
+            num_buckets = int(np.sqrt(num_nodes))
+        num_buckets = max(1, min(num_buckets, num_nodes))
+        directions = self.vectors / np.maximum(self.norms, 1e-12)[:, np.newaxis]
+
+        centroids = directions[np.random.RandomState(seed).choice(num_nodes, num_buckets, replace=False)]
+        for _ in range(iterations):
+            buckets = self._assign(directions, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, buckets, directions)
+            lengths = np.linalg.norm(sums, axis=1)
+            nonempty = lengths > 0  # empty buckets keep their old centroid
+            centroids[nonempty] = sums[nonempty] / lengths[nonempty, np.newaxis]
+        buckets = self._assign(directions, centroids)
+        self.centroids = centroids
+
+        edges = np.percentile(self.norms, np.linspace(0, 100, num_bands + 1)[1:-1])
+        bands = np.searchsorted(edges, self.norms, side='right')
+        cells = buckets * num_bands + bands
+        self.order = np.argsort(cells, kind='mergesort')
+        counts = np.bincount(cells, minlength=num_buckets * num_bands)
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        nonempty = np.flatnonzero(counts)
+        self.cell_start, self.cell_end = offsets[nonempty], offsets[nonempty + 1]
+        self.cell_bucket = nonempty // num_bands
+
+        # angular radius and range of norms of each cell
+        cosines = np.clip((directions * centroids[buckets]).sum(axis=1), -1.0, 1.0)
+        angles, norms = np.arccos(cosines.astype(np.float64))[self.order], self.norms[self.order]
+        self.cell_radius = np.maximum.reduceat(angles, self.cell_start)
+        self.cell_min_norm = np.minimum.reduceat(norms, self.cell_start).astype(np.float64)
+        self.cell_max_norm = np.maximum.reduceat(norms, self.cell_start).astype(np.float64)
+        logger.info(
+            "indexed %i vectors in %i cells (%i buckets x %i bands)", num_nodes, len(nonempty), num_buckets, num_bands
+        )
+
+    @staticmethod
+    def _assign(directions, centroids, chunksize=65536):
+        """Get the closest centroid of each direction."""
+        return np.concatenate([
+            np.argmax(np.dot(directions[start:start + chunksize], centroids.T), axis=1)
+            for start in range(0, len(directions), chunksize)
+        ])
+
+    def lower_bounds(self, vector, norm_range=(None, None)):
+        """Get a lower bound on the distance of `vector` to the nodes of each cell.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Query vector.
+        norm_range : (float, float), optional
+            Only consider nodes with a norm strictly between these bounds (None for no bound).
+
+        Returns
+        -------
+        numpy.array
+            Lower bound for each cell, infinity for cells with no nodes in `norm_range`.
+
+        """
+        vector = np.asarray(vector, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        direction = vector / norm if norm > 0 else vector
+        angles = np.arccos(np.clip(np.dot(self.centroids, direction), -1.0, 1.0))[self.cell_bucket]
+        # smallest possible angle between the query and a node of the cell, with some slack for rounding errors
+        angles = np.maximum(angles - self.cell_radius - 1e-6, 0.0)
+
+        min_norm, max_norm = self.cell_min_norm, self.cell_max_norm
+        valid = np.ones(len(min_norm), dtype=bool)
+        low, high = norm_range
+        if low is not None:
+            valid &= max_norm > low
+            min_norm = np.maximum(min_norm, low)
+        if high is not None:
+            valid &= min_norm < high
+            max_norm = np.minimum(max_norm, high)
+
+        # |u - v|^2 = (|v| - |u| cos a)^2 + (|u| sin a)^2, smallest for |v| as close to |u| cos a as possible
+        projections = norm * np.cos(angles)
+        closest_norm = np.clip(projections, min_norm, max_norm)
+        sq_dists = (closest_norm - projections) ** 2 + (norm * np.sin(angles)) ** 2
+        bounds = np.arccosh(1 + 2 * sq_dists / ((1 - norm ** 2) * (1 - min_norm ** 2))) * (1 - 1e-6)
+        bounds[~valid] = np.inf
+        return bounds
+
+    def search(self, vector, topn, norm_range=(None, None), exclude=None, chunksize=256):
+        """Find the `topn` nodes closest to `vector`.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Query vector.
+        topn : int
+            Number of nodes to return.
+        norm_range : (float, float), optional
+            Only return nodes with a norm strictly between these bounds (None for no bound).
+        exclude : int, optional
+            Index of a node never to return, typically the query node itself.
+        chunksize : int, optional
+            Minimum number of nodes whose exact distances are computed at once.
+
+        Returns
+        -------
+        list of (int, float)
+            Indices of the closest nodes and their distances, in increasing order of distance.
+
+        """
+        bounds = self.lower_bounds(vector, norm_range)
+        cells = np.argsort(bounds, kind='mergesort')
+        cells = cells[:np.searchsorted(bounds[cells], np.inf)]
+        low, high = norm_range
+        best_indices, best_distances = np.zeros(0, dtype=np.int64), np.zeros(0)
+        pos = 0
+        while pos < len(cells):
+            if len(best_distances) >= topn and bounds[cells[pos]] > best_distances[-1]:
+                break  # no node in the remaining cells can be closer
+            members = []
+            num_members = 0
+            while pos < len(cells) and num_members < chunksize:
+                if len(best_distances) >= topn and bounds[cells[pos]] > best_distances[-1]:
+                    break
+                cell = cells[pos]
+                members.append(self.order[self.cell_start[cell]:self.cell_end[cell]])
+                num_members += len(members[-1])
+                pos += 1
+            members = np.concatenate(members)
+            keep = members != exclude if exclude is not None else np.ones(len(members), dtype=bool)
+            if low is not None:
+                keep &= self.norms[members] > low
+            if high is not None:
+                keep &= self.norms[members] < high
+            members = members[keep]
+            distances = PoincareKeyedVectors.vector_distance_matrix(vector[np.newaxis, :], self.vectors[members])[0]
+            best_indices = np.concatenate((best_indices, members))
+            best_distances = np.concatenate((best_distances, distances))
+            best = np.argsort(best_distances, kind='mergesort')[:topn]
+            best_indices, best_distances = best_indices[best], best_distances[best]
+        return [(int(index), float(distance)) for index, distance in zip(best_indices, best_distances)]
+
+
 class PoincareRelations(object):
     """Stream relations for `PoincareModel` from a tsv-like file."""
 
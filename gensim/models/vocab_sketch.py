@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module contains :class:`~gensim.models.vocab_sketch.CountMinSketch`, a fixed-size table of counters that
+estimates the frequencies of the words of a stream without storing the words themselves. It lets
+:meth:`~gensim.models.word2vec.Word2Vec.build_vocab` scan corpora whose raw vocabulary would not fit in memory.
+
+How it works
+------------
+The sketch holds `depth` rows of `width` counters. Each word is hashed to one counter per row, and every occurrence
+of the word increments these `depth` counters. The estimated count of a word is the smallest of its counters: it is
+never lower than the true count, and with probability at least `1 - exp(-depth)` it exceeds the true count by no more
+than `e * total / width`, where `total` is the number of words added so far.
+
+Sketches of the same shape and seed can be merged by adding their tables, so parts of a corpus (files, or the shares of
+worker processes) can be sketched independently.
+
+A vocabulary scan with a sketch reads the corpus twice. The first pass fills the sketch. The second pass counts,
+exactly, only the words whose estimated count reaches `min_count`: no word that belongs in the vocabulary is missed,
+and the words that do not are never stored, except for the few false candidates that `prepare_vocab` then discards.
+The corpus must therefore be a restartable iterable, not a one-shot iterator or generator.
+
+Examples
+--------
+Build the vocabulary of a model within about 32MB of counters:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_texts
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.models.vocab_sketch import CountMinSketch
+    >>>
+    >>> model = Word2Vec(min_count=1)
+    >>> model.build_vocab(common_texts, sketch=CountMinSketch(width=2 ** 20, depth=4))
+
+"""
+
+from __future__ import division
+
+import logging
+import math
+
+import numpy as np
+
+from gensim import utils
+
+logger = logging.getLogger(__name__)
+
+_HASH_BASE = 0x100000001b3  # odd multiplier of the polynomial hash of a word's utf8 bytes
+_MASK = 2 ** 64 - 1
+
+
+def _inverse_mod_2_64(a):
+    """Multiplicative inverse of the odd integer `a` modulo 2**64 (Newton's iteration)."""
+    x = a
+    for _ in range(6):
+        x = (x * (2 - a * x)) & _MASK
+    return x
+
+
+_HASH_BASE_INV = _inverse_mod_2_64(_HASH_BASE)
+
+
+def _mix(h):
+    """The splitmix64 finalizer, applied elementwise to a uint64 array."""
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return h ^ (h >> np.uint64(31))
+
+
+_HASH_BLOCK = 2 ** 16  # bytes hashed at once, bounds the temporary arrays of `hash_words`
+with np.errstate(over='ignore'):
+    # the powers B**0 .. B**_HASH_BLOCK and B**0 .. B**-_HASH_BLOCK of the hash multiplier B, modulo 2**64
+    _POWERS = np.concatenate([[np.uint64(1)], np.cumprod(np.full(_HASH_BLOCK, _HASH_BASE, dtype=np.uint64))])
+    _INVERSE_POWERS = np.concatenate(
+        [[np.uint64(1)], np.cumprod(np.full(_HASH_BLOCK, _HASH_BASE_INV, dtype=np.uint64))]
+    )
+
+BATCH_WORDS = 2 ** 16  # words added to or looked up in a sketch at once, during a vocabulary scan
+
+
+def hash_words(words, seed=0):
+    """Get deterministic 64-bit hashes of words.
+
+    Unlike the builtin `hash`, the hashes do not change between processes, so sketches filled in different processes
+    can be merged. The utf8 bytes of all words are hashed at once, with numpy.
+
+    Parameters
+    ----------
+    words : list of str
+        The words.
+    seed : int, optional
+        Seed that selects the hash function.
+
+    Returns
+    -------
+    numpy.ndarray
+        The hashes, as an array of uint64 of the same length as `words`.
+
+    """
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    try:
+        # join all words with a NUL separator, and find the word boundaries from the separators
+        if isinstance(words[0], bytes):
+            data = np.frombuffer(b'\0'.join(words), dtype=np.uint8)
+        else:
+            data = np.frombuffer(u'\0'.join(words).encode('utf8'), dtype=np.uint8)
+        separators = np.flatnonzero(data == 0)
+        if len(separators) != len(words) - 1:
+            raise ValueError("words contain the separator")
+    except (TypeError, ValueError):
+        # mixed str and bytes, or words containing NUL: fall back to encoding each word separately
+        encoded = [utils.to_utf8(word) for word in words]
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        ends = np.cumsum([len(word) for word in encoded], dtype=np.int64)
+        starts = ends - [len(word) for word in encoded]
+    else:
+        starts = np.empty(len(words), dtype=np.int64)
+        starts[0] = 0
+        starts[1:] = separators + 1
+        ends = np.empty(len(words), dtype=np.int64)
+        ends[:-1] = separators
+        ends[-1] = len(data)
+
+    # the polynomial hash of data[start:end] is sum(data[j] * B**(end - j)) over j in [start, end), mod 2**64.
+    # Within a block of bytes starting at `offset`, the hash of the part [a, b) of a word is B**b * (prefix[b] -
+    # prefix[a]), with prefix[k] = sum(data[offset + j] * B**-j) over j < k, and the hash of a word spanning several
+    # blocks is carried over as hash * B**(b - a) + the hash of its next part.
+    hashes = np.zeros(len(words), dtype=np.uint64)
+    prefix = np.zeros(_HASH_BLOCK + 1, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for offset in range(0, len(data), _HASH_BLOCK):
+            block = data[offset:offset + _HASH_BLOCK]
+            np.cumsum(block * _INVERSE_POWERS[:len(block)], out=prefix[1:len(block) + 1])
+            # the words that overlap the block, empty words excepted
+            lo = np.searchsorted(ends, offset, side='right')
+            hi = np.searchsorted(starts, offset + len(block), side='left')
+            a = np.maximum(starts[lo:hi] - offset, 0)
+            b = np.minimum(ends[lo:hi] - offset, len(block))
+            hashes[lo:hi] = hashes[lo:hi] * _POWERS[b - a] + _POWERS[b] * (prefix[b] - prefix[a])
+        hashes ^= (ends - starts).astype(np.uint64) * np.uint64(0x9e3779b97f4a7c15)
+        hashes ^= np.uint64(seed & _MASK)
+        return _mix(hashes)
+
+
+class CountMinSketch(utils.SaveLoad):
+    """Count-min sketch of word frequencies.
+
+    Attributes
+    ----------
+    table : numpy.ndarray
+        The counters, an int64 array of shape (`depth`, `width`).
+    total : int
+        Total count of all words added to the sketch.
+
+    """
+    def __init__(self, width=2 ** 20, depth=4, seed=1):
+        """
+
+        Parameters
+        ----------
+        width : int, optional
+            Number of counters per row. The estimated counts exceed the true counts by at most
+            `e * total / width`, with high probability.
+        depth : int, optional
+            Number of rows. The error bound holds for each word with probability at least `1 - exp(-depth)`.
+        seed : int, optional
+            Seed for the hash functions of the rows. Only sketches with the same seed can be merged.
+
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive, got width=%s, depth=%s" % (width, depth))
+        self.width = int(width)
+        self.depth = int(depth)
+        self.seed = seed
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon, delta=0.01, seed=1):
+        """Create a sketch that is just large enough for the given error guarantee.
+
+        Parameters
+        ----------
+        epsilon : float
+            Estimated counts exceed the true counts by at most `epsilon * total`...
+        delta : float, optional
+            ...with probability at least `1 - delta`, for each word.
+        seed : int, optional
+            Seed for the hash functions of the rows.
+
+        Returns
+        -------
+        :class:`~gensim.models.vocab_sketch.CountMinSketch`
+            The empty sketch.
+
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be in (0, 1), got epsilon=%s, delta=%s" % (epsilon, delta))
+        return cls(width=int(math.ceil(math.e / epsilon)), depth=int(math.ceil(math.log(1.0 / delta))), seed=seed)
+
+    def __str__(self):
+        return "%s<width=%i, depth=%i, total=%i>" % (self.__class__.__name__, self.width, self.depth, self.total)
+
+    @property
+    def error_bound(self):
+        """float: Bound on the overestimate of any single count, `e * total / width`."""
+        return math.e * self.total / self.width
+
+    @property
+    def confidence(self):
+        """float: Probability that the estimate of a single count is within `error_bound`, `1 - exp(-depth)`."""
+        return 1.0 - math.exp(-self.depth)
+
+    def _counter_indices(self, words):
+        """Get the positions of the counters of `words` in the flattened table, an array of shape (depth, len(words)).
+
+        The column of a word in row `i` is `h1 + i * h2` (modulo `width`), for two halves `h1` and `h2` of its hash.
+
+        """
+        hashes = hash_words(words, seed=self.seed)
+        h1 = hashes & np.uint64(0xffffffff)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, np.newaxis]
+        columns = (h1 + rows * h2) % np.uint64(self.width)
+        return columns.astype(np.int64) + rows.astype(np.int64) * self.width
+
+    def update(self, words, counts=None):
+        """Add words to the sketch.
+
+        Parameters
+        ----------
+        words : list of str
+            The words; repeated words are counted once per occurrence.
+        counts : list of int, optional
+            Count of each word in `words`, if not 1 (such as the counts of a dictionary of word frequencies).
+
+        """
+        words = list(words)
+        if not words:
+            return
+        indices = self._counter_indices(words).ravel()
+        if counts is None:
+            weights = None
+            self.total += len(words)
+        else:
+            counts = np.asarray(counts, dtype=np.int64)
+            weights = np.tile(counts, self.depth)
+            self.total += int(counts.sum())
+        table = self.table.reshape(-1)
+        if len(indices) < table.size:
+            # sum the increments of repeated counters first: a fancy-indexed `+=` would count them only once
+            indices, positions = np.unique(indices, return_inverse=True)
+            table[indices] += np.rint(np.bincount(positions, weights=weights)).astype(np.int64)
+        else:
+            # one pass over the whole table is faster than sorting, for batches larger than the table
+            table += np.rint(np.bincount(indices, weights=weights, minlength=table.size)).astype(np.int64)
+
+    def estimate(self, words):
+        """Get the estimated counts of words.
+
+        Parameters
+        ----------
+        words : list of str
+            The words.
+
+        Returns
+        -------
+        numpy.ndarray
+            The estimated counts, never lower than the true counts.
+
+        """
+        words = list(words)
+        if not words:
+            return np.zeros(0, dtype=np.int64)
+        return self.table.reshape(-1)[self._counter_indices(words)].min(axis=0)
+
+    def __getitem__(self, word):
+        """Get the estimated count of a single word."""
+        return int(self.estimate([word])[0])
+
+    def merge(self, other):
+        """Add the counts of another sketch to this one, in place.
+
+        Parameters
+        ----------
+        other : :class:`~gensim.models.vocab_sketch.CountMinSketch`
+            A sketch of the same width, depth and seed.
+
+        Returns
+        -------
+        :class:`~gensim.models.vocab_sketch.CountMinSketch`
+            This sketch.
+
+        """
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("cannot merge %s with %s: width, depth or seed differ" % (self, other))
+        self.table += other.table
+        self.total += other.total
+        return self
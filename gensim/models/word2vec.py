@@ -122,16 +122,19 @@ import logging
 import sys
 import os
 import heapq
+import struct
+import zlib
 from timeit import default_timer
 from copy import deepcopy
-from collections import defaultdict
+from collections import defaultdict, Counter
 import threading
 import itertools
 import warnings
 
 from gensim.utils import keep_vocab_item, call_on_class_only
 from gensim.models.keyedvectors import Vocab, Word2VecKeyedVectors
-from gensim.models.base_any2vec import BaseWordEmbeddingsModel
+from gensim.models.base_any2vec import BaseWordEmbeddingsModel, _fork_context
+from gensim.models.vocab_sketch import BATCH_WORDS, CountMinSketch
 
 try:
     from queue import Queue, Empty
@@ -142,6 +145,7 @@ from numpy import exp, dot, zeros, random, dtype, float32 as REAL,\
     uint32, seterr, array, uint8, vstack, fromstring, sqrt,\
     empty, sum as np_sum, ones, logaddexp, log, outer
 
+import numpy as np
 from scipy.special import expit
 
 from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
@@ -200,6 +204,13 @@ except ImportError:
 
                 # now go over all words from the (reduced) window, predicting each one in turn
                 start = max(0, pos - model.window + reduced_window)
+                if model.shared_negatives:
+                    window = enumerate(word_vocabs[start:(pos + model.window + 1 - reduced_window)], start)
+                    train_sg_window(
+                        model, model.wv.index2word[word.index], [word2.index for pos2, word2 in window if pos2 != pos],
+                        alpha, compute_loss=compute_loss
+                    )
+                    continue
                 for pos2, word2 in enumerate(word_vocabs[start:(pos + model.window + 1 - reduced_window)], start):
                     # don't train on the `word` itself
                     if pos2 != pos:
@@ -468,6 +479,62 @@ def train_sg_pair(model, word, context_index, alpha, learn_vectors=True, learn_h
     return neu1e
 
 
+def train_sg_window(model, word, context_indices, alpha, compute_loss=False):
+    """Train the passed model instance on a word and all its context words at once, using Skip-gram with negative
+    sampling, with one set of negative words shared by the whole window.
+
+    This is the pure Python version of :func:`~gensim.models.word2vec_inner.w2v_fast_window_sg_neg`,
+    used when `model.shared_negatives` is set.
+
+    Parameters
+    ----------
+    model : :class:`~gensim.models.word2vec.Word2Vec`
+        The model to be trained.
+    word : str
+        The label (predicted) word.
+    context_indices : list of int
+        The vocabulary indices of the context words.
+    alpha : float
+        Learning rate.
+    compute_loss : bool, optional
+        Whether or not the loss should be computed.
+
+    Returns
+    -------
+    numpy.ndarray
+        Error vectors of the context words, back-propagated. Empty if `word` is not in the vocabulary or there
+        are no context words.
+
+    """
+    if word not in model.wv.vocab or not context_indices:
+        return zeros((0, model.wv.vector_size), dtype=REAL)
+    predict_word = model.wv.vocab[word]  # target word (NN output)
+
+    # use this word (label = 1) + `negative` other random words not from this sentence (label = 0)
+    cum_table = model.vocabulary.cum_table
+    word_indices = [predict_word.index]
+    while len(word_indices) < model.negative + 1:
+        w = cum_table.searchsorted(model.random.randint(cum_table[-1]))
+        if w != predict_word.index:
+            word_indices.append(w)
+
+    l1 = model.wv.vectors[context_indices]  # 2d matrix, contexts x layer1_size
+    l2b = model.trainables.syn1neg[word_indices]  # 2d matrix, k+1 x layer1_size
+    prod_term = dot(l1, l2b.T)
+    fb = expit(prod_term)  # propagate hidden -> output
+    gb = (model.neg_labels - fb) * alpha  # matrix of error gradients multiplied by the learning rate
+    # the negative words and the context words may repeat: `np.add.at` applies every update of a repeated row,
+    # where a fancy-indexed `+=` would keep only the last one
+    np.add.at(model.trainables.syn1neg, word_indices, dot(gb.T, l1))  # learn hidden -> output
+    neu1e = dot(gb, l2b)
+    np.add.at(model.wv.vectors, context_indices, neu1e * model.trainables.vectors_lockf[context_indices, None])
+
+    if compute_loss:
+        model.running_training_loss -= np_sum(log(expit(-1 * prod_term[:, 1:])))  # for the sampled words
+        model.running_training_loss -= np_sum(log(expit(prod_term[:, 0])))  # for the output word
+    return neu1e
+
+
 def train_cbow_pair(model, word, input_word_indices, l1, alpha, learn_vectors=True, learn_hidden=True,
                     compute_loss=False, context_vectors=None, context_locks=None, is_ft=False):
     """Train the passed model instance on a word and its context, using the CBOW algorithm.
@@ -658,7 +725,7 @@ class Word2Vec(BaseWordEmbeddingsModel):
                  max_vocab_size=None, sample=1e-3, seed=1, workers=3, min_alpha=0.0001,
                  sg=0, hs=0, negative=5, ns_exponent=0.75, cbow_mean=1, hashfxn=hash, iter=5, null_word=0,
                  trim_rule=None, sorted_vocab=1, batch_words=MAX_WORDS_IN_BATCH, compute_loss=False, callbacks=(),
-                 max_final_vocab=None):
+                 max_final_vocab=None, shared_negatives=False):
         """
 
         Parameters
@@ -751,6 +818,11 @@ class Word2Vec(BaseWordEmbeddingsModel):
             :meth:`~gensim.models.word2vec.Word2Vec.get_latest_training_loss`.
         callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             Sequence of callbacks to be executed at specific stages during training.
+        shared_negatives : bool, optional
+            If True, train each word against all the context words of its window at once, with one set of `negative`
+            noise words shared by the window, as matrix-matrix products (level-3 BLAS) rather than pair by pair.
+            This is much faster per word, especially for large windows and many `workers`, for comparable quality.
+            Only for skip-gram with negative sampling (`sg=1`, `hs=0`, `negative` > 0).
 
         Examples
         --------
@@ -763,6 +835,9 @@ class Word2Vec(BaseWordEmbeddingsModel):
             >>> model = Word2Vec(sentences, min_count=1)
 
         """
+        if shared_negatives and not (sg and negative and not hs):
+            raise ValueError("shared_negatives requires skip-gram with negative sampling: sg=1, hs=0, negative > 0")
+        self.shared_negatives = bool(shared_negatives)
         self.max_final_vocab = max_final_vocab
 
         self.callbacks = callbacks
@@ -819,6 +894,34 @@ class Word2Vec(BaseWordEmbeddingsModel):
             tally += train_batch_cbow(self, sentences, alpha, work, neu1, self.compute_loss)
         return tally, self._raw_word_count(sentences)
 
+    def _get_thread_working_mem(self):
+        """Computes the memory used per worker thread.
+
+        With `shared_negatives`, the work memory holds the sampled words and the matrices of a whole window,
+        see :func:`~gensim.models.word2vec_inner.w2v_fast_window_sg_neg`.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray)
+            Each worker threads private work memory.
+
+        """
+        work, neu1 = super(Word2Vec, self)._get_thread_working_mem()
+        if self.shared_negatives:
+            contexts, targets = 2 * self.window, self.negative + 1
+            work = matutils.zeros_aligned(
+                targets + (2 * contexts + 2 * targets) * self.trainables.layer1_size + contexts * targets, dtype=REAL)
+        return work, neu1
+
+    def _shared_memory_arrays(self):
+        """Get the arrays read and updated by training, as a list of (object, attribute name) pairs."""
+        arrays = [(self.wv, 'vectors'), (self.trainables, 'vectors_lockf')]
+        if self.hs:
+            arrays.append((self.trainables, 'syn1'))
+        if self.negative:
+            arrays.append((self.trainables, 'syn1neg'))
+        return arrays
+
     def _clear_post_train(self):
         """Remove all L2-normalized word vectors from the model."""
         self.wv.vectors_norm = None
@@ -830,7 +933,7 @@ class Word2Vec(BaseWordEmbeddingsModel):
 
     def train(self, sentences=None, corpus_file=None, total_examples=None, total_words=None,
               epochs=None, start_alpha=None, end_alpha=None, word_count=0,
-              queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=()):
+              queue_factor=2, report_delay=1.0, compute_loss=False, callbacks=(), processes=False):
         """Update the model's neural weights from a sequence of sentences.
 
         Notes
@@ -858,6 +961,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
             <https://rare-technologies.com/data-streaming-in-python-generators-iterators-iterables/>`_.
         corpus_file : str, optional
             Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format.
+            Can also be the path of an :class:`~gensim.models.word2vec.IndexedCorpusFile` built from it,
+            which skips tokenization and vocabulary lookups in every epoch.
             You may use this argument instead of `sentences` to get performance boost. Only one of `sentences` or
             `corpus_file` arguments need to be passed (not both of them).
         total_examples : int
@@ -888,6 +993,14 @@ class Word2Vec(BaseWordEmbeddingsModel):
             :meth:`~gensim.models.word2vec.Word2Vec.get_latest_training_loss`.
         callbacks : iterable of :class:`~gensim.models.callbacks.CallbackAny2Vec`, optional
             Sequence of callbacks to be executed at specific stages during training.
+        processes : bool, optional
+            If True, train with `workers` forked processes instead of threads. The word vectors and the hidden
+            layer weights are moved to shared memory (where they stay after training), and every process updates
+            them without locking, exactly like the threads do ("Hogwild"). The processes don't compete for the GIL
+            and don't wait for a single job producer thread, so training scales to more cores. Each process trains
+            on its own part of `corpus_file`, or on every `workers`-th sentence of `sentences`, which it iterates over
+            on its own: for large corpora, prefer `corpus_file`. Epoch callbacks run in the main process, batch
+            callbacks are not called. Not available on Windows.
 
         Examples
         --------
@@ -905,7 +1018,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
         return super(Word2Vec, self).train(
             sentences=sentences, corpus_file=corpus_file, total_examples=total_examples, total_words=total_words,
             epochs=epochs, start_alpha=start_alpha, end_alpha=end_alpha, word_count=word_count,
-            queue_factor=queue_factor, report_delay=report_delay, compute_loss=compute_loss, callbacks=callbacks)
+            queue_factor=queue_factor, report_delay=report_delay, compute_loss=compute_loss, callbacks=callbacks,
+            processes=processes)
 
     def score(self, sentences, total_sentences=int(1e6), chunksize=100, queue_factor=2, report_delay=1):
         """Score the log probability for a sequence of sentences.
@@ -1331,6 +1445,8 @@ class Word2Vec(BaseWordEmbeddingsModel):
             if not hasattr(model, 'max_final_vocab'):
                 model.max_final_vocab = None
                 model.vocabulary.max_final_vocab = None
+            if not hasattr(model, 'shared_negatives'):
+                model.shared_negatives = False
 
             return model
         except AttributeError:
@@ -1464,8 +1580,8 @@ class PathLineSentences(object):
         """
         Parameters
         ----------
-        source : str
-            Path to the directory.
+        source : {str, list of str}
+            Path to the directory, or list of paths to the files (processed in the given order).
         limit : int or None
             Read only the first `limit` lines from each file. Read all if limit is None (the default).
 
@@ -1474,7 +1590,9 @@ class PathLineSentences(object):
         self.max_sentence_length = max_sentence_length
         self.limit = limit
 
-        if os.path.isfile(self.source):
+        if isinstance(self.source, (list, tuple)):
+            self.input_files = list(self.source)
+        elif os.path.isfile(self.source):
             logger.debug('single file given as source, rather than a directory of files')
             logger.debug('consider using models.word2vec.LineSentence for a single file')
             self.input_files = [self.source]  # force code compatibility with list of files
@@ -1500,6 +1618,212 @@ class PathLineSentences(object):
                         yield line[i:i + self.max_sentence_length]
                         i += self.max_sentence_length
 
+    @property
+    def shards(self):
+        """list of :class:`~gensim.models.word2vec.LineSentence`: The sentences of each file, so that
+        :meth:`~gensim.models.word2vec.Word2Vec.build_vocab` can scan the files in parallel."""
+        return [
+            LineSentence(file_name, max_sentence_length=self.max_sentence_length, limit=self.limit)
+            for file_name in self.input_files
+        ]
+
+
+class ShardedSentences(object):
+    """Iterate over the sentences of several corpora (shards), one shard after another.
+
+    Unlike a plain chain of the shards, the shards stay accessible, so that
+    :meth:`~gensim.models.word2vec.Word2Vec.build_vocab` can scan them in parallel, with `workers`.
+
+    Examples
+    --------
+
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import datapath, common_texts
+        >>> from gensim.models.word2vec import ShardedSentences, Word2Vec
+        >>>
+        >>> sentences = ShardedSentences([common_texts, datapath('lee_background.cor')])
+        >>> model = Word2Vec(min_count=1)
+        >>> model.build_vocab(sentences, workers=2)
+
+    """
+    def __init__(self, shards):
+        """
+
+        Parameters
+        ----------
+        shards : list of {iterable of list of str, str}
+            The shards: restartable iterables of sentences, or paths to files in
+            :class:`~gensim.models.word2vec.LineSentence` format.
+
+        """
+        self.shards = [LineSentence(shard) if isinstance(shard, string_types) else shard for shard in shards]
+
+    def __iter__(self):
+        """Iterate through the sentences of all shards."""
+        for shard in self.shards:
+            for sentence in shard:
+                yield sentence
+
+
+class IndexedCorpusFile(object):
+    """Corpus pre-indexed against a fixed vocabulary: the token ids of all sentences, memory-mapped from a binary file.
+
+    Training with `corpus_file` normally re-reads and re-tokenizes a :class:`~gensim.models.word2vec.LineSentence`
+    file and looks every token up in the vocabulary, in every epoch. Build an indexed corpus once, after the vocabulary
+    is final, and pass its path as `corpus_file` instead: training then reads the token ids directly, without any
+    string processing. Frequent-word subsampling is applied on the ids, as usual.
+
+    The file holds a header, the int32 token ids of all sentences one after another (-1 for words that are not in
+    the vocabulary, so that raw word counts and learning rate decay stay the same), and the int64 offsets of the
+    sentence boundaries. The header also records the size and a checksum of the vocabulary, so that the corpus can't
+    be used with a model whose vocabulary has changed since.
+
+    Examples
+    --------
+
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import datapath, get_tmpfile
+        >>> from gensim.models.word2vec import Word2Vec, IndexedCorpusFile
+        >>>
+        >>> corpus_file = datapath('lee_background.cor')
+        >>> model = Word2Vec(size=50, min_count=2)
+        >>> model.build_vocab(corpus_file=corpus_file)
+        >>>
+        >>> indexed = IndexedCorpusFile.build(corpus_file, model.wv, get_tmpfile('lee_background.ids'))
+        >>> model.train(corpus_file=indexed.fname, total_words=model.corpus_total_words, epochs=model.epochs)
+
+    """
+    MAGIC = b'GSMIDS01'
+    HEADER = struct.Struct('<8sqqqI28x')  # magic, sentences, words, vocabulary size, vocabulary checksum; 64 bytes
+
+    def __init__(self, fname):
+        """
+
+        Parameters
+        ----------
+        fname : str
+            Path to a file created by :meth:`~gensim.models.word2vec.IndexedCorpusFile.build`.
+
+        """
+        self.fname = fname
+        with open(fname, 'rb') as fin:
+            magic, num_sentences, num_words, self.vocab_size, self.vocab_checksum = self.HEADER.unpack(
+                fin.read(self.HEADER.size))
+        if magic != self.MAGIC:
+            raise ValueError("%s is not an indexed corpus file" % fname)
+        ids_end = self.HEADER.size + 4 * num_words
+        self.ids = np.memmap(fname, dtype=np.int32, mode='r', offset=self.HEADER.size, shape=(num_words, )) \
+            if num_words else np.zeros(0, dtype=np.int32)
+        self.offsets = np.memmap(
+            fname, dtype=np.int64, mode='r', offset=ids_end + (-ids_end % 8), shape=(num_sentences + 1, ))
+
+    @classmethod
+    def is_indexed(cls, fname):
+        """Check whether the file `fname` is an indexed corpus (rather than a text file)."""
+        try:
+            with open(fname, 'rb') as fin:
+                return fin.read(len(cls.MAGIC)) == cls.MAGIC
+        except (IOError, OSError, TypeError):
+            return False
+
+    @staticmethod
+    def vocab_checksum_of(wv):
+        """Get a checksum of the words of `wv` and their order, i.e. of the token ids they map to."""
+        checksum = 0
+        for start in xrange(0, len(wv.index2word), 100000):
+            words = wv.index2word[start:start + 100000]
+            checksum = zlib.crc32(b'\n'.join(utils.to_utf8(word) for word in words) + b'\n', checksum)
+        return checksum & 0xffffffff
+
+    @classmethod
+    def build(cls, corpus, wv, fname, chunksize=10000):
+        """Convert a corpus to token ids of the vocabulary `wv` and store them in `fname`.
+
+        Parameters
+        ----------
+        corpus : {str, iterable of list of str}
+            Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format (split on whitespace exactly
+            like `corpus_file` training does), or the sentences themselves.
+        wv : :class:`~gensim.models.keyedvectors.Word2VecKeyedVectors`
+            Final vocabulary of the model(s) to train, such as `model.wv`.
+        fname : str
+            Path to the output file.
+        chunksize : int, optional
+            Number of sentences converted at once.
+
+        Returns
+        -------
+        :class:`~gensim.models.word2vec.IndexedCorpusFile`
+            The indexed corpus.
+
+        """
+        if isinstance(corpus, string_types):
+            word2id = {utils.to_utf8(word): vocab.index for word, vocab in iteritems(wv.vocab)}
+            with utils.smart_open(corpus, 'rb') as fin:
+                return cls._write((line.split() for line in fin), word2id, wv, fname, chunksize)
+        word2id = {word: vocab.index for word, vocab in iteritems(wv.vocab)}
+        return cls._write(corpus, word2id, wv, fname, chunksize)
+
+    @classmethod
+    def _write(cls, sentences, word2id, wv, fname, chunksize):
+        lengths, num_words = [], 0
+        with open(fname, 'wb') as fout:
+            fout.write(b'\0' * cls.HEADER.size)
+            for chunk in utils.chunkize_serial(sentences, chunksize):
+                ids = [word2id.get(word, -1) for sentence in chunk for word in sentence]
+                fout.write(np.asarray(ids, dtype=np.int32).tobytes())
+                lengths.append(np.fromiter((len(sentence) for sentence in chunk), dtype=np.int64, count=len(chunk)))
+                num_words += len(ids)
+            lengths = np.concatenate(lengths) if lengths else np.zeros(0, dtype=np.int64)
+            ids_end = cls.HEADER.size + 4 * num_words
+            fout.write(b'\0' * (-ids_end % 8))  # align the offsets
+            fout.write(np.concatenate(([0], np.cumsum(lengths))).astype(np.int64).tobytes())
+            fout.seek(0)
+            fout.write(cls.HEADER.pack(cls.MAGIC, len(lengths), num_words, len(wv.vocab), cls.vocab_checksum_of(wv)))
+        logger.info("indexed %i sentences with %i words into %s", len(lengths), num_words, fname)
+        return cls(fname)
+
+    def check_vocab(self, wv):
+        """Make sure that the token ids of this corpus refer to the vocabulary `wv`.
+
+        Raises
+        ------
+        ValueError
+            If the vocabulary changed since this corpus was built.
+
+        """
+        if len(wv.vocab) != self.vocab_size or self.vocab_checksum_of(wv) != self.vocab_checksum:
+            raise ValueError(
+                "%s was indexed against a different vocabulary, rebuild it with IndexedCorpusFile.build()" % self.fname
+            )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def total_words(self):
+        """Number of words in the corpus, including words that are not in the vocabulary."""
+        return len(self.ids)
+
+    def __iter__(self):
+        """Iterate over the sentences, as arrays of token ids (-1 for words outside the vocabulary)."""
+        for start, end in zip(self.offsets[:-1], self.offsets[1:]):
+            yield self.ids[start:end]
+
+    def worker_offsets(self, workers):
+        """Split the corpus among `workers` workers with about the same number of words each.
+
+        Returns
+        -------
+        list of int
+            Number of the first sentence of every worker.
+
+        """
+        bounds = [self.total_words * thread_id // workers for thread_id in range(workers)]
+        return [int(offset) for offset in np.searchsorted(self.offsets[:-1], bounds, side='left')]
+
 
 def _scan_vocab_worker(stream, progress_queue, max_vocab_size=None, trim_rule=None):
     """Do an initial scan of all words appearing in stream.
@@ -1535,8 +1859,78 @@ def _scan_vocab_worker(stream, progress_queue, max_vocab_size=None, trim_rule=No
     return vocab
 
 
+def _chunk_sentences(sentences, chunksize):
+    """Concatenate consecutive sentences into chunks of at least `chunksize` words.
+
+    Yields
+    ------
+    (int, list of str)
+        Index of the last sentence in the chunk, and the words of the chunk.
+
+    """
+    chunk = []
+    sentence_no = last_sentence_no = -1
+    for sentence_no, sentence in enumerate(sentences):
+        chunk.extend(sentence)
+        if len(chunk) >= chunksize:
+            yield sentence_no, chunk
+            chunk, last_sentence_no = [], sentence_no
+    if sentence_no > last_sentence_no:
+        yield sentence_no, chunk  # possibly empty, trailing empty sentences still count
+
+
+def _init_shard_worker(shards, state):
+    """Keep the shards and the scan parameters of :func:`~gensim.models.word2vec._map_shards` in a worker process."""
+    global _shard_state
+    _shard_state = shards, state
+
+
+def _map_shards(function, shards, workers, state):
+    """Apply `function` to the indexes of all `shards`, in a pool of `workers` forked processes.
+
+    The workers inherit `shards` and `state` rather than unpickling them, so neither the shards (such as generators)
+    nor the scan parameters (such as a `trim_rule` lambda) have to be picklable.
+
+    Yields
+    ------
+    object
+        The result of `function` for each shard, in the order of the shards.
+
+    """
+    pool = _fork_context().Pool(min(workers, len(shards)), _init_shard_worker, (shards, state))
+    try:
+        for result in pool.imap(function, range(len(shards))):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _scan_shard(shard_no):
+    """Count the words of a shard, in a worker process."""
+    shards, (vocabulary, progress_per, trim_rule, sketch) = _shard_state
+    total_words, corpus_count = vocabulary._scan_vocab(shards[shard_no], progress_per, trim_rule)
+    return vocabulary.raw_vocab, total_words, corpus_count
+
+
+def _sketch_shard(shard_no):
+    """Sketch the words of a shard in a new sketch shaped like the scan's sketch, in a worker process."""
+    shards, (vocabulary, progress_per, trim_rule, sketch) = _shard_state
+    shard_sketch = CountMinSketch(width=sketch.width, depth=sketch.depth, seed=sketch.seed)
+    total_words, corpus_count = vocabulary._sketch_words(shards[shard_no], progress_per, shard_sketch)
+    return shard_sketch, total_words, corpus_count
+
+
+def _recount_shard(shard_no):
+    """Count the candidate words of a shard exactly, in a worker process."""
+    shards, (vocabulary, progress_per, trim_rule, sketch) = _shard_state
+    return vocabulary._recount_candidates(shards[shard_no], trim_rule, sketch)
+
+
 class Word2VecVocab(utils.SaveLoad):
     """Vocabulary used by :class:`~gensim.models.word2vec.Word2Vec`."""
+    sketch_min_count = None  # `min_count` of the last scan with a sketch, which counted no rarer words
+
     def __init__(
             self, max_vocab_size=None, min_count=5, sample=1e-3, sorted_vocab=True, null_word=0,
             max_final_vocab=None, ns_exponent=0.75):
@@ -1582,12 +1976,121 @@ class Word2VecVocab(utils.SaveLoad):
         self.raw_vocab = vocab
         return total_words, corpus_count
 
-    def scan_vocab(self, sentences=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None):
+    def _sketch_words(self, sentences, progress_per, sketch):
+        """Add all words to `sketch`, the first pass of a scan with a sketch."""
+        sentence_no = -1
+        total_words = 0
+        next_report = 0
+        for sentence_no, chunk in _chunk_sentences(sentences, BATCH_WORDS):
+            if sentence_no >= next_report:
+                logger.info("PROGRESS: at sentence #%i, sketched %i words", sentence_no, total_words)
+                next_report = sentence_no + progress_per
+            sketch.update(chunk)
+            total_words += len(chunk)
+        return total_words, sentence_no + 1
+
+    def _recount_candidates(self, sentences, trim_rule, sketch):
+        """Count exactly the words whose estimated count in `sketch` is kept, the second pass of a scan with a sketch.
+
+        No word is missed here: estimated counts are never lower than the true counts.
+
+        """
+        vocab = Counter()
+        min_reduce = 1
+        for sentence_no, chunk in _chunk_sentences(sentences, BATCH_WORDS):
+            estimates = sketch.estimate(chunk).tolist()
+            if trim_rule is None:
+                keep = [count >= self.min_count for count in estimates]
+            else:
+                keep = [
+                    keep_vocab_item(word, count, self.min_count, trim_rule=trim_rule)
+                    for word, count in zip(chunk, estimates)
+                ]
+            vocab.update(itertools.compress(chunk, keep))
+            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
+                utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+                min_reduce += 1
+        return vocab
+
+    @staticmethod
+    def _log_sketch(sketch, total_words):
+        logger.info(
+            "sketched %i words in %ix%i counters: estimated counts exceed true counts by at most %.1f, "
+            "each with probability %.3f", total_words, sketch.depth, sketch.width, sketch.error_bound, sketch.confidence
+        )
+
+    def _scan_vocab_sketch(self, sentences, progress_per, trim_rule, sketch):
+        """Count words in two passes: estimate all counts with `sketch`, then count exactly the candidates only."""
+        if iter(sentences) is sentences:
+            raise TypeError(
+                "a scan with a sketch reads the corpus twice: pass a restartable iterable of sentences (such as a list "
+                "or LineSentence), not an iterator or a generator"
+            )
+        total_words, corpus_count = self._sketch_words(sentences, progress_per, sketch)
+        self._log_sketch(sketch, total_words)
+        self.raw_vocab = defaultdict(int, self._recount_candidates(sentences, trim_rule, sketch))
+        return total_words, corpus_count
+
+    def _scan_vocab_shards(self, shards, progress_per, trim_rule, workers, sketch=None):
+        """Scan `shards` in `workers` processes, and merge their counts in the order of the shards.
+
+        The merged vocabulary is the same as that of a scan of all shards in a single process, in the same order.
+
+        """
+        vocab = defaultdict(int)
+        total_words = corpus_count = 0
+        min_reduce = 1
+        state = (self, progress_per, trim_rule, sketch)
+        if sketch is None:
+            results = _map_shards(_scan_shard, shards, workers, state)
+        else:
+            for shard_sketch, shard_words, shard_sentences in _map_shards(_sketch_shard, shards, workers, state):
+                sketch.merge(shard_sketch)
+                total_words += shard_words
+                corpus_count += shard_sentences
+            self._log_sketch(sketch, total_words)
+            # the new workers inherit the merged sketch
+            results = ((shard_vocab, 0, 0) for shard_vocab in _map_shards(_recount_shard, shards, workers, state))
+
+        for shard_no, (shard_vocab, shard_words, shard_sentences) in enumerate(results):
+            utils.merge_counts(vocab, shard_vocab)
+            total_words += shard_words
+            corpus_count += shard_sentences
+            logger.info(
+                "PROGRESS: merged shard #%i of %i, processed %i words, keeping %i word types",
+                shard_no, len(shards), total_words, len(vocab)
+            )
+            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
+                utils.prune_vocab(vocab, min_reduce, trim_rule=trim_rule)
+                min_reduce += 1
+
+        self.raw_vocab = vocab
+        return total_words, corpus_count
+
+    def scan_vocab(self, sentences=None, corpus_file=None, progress_per=10000, workers=None, trim_rule=None,
+                   sketch=None):
         logger.info("collecting all words and their counts")
         if corpus_file:
             sentences = LineSentence(corpus_file)
 
-        total_words, corpus_count = self._scan_vocab(sentences, progress_per, trim_rule)
+        shards = None
+        if workers and workers > 1:
+            shards = getattr(sentences, 'shards', None)
+            if shards is None:
+                logger.warning(
+                    "cannot scan %s in parallel, only sharded corpora such as PathLineSentences or ShardedSentences",
+                    type(sentences).__name__
+                )
+            elif os.name == 'nt':
+                logger.warning("cannot scan in parallel on Windows, where worker processes cannot be forked")
+                shards = None
+        if shards:
+            total_words, corpus_count = self._scan_vocab_shards(shards, progress_per, trim_rule, workers, sketch)
+        elif sketch is not None:
+            total_words, corpus_count = self._scan_vocab_sketch(sentences, progress_per, trim_rule, sketch)
+        else:
+            total_words, corpus_count = self._scan_vocab(sentences, progress_per, trim_rule)
+        self.sketch_min_count = None if sketch is None else self.min_count
 
         logger.info(
             "collected %i word types from a corpus of %i raw words and %i sentences",
@@ -1618,8 +2121,17 @@ class Word2VecVocab(utils.SaveLoad):
         Delete the raw vocabulary after the scaling is done to free up RAM,
         unless `keep_raw_vocab` is set.
 
+        After a scan with a sketch, the raw vocabulary only holds the words that may reach the `min_count` of the
+        scan, so a lower `min_count` raises a ValueError, even with `dry_run`. The counts of dropped words then only
+        cover these candidates.
+
         """
         min_count = min_count or self.min_count
+        if self.sketch_min_count is not None and min_count < self.sketch_min_count:
+            raise ValueError(
+                "the vocabulary was scanned with a sketch for min_count=%i, which did not count rarer words: cannot "
+                "apply min_count=%i, scan the corpus again with a lower min_count" % (self.sketch_min_count, min_count)
+            )
         sample = sample or self.sample
         drop_total = drop_unique = 0
 
@@ -1068,6 +1068,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 /*--- Type declarations ---*/
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence;
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab;
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__;
 
 /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":769
@@ -1149,7 +1150,7 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
- * 
+ * ctypedef void (*sgemm_ptr) (
  */
 typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *, float const *, int const *);
 
@@ -1157,12 +1158,21 @@ typedef double (*__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr)(int const *
  * ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
  * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil             # <<<<<<<<<<<<<<
- * 
- * cdef scopy_ptr scopy
+ * ctypedef void (*sgemm_ptr) (
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *, float const *, float const *, int const *);
 
-/* "gensim/models/word2vec_inner.pxd":44
+/* "gensim/models/word2vec_inner.pxd":28
+ * ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
+ * ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
+ * ctypedef void (*sgemm_ptr) (             # <<<<<<<<<<<<<<
+ *     const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
+ *     const float *A, const int *ldA, const float *B, const int *ldB, const float *beta, float *C, const int *ldC) nogil
+ */
+typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr)(char const *, char const *, int const *, int const *, int const *, float const *, float const *, int const *, float const *, int const *, float const *, float *, int const *);
+
+/* "gensim/models/word2vec_inner.pxd":48
  * 
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1171,7 +1181,7 @@ typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr)(int const *,
  */
 typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr)(int const *, float const *, int const *, float const *, int const *);
 
-/* "gensim/models/word2vec_inner.pxd":45
+/* "gensim/models/word2vec_inner.pxd":49
  * # function implementations swapped based on BLAS detected in word2vec_inner.pyx init()
  * ctypedef REAL_t (*our_dot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
  * ctypedef void (*our_saxpy_ptr) (const int *N, const float *alpha, const float *X, const int *incX, float *Y, const int *incY) nogil             # <<<<<<<<<<<<<<
@@ -1180,11 +1190,11 @@ typedef __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_t_6gensim_6model
  */
 typedef void (*__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr)(int const *, float const *, float const *, int const *, float *, int const *);
 
-/* "gensim/models/word2vec_inner.pxd":51
+/* "gensim/models/word2vec_inner.pxd":55
  * 
  * 
  * cdef struct Word2VecConfig:             # <<<<<<<<<<<<<<
- *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers
+ *     int hs, negative, sample, compute_loss, size, window, cbow_mean, workers, shared_negatives
  *     REAL_t running_training_loss, alpha
  */
 struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
@@ -1196,6 +1206,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   int window;
   int cbow_mean;
   int workers;
+  int shared_negatives;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t running_training_loss;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t alpha;
   __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *syn0;
@@ -1215,7 +1226,7 @@ struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig {
   unsigned PY_LONG_LONG next_random;
 };
 
-/* "gensim/models/word2vec_inner.pxd":125
+/* "gensim/models/word2vec_inner.pxd":137
  * 
  * 
  * cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1=*)             # <<<<<<<<<<<<<<
@@ -1276,17 +1287,41 @@ struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence {
  * 
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
  *     cdef cvocab_t vocab
- *     cdef subword_arrays
+ *     cdef vector[VocabItem] items
  */
 struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   PyObject_HEAD
   struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtab;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t vocab;
+  std::vector<struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem>  items;
   PyObject *subword_arrays;
 };
 
 
-/* "gensim/models/word2vec_corpusfile.pyx":122
+/* "gensim/models/word2vec_corpusfile.pxd":69
+ * 
+ * 
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     cdef public object corpus
+ *     cdef np.int32_t *ids
+ */
+struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtab;
+  PyObject *corpus;
+  __pyx_t_5numpy_int32_t *ids;
+  __pyx_t_5numpy_int64_t *offsets;
+  PY_LONG_LONG num_sentences;
+  PY_LONG_LONG start;
+  PY_LONG_LONG sentence;
+  PY_LONG_LONG position;
+  size_t max_sentence_length;
+  std::vector<__pyx_t_5numpy_int32_t *>  batch_words;
+  std::vector<int>  batch_lengths;
+};
+
+
+/* "gensim/models/word2vec_corpusfile.pyx":128
  *         self._thisptr.Reset()
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -1303,7 +1338,7 @@ struct __pyx_obj_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____ite
 
 
 
-/* "gensim/models/word2vec_corpusfile.pyx":77
+/* "gensim/models/word2vec_corpusfile.pyx":83
  * 
  * @cython.final
  * cdef class CythonLineSentence:             # <<<<<<<<<<<<<<
@@ -1328,7 +1363,7 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_r
 static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *, int __pyx_skip_dispatch);
 
 
-/* "gensim/models/word2vec_corpusfile.pyx":40
+/* "gensim/models/word2vec_corpusfile.pyx":41
  * 
  * @cython.final
  * cdef class CythonVocab:             # <<<<<<<<<<<<<<
@@ -1338,9 +1373,32 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
 
 struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab {
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *(*get_vocab_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *(*get_items_ptr)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
 };
 static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab;
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
+static struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *);
+
+
+/* "gensim/models/word2vec_corpusfile.pyx":189
+ * 
+ * @cython.final
+ * cdef class CythonIdCorpus:             # <<<<<<<<<<<<<<
+ *     """Reader of a :class:`~gensim.models.word2vec.IndexedCorpusFile`, without the GIL.
+ * 
+ */
+
+struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus {
+  bool (*is_eof)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  void (*reset)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*next_batch)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+  int (*read_document)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *, __pyx_t_5numpy_int32_t **);
+};
+static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *);
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_read_document(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *, __pyx_t_5numpy_int32_t **);
 
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
@@ -1663,9 +1721,6 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
 /* None.proto */
 #include <new>
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_uint32(npy_uint32 value);
-
 /* CppExceptionConversion.proto */
 #ifndef __Pyx_CppExn2PyErr
 #include <new>
@@ -1708,9 +1763,15 @@ static void __Pyx_CppExn2PyErr() {
 }
 #endif
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_npy_uint32(npy_uint32 value);
+
 /* None.proto */
 static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void); /* proto */
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
@@ -1954,12 +2015,17 @@ static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_self); /* proto*/
+static struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_self); /* proto*/
 static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static std::vector<std::string>  __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__read_chunked_sentence(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, std::vector<std::string>  __pyx_v_sent, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static void __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto*/
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto*/
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto*/
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_read_document(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, __pyx_t_5numpy_int32_t **__pyx_v_words); /* proto*/
 
 /* Module declarations from 'libc.string' */
 
@@ -2015,6 +2081,8 @@ static __pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr *__pyx_vp_6gensim_6mod
 #define __pyx_v_6gensim_6models_14word2vec_inner_snrm2 (*__pyx_vp_6gensim_6models_14word2vec_inner_snrm2)
 static __pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sscal = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_sscal (*__pyx_vp_6gensim_6models_14word2vec_inner_sscal)
+static __pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_sgemm = 0;
+#define __pyx_v_6gensim_6models_14word2vec_inner_sgemm (*__pyx_vp_6gensim_6models_14word2vec_inner_sgemm)
 static __pyx_t_6gensim_6models_14word2vec_inner_REAL_t (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)[0x3E8] = 0;
 #define __pyx_v_6gensim_6models_14word2vec_inner_EXP_TABLE (*__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE)
 static __pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr *__pyx_vp_6gensim_6models_14word2vec_inner_our_dot = 0;
@@ -2024,6 +2092,7 @@ static __pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr *__pyx_vp_6gensim_
 static unsigned PY_LONG_LONG (*__pyx_f_6gensim_6models_14word2vec_inner_random_int32)(unsigned PY_LONG_LONG *); /*proto*/
 static void (*__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_hs)(__pyx_t_5numpy_uint32_t const *, __pyx_t_5numpy_uint8_t const *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *); /*proto*/
 static unsigned PY_LONG_LONG (*__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_neg)(int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const , __pyx_t_5numpy_uint32_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *); /*proto*/
+static unsigned PY_LONG_LONG (*__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_window_sg_neg)(int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, int, int, int, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *); /*proto*/
 static void (*__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_hs)(__pyx_t_5numpy_uint32_t const *, __pyx_t_5numpy_uint8_t const *, int *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int, int, int, int, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *); /*proto*/
 static unsigned PY_LONG_LONG (*__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_neg)(int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, int *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int, int, int, int, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *); /*proto*/
 static PyObject *(*__pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config)(struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig *, PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_6gensim_6models_14word2vec_inner_init_w2v_config *__pyx_optional_args); /*proto*/
@@ -2031,11 +2100,13 @@ static PyObject *(*__pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config)(str
 /* Module declarations from 'gensim.models.word2vec_corpusfile' */
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = 0;
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = 0;
+static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = 0;
 static PyTypeObject *__pyx_ptype_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__ = 0;
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int); /*proto*/
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6models_19word2vec_corpusfile_get_next_alpha(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t, int, int, int, int, int, int); /*proto*/
 static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject *); /*proto*/
 static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(std::vector<std::vector<std::string> >  &, int, int, int, int *, int *, int *, unsigned PY_LONG_LONG *, __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *, int *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *); /*proto*/
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_id_batch(std::vector<__pyx_t_5numpy_int32_t *>  &, std::vector<int>  &, int, int, int, int *, int *, int *, unsigned PY_LONG_LONG *, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *, int *, __pyx_t_5numpy_uint32_t *, int *, __pyx_t_5numpy_uint8_t **, __pyx_t_5numpy_uint32_t **, __pyx_t_5numpy_uint32_t *); /*proto*/
 static std::string __pyx_convert_string_from_py_std__in_string(PyObject *); /*proto*/
 static std::vector<std::string>  __pyx_convert_vector_from_py_std_3a__3a_string(PyObject *); /*proto*/
 static CYTHON_INLINE PyObject *__pyx_convert_PyObject_string_to_py_std__in_string(std::string const &); /*proto*/
@@ -2062,6 +2133,7 @@ static const char __pyx_k_k[] = "k";
 static const char __pyx_k_hs[] = "hs";
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_wv[] = "wv";
+static const char __pyx_k_ids[] = "ids";
 static const char __pyx_k_six[] = "six";
 static const char __pyx_k_args[] = "args";
 static const char __pyx_k_code[] = "code";
@@ -2082,6 +2154,7 @@ static const char __pyx_k_point[] = "point";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_throw[] = "throw";
 static const char __pyx_k_vocab[] = "vocab";
+static const char __pyx_k_corpus[] = "corpus";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_epochs[] = "epochs";
 static const char __pyx_k_import[] = "__import__";
@@ -2090,6 +2163,8 @@ static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_source[] = "source";
 static const char __pyx_k_alpha_2[] = "_alpha";
 static const char __pyx_k_idx_end[] = "idx_end";
+static const char __pyx_k_indexed[] = "indexed";
+static const char __pyx_k_offsets[] = "offsets";
 static const char __pyx_k_any2utf8[] = "any2utf8";
 static const char __pyx_k_fasttext[] = "fasttext";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -2098,6 +2173,7 @@ static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_cur_epoch[] = "_cur_epoch";
 static const char __pyx_k_end_alpha[] = "end_alpha";
+static const char __pyx_k_id_stream[] = "id_stream";
 static const char __pyx_k_idx_start[] = "idx_start";
 static const char __pyx_k_iteritems[] = "iteritems";
 static const char __pyx_k_min_alpha[] = "min_alpha";
@@ -2118,6 +2194,8 @@ static const char __pyx_k_compute_loss[] = "compute_loss";
 static const char __pyx_k_cython_vocab[] = "_cython_vocab";
 static const char __pyx_k_gensim_utils[] = "gensim.utils";
 static const char __pyx_k_input_stream[] = "input_stream";
+static const char __pyx_k_string_types[] = "string_types";
+static const char __pyx_k_num_sentences[] = "num_sentences";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_expected_words[] = "_expected_words";
 static const char __pyx_k_train_epoch_sg[] = "train_epoch_sg";
@@ -2127,6 +2205,7 @@ static const char __pyx_k_total_sentences[] = "total_sentences";
 static const char __pyx_k_expected_words_2[] = "expected_words";
 static const char __pyx_k_train_epoch_cbow[] = "train_epoch_cbow";
 static const char __pyx_k_expected_examples[] = "_expected_examples";
+static const char __pyx_k_id_corpus_or_none[] = "id_corpus_or_none";
 static const char __pyx_k_CORPUSFILE_VERSION[] = "CORPUSFILE_VERSION";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_effective_sentences[] = "effective_sentences";
@@ -2138,6 +2217,7 @@ static const char __pyx_k_CythonLineSentence___iter[] = "CythonLineSentence.__it
 static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
 static const char __pyx_k_rebuild_cython_line_sentence[] = "rebuild_cython_line_sentence";
 static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_self_items_self_vocab_cannot_be[] = "self.items,self.vocab cannot be converted to a Python object for pickling";
 static const char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
 static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
@@ -2145,7 +2225,7 @@ static const char __pyx_k_Optimized_cython_functions_for_f[] = "Optimized cython
 static const char __pyx_k_gensim_models_word2vec_corpusfil[] = "gensim.models.word2vec_corpusfile";
 static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
-static const char __pyx_k_self_vocab_cannot_be_converted_t[] = "self.vocab cannot be converted to a Python object for pickling";
+static const char __pyx_k_self_batch_words_self_ids_self_o[] = "self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static const char __pyx_k_gensim_models_word2vec_corpusfil_2[] = "gensim/models/word2vec_corpusfile.pyx";
 static PyObject *__pyx_n_s_CORPUSFILE_VERSION;
@@ -2167,6 +2247,7 @@ static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_close;
 static PyObject *__pyx_n_s_code;
 static PyObject *__pyx_n_s_compute_loss;
+static PyObject *__pyx_n_s_corpus;
 static PyObject *__pyx_n_s_corpus_file;
 static PyObject *__pyx_n_s_cur_epoch;
 static PyObject *__pyx_n_s_cur_epoch_2;
@@ -2187,10 +2268,14 @@ static PyObject *__pyx_n_s_gensim_utils;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_hs;
 static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_id_corpus_or_none;
+static PyObject *__pyx_n_s_id_stream;
+static PyObject *__pyx_n_s_ids;
 static PyObject *__pyx_n_s_idx_end;
 static PyObject *__pyx_n_s_idx_start;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_index;
+static PyObject *__pyx_n_s_indexed;
 static PyObject *__pyx_n_s_input_stream;
 static PyObject *__pyx_n_s_iter;
 static PyObject *__pyx_n_s_iteritems;
@@ -2206,10 +2291,12 @@ static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_neu1;
 static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_num_epochs;
+static PyObject *__pyx_n_s_num_sentences;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
 static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
 static PyObject *__pyx_n_s_offset;
+static PyObject *__pyx_n_s_offsets;
 static PyObject *__pyx_n_s_point;
 static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_range;
@@ -2219,7 +2306,8 @@ static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
 static PyObject *__pyx_n_s_running_training_loss;
 static PyObject *__pyx_n_s_sample_int;
-static PyObject *__pyx_kp_s_self_vocab_cannot_be_converted_t;
+static PyObject *__pyx_kp_s_self_batch_words_self_ids_self_o;
+static PyObject *__pyx_kp_s_self_items_self_vocab_cannot_be;
 static PyObject *__pyx_n_s_send;
 static PyObject *__pyx_n_s_sent_idx;
 static PyObject *__pyx_n_s_sentences;
@@ -2228,6 +2316,7 @@ static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_six;
 static PyObject *__pyx_n_s_source;
 static PyObject *__pyx_n_s_start_alpha;
+static PyObject *__pyx_n_s_string_types;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_throw;
 static PyObject *__pyx_n_s_total_effective_words;
@@ -2264,12 +2353,30 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
 static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_18max_words_in_batch_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_6offset___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self); /* proto */
 static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_6offset_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, CYTHON_UNUSED PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss); /* proto */
-static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbow(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus___init__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_corpus, PyObject *__pyx_v_offset, PyObject *__pyx_v_max_sentence_length); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_4__del__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2id_corpus_or_none(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, CYTHON_UNUSED PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss); /* proto */
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_6train_epoch_cbow(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonLineSentence(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonVocab(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
@@ -2287,14 +2394,18 @@ static PyObject *__pyx_tuple__10;
 static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
 static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__14;
 static PyObject *__pyx_tuple__15;
 static PyObject *__pyx_tuple__17;
-static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
 static PyObject *__pyx_codeobj__16;
 static PyObject *__pyx_codeobj__18;
+static PyObject *__pyx_codeobj__20;
+static PyObject *__pyx_codeobj__22;
 /* Late includes */
 
-/* "gensim/models/word2vec_corpusfile.pyx":41
+/* "gensim/models/word2vec_corpusfile.pyx":42
  * @cython.final
  * cdef class CythonVocab:
  *     def __init__(self, wv, hs=0, fasttext=0):             # <<<<<<<<<<<<<<
@@ -2348,7 +2459,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_11CythonVocab_1__init_
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 41, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 42, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2367,7 +2478,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_11CythonVocab_1__init_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 41, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 42, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonVocab.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2388,11 +2499,11 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *(*__pyx_t_7)(PyObject *);
   PyObject *(*__pyx_t_8)(PyObject *);
   __pyx_t_5numpy_uint32_t __pyx_t_9;
@@ -2402,98 +2513,116 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
   std::string __pyx_t_13;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":44
+  /* "gensim/models/word2vec_corpusfile.pyx":45
  *         cdef VocabItem word
  * 
+ *         self.items.resize(len(wv.vocab))             # <<<<<<<<<<<<<<
+ *         for py_token, vocab_item in iteritems(wv.vocab):
+ *             token = any2utf8(py_token)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_vocab); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(1, 45, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  try {
+    __pyx_v_self->items.resize(__pyx_t_2);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(1, 45, __pyx_L1_error)
+  }
+
+  /* "gensim/models/word2vec_corpusfile.pyx":46
+ * 
+ *         self.items.resize(len(wv.vocab))
  *         for py_token, vocab_item in iteritems(wv.vocab):             # <<<<<<<<<<<<<<
  *             token = any2utf8(py_token)
  *             word.index = vocab_item.index
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_iteritems); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 44, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_vocab); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 44, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_iteritems); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_vocab); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 46, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
     }
   }
-  if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!__pyx_t_5) {
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else {
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else
     #endif
     {
-      __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_3);
-      __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
+      __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
-    __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_6 = 0;
+    __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
     __pyx_t_7 = NULL;
   } else {
-    __pyx_t_6 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 44, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 44, __pyx_L1_error)
+    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 46, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 46, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   for (;;) {
     if (likely(!__pyx_t_7)) {
-      if (likely(PyList_CheckExact(__pyx_t_2))) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_2)) break;
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(1, 44, __pyx_L1_error)
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 46, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       } else {
-        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_6); __Pyx_INCREF(__pyx_t_1); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(1, 44, __pyx_L1_error)
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 46, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 44, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       }
     } else {
-      __pyx_t_1 = __pyx_t_7(__pyx_t_2);
+      __pyx_t_1 = __pyx_t_7(__pyx_t_3);
       if (unlikely(!__pyx_t_1)) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(1, 44, __pyx_L1_error)
+          else __PYX_ERR(1, 46, __pyx_L1_error)
         }
         break;
       }
@@ -2505,182 +2634,182 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(1, 44, __pyx_L1_error)
+        __PYX_ERR(1, 46, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       if (likely(PyTuple_CheckExact(sequence))) {
-        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
-        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
       } else {
-        __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
-        __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_6 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
       }
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
       #else
-      __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_6 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 46, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
       #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_4 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 44, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_8 = Py_TYPE(__pyx_t_4)->tp_iternext;
-      index = 0; __pyx_t_5 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_5)) goto __pyx_L5_unpacking_failed;
+      __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 46, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      index = 1; __pyx_t_3 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L5_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_3);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_4), 2) < 0) __PYX_ERR(1, 44, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_8 = Py_TYPE(__pyx_t_5)->tp_iternext;
+      index = 0; __pyx_t_6 = __pyx_t_8(__pyx_t_5); if (unlikely(!__pyx_t_6)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_6);
+      index = 1; __pyx_t_4 = __pyx_t_8(__pyx_t_5); if (unlikely(!__pyx_t_4)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_5), 2) < 0) __PYX_ERR(1, 46, __pyx_L1_error)
       __pyx_t_8 = NULL;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       goto __pyx_L6_unpacking_done;
       __pyx_L5_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_8 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(1, 44, __pyx_L1_error)
+      __PYX_ERR(1, 46, __pyx_L1_error)
       __pyx_L6_unpacking_done:;
     }
-    __Pyx_XDECREF_SET(__pyx_v_py_token, __pyx_t_5);
-    __pyx_t_5 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_vocab_item, __pyx_t_3);
-    __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_py_token, __pyx_t_6);
+    __pyx_t_6 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_vocab_item, __pyx_t_4);
+    __pyx_t_4 = 0;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":45
- * 
+    /* "gensim/models/word2vec_corpusfile.pyx":47
+ *         self.items.resize(len(wv.vocab))
  *         for py_token, vocab_item in iteritems(wv.vocab):
  *             token = any2utf8(py_token)             # <<<<<<<<<<<<<<
  *             word.index = vocab_item.index
  *             word.sample_int = vocab_item.sample_int
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_any2utf8); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 45, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = NULL;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_any2utf8); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 47, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    if (!__pyx_t_5) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_py_token); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+    if (!__pyx_t_6) {
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_py_token); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     } else {
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_py_token};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_py_token};
+        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_v_py_token};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_py_token};
+        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_GOTREF(__pyx_t_1);
       } else
       #endif
       {
-        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 45, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 47, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
         __Pyx_INCREF(__pyx_v_py_token);
         __Pyx_GIVEREF(__pyx_v_py_token);
-        PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_py_token);
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_py_token);
+        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
     }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_XDECREF_SET(__pyx_v_token, __pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":46
+    /* "gensim/models/word2vec_corpusfile.pyx":48
  *         for py_token, vocab_item in iteritems(wv.vocab):
  *             token = any2utf8(py_token)
  *             word.index = vocab_item.index             # <<<<<<<<<<<<<<
  *             word.sample_int = vocab_item.sample_int
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_index); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 46, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_index); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 48, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = __Pyx_PyInt_As_npy_uint32(__pyx_t_1); if (unlikely((__pyx_t_9 == ((npy_uint32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 46, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyInt_As_npy_uint32(__pyx_t_1); if (unlikely((__pyx_t_9 == ((npy_uint32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 48, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_word.index = __pyx_t_9;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":47
+    /* "gensim/models/word2vec_corpusfile.pyx":49
  *             token = any2utf8(py_token)
  *             word.index = vocab_item.index
  *             word.sample_int = vocab_item.sample_int             # <<<<<<<<<<<<<<
  * 
  *             if hs:
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_sample_int); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 47, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_sample_int); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 49, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_10 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_10 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 47, __pyx_L1_error)
+    __pyx_t_10 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_10 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 49, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_word.sample_int = __pyx_t_10;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":49
+    /* "gensim/models/word2vec_corpusfile.pyx":51
  *             word.sample_int = vocab_item.sample_int
  * 
  *             if hs:             # <<<<<<<<<<<<<<
  *                 word.code = <np.uint8_t *>np.PyArray_DATA(vocab_item.code)
  *                 word.code_len = <int>len(vocab_item.code)
  */
-    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_v_hs); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(1, 49, __pyx_L1_error)
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_v_hs); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(1, 51, __pyx_L1_error)
     if (__pyx_t_11) {
 
-      /* "gensim/models/word2vec_corpusfile.pyx":50
+      /* "gensim/models/word2vec_corpusfile.pyx":52
  * 
  *             if hs:
  *                 word.code = <np.uint8_t *>np.PyArray_DATA(vocab_item.code)             # <<<<<<<<<<<<<<
  *                 word.code_len = <int>len(vocab_item.code)
  *                 word.point = <np.uint32_t *>np.PyArray_DATA(vocab_item.point)
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_code); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 50, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_code); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 52, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 50, __pyx_L1_error)
+      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 52, __pyx_L1_error)
       __pyx_v_word.code = ((__pyx_t_5numpy_uint8_t *)PyArray_DATA(((PyArrayObject *)__pyx_t_1)));
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":51
+      /* "gensim/models/word2vec_corpusfile.pyx":53
  *             if hs:
  *                 word.code = <np.uint8_t *>np.PyArray_DATA(vocab_item.code)
  *                 word.code_len = <int>len(vocab_item.code)             # <<<<<<<<<<<<<<
  *                 word.point = <np.uint32_t *>np.PyArray_DATA(vocab_item.point)
  * 
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_code); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 51, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_code); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 53, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_12 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(1, 51, __pyx_L1_error)
+      __pyx_t_12 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(1, 53, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __pyx_v_word.code_len = ((int)__pyx_t_12);
 
-      /* "gensim/models/word2vec_corpusfile.pyx":52
+      /* "gensim/models/word2vec_corpusfile.pyx":54
  *                 word.code = <np.uint8_t *>np.PyArray_DATA(vocab_item.code)
  *                 word.code_len = <int>len(vocab_item.code)
  *                 word.point = <np.uint32_t *>np.PyArray_DATA(vocab_item.point)             # <<<<<<<<<<<<<<
  * 
  *             # subwords information, used only in FastText model
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_point); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 52, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_vocab_item, __pyx_n_s_point); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 54, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 52, __pyx_L1_error)
+      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 54, __pyx_L1_error)
       __pyx_v_word.point = ((__pyx_t_5numpy_uint32_t *)PyArray_DATA(((PyArrayObject *)__pyx_t_1)));
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":49
+      /* "gensim/models/word2vec_corpusfile.pyx":51
  *             word.sample_int = vocab_item.sample_int
  * 
  *             if hs:             # <<<<<<<<<<<<<<
@@ -2689,49 +2818,49 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
  */
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":55
+    /* "gensim/models/word2vec_corpusfile.pyx":57
  * 
  *             # subwords information, used only in FastText model
  *             if fasttext:             # <<<<<<<<<<<<<<
  *                 word.subword_idx_len = <int>(len(wv.buckets_word[word.index]))
  *                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])
  */
-    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_v_fasttext); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(1, 55, __pyx_L1_error)
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_v_fasttext); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(1, 57, __pyx_L1_error)
     if (__pyx_t_11) {
 
-      /* "gensim/models/word2vec_corpusfile.pyx":56
+      /* "gensim/models/word2vec_corpusfile.pyx":58
  *             # subwords information, used only in FastText model
  *             if fasttext:
  *                 word.subword_idx_len = <int>(len(wv.buckets_word[word.index]))             # <<<<<<<<<<<<<<
  *                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])
  * 
  */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_buckets_word); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 56, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_buckets_word); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 58, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_word.index, __pyx_t_5numpy_uint32_t, 0, __Pyx_PyInt_From_npy_uint32, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 56, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_word.index, __pyx_t_5numpy_uint32_t, 0, __Pyx_PyInt_From_npy_uint32, 0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 58, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_12 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(1, 56, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_12 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(1, 58, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __pyx_v_word.subword_idx_len = ((int)__pyx_t_12);
 
-      /* "gensim/models/word2vec_corpusfile.pyx":57
+      /* "gensim/models/word2vec_corpusfile.pyx":59
  *             if fasttext:
  *                 word.subword_idx_len = <int>(len(wv.buckets_word[word.index]))
  *                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])             # <<<<<<<<<<<<<<
  * 
  *             self.vocab[token] = word
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_buckets_word); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 57, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_word.index, __pyx_t_5numpy_uint32_t, 0, __Pyx_PyInt_From_npy_uint32, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 57, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_wv, __pyx_n_s_buckets_word); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 59, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_word.index, __pyx_t_5numpy_uint32_t, 0, __Pyx_PyInt_From_npy_uint32, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 59, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 57, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 59, __pyx_L1_error)
       __pyx_v_word.subword_idx = ((__pyx_t_5numpy_uint32_t *)PyArray_DATA(((PyArrayObject *)__pyx_t_1)));
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":55
+      /* "gensim/models/word2vec_corpusfile.pyx":57
  * 
  *             # subwords information, used only in FastText model
  *             if fasttext:             # <<<<<<<<<<<<<<
@@ -2740,27 +2869,36 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
  */
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":59
+    /* "gensim/models/word2vec_corpusfile.pyx":61
  *                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])
  * 
  *             self.vocab[token] = word             # <<<<<<<<<<<<<<
+ *             self.items[word.index] = word
  * 
- *     cdef cvocab_t* get_vocab_ptr(self) nogil except *:
  */
-    __pyx_t_13 = __pyx_convert_string_from_py_std__in_string(__pyx_v_token); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 59, __pyx_L1_error)
+    __pyx_t_13 = __pyx_convert_string_from_py_std__in_string(__pyx_v_token); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 61, __pyx_L1_error)
     (__pyx_v_self->vocab[__pyx_t_13]) = __pyx_v_word;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":44
- *         cdef VocabItem word
+    /* "gensim/models/word2vec_corpusfile.pyx":62
+ * 
+ *             self.vocab[token] = word
+ *             self.items[word.index] = word             # <<<<<<<<<<<<<<
+ * 
+ *     cdef cvocab_t* get_vocab_ptr(self) nogil except *:
+ */
+    (__pyx_v_self->items[__pyx_v_word.index]) = __pyx_v_word;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":46
  * 
+ *         self.items.resize(len(wv.vocab))
  *         for py_token, vocab_item in iteritems(wv.vocab):             # <<<<<<<<<<<<<<
  *             token = any2utf8(py_token)
  *             word.index = vocab_item.index
  */
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":41
+  /* "gensim/models/word2vec_corpusfile.pyx":42
  * @cython.final
  * cdef class CythonVocab:
  *     def __init__(self, wv, hs=0, fasttext=0):             # <<<<<<<<<<<<<<
@@ -2773,10 +2911,10 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonVocab.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
@@ -2787,8 +2925,8 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":61
- *             self.vocab[token] = word
+/* "gensim/models/word2vec_corpusfile.pyx":64
+ *             self.items[word.index] = word
  * 
  *     cdef cvocab_t* get_vocab_ptr(self) nogil except *:             # <<<<<<<<<<<<<<
  *         return &self.vocab
@@ -2798,18 +2936,18 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab___init__
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_self) {
   __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_r;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":62
+  /* "gensim/models/word2vec_corpusfile.pyx":65
  * 
  *     cdef cvocab_t* get_vocab_ptr(self) nogil except *:
  *         return &self.vocab             # <<<<<<<<<<<<<<
  * 
- * 
+ *     cdef VocabItem* get_items_ptr(self) nogil:
  */
   __pyx_r = (&__pyx_v_self->vocab);
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":61
- *             self.vocab[token] = word
+  /* "gensim/models/word2vec_corpusfile.pyx":64
+ *             self.items[word.index] = word
  * 
  *     cdef cvocab_t* get_vocab_ptr(self) nogil except *:             # <<<<<<<<<<<<<<
  *         return &self.vocab
@@ -2821,9 +2959,43 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_f_6gensim_6
   return __pyx_r;
 }
 
+/* "gensim/models/word2vec_corpusfile.pyx":67
+ *         return &self.vocab
+ * 
+ *     cdef VocabItem* get_items_ptr(self) nogil:             # <<<<<<<<<<<<<<
+ *         return self.items.data()
+ * 
+ */
+
+static struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_self) {
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_r;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":68
+ * 
+ *     cdef VocabItem* get_items_ptr(self) nogil:
+ *         return self.items.data()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_self->items.data();
+  goto __pyx_L0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":67
+ *         return &self.vocab
+ * 
+ *     cdef VocabItem* get_items_ptr(self) nogil:             # <<<<<<<<<<<<<<
+ *         return self.items.data()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
 /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):
  */
 
@@ -2849,9 +3021,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_2_
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  */
   __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -2861,7 +3033,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_2_
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):
  */
 
@@ -2877,9 +3049,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_2_
 
 /* "(tree fragment)":3
  * def __reduce_cython__(self):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  */
 
 /* Python wrapper */
@@ -2903,9 +3075,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_4_
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
  */
   __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -2915,9 +3087,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_4_
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  */
 
   /* function exit code */
@@ -2930,7 +3102,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_11CythonVocab_4_
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":65
+/* "gensim/models/word2vec_corpusfile.pyx":71
  * 
  * 
  * def rebuild_cython_line_sentence(source, max_sentence_length):             # <<<<<<<<<<<<<<
@@ -2971,11 +3143,11 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_1rebuild_cython_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_sentence_length)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("rebuild_cython_line_sentence", 1, 2, 2, 1); __PYX_ERR(1, 65, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("rebuild_cython_line_sentence", 1, 2, 2, 1); __PYX_ERR(1, 71, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rebuild_cython_line_sentence") < 0)) __PYX_ERR(1, 65, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "rebuild_cython_line_sentence") < 0)) __PYX_ERR(1, 71, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2988,7 +3160,7 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_1rebuild_cython_
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("rebuild_cython_line_sentence", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 65, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("rebuild_cython_line_sentence", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 71, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.rebuild_cython_line_sentence", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3009,7 +3181,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_rebuild_cython_l
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("rebuild_cython_line_sentence", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":66
+  /* "gensim/models/word2vec_corpusfile.pyx":72
  * 
  * def rebuild_cython_line_sentence(source, max_sentence_length):
  *     return CythonLineSentence(source, max_sentence_length=max_sentence_length)             # <<<<<<<<<<<<<<
@@ -3017,15 +3189,15 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_rebuild_cython_l
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 66, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_source);
   __Pyx_GIVEREF(__pyx_v_source);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_source);
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 66, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_max_sentence_length, __pyx_v_max_sentence_length) < 0) __PYX_ERR(1, 66, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 66, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_max_sentence_length, __pyx_v_max_sentence_length) < 0) __PYX_ERR(1, 72, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -3033,7 +3205,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_rebuild_cython_l
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":65
+  /* "gensim/models/word2vec_corpusfile.pyx":71
  * 
  * 
  * def rebuild_cython_line_sentence(source, max_sentence_length):             # <<<<<<<<<<<<<<
@@ -3054,7 +3226,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_rebuild_cython_l
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":69
+/* "gensim/models/word2vec_corpusfile.pyx":75
  * 
  * 
  * cdef bytes to_bytes(key):             # <<<<<<<<<<<<<<
@@ -3071,7 +3243,7 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
   PyObject *__pyx_t_4 = NULL;
   __Pyx_RefNannySetupContext("to_bytes", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":70
+  /* "gensim/models/word2vec_corpusfile.pyx":76
  * 
  * cdef bytes to_bytes(key):
  *     if isinstance(key, bytes):             # <<<<<<<<<<<<<<
@@ -3082,7 +3254,7 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":71
+    /* "gensim/models/word2vec_corpusfile.pyx":77
  * cdef bytes to_bytes(key):
  *     if isinstance(key, bytes):
  *         return <bytes>key             # <<<<<<<<<<<<<<
@@ -3094,7 +3266,7 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
     __pyx_r = ((PyObject*)__pyx_v_key);
     goto __pyx_L0;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":70
+    /* "gensim/models/word2vec_corpusfile.pyx":76
  * 
  * cdef bytes to_bytes(key):
  *     if isinstance(key, bytes):             # <<<<<<<<<<<<<<
@@ -3103,7 +3275,7 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
  */
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":73
+  /* "gensim/models/word2vec_corpusfile.pyx":79
  *         return <bytes>key
  *     else:
  *         return key.encode('utf8')             # <<<<<<<<<<<<<<
@@ -3112,18 +3284,18 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_key, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 73, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_key, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 73, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 79, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(1, 73, __pyx_L1_error)
+    if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(1, 79, __pyx_L1_error)
     __pyx_r = ((PyObject*)__pyx_t_4);
     __pyx_t_4 = 0;
     goto __pyx_L0;
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":69
+  /* "gensim/models/word2vec_corpusfile.pyx":75
  * 
  * 
  * cdef bytes to_bytes(key):             # <<<<<<<<<<<<<<
@@ -3143,7 +3315,7 @@ static PyObject *__pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(PyObject
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":78
+/* "gensim/models/word2vec_corpusfile.pyx":84
  * @cython.final
  * cdef class CythonLineSentence:
  *     def __cinit__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
@@ -3197,7 +3369,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_1
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 78, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 84, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3216,7 +3388,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_1
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 78, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 84, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonLineSentence.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3238,27 +3410,27 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__
   FastLineSentence *__pyx_t_4;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":79
+  /* "gensim/models/word2vec_corpusfile.pyx":85
  * cdef class CythonLineSentence:
  *     def __cinit__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
  *         self._thisptr = new FastLineSentence(to_bytes(source), offset)             # <<<<<<<<<<<<<<
  * 
  *     def __init__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
  */
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(__pyx_v_source); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 79, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(__pyx_v_source); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __pyx_convert_string_from_py_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 79, __pyx_L1_error)
+  __pyx_t_2 = __pyx_convert_string_from_py_std__in_string(__pyx_t_1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 85, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_As_size_t(__pyx_v_offset); if (unlikely((__pyx_t_3 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 79, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_As_size_t(__pyx_v_offset); if (unlikely((__pyx_t_3 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 85, __pyx_L1_error)
   try {
     __pyx_t_4 = new FastLineSentence(__pyx_t_2, __pyx_t_3);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(1, 79, __pyx_L1_error)
+    __PYX_ERR(1, 85, __pyx_L1_error)
   }
   __pyx_v_self->_thisptr = __pyx_t_4;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":78
+  /* "gensim/models/word2vec_corpusfile.pyx":84
  * @cython.final
  * cdef class CythonLineSentence:
  *     def __cinit__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
@@ -3278,7 +3450,7 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":81
+/* "gensim/models/word2vec_corpusfile.pyx":87
  *         self._thisptr = new FastLineSentence(to_bytes(source), offset)
  * 
  *     def __init__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
@@ -3332,7 +3504,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_3
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 81, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 87, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3351,7 +3523,7 @@ static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_3
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 81, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 87, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonLineSentence.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3371,14 +3543,14 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_2
   size_t __pyx_t_2;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":82
+  /* "gensim/models/word2vec_corpusfile.pyx":88
  * 
  *     def __init__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
  *         self.source = to_bytes(source)             # <<<<<<<<<<<<<<
  *         self.offset = offset
  *         self.max_sentence_length = max_sentence_length
  */
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(__pyx_v_source); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 82, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_to_bytes(__pyx_v_source); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 88, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->source);
@@ -3386,37 +3558,37 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_2
   __pyx_v_self->source = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":83
+  /* "gensim/models/word2vec_corpusfile.pyx":89
  *     def __init__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
  *         self.source = to_bytes(source)
  *         self.offset = offset             # <<<<<<<<<<<<<<
  *         self.max_sentence_length = max_sentence_length
  *         self.max_words_in_batch = max_sentence_length
  */
-  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_offset); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 83, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_offset); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 89, __pyx_L1_error)
   __pyx_v_self->offset = __pyx_t_2;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":84
+  /* "gensim/models/word2vec_corpusfile.pyx":90
  *         self.source = to_bytes(source)
  *         self.offset = offset
  *         self.max_sentence_length = max_sentence_length             # <<<<<<<<<<<<<<
  *         self.max_words_in_batch = max_sentence_length
  * 
  */
-  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_max_sentence_length); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 84, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_max_sentence_length); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 90, __pyx_L1_error)
   __pyx_v_self->max_sentence_length = __pyx_t_2;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":85
+  /* "gensim/models/word2vec_corpusfile.pyx":91
  *         self.offset = offset
  *         self.max_sentence_length = max_sentence_length
  *         self.max_words_in_batch = max_sentence_length             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_max_sentence_length); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 85, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_max_sentence_length); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 91, __pyx_L1_error)
   __pyx_v_self->max_words_in_batch = __pyx_t_2;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":81
+  /* "gensim/models/word2vec_corpusfile.pyx":87
  *         self._thisptr = new FastLineSentence(to_bytes(source), offset)
  * 
  *     def __init__(self, source, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
@@ -3436,7 +3608,7 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_2
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":87
+/* "gensim/models/word2vec_corpusfile.pyx":93
  *         self.max_words_in_batch = max_sentence_length
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3460,7 +3632,7 @@ static void __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":88
+  /* "gensim/models/word2vec_corpusfile.pyx":94
  * 
  *     def __dealloc__(self):
  *         if self._thisptr != NULL:             # <<<<<<<<<<<<<<
@@ -3470,7 +3642,7 @@ static void __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_
   __pyx_t_1 = ((__pyx_v_self->_thisptr != NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":89
+    /* "gensim/models/word2vec_corpusfile.pyx":95
  *     def __dealloc__(self):
  *         if self._thisptr != NULL:
  *             del self._thisptr             # <<<<<<<<<<<<<<
@@ -3479,7 +3651,7 @@ static void __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_
  */
     delete __pyx_v_self->_thisptr;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":88
+    /* "gensim/models/word2vec_corpusfile.pyx":94
  * 
  *     def __dealloc__(self):
  *         if self._thisptr != NULL:             # <<<<<<<<<<<<<<
@@ -3488,7 +3660,7 @@ static void __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_
  */
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":87
+  /* "gensim/models/word2vec_corpusfile.pyx":93
  *         self.max_words_in_batch = max_sentence_length
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -3500,7 +3672,7 @@ static void __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_
   __Pyx_RefNannyFinishContext();
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":91
+/* "gensim/models/word2vec_corpusfile.pyx":97
  *             del self._thisptr
  * 
  *     cpdef bool_t is_eof(self) nogil:             # <<<<<<<<<<<<<<
@@ -3512,7 +3684,7 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
 static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch) {
   bool __pyx_r;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":92
+  /* "gensim/models/word2vec_corpusfile.pyx":98
  * 
  *     cpdef bool_t is_eof(self) nogil:
  *         return self._thisptr.IsEof()             # <<<<<<<<<<<<<<
@@ -3522,7 +3694,7 @@ static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_i
   __pyx_r = __pyx_v_self->_thisptr->IsEof();
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":91
+  /* "gensim/models/word2vec_corpusfile.pyx":97
  *             del self._thisptr
  * 
  *     cpdef bool_t is_eof(self) nogil:             # <<<<<<<<<<<<<<
@@ -3555,7 +3727,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("is_eof", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 91, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3572,7 +3744,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":94
+/* "gensim/models/word2vec_corpusfile.pyx":100
  *         return self._thisptr.IsEof()
  * 
  *     cpdef vector[string] read_sentence(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -3585,7 +3757,7 @@ static std::vector<std::string>  __pyx_f_6gensim_6models_19word2vec_corpusfile_1
   std::vector<std::string>  __pyx_r;
   std::vector<std::string>  __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":95
+  /* "gensim/models/word2vec_corpusfile.pyx":101
  * 
  *     cpdef vector[string] read_sentence(self) nogil except *:
  *         return self._thisptr.ReadSentence()             # <<<<<<<<<<<<<<
@@ -3602,12 +3774,12 @@ static std::vector<std::string>  __pyx_f_6gensim_6models_19word2vec_corpusfile_1
     #ifdef WITH_THREAD
     __Pyx_PyGILState_Release(__pyx_gilstate_save);
     #endif
-    __PYX_ERR(1, 95, __pyx_L1_error)
+    __PYX_ERR(1, 101, __pyx_L1_error)
   }
   __pyx_r = __pyx_t_1;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":94
+  /* "gensim/models/word2vec_corpusfile.pyx":100
  *         return self._thisptr.IsEof()
  * 
  *     cpdef vector[string] read_sentence(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -3652,8 +3824,8 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("read_sentence", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 94, __pyx_L1_error)
-  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_string(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 94, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 100, __pyx_L1_error)
+  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_string(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -3670,7 +3842,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":97
+/* "gensim/models/word2vec_corpusfile.pyx":103
  *         return self._thisptr.ReadSentence()
  * 
  *     cpdef vector[vector[string]] _read_chunked_sentence(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -3684,17 +3856,17 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   std::vector<std::vector<std::string> >  __pyx_r;
   std::vector<std::string>  __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":98
+  /* "gensim/models/word2vec_corpusfile.pyx":104
  * 
  *     cpdef vector[vector[string]] _read_chunked_sentence(self) nogil except *:
  *         cdef vector[string] sent = self.read_sentence()             # <<<<<<<<<<<<<<
  *         return self._chunk_sentence(sent)
  * 
  */
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 98, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 104, __pyx_L1_error)
   __pyx_v_sent = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":99
+  /* "gensim/models/word2vec_corpusfile.pyx":105
  *     cpdef vector[vector[string]] _read_chunked_sentence(self) nogil except *:
  *         cdef vector[string] sent = self.read_sentence()
  *         return self._chunk_sentence(sent)             # <<<<<<<<<<<<<<
@@ -3704,7 +3876,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_r = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence(__pyx_v_self, __pyx_v_sent, 0);
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":97
+  /* "gensim/models/word2vec_corpusfile.pyx":103
  *         return self._thisptr.ReadSentence()
  * 
  *     cpdef vector[vector[string]] _read_chunked_sentence(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -3749,8 +3921,8 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("_read_chunked_sentence", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__read_chunked_sentence(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 97, __pyx_L1_error)
-  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 97, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__read_chunked_sentence(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 103, __pyx_L1_error)
+  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -3767,7 +3939,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":101
+/* "gensim/models/word2vec_corpusfile.pyx":107
  *         return self._chunk_sentence(sent)
  * 
  *     cpdef vector[vector[string]] _chunk_sentence(self, vector[string] sent) nogil:             # <<<<<<<<<<<<<<
@@ -3788,7 +3960,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   std::vector<std::string> ::size_type __pyx_t_4;
   std::vector<std::string> ::size_type __pyx_t_5;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":104
+  /* "gensim/models/word2vec_corpusfile.pyx":110
  *         cdef vector[vector[string]] res
  *         cdef vector[string] chunk
  *         cdef size_t cur_idx = 0             # <<<<<<<<<<<<<<
@@ -3797,7 +3969,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   __pyx_v_cur_idx = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":106
+  /* "gensim/models/word2vec_corpusfile.pyx":112
  *         cdef size_t cur_idx = 0
  * 
  *         if sent.size() > self.max_sentence_length:             # <<<<<<<<<<<<<<
@@ -3807,7 +3979,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_t_1 = ((__pyx_v_sent.size() > __pyx_v_self->max_sentence_length) != 0);
   if (__pyx_t_1) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":107
+    /* "gensim/models/word2vec_corpusfile.pyx":113
  * 
  *         if sent.size() > self.max_sentence_length:
  *             while cur_idx < sent.size():             # <<<<<<<<<<<<<<
@@ -3818,7 +3990,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       __pyx_t_1 = ((__pyx_v_cur_idx < __pyx_v_sent.size()) != 0);
       if (!__pyx_t_1) break;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":108
+      /* "gensim/models/word2vec_corpusfile.pyx":114
  *         if sent.size() > self.max_sentence_length:
  *             while cur_idx < sent.size():
  *                 chunk.clear()             # <<<<<<<<<<<<<<
@@ -3827,7 +3999,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
       __pyx_v_chunk.clear();
 
-      /* "gensim/models/word2vec_corpusfile.pyx":109
+      /* "gensim/models/word2vec_corpusfile.pyx":115
  *             while cur_idx < sent.size():
  *                 chunk.clear()
  *                 for i in range(cur_idx, min(cur_idx + self.max_sentence_length, sent.size())):             # <<<<<<<<<<<<<<
@@ -3846,7 +4018,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       for (__pyx_t_5 = __pyx_v_cur_idx; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
         __pyx_v_i = __pyx_t_5;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":110
+        /* "gensim/models/word2vec_corpusfile.pyx":116
  *                 chunk.clear()
  *                 for i in range(cur_idx, min(cur_idx + self.max_sentence_length, sent.size())):
  *                     chunk.push_back(sent[i])             # <<<<<<<<<<<<<<
@@ -3863,11 +4035,11 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
           #ifdef WITH_THREAD
           __Pyx_PyGILState_Release(__pyx_gilstate_save);
           #endif
-          __PYX_ERR(1, 110, __pyx_L1_error)
+          __PYX_ERR(1, 116, __pyx_L1_error)
         }
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":112
+      /* "gensim/models/word2vec_corpusfile.pyx":118
  *                     chunk.push_back(sent[i])
  * 
  *                 res.push_back(chunk)             # <<<<<<<<<<<<<<
@@ -3884,10 +4056,10 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
         #ifdef WITH_THREAD
         __Pyx_PyGILState_Release(__pyx_gilstate_save);
         #endif
-        __PYX_ERR(1, 112, __pyx_L1_error)
+        __PYX_ERR(1, 118, __pyx_L1_error)
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":113
+      /* "gensim/models/word2vec_corpusfile.pyx":119
  * 
  *                 res.push_back(chunk)
  *                 cur_idx += chunk.size()             # <<<<<<<<<<<<<<
@@ -3897,7 +4069,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       __pyx_v_cur_idx = (__pyx_v_cur_idx + __pyx_v_chunk.size());
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":106
+    /* "gensim/models/word2vec_corpusfile.pyx":112
  *         cdef size_t cur_idx = 0
  * 
  *         if sent.size() > self.max_sentence_length:             # <<<<<<<<<<<<<<
@@ -3907,7 +4079,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     goto __pyx_L3;
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":115
+  /* "gensim/models/word2vec_corpusfile.pyx":121
  *                 cur_idx += chunk.size()
  *         else:
  *             res.push_back(sent)             # <<<<<<<<<<<<<<
@@ -3925,12 +4097,12 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(1, 115, __pyx_L1_error)
+      __PYX_ERR(1, 121, __pyx_L1_error)
     }
   }
   __pyx_L3:;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":117
+  /* "gensim/models/word2vec_corpusfile.pyx":123
  *             res.push_back(sent)
  * 
  *         return res             # <<<<<<<<<<<<<<
@@ -3940,7 +4112,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_r = __pyx_v_res;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":101
+  /* "gensim/models/word2vec_corpusfile.pyx":107
  *         return self._chunk_sentence(sent)
  * 
  *     cpdef vector[vector[string]] _chunk_sentence(self, vector[string] sent) nogil:             # <<<<<<<<<<<<<<
@@ -3965,7 +4137,7 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("_chunk_sentence (wrapper)", 0);
   assert(__pyx_arg_sent); {
-    __pyx_v_sent = __pyx_convert_vector_from_py_std_3a__3a_string(__pyx_arg_sent); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 101, __pyx_L3_error)
+    __pyx_v_sent = __pyx_convert_vector_from_py_std_3a__3a_string(__pyx_arg_sent); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 107, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3986,7 +4158,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("_chunk_sentence", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence(__pyx_v_self, __pyx_v_sent, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 101, __pyx_L1_error)
+  __pyx_t_1 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence(__pyx_v_self, __pyx_v_sent, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 107, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4003,7 +4175,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":119
+/* "gensim/models/word2vec_corpusfile.pyx":125
  *         return res
  * 
  *     cpdef void reset(self) nogil:             # <<<<<<<<<<<<<<
@@ -4014,7 +4186,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
 static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_15reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
 static void __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch) {
 
-  /* "gensim/models/word2vec_corpusfile.pyx":120
+  /* "gensim/models/word2vec_corpusfile.pyx":126
  * 
  *     cpdef void reset(self) nogil:
  *         self._thisptr.Reset()             # <<<<<<<<<<<<<<
@@ -4023,7 +4195,7 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_r
  */
   __pyx_v_self->_thisptr->Reset();
 
-  /* "gensim/models/word2vec_corpusfile.pyx":119
+  /* "gensim/models/word2vec_corpusfile.pyx":125
  *         return res
  * 
  *     cpdef void reset(self) nogil:             # <<<<<<<<<<<<<<
@@ -4054,7 +4226,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("reset", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 119, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 125, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4072,7 +4244,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
 }
 static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_18generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "gensim/models/word2vec_corpusfile.pyx":122
+/* "gensim/models/word2vec_corpusfile.pyx":128
  *         self._thisptr.Reset()
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -4102,7 +4274,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   if (unlikely(!__pyx_cur_scope)) {
     __pyx_cur_scope = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__ *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(1, 122, __pyx_L1_error)
+    __PYX_ERR(1, 128, __pyx_L1_error)
   } else {
     __Pyx_GOTREF(__pyx_cur_scope);
   }
@@ -4110,7 +4282,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
   __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
   {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_18generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_iter, __pyx_n_s_CythonLineSentence___iter, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!gen)) __PYX_ERR(1, 122, __pyx_L1_error)
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_18generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_iter, __pyx_n_s_CythonLineSentence___iter, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!gen)) __PYX_ERR(1, 128, __pyx_L1_error)
     __Pyx_DECREF(__pyx_cur_scope);
     __Pyx_RefNannyFinishContext();
     return (PyObject *) gen;
@@ -4145,9 +4317,9 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
     return NULL;
   }
   __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(1, 122, __pyx_L1_error)
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(1, 128, __pyx_L1_error)
 
-  /* "gensim/models/word2vec_corpusfile.pyx":123
+  /* "gensim/models/word2vec_corpusfile.pyx":129
  * 
  *     def __iter__(self):
  *         self.reset()             # <<<<<<<<<<<<<<
@@ -4156,7 +4328,7 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
  */
   __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_cur_scope->__pyx_v_self, 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":124
+  /* "gensim/models/word2vec_corpusfile.pyx":130
  *     def __iter__(self):
  *         self.reset()
  *         while not self.is_eof():             # <<<<<<<<<<<<<<
@@ -4167,17 +4339,17 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
     __pyx_t_1 = ((!(__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_cur_scope->__pyx_v_self, 0) != 0)) != 0);
     if (!__pyx_t_1) break;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":125
+    /* "gensim/models/word2vec_corpusfile.pyx":131
  *         self.reset()
  *         while not self.is_eof():
  *             chunked_sentence = self._read_chunked_sentence()             # <<<<<<<<<<<<<<
  *             for chunk in chunked_sentence:
  *                 if not chunk.empty():
  */
-    __pyx_t_2 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__read_chunked_sentence(__pyx_cur_scope->__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 125, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__read_chunked_sentence(__pyx_cur_scope->__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 131, __pyx_L1_error)
     __pyx_cur_scope->__pyx_v_chunked_sentence = __pyx_t_2;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":126
+    /* "gensim/models/word2vec_corpusfile.pyx":132
  *         while not self.is_eof():
  *             chunked_sentence = self._read_chunked_sentence()
  *             for chunk in chunked_sentence:             # <<<<<<<<<<<<<<
@@ -4191,7 +4363,7 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
       ++__pyx_t_3;
       __pyx_cur_scope->__pyx_v_chunk = __pyx_t_4;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":127
+      /* "gensim/models/word2vec_corpusfile.pyx":133
  *             chunked_sentence = self._read_chunked_sentence()
  *             for chunk in chunked_sentence:
  *                 if not chunk.empty():             # <<<<<<<<<<<<<<
@@ -4201,14 +4373,14 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
       __pyx_t_1 = ((!(__pyx_cur_scope->__pyx_v_chunk.empty() != 0)) != 0);
       if (__pyx_t_1) {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":128
+        /* "gensim/models/word2vec_corpusfile.pyx":134
  *             for chunk in chunked_sentence:
  *                 if not chunk.empty():
  *                     yield chunk             # <<<<<<<<<<<<<<
  * 
  *     def __reduce__(self):
  */
-        __pyx_t_5 = __pyx_convert_vector_to_py_std_3a__3a_string(__pyx_cur_scope->__pyx_v_chunk); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 128, __pyx_L1_error)
+        __pyx_t_5 = __pyx_convert_vector_to_py_std_3a__3a_string(__pyx_cur_scope->__pyx_v_chunk); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 134, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __pyx_r = __pyx_t_5;
         __pyx_t_5 = 0;
@@ -4221,9 +4393,9 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
         return __pyx_r;
         __pyx_L9_resume_from_yield:;
         __pyx_t_3 = __pyx_cur_scope->__pyx_t_0;
-        if (unlikely(!__pyx_sent_value)) __PYX_ERR(1, 128, __pyx_L1_error)
+        if (unlikely(!__pyx_sent_value)) __PYX_ERR(1, 134, __pyx_L1_error)
 
-        /* "gensim/models/word2vec_corpusfile.pyx":127
+        /* "gensim/models/word2vec_corpusfile.pyx":133
  *             chunked_sentence = self._read_chunked_sentence()
  *             for chunk in chunked_sentence:
  *                 if not chunk.empty():             # <<<<<<<<<<<<<<
@@ -4232,7 +4404,7 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
  */
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":126
+      /* "gensim/models/word2vec_corpusfile.pyx":132
  *         while not self.is_eof():
  *             chunked_sentence = self._read_chunked_sentence()
  *             for chunk in chunked_sentence:             # <<<<<<<<<<<<<<
@@ -4243,7 +4415,7 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   }
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":122
+  /* "gensim/models/word2vec_corpusfile.pyx":128
  *         self._thisptr.Reset()
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -4266,7 +4438,7 @@ static PyObject *__pyx_gb_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":130
+/* "gensim/models/word2vec_corpusfile.pyx":136
  *                     yield chunk
  * 
  *     def __reduce__(self):             # <<<<<<<<<<<<<<
@@ -4296,7 +4468,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_3 = NULL;
   __Pyx_RefNannySetupContext("__reduce__", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":132
+  /* "gensim/models/word2vec_corpusfile.pyx":138
  *     def __reduce__(self):
  *         # This function helps pickle to correctly serialize objects of this class.
  *         return rebuild_cython_line_sentence, (self.source, self.max_sentence_length)             # <<<<<<<<<<<<<<
@@ -4304,11 +4476,11 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
  *     cpdef vector[vector[string]] next_batch(self) nogil except *:
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_rebuild_cython_line_sentence); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 132, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_rebuild_cython_line_sentence); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_self->max_sentence_length); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_self->max_sentence_length); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 132, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_self->source);
   __Pyx_GIVEREF(__pyx_v_self->source);
@@ -4316,7 +4488,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -4328,7 +4500,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":130
+  /* "gensim/models/word2vec_corpusfile.pyx":136
  *                     yield chunk
  * 
  *     def __reduce__(self):             # <<<<<<<<<<<<<<
@@ -4349,7 +4521,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":134
+/* "gensim/models/word2vec_corpusfile.pyx":140
  *         return rebuild_cython_line_sentence, (self.source, self.max_sentence_length)
  * 
  *     cpdef vector[vector[string]] next_batch(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -4379,7 +4551,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   std::vector<std::vector<std::string> > ::size_type __pyx_t_7;
   std::vector<std::vector<std::string> > ::size_type __pyx_t_8;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":139
+  /* "gensim/models/word2vec_corpusfile.pyx":145
  *             vector[vector[string]] chunked_sentence
  *             vector[string] data
  *             size_t batch_size = 0             # <<<<<<<<<<<<<<
@@ -4388,7 +4560,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   __pyx_v_batch_size = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":140
+  /* "gensim/models/word2vec_corpusfile.pyx":146
  *             vector[string] data
  *             size_t batch_size = 0
  *             size_t last_idx = 0             # <<<<<<<<<<<<<<
@@ -4397,7 +4569,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   __pyx_v_last_idx = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":141
+  /* "gensim/models/word2vec_corpusfile.pyx":147
  *             size_t batch_size = 0
  *             size_t last_idx = 0
  *             size_t tmp = 0             # <<<<<<<<<<<<<<
@@ -4406,7 +4578,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   __pyx_v_tmp = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":145
+  /* "gensim/models/word2vec_corpusfile.pyx":151
  * 
  *         # Try to read data from previous calls which was not returned
  *         if not self.buf_data.empty():             # <<<<<<<<<<<<<<
@@ -4416,7 +4588,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_t_1 = ((!(__pyx_v_self->buf_data.empty() != 0)) != 0);
   if (__pyx_t_1) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":146
+    /* "gensim/models/word2vec_corpusfile.pyx":152
  *         # Try to read data from previous calls which was not returned
  *         if not self.buf_data.empty():
  *             job_batch = self.buf_data             # <<<<<<<<<<<<<<
@@ -4426,7 +4598,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     __pyx_t_2 = __pyx_v_self->buf_data;
     __pyx_v_job_batch = __pyx_t_2;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":147
+    /* "gensim/models/word2vec_corpusfile.pyx":153
  *         if not self.buf_data.empty():
  *             job_batch = self.buf_data
  *             self.buf_data.clear()             # <<<<<<<<<<<<<<
@@ -4435,7 +4607,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     __pyx_v_self->buf_data.clear();
 
-    /* "gensim/models/word2vec_corpusfile.pyx":149
+    /* "gensim/models/word2vec_corpusfile.pyx":155
  *             self.buf_data.clear()
  * 
  *             for sent in job_batch:             # <<<<<<<<<<<<<<
@@ -4449,7 +4621,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       ++__pyx_t_3;
       __pyx_v_sent = __pyx_t_4;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":150
+      /* "gensim/models/word2vec_corpusfile.pyx":156
  * 
  *             for sent in job_batch:
  *                 batch_size += sent.size()             # <<<<<<<<<<<<<<
@@ -4458,7 +4630,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
       __pyx_v_batch_size = (__pyx_v_batch_size + __pyx_v_sent.size());
 
-      /* "gensim/models/word2vec_corpusfile.pyx":149
+      /* "gensim/models/word2vec_corpusfile.pyx":155
  *             self.buf_data.clear()
  * 
  *             for sent in job_batch:             # <<<<<<<<<<<<<<
@@ -4467,7 +4639,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":145
+    /* "gensim/models/word2vec_corpusfile.pyx":151
  * 
  *         # Try to read data from previous calls which was not returned
  *         if not self.buf_data.empty():             # <<<<<<<<<<<<<<
@@ -4476,7 +4648,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":152
+  /* "gensim/models/word2vec_corpusfile.pyx":158
  *                 batch_size += sent.size()
  * 
  *         while not self.is_eof() and batch_size <= self.max_words_in_batch:             # <<<<<<<<<<<<<<
@@ -4495,17 +4667,17 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     __pyx_L8_bool_binop_done:;
     if (!__pyx_t_1) break;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":153
+    /* "gensim/models/word2vec_corpusfile.pyx":159
  * 
  *         while not self.is_eof() and batch_size <= self.max_words_in_batch:
  *             data = self.read_sentence()             # <<<<<<<<<<<<<<
  * 
  *             chunked_sentence = self._chunk_sentence(data)
  */
-    __pyx_t_4 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 153, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_read_sentence(__pyx_v_self, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 159, __pyx_L1_error)
     __pyx_v_data = __pyx_t_4;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":155
+    /* "gensim/models/word2vec_corpusfile.pyx":161
  *             data = self.read_sentence()
  * 
  *             chunked_sentence = self._chunk_sentence(data)             # <<<<<<<<<<<<<<
@@ -4514,7 +4686,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     __pyx_v_chunked_sentence = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence(__pyx_v_self, __pyx_v_data, 0);
 
-    /* "gensim/models/word2vec_corpusfile.pyx":156
+    /* "gensim/models/word2vec_corpusfile.pyx":162
  * 
  *             chunked_sentence = self._chunk_sentence(data)
  *             for chunk in chunked_sentence:             # <<<<<<<<<<<<<<
@@ -4528,7 +4700,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       ++__pyx_t_3;
       __pyx_v_chunk = __pyx_t_4;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":157
+      /* "gensim/models/word2vec_corpusfile.pyx":163
  *             chunked_sentence = self._chunk_sentence(data)
  *             for chunk in chunked_sentence:
  *                 job_batch.push_back(chunk)             # <<<<<<<<<<<<<<
@@ -4545,10 +4717,10 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
         #ifdef WITH_THREAD
         __Pyx_PyGILState_Release(__pyx_gilstate_save);
         #endif
-        __PYX_ERR(1, 157, __pyx_L1_error)
+        __PYX_ERR(1, 163, __pyx_L1_error)
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":158
+      /* "gensim/models/word2vec_corpusfile.pyx":164
  *             for chunk in chunked_sentence:
  *                 job_batch.push_back(chunk)
  *                 batch_size += chunk.size()             # <<<<<<<<<<<<<<
@@ -4557,7 +4729,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
       __pyx_v_batch_size = (__pyx_v_batch_size + __pyx_v_chunk.size());
 
-      /* "gensim/models/word2vec_corpusfile.pyx":156
+      /* "gensim/models/word2vec_corpusfile.pyx":162
  * 
  *             chunked_sentence = self._chunk_sentence(data)
  *             for chunk in chunked_sentence:             # <<<<<<<<<<<<<<
@@ -4567,7 +4739,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     }
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":160
+  /* "gensim/models/word2vec_corpusfile.pyx":166
  *                 batch_size += chunk.size()
  * 
  *         if batch_size > self.max_words_in_batch:             # <<<<<<<<<<<<<<
@@ -4577,7 +4749,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_t_1 = ((__pyx_v_batch_size > __pyx_v_self->max_words_in_batch) != 0);
   if (__pyx_t_1) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":162
+    /* "gensim/models/word2vec_corpusfile.pyx":168
  *         if batch_size > self.max_words_in_batch:
  *             # Save data which doesn't fit in batch in order to return it later.
  *             self.buf_data.clear()             # <<<<<<<<<<<<<<
@@ -4586,7 +4758,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     __pyx_v_self->buf_data.clear();
 
-    /* "gensim/models/word2vec_corpusfile.pyx":164
+    /* "gensim/models/word2vec_corpusfile.pyx":170
  *             self.buf_data.clear()
  * 
  *             tmp = batch_size             # <<<<<<<<<<<<<<
@@ -4595,7 +4767,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     __pyx_v_tmp = __pyx_v_batch_size;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":165
+    /* "gensim/models/word2vec_corpusfile.pyx":171
  * 
  *             tmp = batch_size
  *             idx = job_batch.size() - 1             # <<<<<<<<<<<<<<
@@ -4604,7 +4776,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
     __pyx_v_idx = (__pyx_v_job_batch.size() - 1);
 
-    /* "gensim/models/word2vec_corpusfile.pyx":166
+    /* "gensim/models/word2vec_corpusfile.pyx":172
  *             tmp = batch_size
  *             idx = job_batch.size() - 1
  *             while idx >= 0:             # <<<<<<<<<<<<<<
@@ -4615,7 +4787,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       __pyx_t_1 = ((__pyx_v_idx >= 0) != 0);
       if (!__pyx_t_1) break;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":167
+      /* "gensim/models/word2vec_corpusfile.pyx":173
  *             idx = job_batch.size() - 1
  *             while idx >= 0:
  *                 if tmp - job_batch[idx].size() <= self.max_words_in_batch:             # <<<<<<<<<<<<<<
@@ -4625,7 +4797,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       __pyx_t_1 = (((__pyx_v_tmp - (__pyx_v_job_batch[__pyx_v_idx]).size()) <= __pyx_v_self->max_words_in_batch) != 0);
       if (__pyx_t_1) {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":168
+        /* "gensim/models/word2vec_corpusfile.pyx":174
  *             while idx >= 0:
  *                 if tmp - job_batch[idx].size() <= self.max_words_in_batch:
  *                     last_idx = idx + 1             # <<<<<<<<<<<<<<
@@ -4634,7 +4806,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
         __pyx_v_last_idx = (__pyx_v_idx + 1);
 
-        /* "gensim/models/word2vec_corpusfile.pyx":169
+        /* "gensim/models/word2vec_corpusfile.pyx":175
  *                 if tmp - job_batch[idx].size() <= self.max_words_in_batch:
  *                     last_idx = idx + 1
  *                     break             # <<<<<<<<<<<<<<
@@ -4643,7 +4815,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
         goto __pyx_L14_break;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":167
+        /* "gensim/models/word2vec_corpusfile.pyx":173
  *             idx = job_batch.size() - 1
  *             while idx >= 0:
  *                 if tmp - job_batch[idx].size() <= self.max_words_in_batch:             # <<<<<<<<<<<<<<
@@ -4652,7 +4824,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":171
+      /* "gensim/models/word2vec_corpusfile.pyx":177
  *                     break
  *                 else:
  *                     tmp -= job_batch[idx].size()             # <<<<<<<<<<<<<<
@@ -4663,7 +4835,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
         __pyx_v_tmp = (__pyx_v_tmp - (__pyx_v_job_batch[__pyx_v_idx]).size());
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":173
+      /* "gensim/models/word2vec_corpusfile.pyx":179
  *                     tmp -= job_batch[idx].size()
  * 
  *                 idx -= 1             # <<<<<<<<<<<<<<
@@ -4674,7 +4846,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     }
     __pyx_L14_break:;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":175
+    /* "gensim/models/word2vec_corpusfile.pyx":181
  *                 idx -= 1
  * 
  *             for i in range(last_idx, job_batch.size()):             # <<<<<<<<<<<<<<
@@ -4686,7 +4858,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
     for (__pyx_t_8 = __pyx_v_last_idx; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
       __pyx_v_i = __pyx_t_8;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":176
+      /* "gensim/models/word2vec_corpusfile.pyx":182
  * 
  *             for i in range(last_idx, job_batch.size()):
  *                 self.buf_data.push_back(job_batch[i])             # <<<<<<<<<<<<<<
@@ -4703,11 +4875,11 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
         #ifdef WITH_THREAD
         __Pyx_PyGILState_Release(__pyx_gilstate_save);
         #endif
-        __PYX_ERR(1, 176, __pyx_L1_error)
+        __PYX_ERR(1, 182, __pyx_L1_error)
       }
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":177
+    /* "gensim/models/word2vec_corpusfile.pyx":183
  *             for i in range(last_idx, job_batch.size()):
  *                 self.buf_data.push_back(job_batch[i])
  *             job_batch.resize(last_idx)             # <<<<<<<<<<<<<<
@@ -4724,10 +4896,10 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
       #ifdef WITH_THREAD
       __Pyx_PyGILState_Release(__pyx_gilstate_save);
       #endif
-      __PYX_ERR(1, 177, __pyx_L1_error)
+      __PYX_ERR(1, 183, __pyx_L1_error)
     }
 
-    /* "gensim/models/word2vec_corpusfile.pyx":160
+    /* "gensim/models/word2vec_corpusfile.pyx":166
  *                 batch_size += chunk.size()
  * 
  *         if batch_size > self.max_words_in_batch:             # <<<<<<<<<<<<<<
@@ -4736,7 +4908,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
  */
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":179
+  /* "gensim/models/word2vec_corpusfile.pyx":185
  *             job_batch.resize(last_idx)
  * 
  *         return job_batch             # <<<<<<<<<<<<<<
@@ -4746,7 +4918,7 @@ static std::vector<std::vector<std::string> >  __pyx_f_6gensim_6models_19word2ve
   __pyx_r = __pyx_v_job_batch;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":134
+  /* "gensim/models/word2vec_corpusfile.pyx":140
  *         return rebuild_cython_line_sentence, (self.source, self.max_sentence_length)
  * 
  *     cpdef vector[vector[string]] next_batch(self) nogil except *:             # <<<<<<<<<<<<<<
@@ -4791,8 +4963,8 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSent
   PyObject *__pyx_t_2 = NULL;
   __Pyx_RefNannySetupContext("next_batch", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 134, __pyx_L1_error)
-  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 134, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(1, 140, __pyx_L1_error)
+  __pyx_t_2 = __pyx_convert_vector_to_py_std_3a__3a_vector_3c_std_3a__3a_string_3e___(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 140, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -5126,165 +5298,1823 @@ static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_6
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":182
- * 
- * 
- * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *         vector[vector[string]] &sentences, int sample, int hs, int window, int *total_words,
- *         int *effective_words, int *effective_sentences, unsigned long long *next_random,
- */
-
-static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(std::vector<std::vector<std::string> >  &__pyx_v_sentences, int __pyx_v_sample, int __pyx_v_hs, int __pyx_v_window, int *__pyx_v_total_words, int *__pyx_v_effective_words, int *__pyx_v_effective_sentences, unsigned PY_LONG_LONG *__pyx_v_next_random, __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_v_vocab, int *__pyx_v_sentence_idx, __pyx_t_5numpy_uint32_t *__pyx_v_indexes, int *__pyx_v_codelens, __pyx_t_5numpy_uint8_t **__pyx_v_codes, __pyx_t_5numpy_uint32_t **__pyx_v_points, __pyx_t_5numpy_uint32_t *__pyx_v_reduced_windows) {
-  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem __pyx_v_word;
-  std::string __pyx_v_token;
-  std::vector<std::string>  __pyx_v_sent;
-  int __pyx_v_i;
-  std::vector<std::vector<std::string> > ::iterator __pyx_t_1;
-  std::vector<std::string>  __pyx_t_2;
-  int __pyx_t_3;
-  long __pyx_t_4;
-  std::vector<std::string> ::iterator __pyx_t_5;
-  std::string __pyx_t_6;
-  int __pyx_t_7;
-  __pyx_t_5numpy_uint32_t __pyx_t_8;
-  int __pyx_t_9;
-  __pyx_t_5numpy_uint8_t *__pyx_t_10;
-  __pyx_t_5numpy_uint32_t *__pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-
-  /* "gensim/models/word2vec_corpusfile.pyx":191
- *     cdef vector[string] sent
- * 
- *     sentence_idx[0] = 0  # indices of the first sentence always start at 0             # <<<<<<<<<<<<<<
- *     for sent in sentences:
- *         if sent.empty():
- */
-  (__pyx_v_sentence_idx[0]) = 0;
-
-  /* "gensim/models/word2vec_corpusfile.pyx":192
+/* "gensim/models/word2vec_corpusfile.pyx":196
  * 
- *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
- *     for sent in sentences:             # <<<<<<<<<<<<<<
- *         if sent.empty():
- *             continue # ignore empty sentences; leave effective_sentences unchanged
- */
-  __pyx_t_1 = __pyx_v_sentences.begin();
-  for (;;) {
-    if (!(__pyx_t_1 != __pyx_v_sentences.end())) break;
-    __pyx_t_2 = *__pyx_t_1;
-    ++__pyx_t_1;
-    __pyx_v_sent = __pyx_t_2;
-
-    /* "gensim/models/word2vec_corpusfile.pyx":193
- *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
- *     for sent in sentences:
- *         if sent.empty():             # <<<<<<<<<<<<<<
- *             continue # ignore empty sentences; leave effective_sentences unchanged
- *         total_words[0] += sent.size()
+ *     """
+ *     def __init__(self, corpus, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
+ *         self.corpus = corpus  # keeps the memory maps alive
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
  */
-    __pyx_t_3 = (__pyx_v_sent.empty() != 0);
-    if (__pyx_t_3) {
 
-      /* "gensim/models/word2vec_corpusfile.pyx":194
- *     for sent in sentences:
- *         if sent.empty():
- *             continue # ignore empty sentences; leave effective_sentences unchanged             # <<<<<<<<<<<<<<
- *         total_words[0] += sent.size()
- * 
- */
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_corpus = 0;
+  PyObject *__pyx_v_offset = 0;
+  PyObject *__pyx_v_max_sentence_length = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_corpus,&__pyx_n_s_offset,&__pyx_n_s_max_sentence_length,0};
+    PyObject* values[3] = {0,0,0};
+    values[1] = ((PyObject *)__pyx_int_0);
+    values[2] = ((PyObject *)__pyx_int_10000);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_sentence_length);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 196, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_corpus = values[0];
+    __pyx_v_offset = values[1];
+    __pyx_v_max_sentence_length = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 196, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus___init__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), __pyx_v_corpus, __pyx_v_offset, __pyx_v_max_sentence_length);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus___init__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_corpus, PyObject *__pyx_v_offset, PyObject *__pyx_v_max_sentence_length) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PY_LONG_LONG __pyx_t_3;
+  size_t __pyx_t_4;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "gensim/models/word2vec_corpusfile.pyx":197
+ *     """
+ *     def __init__(self, corpus, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
+ *         self.corpus = corpus  # keeps the memory maps alive             # <<<<<<<<<<<<<<
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
+ *         self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)
+ */
+  __Pyx_INCREF(__pyx_v_corpus);
+  __Pyx_GIVEREF(__pyx_v_corpus);
+  __Pyx_GOTREF(__pyx_v_self->corpus);
+  __Pyx_DECREF(__pyx_v_self->corpus);
+  __pyx_v_self->corpus = __pyx_v_corpus;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":198
+ *     def __init__(self, corpus, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
+ *         self.corpus = corpus  # keeps the memory maps alive
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)             # <<<<<<<<<<<<<<
+ *         self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)
+ *         self.num_sentences = len(corpus)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_corpus, __pyx_n_s_ids); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 198, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 198, __pyx_L1_error)
+  __pyx_v_self->ids = ((__pyx_t_5numpy_int32_t *)PyArray_DATA(((PyArrayObject *)__pyx_t_1)));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":199
+ *         self.corpus = corpus  # keeps the memory maps alive
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
+ *         self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)             # <<<<<<<<<<<<<<
+ *         self.num_sentences = len(corpus)
+ *         self.start = offset
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_corpus, __pyx_n_s_offsets); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(1, 199, __pyx_L1_error)
+  __pyx_v_self->offsets = ((__pyx_t_5numpy_int64_t *)PyArray_DATA(((PyArrayObject *)__pyx_t_1)));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":200
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
+ *         self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)
+ *         self.num_sentences = len(corpus)             # <<<<<<<<<<<<<<
+ *         self.start = offset
+ *         self.max_sentence_length = max_sentence_length
+ */
+  __pyx_t_2 = PyObject_Length(__pyx_v_corpus); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(1, 200, __pyx_L1_error)
+  __pyx_v_self->num_sentences = __pyx_t_2;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":201
+ *         self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)
+ *         self.num_sentences = len(corpus)
+ *         self.start = offset             # <<<<<<<<<<<<<<
+ *         self.max_sentence_length = max_sentence_length
+ *         self.reset()
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_offset); if (unlikely((__pyx_t_3 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 201, __pyx_L1_error)
+  __pyx_v_self->start = __pyx_t_3;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":202
+ *         self.num_sentences = len(corpus)
+ *         self.start = offset
+ *         self.max_sentence_length = max_sentence_length             # <<<<<<<<<<<<<<
+ *         self.reset()
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_size_t(__pyx_v_max_sentence_length); if (unlikely((__pyx_t_4 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 202, __pyx_L1_error)
+  __pyx_v_self->max_sentence_length = __pyx_t_4;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":203
+ *         self.start = offset
+ *         self.max_sentence_length = max_sentence_length
+ *         self.reset()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bool_t is_eof(self) nogil:
+ */
+  __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(__pyx_v_self);
+
+  /* "gensim/models/word2vec_corpusfile.pyx":196
+ * 
+ *     """
+ *     def __init__(self, corpus, offset=0, max_sentence_length=MAX_SENTENCE_LEN):             # <<<<<<<<<<<<<<
+ *         self.corpus = corpus  # keeps the memory maps alive
+ *         self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":205
+ *         self.reset()
+ * 
+ *     cdef bool_t is_eof(self) nogil:             # <<<<<<<<<<<<<<
+ *         return self.sentence >= self.num_sentences
+ * 
+ */
+
+static bool __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  bool __pyx_r;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":206
+ * 
+ *     cdef bool_t is_eof(self) nogil:
+ *         return self.sentence >= self.num_sentences             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void reset(self) nogil:
+ */
+  __pyx_r = (__pyx_v_self->sentence >= __pyx_v_self->num_sentences);
+  goto __pyx_L0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":205
+ *         self.reset()
+ * 
+ *     cdef bool_t is_eof(self) nogil:             # <<<<<<<<<<<<<<
+ *         return self.sentence >= self.num_sentences
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":208
+ *         return self.sentence >= self.num_sentences
+ * 
+ *     cdef void reset(self) nogil:             # <<<<<<<<<<<<<<
+ *         self.sentence = self.start
+ *         self.position = 0
+ */
+
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PY_LONG_LONG __pyx_t_1;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":209
+ * 
+ *     cdef void reset(self) nogil:
+ *         self.sentence = self.start             # <<<<<<<<<<<<<<
+ *         self.position = 0
+ * 
+ */
+  __pyx_t_1 = __pyx_v_self->start;
+  __pyx_v_self->sentence = __pyx_t_1;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":210
+ *     cdef void reset(self) nogil:
+ *         self.sentence = self.start
+ *         self.position = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int next_batch(self) nogil:
+ */
+  __pyx_v_self->position = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":208
+ *         return self.sentence >= self.num_sentences
+ * 
+ *     cdef void reset(self) nogil:             # <<<<<<<<<<<<<<
+ *         self.sentence = self.start
+ *         self.position = 0
+ */
+
+  /* function exit code */
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":212
+ *         self.position = 0
+ * 
+ *     cdef int next_batch(self) nogil:             # <<<<<<<<<<<<<<
+ *         """Collect the next sentence chunks into `batch_words` and `batch_lengths`, and return their number.
+ * 
+ */
+
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PY_LONG_LONG __pyx_v_length;
+  size_t __pyx_v_batch_size;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  size_t __pyx_t_3;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":220
+ *         """
+ *         cdef long long length
+ *         cdef size_t batch_size = 0             # <<<<<<<<<<<<<<
+ * 
+ *         self.batch_words.clear()
+ */
+  __pyx_v_batch_size = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":222
+ *         cdef size_t batch_size = 0
+ * 
+ *         self.batch_words.clear()             # <<<<<<<<<<<<<<
+ *         self.batch_lengths.clear()
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+ */
+  __pyx_v_self->batch_words.clear();
+
+  /* "gensim/models/word2vec_corpusfile.pyx":223
+ * 
+ *         self.batch_words.clear()
+ *         self.batch_lengths.clear()             # <<<<<<<<<<<<<<
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+ */
+  __pyx_v_self->batch_lengths.clear();
+
+  /* "gensim/models/word2vec_corpusfile.pyx":224
+ *         self.batch_words.clear()
+ *         self.batch_lengths.clear()
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:             # <<<<<<<<<<<<<<
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+ *             if length > <long long>self.max_sentence_length:
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_self->sentence < __pyx_v_self->num_sentences) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_batch_size <= __pyx_v_self->max_sentence_length) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":225
+ *         self.batch_lengths.clear()
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position             # <<<<<<<<<<<<<<
+ *             if length > <long long>self.max_sentence_length:
+ *                 length = self.max_sentence_length
+ */
+    __pyx_v_length = (((__pyx_v_self->offsets[(__pyx_v_self->sentence + 1)]) - (__pyx_v_self->offsets[__pyx_v_self->sentence])) - __pyx_v_self->position);
+
+    /* "gensim/models/word2vec_corpusfile.pyx":226
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+ *             if length > <long long>self.max_sentence_length:             # <<<<<<<<<<<<<<
+ *                 length = self.max_sentence_length
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+ */
+    __pyx_t_1 = ((__pyx_v_length > ((PY_LONG_LONG)__pyx_v_self->max_sentence_length)) != 0);
+    if (__pyx_t_1) {
+
+      /* "gensim/models/word2vec_corpusfile.pyx":227
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+ *             if length > <long long>self.max_sentence_length:
+ *                 length = self.max_sentence_length             # <<<<<<<<<<<<<<
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+ *             self.batch_lengths.push_back(<int>length)
+ */
+      __pyx_t_3 = __pyx_v_self->max_sentence_length;
+      __pyx_v_length = __pyx_t_3;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":226
+ *         while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+ *             length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+ *             if length > <long long>self.max_sentence_length:             # <<<<<<<<<<<<<<
+ *                 length = self.max_sentence_length
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+ */
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":228
+ *             if length > <long long>self.max_sentence_length:
+ *                 length = self.max_sentence_length
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)             # <<<<<<<<<<<<<<
+ *             self.batch_lengths.push_back(<int>length)
+ *             batch_size += length
+ */
+    try {
+      __pyx_v_self->batch_words.push_back(((__pyx_v_self->ids + (__pyx_v_self->offsets[__pyx_v_self->sentence])) + __pyx_v_self->position));
+    } catch(...) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      __Pyx_CppExn2PyErr();
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(1, 228, __pyx_L1_error)
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":229
+ *                 length = self.max_sentence_length
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+ *             self.batch_lengths.push_back(<int>length)             # <<<<<<<<<<<<<<
+ *             batch_size += length
+ *             self.position += length
+ */
+    try {
+      __pyx_v_self->batch_lengths.push_back(((int)__pyx_v_length));
+    } catch(...) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      __Pyx_CppExn2PyErr();
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(1, 229, __pyx_L1_error)
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":230
+ *             self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+ *             self.batch_lengths.push_back(<int>length)
+ *             batch_size += length             # <<<<<<<<<<<<<<
+ *             self.position += length
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:
+ */
+    __pyx_v_batch_size = (__pyx_v_batch_size + __pyx_v_length);
+
+    /* "gensim/models/word2vec_corpusfile.pyx":231
+ *             self.batch_lengths.push_back(<int>length)
+ *             batch_size += length
+ *             self.position += length             # <<<<<<<<<<<<<<
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:
+ *                 self.sentence += 1
+ */
+    __pyx_v_self->position = (__pyx_v_self->position + __pyx_v_length);
+
+    /* "gensim/models/word2vec_corpusfile.pyx":232
+ *             batch_size += length
+ *             self.position += length
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:             # <<<<<<<<<<<<<<
+ *                 self.sentence += 1
+ *                 self.position = 0
+ */
+    __pyx_t_1 = ((((__pyx_v_self->offsets[__pyx_v_self->sentence]) + __pyx_v_self->position) >= (__pyx_v_self->offsets[(__pyx_v_self->sentence + 1)])) != 0);
+    if (__pyx_t_1) {
+
+      /* "gensim/models/word2vec_corpusfile.pyx":233
+ *             self.position += length
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:
+ *                 self.sentence += 1             # <<<<<<<<<<<<<<
+ *                 self.position = 0
+ *         return self.batch_words.size()
+ */
+      __pyx_v_self->sentence = (__pyx_v_self->sentence + 1);
+
+      /* "gensim/models/word2vec_corpusfile.pyx":234
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:
+ *                 self.sentence += 1
+ *                 self.position = 0             # <<<<<<<<<<<<<<
+ *         return self.batch_words.size()
+ * 
+ */
+      __pyx_v_self->position = 0;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":232
+ *             batch_size += length
+ *             self.position += length
+ *             if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:             # <<<<<<<<<<<<<<
+ *                 self.sentence += 1
+ *                 self.position = 0
+ */
+    }
+  }
+
+  /* "gensim/models/word2vec_corpusfile.pyx":235
+ *                 self.sentence += 1
+ *                 self.position = 0
+ *         return self.batch_words.size()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int read_document(self, np.int32_t **words) nogil:
+ */
+  __pyx_r = __pyx_v_self->batch_words.size();
+  goto __pyx_L0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":212
+ *         self.position = 0
+ * 
+ *     cdef int next_batch(self) nogil:             # <<<<<<<<<<<<<<
+ *         """Collect the next sentence chunks into `batch_words` and `batch_lengths`, and return their number.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("gensim.models.word2vec_corpusfile.CythonIdCorpus.next_batch", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":237
+ *         return self.batch_words.size()
+ * 
+ *     cdef int read_document(self, np.int32_t **words) nogil:             # <<<<<<<<<<<<<<
+ *         """Point `words` to the whole next sentence and return its length."""
+ *         cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]
+ */
+
+static int __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_read_document(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, __pyx_t_5numpy_int32_t **__pyx_v_words) {
+  int __pyx_v_length;
+  int __pyx_r;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":239
+ *     cdef int read_document(self, np.int32_t **words) nogil:
+ *         """Point `words` to the whole next sentence and return its length."""
+ *         cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]             # <<<<<<<<<<<<<<
+ *         words[0] = self.ids + self.offsets[self.sentence]
+ *         self.sentence += 1
+ */
+  __pyx_v_length = ((__pyx_v_self->offsets[(__pyx_v_self->sentence + 1)]) - (__pyx_v_self->offsets[__pyx_v_self->sentence]));
+
+  /* "gensim/models/word2vec_corpusfile.pyx":240
+ *         """Point `words` to the whole next sentence and return its length."""
+ *         cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]
+ *         words[0] = self.ids + self.offsets[self.sentence]             # <<<<<<<<<<<<<<
+ *         self.sentence += 1
+ *         self.position = 0
+ */
+  (__pyx_v_words[0]) = (__pyx_v_self->ids + (__pyx_v_self->offsets[__pyx_v_self->sentence]));
+
+  /* "gensim/models/word2vec_corpusfile.pyx":241
+ *         cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]
+ *         words[0] = self.ids + self.offsets[self.sentence]
+ *         self.sentence += 1             # <<<<<<<<<<<<<<
+ *         self.position = 0
+ *         return length
+ */
+  __pyx_v_self->sentence = (__pyx_v_self->sentence + 1);
+
+  /* "gensim/models/word2vec_corpusfile.pyx":242
+ *         words[0] = self.ids + self.offsets[self.sentence]
+ *         self.sentence += 1
+ *         self.position = 0             # <<<<<<<<<<<<<<
+ *         return length
+ * 
+ */
+  __pyx_v_self->position = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":243
+ *         self.sentence += 1
+ *         self.position = 0
+ *         return length             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_length;
+  goto __pyx_L0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":237
+ *         return self.batch_words.size()
+ * 
+ *     cdef int read_document(self, np.int32_t **words) nogil:             # <<<<<<<<<<<<<<
+ *         """Point `words` to the whole next sentence and return its length."""
+ *         cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pxd":70
+ * 
+ * cdef class CythonIdCorpus:
+ *     cdef public object corpus             # <<<<<<<<<<<<<<
+ *     cdef np.int32_t *ids
+ *     cdef np.int64_t *offsets
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->corpus);
+  __pyx_r = __pyx_v_self->corpus;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->corpus);
+  __Pyx_DECREF(__pyx_v_self->corpus);
+  __pyx_v_self->corpus = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_5__del__(PyObject *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_4__del__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_4__del__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->corpus);
+  __Pyx_DECREF(__pyx_v_self->corpus);
+  __pyx_v_self->corpus = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pxd":73
+ *     cdef np.int32_t *ids
+ *     cdef np.int64_t *offsets
+ *     cdef public long long num_sentences, start, sentence, position             # <<<<<<<<<<<<<<
+ *     cdef public size_t max_sentence_length
+ *     cdef vector[np.int32_t*] batch_words
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->num_sentences); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.num_sentences.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PY_LONG_LONG __pyx_t_1;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(2, 73, __pyx_L1_error)
+  __pyx_v_self->num_sentences = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.num_sentences.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->start); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.start.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PY_LONG_LONG __pyx_t_1;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(2, 73, __pyx_L1_error)
+  __pyx_v_self->start = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.start.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->sentence); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.sentence.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PY_LONG_LONG __pyx_t_1;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(2, 73, __pyx_L1_error)
+  __pyx_v_self->sentence = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.sentence.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->position); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 73, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.position.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PY_LONG_LONG __pyx_t_1;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_value); if (unlikely((__pyx_t_1 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(2, 73, __pyx_L1_error)
+  __pyx_v_self->position = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.position.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pxd":74
+ *     cdef np.int64_t *offsets
+ *     cdef public long long num_sentences, start, sentence, position
+ *     cdef public size_t max_sentence_length             # <<<<<<<<<<<<<<
+ *     cdef vector[np.int32_t*] batch_words
+ *     cdef vector[int] batch_lengths
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length___get__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length___get__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_self->max_sentence_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.max_sentence_length.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_2__set__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_2__set__(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  size_t __pyx_t_1;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __Pyx_PyInt_As_size_t(__pyx_v_value); if (unlikely((__pyx_t_1 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(2, 74, __pyx_L1_error)
+  __pyx_v_self->max_sentence_length = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.max_sentence_length.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_2__reduce_cython__[] = "CythonIdCorpus.__reduce_cython__(self)";
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_2__reduce_cython__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_4__setstate_cython__[] = "CythonIdCorpus.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_4__setstate_cython__(((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.CythonIdCorpus.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":246
+ * 
+ * 
+ * def id_corpus_or_none(corpus_file, offset):             # <<<<<<<<<<<<<<
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3id_corpus_or_none(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_2id_corpus_or_none[] = "id_corpus_or_none(corpus_file, offset)\nGet a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path.";
+static PyMethodDef __pyx_mdef_6gensim_6models_19word2vec_corpusfile_3id_corpus_or_none = {"id_corpus_or_none", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_3id_corpus_or_none, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_2id_corpus_or_none};
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3id_corpus_or_none(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_corpus_file = 0;
+  PyObject *__pyx_v_offset = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("id_corpus_or_none (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_corpus_file,&__pyx_n_s_offset,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("id_corpus_or_none", 1, 2, 2, 1); __PYX_ERR(1, 246, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "id_corpus_or_none") < 0)) __PYX_ERR(1, 246, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_corpus_file = values[0];
+    __pyx_v_offset = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("id_corpus_or_none", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 246, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.id_corpus_or_none", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_2id_corpus_or_none(__pyx_self, __pyx_v_corpus_file, __pyx_v_offset);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2id_corpus_or_none(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_RefNannySetupContext("id_corpus_or_none", 0);
+
+  /* "gensim/models/word2vec_corpusfile.pyx":248
+ * def id_corpus_or_none(corpus_file, offset):
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):             # <<<<<<<<<<<<<<
+ *         return None
+ *     return CythonIdCorpus(corpus_file, offset)
+ */
+  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_string_types); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_IsInstance(__pyx_v_corpus_file, __pyx_t_1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 248, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "gensim/models/word2vec_corpusfile.pyx":249
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):
+ *         return None             # <<<<<<<<<<<<<<
+ *     return CythonIdCorpus(corpus_file, offset)
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":248
+ * def id_corpus_or_none(corpus_file, offset):
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):             # <<<<<<<<<<<<<<
+ *         return None
+ *     return CythonIdCorpus(corpus_file, offset)
+ */
+  }
+
+  /* "gensim/models/word2vec_corpusfile.pyx":250
+ *     if isinstance(corpus_file, string_types):
+ *         return None
+ *     return CythonIdCorpus(corpus_file, offset)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_corpus_file);
+  __Pyx_GIVEREF(__pyx_v_corpus_file);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_corpus_file);
+  __Pyx_INCREF(__pyx_v_offset);
+  __Pyx_GIVEREF(__pyx_v_offset);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_offset);
+  __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus), __pyx_t_1, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":246
+ * 
+ * 
+ * def id_corpus_or_none(corpus_file, offset):             # <<<<<<<<<<<<<<
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.id_corpus_or_none", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":253
+ * 
+ * 
+ * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *         vector[vector[string]] &sentences, int sample, int hs, int window, int *total_words,
+ *         int *effective_words, int *effective_sentences, unsigned long long *next_random,
+ */
+
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(std::vector<std::vector<std::string> >  &__pyx_v_sentences, int __pyx_v_sample, int __pyx_v_hs, int __pyx_v_window, int *__pyx_v_total_words, int *__pyx_v_effective_words, int *__pyx_v_effective_sentences, unsigned PY_LONG_LONG *__pyx_v_next_random, __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_v_vocab, int *__pyx_v_sentence_idx, __pyx_t_5numpy_uint32_t *__pyx_v_indexes, int *__pyx_v_codelens, __pyx_t_5numpy_uint8_t **__pyx_v_codes, __pyx_t_5numpy_uint32_t **__pyx_v_points, __pyx_t_5numpy_uint32_t *__pyx_v_reduced_windows) {
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem __pyx_v_word;
+  std::string __pyx_v_token;
+  std::vector<std::string>  __pyx_v_sent;
+  int __pyx_v_i;
+  std::vector<std::vector<std::string> > ::iterator __pyx_t_1;
+  std::vector<std::string>  __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  std::vector<std::string> ::iterator __pyx_t_5;
+  std::string __pyx_t_6;
+  int __pyx_t_7;
+  __pyx_t_5numpy_uint32_t __pyx_t_8;
+  int __pyx_t_9;
+  __pyx_t_5numpy_uint8_t *__pyx_t_10;
+  __pyx_t_5numpy_uint32_t *__pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":262
+ *     cdef vector[string] sent
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0             # <<<<<<<<<<<<<<
+ *     for sent in sentences:
+ *         if sent.empty():
+ */
+  (__pyx_v_sentence_idx[0]) = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":263
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent in sentences:             # <<<<<<<<<<<<<<
+ *         if sent.empty():
+ *             continue # ignore empty sentences; leave effective_sentences unchanged
+ */
+  __pyx_t_1 = __pyx_v_sentences.begin();
+  for (;;) {
+    if (!(__pyx_t_1 != __pyx_v_sentences.end())) break;
+    __pyx_t_2 = *__pyx_t_1;
+    ++__pyx_t_1;
+    __pyx_v_sent = __pyx_t_2;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":264
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent in sentences:
+ *         if sent.empty():             # <<<<<<<<<<<<<<
+ *             continue # ignore empty sentences; leave effective_sentences unchanged
+ *         total_words[0] += sent.size()
+ */
+    __pyx_t_3 = (__pyx_v_sent.empty() != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/models/word2vec_corpusfile.pyx":265
+ *     for sent in sentences:
+ *         if sent.empty():
+ *             continue # ignore empty sentences; leave effective_sentences unchanged             # <<<<<<<<<<<<<<
+ *         total_words[0] += sent.size()
+ * 
+ */
       goto __pyx_L3_continue;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":193
- *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
- *     for sent in sentences:
- *         if sent.empty():             # <<<<<<<<<<<<<<
- *             continue # ignore empty sentences; leave effective_sentences unchanged
- *         total_words[0] += sent.size()
+      /* "gensim/models/word2vec_corpusfile.pyx":264
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent in sentences:
+ *         if sent.empty():             # <<<<<<<<<<<<<<
+ *             continue # ignore empty sentences; leave effective_sentences unchanged
+ *         total_words[0] += sent.size()
+ */
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":266
+ *         if sent.empty():
+ *             continue # ignore empty sentences; leave effective_sentences unchanged
+ *         total_words[0] += sent.size()             # <<<<<<<<<<<<<<
+ * 
+ *         for token in sent:
+ */
+    __pyx_t_4 = 0;
+    (__pyx_v_total_words[__pyx_t_4]) = ((__pyx_v_total_words[__pyx_t_4]) + __pyx_v_sent.size());
+
+    /* "gensim/models/word2vec_corpusfile.pyx":268
+ *         total_words[0] += sent.size()
+ * 
+ *         for token in sent:             # <<<<<<<<<<<<<<
+ *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+ *             if vocab[0].find(token) == vocab[0].end():
+ */
+    __pyx_t_5 = __pyx_v_sent.begin();
+    for (;;) {
+      if (!(__pyx_t_5 != __pyx_v_sent.end())) break;
+      __pyx_t_6 = *__pyx_t_5;
+      ++__pyx_t_5;
+      __pyx_v_token = __pyx_t_6;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":270
+ *         for token in sent:
+ *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+ *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      __pyx_t_3 = (((__pyx_v_vocab[0]).find(__pyx_v_token) == (__pyx_v_vocab[0]).end()) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/models/word2vec_corpusfile.pyx":271
+ *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+ *             if vocab[0].find(token) == vocab[0].end():
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             word = vocab[0][token]
+ */
+        goto __pyx_L6_continue;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":270
+ *         for token in sent:
+ *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
+ *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      }
+
+      /* "gensim/models/word2vec_corpusfile.pyx":273
+ *                 continue
+ * 
+ *             word = vocab[0][token]             # <<<<<<<<<<<<<<
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue
+ */
+      __pyx_v_word = ((__pyx_v_vocab[0])[__pyx_v_token]);
+
+      /* "gensim/models/word2vec_corpusfile.pyx":274
+ * 
+ *             word = vocab[0][token]
+ *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ */
+      __pyx_t_7 = (__pyx_v_sample != 0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_3 = __pyx_t_7;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_7 = ((__pyx_v_word.sample_int < __pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random)) != 0);
+      __pyx_t_3 = __pyx_t_7;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "gensim/models/word2vec_corpusfile.pyx":275
+ *             word = vocab[0][token]
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue             # <<<<<<<<<<<<<<
+ *             indexes[effective_words[0]] = word.index
+ *             if hs:
+ */
+        goto __pyx_L6_continue;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":274
+ * 
+ *             word = vocab[0][token]
+ *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ */
+      }
+
+      /* "gensim/models/word2vec_corpusfile.pyx":276
+ *             if sample and word.sample_int < random_int32(next_random):
+ *                 continue
+ *             indexes[effective_words[0]] = word.index             # <<<<<<<<<<<<<<
+ *             if hs:
+ *                 codelens[effective_words[0]] = word.code_len
+ */
+      __pyx_t_8 = __pyx_v_word.index;
+      (__pyx_v_indexes[(__pyx_v_effective_words[0])]) = __pyx_t_8;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":277
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ *             if hs:             # <<<<<<<<<<<<<<
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
  */
-    }
+      __pyx_t_3 = (__pyx_v_hs != 0);
+      if (__pyx_t_3) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":195
- *         if sent.empty():
- *             continue # ignore empty sentences; leave effective_sentences unchanged
- *         total_words[0] += sent.size()             # <<<<<<<<<<<<<<
+        /* "gensim/models/word2vec_corpusfile.pyx":278
+ *             indexes[effective_words[0]] = word.index
+ *             if hs:
+ *                 codelens[effective_words[0]] = word.code_len             # <<<<<<<<<<<<<<
+ *                 codes[effective_words[0]] = word.code
+ *                 points[effective_words[0]] = word.point
+ */
+        __pyx_t_9 = __pyx_v_word.code_len;
+        (__pyx_v_codelens[(__pyx_v_effective_words[0])]) = __pyx_t_9;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":279
+ *             if hs:
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code             # <<<<<<<<<<<<<<
+ *                 points[effective_words[0]] = word.point
+ *             effective_words[0] += 1
+ */
+        __pyx_t_10 = __pyx_v_word.code;
+        (__pyx_v_codes[(__pyx_v_effective_words[0])]) = __pyx_t_10;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":280
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
+ *                 points[effective_words[0]] = word.point             # <<<<<<<<<<<<<<
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:
+ */
+        __pyx_t_11 = __pyx_v_word.point;
+        (__pyx_v_points[(__pyx_v_effective_words[0])]) = __pyx_t_11;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":277
+ *                 continue
+ *             indexes[effective_words[0]] = word.index
+ *             if hs:             # <<<<<<<<<<<<<<
+ *                 codelens[effective_words[0]] = word.code_len
+ *                 codes[effective_words[0]] = word.code
+ */
+      }
+
+      /* "gensim/models/word2vec_corpusfile.pyx":281
+ *                 codes[effective_words[0]] = word.code
+ *                 points[effective_words[0]] = word.point
+ *             effective_words[0] += 1             # <<<<<<<<<<<<<<
+ *             if effective_words[0] == MAX_SENTENCE_LEN:
+ *                 break  # TODO: log warning, tally overflow?
+ */
+      __pyx_t_4 = 0;
+      (__pyx_v_effective_words[__pyx_t_4]) = ((__pyx_v_effective_words[__pyx_t_4]) + 1);
+
+      /* "gensim/models/word2vec_corpusfile.pyx":282
+ *                 points[effective_words[0]] = word.point
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *                 break  # TODO: log warning, tally overflow?
  * 
- *         for token in sent:
  */
-    __pyx_t_4 = 0;
-    (__pyx_v_total_words[__pyx_t_4]) = ((__pyx_v_total_words[__pyx_t_4]) + __pyx_v_sent.size());
+      __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+      if (__pyx_t_3) {
+
+        /* "gensim/models/word2vec_corpusfile.pyx":283
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:
+ *                 break  # TODO: log warning, tally overflow?             # <<<<<<<<<<<<<<
+ * 
+ *         # keep track of which words go into which sentence, so we don't train
+ */
+        goto __pyx_L7_break;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":197
+        /* "gensim/models/word2vec_corpusfile.pyx":282
+ *                 points[effective_words[0]] = word.point
+ *             effective_words[0] += 1
+ *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *                 break  # TODO: log warning, tally overflow?
+ * 
+ */
+      }
+
+      /* "gensim/models/word2vec_corpusfile.pyx":268
  *         total_words[0] += sent.size()
  * 
  *         for token in sent:             # <<<<<<<<<<<<<<
  *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
  *             if vocab[0].find(token) == vocab[0].end():
  */
-    __pyx_t_5 = __pyx_v_sent.begin();
-    for (;;) {
-      if (!(__pyx_t_5 != __pyx_v_sent.end())) break;
-      __pyx_t_6 = *__pyx_t_5;
-      ++__pyx_t_5;
-      __pyx_v_token = __pyx_t_6;
+      __pyx_L6_continue:;
+    }
+    __pyx_L7_break:;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":199
- *         for token in sent:
- *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
- *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
- *                 continue
+    /* "gensim/models/word2vec_corpusfile.pyx":288
+ *         # across sentence boundaries.
+ *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
+ *         effective_sentences[0] += 1             # <<<<<<<<<<<<<<
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  */
-      __pyx_t_3 = (((__pyx_v_vocab[0]).find(__pyx_v_token) == (__pyx_v_vocab[0]).end()) != 0);
-      if (__pyx_t_3) {
+    __pyx_t_4 = 0;
+    (__pyx_v_effective_sentences[__pyx_t_4]) = ((__pyx_v_effective_sentences[__pyx_t_4]) + 1);
 
-        /* "gensim/models/word2vec_corpusfile.pyx":200
- *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
- *             if vocab[0].find(token) == vocab[0].end():
- *                 continue             # <<<<<<<<<<<<<<
+    /* "gensim/models/word2vec_corpusfile.pyx":289
+ *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
+ *         effective_sentences[0] += 1
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]             # <<<<<<<<<<<<<<
  * 
- *             word = vocab[0][token]
+ *         if effective_words[0] == MAX_SENTENCE_LEN:
+ */
+    (__pyx_v_sentence_idx[(__pyx_v_effective_sentences[0])]) = (__pyx_v_effective_words[0]);
+
+    /* "gensim/models/word2vec_corpusfile.pyx":291
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *             break  # TODO: log warning, tally overflow?
+ * 
+ */
+    __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+    if (__pyx_t_3) {
+
+      /* "gensim/models/word2vec_corpusfile.pyx":292
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:
+ *             break  # TODO: log warning, tally overflow?             # <<<<<<<<<<<<<<
+ * 
+ *     # precompute "reduced window" offsets in a single randint() call
+ */
+      goto __pyx_L4_break;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":291
+ *         sentence_idx[effective_sentences[0]] = effective_words[0]
+ * 
+ *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
+ *             break  # TODO: log warning, tally overflow?
+ * 
+ */
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":263
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent in sentences:             # <<<<<<<<<<<<<<
+ *         if sent.empty():
+ *             continue # ignore empty sentences; leave effective_sentences unchanged
+ */
+    __pyx_L3_continue:;
+  }
+  __pyx_L4_break:;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":295
+ * 
+ *     # precompute "reduced window" offsets in a single randint() call
+ *     for i in range(effective_words[0]):             # <<<<<<<<<<<<<<
+ *         reduced_windows[i] = random_int32(next_random) % window
+ * 
+ */
+  __pyx_t_9 = (__pyx_v_effective_words[0]);
+  __pyx_t_12 = __pyx_t_9;
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_i = __pyx_t_13;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":296
+ *     # precompute "reduced window" offsets in a single randint() call
+ *     for i in range(effective_words[0]):
+ *         reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
+  }
+
+  /* "gensim/models/word2vec_corpusfile.pyx":253
+ * 
+ * 
+ * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *         vector[vector[string]] &sentences, int sample, int hs, int window, int *total_words,
+ *         int *effective_words, int *effective_sentences, unsigned long long *next_random,
+ */
+
+  /* function exit code */
+}
+
+/* "gensim/models/word2vec_corpusfile.pyx":299
+ * 
+ * 
+ * cdef void prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *         vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
+ *         int *effective_words, int *effective_sentences, unsigned long long *next_random,
+ */
+
+static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_id_batch(std::vector<__pyx_t_5numpy_int32_t *>  &__pyx_v_sentences, std::vector<int>  &__pyx_v_lengths, int __pyx_v_sample, int __pyx_v_hs, int __pyx_v_window, int *__pyx_v_total_words, int *__pyx_v_effective_words, int *__pyx_v_effective_sentences, unsigned PY_LONG_LONG *__pyx_v_next_random, struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_vocab, int *__pyx_v_sentence_idx, __pyx_t_5numpy_uint32_t *__pyx_v_indexes, int *__pyx_v_codelens, __pyx_t_5numpy_uint8_t **__pyx_v_codes, __pyx_t_5numpy_uint32_t **__pyx_v_points, __pyx_t_5numpy_uint32_t *__pyx_v_reduced_windows) {
+  struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *__pyx_v_word;
+  __pyx_t_5numpy_int32_t *__pyx_v_sent;
+  size_t __pyx_v_sent_no;
+  int __pyx_v_pos;
+  int __pyx_v_i;
+  std::vector<__pyx_t_5numpy_int32_t *> ::size_type __pyx_t_1;
+  std::vector<__pyx_t_5numpy_int32_t *> ::size_type __pyx_t_2;
+  size_t __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  __pyx_t_5numpy_uint32_t __pyx_t_10;
+  int __pyx_t_11;
+  __pyx_t_5numpy_uint8_t *__pyx_t_12;
+  __pyx_t_5numpy_uint32_t *__pyx_t_13;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":309
+ *     cdef int pos
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0             # <<<<<<<<<<<<<<
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:
+ */
+  (__pyx_v_sentence_idx[0]) = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":310
+ * 
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):             # <<<<<<<<<<<<<<
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ */
+  __pyx_t_1 = __pyx_v_sentences.size();
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_sent_no = __pyx_t_3;
+
+    /* "gensim/models/word2vec_corpusfile.pyx":311
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:             # <<<<<<<<<<<<<<
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ */
+    __pyx_t_4 = (((__pyx_v_lengths[__pyx_v_sent_no]) == 0) != 0);
+    if (__pyx_t_4) {
+
+      /* "gensim/models/word2vec_corpusfile.pyx":312
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged             # <<<<<<<<<<<<<<
+ *         sent = sentences[sent_no]
+ *         total_words[0] += lengths[sent_no]
+ */
+      goto __pyx_L3_continue;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":311
+ *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
+ *     for sent_no in range(sentences.size()):
+ *         if lengths[sent_no] == 0:             # <<<<<<<<<<<<<<
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ */
+    }
+
+    /* "gensim/models/word2vec_corpusfile.pyx":313
+ *         if lengths[sent_no] == 0:
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]             # <<<<<<<<<<<<<<
+ *         total_words[0] += lengths[sent_no]
+ * 
+ */
+    __pyx_v_sent = (__pyx_v_sentences[__pyx_v_sent_no]);
+
+    /* "gensim/models/word2vec_corpusfile.pyx":314
+ *             continue  # ignore empty sentences; leave effective_sentences unchanged
+ *         sent = sentences[sent_no]
+ *         total_words[0] += lengths[sent_no]             # <<<<<<<<<<<<<<
+ * 
+ *         for pos in range(lengths[sent_no]):
+ */
+    __pyx_t_5 = 0;
+    (__pyx_v_total_words[__pyx_t_5]) = ((__pyx_v_total_words[__pyx_t_5]) + (__pyx_v_lengths[__pyx_v_sent_no]));
+
+    /* "gensim/models/word2vec_corpusfile.pyx":316
+ *         total_words[0] += lengths[sent_no]
+ * 
+ *         for pos in range(lengths[sent_no]):             # <<<<<<<<<<<<<<
+ *             if sent[pos] < 0:
+ *                 continue  # out of vocabulary, same as a missing token
+ */
+    __pyx_t_6 = (__pyx_v_lengths[__pyx_v_sent_no]);
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_pos = __pyx_t_8;
+
+      /* "gensim/models/word2vec_corpusfile.pyx":317
+ * 
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:             # <<<<<<<<<<<<<<
+ *                 continue  # out of vocabulary, same as a missing token
+ * 
+ */
+      __pyx_t_4 = (((__pyx_v_sent[__pyx_v_pos]) < 0) != 0);
+      if (__pyx_t_4) {
+
+        /* "gensim/models/word2vec_corpusfile.pyx":318
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:
+ *                 continue  # out of vocabulary, same as a missing token             # <<<<<<<<<<<<<<
+ * 
+ *             word = &vocab[sent[pos]]
  */
         goto __pyx_L6_continue;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":199
- *         for token in sent:
- *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
- *             if vocab[0].find(token) == vocab[0].end():             # <<<<<<<<<<<<<<
- *                 continue
+        /* "gensim/models/word2vec_corpusfile.pyx":317
+ * 
+ *         for pos in range(lengths[sent_no]):
+ *             if sent[pos] < 0:             # <<<<<<<<<<<<<<
+ *                 continue  # out of vocabulary, same as a missing token
  * 
  */
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":202
- *                 continue
+      /* "gensim/models/word2vec_corpusfile.pyx":320
+ *                 continue  # out of vocabulary, same as a missing token
  * 
- *             word = vocab[0][token]             # <<<<<<<<<<<<<<
+ *             word = &vocab[sent[pos]]             # <<<<<<<<<<<<<<
  *             if sample and word.sample_int < random_int32(next_random):
  *                 continue
  */
-      __pyx_v_word = ((__pyx_v_vocab[0])[__pyx_v_token]);
+      __pyx_v_word = (&(__pyx_v_vocab[(__pyx_v_sent[__pyx_v_pos])]));
 
-      /* "gensim/models/word2vec_corpusfile.pyx":203
+      /* "gensim/models/word2vec_corpusfile.pyx":321
  * 
- *             word = vocab[0][token]
+ *             word = &vocab[sent[pos]]
  *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
  *                 continue
  *             indexes[effective_words[0]] = word.index
  */
-      __pyx_t_7 = (__pyx_v_sample != 0);
-      if (__pyx_t_7) {
+      __pyx_t_9 = (__pyx_v_sample != 0);
+      if (__pyx_t_9) {
       } else {
-        __pyx_t_3 = __pyx_t_7;
+        __pyx_t_4 = __pyx_t_9;
         goto __pyx_L10_bool_binop_done;
       }
-      __pyx_t_7 = ((__pyx_v_word.sample_int < __pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random)) != 0);
-      __pyx_t_3 = __pyx_t_7;
+      __pyx_t_9 = ((__pyx_v_word->sample_int < __pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random)) != 0);
+      __pyx_t_4 = __pyx_t_9;
       __pyx_L10_bool_binop_done:;
-      if (__pyx_t_3) {
+      if (__pyx_t_4) {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":204
- *             word = vocab[0][token]
+        /* "gensim/models/word2vec_corpusfile.pyx":322
+ *             word = &vocab[sent[pos]]
  *             if sample and word.sample_int < random_int32(next_random):
  *                 continue             # <<<<<<<<<<<<<<
  *             indexes[effective_words[0]] = word.index
@@ -5292,66 +7122,66 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_f
  */
         goto __pyx_L6_continue;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":203
+        /* "gensim/models/word2vec_corpusfile.pyx":321
  * 
- *             word = vocab[0][token]
+ *             word = &vocab[sent[pos]]
  *             if sample and word.sample_int < random_int32(next_random):             # <<<<<<<<<<<<<<
  *                 continue
  *             indexes[effective_words[0]] = word.index
  */
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":205
+      /* "gensim/models/word2vec_corpusfile.pyx":323
  *             if sample and word.sample_int < random_int32(next_random):
  *                 continue
  *             indexes[effective_words[0]] = word.index             # <<<<<<<<<<<<<<
  *             if hs:
  *                 codelens[effective_words[0]] = word.code_len
- */
-      __pyx_t_8 = __pyx_v_word.index;
-      (__pyx_v_indexes[(__pyx_v_effective_words[0])]) = __pyx_t_8;
+ */
+      __pyx_t_10 = __pyx_v_word->index;
+      (__pyx_v_indexes[(__pyx_v_effective_words[0])]) = __pyx_t_10;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":206
+      /* "gensim/models/word2vec_corpusfile.pyx":324
  *                 continue
  *             indexes[effective_words[0]] = word.index
  *             if hs:             # <<<<<<<<<<<<<<
  *                 codelens[effective_words[0]] = word.code_len
  *                 codes[effective_words[0]] = word.code
  */
-      __pyx_t_3 = (__pyx_v_hs != 0);
-      if (__pyx_t_3) {
+      __pyx_t_4 = (__pyx_v_hs != 0);
+      if (__pyx_t_4) {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":207
+        /* "gensim/models/word2vec_corpusfile.pyx":325
  *             indexes[effective_words[0]] = word.index
  *             if hs:
  *                 codelens[effective_words[0]] = word.code_len             # <<<<<<<<<<<<<<
  *                 codes[effective_words[0]] = word.code
  *                 points[effective_words[0]] = word.point
  */
-        __pyx_t_9 = __pyx_v_word.code_len;
-        (__pyx_v_codelens[(__pyx_v_effective_words[0])]) = __pyx_t_9;
+        __pyx_t_11 = __pyx_v_word->code_len;
+        (__pyx_v_codelens[(__pyx_v_effective_words[0])]) = __pyx_t_11;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":208
+        /* "gensim/models/word2vec_corpusfile.pyx":326
  *             if hs:
  *                 codelens[effective_words[0]] = word.code_len
  *                 codes[effective_words[0]] = word.code             # <<<<<<<<<<<<<<
  *                 points[effective_words[0]] = word.point
  *             effective_words[0] += 1
  */
-        __pyx_t_10 = __pyx_v_word.code;
-        (__pyx_v_codes[(__pyx_v_effective_words[0])]) = __pyx_t_10;
+        __pyx_t_12 = __pyx_v_word->code;
+        (__pyx_v_codes[(__pyx_v_effective_words[0])]) = __pyx_t_12;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":209
+        /* "gensim/models/word2vec_corpusfile.pyx":327
  *                 codelens[effective_words[0]] = word.code_len
  *                 codes[effective_words[0]] = word.code
  *                 points[effective_words[0]] = word.point             # <<<<<<<<<<<<<<
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:
  */
-        __pyx_t_11 = __pyx_v_word.point;
-        (__pyx_v_points[(__pyx_v_effective_words[0])]) = __pyx_t_11;
+        __pyx_t_13 = __pyx_v_word->point;
+        (__pyx_v_points[(__pyx_v_effective_words[0])]) = __pyx_t_13;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":206
+        /* "gensim/models/word2vec_corpusfile.pyx":324
  *                 continue
  *             indexes[effective_words[0]] = word.index
  *             if hs:             # <<<<<<<<<<<<<<
@@ -5360,67 +7190,59 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_f
  */
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":210
+      /* "gensim/models/word2vec_corpusfile.pyx":328
  *                 codes[effective_words[0]] = word.code
  *                 points[effective_words[0]] = word.point
  *             effective_words[0] += 1             # <<<<<<<<<<<<<<
  *             if effective_words[0] == MAX_SENTENCE_LEN:
- *                 break  # TODO: log warning, tally overflow?
+ *                 break
  */
-      __pyx_t_4 = 0;
-      (__pyx_v_effective_words[__pyx_t_4]) = ((__pyx_v_effective_words[__pyx_t_4]) + 1);
+      __pyx_t_5 = 0;
+      (__pyx_v_effective_words[__pyx_t_5]) = ((__pyx_v_effective_words[__pyx_t_5]) + 1);
 
-      /* "gensim/models/word2vec_corpusfile.pyx":211
+      /* "gensim/models/word2vec_corpusfile.pyx":329
  *                 points[effective_words[0]] = word.point
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
- *                 break  # TODO: log warning, tally overflow?
+ *                 break
  * 
  */
-      __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
-      if (__pyx_t_3) {
+      __pyx_t_4 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+      if (__pyx_t_4) {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":212
+        /* "gensim/models/word2vec_corpusfile.pyx":330
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:
- *                 break  # TODO: log warning, tally overflow?             # <<<<<<<<<<<<<<
+ *                 break             # <<<<<<<<<<<<<<
  * 
- *         # keep track of which words go into which sentence, so we don't train
+ *         effective_sentences[0] += 1
  */
         goto __pyx_L7_break;
 
-        /* "gensim/models/word2vec_corpusfile.pyx":211
+        /* "gensim/models/word2vec_corpusfile.pyx":329
  *                 points[effective_words[0]] = word.point
  *             effective_words[0] += 1
  *             if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
- *                 break  # TODO: log warning, tally overflow?
+ *                 break
  * 
  */
       }
-
-      /* "gensim/models/word2vec_corpusfile.pyx":197
- *         total_words[0] += sent.size()
- * 
- *         for token in sent:             # <<<<<<<<<<<<<<
- *             # leaving `effective_words` unchanged = shortening the sentence = expanding the window
- *             if vocab[0].find(token) == vocab[0].end():
- */
       __pyx_L6_continue:;
     }
     __pyx_L7_break:;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":217
- *         # across sentence boundaries.
- *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
+    /* "gensim/models/word2vec_corpusfile.pyx":332
+ *                 break
+ * 
  *         effective_sentences[0] += 1             # <<<<<<<<<<<<<<
  *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  */
-    __pyx_t_4 = 0;
-    (__pyx_v_effective_sentences[__pyx_t_4]) = ((__pyx_v_effective_sentences[__pyx_t_4]) + 1);
+    __pyx_t_5 = 0;
+    (__pyx_v_effective_sentences[__pyx_t_5]) = ((__pyx_v_effective_sentences[__pyx_t_5]) + 1);
 
-    /* "gensim/models/word2vec_corpusfile.pyx":218
- *         # indices of sentence number X are between <sentence_idx[X], sentence_idx[X])
+    /* "gensim/models/word2vec_corpusfile.pyx":333
+ * 
  *         effective_sentences[0] += 1
  *         sentence_idx[effective_sentences[0]] = effective_words[0]             # <<<<<<<<<<<<<<
  * 
@@ -5428,58 +7250,50 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_f
  */
     (__pyx_v_sentence_idx[(__pyx_v_effective_sentences[0])]) = (__pyx_v_effective_words[0]);
 
-    /* "gensim/models/word2vec_corpusfile.pyx":220
+    /* "gensim/models/word2vec_corpusfile.pyx":335
  *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
- *             break  # TODO: log warning, tally overflow?
+ *             break
  * 
  */
-    __pyx_t_3 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
-    if (__pyx_t_3) {
+    __pyx_t_4 = (((__pyx_v_effective_words[0]) == 0x2710) != 0);
+    if (__pyx_t_4) {
 
-      /* "gensim/models/word2vec_corpusfile.pyx":221
+      /* "gensim/models/word2vec_corpusfile.pyx":336
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:
- *             break  # TODO: log warning, tally overflow?             # <<<<<<<<<<<<<<
+ *             break             # <<<<<<<<<<<<<<
  * 
  *     # precompute "reduced window" offsets in a single randint() call
  */
       goto __pyx_L4_break;
 
-      /* "gensim/models/word2vec_corpusfile.pyx":220
+      /* "gensim/models/word2vec_corpusfile.pyx":335
  *         sentence_idx[effective_sentences[0]] = effective_words[0]
  * 
  *         if effective_words[0] == MAX_SENTENCE_LEN:             # <<<<<<<<<<<<<<
- *             break  # TODO: log warning, tally overflow?
+ *             break
  * 
  */
     }
-
-    /* "gensim/models/word2vec_corpusfile.pyx":192
- * 
- *     sentence_idx[0] = 0  # indices of the first sentence always start at 0
- *     for sent in sentences:             # <<<<<<<<<<<<<<
- *         if sent.empty():
- *             continue # ignore empty sentences; leave effective_sentences unchanged
- */
     __pyx_L3_continue:;
   }
   __pyx_L4_break:;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":224
+  /* "gensim/models/word2vec_corpusfile.pyx":339
  * 
  *     # precompute "reduced window" offsets in a single randint() call
  *     for i in range(effective_words[0]):             # <<<<<<<<<<<<<<
  *         reduced_windows[i] = random_int32(next_random) % window
  * 
  */
-  __pyx_t_9 = (__pyx_v_effective_words[0]);
-  __pyx_t_12 = __pyx_t_9;
-  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
-    __pyx_v_i = __pyx_t_13;
+  __pyx_t_6 = (__pyx_v_effective_words[0]);
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
 
-    /* "gensim/models/word2vec_corpusfile.pyx":225
+    /* "gensim/models/word2vec_corpusfile.pyx":340
  *     # precompute "reduced window" offsets in a single randint() call
  *     for i in range(effective_words[0]):
  *         reduced_windows[i] = random_int32(next_random) % window             # <<<<<<<<<<<<<<
@@ -5489,18 +7303,18 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_f
     (__pyx_v_reduced_windows[__pyx_v_i]) = (__pyx_f_6gensim_6models_14word2vec_inner_random_int32(__pyx_v_next_random) % __pyx_v_window);
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":182
+  /* "gensim/models/word2vec_corpusfile.pyx":299
  * 
  * 
- * cdef void prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *         vector[vector[string]] &sentences, int sample, int hs, int window, int *total_words,
+ * cdef void prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *         vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
  *         int *effective_words, int *effective_sentences, unsigned long long *next_random,
  */
 
   /* function exit code */
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":228
+/* "gensim/models/word2vec_corpusfile.pyx":343
  * 
  * 
  * cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil:             # <<<<<<<<<<<<<<
@@ -5511,7 +7325,7 @@ static void __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_f
 static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_alpha, __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_end_alpha, int __pyx_v_cur_epoch, int __pyx_v_num_epochs) {
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_r;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":229
+  /* "gensim/models/word2vec_corpusfile.pyx":344
  * 
  * cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil:
  *     return alpha - ((alpha - end_alpha) * (<REAL_t> cur_epoch) / num_epochs)             # <<<<<<<<<<<<<<
@@ -5521,7 +7335,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   __pyx_r = (__pyx_v_alpha - (((__pyx_v_alpha - __pyx_v_end_alpha) * ((__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t)__pyx_v_cur_epoch)) / __pyx_v_num_epochs));
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":228
+  /* "gensim/models/word2vec_corpusfile.pyx":343
  * 
  * 
  * cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil:             # <<<<<<<<<<<<<<
@@ -5534,7 +7348,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":232
+/* "gensim/models/word2vec_corpusfile.pyx":347
  * 
  * 
  * cdef REAL_t get_next_alpha(             # <<<<<<<<<<<<<<
@@ -5552,7 +7366,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_3;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_4;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":237
+  /* "gensim/models/word2vec_corpusfile.pyx":352
  *     cdef REAL_t epoch_progress
  * 
  *     if expected_examples != -1:             # <<<<<<<<<<<<<<
@@ -5562,7 +7376,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   __pyx_t_1 = ((__pyx_v_expected_examples != -1L) != 0);
   if (__pyx_t_1) {
 
-    /* "gensim/models/word2vec_corpusfile.pyx":239
+    /* "gensim/models/word2vec_corpusfile.pyx":354
  *     if expected_examples != -1:
  *         # examples-based decay
  *         epoch_progress = (<REAL_t> total_examples) / expected_examples             # <<<<<<<<<<<<<<
@@ -5571,7 +7385,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
  */
     __pyx_v_epoch_progress = (((__pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t)__pyx_v_total_examples) / __pyx_v_expected_examples);
 
-    /* "gensim/models/word2vec_corpusfile.pyx":237
+    /* "gensim/models/word2vec_corpusfile.pyx":352
  *     cdef REAL_t epoch_progress
  * 
  *     if expected_examples != -1:             # <<<<<<<<<<<<<<
@@ -5581,7 +7395,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
     goto __pyx_L3;
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":242
+  /* "gensim/models/word2vec_corpusfile.pyx":357
  *     else:
  *         # word-based decay
  *         epoch_progress = (<REAL_t> total_words) / expected_words             # <<<<<<<<<<<<<<
@@ -5593,7 +7407,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   }
   __pyx_L3:;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":244
+  /* "gensim/models/word2vec_corpusfile.pyx":359
  *         epoch_progress = (<REAL_t> total_words) / expected_words
  * 
  *     cdef REAL_t progress = (cur_epoch + epoch_progress) / num_epochs             # <<<<<<<<<<<<<<
@@ -5602,7 +7416,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
  */
   __pyx_v_progress = ((__pyx_v_cur_epoch + __pyx_v_epoch_progress) / __pyx_v_num_epochs);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":245
+  /* "gensim/models/word2vec_corpusfile.pyx":360
  * 
  *     cdef REAL_t progress = (cur_epoch + epoch_progress) / num_epochs
  *     cdef REAL_t next_alpha = start_alpha - (start_alpha - end_alpha) * progress             # <<<<<<<<<<<<<<
@@ -5611,7 +7425,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
  */
   __pyx_v_next_alpha = (__pyx_v_start_alpha - ((__pyx_v_start_alpha - __pyx_v_end_alpha) * __pyx_v_progress));
 
-  /* "gensim/models/word2vec_corpusfile.pyx":246
+  /* "gensim/models/word2vec_corpusfile.pyx":361
  *     cdef REAL_t progress = (cur_epoch + epoch_progress) / num_epochs
  *     cdef REAL_t next_alpha = start_alpha - (start_alpha - end_alpha) * progress
  *     return max(end_alpha, next_alpha)             # <<<<<<<<<<<<<<
@@ -5628,7 +7442,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   __pyx_r = __pyx_t_4;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":232
+  /* "gensim/models/word2vec_corpusfile.pyx":347
  * 
  * 
  * cdef REAL_t get_next_alpha(             # <<<<<<<<<<<<<<
@@ -5641,7 +7455,7 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":249
+/* "gensim/models/word2vec_corpusfile.pyx":364
  * 
  * 
  * def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -5650,10 +7464,10 @@ static __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_f_6gensim_6mod
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg[] = "train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1, compute_loss)\nTrain Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.word2vec.Word2Vec`\n        The Word2Vec model instance to train.\n    input_stream : iterable of list of str\n        The corpus used to train the model.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n    compute_loss : bool\n        Whether or not the training loss should be computed in this batch.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
-static PyMethodDef __pyx_mdef_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg = {"train_epoch_sg", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg};
-static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_4train_epoch_sg[] = "train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1, compute_loss)\nTrain Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.word2vec.Word2Vec`\n        The Word2Vec model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n    compute_loss : bool\n        Whether or not the training loss should be computed in this batch.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
+static PyMethodDef __pyx_mdef_6gensim_6models_19word2vec_corpusfile_5train_epoch_sg = {"train_epoch_sg", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_sg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_4train_epoch_sg};
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_sg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_model = 0;
   PyObject *__pyx_v_corpus_file = 0;
   PyObject *__pyx_v_offset = 0;
@@ -5706,59 +7520,59 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg(
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 1); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 1); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 2); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 2); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 3); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 3); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 4); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 4); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 5); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 5); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 6); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 6); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 7); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 7); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 8); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 8); __PYX_ERR(1, 364, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_compute_loss)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 9); __PYX_ERR(1, 249, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, 9); __PYX_ERR(1, 364, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_sg") < 0)) __PYX_ERR(1, 249, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_sg") < 0)) __PYX_ERR(1, 364, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
       goto __pyx_L5_argtuple_error;
@@ -5787,20 +7601,20 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg(
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 249, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("train_epoch_sg", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 364, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.train_epoch_sg", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__neu1, __pyx_v_compute_loss);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_sg(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__neu1, __pyx_v_compute_loss);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, CYTHON_UNUSED PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss) {
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_sg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, CYTHON_UNUSED PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss) {
   struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig __pyx_v_c;
   int __pyx_v_cur_epoch;
   int __pyx_v_num_epochs;
@@ -5809,7 +7623,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -5822,6 +7638,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   int __pyx_v_sent_idx;
   int __pyx_v_idx_start;
   int __pyx_v_idx_end;
+  int __pyx_v_num_sentences;
   std::vector<std::vector<std::string> >  __pyx_v_sentences;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -5831,44 +7648,45 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   int __pyx_t_4;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  std::vector<std::vector<std::string> >  __pyx_t_8;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_9;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  bool __pyx_t_9;
   int __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
+  std::vector<std::vector<std::string> >  __pyx_t_11;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_12;
   int __pyx_t_13;
   int __pyx_t_14;
   int __pyx_t_15;
   int __pyx_t_16;
-  PyObject *__pyx_t_17 = NULL;
-  PyObject *__pyx_t_18 = NULL;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
   __Pyx_RefNannySetupContext("train_epoch_sg", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":279
+  /* "gensim/models/word2vec_corpusfile.pyx":396
  * 
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 279, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 396, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":280
+  /* "gensim/models/word2vec_corpusfile.pyx":397
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 280, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 397, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 280, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 397, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":281
+  /* "gensim/models/word2vec_corpusfile.pyx":398
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -5879,12 +7697,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 281, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 398, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":282
+  /* "gensim/models/word2vec_corpusfile.pyx":399
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -5895,125 +7713,201 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 282, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 399, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":283
+  /* "gensim/models/word2vec_corpusfile.pyx":400
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 283, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 400, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 283, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 400, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":284
+  /* "gensim/models/word2vec_corpusfile.pyx":401
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 284, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 401, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 284, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 401, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":285
+  /* "gensim/models/word2vec_corpusfile.pyx":402
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 285, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 402, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 285, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 402, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_5, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":287
+  /* "gensim/models/word2vec_corpusfile.pyx":404
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_6 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 287, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 404, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_6);
-  __pyx_t_6 = 0;
+  __pyx_t_7 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 404, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 404, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 404, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_7) {
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7); __pyx_t_7 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 404, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(1, 404, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":405
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 405, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_offset);
+    __pyx_t_8 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_6, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 405, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_2 = __pyx_t_8;
+    __pyx_t_8 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":288
+  /* "gensim/models/word2vec_corpusfile.pyx":406
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":407
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(1, 288, __pyx_L1_error)
-  __pyx_t_6 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_6);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_6);
-  __pyx_t_6 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(1, 407, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":291
+  /* "gensim/models/word2vec_corpusfile.pyx":410
  * 
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0             # <<<<<<<<<<<<<<
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  */
   __pyx_v_effective_words = 0;
   __pyx_v_effective_sentences = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":292
+  /* "gensim/models/word2vec_corpusfile.pyx":411
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0             # <<<<<<<<<<<<<<
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  */
   __pyx_v_total_effective_words = 0;
   __pyx_v_total_sentences = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":295
- *     cdef int sent_idx, idx_start, idx_end
+  /* "gensim/models/word2vec_corpusfile.pyx":414
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  *     init_w2v_config(&c, model, _alpha, compute_loss, _work)             # <<<<<<<<<<<<<<
  * 
  *     cdef vector[vector[string]] sentences
  */
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 295, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = __pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_6, __pyx_v_compute_loss, __pyx_v__work, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 295, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 414, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_8 = __pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v_compute_loss, __pyx_v__work, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":299
+  /* "gensim/models/word2vec_corpusfile.pyx":418
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -6023,83 +7917,186 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
       #endif
       /*try:*/ {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":300
+        /* "gensim/models/word2vec_corpusfile.pyx":419
  * 
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_sentences = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/word2vec_corpusfile.pyx":420
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
  */
-        __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_input_stream, 0);
+          __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(__pyx_v_id_stream);
 
-        /* "gensim/models/word2vec_corpusfile.pyx":301
+          /* "gensim/models/word2vec_corpusfile.pyx":419
+ * 
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/word2vec_corpusfile.pyx":422
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":423
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
- *             effective_words = 0
  */
         while (1) {
-          __pyx_t_7 = (__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_7) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_9 = __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_9 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_10 = (__pyx_t_9 != 0);
+          if (!__pyx_t_10) {
           } else {
-            __pyx_t_3 = __pyx_t_7;
-            goto __pyx_L8_bool_binop_done;
+            __pyx_t_3 = __pyx_t_10;
+            goto __pyx_L9_bool_binop_done;
           }
-          __pyx_t_7 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_7;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_7 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_7) break;
-
-          /* "gensim/models/word2vec_corpusfile.pyx":302
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+
+          /* "gensim/models/word2vec_corpusfile.pyx":424
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_sentences = 0
+ *             effective_words = 0
+ */
+          __pyx_t_10 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_10;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/word2vec_corpusfile.pyx":423
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_sentences = 0
+ */
+          __pyx_t_10 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_10) break;
+
+          /* "gensim/models/word2vec_corpusfile.pyx":425
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0             # <<<<<<<<<<<<<<
  *             effective_words = 0
  * 
  */
           __pyx_v_effective_sentences = 0;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":303
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+          /* "gensim/models/word2vec_corpusfile.pyx":426
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             sentences = input_stream.next_batch()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":305
+          /* "gensim/models/word2vec_corpusfile.pyx":428
  *             effective_words = 0
  * 
- *             sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
- * 
- *             prepare_c_structures_for_batch(
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+          __pyx_t_10 = (__pyx_v_indexed != 0);
+          if (__pyx_t_10) {
+
+            /* "gensim/models/word2vec_corpusfile.pyx":430
+ *             if indexed:
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_batch(
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
  */
-          __pyx_t_8 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 305, __pyx_L4_error)
-          __pyx_v_sentences = __pyx_t_8;
+            __pyx_v_num_sentences = __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch(__pyx_v_id_stream);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":309
- *             prepare_c_structures_for_batch(
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,             # <<<<<<<<<<<<<<
- *                 c.codelens, c.codes, c.points, c.reduced_windows)
+            /* "gensim/models/word2vec_corpusfile.pyx":431
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ *                 prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ *                     &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+ */
+            __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_id_batch(__pyx_v_id_stream->batch_words, __pyx_v_id_stream->batch_lengths, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr(__pyx_v_vocab), __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+
+            /* "gensim/models/word2vec_corpusfile.pyx":428
+ *             effective_words = 0
  * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/word2vec_corpusfile.pyx":436
+ *                     c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+ *             else:
+ *                 sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(
+ */
+          /*else*/ {
+            __pyx_t_11 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 436, __pyx_L4_error)
+            __pyx_v_sentences = __pyx_t_11;
+
+            /* "gensim/models/word2vec_corpusfile.pyx":437
+ *             else:
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
  */
-          __pyx_t_9 = __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 309, __pyx_L4_error)
+            __pyx_v_num_sentences = __pyx_v_sentences.size();
 
-          /* "gensim/models/word2vec_corpusfile.pyx":307
- *             sentences = input_stream.next_batch()
+            /* "gensim/models/word2vec_corpusfile.pyx":440
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,             # <<<<<<<<<<<<<<
+ *                     c.codelens, c.codes, c.points, c.reduced_windows)
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
- *                 &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
  */
-          __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_9, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+            __pyx_t_12 = __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 440, __pyx_L4_error)
+
+            /* "gensim/models/word2vec_corpusfile.pyx":438
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
+ */
+            __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_12, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":312
- *                 c.codelens, c.codes, c.points, c.reduced_windows)
+          /* "gensim/models/word2vec_corpusfile.pyx":443
+ *                     c.codelens, c.codes, c.points, c.reduced_windows)
  * 
  *             for sent_idx in range(effective_sentences):             # <<<<<<<<<<<<<<
  *                 idx_start = c.sentence_idx[sent_idx]
@@ -6107,10 +8104,10 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
           __pyx_t_1 = __pyx_v_effective_sentences;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_4; __pyx_t_10+=1) {
-            __pyx_v_sent_idx = __pyx_t_10;
+          for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_4; __pyx_t_13+=1) {
+            __pyx_v_sent_idx = __pyx_t_13;
 
-            /* "gensim/models/word2vec_corpusfile.pyx":313
+            /* "gensim/models/word2vec_corpusfile.pyx":444
  * 
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]             # <<<<<<<<<<<<<<
@@ -6119,7 +8116,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
             __pyx_v_idx_start = (__pyx_v_c.sentence_idx[__pyx_v_sent_idx]);
 
-            /* "gensim/models/word2vec_corpusfile.pyx":314
+            /* "gensim/models/word2vec_corpusfile.pyx":445
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]             # <<<<<<<<<<<<<<
@@ -6128,19 +8125,19 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
             __pyx_v_idx_end = (__pyx_v_c.sentence_idx[(__pyx_v_sent_idx + 1)]);
 
-            /* "gensim/models/word2vec_corpusfile.pyx":315
+            /* "gensim/models/word2vec_corpusfile.pyx":446
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):             # <<<<<<<<<<<<<<
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  */
-            __pyx_t_11 = __pyx_v_idx_end;
-            __pyx_t_12 = __pyx_t_11;
-            for (__pyx_t_13 = __pyx_v_idx_start; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
-              __pyx_v_i = __pyx_t_13;
+            __pyx_t_14 = __pyx_v_idx_end;
+            __pyx_t_15 = __pyx_t_14;
+            for (__pyx_t_16 = __pyx_v_idx_start; __pyx_t_16 < __pyx_t_15; __pyx_t_16+=1) {
+              __pyx_v_i = __pyx_t_16;
 
-              /* "gensim/models/word2vec_corpusfile.pyx":316
+              /* "gensim/models/word2vec_corpusfile.pyx":447
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -6149,17 +8146,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
               __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/word2vec_corpusfile.pyx":317
+              /* "gensim/models/word2vec_corpusfile.pyx":448
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  */
-              __pyx_t_7 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
-              if (__pyx_t_7) {
+              __pyx_t_10 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
+              if (__pyx_t_10) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":318
+                /* "gensim/models/word2vec_corpusfile.pyx":449
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  *                         j = idx_start             # <<<<<<<<<<<<<<
@@ -6168,7 +8165,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
                 __pyx_v_j = __pyx_v_idx_start;
 
-                /* "gensim/models/word2vec_corpusfile.pyx":317
+                /* "gensim/models/word2vec_corpusfile.pyx":448
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
@@ -6177,7 +8174,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
               }
 
-              /* "gensim/models/word2vec_corpusfile.pyx":319
+              /* "gensim/models/word2vec_corpusfile.pyx":450
  *                     if j < idx_start:
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -6186,67 +8183,104 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
               __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/word2vec_corpusfile.pyx":320
+              /* "gensim/models/word2vec_corpusfile.pyx":451
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
  *                         k = idx_end
- *                     for j in range(j, k):
+ *                     if c.shared_negatives:
  */
-              __pyx_t_7 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
-              if (__pyx_t_7) {
+              __pyx_t_10 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
+              if (__pyx_t_10) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":321
+                /* "gensim/models/word2vec_corpusfile.pyx":452
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:
  *                         k = idx_end             # <<<<<<<<<<<<<<
- *                     for j in range(j, k):
- *                         if j == i:
+ *                     if c.shared_negatives:
+ *                         c.next_random = w2v_fast_window_sg_neg(
  */
                 __pyx_v_k = __pyx_v_idx_end;
 
-                /* "gensim/models/word2vec_corpusfile.pyx":320
+                /* "gensim/models/word2vec_corpusfile.pyx":451
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
  *                         k = idx_end
- *                     for j in range(j, k):
+ *                     if c.shared_negatives:
  */
               }
 
-              /* "gensim/models/word2vec_corpusfile.pyx":322
+              /* "gensim/models/word2vec_corpusfile.pyx":453
+ *                     if k > idx_end:
+ *                         k = idx_end
+ *                     if c.shared_negatives:             # <<<<<<<<<<<<<<
+ *                         c.next_random = w2v_fast_window_sg_neg(
+ *                             c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k,
+ */
+              __pyx_t_10 = (__pyx_v_c.shared_negatives != 0);
+              if (__pyx_t_10) {
+
+                /* "gensim/models/word2vec_corpusfile.pyx":454
+ *                         k = idx_end
+ *                     if c.shared_negatives:
+ *                         c.next_random = w2v_fast_window_sg_neg(             # <<<<<<<<<<<<<<
+ *                             c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k,
+ *                             c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+ */
+                __pyx_v_c.next_random = __pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_window_sg_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.syn0, __pyx_v_c.syn1neg, __pyx_v_c.size, __pyx_v_c.indexes, __pyx_v_i, __pyx_v_j, __pyx_v_k, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.next_random, __pyx_v_c.word_locks, __pyx_v_c.compute_loss, (&__pyx_v_c.running_training_loss));
+
+                /* "gensim/models/word2vec_corpusfile.pyx":457
+ *                             c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k,
+ *                             c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     for j in range(j, k):
+ *                         if j == i:
+ */
+                goto __pyx_L14_continue;
+
+                /* "gensim/models/word2vec_corpusfile.pyx":453
  *                     if k > idx_end:
  *                         k = idx_end
+ *                     if c.shared_negatives:             # <<<<<<<<<<<<<<
+ *                         c.next_random = w2v_fast_window_sg_neg(
+ *                             c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k,
+ */
+              }
+
+              /* "gensim/models/word2vec_corpusfile.pyx":458
+ *                             c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+ *                         continue
  *                     for j in range(j, k):             # <<<<<<<<<<<<<<
  *                         if j == i:
  *                             continue
  */
-              __pyx_t_14 = __pyx_v_k;
-              __pyx_t_15 = __pyx_t_14;
-              for (__pyx_t_16 = __pyx_v_j; __pyx_t_16 < __pyx_t_15; __pyx_t_16+=1) {
-                __pyx_v_j = __pyx_t_16;
+              __pyx_t_17 = __pyx_v_k;
+              __pyx_t_18 = __pyx_t_17;
+              for (__pyx_t_19 = __pyx_v_j; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+                __pyx_v_j = __pyx_t_19;
 
-                /* "gensim/models/word2vec_corpusfile.pyx":323
- *                         k = idx_end
+                /* "gensim/models/word2vec_corpusfile.pyx":459
+ *                         continue
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
  *                             continue
  *                         if c.hs:
  */
-                __pyx_t_7 = ((__pyx_v_j == __pyx_v_i) != 0);
-                if (__pyx_t_7) {
+                __pyx_t_10 = ((__pyx_v_j == __pyx_v_i) != 0);
+                if (__pyx_t_10) {
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":324
+                  /* "gensim/models/word2vec_corpusfile.pyx":460
  *                     for j in range(j, k):
  *                         if j == i:
  *                             continue             # <<<<<<<<<<<<<<
  *                         if c.hs:
  *                             w2v_fast_sentence_sg_hs(
  */
-                  goto __pyx_L16_continue;
+                  goto __pyx_L19_continue;
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":323
- *                         k = idx_end
+                  /* "gensim/models/word2vec_corpusfile.pyx":459
+ *                         continue
  *                     for j in range(j, k):
  *                         if j == i:             # <<<<<<<<<<<<<<
  *                             continue
@@ -6254,17 +8288,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
                 }
 
-                /* "gensim/models/word2vec_corpusfile.pyx":325
+                /* "gensim/models/word2vec_corpusfile.pyx":461
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
  *                             w2v_fast_sentence_sg_hs(
  *                                 c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j],
  */
-                __pyx_t_7 = (__pyx_v_c.hs != 0);
-                if (__pyx_t_7) {
+                __pyx_t_10 = (__pyx_v_c.hs != 0);
+                if (__pyx_t_10) {
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":326
+                  /* "gensim/models/word2vec_corpusfile.pyx":462
  *                             continue
  *                         if c.hs:
  *                             w2v_fast_sentence_sg_hs(             # <<<<<<<<<<<<<<
@@ -6273,7 +8307,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
                   __pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), (__pyx_v_c.codelens[__pyx_v_i]), __pyx_v_c.syn0, __pyx_v_c.syn1, __pyx_v_c.size, (__pyx_v_c.indexes[__pyx_v_j]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.word_locks, __pyx_v_c.compute_loss, (&__pyx_v_c.running_training_loss));
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":325
+                  /* "gensim/models/word2vec_corpusfile.pyx":461
  *                         if j == i:
  *                             continue
  *                         if c.hs:             # <<<<<<<<<<<<<<
@@ -6282,17 +8316,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
                 }
 
-                /* "gensim/models/word2vec_corpusfile.pyx":329
+                /* "gensim/models/word2vec_corpusfile.pyx":465
  *                                 c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j],
  *                                 c.alpha, c.work, c.word_locks, c.compute_loss, &c.running_training_loss)
  *                         if c.negative:             # <<<<<<<<<<<<<<
  *                             c.next_random = w2v_fast_sentence_sg_neg(
  *                                 c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size,
  */
-                __pyx_t_7 = (__pyx_v_c.negative != 0);
-                if (__pyx_t_7) {
+                __pyx_t_10 = (__pyx_v_c.negative != 0);
+                if (__pyx_t_10) {
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":330
+                  /* "gensim/models/word2vec_corpusfile.pyx":466
  *                                 c.alpha, c.work, c.word_locks, c.compute_loss, &c.running_training_loss)
  *                         if c.negative:
  *                             c.next_random = w2v_fast_sentence_sg_neg(             # <<<<<<<<<<<<<<
@@ -6301,7 +8335,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
                   __pyx_v_c.next_random = __pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.syn0, __pyx_v_c.syn1neg, __pyx_v_c.size, (__pyx_v_c.indexes[__pyx_v_i]), (__pyx_v_c.indexes[__pyx_v_j]), __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_c.next_random, __pyx_v_c.word_locks, __pyx_v_c.compute_loss, (&__pyx_v_c.running_training_loss));
 
-                  /* "gensim/models/word2vec_corpusfile.pyx":329
+                  /* "gensim/models/word2vec_corpusfile.pyx":465
  *                                 c.points[i], c.codes[i], c.codelens[i], c.syn0, c.syn1, c.size, c.indexes[j],
  *                                 c.alpha, c.work, c.word_locks, c.compute_loss, &c.running_training_loss)
  *                         if c.negative:             # <<<<<<<<<<<<<<
@@ -6309,30 +8343,31 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  *                                 c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size,
  */
                 }
-                __pyx_L16_continue:;
+                __pyx_L19_continue:;
               }
+              __pyx_L14_continue:;
             }
           }
 
-          /* "gensim/models/word2vec_corpusfile.pyx":335
+          /* "gensim/models/word2vec_corpusfile.pyx":471
  *                                 c.compute_loss, &c.running_training_loss)
  * 
- *             total_sentences += sentences.size()             # <<<<<<<<<<<<<<
+ *             total_sentences += num_sentences             # <<<<<<<<<<<<<<
  *             total_effective_words += effective_words
  * 
  */
-          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_sentences.size());
+          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_num_sentences);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":336
+          /* "gensim/models/word2vec_corpusfile.pyx":472
  * 
- *             total_sentences += sentences.size()
+ *             total_sentences += num_sentences
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
  * 
  *             c.alpha = get_next_alpha(
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":338
+          /* "gensim/models/word2vec_corpusfile.pyx":474
  *             total_effective_words += effective_words
  * 
  *             c.alpha = get_next_alpha(             # <<<<<<<<<<<<<<
@@ -6343,12 +8378,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
         }
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":299
+      /* "gensim/models/word2vec_corpusfile.pyx":418
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -6369,19 +8404,19 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
       }
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":342
+  /* "gensim/models/word2vec_corpusfile.pyx":478
  *                 expected_examples, expected_words, cur_epoch, num_epochs)
  * 
  *     model.running_training_loss = c.running_training_loss             # <<<<<<<<<<<<<<
  *     return total_sentences, total_effective_words, total_words
  * 
  */
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_c.running_training_loss); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 342, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_model, __pyx_n_s_running_training_loss, __pyx_t_2) < 0) __PYX_ERR(1, 342, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_c.running_training_loss); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 478, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_model, __pyx_n_s_running_training_loss, __pyx_t_8) < 0) __PYX_ERR(1, 478, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":343
+  /* "gensim/models/word2vec_corpusfile.pyx":479
  * 
  *     model.running_training_loss = c.running_training_loss
  *     return total_sentences, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -6389,28 +8424,28 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 343, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 479, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 479, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 343, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 479, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_17 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_17)) __PYX_ERR(1, 343, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_17);
-  __pyx_t_18 = PyTuple_New(3); if (unlikely(!__pyx_t_18)) __PYX_ERR(1, 343, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_18);
+  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 479, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_8);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_18, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
-  PyTuple_SET_ITEM(__pyx_t_18, 1, __pyx_t_6);
-  __Pyx_GIVEREF(__pyx_t_17);
-  PyTuple_SET_ITEM(__pyx_t_18, 2, __pyx_t_17);
+  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_6);
+  __pyx_t_8 = 0;
   __pyx_t_2 = 0;
   __pyx_t_6 = 0;
-  __pyx_t_17 = 0;
-  __pyx_r = __pyx_t_18;
-  __pyx_t_18 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":249
+  /* "gensim/models/word2vec_corpusfile.pyx":364
  * 
  * 
  * def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -6422,11 +8457,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_17);
-  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.train_epoch_sg", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -6434,7 +8470,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
   return __pyx_r;
 }
 
-/* "gensim/models/word2vec_corpusfile.pyx":346
+/* "gensim/models/word2vec_corpusfile.pyx":482
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -6443,10 +8479,10 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_2train_epoch_sg(
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbow[] = "train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1, compute_loss)\nTrain CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.word2vec.Word2Vec`\n        The Word2Vec model instance to train.\n    input_stream : iterable of list of str\n        The corpus used to train the model.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n    compute_loss : bool\n        Whether or not the training loss should be computed in this batch.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
-static PyMethodDef __pyx_mdef_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbow = {"train_epoch_cbow", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbow, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbow};
-static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_7train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_6gensim_6models_19word2vec_corpusfile_6train_epoch_cbow[] = "train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work, _neu1, compute_loss)\nTrain CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.\n\n    Called internally from :meth:`~gensim.models.word2vec.Word2Vec.train`.\n\n    Parameters\n    ----------\n    model : :class:`~gensim.models.word2vec.Word2Vec`\n        The Word2Vec model instance to train.\n    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}\n        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.\n    offset : int\n        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.\n    _cur_epoch : int\n        Current epoch number. Used for calculating and decaying learning rate.\n    _work : np.ndarray\n        Private working memory for each worker.\n    _neu1 : np.ndarray\n        Private working memory for each worker.\n    compute_loss : bool\n        Whether or not the training loss should be computed in this batch.\n\n    Returns\n    -------\n    int\n        Number of words in the vocabulary actually used for training (They already existed in the vocabulary\n        and were not discarded by negative sampling).\n    ";
+static PyMethodDef __pyx_mdef_6gensim_6models_19word2vec_corpusfile_7train_epoch_cbow = {"train_epoch_cbow", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_7train_epoch_cbow, METH_VARARGS|METH_KEYWORDS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_6train_epoch_cbow};
+static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_7train_epoch_cbow(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_model = 0;
   PyObject *__pyx_v_corpus_file = 0;
   PyObject *__pyx_v_offset = 0;
@@ -6499,59 +8535,59 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbo
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_corpus_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 1); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 1); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 2); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 2); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cython_vocab)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 3); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 3); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_cur_epoch)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 4); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 4); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_examples)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 5); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 5); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_expected_words)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 6); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 6); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_work)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 7); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 7); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_neu1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 8); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 8); __PYX_ERR(1, 482, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_compute_loss)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 9); __PYX_ERR(1, 346, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, 9); __PYX_ERR(1, 482, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_cbow") < 0)) __PYX_ERR(1, 346, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "train_epoch_cbow") < 0)) __PYX_ERR(1, 482, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
       goto __pyx_L5_argtuple_error;
@@ -6580,20 +8616,20 @@ static PyObject *__pyx_pw_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbo
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 346, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("train_epoch_cbow", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 482, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.train_epoch_cbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbow(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__neu1, __pyx_v_compute_loss);
+  __pyx_r = __pyx_pf_6gensim_6models_19word2vec_corpusfile_6train_epoch_cbow(__pyx_self, __pyx_v_model, __pyx_v_corpus_file, __pyx_v_offset, __pyx_v__cython_vocab, __pyx_v__cur_epoch, __pyx_v__expected_examples, __pyx_v__expected_words, __pyx_v__work, __pyx_v__neu1, __pyx_v_compute_loss);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbow(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss) {
+static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_6train_epoch_cbow(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_model, PyObject *__pyx_v_corpus_file, PyObject *__pyx_v_offset, PyObject *__pyx_v__cython_vocab, PyObject *__pyx_v__cur_epoch, PyObject *__pyx_v__expected_examples, PyObject *__pyx_v__expected_words, PyObject *__pyx_v__work, PyObject *__pyx_v__neu1, PyObject *__pyx_v_compute_loss) {
   struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig __pyx_v_c;
   int __pyx_v_cur_epoch;
   int __pyx_v_num_epochs;
@@ -6602,7 +8638,9 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_start_alpha;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v_end_alpha;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_v__alpha;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *__pyx_v_id_stream = 0;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *__pyx_v_input_stream = 0;
+  int __pyx_v_indexed;
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *__pyx_v_vocab = 0;
   int __pyx_v_i;
   int __pyx_v_j;
@@ -6615,6 +8653,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   int __pyx_v_sent_idx;
   int __pyx_v_idx_start;
   int __pyx_v_idx_end;
+  int __pyx_v_num_sentences;
   std::vector<std::vector<std::string> >  __pyx_v_sentences;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -6624,42 +8663,43 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   int __pyx_t_4;
   __pyx_t_6gensim_6models_19word2vec_corpusfile_REAL_t __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  struct __pyx_opt_args_6gensim_6models_14word2vec_inner_init_w2v_config __pyx_t_7;
-  int __pyx_t_8;
-  std::vector<std::vector<std::string> >  __pyx_t_9;
-  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_10;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  struct __pyx_opt_args_6gensim_6models_14word2vec_inner_init_w2v_config __pyx_t_9;
+  bool __pyx_t_10;
   int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
+  std::vector<std::vector<std::string> >  __pyx_t_12;
+  __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *__pyx_t_13;
   int __pyx_t_14;
-  PyObject *__pyx_t_15 = NULL;
-  PyObject *__pyx_t_16 = NULL;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
   __Pyx_RefNannySetupContext("train_epoch_cbow", 0);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":376
+  /* "gensim/models/word2vec_corpusfile.pyx":514
  * 
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch             # <<<<<<<<<<<<<<
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  */
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 376, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v__cur_epoch); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 514, __pyx_L1_error)
   __pyx_v_cur_epoch = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":377
+  /* "gensim/models/word2vec_corpusfile.pyx":515
  *     # For learning rate updates
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs             # <<<<<<<<<<<<<<
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 377, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_epochs); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 515, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 377, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 515, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_num_epochs = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":378
+  /* "gensim/models/word2vec_corpusfile.pyx":516
  *     cdef int cur_epoch = _cur_epoch
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)             # <<<<<<<<<<<<<<
@@ -6670,12 +8710,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 378, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_examples); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 516, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_examples = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":379
+  /* "gensim/models/word2vec_corpusfile.pyx":517
  *     cdef int num_epochs = model.epochs
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)             # <<<<<<<<<<<<<<
@@ -6686,127 +8726,203 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   if ((__pyx_t_3 != 0)) {
     __pyx_t_1 = -1;
   } else {
-    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 379, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v__expected_words); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 517, __pyx_L1_error)
     __pyx_t_1 = __pyx_t_4;
   }
   __pyx_v_expected_words = __pyx_t_1;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":380
+  /* "gensim/models/word2vec_corpusfile.pyx":518
  *     cdef int expected_examples = (-1 if _expected_examples is None else _expected_examples)
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 380, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 518, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 380, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 518, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_start_alpha = __pyx_t_5;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":381
+  /* "gensim/models/word2vec_corpusfile.pyx":519
  *     cdef int expected_words = (-1 if _expected_words is None else _expected_words)
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha             # <<<<<<<<<<<<<<
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 381, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_min_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 519, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 381, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 519, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_end_alpha = __pyx_t_5;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":382
+  /* "gensim/models/word2vec_corpusfile.pyx":520
  *     cdef REAL_t start_alpha = model.alpha
  *     cdef REAL_t end_alpha = model.min_alpha
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)             # <<<<<<<<<<<<<<
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 382, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_model, __pyx_n_s_alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 520, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 382, __pyx_L1_error)
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == ((npy_float32)-1)) && PyErr_Occurred())) __PYX_ERR(1, 520, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v__alpha = __pyx_f_6gensim_6models_19word2vec_corpusfile_get_alpha(__pyx_t_5, __pyx_v_end_alpha, __pyx_v_cur_epoch, __pyx_v_num_epochs);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":384
+  /* "gensim/models/word2vec_corpusfile.pyx":522
  *     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
- *     cdef CythonVocab vocab = _cython_vocab
- * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 384, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_corpus_file);
-  __Pyx_GIVEREF(__pyx_v_corpus_file);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_corpus_file);
-  __Pyx_INCREF(__pyx_v_offset);
-  __Pyx_GIVEREF(__pyx_v_offset);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_offset);
-  __pyx_t_6 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_2, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 384, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_id_corpus_or_none); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 522, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_6);
-  __pyx_t_6 = 0;
+  __pyx_t_7 = NULL;
+  __pyx_t_1 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_1 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 522, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_corpus_file, __pyx_v_offset};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_1, 2+__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 522, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 522, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_7) {
+      __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7); __pyx_t_7 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_1, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_1, __pyx_v_offset);
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 522, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus))))) __PYX_ERR(1, 522, __pyx_L1_error)
+  __pyx_v_id_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":523
+ * 
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)             # <<<<<<<<<<<<<<
+ *     cdef bint indexed = id_stream is not None
+ *     cdef CythonVocab vocab = _cython_vocab
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  if ((__pyx_t_3 != 0)) {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  } else {
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_v_corpus_file);
+    __Pyx_GIVEREF(__pyx_v_corpus_file);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_corpus_file);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_offset);
+    __pyx_t_8 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence), __pyx_t_6, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_2 = __pyx_t_8;
+    __pyx_t_8 = 0;
+  }
+  __pyx_v_input_stream = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":385
+  /* "gensim/models/word2vec_corpusfile.pyx":524
+ *     cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None             # <<<<<<<<<<<<<<
+ *     cdef CythonVocab vocab = _cython_vocab
  * 
- *     cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+ */
+  __pyx_t_3 = (((PyObject *)__pyx_v_id_stream) != Py_None);
+  __pyx_v_indexed = __pyx_t_3;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":525
+ *     cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+ *     cdef bint indexed = id_stream is not None
  *     cdef CythonVocab vocab = _cython_vocab             # <<<<<<<<<<<<<<
  * 
  *     cdef int i, j, k
  */
-  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(1, 385, __pyx_L1_error)
-  __pyx_t_6 = __pyx_v__cython_vocab;
-  __Pyx_INCREF(__pyx_t_6);
-  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_6);
-  __pyx_t_6 = 0;
+  if (!(likely(((__pyx_v__cython_vocab) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__cython_vocab, __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab))))) __PYX_ERR(1, 525, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v__cython_vocab;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_vocab = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":388
+  /* "gensim/models/word2vec_corpusfile.pyx":528
  * 
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0             # <<<<<<<<<<<<<<
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  */
   __pyx_v_effective_words = 0;
   __pyx_v_effective_sentences = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":389
+  /* "gensim/models/word2vec_corpusfile.pyx":529
  *     cdef int i, j, k
  *     cdef int effective_words = 0, effective_sentences = 0
  *     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0             # <<<<<<<<<<<<<<
- *     cdef int sent_idx, idx_start, idx_end
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  */
   __pyx_v_total_effective_words = 0;
   __pyx_v_total_sentences = 0;
   __pyx_v_total_words = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":392
- *     cdef int sent_idx, idx_start, idx_end
+  /* "gensim/models/word2vec_corpusfile.pyx":532
+ *     cdef int sent_idx, idx_start, idx_end, num_sentences
  * 
  *     init_w2v_config(&c, model, _alpha, compute_loss, _work, _neu1)             # <<<<<<<<<<<<<<
  * 
  *     cdef vector[vector[string]] sentences
  */
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 392, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7.__pyx_n = 1;
-  __pyx_t_7._neu1 = __pyx_v__neu1;
-  __pyx_t_2 = __pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_6, __pyx_v_compute_loss, __pyx_v__work, &__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 392, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v__alpha); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 532, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_9.__pyx_n = 1;
+  __pyx_t_9._neu1 = __pyx_v__neu1;
+  __pyx_t_8 = __pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config((&__pyx_v_c), __pyx_v_model, __pyx_t_2, __pyx_v_compute_loss, __pyx_v__work, &__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 532, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":396
+  /* "gensim/models/word2vec_corpusfile.pyx":536
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
   {
       #ifdef WITH_THREAD
@@ -6816,83 +8932,186 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
       #endif
       /*try:*/ {
 
-        /* "gensim/models/word2vec_corpusfile.pyx":397
+        /* "gensim/models/word2vec_corpusfile.pyx":537
  * 
  *     with nogil:
- *         input_stream.reset()             # <<<<<<<<<<<<<<
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
- *             effective_sentences = 0
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+        __pyx_t_3 = (__pyx_v_indexed != 0);
+        if (__pyx_t_3) {
+
+          /* "gensim/models/word2vec_corpusfile.pyx":538
+ *     with nogil:
+ *         if indexed:
+ *             id_stream.reset()             # <<<<<<<<<<<<<<
+ *         else:
+ *             input_stream.reset()
  */
-        __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_input_stream, 0);
+          __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset(__pyx_v_id_stream);
 
-        /* "gensim/models/word2vec_corpusfile.pyx":398
+          /* "gensim/models/word2vec_corpusfile.pyx":537
+ * 
  *     with nogil:
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *         if indexed:             # <<<<<<<<<<<<<<
+ *             id_stream.reset()
+ *         else:
+ */
+          goto __pyx_L6;
+        }
+
+        /* "gensim/models/word2vec_corpusfile.pyx":540
+ *             id_stream.reset()
+ *         else:
+ *             input_stream.reset()             # <<<<<<<<<<<<<<
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
+ */
+        /*else*/ {
+          __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset(__pyx_v_input_stream, 0);
+        }
+        __pyx_L6:;
+
+        /* "gensim/models/word2vec_corpusfile.pyx":541
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
+ *             effective_sentences = 0
+ */
+        while (1) {
+          if ((__pyx_v_indexed != 0)) {
+            __pyx_t_10 = __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof(__pyx_v_id_stream);
+          } else {
+            __pyx_t_10 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_input_stream, 0);
+          }
+          __pyx_t_11 = (__pyx_t_10 != 0);
+          if (!__pyx_t_11) {
+          } else {
+            __pyx_t_3 = __pyx_t_11;
+            goto __pyx_L9_bool_binop_done;
+          }
+
+          /* "gensim/models/word2vec_corpusfile.pyx":542
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):             # <<<<<<<<<<<<<<
+ *             effective_sentences = 0
+ *             effective_words = 0
+ */
+          __pyx_t_11 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
+          __pyx_t_3 = __pyx_t_11;
+          __pyx_L9_bool_binop_done:;
+
+          /* "gensim/models/word2vec_corpusfile.pyx":541
+ *         else:
+ *             input_stream.reset()
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or             # <<<<<<<<<<<<<<
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
- *             effective_words = 0
  */
-        while (1) {
-          __pyx_t_8 = (__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_is_eof(__pyx_v_input_stream, 0) != 0);
-          if (!__pyx_t_8) {
-          } else {
-            __pyx_t_3 = __pyx_t_8;
-            goto __pyx_L8_bool_binop_done;
-          }
-          __pyx_t_8 = ((__pyx_v_total_words > (__pyx_v_expected_words / __pyx_v_c.workers)) != 0);
-          __pyx_t_3 = __pyx_t_8;
-          __pyx_L8_bool_binop_done:;
-          __pyx_t_8 = ((!__pyx_t_3) != 0);
-          if (!__pyx_t_8) break;
-
-          /* "gensim/models/word2vec_corpusfile.pyx":399
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+          __pyx_t_11 = ((!__pyx_t_3) != 0);
+          if (!__pyx_t_11) break;
+
+          /* "gensim/models/word2vec_corpusfile.pyx":543
+ *         while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0             # <<<<<<<<<<<<<<
  *             effective_words = 0
  * 
  */
           __pyx_v_effective_sentences = 0;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":400
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+          /* "gensim/models/word2vec_corpusfile.pyx":544
+ *                    total_words > expected_words / c.workers):
  *             effective_sentences = 0
  *             effective_words = 0             # <<<<<<<<<<<<<<
  * 
- *             sentences = input_stream.next_batch()
+ *             if indexed:
  */
           __pyx_v_effective_words = 0;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":402
+          /* "gensim/models/word2vec_corpusfile.pyx":546
  *             effective_words = 0
  * 
- *             sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
- * 
- *             prepare_c_structures_for_batch(
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+          __pyx_t_11 = (__pyx_v_indexed != 0);
+          if (__pyx_t_11) {
+
+            /* "gensim/models/word2vec_corpusfile.pyx":548
+ *             if indexed:
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_id_batch(
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
  */
-          __pyx_t_9 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 402, __pyx_L4_error)
-          __pyx_v_sentences = __pyx_t_9;
+            __pyx_v_num_sentences = __pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch(__pyx_v_id_stream);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":406
- *             prepare_c_structures_for_batch(
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &effective_sentences, &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx,             # <<<<<<<<<<<<<<
- *                 c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+            /* "gensim/models/word2vec_corpusfile.pyx":549
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ *                 prepare_c_structures_for_id_batch(             # <<<<<<<<<<<<<<
+ *                     id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+ *                     &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+ */
+            __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_id_batch(__pyx_v_id_stream->batch_words, __pyx_v_id_stream->batch_lengths, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr(__pyx_v_vocab), __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+
+            /* "gensim/models/word2vec_corpusfile.pyx":546
+ *             effective_words = 0
  * 
+ *             if indexed:             # <<<<<<<<<<<<<<
+ *                 # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+ *                 num_sentences = id_stream.next_batch()
+ */
+            goto __pyx_L11;
+          }
+
+          /* "gensim/models/word2vec_corpusfile.pyx":554
+ *                     c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+ *             else:
+ *                 sentences = input_stream.next_batch()             # <<<<<<<<<<<<<<
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(
+ */
+          /*else*/ {
+            __pyx_t_12 = __pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch(__pyx_v_input_stream, 0); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 554, __pyx_L4_error)
+            __pyx_v_sentences = __pyx_t_12;
+
+            /* "gensim/models/word2vec_corpusfile.pyx":555
+ *             else:
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()             # <<<<<<<<<<<<<<
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
  */
-          __pyx_t_10 = __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 406, __pyx_L4_error)
+            __pyx_v_num_sentences = __pyx_v_sentences.size();
 
-          /* "gensim/models/word2vec_corpusfile.pyx":404
- *             sentences = input_stream.next_batch()
+            /* "gensim/models/word2vec_corpusfile.pyx":558
+ *                 prepare_c_structures_for_batch(
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,             # <<<<<<<<<<<<<<
+ *                     c.codelens, c.codes, c.points, c.reduced_windows)
  * 
- *             prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
- *                 sentences, c.sample, c.hs, c.window, &total_words, &effective_words,
- *                 &effective_sentences, &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx,
  */
-          __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_10, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+            __pyx_t_13 = __pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr(__pyx_v_vocab); if (unlikely(__Pyx_ErrOccurredWithGIL())) __PYX_ERR(1, 558, __pyx_L4_error)
+
+            /* "gensim/models/word2vec_corpusfile.pyx":556
+ *                 sentences = input_stream.next_batch()
+ *                 num_sentences = sentences.size()
+ *                 prepare_c_structures_for_batch(             # <<<<<<<<<<<<<<
+ *                     sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+ *                     &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
+ */
+            __pyx_f_6gensim_6models_19word2vec_corpusfile_prepare_c_structures_for_batch(__pyx_v_sentences, __pyx_v_c.sample, __pyx_v_c.hs, __pyx_v_c.window, (&__pyx_v_total_words), (&__pyx_v_effective_words), (&__pyx_v_effective_sentences), (&__pyx_v_c.next_random), __pyx_t_13, __pyx_v_c.sentence_idx, __pyx_v_c.indexes, __pyx_v_c.codelens, __pyx_v_c.codes, __pyx_v_c.points, __pyx_v_c.reduced_windows);
+          }
+          __pyx_L11:;
 
-          /* "gensim/models/word2vec_corpusfile.pyx":409
- *                 c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+          /* "gensim/models/word2vec_corpusfile.pyx":561
+ *                     c.codelens, c.codes, c.points, c.reduced_windows)
  * 
  *             for sent_idx in range(effective_sentences):             # <<<<<<<<<<<<<<
  *                 idx_start = c.sentence_idx[sent_idx]
@@ -6900,10 +9119,10 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
           __pyx_t_1 = __pyx_v_effective_sentences;
           __pyx_t_4 = __pyx_t_1;
-          for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_4; __pyx_t_11+=1) {
-            __pyx_v_sent_idx = __pyx_t_11;
+          for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_4; __pyx_t_14+=1) {
+            __pyx_v_sent_idx = __pyx_t_14;
 
-            /* "gensim/models/word2vec_corpusfile.pyx":410
+            /* "gensim/models/word2vec_corpusfile.pyx":562
  * 
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]             # <<<<<<<<<<<<<<
@@ -6912,7 +9131,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
             __pyx_v_idx_start = (__pyx_v_c.sentence_idx[__pyx_v_sent_idx]);
 
-            /* "gensim/models/word2vec_corpusfile.pyx":411
+            /* "gensim/models/word2vec_corpusfile.pyx":563
  *             for sent_idx in range(effective_sentences):
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]             # <<<<<<<<<<<<<<
@@ -6921,19 +9140,19 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
             __pyx_v_idx_end = (__pyx_v_c.sentence_idx[(__pyx_v_sent_idx + 1)]);
 
-            /* "gensim/models/word2vec_corpusfile.pyx":412
+            /* "gensim/models/word2vec_corpusfile.pyx":564
  *                 idx_start = c.sentence_idx[sent_idx]
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):             # <<<<<<<<<<<<<<
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  */
-            __pyx_t_12 = __pyx_v_idx_end;
-            __pyx_t_13 = __pyx_t_12;
-            for (__pyx_t_14 = __pyx_v_idx_start; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
-              __pyx_v_i = __pyx_t_14;
+            __pyx_t_15 = __pyx_v_idx_end;
+            __pyx_t_16 = __pyx_t_15;
+            for (__pyx_t_17 = __pyx_v_idx_start; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+              __pyx_v_i = __pyx_t_17;
 
-              /* "gensim/models/word2vec_corpusfile.pyx":413
+              /* "gensim/models/word2vec_corpusfile.pyx":565
  *                 idx_end = c.sentence_idx[sent_idx + 1]
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -6942,17 +9161,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
               __pyx_v_j = ((__pyx_v_i - __pyx_v_c.window) + (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/word2vec_corpusfile.pyx":414
+              /* "gensim/models/word2vec_corpusfile.pyx":566
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  */
-              __pyx_t_8 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_j < __pyx_v_idx_start) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":415
+                /* "gensim/models/word2vec_corpusfile.pyx":567
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:
  *                         j = idx_start             # <<<<<<<<<<<<<<
@@ -6961,7 +9180,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
                 __pyx_v_j = __pyx_v_idx_start;
 
-                /* "gensim/models/word2vec_corpusfile.pyx":414
+                /* "gensim/models/word2vec_corpusfile.pyx":566
  *                 for i in range(idx_start, idx_end):
  *                     j = i - c.window + c.reduced_windows[i]
  *                     if j < idx_start:             # <<<<<<<<<<<<<<
@@ -6970,7 +9189,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
               }
 
-              /* "gensim/models/word2vec_corpusfile.pyx":416
+              /* "gensim/models/word2vec_corpusfile.pyx":568
  *                     if j < idx_start:
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]             # <<<<<<<<<<<<<<
@@ -6979,17 +9198,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
               __pyx_v_k = (((__pyx_v_i + __pyx_v_c.window) + 1) - (__pyx_v_c.reduced_windows[__pyx_v_i]));
 
-              /* "gensim/models/word2vec_corpusfile.pyx":417
+              /* "gensim/models/word2vec_corpusfile.pyx":569
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
  *                         k = idx_end
  *                     if c.hs:
  */
-              __pyx_t_8 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = ((__pyx_v_k > __pyx_v_idx_end) != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":418
+                /* "gensim/models/word2vec_corpusfile.pyx":570
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:
  *                         k = idx_end             # <<<<<<<<<<<<<<
@@ -6998,7 +9217,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
                 __pyx_v_k = __pyx_v_idx_end;
 
-                /* "gensim/models/word2vec_corpusfile.pyx":417
+                /* "gensim/models/word2vec_corpusfile.pyx":569
  *                         j = idx_start
  *                     k = i + c.window + 1 - c.reduced_windows[i]
  *                     if k > idx_end:             # <<<<<<<<<<<<<<
@@ -7007,17 +9226,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
               }
 
-              /* "gensim/models/word2vec_corpusfile.pyx":419
+              /* "gensim/models/word2vec_corpusfile.pyx":571
  *                     if k > idx_end:
  *                         k = idx_end
  *                     if c.hs:             # <<<<<<<<<<<<<<
  *                         w2v_fast_sentence_cbow_hs(
  *                             c.points[i], c.codes[i], c.codelens, c.neu1, c.syn0, c.syn1, c.size, c.indexes, c.alpha,
  */
-              __pyx_t_8 = (__pyx_v_c.hs != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = (__pyx_v_c.hs != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":420
+                /* "gensim/models/word2vec_corpusfile.pyx":572
  *                         k = idx_end
  *                     if c.hs:
  *                         w2v_fast_sentence_cbow_hs(             # <<<<<<<<<<<<<<
@@ -7026,7 +9245,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
                 __pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_hs((__pyx_v_c.points[__pyx_v_i]), (__pyx_v_c.codes[__pyx_v_i]), __pyx_v_c.codelens, __pyx_v_c.neu1, __pyx_v_c.syn0, __pyx_v_c.syn1, __pyx_v_c.size, __pyx_v_c.indexes, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_i, __pyx_v_j, __pyx_v_k, __pyx_v_c.cbow_mean, __pyx_v_c.word_locks, __pyx_v_c.compute_loss, (&__pyx_v_c.running_training_loss));
 
-                /* "gensim/models/word2vec_corpusfile.pyx":419
+                /* "gensim/models/word2vec_corpusfile.pyx":571
  *                     if k > idx_end:
  *                         k = idx_end
  *                     if c.hs:             # <<<<<<<<<<<<<<
@@ -7035,17 +9254,17 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
               }
 
-              /* "gensim/models/word2vec_corpusfile.pyx":424
+              /* "gensim/models/word2vec_corpusfile.pyx":576
  *                             c.work, i, j, k, c.cbow_mean, c.word_locks, c.compute_loss, &c.running_training_loss)
  * 
  *                     if c.negative:             # <<<<<<<<<<<<<<
  *                         c.next_random = w2v_fast_sentence_cbow_neg(
  *                             c.negative, c.cum_table, c.cum_table_len, c.codelens, c.neu1, c.syn0,
  */
-              __pyx_t_8 = (__pyx_v_c.negative != 0);
-              if (__pyx_t_8) {
+              __pyx_t_11 = (__pyx_v_c.negative != 0);
+              if (__pyx_t_11) {
 
-                /* "gensim/models/word2vec_corpusfile.pyx":425
+                /* "gensim/models/word2vec_corpusfile.pyx":577
  * 
  *                     if c.negative:
  *                         c.next_random = w2v_fast_sentence_cbow_neg(             # <<<<<<<<<<<<<<
@@ -7054,7 +9273,7 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  */
                 __pyx_v_c.next_random = __pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_neg(__pyx_v_c.negative, __pyx_v_c.cum_table, __pyx_v_c.cum_table_len, __pyx_v_c.codelens, __pyx_v_c.neu1, __pyx_v_c.syn0, __pyx_v_c.syn1neg, __pyx_v_c.size, __pyx_v_c.indexes, __pyx_v_c.alpha, __pyx_v_c.work, __pyx_v_i, __pyx_v_j, __pyx_v_k, __pyx_v_c.cbow_mean, __pyx_v_c.next_random, __pyx_v_c.word_locks, __pyx_v_c.compute_loss, (&__pyx_v_c.running_training_loss));
 
-                /* "gensim/models/word2vec_corpusfile.pyx":424
+                /* "gensim/models/word2vec_corpusfile.pyx":576
  *                             c.work, i, j, k, c.cbow_mean, c.word_locks, c.compute_loss, &c.running_training_loss)
  * 
  *                     if c.negative:             # <<<<<<<<<<<<<<
@@ -7065,25 +9284,25 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
             }
           }
 
-          /* "gensim/models/word2vec_corpusfile.pyx":430
+          /* "gensim/models/word2vec_corpusfile.pyx":582
  *                             c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
  * 
- *             total_sentences += sentences.size()             # <<<<<<<<<<<<<<
+ *             total_sentences += num_sentences             # <<<<<<<<<<<<<<
  *             total_effective_words += effective_words
  * 
  */
-          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_sentences.size());
+          __pyx_v_total_sentences = (__pyx_v_total_sentences + __pyx_v_num_sentences);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":431
+          /* "gensim/models/word2vec_corpusfile.pyx":583
  * 
- *             total_sentences += sentences.size()
+ *             total_sentences += num_sentences
  *             total_effective_words += effective_words             # <<<<<<<<<<<<<<
  * 
  *             c.alpha = get_next_alpha(
  */
           __pyx_v_total_effective_words = (__pyx_v_total_effective_words + __pyx_v_effective_words);
 
-          /* "gensim/models/word2vec_corpusfile.pyx":433
+          /* "gensim/models/word2vec_corpusfile.pyx":585
  *             total_effective_words += effective_words
  * 
  *             c.alpha = get_next_alpha(             # <<<<<<<<<<<<<<
@@ -7094,12 +9313,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
         }
       }
 
-      /* "gensim/models/word2vec_corpusfile.pyx":396
+      /* "gensim/models/word2vec_corpusfile.pyx":536
  *     cdef vector[vector[string]] sentences
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         input_stream.reset()
- *         while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+ *         if indexed:
+ *             id_stream.reset()
  */
       /*finally:*/ {
         /*normal exit:*/{
@@ -7120,19 +9339,19 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
       }
   }
 
-  /* "gensim/models/word2vec_corpusfile.pyx":437
+  /* "gensim/models/word2vec_corpusfile.pyx":589
  *                 expected_examples, expected_words, cur_epoch, num_epochs)
  * 
  *     model.running_training_loss = c.running_training_loss             # <<<<<<<<<<<<<<
  *     return total_sentences, total_effective_words, total_words
  * 
  */
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_c.running_training_loss); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 437, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_model, __pyx_n_s_running_training_loss, __pyx_t_2) < 0) __PYX_ERR(1, 437, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_c.running_training_loss); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 589, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_model, __pyx_n_s_running_training_loss, __pyx_t_8) < 0) __PYX_ERR(1, 589, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":438
+  /* "gensim/models/word2vec_corpusfile.pyx":590
  * 
  *     model.running_training_loss = c.running_training_loss
  *     return total_sentences, total_effective_words, total_words             # <<<<<<<<<<<<<<
@@ -7140,28 +9359,28 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 438, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_total_sentences); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 590, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_total_effective_words); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 438, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 590, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_total_words); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 438, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_15);
-  __pyx_t_16 = PyTuple_New(3); if (unlikely(!__pyx_t_16)) __PYX_ERR(1, 438, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
+  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_8);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_6);
-  PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_t_6);
-  __Pyx_GIVEREF(__pyx_t_15);
-  PyTuple_SET_ITEM(__pyx_t_16, 2, __pyx_t_15);
+  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_6);
+  __pyx_t_8 = 0;
   __pyx_t_2 = 0;
   __pyx_t_6 = 0;
-  __pyx_t_15 = 0;
-  __pyx_r = __pyx_t_16;
-  __pyx_t_16 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":346
+  /* "gensim/models/word2vec_corpusfile.pyx":482
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
@@ -7173,11 +9392,12 @@ static PyObject *__pyx_pf_6gensim_6models_19word2vec_corpusfile_4train_epoch_cbo
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
   __Pyx_AddTraceback("gensim.models.word2vec_corpusfile.train_epoch_cbow", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_id_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_input_stream);
   __Pyx_XDECREF((PyObject *)__pyx_v_vocab);
   __Pyx_XGIVEREF(__pyx_r);
@@ -7301,7 +9521,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 229, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 229, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -7357,7 +9577,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  * 
  *             info.buf = PyArray_DATA(self)
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 233, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 233, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -7614,7 +9834,7 @@ static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, P
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 263, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 263, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8494,7 +10714,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 810, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 810, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8562,7 +10782,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 814, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 814, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -8671,7 +10891,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(3, 834, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(3, 834, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -9345,7 +11565,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1000, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1000, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -9474,7 +11694,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1006, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1006, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -9600,7 +11820,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1012, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(3, 1012, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -10342,6 +12562,7 @@ static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonVocab(
   p = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)o);
   p->__pyx_vtab = __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab;
   new((void*)&(p->vocab)) __pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t();
+  new((void*)&(p->items)) std::vector<struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem> ();
   p->subword_arrays = Py_None; Py_INCREF(Py_None);
   return o;
 }
@@ -10350,6 +12571,7 @@ static void __pyx_tp_dealloc_6gensim_6models_19word2vec_corpusfile_CythonVocab(P
   struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *p = (struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *)o;
   PyObject_GC_UnTrack(o);
   __Pyx_call_destructor(p->vocab);
+  __Pyx_call_destructor(p->items);
   Py_CLEAR(p->subword_arrays);
   (*Py_TYPE(o)->tp_free)(o);
 }
@@ -10435,6 +12657,204 @@ static PyTypeObject __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab
   0, /*tp_finalize*/
   #endif
 };
+static struct __pyx_vtabstruct_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+
+static PyObject *__pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *p;
+  PyObject *o;
+  o = (*t->tp_alloc)(t, 0);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)o);
+  p->__pyx_vtab = __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+  new((void*)&(p->batch_words)) std::vector<__pyx_t_5numpy_int32_t *> ();
+  new((void*)&(p->batch_lengths)) std::vector<int> ();
+  p->corpus = Py_None; Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus(PyObject *o) {
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *p = (struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)o;
+  PyObject_GC_UnTrack(o);
+  __Pyx_call_destructor(p->batch_words);
+  __Pyx_call_destructor(p->batch_lengths);
+  Py_CLEAR(p->corpus);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *p = (struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)o;
+  if (p->corpus) {
+    e = (*v)(p->corpus, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *p = (struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *)o;
+  tmp = ((PyObject*)p->corpus);
+  p->corpus = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_corpus(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_corpus(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_6corpus_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_num_sentences(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_num_sentences(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_13num_sentences_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_start(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_start(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5start_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_sentence(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_sentence(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8sentence_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_position(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_position(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_8position_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_max_sentence_length(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_1__get__(o);
+}
+
+static int __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_max_sentence_length(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_19max_sentence_length_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyMethodDef __pyx_methods_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_3__reduce_cython__, METH_NOARGS, __pyx_doc_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_2__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_5__setstate_cython__, METH_O, __pyx_doc_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_4__setstate_cython__},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus[] = {
+  {(char *)"corpus", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_corpus, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_corpus, (char *)"corpus: object", 0},
+  {(char *)"num_sentences", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_num_sentences, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_num_sentences, (char *)"num_sentences: 'long long'", 0},
+  {(char *)"start", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_start, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_start, (char *)"start: 'long long'", 0},
+  {(char *)"sentence", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_sentence, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_sentence, (char *)"sentence: 'long long'", 0},
+  {(char *)"position", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_position, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_position, (char *)"position: 'long long'", 0},
+  {(char *)"max_sentence_length", __pyx_getprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_max_sentence_length, __pyx_setprop_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_max_sentence_length, (char *)"max_sentence_length: 'size_t'", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "gensim.models.word2vec_corpusfile.CythonIdCorpus", /*tp_name*/
+  sizeof(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "CythonIdCorpus(corpus, offset=0, max_sentence_length=10000)\nReader of a :class:`~gensim.models.word2vec.IndexedCorpusFile`, without the GIL.\n\n    Sentences are read as pointers into the memory-mapped token ids, starting from sentence number `offset`,\n    and split into chunks of at most `max_sentence_length` words, like in :class:`CythonLineSentence`.\n\n    ", /*tp_doc*/
+  __pyx_tp_traverse_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_traverse*/
+  __pyx_tp_clear_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+};
 
 static struct __pyx_obj_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__ *__pyx_freelist_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__[8];
 static int __pyx_freecount_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__ = 0;
@@ -10595,6 +13015,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
   {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
   {&__pyx_n_s_compute_loss, __pyx_k_compute_loss, sizeof(__pyx_k_compute_loss), 0, 0, 1, 1},
+  {&__pyx_n_s_corpus, __pyx_k_corpus, sizeof(__pyx_k_corpus), 0, 0, 1, 1},
   {&__pyx_n_s_corpus_file, __pyx_k_corpus_file, sizeof(__pyx_k_corpus_file), 0, 0, 1, 1},
   {&__pyx_n_s_cur_epoch, __pyx_k_cur_epoch, sizeof(__pyx_k_cur_epoch), 0, 0, 1, 1},
   {&__pyx_n_s_cur_epoch_2, __pyx_k_cur_epoch_2, sizeof(__pyx_k_cur_epoch_2), 0, 0, 1, 1},
@@ -10615,10 +13036,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_hs, __pyx_k_hs, sizeof(__pyx_k_hs), 0, 0, 1, 1},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_id_corpus_or_none, __pyx_k_id_corpus_or_none, sizeof(__pyx_k_id_corpus_or_none), 0, 0, 1, 1},
+  {&__pyx_n_s_id_stream, __pyx_k_id_stream, sizeof(__pyx_k_id_stream), 0, 0, 1, 1},
+  {&__pyx_n_s_ids, __pyx_k_ids, sizeof(__pyx_k_ids), 0, 0, 1, 1},
   {&__pyx_n_s_idx_end, __pyx_k_idx_end, sizeof(__pyx_k_idx_end), 0, 0, 1, 1},
   {&__pyx_n_s_idx_start, __pyx_k_idx_start, sizeof(__pyx_k_idx_start), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
+  {&__pyx_n_s_indexed, __pyx_k_indexed, sizeof(__pyx_k_indexed), 0, 0, 1, 1},
   {&__pyx_n_s_input_stream, __pyx_k_input_stream, sizeof(__pyx_k_input_stream), 0, 0, 1, 1},
   {&__pyx_n_s_iter, __pyx_k_iter, sizeof(__pyx_k_iter), 0, 0, 1, 1},
   {&__pyx_n_s_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 0, 0, 1, 1},
@@ -10634,10 +13059,12 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_neu1, __pyx_k_neu1, sizeof(__pyx_k_neu1), 0, 0, 1, 1},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_num_epochs, __pyx_k_num_epochs, sizeof(__pyx_k_num_epochs), 0, 0, 1, 1},
+  {&__pyx_n_s_num_sentences, __pyx_k_num_sentences, sizeof(__pyx_k_num_sentences), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
   {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
   {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_offsets, __pyx_k_offsets, sizeof(__pyx_k_offsets), 0, 0, 1, 1},
   {&__pyx_n_s_point, __pyx_k_point, sizeof(__pyx_k_point), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
@@ -10647,7 +13074,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
   {&__pyx_n_s_running_training_loss, __pyx_k_running_training_loss, sizeof(__pyx_k_running_training_loss), 0, 0, 1, 1},
   {&__pyx_n_s_sample_int, __pyx_k_sample_int, sizeof(__pyx_k_sample_int), 0, 0, 1, 1},
-  {&__pyx_kp_s_self_vocab_cannot_be_converted_t, __pyx_k_self_vocab_cannot_be_converted_t, sizeof(__pyx_k_self_vocab_cannot_be_converted_t), 0, 0, 1, 0},
+  {&__pyx_kp_s_self_batch_words_self_ids_self_o, __pyx_k_self_batch_words_self_ids_self_o, sizeof(__pyx_k_self_batch_words_self_ids_self_o), 0, 0, 1, 0},
+  {&__pyx_kp_s_self_items_self_vocab_cannot_be, __pyx_k_self_items_self_vocab_cannot_be, sizeof(__pyx_k_self_items_self_vocab_cannot_be), 0, 0, 1, 0},
   {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
   {&__pyx_n_s_sent_idx, __pyx_k_sent_idx, sizeof(__pyx_k_sent_idx), 0, 0, 1, 1},
   {&__pyx_n_s_sentences, __pyx_k_sentences, sizeof(__pyx_k_sentences), 0, 0, 1, 1},
@@ -10656,6 +13084,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_six, __pyx_k_six, sizeof(__pyx_k_six), 0, 0, 1, 1},
   {&__pyx_n_s_source, __pyx_k_source, sizeof(__pyx_k_source), 0, 0, 1, 1},
   {&__pyx_n_s_start_alpha, __pyx_k_start_alpha, sizeof(__pyx_k_start_alpha), 0, 0, 1, 1},
+  {&__pyx_n_s_string_types, __pyx_k_string_types, sizeof(__pyx_k_string_types), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
   {&__pyx_n_s_total_effective_words, __pyx_k_total_effective_words, sizeof(__pyx_k_total_effective_words), 0, 0, 1, 1},
@@ -10672,7 +13101,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
 };
 static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 109, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(1, 115, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(3, 229, __pyx_L1_error)
   __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(3, 810, __pyx_L1_error)
   __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(3, 1000, __pyx_L1_error)
@@ -10687,34 +13116,53 @@ static int __Pyx_InitCachedConstants(void) {
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_self_vocab_cannot_be_converted_t); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_self_items_self_vocab_cannot_be); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
   /* "(tree fragment)":4
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")
  * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ *     raise TypeError("self.items,self.vocab cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_self_vocab_cannot_be_converted_t); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_self_items_self_vocab_cannot_be); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":73
+  /* "gensim/models/word2vec_corpusfile.pyx":79
  *         return <bytes>key
  *     else:
  *         return key.encode('utf8')             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_n_s_utf8); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 73, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_n_s_utf8); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_self_batch_words_self_ids_self_o); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("self.batch_words,self.ids,self.offsets cannot be converted to a Python object for pickling")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_self_batch_words_self_ids_self_o); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":229
  *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
  *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
@@ -10722,9 +13170,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(3, 229, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(3, 229, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":233
  *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
@@ -10733,9 +13181,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(3, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(3, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":263
  *                 if ((descr.byteorder == c'>' and little_endian) or
@@ -10744,9 +13192,9 @@ static int __Pyx_InitCachedConstants(void) {
  *                 if   t == NPY_BYTE:        f = "b"
  *                 elif t == NPY_UBYTE:       f = "B"
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(3, 263, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(3, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":810
  * 
@@ -10755,9 +13203,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(3, 810, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(3, 810, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":814
  *         if ((child.byteorder == c'>' and little_endian) or
@@ -10766,9 +13214,9 @@ static int __Pyx_InitCachedConstants(void) {
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(3, 814, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(3, 814, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":834
  *             t = child.type_num
@@ -10777,9 +13225,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(3, 834, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(3, 834, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1000
  *         _import_array()
@@ -10788,9 +13236,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(3, 1000, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(3, 1000, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1006
  *         _import_umath()
@@ -10799,54 +13247,66 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(3, 1006, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(3, 1006, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
   /* "../../.virtualenvs/math/local/lib/python2.7/site-packages/Cython/Includes/numpy/__init__.pxd":1012
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(3, 1012, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(3, 1012, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
-  /* "gensim/models/word2vec_corpusfile.pyx":65
+  /* "gensim/models/word2vec_corpusfile.pyx":71
  * 
  * 
  * def rebuild_cython_line_sentence(source, max_sentence_length):             # <<<<<<<<<<<<<<
  *     return CythonLineSentence(source, max_sentence_length=max_sentence_length)
  * 
  */
-  __pyx_tuple__13 = PyTuple_Pack(2, __pyx_n_s_source, __pyx_n_s_max_sentence_length); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_rebuild_cython_line_sentence, 65, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(1, 65, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(2, __pyx_n_s_source, __pyx_n_s_max_sentence_length); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_rebuild_cython_line_sentence, 71, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(1, 71, __pyx_L1_error)
+
+  /* "gensim/models/word2vec_corpusfile.pyx":246
+ * 
+ * 
+ * def id_corpus_or_none(corpus_file, offset):             # <<<<<<<<<<<<<<
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):
+ */
+  __pyx_tuple__17 = PyTuple_Pack(2, __pyx_n_s_corpus_file, __pyx_n_s_offset); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_id_corpus_or_none, 246, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(1, 246, __pyx_L1_error)
 
-  /* "gensim/models/word2vec_corpusfile.pyx":249
+  /* "gensim/models/word2vec_corpusfile.pyx":364
  * 
  * 
  * def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                    _neu1, compute_loss):
  *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_tuple__15 = PyTuple_Pack(32, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_compute_loss, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(10, 0, 32, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_train_epoch_sg, 249, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(1, 249, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(35, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_compute_loss, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_num_sentences, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(10, 0, 35, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_train_epoch_sg, 364, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(1, 364, __pyx_L1_error)
 
-  /* "gensim/models/word2vec_corpusfile.pyx":346
+  /* "gensim/models/word2vec_corpusfile.pyx":482
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                      _neu1, compute_loss):
  *     """Train CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_tuple__17 = PyTuple_Pack(32, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_compute_loss, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_input_stream, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 346, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
-  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(10, 0, 32, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_train_epoch_cbow, 346, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(1, 346, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(35, __pyx_n_s_model, __pyx_n_s_corpus_file, __pyx_n_s_offset, __pyx_n_s_cython_vocab, __pyx_n_s_cur_epoch, __pyx_n_s_expected_examples, __pyx_n_s_expected_words, __pyx_n_s_work, __pyx_n_s_neu1, __pyx_n_s_compute_loss, __pyx_n_s_c, __pyx_n_s_cur_epoch_2, __pyx_n_s_num_epochs, __pyx_n_s_expected_examples_2, __pyx_n_s_expected_words_2, __pyx_n_s_start_alpha, __pyx_n_s_end_alpha, __pyx_n_s_alpha_2, __pyx_n_s_id_stream, __pyx_n_s_input_stream, __pyx_n_s_indexed, __pyx_n_s_vocab, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_k, __pyx_n_s_effective_words, __pyx_n_s_effective_sentences, __pyx_n_s_total_effective_words, __pyx_n_s_total_sentences, __pyx_n_s_total_words, __pyx_n_s_sent_idx, __pyx_n_s_idx_start, __pyx_n_s_idx_end, __pyx_n_s_num_sentences, __pyx_n_s_sentences); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 482, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(10, 0, 35, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gensim_models_word2vec_corpusfil_2, __pyx_n_s_train_epoch_cbow, 482, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(1, 482, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -10912,26 +13372,41 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonLineSentence._chunk_sentence = (std::vector<std::vector<std::string> >  (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *, std::vector<std::string> , int __pyx_skip_dispatch))__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence__chunk_sentence;
   __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.reset = (void (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *, int __pyx_skip_dispatch))__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_reset;
   __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.next_batch = (std::vector<std::vector<std::string> >  (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonLineSentence *, int __pyx_skip_dispatch))__pyx_f_6gensim_6models_19word2vec_corpusfile_18CythonLineSentence_next_batch;
-  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 77, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 83, __pyx_L1_error)
   __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_print = 0;
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_dictoffset && __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
-  if (__Pyx_SetVtable(__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_dict, __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 77, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "CythonLineSentence", (PyObject *)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 77, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence.tp_dict, __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 83, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "CythonLineSentence", (PyObject *)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence) < 0) __PYX_ERR(1, 83, __pyx_L1_error)
   __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonLineSentence = &__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonLineSentence;
   __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab = &__pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonVocab;
   __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonVocab.get_vocab_ptr = (__pyx_t_6gensim_6models_19word2vec_corpusfile_cvocab_t *(*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *))__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_vocab_ptr;
-  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 40, __pyx_L1_error)
+  __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonVocab.get_items_ptr = (struct __pyx_t_6gensim_6models_19word2vec_corpusfile_VocabItem *(*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonVocab *))__pyx_f_6gensim_6models_19word2vec_corpusfile_11CythonVocab_get_items_ptr;
+  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 41, __pyx_L1_error)
   __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_print = 0;
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_dictoffset && __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
-  if (__Pyx_SetVtable(__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_dict, __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 40, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "CythonVocab", (PyObject *)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 40, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 40, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab.tp_dict, __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 41, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "CythonVocab", (PyObject *)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 41, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab) < 0) __PYX_ERR(1, 41, __pyx_L1_error)
   __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonVocab = &__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonVocab;
-  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__) < 0) __PYX_ERR(1, 122, __pyx_L1_error)
+  __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = &__pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+  __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.is_eof = (bool (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *))__pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_is_eof;
+  __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.reset = (void (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *))__pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_reset;
+  __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.next_batch = (int (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *))__pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_next_batch;
+  __pyx_vtable_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.read_document = (int (*)(struct __pyx_obj_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus *, __pyx_t_5numpy_int32_t **))__pyx_f_6gensim_6models_19word2vec_corpusfile_14CythonIdCorpus_read_document;
+  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus) < 0) __PYX_ERR(1, 189, __pyx_L1_error)
+  __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.tp_print = 0;
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.tp_dictoffset && __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  if (__Pyx_SetVtable(__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus.tp_dict, __pyx_vtabptr_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus) < 0) __PYX_ERR(1, 189, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "CythonIdCorpus", (PyObject *)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus) < 0) __PYX_ERR(1, 189, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus) < 0) __PYX_ERR(1, 189, __pyx_L1_error)
+  __pyx_ptype_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus = &__pyx_type_6gensim_6models_19word2vec_corpusfile_CythonIdCorpus;
+  if (PyType_Ready(&__pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__) < 0) __PYX_ERR(1, 128, __pyx_L1_error)
   __pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__.tp_print = 0;
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__.tp_dictoffset && __pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_6gensim_6models_19word2vec_corpusfile___pyx_scope_struct____iter__.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
@@ -10979,6 +13454,7 @@ static int __Pyx_modinit_variable_import_code(void) {
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "dsdot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_dsdot, "__pyx_t_6gensim_6models_14word2vec_inner_dsdot_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "snrm2", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_snrm2, "__pyx_t_6gensim_6models_14word2vec_inner_snrm2_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "sscal", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sscal, "__pyx_t_6gensim_6models_14word2vec_inner_sscal_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr(__pyx_t_1, "sgemm", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_sgemm, "__pyx_t_6gensim_6models_14word2vec_inner_sgemm_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "EXP_TABLE", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_EXP_TABLE, "__pyx_t_6gensim_6models_14word2vec_inner_REAL_t [0x3E8]") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_dot", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_dot, "__pyx_t_6gensim_6models_14word2vec_inner_our_dot_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportVoidPtr(__pyx_t_1, "our_saxpy", (void **)&__pyx_vp_6gensim_6models_14word2vec_inner_our_saxpy, "__pyx_t_6gensim_6models_14word2vec_inner_our_saxpy_ptr") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
@@ -11000,6 +13476,7 @@ static int __Pyx_modinit_function_import_code(void) {
   if (__Pyx_ImportFunction(__pyx_t_1, "random_int32", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_random_int32, "unsigned PY_LONG_LONG (unsigned PY_LONG_LONG *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportFunction(__pyx_t_1, "w2v_fast_sentence_sg_hs", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_hs, "void (__pyx_t_5numpy_uint32_t const *, __pyx_t_5numpy_uint8_t const *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportFunction(__pyx_t_1, "w2v_fast_sentence_sg_neg", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_sg_neg, "unsigned PY_LONG_LONG (int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const , __pyx_t_5numpy_uint32_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction(__pyx_t_1, "w2v_fast_window_sg_neg", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_window_sg_neg, "unsigned PY_LONG_LONG (int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, int, int, int, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportFunction(__pyx_t_1, "w2v_fast_sentence_cbow_hs", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_hs, "void (__pyx_t_5numpy_uint32_t const *, __pyx_t_5numpy_uint8_t const *, int *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int, int, int, int, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportFunction(__pyx_t_1, "w2v_fast_sentence_cbow_neg", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_w2v_fast_sentence_cbow_neg, "unsigned PY_LONG_LONG (int const , __pyx_t_5numpy_uint32_t *, unsigned PY_LONG_LONG, int *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_5numpy_uint32_t const *, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int, int, int, int, unsigned PY_LONG_LONG, __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *, int const , __pyx_t_6gensim_6models_14word2vec_inner_REAL_t *)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
   if (__Pyx_ImportFunction(__pyx_t_1, "init_w2v_config", (void (**)(void))&__pyx_f_6gensim_6models_14word2vec_inner_init_w2v_config, "PyObject *(struct __pyx_t_6gensim_6models_14word2vec_inner_Word2VecConfig *, PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_6gensim_6models_14word2vec_inner_init_w2v_config *__pyx_optional_args)") < 0) __PYX_ERR(1, 1, __pyx_L1_error)
@@ -11202,7 +13679,7 @@ if (!__Pyx_RefNanny) {
  * import numpy as np
  * 
  * from gensim.utils import any2utf8             # <<<<<<<<<<<<<<
- * from six import iteritems
+ * from six import iteritems, string_types
  * 
  */
   __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
@@ -11222,15 +13699,18 @@ if (!__Pyx_RefNanny) {
   /* "gensim/models/word2vec_corpusfile.pyx":18
  * 
  * from gensim.utils import any2utf8
- * from six import iteritems             # <<<<<<<<<<<<<<
+ * from six import iteritems, string_types             # <<<<<<<<<<<<<<
  * 
  * cimport numpy as np
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 18, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_iteritems);
   __Pyx_GIVEREF(__pyx_n_s_iteritems);
   PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_iteritems);
+  __Pyx_INCREF(__pyx_n_s_string_types);
+  __Pyx_GIVEREF(__pyx_n_s_string_types);
+  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_string_types);
   __pyx_t_1 = __Pyx_Import(__pyx_n_s_six, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -11238,50 +13718,66 @@ if (!__Pyx_RefNanny) {
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_iteritems, __pyx_t_2) < 0) __PYX_ERR(1, 18, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_string_types); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 18, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_string_types, __pyx_t_2) < 0) __PYX_ERR(1, 18, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":65
+  /* "gensim/models/word2vec_corpusfile.pyx":71
  * 
  * 
  * def rebuild_cython_line_sentence(source, max_sentence_length):             # <<<<<<<<<<<<<<
  *     return CythonLineSentence(source, max_sentence_length=max_sentence_length)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_1rebuild_cython_line_sentence, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 65, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_1rebuild_cython_line_sentence, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rebuild_cython_line_sentence, __pyx_t_1) < 0) __PYX_ERR(1, 65, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_rebuild_cython_line_sentence, __pyx_t_1) < 0) __PYX_ERR(1, 71, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":249
+  /* "gensim/models/word2vec_corpusfile.pyx":246
+ * 
+ * 
+ * def id_corpus_or_none(corpus_file, offset):             # <<<<<<<<<<<<<<
+ *     """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+ *     if isinstance(corpus_file, string_types):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_3id_corpus_or_none, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_id_corpus_or_none, __pyx_t_1) < 0) __PYX_ERR(1, 246, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gensim/models/word2vec_corpusfile.pyx":364
  * 
  * 
  * def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                    _neu1, compute_loss):
  *     """Train Skipgram model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_3train_epoch_sg, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 249, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_5train_epoch_sg, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 364, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_sg, __pyx_t_1) < 0) __PYX_ERR(1, 249, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_sg, __pyx_t_1) < 0) __PYX_ERR(1, 364, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":346
+  /* "gensim/models/word2vec_corpusfile.pyx":482
  * 
  * 
  * def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expected_examples, _expected_words, _work,             # <<<<<<<<<<<<<<
  *                      _neu1, compute_loss):
  *     """Train CBOW model for one epoch by training on an input stream. This function is used only in multistream mode.
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_5train_epoch_cbow, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 346, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_6gensim_6models_19word2vec_corpusfile_7train_epoch_cbow, NULL, __pyx_n_s_gensim_models_word2vec_corpusfil); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 482, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_cbow, __pyx_t_1) < 0) __PYX_ERR(1, 346, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_train_epoch_cbow, __pyx_t_1) < 0) __PYX_ERR(1, 482, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "gensim/models/word2vec_corpusfile.pyx":441
+  /* "gensim/models/word2vec_corpusfile.pyx":593
  * 
  * 
  * CORPUSFILE_VERSION = 1             # <<<<<<<<<<<<<<
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(1, 441, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CORPUSFILE_VERSION, __pyx_int_1) < 0) __PYX_ERR(1, 593, __pyx_L1_error)
 
   /* "gensim/models/word2vec_corpusfile.pyx":1
  * #!/usr/bin/env cython             # <<<<<<<<<<<<<<
@@ -12805,6 +15301,37 @@ bad:
   return err;
 }
 
+/* CIntToPy */
+      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntToPy */
       static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = (int) 0;
@@ -60,8 +60,25 @@ ctypedef unordered_map[string, VocabItem] cvocab_t
 
 cdef class CythonVocab:
     cdef cvocab_t vocab
+    cdef vector[VocabItem] items
     cdef subword_arrays
     cdef cvocab_t* get_vocab_ptr(self) nogil except *
+    cdef VocabItem* get_items_ptr(self) nogil
+
+
+cdef class CythonIdCorpus:
+    cdef public object corpus
+    cdef np.int32_t *ids
+    cdef np.int64_t *offsets
+    cdef public long long num_sentences, start, sentence, position
+    cdef public size_t max_sentence_length
+    cdef vector[np.int32_t*] batch_words
+    cdef vector[int] batch_lengths
+
+    cdef bool_t is_eof(self) nogil
+    cdef void reset(self) nogil
+    cdef int next_batch(self) nogil
+    cdef int read_document(self, np.int32_t **words) nogil
 
 
 cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil
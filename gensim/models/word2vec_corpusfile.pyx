@@ -15,7 +15,7 @@ import cython
 import numpy as np
 
 from gensim.utils import any2utf8
-from six import iteritems
+from six import iteritems, string_types
 
 cimport numpy as np
 
@@ -26,6 +26,7 @@ from libcpp cimport bool as bool_t
 from gensim.models.word2vec_inner cimport (
     w2v_fast_sentence_sg_hs,
     w2v_fast_sentence_sg_neg,
+    w2v_fast_window_sg_neg,
     w2v_fast_sentence_cbow_hs,
     w2v_fast_sentence_cbow_neg,
     random_int32,
@@ -41,6 +42,7 @@ cdef class CythonVocab:
     def __init__(self, wv, hs=0, fasttext=0):
         cdef VocabItem word
 
+        self.items.resize(len(wv.vocab))
         for py_token, vocab_item in iteritems(wv.vocab):
             token = any2utf8(py_token)
             word.index = vocab_item.index
@@ -57,10 +59,14 @@ cdef class CythonVocab:
                 word.subword_idx = <np.uint32_t *>np.PyArray_DATA(wv.buckets_word[word.index])
 
             self.vocab[token] = word
+            self.items[word.index] = word
 
     cdef cvocab_t* get_vocab_ptr(self) nogil except *:
         return &self.vocab
 
+    cdef VocabItem* get_items_ptr(self) nogil:
+        return self.items.data()
+
 
 def rebuild_cython_line_sentence(source, max_sentence_length):
     return CythonLineSentence(source, max_sentence_length=max_sentence_length)
@@ -179,6 +185,71 @@ cdef class CythonLineSentence:
         return job_batch
 
 
+@cython.final
+cdef class CythonIdCorpus:
+    """Reader of a :class:`~gensim.models.word2vec.IndexedCorpusFile`, without the GIL.
+
+    Sentences are read as pointers into the memory-mapped token ids, starting from sentence number `offset`,
+    and split into chunks of at most `max_sentence_length` words, like in :class:`CythonLineSentence`.
+
+    """
+    def __init__(self, corpus, offset=0, max_sentence_length=MAX_SENTENCE_LEN):
+        self.corpus = corpus  # keeps the memory maps alive
+        self.ids = <np.int32_t *>np.PyArray_DATA(corpus.ids)
+        self.offsets = <np.int64_t *>np.PyArray_DATA(corpus.offsets)
+        self.num_sentences = len(corpus)
+        self.start = offset
+        self.max_sentence_length = max_sentence_length
+        self.reset()
+
+    cdef bool_t is_eof(self) nogil:
+        return self.sentence >= self.num_sentences
+
+    cdef void reset(self) nogil:
+        self.sentence = self.start
+        self.position = 0
+
+    cdef int next_batch(self) nogil:
+        """Collect the next sentence chunks into `batch_words` and `batch_lengths`, and return their number.
+
+        Chunks are added for as long as the batch holds at most `max_sentence_length` words, exactly like
+        :meth:`CythonLineSentence.next_batch` does, so that both readers produce the same batches.
+
+        """
+        cdef long long length
+        cdef size_t batch_size = 0
+
+        self.batch_words.clear()
+        self.batch_lengths.clear()
+        while self.sentence < self.num_sentences and batch_size <= self.max_sentence_length:
+            length = self.offsets[self.sentence + 1] - self.offsets[self.sentence] - self.position
+            if length > <long long>self.max_sentence_length:
+                length = self.max_sentence_length
+            self.batch_words.push_back(self.ids + self.offsets[self.sentence] + self.position)
+            self.batch_lengths.push_back(<int>length)
+            batch_size += length
+            self.position += length
+            if self.offsets[self.sentence] + self.position >= self.offsets[self.sentence + 1]:
+                self.sentence += 1
+                self.position = 0
+        return self.batch_words.size()
+
+    cdef int read_document(self, np.int32_t **words) nogil:
+        """Point `words` to the whole next sentence and return its length."""
+        cdef int length = self.offsets[self.sentence + 1] - self.offsets[self.sentence]
+        words[0] = self.ids + self.offsets[self.sentence]
+        self.sentence += 1
+        self.position = 0
+        return length
+
+
+def id_corpus_or_none(corpus_file, offset):
+    """Get a :class:`CythonIdCorpus` reader if `corpus_file` is a pre-indexed corpus, None if it is a path."""
+    if isinstance(corpus_file, string_types):
+        return None
+    return CythonIdCorpus(corpus_file, offset)
+
+
 cdef void prepare_c_structures_for_batch(
         vector[vector[string]] &sentences, int sample, int hs, int window, int *total_words,
         int *effective_words, int *effective_sentences, unsigned long long *next_random,
@@ -225,6 +296,50 @@ cdef void prepare_c_structures_for_batch(
         reduced_windows[i] = random_int32(next_random) % window
 
 
+cdef void prepare_c_structures_for_id_batch(
+        vector[np.int32_t*] &sentences, vector[int] &lengths, int sample, int hs, int window, int *total_words,
+        int *effective_words, int *effective_sentences, unsigned long long *next_random,
+        VocabItem *vocab, int *sentence_idx, np.uint32_t *indexes, int *codelens,
+        np.uint8_t **codes, np.uint32_t **points, np.uint32_t *reduced_windows) nogil:
+    cdef VocabItem *word
+    cdef np.int32_t *sent
+    cdef size_t sent_no
+    cdef int pos
+
+    sentence_idx[0] = 0  # indices of the first sentence always start at 0
+    for sent_no in range(sentences.size()):
+        if lengths[sent_no] == 0:
+            continue  # ignore empty sentences; leave effective_sentences unchanged
+        sent = sentences[sent_no]
+        total_words[0] += lengths[sent_no]
+
+        for pos in range(lengths[sent_no]):
+            if sent[pos] < 0:
+                continue  # out of vocabulary, same as a missing token
+
+            word = &vocab[sent[pos]]
+            if sample and word.sample_int < random_int32(next_random):
+                continue
+            indexes[effective_words[0]] = word.index
+            if hs:
+                codelens[effective_words[0]] = word.code_len
+                codes[effective_words[0]] = word.code
+                points[effective_words[0]] = word.point
+            effective_words[0] += 1
+            if effective_words[0] == MAX_SENTENCE_LEN:
+                break
+
+        effective_sentences[0] += 1
+        sentence_idx[effective_sentences[0]] = effective_words[0]
+
+        if effective_words[0] == MAX_SENTENCE_LEN:
+            break
+
+    # precompute "reduced window" offsets in a single randint() call
+    for i in range(effective_words[0]):
+        reduced_windows[i] = random_int32(next_random) % window
+
+
 cdef REAL_t get_alpha(REAL_t alpha, REAL_t end_alpha, int cur_epoch, int num_epochs) nogil:
     return alpha - ((alpha - end_alpha) * (<REAL_t> cur_epoch) / num_epochs)
 
@@ -256,8 +371,10 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     ----------
     model : :class:`~gensim.models.word2vec.Word2Vec`
         The Word2Vec model instance to train.
-    input_stream : iterable of list of str
-        The corpus used to train the model.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -284,30 +401,44 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
-    cdef int sent_idx, idx_start, idx_end
+    cdef int sent_idx, idx_start, idx_end, num_sentences
 
     init_w2v_config(&c, model, _alpha, compute_loss, _work)
 
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
-
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
-                &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
-                c.codelens, c.codes, c.points, c.reduced_windows)
+            if indexed:
+                # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+                num_sentences = id_stream.next_batch()
+                prepare_c_structures_for_id_batch(
+                    id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+                    &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+                    c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
+                    c.codelens, c.codes, c.points, c.reduced_windows)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -319,6 +450,11 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
                     k = i + c.window + 1 - c.reduced_windows[i]
                     if k > idx_end:
                         k = idx_end
+                    if c.shared_negatives:
+                        c.next_random = w2v_fast_window_sg_neg(
+                            c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k,
+                            c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+                        continue
                     for j in range(j, k):
                         if j == i:
                             continue
@@ -332,7 +468,7 @@ def train_epoch_sg(model, corpus_file, offset, _cython_vocab, _cur_epoch, _expec
                                 c.indexes[i], c.indexes[j], c.alpha, c.work, c.next_random, c.word_locks,
                                 c.compute_loss, &c.running_training_loss)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(
@@ -353,8 +489,10 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     ----------
     model : :class:`~gensim.models.word2vec.Word2Vec`
         The Word2Vec model instance to train.
-    input_stream : iterable of list of str
-        The corpus used to train the model.
+    corpus_file : {str, :class:`~gensim.models.word2vec.IndexedCorpusFile`}
+        Path to a corpus file in :class:`~gensim.models.word2vec.LineSentence` format, or a pre-indexed corpus.
+    offset : int
+        Offset in `corpus_file` to start reading from: in bytes for a path, in sentences for a pre-indexed corpus.
     _cur_epoch : int
         Current epoch number. Used for calculating and decaying learning rate.
     _work : np.ndarray
@@ -381,30 +519,44 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
     cdef REAL_t end_alpha = model.min_alpha
     cdef REAL_t _alpha = get_alpha(model.alpha, end_alpha, cur_epoch, num_epochs)
 
-    cdef CythonLineSentence input_stream = CythonLineSentence(corpus_file, offset)
+    cdef CythonIdCorpus id_stream = id_corpus_or_none(corpus_file, offset)
+    cdef CythonLineSentence input_stream = None if id_stream is not None else CythonLineSentence(corpus_file, offset)
+    cdef bint indexed = id_stream is not None
     cdef CythonVocab vocab = _cython_vocab
 
     cdef int i, j, k
     cdef int effective_words = 0, effective_sentences = 0
     cdef int total_effective_words = 0, total_sentences = 0, total_words = 0
-    cdef int sent_idx, idx_start, idx_end
+    cdef int sent_idx, idx_start, idx_end, num_sentences
 
     init_w2v_config(&c, model, _alpha, compute_loss, _work, _neu1)
 
     cdef vector[vector[string]] sentences
 
     with nogil:
-        input_stream.reset()
-        while not (input_stream.is_eof() or total_words > expected_words / c.workers):
+        if indexed:
+            id_stream.reset()
+        else:
+            input_stream.reset()
+        while not ((id_stream.is_eof() if indexed else input_stream.is_eof()) or
+                   total_words > expected_words / c.workers):
             effective_sentences = 0
             effective_words = 0
 
-            sentences = input_stream.next_batch()
-
-            prepare_c_structures_for_batch(
-                sentences, c.sample, c.hs, c.window, &total_words, &effective_words,
-                &effective_sentences, &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx,
-                c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+            if indexed:
+                # pre-indexed corpus: no tokenization or vocabulary lookups, just token ids
+                num_sentences = id_stream.next_batch()
+                prepare_c_structures_for_id_batch(
+                    id_stream.batch_words, id_stream.batch_lengths, c.sample, c.hs, c.window, &total_words,
+                    &effective_words, &effective_sentences, &c.next_random, vocab.get_items_ptr(),
+                    c.sentence_idx, c.indexes, c.codelens, c.codes, c.points, c.reduced_windows)
+            else:
+                sentences = input_stream.next_batch()
+                num_sentences = sentences.size()
+                prepare_c_structures_for_batch(
+                    sentences, c.sample, c.hs, c.window, &total_words, &effective_words, &effective_sentences,
+                    &c.next_random, vocab.get_vocab_ptr(), c.sentence_idx, c.indexes,
+                    c.codelens, c.codes, c.points, c.reduced_windows)
 
             for sent_idx in range(effective_sentences):
                 idx_start = c.sentence_idx[sent_idx]
@@ -427,7 +579,7 @@ def train_epoch_cbow(model, corpus_file, offset, _cython_vocab, _cur_epoch, _exp
                             c.syn1neg, c.size, c.indexes, c.alpha, c.work, i, j, k, c.cbow_mean,
                             c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
 
-            total_sentences += sentences.size()
+            total_sentences += num_sentences
             total_effective_words += effective_words
 
             c.alpha = get_next_alpha(
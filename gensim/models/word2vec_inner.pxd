@@ -25,6 +25,9 @@ ctypedef float (*sdot_ptr) (const int *N, const float *X, const int *incX, const
 ctypedef double (*dsdot_ptr) (const int *N, const float *X, const int *incX, const float *Y, const int *incY) nogil
 ctypedef double (*snrm2_ptr) (const int *N, const float *X, const int *incX) nogil
 ctypedef void (*sscal_ptr) (const int *N, const float *alpha, const float *X, const int *incX) nogil
+ctypedef void (*sgemm_ptr) (
+    const char *transA, const char *transB, const int *M, const int *N, const int *K, const float *alpha,
+    const float *A, const int *ldA, const float *B, const int *ldB, const float *beta, float *C, const int *ldC) nogil
 
 cdef scopy_ptr scopy
 cdef saxpy_ptr saxpy
@@ -32,6 +35,7 @@ cdef sdot_ptr sdot
 cdef dsdot_ptr dsdot
 cdef snrm2_ptr snrm2
 cdef sscal_ptr sscal
+cdef sgemm_ptr sgemm
 
 # precalculated sigmoid table
 DEF EXP_TABLE_SIZE = 1000
@@ -49,7 +53,7 @@ cdef our_saxpy_ptr our_saxpy
 
 
 cdef struct Word2VecConfig:
-    int hs, negative, sample, compute_loss, size, window, cbow_mean, workers
+    int hs, negative, sample, compute_loss, size, window, cbow_mean, workers, shared_negatives
     REAL_t running_training_loss, alpha
 
     REAL_t *syn0
@@ -106,6 +110,14 @@ cdef unsigned long long w2v_fast_sentence_sg_neg(
     const int _compute_loss, REAL_t *_running_training_loss_param) nogil
 
 
+cdef unsigned long long w2v_fast_window_sg_neg(
+    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t indexes[MAX_SENTENCE_LEN],
+    int i, int j, int k, const REAL_t alpha, REAL_t *work,
+    unsigned long long next_random, REAL_t *word_locks,
+    const int _compute_loss, REAL_t *_running_training_loss_param) nogil
+
+
 cdef void w2v_fast_sentence_cbow_hs(
     const np.uint32_t *word_point, const np.uint8_t *word_code, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1, REAL_t *syn0, REAL_t *syn1, const int size,
@@ -17,7 +17,7 @@ cimport numpy as np
 
 from libc.math cimport exp
 from libc.math cimport log
-from libc.string cimport memset
+from libc.string cimport memset, memcpy
 
 # scipy <= 0.15
 try:
@@ -36,6 +36,7 @@ cdef sdot_ptr sdot=<sdot_ptr>PyCObject_AsVoidPtr(fblas.sdot._cpointer)  # float
 cdef dsdot_ptr dsdot=<dsdot_ptr>PyCObject_AsVoidPtr(fblas.sdot._cpointer)  # double = dot(x, y)
 cdef snrm2_ptr snrm2=<snrm2_ptr>PyCObject_AsVoidPtr(fblas.snrm2._cpointer)  # sqrt(x^2)
 cdef sscal_ptr sscal=<sscal_ptr>PyCObject_AsVoidPtr(fblas.sscal._cpointer) # x = alpha * x
+cdef sgemm_ptr sgemm=<sgemm_ptr>PyCObject_AsVoidPtr(fblas.sgemm._cpointer)  # C = alpha * op(A) * op(B) + beta * C
 
 DEF EXP_TABLE_SIZE = 1000
 DEF MAX_EXP = 6
@@ -45,6 +46,9 @@ cdef REAL_t[EXP_TABLE_SIZE] LOG_TABLE
 
 cdef int ONE = 1
 cdef REAL_t ONEF = <REAL_t>1.0
+cdef REAL_t ZEROF = <REAL_t>0.0
+cdef char TRANS = b'T'
+cdef char NO_TRANS = b'N'
 
 
 # for when fblas.sdot returns a double
@@ -247,6 +251,138 @@ cdef unsigned long long w2v_fast_sentence_sg_neg(
     return next_random
 
 
+cdef unsigned long long w2v_fast_window_sg_neg(
+    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    REAL_t *syn0, REAL_t *syn1neg, const int size, const np.uint32_t indexes[MAX_SENTENCE_LEN],
+    int i, int j, int k, const REAL_t alpha, REAL_t *work,
+    unsigned long long next_random, REAL_t *word_locks,
+    const int _compute_loss, REAL_t *_running_training_loss_param) nogil:
+    """Train on a single effective word and all its context words at once, using the Skip-Gram model.
+
+    Unlike :func:`w2v_fast_sentence_sg_neg`, which trains each (word, context word) pair against its own
+    negative words, one set of negative words is drawn for the whole window and shared by its context words
+    (the approach of Ji et al., "Parallelizing Word2Vec in Shared and Distributed Memory", 2016). The scores and
+    the updates of all pairs are then matrix-matrix products (level-3 BLAS), rather than a sequence of
+    vector operations.
+
+    Parameters
+    ----------
+    negative
+        Number of negative words to be sampled.
+    cum_table
+        Cumulative-distribution table using stored vocabulary word counts for
+        drawing random words (with a negative label).
+    cum_table_len
+        Length of the `cum_table`
+    syn0
+        Embeddings for the words in the vocabulary (`model.wv.vectors`)
+    syn1neg
+        Weights of the hidden layer in the model's trainable neural network.
+    size
+        Length of the embeddings.
+    indexes
+        Indexes of the words of the current sentence in the vocabulary.
+    i
+        Position of the current training word in `indexes`.
+    j
+        Position of the first context word in `indexes`.
+    k
+        Position after the last context word in `indexes`.
+    alpha
+        Learning rate.
+    work
+        Private working memory for each worker, of at least `(negative + 1) + (2 * C + 2 * T) * size + C * T`
+        floats for `C = k - j - 1` context words and `T = negative + 1` output words.
+    next_random
+        Seed to produce the index for the next word to be randomly sampled.
+    word_locks
+        Lock factors for each word. A value of 0 will block training.
+    _compute_loss
+        Whether or not the loss should be computed at this step.
+    _running_training_loss_param
+        Running loss, used to debug or inspect how training progresses.
+
+    Returns
+    -------
+    Seed to draw the training word for the next iteration of the same routine.
+
+    """
+    cdef unsigned long long modulo = 281474976710655ULL
+    cdef np.uint32_t word_index = indexes[i]
+    cdef np.uint32_t target_index
+    cdef int num_contexts = k - j - 1, num_targets = 1
+    cdef int a, b, d
+    cdef REAL_t f, f_dot, label
+
+    if num_contexts <= 0:
+        return next_random
+
+    # the output words: the current word (label 1), then the negative words (label 0)
+    cdef np.uint32_t *targets = <np.uint32_t *>work
+    targets[0] = word_index
+    for d in range(negative):
+        target_index = bisect_left(cum_table, (next_random >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
+        next_random = (next_random * <unsigned long long>25214903917ULL + 11) & modulo
+        if target_index == word_index:
+            continue
+        targets[num_targets] = target_index
+        num_targets += 1
+
+    # row-major matrices: context vectors, output vectors, scores (then gradients) and the updates of both vectors
+    cdef REAL_t *l1 = work + negative + 1
+    cdef REAL_t *l2 = l1 + num_contexts * size
+    cdef REAL_t *scores = l2 + num_targets * size
+    cdef REAL_t *neu1e = scores + num_contexts * num_targets
+    cdef REAL_t *l2e = neu1e + num_contexts * size
+
+    a = 0
+    for b in range(j, k):
+        if b != i:
+            memcpy(&l1[a * size], &syn0[<long long>indexes[b] * size], size * cython.sizeof(REAL_t))
+            a += 1
+    for d in range(num_targets):
+        memcpy(&l2[d * size], &syn1neg[<long long>targets[d] * size], size * cython.sizeof(REAL_t))
+
+    # BLAS is column-major: a row-major (m x n) matrix is its column-major (n x m) transpose.
+    # scores = l1 * l2^T, a (num_contexts x num_targets) matrix
+    sgemm(&TRANS, &NO_TRANS, &num_targets, &num_contexts, &size, &ONEF, l2, &size, l1, &size, &ZEROF,
+          scores, &num_targets)
+
+    for a in range(num_contexts):
+        for d in range(num_targets):
+            f_dot = scores[a * num_targets + d]
+            if f_dot <= -MAX_EXP or f_dot >= MAX_EXP:
+                scores[a * num_targets + d] = ZEROF
+                continue
+            f = EXP_TABLE[<int>((f_dot + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+            label = ONEF if d == 0 else ZEROF
+            scores[a * num_targets + d] = (label - f) * alpha
+
+            if _compute_loss == 1:
+                f_dot = (f_dot if d == 0 else -f_dot)
+                if f_dot <= -MAX_EXP or f_dot >= MAX_EXP:
+                    continue
+                _running_training_loss_param[0] = _running_training_loss_param[0] - LOG_TABLE[
+                    <int>((f_dot + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+
+    # neu1e = scores * l2, the updates of the context vectors
+    sgemm(&NO_TRANS, &NO_TRANS, &size, &num_contexts, &num_targets, &ONEF, l2, &size, scores, &num_targets, &ZEROF,
+          neu1e, &size)
+    # l2e = scores^T * l1, the updates of the output vectors
+    sgemm(&NO_TRANS, &TRANS, &size, &num_targets, &num_contexts, &ONEF, l1, &size, scores, &num_targets, &ZEROF,
+          l2e, &size)
+
+    for d in range(num_targets):
+        our_saxpy(&size, &ONEF, &l2e[d * size], &ONE, &syn1neg[<long long>targets[d] * size], &ONE)
+    a = 0
+    for b in range(j, k):
+        if b != i:
+            our_saxpy(&size, &word_locks[indexes[b]], &neu1e[a * size], &ONE, &syn0[<long long>indexes[b] * size], &ONE)
+            a += 1
+
+    return next_random
+
+
 cdef void w2v_fast_sentence_cbow_hs(
     const np.uint32_t *word_point, const np.uint8_t *word_code, int codelens[MAX_SENTENCE_LEN],
     REAL_t *neu1, REAL_t *syn0, REAL_t *syn1, const int size,
@@ -471,6 +607,7 @@ cdef init_w2v_config(Word2VecConfig *c, model, alpha, compute_loss, _work, _neu1
     c[0].cbow_mean = model.cbow_mean
     c[0].window = model.window
     c[0].workers = model.workers
+    c[0].shared_negatives = model.shared_negatives
 
     c[0].compute_loss = (1 if compute_loss else 0)
     c[0].running_training_loss = model.running_training_loss
@@ -576,6 +713,9 @@ def train_batch_sg(model, sentences, alpha, _work, compute_loss):
                 k = i + c.window + 1 - c.reduced_windows[i]
                 if k > idx_end:
                     k = idx_end
+                if c.shared_negatives:
+                    c.next_random = w2v_fast_window_sg_neg(c.negative, c.cum_table, c.cum_table_len, c.syn0, c.syn1neg, c.size, c.indexes, i, j, k, c.alpha, c.work, c.next_random, c.word_locks, c.compute_loss, &c.running_training_loss)
+                    continue
                 for j in range(j, k):
                     if j == i:
                         continue
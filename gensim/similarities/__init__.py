@@ -4,3 +4,6 @@ This package contains implementations of pairwise similarity queries.
 
 # bring classes directly into package namespace, to save some typing
 from .docsim import Similarity, MatrixSimilarity, SparseMatrixSimilarity, SoftCosineSimilarity, WmdSimilarity  # noqa:F401
+from .docsim import DistributionSimilarity  # noqa:F401
+from .ivf import IvfSimilarity  # noqa:F401
+from .minhash import LshSimilarity  # noqa:F401
@@ -65,17 +65,41 @@ uses the faster, batch queries internally and **is ideal for all-vs-all pairwise
     >>> for similarities in index:  # yield similarities of the 1st indexed document, then 2nd...
     ...     pass
 
+If you only need the most similar pairs (e.g. to find near-duplicates), :func:`~gensim.similarities.docsim.self_join`
+computes all-vs-all similarities block by block and streams only the pairs above a threshold, or the top-N of each
+document, to a Matrix Market file:
+.. sourcecode:: pycon
+
+    >>> from gensim.similarities.docsim import self_join
+    >>>
+    >>> neighbours = self_join(index, get_tmpfile("neighbours.mm"), threshold=0.8)
+
+Documents can carry integer or categorical attributes. Queries can then be restricted to the documents that match a
+filter; the filter is applied inside each shard before the top-N are selected, so nothing needs to be over-fetched:
+.. sourcecode:: pycon
+
+    >>> index.set_attribute('lang', ['en', 'de', 'en', 'en', 'de', 'en', 'de', 'en', 'en'])
+    >>> index.num_best = 3
+    >>> top_english = index.search(query, where={'lang': 'en'})
+
 """
 
 import logging
 import itertools
 import os
 import heapq
+import copy
+import glob
+import tempfile
+import threading
+import operator
 
 import numpy
 import scipy.sparse
+from scipy.special import xlogy
 
 from gensim import interfaces, utils, matutils
+from gensim.corpora.indexedcorpus import IndexedCorpus
 from six.moves import map as imap, xrange, zip as izip
 
 
@@ -84,19 +108,230 @@ logger = logging.getLogger(__name__)
 PARALLEL_SHARDS = False
 try:
     import multiprocessing
+    import multiprocessing.pool
     # by default, don't parallelize queries. uncomment the following line if you want that.
 #    PARALLEL_SHARDS = multiprocessing.cpu_count() # use #parallel processes = #CPus
 except ImportError:
     pass
 
 
+# comparison operators accepted in filter expressions, see DocumentAttributes.mask()
+FILTER_OPERATORS = {
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    'in': None, 'not in': None,
+}
+
+
+class DocumentAttributes(utils.SaveLoad):
+    """Integer and categorical attributes of indexed documents, used to filter query results.
+
+    Each attribute is a column with one value per document position. Numeric values are stored as float64,
+    with NaN for documents that have no value; any other values (strings, ...) are categorical and stored as integer
+    codes, with -1 for missing values. Filter expressions are evaluated into a boolean bitmap over the
+    document positions, which is cached until an attribute changes.
+
+    Filter expressions are dicts that map attribute names to conditions, all of which must hold:
+
+    * a plain value: the attribute equals that value, e.g. `{'lang': 'en'}`,
+    * a list, tuple or set: the attribute is one of these values, e.g. `{'lang': ['en', 'de']}`,
+    * a dict of `{operator: value}`, with operators '==', '!=', '<', '<=', '>', '>=', 'in' and 'not in',
+      e.g. `{'year': {'>=': 2015, '<': 2019}}`. Order comparisons only apply to numeric attributes.
+
+    Documents with a missing value never match a condition on that attribute.
+
+    """
+    max_masks = 64  # maximum number of cached bitmaps
+
+    def __init__(self, length=0):
+        """
+
+        Parameters
+        ----------
+        length : int, optional
+            Number of documents.
+
+        """
+        self.length = length
+        self.columns = {}
+        self.categories = {}  # {attribute name: {value: code}}, for categorical attributes
+        self.masks = {}
+
+    def __len__(self):
+        return self.length
+
+    def __getstate__(self):
+        result = self.__dict__.copy()
+        result['masks'] = {}  # cached bitmaps are cheap to rebuild
+        return result
+
+    def resize(self, length):
+        """Extend all attributes to `length` documents, the new documents have missing values.
+
+        Parameters
+        ----------
+        length : int
+            New number of documents.
+
+        """
+        if length < self.length:
+            raise ValueError("cannot shrink attributes of %i documents to %i" % (self.length, length))
+        for name, column in self.columns.items():
+            missing = -1 if name in self.categories else numpy.nan
+            self.columns[name] = numpy.concatenate(
+                [column, numpy.full(length - self.length, missing, dtype=column.dtype)]
+            )
+        self.length = length
+        self.masks = {}
+
+    def set(self, name, values, positions=None):
+        """Set the values of attribute `name`.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+        values : iterable
+            Attribute values, one per document in `positions`.
+        positions : iterable of int, optional
+            Document positions, all documents by default.
+
+        """
+        values = numpy.asarray(list(values) if not isinstance(values, numpy.ndarray) else values)
+        positions = numpy.arange(self.length) if positions is None else numpy.asarray(positions, dtype=numpy.int64)
+        if values.shape != positions.shape:
+            raise ValueError("got %i values of attribute %r for %i documents" % (len(values), name, len(positions)))
+        if len(positions) and (positions.min() < 0 or positions.max() >= self.length):
+            raise ValueError("invalid document positions: must be 0 <= x < %s" % self.length)
+        categorical = values.dtype.kind not in 'biuf'
+        if name not in self.columns:
+            if categorical:
+                self.categories[name] = {}
+                self.columns[name] = numpy.full(self.length, -1, dtype=numpy.int32)
+            else:
+                self.columns[name] = numpy.full(self.length, numpy.nan, dtype=numpy.float64)
+        elif categorical != (name in self.categories):
+            raise ValueError("attribute %r cannot mix numeric and categorical values" % name)
+        if categorical:
+            codes = self.categories[name]
+            values = numpy.fromiter((codes.setdefault(value, len(codes)) for value in values.tolist()), numpy.int32)
+        self.columns[name][positions] = values
+        self.masks = {}
+
+    def compare(self, name, op, value):
+        """Evaluate a single condition on attribute `name`.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+        op : str
+            One of the `FILTER_OPERATORS`.
+        value : object
+            Value to compare with, an iterable of values for 'in' and 'not in'.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean bitmap of the documents for which the condition holds.
+
+        """
+        if name not in self.columns:
+            raise ValueError("unknown attribute %r" % name)
+        if op not in FILTER_OPERATORS:
+            raise ValueError("unknown operator %r, expected one of %s" % (op, sorted(FILTER_OPERATORS)))
+        column = self.columns[name]
+        present = column >= 0 if name in self.categories else ~numpy.isnan(column)
+        if op in ('in', 'not in'):
+            values = list(value)
+            if name in self.categories:
+                codes = self.categories[name]
+                values = [codes[v] for v in values if v in codes]
+            result = numpy.in1d(column, numpy.asarray(values, dtype=column.dtype))
+            return result if op == 'in' else present & ~result
+        if name in self.categories:
+            if op not in ('==', '!='):
+                raise ValueError("operator %r is not supported for categorical attribute %r" % (op, name))
+            value = self.categories[name].get(value, -2)  # -2 matches no document, unlike -1 for missing values
+        with numpy.errstate(invalid='ignore'):  # missing values (NaN) are left out by `present` already
+            return present & FILTER_OPERATORS[op](column, value)
+
+    def mask(self, where):
+        """Get the bitmap of the documents that match filter expression `where`.
+
+        Parameters
+        ----------
+        where : dict
+            Filter expression, see :class:`~gensim.similarities.docsim.DocumentAttributes`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean bitmap over the document positions, True for the documents that match.
+
+        """
+        key = repr(sorted((repr(name), repr(condition)) for name, condition in where.items()))
+        result = self.masks.get(key)
+        if result is not None:
+            return result
+        result = numpy.ones(self.length, dtype=bool)
+        for name, condition in where.items():
+            if isinstance(condition, dict):
+                conditions = condition.items()
+            elif isinstance(condition, (list, tuple, set, frozenset)):
+                conditions = [('in', condition)]
+            else:
+                conditions = [('==', condition)]
+            for op, value in conditions:
+                result &= self.compare(name, op, value)
+        if len(self.masks) >= self.max_masks:
+            self.masks = {}
+        self.masks[key] = result
+        return result
+
+
+def filter_mask(attributes, where, length):
+    """Get the bitmap of the documents allowed by `where`. Used internally by filtered queries.
+
+    Parameters
+    ----------
+    attributes : :class:`~gensim.similarities.docsim.DocumentAttributes`
+        Document attributes, or None if no attributes were set.
+    where : {dict, numpy.ndarray}
+        Filter expression, or a precomputed boolean bitmap over the document positions.
+    length : int
+        Number of documents in the index.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean bitmap over the document positions, True for the documents that may be returned.
+
+    """
+    if isinstance(where, numpy.ndarray):
+        if where.dtype != bool or where.shape != (length, ):
+            raise ValueError("filter bitmap must be a boolean array with one flag per document (%i)" % length)
+        return where
+    if attributes is None:
+        raise ValueError("cannot filter by %r, no document attributes were set" % (where, ))
+    if len(attributes) != length:
+        attributes.resize(length)
+    return attributes.mask(where)
+
+
 class Shard(utils.SaveLoad):
     """A proxy that represents a single shard instance within :class:`~gensim.similarity.docsim.Similarity` index.
 
     Basically just wraps :class:`~gensim.similarities.docsim.MatrixSimilarity`,
     :class:`~gensim.similarities.docsim.SparseMatrixSimilarity`, etc, so that it mmaps from disk on request (query).
 
+    Documents deleted from the shard are only marked in the `deleted` bitmap (one flag per document position) and
+    filtered out of query results, until the shard is compacted. The rows of a compacted shard no longer match
+    the document positions one to one; `positions` then holds the position of each row of the underlying index.
+
     """
+    deleted = None  # bitmap of deleted document positions, None if nothing was deleted
+    positions = None  # position of each index row, None if the shard was never compacted
+
     def __init__(self, fname, index):
         """
 
@@ -183,8 +418,134 @@ class Shard(utils.SaveLoad):
 
         """
         assert 0 <= pos < len(self), "requested position out of range"
+        if self.deleted is not None and self.deleted[pos]:
+            raise ValueError("document at position %i was deleted" % pos)
+        if self.positions is not None:
+            pos = numpy.searchsorted(self.positions, pos)
         return self.get_index().index[pos]
 
+    def num_rows(self):
+        """Get the number of rows in the underlying index, including deleted documents that were not compacted yet.
+
+        Returns
+        -------
+        int
+            Number of index rows.
+
+        """
+        return self.length if self.positions is None else len(self.positions)
+
+    def deleted_rows(self):
+        """Get the rows of the underlying index that hold deleted documents.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted row numbers, or None if there are no deleted rows.
+
+        """
+        if self.deleted is None:
+            return None
+        deleted = self.deleted if self.positions is None else self.deleted[self.positions]
+        rows = numpy.flatnonzero(deleted)
+        return rows if len(rows) else None
+
+    def excluded_rows(self, allowed=None):
+        """Get the rows of the underlying index to leave out of a query: deleted documents, and documents that are
+        not `allowed`.
+
+        Parameters
+        ----------
+        allowed : numpy.ndarray, optional
+            Boolean bitmap over the document positions of this shard, True for the documents that may be returned.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sorted row numbers, or None if no rows are left out.
+
+        """
+        if allowed is None:
+            return self.deleted_rows()
+        excluded = ~allowed
+        if self.deleted is not None:
+            excluded |= self.deleted
+        if self.positions is not None:
+            excluded = excluded[self.positions]
+        rows = numpy.flatnonzero(excluded)
+        return rows if len(rows) else None
+
+    def delete(self, positions):
+        """Mark documents as deleted.
+
+        Parameters
+        ----------
+        positions : iterable of int
+            Positions of the documents within this shard.
+
+        """
+        if self.deleted is None:
+            self.deleted = numpy.zeros(self.length, dtype=bool)
+        self.deleted[positions] = True
+
+    def to_positions(self, result):
+        """Convert a full similarity vector (or matrix) over the index rows to one over the document positions.
+
+        Parameters
+        ----------
+        result : numpy.ndarray
+            Similarities, one column per index row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Similarities, one column per document position, 0 for compacted documents.
+
+        """
+        if self.positions is None:
+            return result
+        expanded = numpy.zeros(result.shape[:-1] + (self.length, ), dtype=result.dtype)
+        expanded[..., self.positions] = result
+        return expanded
+
+    def compact(self, fname):
+        """Rewrite the shard without its deleted documents.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the file of the compacted shard. It must differ from the current one, which may still be
+            mmapped by running queries.
+
+        Returns
+        -------
+        :class:`~gensim.similarities.docsim.Shard`
+            The compacted shard. This shard stays usable until its files are removed.
+
+        """
+        deleted = self.deleted  # deletions made during the compaction are shared with the compacted shard
+        rows = numpy.flatnonzero(~(deleted if self.positions is None else deleted[self.positions]))
+        index = copy.copy(self.get_index())
+        index.index = index.index[rows]
+        logger.info("compacting %s down to %i rows", self, len(rows))
+        shard = Shard(fname, index)
+        shard.length = self.length
+        shard.positions = rows if self.positions is None else self.positions[rows]
+        shard.deleted = deleted
+        shard.num_best = getattr(self, 'num_best', None)
+        shard.normalize = getattr(self, 'normalize', True)
+        shard.num_nnz = index.index.nnz if scipy.sparse.issparse(index.index) else numpy.count_nonzero(index.index)
+        return shard
+
+    def remove_files(self):
+        """Delete the files of this shard from disk."""
+        for fname in [self.fullname()] + glob.glob(self.fullname() + '.*'):
+            logger.info("deleting %s", fname)
+            try:
+                os.remove(fname)
+            except OSError as err:  # e.g. still mmapped on Windows
+                logger.warning("failed to delete %s: %s", fname, err)
+
     def __getitem__(self, query):
         """Get similarities of document (or corpus) `query` to all documents in the corpus.
 
@@ -203,11 +564,60 @@ class Shard(utils.SaveLoad):
         """
         index = self.get_index()
         try:
-            index.num_best = self.num_best
-            index.normalize = self.normalize
+            num_best, normalize = self.num_best, self.normalize
         except Exception:
             raise ValueError("num_best and normalize have to be set before querying a proxy Shard object")
+        return query_index(index, query, num_best, normalize, self.deleted_rows())
+
+
+def query_index(index, query, num_best, normalize, deleted_rows=None):
+    """Query `index`, leaving out the rows of deleted documents. Used internally by shards.
+
+    Parameters
+    ----------
+    index : :class:`~gensim.interfaces.SimilarityABC`
+        Index to query.
+    query : {iterable of list of (int, number) , list of (int, number))}
+        Document or corpus.
+    num_best : int
+        If set, return only the `num_best` most similar (non-deleted) rows.
+    normalize : {'l1', 'l2', False}
+        Query normalization.
+    deleted_rows : numpy.ndarray, optional
+        Rows of `index` to leave out. They get similarity 0 in full results and never appear in `num_best` results,
+        which are taken from the remaining rows, so no more than `num_best` rows are ever fetched.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` or list of (int, float)
+        Similarities of the query against the rows of the index.
+
+    Notes
+    -----
+    All rows are scored and the left out rows masked in the result, so the index itself is never copied. A re-ranking
+    :class:`~gensim.similarities.docsim.MatrixSimilarity` masks them before picking the candidates to re-rank.
+
+    """
+    index.normalize = normalize
+    if deleted_rows is None:
+        index.num_best = num_best
         return index[query]
+    if num_best is not None and isinstance(index, MatrixSimilarity) and index.exact_index is not None:
+        index.num_best, index.masked_rows = num_best, deleted_rows
+        try:
+            return index[query]
+        finally:
+            index.masked_rows = None
+    index.num_best = None
+    result = index[query]
+    if scipy.sparse.issparse(result):
+        result = result.toarray()
+    result[..., deleted_rows] = 0.0
+    if num_best is None:
+        return result
+    if result.ndim > 1:
+        return [matutils.full2sparse_clipped(v, num_best) for v in result]
+    return matutils.full2sparse_clipped(result, num_best)
 
 
 def query_shard(args):
@@ -215,8 +625,8 @@ def query_shard(args):
 
     Parameters
     ---------
-    args : (list of (int, number), :class:`~gensim.interfaces.SimilarityABC`)
-        Query and Shard instances
+    args : (list of (int, number), :class:`~gensim.interfaces.SimilarityABC`, numpy.ndarray)
+        Query, Shard instance and the rows of the shard to leave out (None to only leave out deleted documents).
 
     Returns
     -------
@@ -224,23 +634,183 @@ def query_shard(args):
         Similarities of the query against documents indexed in this shard.
 
     """
-    query, shard = args  # simulate starmap (not part of multiprocessing in older Pythons)
+    query, shard, excluded_rows = args  # simulate starmap (not part of multiprocessing in older Pythons)
     logger.debug("querying shard %s num_best=%s in process %s", shard, shard.num_best, os.getpid())
-    result = shard[query]
+    if excluded_rows is None:
+        result = shard[query]
+    else:
+        result = query_index(shard.get_index(), query, shard.num_best, shard.normalize, excluded_rows)
     logger.debug("finished querying shard %s in process %s", shard, os.getpid())
     return result
 
 
+# shards opened by the current worker process, {shard id: ((file name, length), index)}
+_worker_shards = {}
+
+
+def query_shard_by_id(args):
+    """Helper for querying a shard from a long-lived worker process of :class:`~gensim.similarities.docsim.Similarity`.
+
+    Each worker opens (mmaps) a shard the first time it is asked to query it and keeps it open, so that
+    subsequent queries only ship the query itself between processes, not the shard.
+
+    Parameters
+    ----------
+    args : (int, str, int, type, int, {'l1', 'l2', False}, numpy.ndarray, object)
+        Shard id, shard file name, shard length, shard index class, `num_best`, `normalize`,
+        the deleted rows of the shard (or None) and the query.
+
+    Returns
+    -------
+    :class:`numpy.ndarray` or :class:`scipy.sparse.csr_matrix`
+        Similarities of the query against documents indexed in this shard.
+
+    """
+    shardid, fname, length, cls, num_best, normalize, deleted_rows, query = args
+    key = (fname, length)  # a shard reopened and closed again gets rewritten, with more documents
+    cached = _worker_shards.get(shardid)
+    if cached is None or cached[0] != key:
+        logger.debug("opening shard #%i from %s in process %s", shardid, fname, os.getpid())
+        cached = _worker_shards[shardid] = (key, cls.load(fname, mmap='r'))
+    return query_index(cached[1], query, num_best, normalize, deleted_rows)
+
+
+def is_indexable(corpus):
+    """Check whether `corpus` supports `len()` and slicing, as needed for parallel shard building.
+
+    Parameters
+    ----------
+    corpus : iterable of list of (int, number)
+        Corpus in BoW format.
+
+    Returns
+    -------
+    bool
+        True for lists, tuples and :class:`~gensim.corpora.indexedcorpus.IndexedCorpus` with an offset index.
+
+    """
+    if isinstance(corpus, IndexedCorpus):
+        return corpus.index is not None
+    return isinstance(corpus, (list, tuple))
+
+
+def shard_vector(doc, num_features, norm):
+    """Convert a document to the normalized vector stored in a shard. Used internally by
+    :class:`~gensim.similarities.docsim.Similarity`.
+
+    Parameters
+    ----------
+    doc : {list of (int, number), numpy.ndarray, :class:`scipy.sparse.csr_matrix`}
+        Document in BoW format. Dense and sparse vectors are stored as they are.
+    num_features : int
+        Size of the dictionary (number of features).
+    norm : {'l1', 'l2'}
+        Normalization to use.
+
+    Returns
+    -------
+    ({numpy.ndarray, :class:`scipy.sparse.csr_matrix`}, int)
+        The vector and its number of non-zero entries.
+
+    """
+    if isinstance(doc, numpy.ndarray):
+        doclen = len(doc)
+    elif scipy.sparse.issparse(doc):
+        doclen = doc.nnz
+    else:
+        doclen = len(doc)
+        if doclen < 0.3 * num_features:
+            doc = matutils.unitvec(matutils.corpus2csc([doc], num_features).T, norm)
+        else:
+            doc = matutils.unitvec(matutils.sparse2full(doc, num_features), norm)
+    return doc, doclen
+
+
+def shard_index(docs, num_nnz, num_features):
+    """Build the index of a shard, dense or sparse depending on the density of its documents. Used internally by
+    :class:`~gensim.similarities.docsim.Similarity`.
+
+    Parameters
+    ----------
+    docs : list of {numpy.ndarray, :class:`scipy.sparse.csr_matrix`}
+        Document vectors, as returned by :func:`~gensim.similarities.docsim.shard_vector`.
+    num_nnz : int
+        Total number of non-zero entries in `docs`.
+    num_features : int
+        Size of the dictionary (number of features).
+
+    Returns
+    -------
+    {:class:`~gensim.similarities.docsim.MatrixSimilarity`, :class:`~gensim.similarities.docsim.SparseMatrixSimilarity`}
+        Index of the shard.
+
+    """
+    # consider the shard sparse if its density is < 30%
+    if 0.3 > 1.0 * num_nnz / (len(docs) * num_features):
+        return SparseMatrixSimilarity(docs, num_terms=num_features, num_docs=len(docs), num_nnz=num_nnz)
+    return MatrixSimilarity(docs, num_features=num_features)
+
+
+# corpus being indexed by the current worker process of a parallel shard build
+_worker_corpus = None
+
+
+def init_build_worker(corpus):
+    """Initialize a worker process of a parallel shard build with the corpus to index, sent only once per worker.
+
+    Parameters
+    ----------
+    corpus : {list of list of (int, number), :class:`~gensim.corpora.indexedcorpus.IndexedCorpus`}
+        Corpus in BoW format, that supports slicing.
+
+    """
+    global _worker_corpus
+    _worker_corpus = corpus
+
+
+def build_shard(args):
+    """Build and save the shard of a range of documents, in a worker process of a parallel shard build.
+
+    Parameters
+    ----------
+    args : (str, int, int, int, {'l1', 'l2'})
+        Shard file name, first and past-the-last document of the range in the corpus, number of features
+        and normalization.
+
+    Returns
+    -------
+    :class:`~gensim.similarities.docsim.Shard`
+        The saved shard, the same as if it was built by :meth:`~gensim.similarities.docsim.Similarity.close_shard`.
+
+    """
+    fname, start, stop, num_features, norm = args
+    logger.debug("building shard of documents #%i-#%i in process %s", start, stop, os.getpid())
+    docs, num_nnz = [], 0
+    for doc in _worker_corpus[start:stop]:
+        doc, doclen = shard_vector(doc, num_features, norm)
+        docs.append(doc)
+        num_nnz += doclen
+    shard = Shard(fname, shard_index(docs, num_nnz, num_features))
+    shard.num_nnz = num_nnz
+    return shard
+
+
 class Similarity(interfaces.SimilarityABC):
     """Compute cosine similarity of a dynamic query against a corpus of documents ('the index').
 
-    The index supports adding new documents dynamically.
+    The index supports adding new documents dynamically, as well as deleting them.
 
     Notes
     -----
     Scalability is achieved by sharding the index into smaller pieces, each of which fits into core memory
     The shards themselves are simply stored as files to disk and mmap'ed back as needed.
 
+    Deleted documents keep their positions (the positions of the other documents never change), but are left out
+    of all query results. They stay in their shards until the shards are rewritten by
+    :meth:`~gensim.similarities.docsim.Similarity.compact`. If `compaction_threshold` is set, this also happens in a
+    background thread as soon as more than `compaction_threshold` of the rows of some shard belong to deleted documents.
+    The files of a rewritten shard are only deleted once no running query reads them anymore.
+
     Examples
     --------
     .. sourcecode:: pycon
@@ -264,6 +834,8 @@ class Similarity(interfaces.SimilarityABC):
         >>> # uses the faster, batch queries internally and **is ideal for all-vs-all pairwise similarities**:
         >>> for similarities in index:  # yield similarities of the 1st indexed document, then 2nd...
         ...     pass
+        >>>
+        >>> index.delete([0, 2])  # documents at positions 0 and 2 won't be returned by queries anymore
 
     See Also
     --------
@@ -277,8 +849,13 @@ class Similarity(interfaces.SimilarityABC):
         Index similarity (with word-mover distance).
 
     """
+    compaction_threshold = None  # indexes stored by older versions never compact
+    compaction_thread = None
+    retired_shards = ()  # shards replaced by a compaction, whose files are still read by running queries
+    attributes = None  # document attributes for filtered queries, None if no attributes were set
 
-    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2'):
+    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768, norm='l2',
+                 workers=None, pool_type='process', compaction_threshold=None, build_workers=1):
         """
 
         Parameters
@@ -299,6 +876,20 @@ class Similarity(interfaces.SimilarityABC):
             comfortably into your RAM.
         norm : {'l1', 'l2'}, optional
             Normalization to use.
+        workers : int, optional
+            Number of workers that query the shards in parallel. The workers are started on the first query and
+            kept alive until :meth:`~gensim.similarities.docsim.Similarity.close` is called.
+            If None, use the module-level `PARALLEL_SHARDS` setting (serial querying by default).
+        pool_type : {'process', 'thread'}, optional
+            Kind of workers. Worker processes mmap each shard once and keep it open; threads share the shards
+            of this process, which is cheaper, but only run in parallel while BLAS releases the GIL.
+        compaction_threshold : float, optional
+            Fraction of deleted rows in a shard that triggers a background compaction of the index, e.g. 0.25.
+            If None, shards are only compacted by explicit calls to
+            :meth:`~gensim.similarities.docsim.Similarity.compact`.
+        build_workers : int, optional
+            Number of processes that build the shards of `corpus` in parallel, if `corpus` supports random access,
+            see :meth:`~gensim.similarities.docsim.Similarity.add_documents`.
 
         Notes
         -----
@@ -327,9 +918,18 @@ class Similarity(interfaces.SimilarityABC):
         self.shardsize = shardsize
         self.shards = []
         self.fresh_docs, self.fresh_nnz = [], 0
+        if pool_type not in ('process', 'thread'):
+            raise ValueError("pool_type must be 'process' or 'thread', got %r" % pool_type)
+        self.workers = workers
+        self.pool_type = pool_type
+        self.pool = None
+        self.compaction_threshold = compaction_threshold
+        self.retired_shards = []
+        self.shard_lock = threading.Lock()
+        self.shard_readers = {}
 
         if corpus is not None:
-            self.add_documents(corpus)
+            self.add_documents(corpus, workers=build_workers)
 
     def __len__(self):
         """Get length of index."""
@@ -340,13 +940,50 @@ class Similarity(interfaces.SimilarityABC):
             len(self), len(self.shards), self.output_prefix
         )
 
-    def add_documents(self, corpus):
+    def __getstate__(self):
+        """Special handler for pickle.
+
+        Returns
+        -------
+        dict
+            Object that contains state of current instance without the worker pool.
+
+        """
+        result = self.__dict__.copy()
+        result['pool'] = None  # worker pools cannot be pickled, a new one is started by the first query
+        result.pop('compaction_thread', None)
+        result.pop('shard_lock', None)
+        result.pop('shard_readers', None)
+        return result
+
+    def __setstate__(self, state):
+        """Special handler for unpickle, recreates the bookkeeping of the shards read by running queries.
+
+        Parameters
+        ----------
+        state : dict
+            Pickled state, see :meth:`~gensim.similarities.docsim.Similarity.__getstate__`.
+
+        """
+        self.__dict__.update(state)
+        self.shard_lock = threading.Lock()
+        self.shard_readers = {}
+
+    def add_documents(self, corpus, attributes=None, workers=1):
         """Extend the index with new documents.
 
         Parameters
         ----------
         corpus : iterable of list of (int, number)
             Corpus in BoW format.
+        attributes : dict of (str, iterable), optional
+            Attributes of the new documents, for filtered queries, see
+            :meth:`~gensim.similarities.docsim.Similarity.set_attribute`. Each iterable holds one value per document.
+        workers : int, optional
+            Number of processes that build full shards in parallel. Only used if `corpus` supports random access
+            (a list, or an :class:`~gensim.corpora.indexedcorpus.IndexedCorpus` such as
+            :class:`~gensim.corpora.mmcorpus.MmCorpus`), otherwise the shards are built serially.
+            The resulting index is the same either way.
 
         Notes
         -----
@@ -370,20 +1007,34 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         min_ratio = 1.0  # 0.5 to only reopen shards that are <50% complete
-        if self.shards and len(self.shards[-1]) < min_ratio * self.shardsize:
+        last_shard = self.shards[-1] if self.shards else None
+        if last_shard is not None and len(last_shard) < min_ratio * self.shardsize and last_shard.deleted is None:
             # The last shard was incomplete (<; load it back and add the documents there, don't start a new shard
             self.reopen_shard()
+        self.invalidate_cache()
+        start = len(self)
+        if workers > 1 and is_indexable(corpus):
+            self.build_shards(corpus, workers)
+        else:
+            if workers > 1:
+                logger.warning("corpus of type %s has no random access, building shards serially", type(corpus))
+            self.buffer_documents(corpus)
+        if attributes:
+            positions = numpy.arange(start, len(self))
+            for name, values in attributes.items():
+                self.set_attribute(name, values, positions)
+
+    def buffer_documents(self, corpus):
+        """Add documents to the shard being built, closing it whenever it is full. Used internally.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Corpus in BoW format.
+
+        """
         for doc in corpus:
-            if isinstance(doc, numpy.ndarray):
-                doclen = len(doc)
-            elif scipy.sparse.issparse(doc):
-                doclen = doc.nnz
-            else:
-                doclen = len(doc)
-                if doclen < 0.3 * self.num_features:
-                    doc = matutils.unitvec(matutils.corpus2csc([doc], self.num_features).T, self.norm)
-                else:
-                    doc = matutils.unitvec(matutils.sparse2full(doc, self.num_features), self.norm)
+            doc, doclen = shard_vector(doc, self.num_features, self.norm)
             self.fresh_docs.append(doc)
             self.fresh_nnz += doclen
             if len(self.fresh_docs) >= self.shardsize:
@@ -391,6 +1042,44 @@ class Similarity(interfaces.SimilarityABC):
             if len(self.fresh_docs) % 10000 == 0:
                 logger.info("PROGRESS: fresh_shard size=%i", len(self.fresh_docs))
 
+    def build_shards(self, corpus, workers):
+        """Add the documents of a random-access `corpus`, building its full shards in parallel. Used internally.
+
+        The documents that complete the current shard, and those that don't fill a whole shard at the end of
+        `corpus`, are buffered as in :meth:`~gensim.similarities.docsim.Similarity.buffer_documents`; the shards
+        in between are built and saved by `workers` processes, so the index ends up exactly as with a serial build.
+
+        Parameters
+        ----------
+        corpus : {list of list of (int, number), :class:`~gensim.corpora.indexedcorpus.IndexedCorpus`}
+            Corpus in BoW format, that supports `len()` and slicing.
+        workers : int
+            Number of worker processes.
+
+        """
+        num_docs = len(corpus)
+        head = min(num_docs, (self.shardsize - len(self.fresh_docs)) % self.shardsize)
+        if head:
+            self.buffer_documents(corpus[:head])
+        tail = head + (num_docs - head) // self.shardsize * self.shardsize
+        args = [
+            (self.shardid2filename(len(self.shards) + shardno), start, start + self.shardsize,
+             self.num_features, self.norm)
+            for shardno, start in enumerate(xrange(head, tail, self.shardsize))
+        ]
+        if args:
+            logger.info("building %i shards in %i processes", len(args), workers)
+            pool = multiprocessing.Pool(min(workers, len(args)), initializer=init_build_worker, initargs=(corpus, ))
+            try:
+                for shard in pool.imap(build_shard, args):
+                    shard.num_best = self.num_best
+                    self.shards.append(shard)
+                    logger.info("PROGRESS: built shard #%i", len(self.shards) - 1)
+            finally:
+                pool.terminate()
+        if tail < num_docs:
+            self.buffer_documents(corpus[tail:])
+
     def shardid2filename(self, shardid):
         """Get shard file by `shardid`.
 
@@ -424,15 +1113,8 @@ class Similarity(interfaces.SimilarityABC):
         if not self.fresh_docs:
             return
         shardid = len(self.shards)
-        # consider the shard sparse if its density is < 30%
-        issparse = 0.3 > 1.0 * self.fresh_nnz / (len(self.fresh_docs) * self.num_features)
-        if issparse:
-            index = SparseMatrixSimilarity(
-                self.fresh_docs, num_terms=self.num_features, num_docs=len(self.fresh_docs), num_nnz=self.fresh_nnz
-            )
-        else:
-            index = MatrixSimilarity(self.fresh_docs, num_features=self.num_features)
-        logger.info("creating %s shard #%s", 'sparse' if issparse else 'dense', shardid)
+        index = shard_index(self.fresh_docs, self.fresh_nnz, self.num_features)
+        logger.info("creating %s shard #%s", 'dense' if isinstance(index, MatrixSimilarity) else 'sparse', shardid)
         shard = Shard(self.shardid2filename(shardid), index)
         shard.num_best = self.num_best
         shard.num_nnz = self.fresh_nnz
@@ -453,38 +1135,98 @@ class Similarity(interfaces.SimilarityABC):
         del self.shards[-1]  # remove the shard from index, *but its file on disk is not deleted*
         logger.debug("reopen complete")
 
-    def query_shards(self, query):
+    def query_shards(self, query, allowed=None, shards=None):
         """Apply shard[query] to each shard in `self.shards`. Used internally.
 
         Parameters
         ----------
         query : {iterable of list of (int, number) , list of (int, number))}
             Document in BoW format or corpus of documents.
+        allowed : numpy.ndarray, optional
+            Boolean bitmap over the document positions, True for the documents that may be returned.
+            Each shard leaves out the other documents before selecting its most similar documents.
+        shards : list of :class:`~gensim.similarities.docsim.Shard`, optional
+            The shards to query, as taken by :meth:`~gensim.similarities.docsim.Similarity.acquire_shards`.
+            By default, `self.shards`.
 
         Returns
         -------
-        (None, list of individual shard query results)
-            Query results.
+        (:class:`multiprocessing.pool.Pool`, iterable of individual shard query results)
+            The worker pool (None for serial processing) and the query results.
 
         """
-        args = izip([query] * len(self.shards), self.shards)
-        if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
-            logger.debug("spawning %i query processes", PARALLEL_SHARDS)
-            pool = multiprocessing.Pool(PARALLEL_SHARDS)
-            result = pool.imap(query_shard, args, chunksize=1 + len(self.shards) / PARALLEL_SHARDS)
+        if shards is None:
+            shards = list(self.shards)
+        if allowed is None:
+            excluded = [None] * len(shards)
         else:
+            offsets = numpy.cumsum([0] + [len(shard) for shard in shards])
+            excluded = [
+                shard.excluded_rows(allowed[offsets[shardid]: offsets[shardid + 1]])
+                for shardid, shard in enumerate(shards)
+            ]
+        pool = self.get_pool()
+        if pool is None:
             # serial processing, one shard after another
-            pool = None
-            result = imap(query_shard, args)
+            result = imap(query_shard, izip([query] * len(shards), shards, excluded))
+        elif self.pool_type == 'thread':
+            # threads share the shards already opened by this process
+            result = pool.imap(query_shard, izip([query] * len(shards), shards, excluded))
+        else:
+            args = [
+                (
+                    shardid, shard.fullname(), len(shard), shard.cls, shard.num_best, shard.normalize,
+                    shard.deleted_rows() if excluded_rows is None else excluded_rows, query
+                )
+                for shardid, (shard, excluded_rows) in enumerate(izip(shards, excluded))
+            ]
+            result = pool.imap(query_shard_by_id, args)
         return pool, result
 
-    def __getitem__(self, query):
+    def get_pool(self):
+        """Get the pool of workers for parallel shard queries, starting it if necessary. Used internally.
+
+        Returns
+        -------
+        :class:`multiprocessing.pool.Pool`
+            Worker pool, or None if the shards should be queried serially.
+
+        """
+        workers = getattr(self, 'workers', None)  # indexes stored by older versions have no `workers`
+        if workers is None:
+            workers = PARALLEL_SHARDS
+        if not workers or workers <= 1:
+            return None
+        if getattr(self, 'pool', None) is None:
+            self.pool_type = getattr(self, 'pool_type', 'process')
+            logger.info("starting %i %s workers for shard queries", workers, self.pool_type)
+            if self.pool_type == 'thread':
+                self.pool = multiprocessing.pool.ThreadPool(workers)
+            else:
+                self.pool = multiprocessing.Pool(workers)
+        return self.pool
+
+    def close(self):
+        """Shut down the workers started for parallel shard queries, if any.
+
+        The index stays usable, a new pool of workers is started by the next query.
+
+        """
+        pool, self.pool = getattr(self, 'pool', None), None
+        if pool is not None:
+            logger.info("shutting down query workers")
+            pool.close()
+            pool.join()
+
+    def _query(self, query, allowed=None):
         """Get similarities of the document (or corpus) `query` to all documents in the corpus.
 
         Parameters
         ----------
         query : {iterable of list of (int, number) , list of (int, number))}
             A single document in bag-of-words format, or a corpus (iterable) of such documents.
+        allowed : numpy.ndarray, optional
+            Boolean bitmap over the document positions, True for the documents that may be returned.
 
         Return
         ------
@@ -511,9 +1253,24 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         self.close_shard()  # no-op if no documents added to index since last query
+        if getattr(query, 'ndim', 0) > 1 and query.shape[0] == 1:
+            # a single document as a one-row matrix: dense shards would return a one-row matrix for it, sparse shards
+            # a vector. a plain vector is a single document for all of them.
+            query = query.toarray()[0] if scipy.sparse.issparse(query) else query[0]
+
+        # a compaction may replace shards while the query runs: all of the query reads the same shards, whose files
+        # are kept until they are released
+        shards = self.acquire_shards()
+        try:
+            return self._query_shards(query, allowed, shards)
+        finally:
+            self.release_shards(shards)
 
+    def _query_shards(self, query, allowed, shards):
+        """Query the acquired `shards` and merge their results, see
+        :meth:`~gensim.similarities.docsim.Similarity._query`."""
         # reset num_best and normalize parameters, in case they were changed dynamically
-        for shard in self.shards:
+        for shard in shards:
             shard.num_best = self.num_best
             shard.normalize = self.norm
 
@@ -521,48 +1278,151 @@ class Similarity(interfaces.SimilarityABC):
         # a corpus (or numpy/scipy matrix) or a single document, and whether the
         # similarity result should be a full array or only num_best most similar
         # documents.
-        pool, shard_results = self.query_shards(query)
+        _, shard_results = self.query_shards(query, allowed, shards)
         if self.num_best is None:
             # user asked for all documents => just stack the sub-results into a single matrix
             # (works for both corpus / single doc query)
-            result = numpy.hstack(shard_results)
+            result = numpy.hstack([shard.to_positions(r) for shard, r in izip(shards, shard_results)])
         else:
             # the following uses a lot of lazy evaluation and (optionally) parallel
             # processing, to improve query latency and minimize memory footprint.
-            offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
+            # each shard only returns its own top num_best documents; these are folded into a running
+            # top num_best (per query) one shard at a time, so memory doesn't grow with the number of shards.
+            offsets = numpy.cumsum([0] + [len(shard) for shard in shards])
 
             def convert(shard_no, doc):
-                return [(doc_index + offsets[shard_no], sim) for doc_index, sim in doc]
+                # shard-local (row, sim) pairs => global (-sim, docno) keys, most similar first
+                positions = shards[shard_no].positions
+                if positions is not None:  # compacted shard, translate index rows to document positions
+                    doc = [(int(positions[doc_index]), sim) for doc_index, sim in doc]
+                return sorted((-sim, doc_index + offsets[shard_no]) for doc_index, sim in doc)
+
+            def merge(best, shard_best):
+                # k-way merge of two lists of keys that are already sorted, keep the top num_best
+                return list(itertools.islice(heapq.merge(best, shard_best), self.num_best))
 
             is_corpus, query = utils.is_corpus(query)
             is_corpus = is_corpus or hasattr(query, 'ndim') and query.ndim > 1 and query.shape[0] > 1
             if not is_corpus:
                 # user asked for num_best most similar and query is a single doc
-                results = (convert(shard_no, result) for shard_no, result in enumerate(shard_results))
-                result = heapq.nlargest(self.num_best, itertools.chain(*results), key=lambda item: item[1])
+                best = []
+                for shard_no, shard_result in enumerate(shard_results):
+                    best = merge(best, convert(shard_no, shard_result))
+                result = [(doc_index, -neg_sim) for neg_sim, doc_index in best]
             else:
                 # the trickiest combination: returning num_best results when query was a corpus
-                results = []
-                for shard_no, result in enumerate(shard_results):
-                    shard_result = [convert(shard_no, doc) for doc in result]
-                    results.append(shard_result)
-                result = []
-                for parts in izip(*results):
-                    merged = heapq.nlargest(self.num_best, itertools.chain(*parts), key=lambda item: item[1])
-                    result.append(merged)
-        if pool:
-            # gc doesn't seem to collect the Pools, eventually leading to
-            # "IOError 24: too many open files". so let's terminate it manually.
-            pool.terminate()
+                best = None
+                for shard_no, shard_result in enumerate(shard_results):
+                    shard_best = [convert(shard_no, doc) for doc in shard_result]
+                    if best is None:
+                        best = shard_best
+                    else:
+                        best = [merge(doc_best, doc_shard_best) for doc_best, doc_shard_best in izip(best, shard_best)]
+                result = [[(doc_index, -neg_sim) for neg_sim, doc_index in doc_best] for doc_best in best or []]
 
         return result
 
-    def vector_by_id(self, docpos):
-        """Get the indexed vector corresponding to the document at position `docpos`.
+    def acquire_shards(self):
+        """Get the current shards for reading, protecting their files from deletion by a concurrent compaction.
+        Used internally.
 
-        Parameters
-        ----------
-        docpos : int
+        Returns
+        -------
+        list of :class:`~gensim.similarities.docsim.Shard`
+            Snapshot of `self.shards`, to be handed back to
+            :meth:`~gensim.similarities.docsim.Similarity.release_shards` once read.
+
+        """
+        with self.shard_lock:
+            shards = list(self.shards)
+            for shard in shards:
+                self.shard_readers[id(shard)] = self.shard_readers.get(id(shard), 0) + 1
+        return shards
+
+    def release_shards(self, shards):
+        """Release shards acquired by :meth:`~gensim.similarities.docsim.Similarity.acquire_shards`, deleting the
+        files of the retired shards that are not read anymore. Used internally.
+
+        Parameters
+        ----------
+        shards : list of :class:`~gensim.similarities.docsim.Shard`
+            The acquired shards.
+
+        """
+        with self.shard_lock:
+            for shard in shards:
+                readers = self.shard_readers.pop(id(shard)) - 1
+                if readers:
+                    self.shard_readers[id(shard)] = readers
+            unused = [shard for shard in self.retired_shards if id(shard) not in self.shard_readers]
+            self.retired_shards = [shard for shard in self.retired_shards if id(shard) in self.shard_readers]
+        for shard in unused:
+            shard.remove_files()
+
+    def set_attribute(self, name, values, positions=None):
+        """Attach an integer or categorical attribute to the indexed documents, for filtered queries with
+        :meth:`~gensim.similarities.docsim.Similarity.search`.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+        values : iterable
+            Attribute values, one per document in `positions`.
+        positions : iterable of int, optional
+            Document positions, all documents in the index by default.
+
+        """
+        if self.attributes is None:
+            self.attributes = DocumentAttributes(len(self))
+        elif len(self.attributes) != len(self):
+            self.attributes.resize(len(self))
+        self.attributes.set(name, values, positions)
+
+    def search(self, query, where=None):
+        """Get similarities of the document (or corpus) `query` to the indexed documents that match `where`.
+
+        The filter is evaluated into a bitmap over the document positions (cached across queries), which each shard
+        applies before selecting its `num_best` most similar documents, so no results are lost to filtering.
+
+        Parameters
+        ----------
+        query : {iterable of list of (int, number) , list of (int, number))}
+            A single document in bag-of-words format, or a corpus (iterable) of such documents.
+        where : {dict, numpy.ndarray}, optional
+            Filter expression over the attributes set by :meth:`~gensim.similarities.docsim.Similarity.set_attribute`
+            (see :class:`~gensim.similarities.docsim.DocumentAttributes`), or a boolean bitmap with one flag per
+            document. If None, same as `self[query]`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list of (int, float)
+            Similarities of the query against this index, 0 for the documents that don't match `where`.
+
+        Examples
+        --------
+        .. sourcecode:: pycon
+
+            >>> from gensim.test.utils import common_corpus, common_dictionary, get_tmpfile
+            >>> from gensim.similarities import Similarity
+            >>>
+            >>> index = Similarity(get_tmpfile("index"), common_corpus, len(common_dictionary), num_best=3)
+            >>> index.set_attribute('lang', ['en', 'de', 'en', 'en', 'de', 'en', 'de', 'en', 'en'])
+            >>> index.set_attribute('year', [2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019])
+            >>> sims = index.search([(1, 2), (5, 4)], where={'lang': 'en', 'year': {'>=': 2014}})
+
+        """
+        if where is None:
+            return self[query]
+        self.close_shard()
+        return self._query(query, allowed=filter_mask(self.attributes, where, len(self)))
+
+    def vector_by_id(self, docpos):
+        """Get the indexed vector corresponding to the document at position `docpos`.
+
+        Parameters
+        ----------
+        docpos : int
             Document position
 
         Return
@@ -586,14 +1446,18 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         self.close_shard()  # no-op if no documents added to index since last query
-        pos = 0
-        for shard in self.shards:
-            pos += len(shard)
-            if docpos < pos:
-                break
-        if not self.shards or docpos < 0 or docpos >= pos:
-            raise ValueError("invalid document position: %s (must be 0 <= x < %s)" % (docpos, len(self)))
-        result = shard.get_document_id(docpos - pos + len(shard))
+        shards = self.acquire_shards()
+        try:
+            pos = 0
+            for shard in shards:
+                pos += len(shard)
+                if docpos < pos:
+                    break
+            if not shards or docpos < 0 or docpos >= pos:
+                raise ValueError("invalid document position: %s (must be 0 <= x < %s)" % (docpos, len(self)))
+            result = shard.get_document_id(docpos - pos + len(shard))
+        finally:
+            self.release_shards(shards)
         return result
 
     def similarity_by_id(self, docpos):
@@ -636,7 +1500,8 @@ class Similarity(interfaces.SimilarityABC):
         Yields
         ------
         :class:`numpy.ndarray` or :class:`scipy.sparse.csr_matrix`
-            Similarities of each document in turn against the index.
+            Similarities of each document in turn against the index, one per document position: the similarities of
+            a deleted document are all zeros (an empty list if `num_best` is set).
 
         """
         # turn off query normalization (vectors in the index are already normalized, save some CPU)
@@ -644,10 +1509,10 @@ class Similarity(interfaces.SimilarityABC):
 
         for chunk in self.iter_chunks():
             if chunk.shape[0] > 1:
-                for sim in self[chunk]:
+                for sim in self._query(chunk):
                     yield sim
             else:
-                yield self[chunk]
+                yield self._query(chunk)
 
         self.norm = norm  # restore normalization
 
@@ -662,8 +1527,9 @@ class Similarity(interfaces.SimilarityABC):
         Yields
         ------
         :class:`numpy.ndarray` or :class:`scipy.sparse.csr_matrix`
-            Chunks of the index as 2D arrays. The arrays are either dense or sparse, depending on
-            whether the shard was storing dense or sparse vectors.
+            Chunks of the index as 2D arrays, with one row per document position: the rows of deleted documents are
+            all zeros. The arrays are either dense or sparse, depending on whether the shard was storing dense or
+            sparse vectors.
 
         """
         self.close_shard()
@@ -672,15 +1538,129 @@ class Similarity(interfaces.SimilarityABC):
             # if not explicitly specified, use the chunksize from the constructor
             chunksize = self.chunksize
 
-        for shard in self.shards:
-            query = shard.get_index().index
-            for chunk_start in xrange(0, query.shape[0], chunksize):
-                # scipy.sparse doesn't allow slicing beyond real size of the matrix
-                # (unlike numpy). so, clip the end of the chunk explicitly to make
-                # scipy.sparse happy
-                chunk_end = min(query.shape[0], chunk_start + chunksize)
-                chunk = query[chunk_start: chunk_end]  # create a view
-                yield chunk
+        shards = self.acquire_shards()
+        try:
+            for shard in shards:
+                query = shard.get_index().index
+                deleted_rows = shard.deleted_rows()
+                if deleted_rows is None and shard.positions is None:
+                    for chunk_start in xrange(0, query.shape[0], chunksize):
+                        # scipy.sparse doesn't allow slicing beyond real size of the matrix
+                        # (unlike numpy). so, clip the end of the chunk explicitly to make
+                        # scipy.sparse happy
+                        chunk_end = min(query.shape[0], chunk_start + chunksize)
+                        chunk = query[chunk_start: chunk_end]  # create a view
+                        yield chunk
+                    continue
+                # place the rows of live documents at their positions, leaving zeros for the deleted documents
+                live = numpy.ones(query.shape[0], dtype=bool)
+                if deleted_rows is not None:
+                    live[deleted_rows] = False
+                rows = numpy.flatnonzero(live)
+                positions = rows if shard.positions is None else shard.positions[rows]
+                for chunk_start in xrange(0, len(shard), chunksize):
+                    chunk_end = min(len(shard), chunk_start + chunksize)
+                    lo, hi = numpy.searchsorted(positions, [chunk_start, chunk_end])
+                    chunk_positions = positions[lo:hi] - chunk_start
+                    if scipy.sparse.issparse(query):
+                        placement = scipy.sparse.csr_matrix(
+                            (numpy.ones(hi - lo, dtype=query.dtype), (chunk_positions, numpy.arange(hi - lo))),
+                            shape=(chunk_end - chunk_start, hi - lo)
+                        )
+                        chunk = (placement * query[rows[lo:hi]]).tocsr()
+                    else:
+                        chunk = numpy.zeros((chunk_end - chunk_start, query.shape[1]), dtype=query.dtype)
+                        chunk[chunk_positions] = query[rows[lo:hi]]
+                    yield chunk
+        finally:
+            self.release_shards(shards)
+
+    def delete(self, positions):
+        """Delete documents from the index.
+
+        Parameters
+        ----------
+        positions : iterable of int
+            Positions of the documents to delete.
+
+        Notes
+        -----
+        The deleted documents are only marked in a per-shard bitmap (tombstones) and left out of query results from
+        now on. If `compaction_threshold` is set and more than that fraction of the rows of a shard is deleted, the
+        index is compacted in a background thread, see :meth:`~gensim.similarities.docsim.Similarity.compact`.
+
+        """
+        self.close_shard()
+        positions = numpy.unique(numpy.asarray(positions, dtype=numpy.int64))
+        if len(positions) and (positions[0] < 0 or positions[-1] >= len(self)):
+            raise ValueError("invalid document positions: must be 0 <= x < %s" % len(self))
+        offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
+        shardnos = numpy.searchsorted(offsets, positions, side='right') - 1
+        for shardno in numpy.unique(shardnos):
+            self.shards[shardno].delete(positions[shardnos == shardno] - offsets[shardno])
+        self.invalidate_cache()
+        logger.info("deleted %i documents from %s", len(positions), self)
+
+        threshold = self.compaction_threshold
+        if threshold is not None and self.shards_to_compact(threshold):
+            if self.compaction_thread is None or not self.compaction_thread.is_alive():
+                self.compaction_thread = threading.Thread(target=self.compact, kwargs={'threshold': threshold})
+                self.compaction_thread.daemon = True
+                self.compaction_thread.start()
+
+    def shards_to_compact(self, threshold):
+        """Get the shards in which more than `threshold` of the rows belong to deleted documents.
+
+        Parameters
+        ----------
+        threshold : float
+            Fraction of deleted rows.
+
+        Returns
+        -------
+        list of int
+            Shard ids.
+
+        """
+        result = []
+        for shardid, shard in enumerate(self.shards):
+            deleted_rows = shard.deleted_rows()
+            if deleted_rows is not None and len(deleted_rows) > threshold * shard.num_rows():
+                result.append(shardid)
+        return result
+
+    def compact(self, threshold=0.0):
+        """Rewrite the shards in which more than `threshold` of the rows belong to deleted documents, leaving
+        the deleted documents out. Document positions don't change.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Fraction of deleted rows from which a shard is rewritten. By default, rewrite all shards with deletions.
+
+        Notes
+        -----
+        Each compacted shard is written to a new file and swapped in once complete, so the index stays usable
+        (for queries and deletions) while the compaction runs, which makes it safe to call from a background thread.
+        The files of the replaced shard are deleted once the queries that still read it are done.
+
+        """
+        for shardid in self.shards_to_compact(threshold):
+            shard = self.shards[shardid]
+            generation = getattr(shard, 'generation', 0) + 1
+            compacted = shard.compact("%s~%i" % (self.shardid2filename(shardid), generation))
+            compacted.generation = generation
+            with self.shard_lock:
+                self.shards[shardid] = compacted
+                self.retired_shards = list(self.retired_shards) + [shard]
+            self.release_shards([])
+
+    def wait_compaction(self):
+        """Wait for a running background compaction, if any, to finish."""
+        thread = self.compaction_thread
+        if thread is not None:
+            thread.join()
+            self.compaction_thread = None
 
     def check_moved(self):
         """Update shard locations, for case where the server prefix location changed on the filesystem."""
@@ -725,37 +1705,88 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         self.close_shard()
+        self.wait_compaction()
         if fname is None:
             fname = self.output_prefix
         super(Similarity, self).save(fname, *args, **kwargs)
 
     def destroy(self):
         """Delete all files under self.output_prefix Index is not usable anymore after calling this method."""
-        import glob
+        self.close()
+        self.wait_compaction()
         for fname in glob.glob(self.output_prefix + '*'):
             logger.info("deleting %s", fname)
             os.remove(fname)
 
 
+def create_memmap(shape, dtype, fname=None):
+    """Create a `.npy` file and memory-map it, such as for the exact copy of a reduced-precision index.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the array.
+    dtype : numpy.dtype
+        Datatype of the array.
+    fname : str, optional
+        Path to the file. If not specified, a temporary file is created and unlinked right away, so that it
+        disappears together with its memory map.
+
+    Returns
+    -------
+    :class:`numpy.memmap`
+        Writable memory map of the file.
+
+    """
+    if fname is not None:
+        return numpy.lib.format.open_memmap(fname, mode='w+', dtype=dtype, shape=shape)
+    fd, fname = tempfile.mkstemp(prefix='gensim_exact_index_', suffix='.npy')
+    os.close(fd)
+    array = numpy.lib.format.open_memmap(fname, mode='w+', dtype=dtype, shape=shape)
+    try:
+        os.remove(fname)
+    except OSError as err:  # still mmapped on Windows
+        logger.warning("failed to unlink temporary file %s: %s", fname, err)
+    return array
+
+
 class MatrixSimilarity(interfaces.SimilarityABC):
     """Compute cosine similarity against a corpus of documents by storing the index matrix in memory.
 
     Unless the entire matrix fits into main memory, use :class:`~gensim.similarities.docsim.Similarity` instead.
 
+    The index can also be stored in reduced precision with `storage='float16'` (half the memory of float32)
+    or `storage='int8'` (a quarter, with one float32 scale per document). The compact matrix is saved as a raw
+    `.npy` file next to the pickle and can be memory-mapped back with `load(fname, mmap='r')`; queries dequantise it
+    on the fly, `blocksize` documents at a time, so that no full-precision copy of the index is ever materialized.
+    With `rerank` set, the top `rerank` candidates of each `num_best` query are re-scored against an exact float32 copy
+    of the index. The exact copy is written to a `.npy` file while the index is built and stays on disk, memory-mapped:
+    only the rows of those few candidates are ever read.
+
     Examples
     --------
 
     .. sourcecode:: pycon
 
-        >>> from gensim.test.utils import common_corpus, common_dictionary
+        >>> from gensim.test.utils import common_corpus, common_dictionary, get_tmpfile
         >>> from gensim.similarities import MatrixSimilarity
         >>>
         >>> query = [(1, 2), (5, 4)]
         >>> index = MatrixSimilarity(common_corpus, num_features=len(common_dictionary))
         >>> sims = index[query]
+        >>>
+        >>> # compact index, memory-mapped after loading
+        >>> index = MatrixSimilarity(common_corpus, num_features=len(common_dictionary), storage='int8')
+        >>> index.save(get_tmpfile("index_int8"))
+        >>> index = MatrixSimilarity.load(get_tmpfile("index_int8"), mmap='r')
+        >>> sims = index[query]
 
     """
-    def __init__(self, corpus, num_best=None, dtype=numpy.float32, num_features=None, chunksize=256, corpus_len=None):
+    attributes = None  # document attributes for filtered queries, None if no attributes were set
+    masked_rows = None  # rows left out of the current query, set by query_index()
+
+    def __init__(self, corpus, num_best=None, dtype=numpy.float32, num_features=None, chunksize=256, corpus_len=None,
+                 storage=None, rerank=None, blocksize=65536, exact_fname=None):
         """
 
         Parameters
@@ -772,9 +1803,24 @@ class MatrixSimilarity(interfaces.SimilarityABC):
         chunksize : int, optional
             Size of query chunks. Used internally when the query is an entire corpus.
         dtype : numpy.dtype, optional
-            Datatype to store the internal matrix in.
+            Datatype to store the internal matrix in. With a reduced-precision `storage`, this is the datatype
+            the index is dequantised to at query time.
+        storage : {None, 'float16', 'int8'}, optional
+            Reduced-precision storage of the index. None stores the index in `dtype`, 'float16' in half precision and
+            'int8' as 8-bit integers with one scaling factor per document (`index_scales`).
+        rerank : int, optional
+            If set together with `num_best` and a reduced-precision `storage`, keep an exact copy of the index
+            (`exact_index`) and re-score the top `rerank` candidates of every query against it.
+        blocksize : int, optional
+            Number of documents dequantised at once when querying a reduced-precision index.
+        exact_fname : str, optional
+            Path to the `.npy` file that receives the exact copy of the index when `rerank` is set. If not specified,
+            an anonymous temporary file is used, which is removed as soon as the index is no longer referenced.
+            Either way, :meth:`~gensim.similarities.docsim.MatrixSimilarity.save` stores a copy next to the index.
 
         """
+        if storage not in (None, 'float16', 'int8'):
+            raise ValueError("storage must be one of None, 'float16' or 'int8', not %r" % (storage, ))
         if num_features is None:
             logger.warning(
                 "scanning corpus to determine the number of features (consider setting `num_features` explicitly)"
@@ -785,6 +1831,12 @@ class MatrixSimilarity(interfaces.SimilarityABC):
         self.num_best = num_best
         self.normalize = True
         self.chunksize = chunksize
+        self.dtype = dtype
+        self.storage = storage
+        self.rerank = rerank if storage is not None else None
+        self.blocksize = blocksize
+        self.index_scales = None
+        self.exact_index = None
         if corpus_len is None:
             corpus_len = len(corpus)
 
@@ -795,7 +1847,15 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                     "or a non-empty corpus in the constructor)"
                 )
             logger.info("creating matrix with %i documents and %i features", corpus_len, num_features)
-            self.index = numpy.empty(shape=(corpus_len, num_features), dtype=dtype)
+            if storage == 'int8':
+                self.index = numpy.empty(shape=(corpus_len, num_features), dtype=numpy.int8)
+                self.index_scales = numpy.empty(corpus_len, dtype=numpy.float32)
+            elif storage == 'float16':
+                self.index = numpy.empty(shape=(corpus_len, num_features), dtype=numpy.float16)
+            else:
+                self.index = numpy.empty(shape=(corpus_len, num_features), dtype=dtype)
+            if self.rerank:
+                self.exact_index = self.open_exact_index((corpus_len, num_features), exact_fname)
             # iterate over corpus, populating the numpy index matrix with (normalized)
             # document vectors
             for docno, vector in enumerate(corpus):
@@ -811,11 +1871,107 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                     vector = vector.toarray().flatten()
                 else:
                     vector = matutils.unitvec(matutils.sparse2full(vector, num_features))
-                self.index[docno] = vector
+                if self.exact_index is not None:
+                    self.exact_index[docno] = vector
+                if storage == 'int8':
+                    scale = numpy.abs(vector).max() / 127.0
+                    self.index_scales[docno] = scale
+                    self.index[docno] = numpy.rint(vector / scale) if scale > 0 else 0
+                else:
+                    self.index[docno] = vector
+            if self.exact_index is not None:
+                self.exact_index.flush()
 
     def __len__(self):
         return self.index.shape[0]
 
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(MatrixSimilarity, self)._cache_params() + (getattr(self, 'rerank', None), )
+
+    def open_exact_index(self, shape, fname=None):
+        """Create the memory-mapped `.npy` file that holds the exact copy of the index, for re-ranking.
+
+        Parameters
+        ----------
+        shape : (int, int)
+            Number of documents and number of features.
+        fname : str, optional
+            Path to the file. If not specified, a temporary file is created and unlinked right away, so that it
+            disappears together with its memory map.
+
+        Returns
+        -------
+        :class:`numpy.memmap`
+            Writable memory map of the file.
+
+        """
+        return create_memmap(shape, self.dtype, fname)
+
+    def save(self, *args, **kwargs):
+        """Save the index.
+
+        The matrices of a reduced-precision index are always stored as separate `.npy` files, so that they can be
+        memory-mapped back with `load(fname, mmap='r')`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output file.
+
+        See Also
+        --------
+        :meth:`~gensim.utils.SaveLoad.save`
+            Save object to file.
+
+        """
+        if getattr(self, 'storage', None) is not None and kwargs.get('separately') is None and len(args) < 2:
+            kwargs['separately'] = [
+                attr for attr in ('index', 'index_scales', 'exact_index') if getattr(self, attr, None) is not None
+            ]
+        super(MatrixSimilarity, self).save(*args, **kwargs)
+
+    def blocked_dot(self, query):
+        """Multiply the reduced-precision index with `query`, dequantising `blocksize` documents at a time.
+
+        Parameters
+        ----------
+        query : numpy.ndarray
+            Dense query matrix, one query per row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Similarity matrix of shape (number of documents, number of queries).
+
+        """
+        result = numpy.empty((len(self), query.shape[0]), dtype=query.dtype)
+        for start in xrange(0, len(self), self.blocksize):
+            block = self.index[start: start + self.blocksize].astype(query.dtype)
+            result[start: start + len(block)] = numpy.dot(block, query.T)
+        if self.storage == 'int8':
+            result *= self.index_scales[:, None]
+        return result
+
+    def rerank_candidates(self, result, query):
+        """Re-score the top `rerank` candidates of every query in `result` against the exact index, in place.
+
+        Parameters
+        ----------
+        result : numpy.ndarray
+            Approximate similarities of shape (number of queries, number of documents), -inf for the documents
+            that may not be returned. These are never re-scored.
+        query : numpy.ndarray
+            Dense query matrix, one query per row.
+
+        """
+        topn = min(max(self.rerank, self.num_best), len(self))
+        for qno in xrange(len(query)):
+            candidates = numpy.sort(numpy.argpartition(-result[qno], topn - 1)[:topn])
+            candidates = candidates[result[qno, candidates] > -numpy.inf]
+            result[qno, candidates] = numpy.dot(self.exact_index[candidates], query[qno])
+
     def get_similarities(self, query):
         """Get similarity between `query` and this index.
 
@@ -835,11 +1991,13 @@ class MatrixSimilarity(interfaces.SimilarityABC):
             Similarity matrix.
 
         """
+        storage = getattr(self, 'storage', None)  # indexes stored by older gensim versions have no storage modes
+        dtype = self.index.dtype if storage is None else self.dtype
         is_corpus, query = utils.is_corpus(query)
         if is_corpus:
             query = numpy.asarray(
                 [matutils.sparse2full(vec, self.num_features) for vec in query],
-                dtype=self.index.dtype
+                dtype=dtype
             )
         else:
             if scipy.sparse.issparse(query):
@@ -849,12 +2007,72 @@ class MatrixSimilarity(interfaces.SimilarityABC):
             else:
                 # default case: query is a single vector in sparse gensim format
                 query = matutils.sparse2full(query, self.num_features)
-            query = numpy.asarray(query, dtype=self.index.dtype)
+            query = numpy.asarray(query, dtype=dtype)
+
+        if storage is None:
+            # do a little transposition dance to stop numpy from making a copy of
+            # self.index internally in numpy.dot (very slow).
+            result = numpy.dot(self.index, query.T).T  # return #queries x #index
+            return result  # XXX: removed casting the result from array to list; does anyone care?
+
+        queries = numpy.atleast_2d(query)
+        result = self.blocked_dot(queries).T
+        if self.rerank and self.num_best and self.exact_index is not None:
+            result = numpy.ascontiguousarray(result)
+            masked_rows = self.masked_rows
+            if masked_rows is not None:
+                result[:, masked_rows] = -numpy.inf
+            self.rerank_candidates(result, queries)
+            if masked_rows is not None:
+                result[:, masked_rows] = 0.0
+        return result if query.ndim > 1 else result[0]
+
+    def set_attribute(self, name, values, positions=None):
+        """Attach an integer or categorical attribute to the indexed documents, for filtered queries with
+        :meth:`~gensim.similarities.docsim.MatrixSimilarity.search`.
 
-        # do a little transposition dance to stop numpy from making a copy of
-        # self.index internally in numpy.dot (very slow).
-        result = numpy.dot(self.index, query.T).T  # return #queries x #index
-        return result  # XXX: removed casting the result from array to list; does anyone care?
+        Parameters
+        ----------
+        name : str
+            Attribute name.
+        values : iterable
+            Attribute values, one per document in `positions`.
+        positions : iterable of int, optional
+            Document positions, all documents in the index by default.
+
+        """
+        if self.attributes is None:
+            self.attributes = DocumentAttributes(len(self))
+        self.attributes.set(name, values, positions)
+
+    def search(self, query, where=None):
+        """Get similarities of the document (or corpus) `query` to the indexed documents that match `where`.
+
+        The filter is evaluated into a bitmap (cached across queries), applied before the `num_best` most similar
+        documents are selected: all documents are scored, and those that don't match are masked out of the result.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), :class:`scipy.sparse.csr_matrix`}
+            Document or collection of documents.
+        where : {dict, numpy.ndarray}, optional
+            Filter expression over the attributes set by
+            :meth:`~gensim.similarities.docsim.MatrixSimilarity.set_attribute`
+            (see :class:`~gensim.similarities.docsim.DocumentAttributes`), or a boolean bitmap with one flag per
+            document. If None, same as `self[query]`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or list of (int, float)
+            Similarities of the query against this index, 0 for the documents that don't match `where`.
+
+        """
+        if where is None:
+            return self[query]
+        excluded = numpy.flatnonzero(~filter_mask(self.attributes, where, len(self)))
+        index = copy.copy(self)  # query_index() changes the query parameters of the index it queries
+        index.query_cache = None
+        return query_index(index, query, self.num_best, self.normalize, excluded if len(excluded) else None)
 
     def __str__(self):
         return "%s<%i docs, %i features>" % (self.__class__.__name__, len(self), self.index.shape[1])
@@ -889,6 +2107,12 @@ class SoftCosineSimilarity(interfaces.SimilarityABC):
     <https://github.com/RaRe-Technologies/gensim/blob/develop/docs/notebooks/soft_cosine_tutorial.ipynb>`_
     for more examples.
 
+    Notes
+    -----
+    Queries are evaluated `chunksize` at a time as the sparse matrix product :math:`Q S D^T` of the query chunk `Q`,
+    the term similarity matrix `S` and the corpus matrix `D`, which is built (together with the soft cosine norms
+    of all documents) on the first query. The results are the same as those of :func:`gensim.matutils.softcossim`.
+
     """
     def __init__(self, corpus, similarity_matrix, num_best=None, chunksize=256):
         """
@@ -925,10 +2149,43 @@ class SoftCosineSimilarity(interfaces.SimilarityABC):
 
         # index is simply an array from 0 to size of corpus.
         self.index = numpy.arange(len(corpus))
+        self.corpus_matrix = None
+        self.corpus_norms = None
 
     def __len__(self):
         return len(self.corpus)
 
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(SoftCosineSimilarity, self)._cache_params() + (id(self.similarity_matrix), )
+
+    def softcos_norms(self, matrix):
+        """Get the soft cosine norms :math:`\\sqrt{x^T S x}` of the rows of `matrix`.
+
+        Parameters
+        ----------
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Documents in rows.
+
+        Returns
+        -------
+        numpy.ndarray
+            Norm of every row.
+
+        """
+        squares = numpy.asarray(matrix.multiply(matrix.dot(self.similarity_matrix)).sum(axis=1)).ravel()
+        return numpy.sqrt(numpy.maximum(squares, 0.0))
+
+    def init_corpus_matrix(self):
+        """Convert the corpus to a sparse matrix and precompute the soft cosine norms of its documents."""
+        logger.info("building the soft cosine corpus matrix of %i documents", len(self))
+        self.corpus_matrix = matutils.corpus2csc(
+            self.corpus, num_terms=self.similarity_matrix.shape[0], num_docs=len(self),
+            dtype=self.similarity_matrix.dtype
+        ).T.tocsr()
+        self.corpus_norms = self.softcos_norms(self.corpus_matrix)
+
     def get_similarities(self, query):
         """Get similarity between `query` and this index.
 
@@ -956,19 +2213,25 @@ class SoftCosineSimilarity(interfaces.SimilarityABC):
             else:
                 query = [query]
 
-        result = []
-        for query_document in query:
-            # Compute similarity for each query.
-            qresult = [matutils.softcossim(query_document, corpus_document, self.similarity_matrix)
-                       for corpus_document in self.corpus]
-            qresult = numpy.array(qresult)
-
-            # Append single query result to list of all results.
-            result.append(qresult)
+        if getattr(self, 'corpus_matrix', None) is None:
+            self.init_corpus_matrix()
 
-        if is_corpus:
-            result = numpy.array(result)
-        else:
+        result = []
+        for chunk in utils.grouper(query, self.chunksize):
+            # Compute similarities for a chunk of queries at once.
+            chunk = matutils.corpus2csc(
+                chunk, num_terms=self.similarity_matrix.shape[0], num_docs=len(chunk),
+                dtype=self.similarity_matrix.dtype
+            ).T.tocsr()
+            norms = numpy.outer(self.softcos_norms(chunk), self.corpus_norms)
+            chunk_result = chunk.dot(self.similarity_matrix).dot(self.corpus_matrix.T).toarray()
+            nonzero = norms > 0.0  # empty documents have zero similarity to everything
+            chunk_result[nonzero] /= norms[nonzero]
+            chunk_result[~nonzero] = 0.0
+            result.append(numpy.clip(chunk_result, -1.0, 1.0))
+
+        result = numpy.vstack(result) if result else numpy.zeros((0, len(self)))
+        if not is_corpus:
             result = result[0]
 
         return result
@@ -1009,8 +2272,15 @@ class WmdSimilarity(interfaces.SimilarityABC):
         >>> query = ['trees']
         >>> sims = index[query]
 
+    Queries with `num_best` set use the prefetch-and-prune search of Kusner et al. by default: documents are visited in
+    order of increasing word centroid distance (WCD), which is a lower bound of WMD, and a document is skipped
+    as soon as either the WCD or the relaxed WMD (RWMD), the tighter of the two bounds, shows that it can't enter the
+    current `num_best` set. Only the remaining candidates go through the full (and expensive) EMD solve.
+    The `num_best` results are the same as without pruning; the documents that were pruned get similarity 0
+    in the full similarity vector returned by :meth:`~gensim.similarities.docsim.WmdSimilarity.get_similarities`.
+
     """
-    def __init__(self, corpus, w2v_model, num_best=None, normalize_w2v_and_replace=True, chunksize=256):
+    def __init__(self, corpus, w2v_model, num_best=None, normalize_w2v_and_replace=True, chunksize=256, prune=True):
         """
 
         Parameters
@@ -1025,12 +2295,16 @@ class WmdSimilarity(interfaces.SimilarityABC):
             Whether or not to normalize the word2vec vectors to length 1.
         chunksize : int, optional
             Size of chunk.
+        prune : bool, optional
+            Whether to prune `num_best` queries with the WCD and RWMD lower bounds.
 
         """
         self.corpus = corpus
         self.w2v_model = w2v_model
         self.num_best = num_best
         self.chunksize = chunksize
+        self.prune = prune
+        self.centroids = None
 
         # Normalization of features is not possible, as corpus is a list (of lists) of strings.
         self.normalize = False
@@ -1046,6 +2320,117 @@ class WmdSimilarity(interfaces.SimilarityABC):
         """Get size of corpus."""
         return len(self.corpus)
 
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(WmdSimilarity, self)._cache_params() + (id(self.w2v_model), getattr(self, 'prune', False))
+
+    def nbow(self, document):
+        """Get the distinct in-vocabulary words of `document` as vectors, with their normalized frequencies.
+
+        Parameters
+        ----------
+        document : list of str
+            Input document.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Word vectors (one per row) and their nBOW weights, or (None, None) if no word of `document`
+            is in the vocabulary.
+
+        """
+        wv = self.w2v_model.wv
+        document = [token for token in document if token in wv]
+        if not document:
+            return None, None
+        counts = {}
+        for token in document:
+            counts[token] = counts.get(token, 0) + 1
+        words = list(counts)
+        vectors = numpy.array([wv[word] for word in words], dtype=numpy.float64)
+        weights = numpy.array([counts[word] for word in words], dtype=numpy.float64) / len(document)
+        return vectors, weights
+
+    def init_centroids(self):
+        """Precompute the word centroid (nBOW-weighted average word vector) of every document in the corpus.
+
+        Documents without any in-vocabulary word get a NaN centroid.
+
+        """
+        logger.info("computing word centroids of %i documents", len(self))
+        self.centroids = numpy.empty((len(self), self.w2v_model.wv.vector_size), dtype=numpy.float64)
+        for docno, document in enumerate(self.corpus):
+            vectors, weights = self.nbow(document)
+            self.centroids[docno] = numpy.nan if vectors is None else weights.dot(vectors)
+
+    @staticmethod
+    def rwmd(vectors1, weights1, vectors2, weights2):
+        """Get the relaxed WMD between two documents, the larger of the two one-sided relaxations of the transport
+        problem. This is a lower bound of their WMD.
+
+        Parameters
+        ----------
+        vectors1, vectors2 : numpy.ndarray
+            Word vectors of the two documents, as returned by :meth:`~gensim.similarities.docsim.WmdSimilarity.nbow`.
+        weights1, weights2 : numpy.ndarray
+            nBOW weights of the two documents.
+
+        Returns
+        -------
+        float
+            Relaxed Word Mover's Distance.
+
+        """
+        cost = numpy.sqrt(((vectors1[:, None, :] - vectors2[None, :, :]) ** 2).sum(axis=2))
+        return max(weights1.dot(cost.min(axis=1)), weights2.dot(cost.min(axis=0)))
+
+    def get_distances_pruned(self, query, topn):
+        """Get WMD between `query` and the documents that may be among the `topn` nearest ones.
+
+        Parameters
+        ----------
+        query : list of str
+            Query document.
+        topn : int
+            Number of nearest documents to find.
+
+        Returns
+        -------
+        numpy.ndarray
+            Distance to each document in the index, `inf` for documents that were pruned.
+
+        """
+        distances = numpy.full(len(self), numpy.inf)
+        qvectors, qweights = self.nbow(query)
+        if qvectors is None:
+            return distances  # no query word in the vocabulary: all distances are infinite
+        if getattr(self, 'centroids', None) is None:
+            self.init_centroids()
+
+        wcd = numpy.sqrt(((self.centroids - qweights.dot(qvectors)) ** 2).sum(axis=1))
+        best = []  # heap of negated distances of the `topn` nearest documents so far
+        solved = 0
+        for docno in numpy.argsort(wcd):  # NaN (out-of-vocabulary documents) go last
+            if numpy.isnan(wcd[docno]):
+                break
+            if len(best) == topn:
+                kth = -best[0] * (1 + 1e-5)  # leave room for the float32 rounding in wmdistance
+                if wcd[docno] > kth:
+                    break  # the remaining documents are even further away, according to their WCD
+                dvectors, dweights = self.nbow(self.corpus[docno])
+                if self.rwmd(qvectors, qweights, dvectors, dweights) > kth:
+                    continue
+            distance = self.w2v_model.wv.wmdistance(self.corpus[docno], query)
+            distances[docno] = distance
+            solved += 1
+            if len(best) < topn:
+                heapq.heappush(best, -distance)
+            else:
+                heapq.heappushpop(best, -distance)
+        logger.debug("solved %i out of %i EMD problems", solved, len(self))
+        return distances
+
     def get_similarities(self, query):
         """Get similarity between `query` and this index.
 
@@ -1075,8 +2460,11 @@ class WmdSimilarity(interfaces.SimilarityABC):
         result = []
         for qidx in range(n_queries):
             # Compute similarity for each query.
-            qresult = [self.w2v_model.wv.wmdistance(document, query[qidx]) for document in self.corpus]
-            qresult = numpy.array(qresult)
+            if self.num_best and getattr(self, 'prune', False):
+                qresult = self.get_distances_pruned(query[qidx], self.num_best)
+            else:
+                qresult = [self.w2v_model.wv.wmdistance(document, query[qidx]) for document in self.corpus]
+                qresult = numpy.array(qresult)
             qresult = 1. / (1. + qresult)  # Similarity is the negative of the distance.
 
             # Append single query result to list of all results.
@@ -1108,6 +2496,12 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
     causes `get_similarities` to return a sparse matrix instead of a
     dense representation if possible.
 
+    With `prune=True` and `num_best` set, bag-of-words queries are answered from an inverted index (the index
+    matrix in CSC format, one posting list per term) with MaxScore pruning: query terms are scored in the order
+    of decreasing upper bound of their contribution, and as soon as the remaining terms together cannot lift an
+    unseen document into the top `num_best`, only the documents seen so far are scored further, by skipping
+    through the remaining posting lists. The results are the same as those of the exhaustive evaluation.
+
     See also
     --------
     :class:`~gensim.similarities.docsim.Similarity`
@@ -1117,7 +2511,7 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
 
     """
     def __init__(self, corpus, num_features=None, num_terms=None, num_docs=None, num_nnz=None,
-                 num_best=None, chunksize=500, dtype=numpy.float32, maintain_sparsity=False):
+                 num_best=None, chunksize=500, dtype=numpy.float32, maintain_sparsity=False, prune=False):
         """
 
         Parameters
@@ -1141,12 +2535,18 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
             Data type of the internal matrix.
         maintain_sparsity : bool, optional
             Return sparse arrays from :meth:`~gensim.similarities.docsim.SparseMatrixSimilarity.get_similarities`?
+        prune : bool, optional
+            Answer `num_best` queries from an inverted index with MaxScore pruning, instead of scoring every
+            document? Only applies to queries in the bag-of-words format. Requires non-negative weights
+            (such as TF-IDF), falls back to the exhaustive evaluation otherwise.
 
         """
         self.num_best = num_best
         self.normalize = True
         self.chunksize = chunksize
         self.maintain_sparsity = maintain_sparsity
+        self.prune = prune
+        self.postings = None
 
         if corpus is not None:
             logger.info("creating sparse index")
@@ -1182,6 +2582,11 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
         """Get size of index."""
         return self.index.shape[0]
 
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(SparseMatrixSimilarity, self)._cache_params() + (getattr(self, 'prune', False), )
+
     def get_similarities(self, query):
         """Get similarity between `query` and this index.
 
@@ -1228,3 +2633,658 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
             # otherwise, return a 2d matrix (#queries x #index)
             result = result.toarray().T
         return result
+
+    def _query(self, query):
+        """Get similarities of the given document or corpus against this index.
+
+        Same as :meth:`gensim.interfaces.SimilarityABC._query`, except that bag-of-words queries
+        with `num_best` set are evaluated over the inverted index if `prune` is True.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), :class:`scipy.sparse.csr_matrix`}
+            Document or collection of documents.
+
+        Returns
+        -------
+        {:class:`numpy.ndarray`, :class:`scipy.sparse.csr_matrix`, list of (int, float)}
+            Similarities of the query against this index.
+
+        """
+        if not (getattr(self, 'prune', False) and self.num_best is not None and not self.maintain_sparsity):
+            return super(SparseMatrixSimilarity, self)._query(query)
+        is_corpus, query = utils.is_corpus(query)
+        if isinstance(query, numpy.ndarray) or scipy.sparse.issparse(query):
+            return super(SparseMatrixSimilarity, self)._query(query)
+        if is_corpus:
+            return [self.get_similarities_pruned(doc, self.num_best) for doc in query]
+        return self.get_similarities_pruned(query, self.num_best)
+
+    def init_postings(self):
+        """Build the inverted index for pruned queries. Called automatically on the first pruned query.
+
+        See :meth:`~gensim.similarities.docsim.SparseMatrixSimilarity.get_similarities_pruned`.
+        The posting lists are stored (and mmapped) together with the index, if they exist at the time of saving.
+
+        """
+        if getattr(self, 'postings', None) is None:
+            logger.info("building inverted index over %i documents", self.index.shape[0])
+            postings = self.index.tocsc()
+            postings.sort_indices()
+            self.postings = postings
+        if getattr(self, 'postings_max', None) is None or len(self.postings_max) != self.postings.shape[1]:
+            # highest weight of each term in any document, the upper bound on its contribution to a score
+            self.postings_max = self.postings.max(axis=0).toarray().ravel()
+            self.postings_nonnegative = not self.postings.nnz or self.postings.data.min() >= 0
+
+    def get_similarities_pruned(self, query, topn):
+        """Get the `topn` most similar documents to `query`, without scoring every document in the index.
+
+        Warnings
+        --------
+        Do not use this function directly; set `prune=True` and use the `self[query]` syntax instead.
+
+        Parameters
+        ----------
+        query : list of (int, number)
+            Document in the bag-of-words format.
+        topn : int
+            Number of most similar documents to return.
+
+        Returns
+        -------
+        list of (int, float)
+            Most similar documents and their similarities, most similar first, same as
+            :func:`~gensim.matutils.full2sparse_clipped` of the exhaustive
+            :meth:`~gensim.similarities.docsim.SparseMatrixSimilarity.get_similarities`.
+
+        """
+        self.init_postings()
+        if self.normalize:
+            query = matutils.unitvec(query)
+        weights = {}
+        for termid, weight in query:
+            if 0 <= termid < self.index.shape[1]:
+                weights[termid] = weights.get(termid, 0.0) + weight
+        termids = numpy.array(list(weights), dtype=numpy.int64)
+        weights = numpy.array([weights[termid] for termid in termids.tolist()], dtype=self.index.dtype)
+
+        if (weights < 0).any() or not self.postings_nonnegative:
+            # negative contributions break the upper bounds => evaluate the query exhaustively
+            return matutils.full2sparse_clipped(self.get_similarities(query), topn)
+        if topn <= 0 or not len(termids):
+            return []
+
+        # score the terms with the highest possible contribution first
+        bounds = weights.astype(float) * self.postings_max[termids]
+        order = numpy.argsort(-bounds, kind='mergesort')
+        termids, weights = termids[order], weights[order]
+        remaining = numpy.append(numpy.cumsum(bounds[order][::-1])[::-1], 0)  # bound of terms pos..end
+
+        indptr, indices, data = self.postings.indptr, self.postings.indices, self.postings.data
+        scores = numpy.zeros(self.index.shape[0], dtype=self.index.dtype)
+        is_seen = numpy.zeros(self.index.shape[0], dtype=bool)
+        seen = numpy.zeros(0, dtype=indices.dtype)
+        threshold = 0.0
+        pos = 0
+        for pos in xrange(len(termids)):
+            if len(seen) >= topn and remaining[pos] < threshold:
+                break  # documents not seen yet can't make it into the top `topn` anymore
+            start, end = indptr[termids[pos]], indptr[termids[pos] + 1]
+            docids = indices[start:end]
+            scores[docids] += weights[pos] * data[start:end]
+            unseen = docids[~is_seen[docids]]
+            is_seen[unseen] = True
+            seen = numpy.concatenate((seen, unseen))
+            if len(seen) >= topn:
+                threshold = numpy.partition(scores[seen], len(seen) - topn)[len(seen) - topn]
+        else:
+            pos = len(termids)
+
+        # only finish scoring the seen documents that can still make it
+        candidates = seen[scores[seen] + remaining[pos] >= threshold]
+        candidate_scores = scores[candidates]
+        for pos in xrange(pos, len(termids)):
+            start, end = indptr[termids[pos]], indptr[termids[pos] + 1]
+            docids = indices[start:end]
+            found = numpy.searchsorted(docids, candidates)
+            hit = found < len(docids)
+            hit[hit] = docids[found[hit]] == candidates[hit]
+            candidate_scores[hit] += weights[pos] * data[start:end][found[hit]]
+            if len(candidates) >= topn:
+                threshold = max(threshold, numpy.partition(candidate_scores, len(candidates) - topn)[-topn])
+            keep = candidate_scores + remaining[pos + 1] >= threshold
+            candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+
+        candidate_scores = numpy.asarray(candidate_scores, dtype=float)
+        nonzero = numpy.nonzero(candidate_scores > 1e-9)[0]
+        best = nonzero.take(matutils.argsort(candidate_scores.take(nonzero), topn, reverse=True))
+        return list(zip(candidates.take(best), candidate_scores.take(best)))
+
+
+class DistributionSimilarity(interfaces.SimilarityABC):
+    """Compare probability distributions (such as the topic distributions of
+    :class:`~gensim.models.ldamodel.LdaModel`) with Hellinger or Jensen-Shannon distance, storing the index in memory.
+
+    Similarities are reported as `1 - distance`, so that `num_best` returns the closest distributions, with the same
+    conventions as :class:`~gensim.similarities.docsim.MatrixSimilarity`.
+
+    Notes
+    -----
+    With `metric='hellinger'`, the index stores the square roots of the distributions, which turns the Hellinger
+    distance :math:`\\sqrt{\\frac{1}{2}\\sum_i (\\sqrt{p_i} - \\sqrt{q_i})^2}` into a single matrix product
+    :math:`\\sqrt{\\frac{1}{2}(\\sum_i p_i + \\sum_i q_i) - \\sqrt{p} \\cdot \\sqrt{q}}`, computed for a whole
+    chunk of queries at once. The distance is the same as that of :func:`gensim.matutils.hellinger`, but the square
+    root amplifies rounding errors for nearly identical distributions (to about 1e-3 with float32 `dtype`); use
+    `dtype=numpy.float64` if such small distances matter.
+
+    With `metric='jensen_shannon'`, the index stores the L1-normalized distributions along with their negative
+    entropies :math:`\\sum_i p_i \\log p_i`, so that only the mixed term :math:`\\sum_i s_i \\log s_i`,
+    :math:`s = p + q`, is left to compute for each pair. That term is evaluated vectorised over blocks of
+    (queries x documents x features) of at most `block_entries` entries. The distance is the Jensen-Shannon divergence
+    of :func:`gensim.matutils.jensen_shannon` (in nats, at most :math:`\\log 2`), and the similarity is
+    `1 - divergence / log(2)`.
+
+    Examples
+    --------
+
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import common_corpus, common_dictionary
+        >>> from gensim.models import LdaModel
+        >>> from gensim.similarities import DistributionSimilarity
+        >>>
+        >>> lda = LdaModel(common_corpus, id2word=common_dictionary, num_topics=3)
+        >>> index = DistributionSimilarity(lda[common_corpus], num_features=lda.num_topics, num_best=3)
+        >>> sims = index[lda[common_corpus[0]]]  # 3 closest documents by Hellinger distance
+        >>>
+        >>> index = DistributionSimilarity(lda[common_corpus], num_features=lda.num_topics, metric='jensen_shannon')
+        >>> distances = index.distances(lda[common_corpus[0]])
+
+    """
+    METRICS = ('hellinger', 'jensen_shannon')
+
+    def __init__(self, corpus, num_features, metric='hellinger', num_best=None, chunksize=256, dtype=numpy.float32,
+                 corpus_len=None, block_entries=2 ** 22):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Probability distributions in the sparse Gensim format, or as dense vectors.
+        num_features : int
+            Size of the distributions (number of topics).
+        metric : {'hellinger', 'jensen_shannon'}, optional
+            Distance between the distributions.
+        num_best : int, optional
+            If set, return only the `num_best` most similar documents, always leaving out documents with similarity = 0.
+            Otherwise, return a full vector with one float for every document in the index.
+        chunksize : int, optional
+            Size of query chunks. Used internally when the query is an entire corpus.
+        dtype : numpy.dtype, optional
+            Datatype to store the internal matrix in.
+        corpus_len : int, optional
+            Number of documents in `corpus`. If not specified, will scan the corpus to determine the matrix size.
+        block_entries : int, optional
+            Maximum number of (query, document, feature) entries processed at once by Jensen-Shannon queries.
+
+        """
+        if metric not in self.METRICS:
+            raise ValueError("metric must be one of %s, not %r" % (", ".join(map(repr, self.METRICS)), metric))
+        if num_features <= 0:
+            raise ValueError("cannot index distributions with zero features")
+        self.num_features = num_features
+        self.metric = metric
+        self.num_best = num_best
+        self.normalize = False  # distributions must not be L2-normalized
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.block_entries = block_entries
+        if corpus_len is None:
+            corpus_len = len(corpus)
+
+        logger.info("creating %s index of %i distributions over %i features", metric, corpus_len, num_features)
+        self.index = numpy.empty(shape=(corpus_len, num_features), dtype=dtype)
+        for docno, vector in enumerate(corpus):
+            if docno % 1000 == 0:
+                logger.debug("PROGRESS: at document #%i/%i", docno, corpus_len)
+            self.index[docno] = self.dense(vector)[0]
+        self.index_mass, self.index_negentropy = self.prepare(self.index)
+
+    def __len__(self):
+        return self.index.shape[0]
+
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(DistributionSimilarity, self)._cache_params() + (self.metric, )
+
+    def dense(self, query):
+        """Convert a distribution or a collection of distributions to a dense matrix, one distribution per row.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, scipy.sparse.csr_matrix}
+            Distribution or collection of distributions.
+
+        Returns
+        -------
+        numpy.ndarray
+            Dense matrix of shape (number of distributions, `num_features`).
+
+        """
+        is_corpus, query = utils.is_corpus(query)
+        if is_corpus:
+            query = [matutils.sparse2full(vec, self.num_features) for vec in query]
+        elif scipy.sparse.issparse(query):
+            query = query.toarray()
+        elif not isinstance(query, numpy.ndarray):
+            query = matutils.sparse2full(query, self.num_features)
+        query = numpy.array(query, dtype=self.dtype).reshape(-1, self.num_features)  # prepare() works in place
+        if (query < 0).any():
+            raise ValueError("probability distributions cannot contain negative values")
+        return query
+
+    def prepare(self, matrix):
+        """Transform distributions in the rows of `matrix` in place into the stored representation of `metric`.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray
+            Dense distributions, one per row.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Total mass of every distribution and, for Jensen-Shannon, its negative entropy (None for Hellinger).
+
+        """
+        mass = matrix.sum(axis=1, dtype=numpy.float64)
+        if self.metric == 'hellinger':
+            numpy.sqrt(matrix, out=matrix)
+            return mass, None
+        nonempty = mass > 0
+        matrix[nonempty] /= mass[nonempty, None].astype(matrix.dtype)
+        negentropy = numpy.empty(len(matrix), dtype=numpy.float64)
+        for start in xrange(0, len(matrix), max(1, self.block_entries // self.num_features)):
+            block = matrix[start: start + max(1, self.block_entries // self.num_features)]
+            negentropy[start: start + len(block)] = xlogy(block, block).sum(axis=1)
+        return mass, negentropy
+
+    def distances(self, query):
+        """Get the distances between `query` and all distributions in this index.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, scipy.sparse.csr_matrix}
+            Distribution or collection of distributions.
+
+        Returns
+        -------
+        numpy.ndarray
+            Distances of shape (number of queries, number of documents), or a vector for a single query.
+
+        """
+        is_corpus, query = utils.is_corpus(query)
+        single = not is_corpus and not scipy.sparse.issparse(query) and not (
+            isinstance(query, numpy.ndarray) and query.ndim > 1
+        )
+        queries = self.dense(query)
+        result = numpy.empty((len(queries), len(self)), dtype=numpy.float64)
+        for start in xrange(0, len(queries), self.chunksize):
+            chunk = queries[start: start + self.chunksize]
+            mass, negentropy = self.prepare(chunk)
+            if self.metric == 'hellinger':
+                result[start: start + len(chunk)] = self.hellinger(chunk, mass)
+            else:
+                result[start: start + len(chunk)] = self.jensen_shannon(chunk, negentropy)
+        return result[0] if single else result
+
+    def hellinger(self, chunk, mass):
+        """Get Hellinger distances between the square-rooted distributions in `chunk` and this index.
+
+        Parameters
+        ----------
+        chunk : numpy.ndarray
+            Square roots of the query distributions, one per row.
+        mass : numpy.ndarray
+            Total mass of every query distribution.
+
+        Returns
+        -------
+        numpy.ndarray
+            Distances of shape (number of queries, number of documents).
+
+        """
+        # do a little transposition dance to stop numpy from making a copy of self.index internally in numpy.dot
+        overlap = numpy.dot(self.index, chunk.T).T
+        squares = 0.5 * (mass[:, None] + self.index_mass[None, :]) - overlap
+        return numpy.sqrt(numpy.maximum(squares, 0.0))
+
+    def jensen_shannon(self, chunk, negentropy):
+        """Get Jensen-Shannon divergences between the normalized distributions in `chunk` and this index.
+
+        Parameters
+        ----------
+        chunk : numpy.ndarray
+            Normalized query distributions, one per row.
+        negentropy : numpy.ndarray
+            Negative entropy of every query distribution.
+
+        Returns
+        -------
+        numpy.ndarray
+            Divergences of shape (number of queries, number of documents).
+
+        """
+        result = 0.5 * (negentropy[:, None] + self.index_negentropy[None, :]) + numpy.log(2.0)
+        queries_per_block = max(1, min(len(chunk), self.block_entries // self.num_features))
+        for qstart in xrange(0, len(chunk), queries_per_block):
+            queries = chunk[qstart: qstart + queries_per_block, None, :]
+            docs_per_block = max(1, self.block_entries // (len(queries) * self.num_features))
+            for dstart in xrange(0, len(self), docs_per_block):
+                mixed = queries + self.index[None, dstart: dstart + docs_per_block, :]
+                mixed = xlogy(mixed, mixed, out=mixed).sum(axis=2)
+                result[qstart: qstart + len(queries), dstart: dstart + mixed.shape[1]] -= 0.5 * mixed
+        return numpy.clip(result, 0.0, numpy.log(2.0))
+
+    def get_similarities(self, query):
+        """Get similarity between `query` and this index.
+
+        Warnings
+        --------
+        Do not use this function directly, use the `self[query]` syntax instead.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, scipy.sparse.csr_matrix}
+            Distribution or collection of distributions.
+
+        Return
+        ------
+        :class:`numpy.ndarray`
+            Similarity matrix.
+
+        """
+        distances = self.distances(query)
+        if self.metric == 'jensen_shannon':
+            distances /= numpy.log(2.0)
+        return (1.0 - distances).astype(self.dtype)
+
+    def __iter__(self):
+        """Iterate over all distributions in the index, computing their similarities against the whole index.
+
+        Yields
+        ------
+        {:class:`numpy.ndarray`, list of (int, float)}
+            Similarity of the current distribution and all distributions in the index.
+
+        """
+        for start in xrange(0, len(self), self.chunksize):
+            chunk = numpy.array(self.index[start: start + self.chunksize], dtype=self.dtype)
+            if self.metric == 'hellinger':
+                chunk **= 2  # the index stores square roots
+            for sims in self._query(chunk):
+                yield sims
+
+    def __str__(self):
+        return "%s<%i docs, %i features, %s>" % (self.__class__.__name__, len(self), self.num_features, self.metric)
+
+
+def index_blocks(index, blocksize):
+    """Split the documents of `index` into blocks of at most `blocksize` rows. Used internally by
+    :func:`~gensim.similarities.docsim.self_join`.
+
+    Parameters
+    ----------
+    index : {:class:`~gensim.similarities.docsim.Similarity`, :class:`~gensim.similarities.docsim.MatrixSimilarity`, \
+    :class:`~gensim.similarities.docsim.SparseMatrixSimilarity`}
+        Index to split.
+    blocksize : int
+        Maximum number of documents per block.
+
+    Returns
+    -------
+    list of (numpy.ndarray, (:class:`~gensim.interfaces.SimilarityABC`, numpy.ndarray))
+        Document positions of each block, in ascending order, and the index together with the rows of the block.
+        Deleted documents of a :class:`~gensim.similarities.docsim.Similarity` index are left out.
+
+    """
+    if isinstance(index, Similarity):
+        index.close_shard()
+        blocks, offset = [], 0
+        for shard in index.shards:
+            rows = numpy.arange(shard.num_rows())
+            deleted_rows = shard.deleted_rows()
+            if deleted_rows is not None:
+                rows = numpy.setdiff1d(rows, deleted_rows)
+            positions = offset + (rows if shard.positions is None else shard.positions[rows])
+            for start in xrange(0, len(rows), blocksize):
+                end = start + blocksize
+                blocks.append((positions[start: end], (shard.get_index(), rows[start: end])))
+            offset += len(shard)
+        return blocks
+    if isinstance(index, (MatrixSimilarity, SparseMatrixSimilarity)):
+        rows = numpy.arange(len(index))
+        return [
+            (rows[start: start + blocksize], (index, rows[start: start + blocksize]))
+            for start in xrange(0, len(index), blocksize)
+        ]
+    raise TypeError("self-joins are only supported for Similarity, MatrixSimilarity and SparseMatrixSimilarity indexes")
+
+
+def block_vectors(block):
+    """Get the (normalized) document vectors of a block of :func:`~gensim.similarities.docsim.index_blocks`.
+
+    Parameters
+    ----------
+    block : (:class:`~gensim.interfaces.SimilarityABC`, numpy.ndarray)
+        Index and rows of the block.
+
+    Returns
+    -------
+    {numpy.ndarray, :class:`scipy.sparse.csr_matrix`}
+        Document vectors, one per row.
+
+    """
+    index, rows = block
+    vectors = index.index[rows[0]: rows[-1] + 1]
+    if len(rows) != rows[-1] + 1 - rows[0]:
+        vectors = vectors[rows - rows[0]]
+    if scipy.sparse.issparse(vectors):
+        return vectors
+    storage = getattr(index, 'storage', None)
+    if storage is None:
+        return numpy.asarray(vectors)
+    vectors = vectors.astype(index.dtype)
+    if storage == 'int8':
+        vectors *= index.index_scales[rows][:, None]
+    return vectors
+
+
+def self_join_tile(args):
+    """Compute the similarities between two blocks of documents and keep only the best ones.
+    Used internally by :func:`~gensim.similarities.docsim.self_join`.
+
+    Parameters
+    ----------
+    args : ((numpy.ndarray, object), (numpy.ndarray, object), float, int, bool, bool)
+        Both blocks as returned by :func:`~gensim.similarities.docsim.index_blocks`, the `threshold`,
+        `topn` and `include_self` parameters of the self-join, and whether to also get the best similarities of
+        the rows of the second block.
+
+    Returns
+    -------
+    (tuple, tuple)
+        The best similarities of the rows of the first block, and of the rows of the second block (None if both
+        blocks are the same, or if not asked for), either as (row, column, similarity) arrays or, if `topn` is set,
+        as (columns, similarities) matrices with `topn` columns per row, -inf marking the unused ones.
+
+    """
+    (positions1, block1), (positions2, block2), threshold, topn, include_self, mirror = args
+    vectors1, vectors2 = block_vectors(block1), block_vectors(block2)
+    if scipy.sparse.issparse(vectors1):
+        sims = vectors1.dot(vectors2.T)
+    elif scipy.sparse.issparse(vectors2):
+        sims = vectors2.dot(vectors1.T).T
+    else:
+        sims = numpy.dot(vectors1, vectors2.T)
+    sims = numpy.array(sims.toarray() if scipy.sparse.issparse(sims) else sims, dtype=numpy.float32)
+    symmetric = positions1 is positions2
+    if symmetric and not include_self:
+        numpy.fill_diagonal(sims, -numpy.inf)
+    if threshold is not None:
+        sims[sims < threshold] = -numpy.inf
+
+    if topn is None:
+        rows, cols = numpy.nonzero(sims > -numpy.inf)
+        best = (rows, positions2[cols], sims[rows, cols])
+        return best, None if symmetric or not mirror else (cols, positions1[rows], best[2])
+
+    def best_per_row(sims, positions):
+        k = min(topn, sims.shape[1])
+        cols = numpy.argpartition(-sims, k - 1, axis=1)[:, :k]
+        return positions[cols], sims[numpy.arange(len(sims))[:, None], cols]
+
+    return best_per_row(sims, positions2), None if symmetric or not mirror else best_per_row(sims.T, positions1)
+
+
+def merge_topn(best, other, topn):
+    """Merge two sets of per-row best similarities of :func:`~gensim.similarities.docsim.self_join_tile`.
+
+    Parameters
+    ----------
+    best : (numpy.ndarray, numpy.ndarray)
+        Column ids and similarities so far, None if there are none yet.
+    other : (numpy.ndarray, numpy.ndarray)
+        Column ids and similarities to merge in.
+    topn : int
+        Number of similarities to keep per row.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Column ids and similarities of the best `topn` of both, per row.
+
+    """
+    if best is None:
+        return other
+    ids, sims = numpy.hstack((best[0], other[0])), numpy.hstack((best[1], other[1]))
+    if sims.shape[1] <= topn:
+        return ids, sims
+    cols = numpy.argpartition(-sims, topn - 1, axis=1)[:, :topn]
+    rows = numpy.arange(len(sims))[:, None]
+    return ids[rows, cols], sims[rows, cols]
+
+
+def self_join(index, fname, threshold=None, topn=None, blocksize=4096, workers=1, include_self=False):
+    """Compute the similarities of all pairs of documents in `index` and store the best ones as a sparse matrix
+    in Matrix Market format, without ever materializing the full `N x N` similarity matrix.
+
+    The index is split into blocks of `blocksize` documents, and the similarities of each pair of blocks
+    are computed with a single matrix-matrix product. The rows of a block are written out as soon as all of its
+    products are done, one block after another.
+
+    With a `threshold` only, the similarity being symmetric, only the pairs of blocks on and above the diagonal are
+    computed; each such product is used for the rows of both of its blocks. With `topn`, each block is multiplied
+    with all blocks instead: this computes every product twice, but only the best similarities of the blocks in
+    progress are held in memory, not `topn` candidates for every document of the index.
+
+    Parameters
+    ----------
+    index : {:class:`~gensim.similarities.docsim.Similarity`, :class:`~gensim.similarities.docsim.MatrixSimilarity`, \
+    :class:`~gensim.similarities.docsim.SparseMatrixSimilarity`}
+        Index of documents to join with itself.
+    fname : str
+        Path to the output Matrix Market file. Row `i` holds the kept similarities of the document at position `i`.
+    threshold : float, optional
+        Only keep the similarities of at least `threshold`.
+    topn : int, optional
+        Only keep the `topn` highest similarities of each document. At least one of `threshold` and `topn` must be set.
+    blocksize : int, optional
+        Number of documents per block. A `blocksize x blocksize` matrix of floats must fit into RAM, once per worker.
+    workers : int, optional
+        Number of threads that compute pairs of blocks in parallel (BLAS releases the GIL).
+    include_self : bool, optional
+        Keep the similarity of each document with itself?
+
+    Returns
+    -------
+    :class:`~gensim.corpora.mmcorpus.MmCorpus`
+        The stored similarities, as a corpus with one (sparse) document per indexed document.
+
+    Notes
+    -----
+    Similarities of exactly 0 are never stored. Deleted documents of a :class:`~gensim.similarities.docsim.Similarity`
+    index get empty rows, and never appear in the rows of other documents.
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import common_corpus, common_dictionary, get_tmpfile
+        >>> from gensim.similarities import MatrixSimilarity
+        >>> from gensim.similarities.docsim import self_join
+        >>>
+        >>> index = MatrixSimilarity(common_corpus, num_features=len(common_dictionary))
+        >>> neighbours = self_join(index, get_tmpfile("neighbours.mm"), threshold=0.5, topn=3)
+
+    """
+    from gensim.corpora.mmcorpus import MmCorpus  # avoid a circular import
+
+    if threshold is None and topn is None:
+        raise ValueError("at least one of threshold and topn must be set")
+    num_docs = len(index)
+    blocks = index_blocks(index, blocksize)
+    mirror = topn is None  # use each product for the rows of both blocks?
+    tiles = [(i, j) for i in xrange(len(blocks)) for j in xrange(i if mirror else 0, len(blocks))]
+    args = ((blocks[i], blocks[j], threshold, topn, include_self, mirror) for i, j in tiles)
+
+    pool = multiprocessing.pool.ThreadPool(workers) if workers > 1 else None
+    results = pool.imap(self_join_tile, args) if pool is not None else imap(self_join_tile, args)
+
+    # best similarities of the rows of each block in progress, gathered from all pairs of blocks seen so far
+    pending = [None if topn is not None else [] for _ in blocks]
+    writer = matutils.MmWriter(fname)
+    writer.write_headers(-1, -1, -1)
+    num_nnz = 0
+    try:
+        for (i, j), (best1, best2) in izip(tiles, results):
+            if topn is not None:
+                pending[i] = merge_topn(pending[i], best1, topn)
+                if best2 is not None:
+                    pending[j] = merge_topn(pending[j], best2, topn)
+            else:
+                pending[i].append(best1)
+                if best2 is not None:
+                    pending[j].append(best2)
+            if j < len(blocks) - 1:
+                continue
+
+            # all pairs of blocks with block i are done => write out its rows
+            positions, best = blocks[i][0], pending[i]
+            pending[i] = None
+            if topn is not None:
+                rows = numpy.repeat(numpy.arange(len(positions)), best[0].shape[1])
+                cols, sims = best[0].ravel(), best[1].ravel()
+            else:
+                rows, cols, sims = (numpy.concatenate(parts) for parts in izip(*best)) if best else ([], [], [])
+            rows, cols, sims = numpy.asarray(rows), numpy.asarray(cols), numpy.asarray(sims)
+            keep = sims > -numpy.inf
+            rows, cols, sims = rows[keep], cols[keep], sims[keep]
+            order = numpy.lexsort((cols, rows))
+            rows, cols, sims = rows[order], cols[order], sims[order]
+            bounds = numpy.searchsorted(rows, numpy.arange(len(positions) + 1))
+            for row, position in enumerate(positions):
+                start, end = bounds[row], bounds[row + 1]
+                if start < end:
+                    num_nnz += writer.write_vector(position, izip(cols[start:end], sims[start:end]))[1]
+            logger.info("PROGRESS: self-joined %i/%i blocks", i + 1, len(blocks))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    writer.fake_headers(num_docs, num_docs, num_nnz)
+    writer.close()
+    logger.info("stored %i similarities between %i documents in %s", num_nnz, num_docs, fname)
+    return MmCorpus(fname)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module contains a native approximate nearest neighbour indexer for :class:`~gensim.models.word2vec.Word2Vec`,
+:class:`~gensim.models.doc2vec.Doc2Vec`, :class:`~gensim.models.fasttext.FastText` and
+:class:`~gensim.models.keyedvectors.KeyedVectors`, with no dependencies beyond numpy.
+
+
+How it works
+------------
+The index is a `Hierarchical Navigable Small World graph <https://arxiv.org/abs/1603.09320>`_.
+Every vector is a node, connected to (at most) `2 * m` of its close neighbours on the bottom layer.
+A random, exponentially decaying subset of the nodes is also inserted into sparser upper layers, which serve
+as "express lanes": a query greedily descends from the top layer to the bottom, and then runs a best-first
+search over the bottom layer, keeping the `ef` best candidates seen so far.
+
+Larger `ef` means better recall and slower queries; it can be changed at any time, without rebuilding the index.
+
+Unlike :class:`~gensim.similarities.index.AnnoyIndexer`, new vectors can be inserted into an existing index:
+vectors appended to the model through :meth:`~gensim.models.keyedvectors.BaseKeyedVectors.add` are picked up
+automatically on the next query.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.similarities.hnsw import HnswIndexer
+    >>> from gensim.models import Word2Vec
+    >>> from gensim.test.utils import common_texts, get_tmpfile
+    >>>
+    >>> model = Word2Vec(common_texts, min_count=1, seed=1)
+    >>> indexer = HnswIndexer(model, m=8, ef=20)
+    >>> approx = model.wv.most_similar("graph", topn=3, indexer=indexer)
+    >>>
+    >>> fname = get_tmpfile("hnsw.index")
+    >>> indexer.save(fname)
+    >>> indexer = HnswIndexer.load(fname, mmap='r')
+    >>> indexer.model = model  # the model is not stored along with the index
+
+"""
+
+from __future__ import division
+
+import heapq
+import logging
+import math
+
+import numpy
+from six.moves import xrange, zip
+
+from gensim import utils, matutils
+from gensim.models.keyedvectors import BaseKeyedVectors, Doc2VecKeyedVectors
+
+logger = logging.getLogger(__name__)
+
+
+class HnswIndexer(utils.SaveLoad):
+    """Approximate nearest neighbour search over a Hierarchical Navigable Small World graph.
+
+    Can be passed as `indexer` to :meth:`~gensim.models.keyedvectors.WordEmbeddingsKeyedVectors.most_similar`
+    and :meth:`~gensim.models.keyedvectors.Doc2VecKeyedVectors.most_similar`.
+
+    """
+    def __init__(self, model=None, m=16, ef_construction=200, ef=50, seed=1):
+        """
+
+        Parameters
+        ----------
+        model : {:class:`~gensim.models.base_any2vec.BaseWordEmbeddingsModel`,
+                 :class:`~gensim.models.keyedvectors.BaseKeyedVectors`}, optional
+            Model or keyed vectors to index. If None, use :meth:`~gensim.similarities.hnsw.HnswIndexer.add_items`.
+        m : int, optional
+            Maximum number of neighbours of a node on the upper layers (`2 * m` on the bottom layer).
+            Larger values improve recall on high-dimensional data, at the cost of memory and build time.
+        ef_construction : int, optional
+            Size of the candidate list used when inserting new vectors. Larger values build a better graph, slower.
+        ef : int, optional
+            Size of the candidate list used when querying. Trades recall against latency.
+        seed : int, optional
+            Seed for the random generator that assigns nodes to layers.
+
+        """
+        if m < 2:
+            raise ValueError("m must be at least 2, got %r" % m)
+        self.model = model
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef = ef
+        self.level_mult = 1.0 / math.log(m)
+        self.random = numpy.random.RandomState(seed)
+
+        self.num_items = 0
+        self.labels = []
+        self.vectors = None  # unit-length copies of the indexed vectors
+        self.levels = None  # top layer of each node
+        self.neighbors = None  # bottom layer adjacency, shape (capacity, 2 * m), padded with -1
+        self.layers = []  # upper layer adjacency, layers[l - 1] = {node: array of neighbours on layer l}
+        self.entry_point = -1
+
+        if model is not None:
+            self.update()
+
+    def __len__(self):
+        return self.num_items
+
+    def save(self, *args, **kwargs):
+        """Save the index. The model is **not** stored, set the `model` attribute again after loading.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output file.
+
+        See Also
+        --------
+        :meth:`~gensim.utils.SaveLoad.load`
+            Load the index, optionally memory-mapping the large arrays with `mmap='r'`.
+
+        """
+        # drop the spare capacity reserved for future inserts, a prefix view costs nothing
+        if self.vectors is not None:
+            self.vectors = self.vectors[:self.num_items]
+            self.levels = self.levels[:self.num_items]
+            self.neighbors = self.neighbors[:self.num_items]
+        kwargs['ignore'] = kwargs.get('ignore', ['model'])
+        super(HnswIndexer, self).save(*args, **kwargs)
+
+    def _model_vectors(self):
+        """Get the raw vectors of `self.model` and a function that maps a vector position to its label."""
+        model = self.model
+        if isinstance(model, BaseKeyedVectors):
+            kv = model
+        elif hasattr(model, 'docvecs'):
+            kv = model.docvecs
+        elif hasattr(model, 'wv'):
+            kv = model.wv
+        else:
+            raise ValueError("Only a Word2Vec, Doc2Vec, FastText or KeyedVectors instance can be used")
+
+        if isinstance(kv, Doc2VecKeyedVectors):
+            return kv.vectors_docs, kv.index_to_doctag
+        return kv.vectors, kv.index2entity.__getitem__
+
+    def update(self):
+        """Insert the vectors that were added to `self.model` since the index was last synchronised with it.
+
+        Called automatically by :meth:`~gensim.similarities.hnsw.HnswIndexer.most_similar`.
+
+        Notes
+        -----
+        Vectors replaced in place (e.g. `kv.add(..., replace=True)`) are not re-indexed.
+
+        """
+        vectors, label = self._model_vectors()
+        if len(vectors) > self.num_items:
+            start = self.num_items
+            self.add_items(vectors[start:], [label(i) for i in xrange(start, len(vectors))])
+
+    def add_items(self, vectors, labels):
+        """Insert new vectors into the index.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            2D array of vectors, one per row. They don't have to be normalized.
+        labels : list of object
+            Label returned by :meth:`~gensim.similarities.hnsw.HnswIndexer.most_similar` for each row of `vectors`.
+
+        """
+        vectors = numpy.asarray(vectors)
+        if len(vectors) != len(labels):
+            raise ValueError("got %i vectors but %i labels" % (len(vectors), len(labels)))
+        if not len(vectors):
+            return
+        self._reserve(self.num_items + len(vectors), vectors.shape[1])
+        logger.info("inserting %i vectors into HNSW index of %i vectors", len(vectors), self.num_items)
+
+        for i, (vector, label) in enumerate(zip(vectors, labels)):
+            node = self.num_items
+            self.vectors[node] = matutils.unitvec(vector)
+            self.labels.append(label)
+            self.num_items += 1
+            self._insert(node)
+            if i and i % 10000 == 0:
+                logger.info("PROGRESS: inserted %i vectors", i)
+
+    def _reserve(self, size, vector_size):
+        """Make sure the arrays can hold `size` nodes and are writeable (they aren't after loading with mmap)."""
+        if self.vectors is None:
+            self.vectors = numpy.zeros((0, vector_size), dtype=numpy.float32)
+            self.levels = numpy.zeros(0, dtype=numpy.int32)
+            self.neighbors = numpy.zeros((0, 2 * self.m), dtype=numpy.int32)
+        capacity = len(self.vectors)
+        if size <= capacity and self.vectors.flags.writeable and self.neighbors.flags.writeable:
+            return
+        capacity = max(size, 2 * capacity)
+
+        vectors = numpy.zeros((capacity, self.vectors.shape[1]), dtype=numpy.float32)
+        vectors[:self.num_items] = self.vectors[:self.num_items]
+        levels = numpy.zeros(capacity, dtype=numpy.int32)
+        levels[:self.num_items] = self.levels[:self.num_items]
+        neighbors = numpy.full((capacity, 2 * self.m), -1, dtype=numpy.int32)
+        neighbors[:self.num_items] = self.neighbors[:self.num_items]
+        self.vectors, self.levels, self.neighbors = vectors, levels, neighbors
+
+    def _get_neighbors(self, node, layer):
+        if layer == 0:
+            row = self.neighbors[node]
+            return row[row >= 0]
+        return self.layers[layer - 1][node]
+
+    def _set_neighbors(self, node, layer, nodes):
+        if layer == 0:
+            self.neighbors[node] = -1
+            self.neighbors[node, :len(nodes)] = nodes
+        else:
+            self.layers[layer - 1][node] = numpy.array(nodes, dtype=numpy.int32)
+
+    def _search_layer(self, query, entry_points, ef, layer):
+        """Best-first search on a single layer.
+
+        Parameters
+        ----------
+        query : numpy.ndarray
+            Unit-length query vector.
+        entry_points : list of (float, int)
+            (similarity to `query`, node) pairs to start the search from.
+        ef : int
+            Number of best candidates to keep.
+        layer : int
+            Layer to search.
+
+        Returns
+        -------
+        list of (float, int)
+            Up to `ef` (similarity, node) pairs, most similar first.
+
+        """
+        visited = set(node for _, node in entry_points)
+        candidates = [(-sim, node) for sim, node in entry_points]
+        heapq.heapify(candidates)
+        results = list(entry_points)
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            neg_sim, node = heapq.heappop(candidates)
+            if -neg_sim < results[0][0] and len(results) >= ef:
+                break  # the closest unexpanded candidate is worse than anything we keep
+            unvisited = [n for n in self._get_neighbors(node, layer).tolist() if n not in visited]
+            if not unvisited:
+                continue
+            visited.update(unvisited)
+            sims = numpy.dot(self.vectors[unvisited], query)
+            for neighbor, sim in zip(unvisited, sims.tolist()):
+                if len(results) < ef or sim > results[0][0]:
+                    heapq.heappush(candidates, (-sim, neighbor))
+                    heapq.heappush(results, (sim, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted(results, reverse=True)
+
+    def _select_neighbors(self, candidates, m):
+        """Pick up to `m` neighbours out of `candidates`, sorted by decreasing similarity.
+
+        Prefer candidates that are closer to the base node than to any already selected neighbour,
+        so that the links point in diverse directions (the heuristic from Section 4 of the HNSW paper).
+
+        """
+        if len(candidates) <= m:
+            return [node for _, node in candidates]
+        nodes = [node for _, node in candidates]
+        vectors = self.vectors[nodes]
+        pairwise = numpy.dot(vectors, vectors.T)
+        selected, pruned = [], []
+        for pos, (sim, node) in enumerate(candidates):
+            if len(selected) >= m:
+                break
+            if selected and pairwise[pos, selected].max() > sim:
+                pruned.append(pos)
+            else:
+                selected.append(pos)
+        return [nodes[pos] for pos in selected + pruned[:m - len(selected)]]
+
+    def _connect(self, node, new_neighbor, layer):
+        """Add a link from `node` to `new_neighbor`, pruning the links of `node` if it has too many."""
+        max_links = 2 * self.m if layer == 0 else self.m
+        current = self._get_neighbors(node, layer)
+        if len(current) < max_links:
+            self._set_neighbors(node, layer, numpy.append(current, new_neighbor))
+            return
+        nodes = numpy.append(current, new_neighbor)
+        sims = numpy.dot(self.vectors[nodes], self.vectors[node])
+        order = numpy.argsort(-sims)
+        self._set_neighbors(node, layer, self._select_neighbors(list(zip(sims[order], nodes[order])), max_links))
+
+    def _insert(self, node):
+        """Link an already stored vector into the graph."""
+        level = int(-math.log(1.0 - self.random.random_sample()) * self.level_mult)
+        self.levels[node] = level
+        while len(self.layers) < level:
+            self.layers.append({})
+        for layer in xrange(1, level + 1):
+            self.layers[layer - 1][node] = numpy.zeros(0, dtype=numpy.int32)
+
+        if self.entry_point < 0:
+            self.entry_point = node
+            return
+
+        query = self.vectors[node]
+        top_level = int(self.levels[self.entry_point])
+        entry_points = [(float(numpy.dot(self.vectors[self.entry_point], query)), self.entry_point)]
+        for layer in xrange(top_level, level, -1):
+            entry_points = self._search_layer(query, entry_points, 1, layer)
+        for layer in xrange(min(level, top_level), -1, -1):
+            entry_points = self._search_layer(query, entry_points, self.ef_construction, layer)
+            neighbors = self._select_neighbors(entry_points, self.m)
+            self._set_neighbors(node, layer, neighbors)
+            for neighbor in neighbors:
+                self._connect(neighbor, node, layer)
+
+        if level > top_level:
+            self.entry_point = node
+
+    def most_similar(self, vector, num_neighbors):
+        """Find the approximate `num_neighbors` most similar items.
+
+        Parameters
+        ----------
+        vector : numpy.array
+            Vector for word/document.
+        num_neighbors : int
+            Number of most similar items.
+
+        Returns
+        -------
+        list of (str, float)
+            List of most similar items in format [(`item`, `cosine_similarity`), ... ]
+
+        """
+        if self.model is not None:
+            self.update()
+        if self.entry_point < 0:
+            return []
+
+        query = matutils.unitvec(numpy.asarray(vector, dtype=numpy.float32))
+        entry_points = [(float(numpy.dot(self.vectors[self.entry_point], query)), self.entry_point)]
+        for layer in xrange(int(self.levels[self.entry_point]), 0, -1):
+            entry_points = self._search_layer(query, entry_points, 1, layer)
+        results = self._search_layer(query, entry_points, max(self.ef, num_neighbors), 0)
+        return [(self.labels[node], sim) for sim, node in results[:num_neighbors]]
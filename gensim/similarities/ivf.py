@@ -0,0 +1,600 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module contains :class:`~gensim.similarities.ivf.IvfSimilarity`, an inverted-file (IVF) index for
+approximate cosine similarity search over dense document vectors, such as LSI or Doc2Vec vectors, with no
+dependencies beyond numpy.
+
+
+How it works
+------------
+The documents are clustered into `nlist` lists by (spherical) k-means, trained on a sample of the documents.
+The vectors of each list are stored next to each other. A query is compared to the `nlist` centroids first
+(the "coarse quantizer"), and then only to the documents of its `nprobe` closest lists, so that only about
+`nprobe / nlist` of the index is scanned. Larger `nprobe` means better recall and slower queries; it can be changed
+at any time, without rebuilding the index. With `nprobe >= nlist`, the search is exhaustive and exact.
+
+A batch of queries (a corpus) is evaluated list by list: each probed list is multiplied with all the queries that
+probe it at once.
+
+Like :class:`~gensim.similarities.docsim.MatrixSimilarity`, the vectors can be stored in reduced precision
+(`storage='float16'` or `'int8'`). The corpus is converted and quantised chunk by chunk, so that building the index
+never holds more than the reduced-precision vectors in memory. With `rerank`, the best candidates are then re-scored
+against an exact copy of the index, which stays on disk, in a memory-mapped `.npy` file.
+
+Every list keeps some free rows after its documents, so that new documents are written in place: adding documents
+only rewrites the whole index when one of their lists is full, and then leaves room in every list again.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary, get_tmpfile
+    >>> from gensim.models import LsiModel
+    >>> from gensim.similarities import IvfSimilarity
+    >>>
+    >>> lsi = LsiModel(common_corpus, id2word=common_dictionary, num_topics=2)
+    >>> index = IvfSimilarity(lsi[common_corpus], num_features=2, nlist=3, nprobe=2, num_best=3)
+    >>> sims = index[lsi[common_corpus[0]]]
+    >>>
+    >>> index.add_documents(lsi[common_corpus])
+    >>> fname = get_tmpfile("ivf.index")
+    >>> index.save(fname)
+    >>> index = IvfSimilarity.load(fname, mmap='r')
+
+"""
+
+from __future__ import division
+
+import logging
+
+import numpy
+import scipy.sparse
+from six.moves import xrange, zip
+
+from gensim import interfaces, utils, matutils
+from gensim.similarities.docsim import create_memmap
+
+logger = logging.getLogger(__name__)
+
+COPY_ROWS = 65536  # rows copied, assigned to lists or quantised at once
+
+
+def quantise(vectors, storage, dtype):
+    """Convert vectors to their stored form, see :class:`~gensim.similarities.docsim.MatrixSimilarity`.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The stored vectors, and the scale of each vector for `storage='int8'` (None otherwise).
+
+    """
+    if storage != 'int8':
+        return vectors.astype(storage or dtype), None
+    scales = numpy.abs(vectors).max(axis=1) / 127.0
+    stored = numpy.rint(vectors / numpy.where(scales > 0, scales, 1.0)[:, None]).astype(numpy.int8)
+    return stored, scales.astype(numpy.float32)
+
+
+def dequantise(stored, scales, dtype):
+    """Convert stored vectors back to `dtype`, the inverse of :func:`~gensim.similarities.ivf.quantise`."""
+    if stored.dtype == dtype:
+        return stored
+    vectors = stored.astype(dtype)
+    if scales is not None:
+        vectors *= scales[:, None]
+    return vectors
+
+
+def grow(array, length):
+    """Get `array`, or a copy enlarged geometrically if it is shorter than `length` or read-only."""
+    if len(array) >= length and array.flags.writeable:
+        return array
+    grown = numpy.empty((max(length, 2 * len(array)), ) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class IvfSimilarity(interfaces.SimilarityABC):
+    """Approximate cosine similarity search over an inverted-file index of dense document vectors.
+
+    Can be used in place of :class:`~gensim.similarities.docsim.MatrixSimilarity`: full similarity vectors hold
+    the similarities to the documents in the probed lists, and 0 for all other documents.
+
+    """
+    def __init__(self, corpus, num_features, nlist=None, nprobe=8, num_best=None, chunksize=256, dtype=numpy.float32,
+                 storage=None, rerank=None, train_size=None, iterations=10, seed=0):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Corpus in streamed Gensim bag-of-words format, or of dense vectors.
+        num_features : int
+            Size of the dictionary (number of features).
+        nlist : int, optional
+            Number of lists. If None, use four times the square root of the number of documents.
+        nprobe : int, optional
+            Number of lists scanned per query.
+        num_best : int, optional
+            If set, return only the `num_best` most similar documents, always leaving out documents with similarity = 0.
+            Otherwise, return a full vector with one float for every document in the index.
+        chunksize : int, optional
+            Size of query chunks. Used internally when iterating over the index.
+        dtype : numpy.dtype, optional
+            Datatype of the similarities, and of the stored vectors unless `storage` is set.
+        storage : {None, 'float16', 'int8'}, optional
+            Reduced-precision storage of the vectors, see :class:`~gensim.similarities.docsim.MatrixSimilarity`.
+        rerank : int, optional
+            If set together with `num_best` and a reduced-precision `storage`, keep an exact copy of the vectors
+            (`exact_index`) and re-score the top `rerank` candidates of every query against it.
+        train_size : int, optional
+            Number of documents sampled to train the list centroids. If None, use up to 64 documents per list.
+        iterations : int, optional
+            Number of k-means iterations.
+        seed : int, optional
+            Seed for sampling the training documents and the initial centroids.
+
+        """
+        if storage not in (None, 'float16', 'int8'):
+            raise ValueError("storage must be one of None, 'float16' or 'int8', not %r" % (storage, ))
+        self.num_features = num_features
+        self.nprobe = nprobe
+        self.num_best = num_best
+        self.normalize = True
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.storage = storage
+        self.rerank = rerank if storage is not None else None
+
+        self.num_docs = 0
+        self.exact_index = numpy.empty((0, num_features), dtype=dtype) if self.rerank else None
+
+        # convert and quantise the corpus chunk by chunk, the exact vectors go straight to the disk
+        stored, scales = [numpy.empty((0, num_features), dtype=self.storage or dtype)], []
+        for chunk in utils.grouper(corpus, self.chunksize):
+            vectors = self.corpus2vectors(chunk)
+            self.append_exact(vectors)
+            chunk_stored, chunk_scales = quantise(vectors, self.storage, dtype)
+            stored.append(chunk_stored)
+            scales.append(chunk_scales)
+            self.num_docs += len(vectors)
+        stored = numpy.concatenate(stored)
+        scales = numpy.concatenate([numpy.empty(0, dtype=numpy.float32)] + scales) if storage == 'int8' else None
+
+        if nlist is None:
+            nlist = int(4 * numpy.sqrt(len(stored)))
+        nlist = max(1, min(nlist, len(stored)))
+        train_size = train_size or 64 * nlist
+        sample = numpy.arange(len(stored))
+        if len(stored) > train_size:
+            sample = numpy.sort(numpy.random.RandomState(seed).choice(len(stored), train_size, replace=False))
+        self.centroids = self.train_centroids(
+            dequantise(stored[sample], None if scales is None else scales[sample], dtype),
+            nlist, train_size, iterations, seed
+        )
+        lists = numpy.concatenate([numpy.zeros(0, dtype=numpy.int32)] + [
+            self.assign(
+                dequantise(stored[start:start + COPY_ROWS], None if scales is None else scales[start:start + COPY_ROWS],
+                           dtype),
+                self.centroids
+            )
+            for start in xrange(0, len(stored), COPY_ROWS)
+        ])
+
+        # the vectors of list `l` are at rows `list_offsets[l]:list_offsets[l] + list_sizes[l]`, followed by free
+        # rows up to `list_offsets[l + 1]`. `docids` holds the document position of each row (-1 for free rows),
+        # and `rows` the row of each document position.
+        self.rows = numpy.empty(0, dtype=numpy.int64)
+        self.layout(stored, scales, lists, numpy.arange(len(stored)))
+        logger.info("indexed %i documents in %s", len(self), self)
+
+    def __len__(self):
+        return self.num_docs
+
+    def _cache_params(self):
+        """Get the settings of this index that affect query results, see
+        :meth:`~gensim.interfaces.SimilarityABC._cache_params`."""
+        return super(IvfSimilarity, self)._cache_params() + (self.nprobe, self.rerank)
+
+    def __str__(self):
+        return "%s<%i docs, %i features, %i lists>" % (
+            self.__class__.__name__, len(self), self.num_features, len(self.centroids)
+        )
+
+    def corpus2vectors(self, corpus):
+        """Convert a corpus to a dense matrix of unit-length vectors, one per row.
+
+        Parameters
+        ----------
+        corpus : iterable of {list of (int, number), numpy.ndarray, :class:`scipy.sparse.spmatrix`}
+            Documents.
+
+        Returns
+        -------
+        numpy.ndarray
+            Document vectors.
+
+        """
+        vectors = []
+        for vector in corpus:
+            if isinstance(vector, numpy.ndarray):
+                pass
+            elif scipy.sparse.issparse(vector):
+                vector = vector.toarray().ravel()
+            else:
+                vector = matutils.sparse2full(vector, self.num_features)
+            vectors.append(matutils.unitvec(numpy.asarray(vector, dtype=self.dtype)))
+        return numpy.array(vectors, dtype=self.dtype).reshape(len(vectors), self.num_features)
+
+    @staticmethod
+    def assign(vectors, centroids, chunksize=65536):
+        """Get the list (closest centroid) of each vector."""
+        return numpy.concatenate([numpy.zeros(0, dtype=numpy.int64)] + [
+            numpy.argmax(numpy.dot(vectors[start:start + chunksize], centroids.T), axis=1)
+            for start in xrange(0, len(vectors), chunksize)
+        ]).astype(numpy.int32)
+
+    @classmethod
+    def train_centroids(cls, vectors, nlist, train_size, iterations, seed):
+        """Train the list centroids by spherical k-means on a sample of `vectors`.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            Unit-length document vectors, one per row.
+        nlist : int
+            Number of centroids.
+        train_size : int
+            Number of sampled vectors.
+        iterations : int
+            Number of k-means iterations.
+        seed : int
+            Seed for the sample and for the initial centroids.
+
+        Returns
+        -------
+        numpy.ndarray
+            Unit-length centroids, one per row.
+
+        """
+        random = numpy.random.RandomState(seed)
+        if len(vectors) > train_size:
+            vectors = vectors[numpy.sort(random.choice(len(vectors), train_size, replace=False))]
+        if not len(vectors):
+            return numpy.zeros((1, vectors.shape[1]), dtype=vectors.dtype)
+        nlist = min(nlist, len(vectors))
+        logger.info("training %i list centroids on %i documents", nlist, len(vectors))
+        centroids = vectors[random.choice(len(vectors), nlist, replace=False)].copy()
+        for _ in xrange(iterations):
+            lists = cls.assign(vectors, centroids)
+            members = scipy.sparse.csr_matrix(
+                (numpy.ones(len(lists), dtype=vectors.dtype), (lists, numpy.arange(len(lists)))),
+                shape=(len(centroids), len(vectors))
+            )
+            sums = members.dot(vectors)
+            lengths = numpy.linalg.norm(sums, axis=1)
+            nonempty = lengths > 0  # empty lists keep their old centroid
+            centroids[nonempty] = sums[nonempty] / lengths[nonempty, None]
+        return centroids
+
+    def add_documents(self, corpus):
+        """Extend the index with new documents. The list centroids are not retrained.
+
+        Parameters
+        ----------
+        corpus : iterable of list of (int, number)
+            Corpus in streamed Gensim bag-of-words format, or of dense vectors.
+
+        """
+        self.add_vectors(self.corpus2vectors(corpus))
+
+    def add_vectors(self, vectors):
+        """Add unit-length document vectors to their lists. Used internally.
+
+        The vectors are written to the free rows of their lists. Only if some list is full, the whole index is laid
+        out again, with free rows in every list, so that adding documents takes amortized constant time per document.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            Document vectors, one per row.
+
+        """
+        if not len(vectors):
+            return
+        self.invalidate_cache()
+        self.append_exact(vectors)
+        lists = self.assign(vectors, self.centroids)
+        stored, scales = quantise(vectors, self.storage, self.dtype)
+        docids = numpy.arange(len(self), len(self) + len(vectors))
+        self.num_docs += len(vectors)
+
+        counts = numpy.bincount(lists, minlength=len(self.centroids))
+        arrays = [self.index, self.docids] + ([] if scales is None else [self.index_scales])
+        if (self.list_sizes + counts > numpy.diff(self.list_offsets)).any() or \
+                not all(array.flags.writeable for array in arrays):
+            # lay out all documents again, the new ones at the end of their lists
+            used = numpy.flatnonzero(self.docids >= 0)
+            old_lists = numpy.repeat(numpy.arange(len(self.centroids), dtype=numpy.int32), self.list_sizes)
+            self.layout(
+                numpy.concatenate((self.index[used], stored)),
+                None if scales is None else numpy.concatenate((self.index_scales[used], scales)),
+                numpy.concatenate((old_lists, lists)), numpy.concatenate((self.docids[used], docids))
+            )
+        else:
+            order = numpy.argsort(lists, kind='mergesort')
+            rank = numpy.arange(len(lists)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+            targets = self.list_offsets[lists[order]] + self.list_sizes[lists[order]] + rank
+            self.index[targets] = stored[order]
+            if scales is not None:
+                self.index_scales[targets] = scales[order]
+            self.docids[targets] = docids[order]
+            self.rows = grow(self.rows, len(self))
+            self.rows[docids[order]] = targets
+            self.list_sizes += counts
+        logger.info("added %i documents to %s", len(vectors), self)
+
+    def layout(self, stored, scales, lists, docids):
+        """Store vectors grouped by list, leaving free rows at the end of every list. Used internally.
+
+        Parameters
+        ----------
+        stored : numpy.ndarray
+            Stored (quantised) vectors, one per row.
+        scales : numpy.ndarray
+            Scales of the stored vectors, for `storage='int8'`.
+        lists : numpy.ndarray
+            List of each vector.
+        docids : numpy.ndarray
+            Document position of each vector.
+
+        """
+        sizes = numpy.bincount(lists, minlength=len(self.centroids))
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes + sizes // 4 + 4)))
+        order = numpy.argsort(lists, kind='mergesort')  # every list keeps its documents in the order they came
+        rank = numpy.arange(len(lists)) - numpy.repeat(numpy.cumsum(sizes) - sizes, sizes)
+        targets = numpy.repeat(offsets[:-1], sizes) + rank
+        self.index = numpy.zeros((offsets[-1], self.num_features), dtype=stored.dtype)
+        for start in xrange(0, len(order), COPY_ROWS):
+            self.index[targets[start:start + COPY_ROWS]] = stored[order[start:start + COPY_ROWS]]
+        self.index_scales = None
+        if scales is not None:
+            self.index_scales = numpy.zeros(offsets[-1], dtype=numpy.float32)
+            self.index_scales[targets] = scales[order]
+        self.docids = numpy.full(offsets[-1], -1, dtype=numpy.int64)
+        self.docids[targets] = docids[order]
+        self.rows = numpy.empty(len(self), dtype=numpy.int64)
+        self.rows[docids[order]] = targets
+        self.list_offsets, self.list_sizes = offsets, sizes
+
+    def append_exact(self, vectors):
+        """Write the exact copies of new document vectors to `exact_index`, if re-ranking. Used internally.
+
+        `exact_index` holds the vectors in document order, in a memory-mapped file whose size doubles when full.
+
+        """
+        if self.exact_index is None:
+            return
+        exact_index, end = self.exact_index, len(self) + len(vectors)
+        if len(exact_index) < end or not exact_index.flags.writeable:
+            exact_index = create_memmap((max(end, 2 * len(self)), self.num_features), self.dtype)
+            for start in xrange(0, len(self), COPY_ROWS):
+                stop = min(start + COPY_ROWS, len(self))
+                exact_index[start:stop] = self.exact_index[start:stop]
+        exact_index[len(self):end] = vectors
+        self.exact_index = exact_index
+
+    def save(self, *args, **kwargs):
+        """Save the index.
+
+        The vectors and the document positions are always stored as separate `.npy` files, so that they can be
+        memory-mapped back with `load(fname, mmap='r')`.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the output file.
+
+        See Also
+        --------
+        :meth:`~gensim.utils.SaveLoad.save`
+            Save object to file.
+
+        """
+        if kwargs.get('separately') is None and len(args) < 2:
+            kwargs['separately'] = [
+                attr for attr in ('index', 'index_scales', 'exact_index', 'docids', 'rows')
+                if getattr(self, attr, None) is not None
+            ]
+        # leave out the room for more documents
+        exact_index, rows = self.exact_index, self.rows
+        if exact_index is not None:
+            self.exact_index = exact_index[:len(self)]
+        self.rows = rows[:len(self)]
+        try:
+            super(IvfSimilarity, self).save(*args, **kwargs)
+        finally:
+            self.exact_index, self.rows = exact_index, rows
+
+    def query2vectors(self, query):
+        """Convert a query document or corpus to a dense matrix, one query per row.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, \
+        :class:`scipy.sparse.spmatrix`}
+            Document or corpus.
+
+        Returns
+        -------
+        (numpy.ndarray, bool)
+            The query vectors, and whether `query` was a single document.
+
+        """
+        is_corpus, query = utils.is_corpus(query)
+        if scipy.sparse.issparse(query):
+            query = query.toarray()
+        if isinstance(query, numpy.ndarray):
+            single = query.ndim == 1
+            return numpy.atleast_2d(numpy.asarray(query, dtype=self.dtype)), single
+        if not is_corpus:
+            query = [query]
+        vectors = numpy.asarray([matutils.sparse2full(vec, self.num_features) for vec in query], dtype=self.dtype)
+        return vectors.reshape(len(vectors), self.num_features), not is_corpus
+
+    def list_vectors(self, lst):
+        """Get the (dequantised) vectors of the documents in list `lst`."""
+        return self.stored_vectors(slice(self.list_offsets[lst], self.list_offsets[lst] + self.list_sizes[lst]))
+
+    def stored_vectors(self, rows):
+        """Get the (dequantised) vectors of the given index rows."""
+        return dequantise(self.index[rows], None if self.index_scales is None else self.index_scales[rows], self.dtype)
+
+    def probe(self, queries):
+        """Get the `nprobe` lists to scan for each query.
+
+        Parameters
+        ----------
+        queries : numpy.ndarray
+            Query vectors, one per row.
+
+        Returns
+        -------
+        dict of (int, numpy.ndarray)
+            The queries (row numbers of `queries`) that probe each list.
+
+        """
+        nprobe = min(self.nprobe, len(self.centroids))
+        coarse = numpy.dot(queries, self.centroids.T)
+        if nprobe < len(self.centroids):
+            probes = numpy.argpartition(-coarse, nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            probes = numpy.tile(numpy.arange(len(self.centroids)), (len(queries), 1))
+        qnos = numpy.repeat(numpy.arange(len(queries)), probes.shape[1])
+        probes = probes.ravel()
+        order = numpy.argsort(probes, kind='mergesort')
+        probes, qnos = probes[order], qnos[order]
+        bounds = numpy.flatnonzero(numpy.diff(probes)) + 1
+        return {
+            int(lists[0]): lst_qnos
+            for lists, lst_qnos in zip(numpy.split(probes, bounds), numpy.split(qnos, bounds)) if len(lists)
+        }
+
+    def get_similarities(self, query):
+        """Get similarity between `query` and the documents in the probed lists, 0 for all other documents.
+
+        Warnings
+        --------
+        Do not use this function directly, use the `self[query]` syntax instead.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, \
+        :class:`scipy.sparse.spmatrix`}
+            Document or corpus.
+
+        Returns
+        -------
+        numpy.ndarray
+            Similarity vector, or matrix of shape (number of queries, number of documents).
+
+        """
+        queries, single = self.query2vectors(query)
+        result = numpy.zeros((len(queries), len(self)), dtype=self.dtype)
+        for lst, qnos in self.probe(queries).items():
+            docids = self.docids[self.list_offsets[lst]:self.list_offsets[lst] + self.list_sizes[lst]]
+            result[numpy.ix_(qnos, docids)] = numpy.dot(queries[qnos], self.list_vectors(lst).T)
+        return result[0] if single else result
+
+    def get_best(self, query, topn):
+        """Get the `topn` most similar documents to each query, scanning only the probed lists.
+
+        Warnings
+        --------
+        Do not use this function directly; set `num_best` and use the `self[query]` syntax instead.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, \
+        :class:`scipy.sparse.spmatrix`}
+            Document or corpus.
+        topn : int
+            Number of most similar documents to return.
+
+        Returns
+        -------
+        {list of (int, float), list of list of (int, float)}
+            Most similar documents and their similarities, most similar first, for the query or each query in a corpus.
+
+        """
+        queries, single = self.query2vectors(query)
+        keep = max(topn, self.rerank or 0)
+        candidate_rows = [[] for _ in xrange(len(queries))]
+        candidate_sims = [[] for _ in xrange(len(queries))]
+        for lst, qnos in self.probe(queries).items():
+            sims = numpy.dot(queries[qnos], self.list_vectors(lst).T)
+            if sims.shape[1] > keep:
+                best = numpy.argpartition(-numpy.abs(sims), keep - 1, axis=1)[:, :keep]
+                sims = sims[numpy.arange(len(qnos))[:, None], best]
+            else:
+                best = numpy.tile(numpy.arange(sims.shape[1]), (len(qnos), 1))
+            for qno, rows, row_sims in zip(qnos, best + self.list_offsets[lst], sims):
+                candidate_rows[qno].append(rows)
+                candidate_sims[qno].append(row_sims)
+
+        result = []
+        for qno in xrange(len(queries)):
+            rows = numpy.concatenate([numpy.zeros(0, dtype=numpy.int64)] + candidate_rows[qno])
+            sims = numpy.concatenate([numpy.zeros(0, dtype=self.dtype)] + candidate_sims[qno])
+            if self.rerank and self.exact_index is not None and len(rows):
+                candidates = matutils.argsort(numpy.abs(sims), self.rerank, reverse=True)
+                sims[candidates] = numpy.dot(self.exact_index[self.docids[rows[candidates]]], queries[qno])
+            best = matutils.full2sparse_clipped(sims, topn)
+            result.append([(int(self.docids[rows[pos]]), sim) for pos, sim in best])
+        return result[0] if single else result
+
+    def _query(self, query):
+        """Get similarities of the given document or corpus against this index.
+
+        Same as :meth:`gensim.interfaces.SimilarityABC._query`, except that queries with `num_best` set only
+        score the documents of the probed lists.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number)}
+            Document or corpus.
+
+        Returns
+        -------
+        {numpy.ndarray, list of (int, float), list of list of (int, float)}
+            Similarities of the query against this index.
+
+        """
+        if self.num_best is None:
+            return super(IvfSimilarity, self)._query(query)
+        is_corpus, query = utils.is_corpus(query)
+        if self.normalize and not matutils.ismatrix(query):
+            query = [matutils.unitvec(v) for v in query] if is_corpus else matutils.unitvec(query)
+        return self.get_best(query, self.num_best)
+
+    def __iter__(self):
+        """For each document in the index, in order, compute its similarities to the index.
+
+        Yields
+        ------
+        {numpy.ndarray, list of (int, float)}
+            Similarities of each document in turn against the index.
+
+        """
+        norm, self.normalize = self.normalize, False  # the indexed vectors are normalized already
+        for start in xrange(0, len(self), self.chunksize):
+            rows = self.rows[start:min(start + self.chunksize, len(self))]
+            for sims in self._query(self.stored_vectors(rows)):
+                yield sims
+        self.normalize = norm
@@ -0,0 +1,731 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module contains :class:`~gensim.similarities.minhash.MinHash`, a transformation of documents into MinHash
+signatures, and :class:`~gensim.similarities.minhash.LshSimilarity`, a locality-sensitive hashing (LSH) index
+over these signatures, for finding near-duplicate documents in a large corpus without comparing all pairs.
+
+Documents are treated as sets of feature ids: bag-of-words documents (the weights are ignored), or plain lists of ids,
+such as the output of :meth:`~gensim.corpora.dictionary.Dictionary.doc2idx`. The similarity of two documents is
+their Jaccard similarity, `1 - jaccard_distance(set1, set2)` (see :func:`~gensim.matutils.jaccard_distance`).
+
+
+How it works
+------------
+A MinHash signature holds, for each of `num_perm` random hash functions, the smallest hash of the ids in a
+document. Two documents agree on any single signature entry with probability equal to their Jaccard similarity,
+so the fraction of agreeing entries estimates it. The signatures of a whole batch of documents are computed at once,
+with numpy.
+
+The LSH index cuts the signatures into `num_bands` bands of `rows` entries. Documents that agree on all the entries
+of at least one band become candidates for each other; this happens with probability `1 - (1 - s^rows)^num_bands`
+for documents of similarity `s`, which rises steeply around the `threshold` the bands were chosen for. Candidates are
+scored by their estimated similarity, or by their exact similarity if the index keeps the documents
+(`exact=True`). Each band is a sorted array of hashes, so a batch of queries is looked up with binary searches;
+the documents added later go to new sorted arrays, which are merged with the older ones as they grow, so adding
+documents stays cheap at any index size.
+
+Examples
+--------
+Deduplicating a corpus in a single pass, keeping the first of each group of near-duplicates:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus
+    >>> from gensim.similarities import LshSimilarity
+    >>> from gensim import utils
+    >>>
+    >>> index = LshSimilarity(threshold=0.8, exact=True)
+    >>> unique = []
+    >>> for chunk in utils.grouper(common_corpus + common_corpus, 4):
+    ...     chunk = [doc for doc, duplicates in zip(chunk, index.near_duplicates(chunk)) if not duplicates]
+    ...     unique.extend(chunk)
+    ...     index.add_documents(chunk)
+
+Here the documents of a chunk are only compared with the documents indexed before, not with each other.
+
+"""
+
+from __future__ import division
+
+import itertools
+import logging
+import numbers
+
+import numpy
+from six.moves import xrange
+
+from gensim import interfaces, utils
+
+logger = logging.getLogger(__name__)
+
+HASH_SHIFT = numpy.uint64(33)  # hash functions are of the form ((a * id + b) mod 2**64) >> HASH_SHIFT
+EMPTY = numpy.uint32(0xFFFFFFFF)  # signature entries of empty documents, never produced by the hash functions
+
+
+def is_document(obj):
+    """Check whether `obj` is a single document rather than a corpus.
+
+    Parameters
+    ----------
+    obj : object
+        A document (bag-of-words, or a list or array of ids) or a corpus of documents.
+
+    Returns
+    -------
+    (bool, object)
+        Whether `obj` is a single document, and `obj` itself (a generator is wrapped so that no document is lost).
+
+    """
+    if isinstance(obj, numpy.ndarray):
+        return obj.ndim == 1, obj
+    if hasattr(obj, 'next') or hasattr(obj, '__next__'):
+        try:
+            first = next(obj)
+        except StopIteration:
+            return False, []
+        obj = itertools.chain([first], obj)
+    else:
+        try:
+            first = next(iter(obj))
+        except StopIteration:
+            return True, obj  # an empty document
+    if isinstance(first, (numbers.Integral, numpy.integer)):
+        return True, obj
+    # a bag-of-words entry is an (id, weight) pair, a document is anything else that holds ids
+    return isinstance(first, tuple) and len(first) == 2 and not isinstance(first[0], tuple), obj
+
+
+def document_ids(doc, unique=True):
+    """Get the feature ids of a document.
+
+    Parameters
+    ----------
+    doc : {list of (int, number), list of int, numpy.ndarray}
+        Document in bag-of-words format, or a list of ids.
+    unique : bool, optional
+        Sort the ids and remove repetitions.
+
+    Returns
+    -------
+    numpy.ndarray
+        The ids of the document (those with a non-zero weight, for a bag-of-words document).
+
+    """
+    if isinstance(doc, numpy.ndarray):
+        ids = doc
+    elif len(doc) and isinstance(doc[0], tuple):
+        ids = [termid for termid, weight in doc if weight]
+    else:
+        ids = doc
+    ids = numpy.asarray(ids, dtype=numpy.int64)
+    return numpy.unique(ids) if unique else ids
+
+
+def lsh_params(num_perm, threshold):
+    """Choose the number of bands and of rows per band for a Jaccard similarity `threshold`.
+
+    Parameters
+    ----------
+    num_perm : int
+        Length of the signatures.
+    threshold : float
+        Jaccard similarity at which documents should start becoming candidates.
+
+    Returns
+    -------
+    (int, int)
+        Number of bands and number of rows per band. Documents of similarity `(1 / bands) ** (1 / rows)`
+        (the steepest point of the candidate probability) are about as close as possible to `threshold`.
+
+    """
+    if not 0.0 < threshold < 1.0:
+        raise ValueError("threshold must be between 0 and 1, got %r" % threshold)
+    best = None
+    for rows in xrange(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def append_rows(buf, size, rows):
+    """Append `rows` after the first `size` rows of the array `buf`, reallocating it geometrically.
+
+    Parameters
+    ----------
+    buf : numpy.ndarray
+        Buffer, or None.
+    size : int
+        Number of rows of `buf` in use.
+    rows : numpy.ndarray
+        Rows to append.
+
+    Returns
+    -------
+    numpy.ndarray
+        The buffer holding the `size + len(rows)` rows, which may be `buf` itself.
+
+    """
+    needed = size + len(rows)
+    if buf is None or needed > len(buf):
+        grown = numpy.empty((max(needed, 2 * size), ) + rows.shape[1:], dtype=rows.dtype)
+        if size:
+            grown[:size] = buf[:size]
+        buf = grown
+    buf[size:needed] = rows
+    return buf
+
+
+class MinHash(interfaces.TransformationABC):
+    """Transform documents into MinHash signatures.
+
+    `minhash[doc]` is the signature of a single document, a numpy array of `num_perm` uint32 values;
+    `minhash[corpus]` is a streamed corpus of signatures, computed `chunksize` documents at a time
+    (or a 2D array with one signature per row, if `corpus` is a list).
+
+    Examples
+    --------
+    .. sourcecode:: pycon
+
+        >>> from gensim.test.utils import common_corpus
+        >>> from gensim.similarities.minhash import MinHash
+        >>>
+        >>> minhash = MinHash(num_perm=64)
+        >>> signatures = minhash[common_corpus]
+        >>> similarity = MinHash.estimate(signatures[0], signatures[1])
+
+    """
+    def __init__(self, num_perm=128, seed=0, chunksize=256):
+        """
+
+        Parameters
+        ----------
+        num_perm : int, optional
+            Length of the signatures (number of hash functions). The standard error of the estimated similarity is
+            about `1 / sqrt(num_perm)`.
+        seed : int, optional
+            Seed for the hash functions. Signatures are only comparable if they were computed with the same seed and
+            `num_perm`.
+        chunksize : int, optional
+            Number of documents hashed at once when transforming a streamed corpus.
+
+        """
+        self.num_perm = num_perm
+        self.seed = seed
+        self.chunksize = chunksize
+        random_state = numpy.random.RandomState(seed)
+        # multiply-shift hashing of 32-bit ids: random odd 64-bit multipliers `a` and 64-bit offsets `b`
+        words = random_state.randint(0, 1 << 32, size=(4, num_perm)).astype(numpy.uint64)
+        self.a = (words[0] << numpy.uint64(32)) | words[1] | numpy.uint64(1)
+        self.b = (words[2] << numpy.uint64(32)) | words[3]
+
+    def __str__(self):
+        return "%s<num_perm=%i, seed=%i>" % (self.__class__.__name__, self.num_perm, self.seed)
+
+    def signatures(self, docs, blocksize=16):
+        """Get the signatures of a batch of documents.
+
+        Parameters
+        ----------
+        docs : list of {list of (int, number), list of int, numpy.ndarray}
+            Documents in bag-of-words format, or lists of ids.
+        blocksize : int, optional
+            Number of hash functions evaluated at once, which bounds the size of temporary arrays to
+            `blocksize` times the number of ids in `docs`.
+
+        Returns
+        -------
+        numpy.ndarray
+            One signature (of `num_perm` uint32 values) per row. Empty documents get an all-`EMPTY` signature.
+
+        """
+        ids = [document_ids(doc, unique=False) for doc in docs]
+        lengths = numpy.array([len(doc_ids) for doc_ids in ids], dtype=numpy.int64)
+        result = numpy.full((len(ids), self.num_perm), EMPTY, dtype=numpy.uint32)
+        nonempty = lengths > 0
+        if not nonempty.any():
+            return result
+        # concatenate the ids of all documents, reduceat() then takes the minimum over each document's segment
+        ids = numpy.concatenate(ids).astype(numpy.uint64) & numpy.uint64(0xFFFFFFFF)
+        starts = (numpy.cumsum(lengths) - lengths)[nonempty]
+        for start in xrange(0, self.num_perm, blocksize):
+            hashes = self.a[start: start + blocksize, None] * ids  # wraps around modulo 2**64
+            hashes += self.b[start: start + blocksize, None]
+            hashes >>= HASH_SHIFT
+            result[nonempty, start: start + blocksize] = numpy.minimum.reduceat(hashes, starts, axis=1).T
+        return result
+
+    def __getitem__(self, doc, chunksize=None):
+        """Get the signature of a document, or the signatures of a corpus.
+
+        Parameters
+        ----------
+        doc : {list of (int, number), list of int, iterable of list of (int, number), iterable of list of int}
+            Document (bag-of-words or list of ids) or corpus.
+        chunksize : int, optional
+            Number of documents hashed at once, `self.chunksize` by default.
+
+        Returns
+        -------
+        {numpy.ndarray, :class:`~gensim.interfaces.TransformedCorpus`}
+            Signature of the document, or the signatures of the corpus: a 2D array if `doc` is a list of
+            documents, a streamed corpus otherwise.
+
+        """
+        single, doc = is_document(doc)
+        if single:
+            return self.signatures([doc])[0]
+        if isinstance(doc, (list, tuple)):
+            return self.signatures(doc)
+        return self._apply(doc, chunksize=chunksize or self.chunksize)
+
+    @staticmethod
+    def estimate(signature1, signature2):
+        """Estimate the Jaccard similarity of two documents from their signatures.
+
+        Parameters
+        ----------
+        signature1 : numpy.ndarray
+            Signature of the first document, or a 2D array of signatures.
+        signature2 : numpy.ndarray
+            Signature of the second document, or a 2D array of signatures of the same shape as `signature1`.
+
+        Returns
+        -------
+        {float, numpy.ndarray}
+            Fraction of agreeing signature entries, for each pair of signatures. Empty documents have similarity 0.
+
+        """
+        signature1, signature2 = numpy.asarray(signature1), numpy.asarray(signature2)
+        result = numpy.mean(signature1 == signature2, axis=-1)
+        result = numpy.where((signature1[..., 0] == EMPTY) | (signature2[..., 0] == EMPTY), 0.0, result)
+        return float(result) if result.ndim == 0 else result
+
+
+class LshSimilarity(interfaces.SimilarityABC):
+    """Locality-sensitive hashing index for finding documents of high Jaccard similarity.
+
+    Only the candidates found through the LSH bands get a similarity: full similarity vectors hold the (estimated or
+    exact) Jaccard similarities of the candidates, and 0 for all other documents; with `num_best`, the best
+    candidates are returned without ever building a full vector.
+
+    """
+    def __init__(self, corpus=None, num_perm=128, threshold=0.5, num_bands=None, exact=False, num_best=None,
+                 chunksize=256, seed=0):
+        """
+
+        Parameters
+        ----------
+        corpus : iterable of {list of (int, number), list of int}, optional
+            Documents to index, in bag-of-words format or as lists of ids.
+        num_perm : int, optional
+            Length of the MinHash signatures.
+        threshold : float, optional
+            Jaccard similarity from which documents should be found as candidates, used to choose the bands
+            (see :func:`~gensim.similarities.minhash.lsh_params`) and as the default threshold of
+            :meth:`~gensim.similarities.minhash.LshSimilarity.near_duplicates`.
+        num_bands : int, optional
+            Number of bands, each of `num_perm // num_bands` rows. If None, chosen from `threshold`.
+            More bands find more candidates (fewer false negatives, more false positives).
+        exact : bool, optional
+            Keep the ids of the indexed documents, to score candidates by their exact Jaccard similarity instead of
+            the estimate from the signatures. Costs memory proportional to the size of the corpus.
+        num_best : int, optional
+            If set, return only the `num_best` most similar candidates. Otherwise, return a full vector with one float
+            for every document in the index.
+        chunksize : int, optional
+            Number of documents hashed and looked up at once.
+        seed : int, optional
+            Seed for the MinHash hash functions.
+
+        """
+        self.minhash = MinHash(num_perm=num_perm, seed=seed, chunksize=chunksize)
+        self.num_perm = num_perm
+        self.threshold = threshold
+        if num_bands is None:
+            num_bands, rows = lsh_params(num_perm, threshold)
+        else:
+            rows = num_perm // num_bands
+            if not rows:
+                raise ValueError("num_bands must not exceed num_perm (%i), got %i" % (num_perm, num_bands))
+        self.num_bands, self.rows = num_bands, rows
+        self.exact = exact
+        self.num_best = num_best
+        self.normalize = False  # documents are sets of ids, weights are ignored
+        self.chunksize = chunksize
+
+        self.num_docs = 0
+        self.signatures = None  # one signature per row, a buffer that grows geometrically
+        self.ids, self.num_ids = None, 0  # ids of all documents, concatenated (with exact=True)
+        self.id_offsets = numpy.zeros(1, dtype=numpy.int64)  # start of the ids of each document in `ids`
+        self.runs = []  # (sorted band hashes, document numbers), each array of shape (num_bands, run length)
+
+        if corpus is not None:
+            self.add_documents(corpus)
+
+    def __len__(self):
+        return self.num_docs
+
+    def __str__(self):
+        return "%s<%i docs, %i bands of %i rows, exact=%s>" % (
+            self.__class__.__name__, len(self), self.num_bands, self.rows, self.exact
+        )
+
+    def band_hashes(self, signatures):
+        """Hash each band of `signatures` into a single 64-bit value.
+
+        Parameters
+        ----------
+        signatures : numpy.ndarray
+            One signature per row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Band hashes, of shape (`num_bands`, number of signatures).
+
+        """
+        signatures = signatures[:, :self.num_bands * self.rows].astype(numpy.uint64)
+        bands = signatures.reshape(len(signatures), self.num_bands, self.rows)
+        result = numpy.zeros((len(signatures), self.num_bands), dtype=numpy.uint64)
+        with numpy.errstate(over='ignore'):
+            for row in xrange(self.rows):
+                # polynomial rolling hash, wrapping around modulo 2**64
+                result = result * numpy.uint64(0x9E3779B97F4A7C15) + bands[:, :, row]
+        return result.T
+
+    def add_documents(self, corpus):
+        """Extend the index with new documents.
+
+        Parameters
+        ----------
+        corpus : iterable of {list of (int, number), list of int}
+            Documents in bag-of-words format, or lists of ids.
+
+        """
+        self.invalidate_cache()
+        for chunk in utils.grouper(corpus, self.chunksize):
+            ids = [document_ids(doc) for doc in chunk] if self.exact else None
+            self.add_signatures(self.minhash.signatures(chunk), ids)
+        logger.info("%s", self)
+
+    def add_signatures(self, signatures, ids=None):
+        """Extend the index with the documents of precomputed `signatures`.
+
+        Parameters
+        ----------
+        signatures : numpy.ndarray
+            One signature per row, computed by a :class:`~gensim.similarities.minhash.MinHash` with the same
+            `num_perm` and `seed`.
+        ids : list of numpy.ndarray, optional
+            Sorted unique ids of each document, required if the index is `exact`.
+
+        """
+        if signatures.ndim != 2 or signatures.shape[1] != self.num_perm:
+            raise ValueError("expected signatures of length %i, got shape %s" % (self.num_perm, signatures.shape))
+        if self.exact:
+            if ids is None or len(ids) != len(signatures):
+                raise ValueError("an exact index needs the ids of each document")
+            lengths = numpy.array([len(doc_ids) for doc_ids in ids], dtype=numpy.int64)
+            offsets = self.num_ids + numpy.cumsum(lengths)
+            self.id_offsets = append_rows(self.id_offsets, self.num_docs + 1, offsets)
+            if lengths.sum():
+                self.ids = append_rows(self.ids, self.num_ids, numpy.concatenate(ids).astype(numpy.int64))
+                self.num_ids = int(offsets[-1])
+        docnos = numpy.arange(self.num_docs, self.num_docs + len(signatures), dtype=numpy.int64)
+        self.signatures = append_rows(self.signatures, self.num_docs, signatures.astype(numpy.uint32))
+        self.num_docs += len(signatures)
+
+        nonempty = signatures[:, 0] != EMPTY  # empty documents are never candidates
+        if not nonempty.any():
+            return
+        hashes = self.band_hashes(signatures[nonempty])
+        docnos = numpy.tile(docnos[nonempty], (self.num_bands, 1))
+        bands = numpy.arange(self.num_bands)[:, None]
+        order = numpy.argsort(hashes, axis=1, kind='mergesort')
+        self.runs.append((hashes[bands, order], docnos[bands, order]))
+        # merge the newest runs while they are of similar size, so that there are O(log N) runs at any time
+        # and every document gets merged O(log N) times overall
+        while len(self.runs) > 1 and self.runs[-2][0].shape[1] <= 2 * self.runs[-1][0].shape[1]:
+            (hashes1, docnos1), (hashes2, docnos2) = self.runs[-2:]
+            hashes, docnos = numpy.hstack([hashes1, hashes2]), numpy.hstack([docnos1, docnos2])
+            order = numpy.argsort(hashes, axis=1, kind='mergesort')  # merges the two sorted halves
+            self.runs[-2:] = [(hashes[bands, order], docnos[bands, order])]
+
+    def query2signatures(self, query):
+        """Get the signatures (and ids, for an exact index) of the query documents.
+
+        Parameters
+        ----------
+        query : {list of (int, number), list of int, list of documents, numpy.ndarray}
+            Document or corpus, or precomputed signatures (a uint32 array with one signature per row).
+
+        Returns
+        -------
+        (bool, numpy.ndarray, list of numpy.ndarray)
+            Whether `query` is a single document, the signatures (one per row) and the ids of each document
+            (None if the index is not exact).
+
+        """
+        if isinstance(query, numpy.ndarray) and query.dtype == numpy.uint32 and query.shape[-1] == self.num_perm:
+            if self.exact:
+                raise ValueError("an exact index cannot be queried by signatures, query by documents instead")
+            return query.ndim == 1, numpy.atleast_2d(query), None
+        single, query = is_document(query)
+        docs = [query] if single else list(query)
+        ids = [document_ids(doc) for doc in docs] if self.exact else None
+        return single, self.minhash.signatures(docs), ids
+
+    def candidates(self, query):
+        """Get the documents that share at least one LSH band with the query.
+
+        Parameters
+        ----------
+        query : {list of (int, number), list of int, list of documents, numpy.ndarray}
+            Document or corpus, or precomputed signatures.
+
+        Returns
+        -------
+        {numpy.ndarray, list of numpy.ndarray}
+            Sorted document numbers of the candidates of the query document, or of each document in the corpus.
+
+        """
+        single, signatures, _ = self.query2signatures(query)
+        queries, docnos = self.candidate_pairs(signatures)
+        bounds = numpy.searchsorted(queries, numpy.arange(len(signatures) + 1))
+        result = [docnos[start: end] for start, end in zip(bounds[:-1], bounds[1:])]
+        return result[0] if single else result
+
+    def candidate_pairs(self, signatures):
+        """Look up the candidates of a batch of query signatures in the LSH bands.
+
+        Parameters
+        ----------
+        signatures : numpy.ndarray
+            One signature per row.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            Query numbers (rows of `signatures`) and document numbers of all (query, candidate) pairs,
+            sorted and without repetitions.
+
+        """
+        hashes = self.band_hashes(signatures)
+        nonempty = signatures[:, 0] != EMPTY
+        pairs = []
+        for run_hashes, run_docnos in self.runs:
+            for band in xrange(self.num_bands):
+                start = numpy.searchsorted(run_hashes[band], hashes[band], side='left')
+                counts = numpy.searchsorted(run_hashes[band], hashes[band], side='right') - start
+                counts[~nonempty] = 0
+                total = counts.sum()
+                if not total:
+                    continue
+                # positions start[q], ..., start[q] + counts[q] - 1 of the band, for each query q
+                queries = numpy.repeat(numpy.arange(len(signatures), dtype=numpy.int64), counts)
+                positions = numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts - start, counts)
+                pairs.append(queries * self.num_docs + run_docnos[band][positions])
+        if not pairs:
+            return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+        pairs = numpy.unique(numpy.concatenate(pairs))
+        return pairs // self.num_docs, pairs % self.num_docs
+
+    def document_ids(self, docno):
+        """Get the sorted unique ids of an indexed document, if the index is `exact`.
+
+        Parameters
+        ----------
+        docno : int
+            Document number.
+
+        Returns
+        -------
+        numpy.ndarray
+            Ids of the document.
+
+        """
+        if not self.exact:
+            raise ValueError("only an exact index keeps the ids of its documents")
+        return self.ids[self.id_offsets[docno]: self.id_offsets[docno + 1]]
+
+    def score_pairs(self, signatures, ids, queries, docnos, blocksize=4096):
+        """Get the Jaccard similarities of (query, document) pairs.
+
+        Parameters
+        ----------
+        signatures : numpy.ndarray
+            Query signatures, one per row.
+        ids : list of numpy.ndarray
+            Ids of each query document, for exact similarities, or None to estimate them from the signatures.
+        queries : numpy.ndarray
+            Query number of each pair.
+        docnos : numpy.ndarray
+            Document number of each pair.
+        blocksize : int, optional
+            Number of pairs whose signatures are compared at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            Similarity of each pair.
+
+        """
+        result = numpy.empty(len(queries), dtype=numpy.float32)
+        if ids is not None:
+            for pos, (query, docno) in enumerate(zip(queries, docnos)):
+                query_ids, doc_ids = ids[query], self.document_ids(docno)
+                common = len(numpy.intersect1d(query_ids, doc_ids, assume_unique=True))
+                result[pos] = common / (len(query_ids) + len(doc_ids) - common)
+            return result
+        for start in xrange(0, len(queries), blocksize):
+            end = start + blocksize
+            result[start: end] = MinHash.estimate(signatures[queries[start: end]], self.signatures[docnos[start: end]])
+        return result
+
+    def search(self, signatures, ids=None):
+        """Find and score the candidates of a batch of queries.
+
+        Parameters
+        ----------
+        signatures : numpy.ndarray
+            Query signatures, one per row.
+        ids : list of numpy.ndarray, optional
+            Ids of each query document, required if the index is `exact`.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            Query number, document number and similarity of each (query, candidate) pair.
+
+        """
+        queries, docnos = self.candidate_pairs(signatures)
+        return queries, docnos, self.score_pairs(signatures, ids, queries, docnos)
+
+    def get_similarities(self, query):
+        """Get the similarities of the candidates of the query document(s), 0 for all other documents.
+
+        **Do not use this function directly; use the `self[query]` syntax instead.**
+
+        Parameters
+        ----------
+        query : {list of (int, number), list of int, list of documents, numpy.ndarray}
+            Document or corpus, or precomputed signatures.
+
+        Returns
+        -------
+        numpy.ndarray
+            Similarity vector for a single document, or matrix for a corpus.
+
+        """
+        single, signatures, ids = self.query2signatures(query)
+        queries, docnos, sims = self.search(signatures, ids)
+        result = numpy.zeros((len(signatures), len(self)), dtype=numpy.float32)
+        result[queries, docnos] = sims
+        return result[0] if single else result
+
+    def best(self, queries, docnos, sims, num_queries, topn):
+        """Group scored pairs by query, keeping the `topn` most similar candidates of each query.
+
+        Parameters
+        ----------
+        queries : numpy.ndarray
+            Query number of each pair, sorted.
+        docnos : numpy.ndarray
+            Document number of each pair.
+        sims : numpy.ndarray
+            Similarity of each pair.
+        num_queries : int
+            Number of queries.
+        topn : int
+            Number of candidates to keep per query, all if None.
+
+        Returns
+        -------
+        list of list of (int, float)
+            The best candidates of each query, most similar first, leaving out those of similarity 0.
+
+        """
+        bounds = numpy.searchsorted(queries, numpy.arange(num_queries + 1))
+        result = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            order = numpy.lexsort((docnos[start: end], -sims[start: end]))[:topn]
+            result.append([
+                (int(docno), float(sim)) for docno, sim in zip(docnos[start: end][order], sims[start: end][order])
+                if sim > 0
+            ])
+        return result
+
+    def near_duplicates(self, query, threshold=None):
+        """Get the indexed documents whose similarity to the query document(s) reaches `threshold`.
+
+        Parameters
+        ----------
+        query : {list of (int, number), list of int, list of documents, numpy.ndarray}
+            Document or corpus, or precomputed signatures.
+        threshold : float, optional
+            Minimum (estimated or exact) Jaccard similarity, `self.threshold` by default.
+
+        Returns
+        -------
+        {list of (int, float), list of list of (int, float)}
+            Near-duplicates of the query document, or of each document in the corpus, most similar first.
+
+        """
+        threshold = self.threshold if threshold is None else threshold
+        single, signatures, ids = self.query2signatures(query)
+        queries, docnos, sims = self.search(signatures, ids)
+        keep = sims >= threshold
+        result = self.best(queries[keep], docnos[keep], sims[keep], len(signatures), None)
+        return result[0] if single else result
+
+    def _query(self, query):
+        if self.num_best is None:
+            return super(LshSimilarity, self)._query(query)
+        single, signatures, ids = self.query2signatures(query)
+        queries, docnos, sims = self.search(signatures, ids)
+        result = self.best(queries, docnos, sims, len(signatures), self.num_best)
+        return result[0] if single else result
+
+    def __iter__(self):
+        """Iterate over the indexed documents, yielding the similarities of each to the index.
+
+        Yields
+        ------
+        {numpy.ndarray, list of (int, float)}
+            Similarities of the document to the candidates among the indexed documents, including itself.
+
+        """
+        for start in xrange(0, len(self), self.chunksize):
+            end = min(len(self), start + self.chunksize)
+            signatures = self.signatures[start: end]
+            ids = [self.document_ids(docno) for docno in xrange(start, end)] if self.exact else None
+            queries, docnos, sims = self.search(signatures, ids)
+            if self.num_best is not None:
+                for sim in self.best(queries, docnos, sims, end - start, self.num_best):
+                    yield sim
+            else:
+                result = numpy.zeros((end - start, len(self)), dtype=numpy.float32)
+                result[queries, docnos] = sims
+                for sim in result:
+                    yield sim
+
+    def save(self, *args, **kwargs):
+        """Save the index, see :meth:`~gensim.utils.SaveLoad.save`.
+
+        The spare capacity of the growing buffers is left out, the arrays are saved at their actual size.
+
+        """
+        if self.signatures is not None:
+            self.signatures = self.signatures[:self.num_docs]
+        self.id_offsets = self.id_offsets[:self.num_docs + 1]
+        if self.ids is not None:
+            self.ids = self.ids[:self.num_ids]
+        super(LshSimilarity, self).save(*args, **kwargs)
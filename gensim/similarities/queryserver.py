@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module contains an asyncio-based query server for similarity indexes, such as
+:class:`~gensim.similarities.docsim.MatrixSimilarity` or :class:`~gensim.similarities.docsim.Similarity`.
+
+
+How it works
+------------
+Queries submitted concurrently (by different clients, or by a single client that doesn't wait for its answers)
+are gathered into micro-batches: a batch is closed as soon as it holds `max_batch_size` queries or its first query
+has waited for `max_delay` seconds, whichever comes first. The whole batch is then evaluated as a single corpus
+query, i.e. a single matrix-matrix product instead of one matrix-vector product per query, which makes much better
+use of BLAS. The results are fanned back out to the individual queries.
+
+Batches are evaluated one at a time, in a background thread, so that the event loop keeps accepting (and batching)
+new queries while the previous batch is being computed. If a batch fails, its queries are evaluated again one by one,
+so that only the queries that fail on their own get an error.
+
+The server speaks newline-delimited JSON over TCP or a Unix domain socket. Each request is a JSON object on its own
+line, either `{"id": 1, "query": [[term_id, weight], ...]}`, answered by `{"id": 1, "result": ...}`, or
+`{"id": 2, "stats": true}`, answered by `{"id": 2, "stats": {...}}` with the batch size and latency statistics
+of :meth:`~gensim.similarities.queryserver.BatchingQueryServer.stats`. Answers to the queries of one connection
+may arrive out of order; use `id` to match them to their requests.
+
+This module requires Python 3.
+
+Examples
+--------
+.. sourcecode:: pycon
+
+    >>> import asyncio
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.similarities import MatrixSimilarity
+    >>> from gensim.similarities.queryserver import BatchingQueryServer
+    >>>
+    >>> index = MatrixSimilarity(common_corpus, num_features=len(common_dictionary), num_best=3)
+    >>> loop = asyncio.new_event_loop()
+    >>> server = BatchingQueryServer(index, max_batch_size=16, max_delay=0.002, loop=loop)
+    >>>
+    >>> # answer queries from within the event loop...
+    >>> futures = [server.submit(document) for document in common_corpus]
+    >>> results = loop.run_until_complete(asyncio.gather(*futures))
+    >>>
+    >>> # ...or from clients connecting over TCP, until loop.run_forever() is interrupted
+    >>> listener = loop.run_until_complete(server.serve('127.0.0.1', 0))
+    >>> listener.close()
+    >>> server.close()
+
+"""
+
+from __future__ import division
+
+import json
+import logging
+import time
+from collections import deque
+from functools import partial
+
+try:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    raise ImportError("The query server requires asyncio, which is only available in Python 3")
+
+import numpy
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingQueryServer(object):
+    """Answer queries against a similarity index in micro-batches."""
+
+    def __init__(self, index, max_batch_size=64, max_delay=0.002, loop=None, stats_window=10000):
+        """
+
+        Parameters
+        ----------
+        index : :class:`~gensim.interfaces.SimilarityABC`
+            Index to query.
+        max_batch_size : int, optional
+            Maximum number of queries evaluated together.
+        max_delay : float, optional
+            Maximum time (in seconds) a query waits for other queries to fill its batch.
+        loop : :class:`asyncio.AbstractEventLoop`, optional
+            Event loop of the server. If None, use the current event loop.
+        stats_window : int, optional
+            Number of most recent queries and batches the statistics are computed from.
+
+        """
+        self.index = index
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.loop = loop if loop is not None else asyncio.get_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=1)  # one batch at a time, the index isn't thread-safe
+        self.pending = []  # (query, future, submission time) of the batch being gathered
+        self.timer = None
+        self.num_queries = 0
+        self.num_batches = 0
+        self.latencies = deque(maxlen=stats_window)
+        self.batch_sizes = deque(maxlen=stats_window)
+
+    def submit(self, query):
+        """Submit a query for the next batch.
+
+        Parameters
+        ----------
+        query : list of (int, number)
+            Document in bag-of-words format.
+
+        Returns
+        -------
+        :class:`asyncio.Future`
+            Future result of the query, the same as `index[query]`.
+
+        """
+        future = self.loop.create_future()
+        self.pending.append((query, future, time.time()))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = self.loop.call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        """Close the batch being gathered and start evaluating it."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        logger.debug("evaluating a batch of %i queries", len(batch))
+        queries = [query for query, _, _ in batch]
+        computation = self.loop.run_in_executor(self.executor, self.index.__getitem__, queries)
+        computation.add_done_callback(partial(self._fan_out, batch))
+
+    def _fan_out(self, batch, computation):
+        """Hand the results of a batch over to the futures of its queries."""
+        now = time.time()
+        self.num_batches += 1
+        self.num_queries += len(batch)
+        self.batch_sizes.append(len(batch))
+        try:
+            results = computation.result()
+        except Exception as err:
+            if len(batch) == 1:
+                self._fan_out_each(batch, [(None, err)], now)
+                return
+            # don't fail the whole batch because of a single bad query: find it by evaluating the queries one by one
+            logger.warning("failed to evaluate a batch of %i queries (%s), evaluating them separately", len(batch), err)
+            queries = [query for query, _, _ in batch]
+            computation = self.loop.run_in_executor(self.executor, self._evaluate_each, queries)
+            computation.add_done_callback(partial(self._fan_out_separately, batch))
+            return
+        self._fan_out_each(batch, [(result, None) for result in results], now)
+
+    def _fan_out_separately(self, batch, computation):
+        """Hand the results of the queries of a failed batch, evaluated one by one, over to their futures."""
+        try:
+            outcomes = computation.result()
+        except Exception as err:
+            outcomes = [(None, err)] * len(batch)
+        self._fan_out_each(batch, outcomes)
+
+    def _evaluate_each(self, queries):
+        """Evaluate the queries of a failed batch one at a time, in the background thread.
+
+        Returns
+        -------
+        list of (object, Exception)
+            Result of each query, or the exception it raised.
+
+        """
+        outcomes = []
+        for query in queries:
+            try:
+                outcomes.append((self.index[query], None))
+            except Exception as err:
+                logger.error("failed to evaluate query %s: %s", query, err)
+                outcomes.append((None, err))
+        return outcomes
+
+    def _fan_out_each(self, batch, outcomes, now=None):
+        """Hand the (result, exception) outcome of each query of a batch over to its future."""
+        if now is None:
+            now = time.time()
+        for (_, future, submitted), (result, err) in zip(batch, outcomes):
+            self.latencies.append(now - submitted)
+            if future.done():
+                continue
+            if err is not None:
+                future.set_exception(err)
+            else:
+                future.set_result(result)
+
+    def stats(self):
+        """Get statistics of the recent batches and queries.
+
+        Returns
+        -------
+        dict
+            Total number of `queries` and `batches` answered so far, number of `pending` queries, mean and maximum
+            size of the recent batches (`batch_size_mean`, `batch_size_max`) and the mean, median and 99th
+            percentile of the recent query latencies in seconds (`latency_mean`, `latency_p50`, `latency_p99`).
+
+        """
+        result = {'queries': self.num_queries, 'batches': self.num_batches, 'pending': len(self.pending)}
+        if self.batch_sizes:
+            result['batch_size_mean'] = float(numpy.mean(self.batch_sizes))
+            result['batch_size_max'] = int(numpy.max(self.batch_sizes))
+        if self.latencies:
+            latencies = numpy.asarray(self.latencies)
+            result['latency_mean'] = float(latencies.mean())
+            result['latency_p50'], result['latency_p99'] = [float(p) for p in numpy.percentile(latencies, [50, 99])]
+        return result
+
+    def serve(self, host='127.0.0.1', port=0):
+        """Get a coroutine that starts serving queries over TCP.
+
+        Parameters
+        ----------
+        host : str, optional
+            Address to listen on.
+        port : int, optional
+            Port to listen on, 0 picks a free one.
+
+        Returns
+        -------
+        coroutine
+            Coroutine returning the :class:`asyncio.Server`, to be run in the event loop of this server.
+
+        """
+        return self.loop.create_server(partial(QueryProtocol, self), host, port)
+
+    def serve_unix(self, path):
+        """Get a coroutine that starts serving queries over a Unix domain socket.
+
+        Parameters
+        ----------
+        path : str
+            Path of the socket.
+
+        Returns
+        -------
+        coroutine
+            Coroutine returning the :class:`asyncio.Server`, to be run in the event loop of this server.
+
+        """
+        return self.loop.create_unix_server(partial(QueryProtocol, self), path)
+
+    def close(self):
+        """Stop the background thread. Queries that are still pending are never answered."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.executor.shutdown(wait=True)
+
+
+def _to_json(result):
+    """Convert a query result (full similarity vector or `num_best` pairs) to plain Python types."""
+    if isinstance(result, numpy.ndarray):
+        return result.tolist()
+    return [[int(docno), float(sim)] for docno, sim in result]
+
+
+class QueryProtocol(asyncio.Protocol):
+    """Newline-delimited JSON protocol of :class:`~gensim.similarities.queryserver.BatchingQueryServer`."""
+
+    def __init__(self, server):
+        """
+
+        Parameters
+        ----------
+        server : :class:`~gensim.similarities.queryserver.BatchingQueryServer`
+            Server answering the queries.
+
+        """
+        self.server = server
+        self.transport = None
+        self.buffer = b''
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        while b'\n' in self.buffer:
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            if line.strip():
+                self.handle(line)
+
+    def handle(self, line):
+        """Handle a single request.
+
+        Parameters
+        ----------
+        line : bytes
+            JSON-encoded request.
+
+        """
+        request_id = None
+        try:
+            request = json.loads(line.decode('utf8'))
+            request_id = request.get('id')
+            if request.get('stats'):
+                self.respond({'id': request_id, 'stats': self.server.stats()})
+                return
+            query = [(int(termid), float(weight)) for termid, weight in request['query']]
+            num_features = getattr(self.server.index, 'num_features', None)
+            for termid, _ in query:
+                if termid < 0 or num_features is not None and termid >= num_features:
+                    raise ValueError("term id %i out of range [0, %s)" % (termid, num_features))
+        except (ValueError, KeyError, TypeError, AttributeError) as err:
+            self.respond({'id': request_id, 'error': 'invalid request: %s' % err})
+            return
+        self.server.submit(query).add_done_callback(partial(self.reply, request_id))
+
+    def reply(self, request_id, future):
+        """Send the result of a query back to the client."""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.respond({'id': request_id, 'error': str(future.exception())})
+        else:
+            self.respond({'id': request_id, 'result': _to_json(future.result())})
+
+    def respond(self, message):
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(json.dumps(message).encode('utf8') + b'\n')
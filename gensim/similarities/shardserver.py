@@ -0,0 +1,650 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Intro
+-----
+This module distributes a similarity index over several long-running worker processes, possibly on different hosts,
+and answers queries against all of them in scatter-gather fashion.
+
+Each worker (:class:`~gensim.similarities.shardserver.ShardWorker`) hosts one index, such as a
+:class:`~gensim.similarities.docsim.Similarity` or :class:`~gensim.similarities.docsim.MatrixSimilarity` built over
+one slice of the corpus. The coordinator (:class:`~gensim.similarities.shardserver.ShardCoordinator`) keeps one
+connection open to every worker, broadcasts each batch of queries to all of them at once, and merges their answers.
+With `num_best` set, every worker only returns its own `num_best` best documents, so that the coordinator merges
+`num_best` x number of workers candidates per query instead of receiving full similarity vectors.
+Document ids are global: the documents of the first worker come first, followed by those of the second one, and so on.
+
+
+How it works
+------------
+Workers and the coordinator talk over TCP. Every message consists of a 8-byte frame header (the magic `b'GSIM'` and the
+length of a JSON header, as big-endian uint32), the JSON header, and then the raw bytes of the NumPy arrays listed in
+the JSON header (`"arrays": [{"dtype": "<f4", "shape": [2, 3]}, ...]`). Arrays are sent straight from their memory
+and received straight into preallocated arrays, without any (de)serialization. Query batches travel as the three
+arrays of a :class:`scipy.sparse.csr_matrix`.
+
+Examples
+--------
+Start a worker for each saved index, on the same or different hosts:
+
+.. sourcecode:: bash
+
+    python -m gensim.similarities.shardserver --index /data/shard0.index --port 9000
+    python -m gensim.similarities.shardserver --index /data/shard1.index --port 9001
+
+and query them all from a coordinator:
+
+.. sourcecode:: pycon
+
+    >>> from gensim.test.utils import common_corpus, common_dictionary
+    >>> from gensim.similarities import MatrixSimilarity
+    >>> from gensim.similarities.shardserver import ShardCoordinator, ShardWorker
+    >>>
+    >>> # workers can also run in background threads of the current process
+    >>> workers = [
+    ...     ShardWorker(MatrixSimilarity(common_corpus[:5], num_features=len(common_dictionary))).start(),
+    ...     ShardWorker(MatrixSimilarity(common_corpus[5:], num_features=len(common_dictionary))).start(),
+    ... ]
+    >>> index = ShardCoordinator([worker.address for worker in workers], num_best=3)
+    >>> sims = index[common_corpus[0]]  # top 3 of all documents, over both workers
+    >>> index.close()
+    >>> for worker in workers:
+    ...     worker.close()
+
+"""
+
+import json
+import logging
+import multiprocessing
+import socket
+import struct
+import sys
+import threading
+
+import numpy
+import scipy.sparse
+
+from gensim import interfaces, matutils, utils
+from gensim.similarities.docsim import block_vectors, index_blocks
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'GSIM'
+FRAME = struct.Struct('!4sI')  # magic, length of the JSON header
+
+
+def _recv_into(sock, buf):
+    """Fill the writable buffer `buf` from `sock`, raising EOFError if the connection closes first."""
+    view = memoryview(buf)
+    while len(view):
+        received = sock.recv_into(view)
+        if not received:
+            raise EOFError("connection closed")
+        view = view[received:]
+
+
+def _bytes(array):
+    """Get a flat byte view of the contiguous `array`, without copying it."""
+    return memoryview(array.reshape(-1).view(numpy.uint8))
+
+
+def send_message(sock, header, arrays=()):
+    """Send a message: a JSON header followed by the raw data of NumPy arrays.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+    header : dict
+        JSON-serializable message header.
+    arrays : sequence of numpy.ndarray, optional
+        Arrays to send after the header, in order.
+
+    """
+    arrays = [numpy.ascontiguousarray(array) for array in arrays]
+    header = dict(header, arrays=[{'dtype': array.dtype.str, 'shape': list(array.shape)} for array in arrays])
+    payload = json.dumps(header).encode('utf8')
+    sock.sendall(FRAME.pack(MAGIC, len(payload)) + payload)
+    for array in arrays:
+        if array.size:
+            sock.sendall(_bytes(array))
+
+
+def recv_message(sock):
+    """Receive a message sent by :func:`~gensim.similarities.shardserver.send_message`.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Connected socket.
+
+    Returns
+    -------
+    (dict, list of numpy.ndarray)
+        Message header and arrays.
+
+    Raises
+    ------
+    EOFError
+        If the connection was closed.
+    ValueError
+        If the data received is not a message.
+
+    """
+    frame = bytearray(FRAME.size)
+    _recv_into(sock, frame)
+    magic, length = FRAME.unpack(bytes(frame))
+    if magic != MAGIC:
+        raise ValueError("not a shard server message: %r" % (magic, ))
+    payload = bytearray(length)
+    _recv_into(sock, payload)
+    header = json.loads(payload.decode('utf8'))
+    arrays = []
+    for spec in header.pop('arrays'):
+        array = numpy.empty(spec['shape'], dtype=numpy.dtype(str(spec['dtype'])))
+        if array.size:
+            _recv_into(sock, _bytes(array))
+        arrays.append(array)
+    return header, arrays
+
+
+def _connected(sock):
+    """Switch Nagle's algorithm off, messages are sent as a whole already."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def top_similarities(sims, topn):
+    """Get the `topn` largest similarities (by absolute value) of each row of `sims`, in decreasing order.
+
+    Parameters
+    ----------
+    sims : numpy.ndarray
+        Similarity matrix, one query per row.
+    topn : int
+        Number of similarities to keep per row.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Column ids and similarities, both of shape (number of rows, min(`topn`, number of columns)).
+
+    """
+    topn = min(topn, sims.shape[1])
+    magnitudes = -numpy.abs(sims)
+    if 0 < topn < sims.shape[1]:
+        ids = numpy.argpartition(magnitudes, topn - 1, axis=1)[:, :topn]
+    else:
+        ids = numpy.tile(numpy.arange(topn), (len(sims), 1))
+    rows = numpy.arange(len(sims))[:, None]
+    ids = ids[rows, numpy.argsort(magnitudes[rows, ids], axis=1, kind='mergesort')]
+    return ids, sims[rows, ids]
+
+
+def best_arrays(results, topn):
+    """Convert the `num_best` results of a corpus query to arrays of fixed width.
+
+    Parameters
+    ----------
+    results : {list of list of (int, float), :class:`scipy.sparse.csr_matrix`}
+        Most similar documents of each query, as returned by an index with `num_best` set.
+    topn : int
+        Width of the arrays. Rows with fewer results are padded with similarity 0.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        Document ids (int64) and similarities (float32), both of shape (number of queries, `topn`).
+
+    """
+    if scipy.sparse.issparse(results):  # indexes that maintain sparsity return a sparse matrix
+        results = [list(zip(row.indices, row.data)) for row in results]
+    ids = numpy.zeros((len(results), topn), dtype=numpy.int64)
+    sims = numpy.zeros((len(results), topn), dtype=numpy.float32)
+    for row, best in enumerate(results):
+        best = best[:topn]
+        if best:
+            ids[row, :len(best)], sims[row, :len(best)] = zip(*best)
+    return ids, sims
+
+
+class ShardWorker(object):
+    """Host a similarity index and answer query batches sent by a
+    :class:`~gensim.similarities.shardserver.ShardCoordinator`."""
+
+    def __init__(self, index, host='127.0.0.1', port=0):
+        """
+
+        Parameters
+        ----------
+        index : :class:`~gensim.interfaces.SimilarityABC`
+            Index to serve. Its `num_best` is ignored, the coordinator asks for the number of results it needs.
+        host : str, optional
+            Address to listen on.
+        port : int, optional
+            Port to listen on, 0 picks a free one.
+
+        """
+        self.index = index
+        self.lock = threading.Lock()  # one query batch against the index at a time
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen(16)
+        self.listener.settimeout(0.2)  # check for close() regularly
+        self.address = self.listener.getsockname()[:2]
+        self.closed = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Serve in a background (daemon) thread.
+
+        Returns
+        -------
+        :class:`~gensim.similarities.shardserver.ShardWorker`
+            This worker.
+
+        """
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        """Accept connections until :meth:`~gensim.similarities.shardserver.ShardWorker.close` is called,
+        serving each connection in its own thread."""
+        logger.info("serving %s on %s:%i", self.index, self.address[0], self.address[1])
+        while not self.closed.is_set():
+            try:
+                conn, _ = self.listener.accept()
+            except socket.timeout:
+                continue
+            except (socket.error, OSError):
+                if self.closed.is_set():
+                    break
+                raise
+            conn.settimeout(None)
+            thread = threading.Thread(target=self.handle, args=(_connected(conn), ))
+            thread.daemon = True
+            thread.start()
+        self.listener.close()
+
+    def handle(self, conn):
+        """Answer the requests received on the connection `conn` until it is closed."""
+        try:
+            while True:
+                try:
+                    header, arrays = recv_message(conn)
+                except EOFError:
+                    break
+                try:
+                    reply, arrays = self.answer(header, arrays)
+                except Exception as err:
+                    logger.exception("failed to answer %s request", header.get('op'))
+                    reply, arrays = {'error': "%s: %s" % (err.__class__.__name__, err)}, ()
+                send_message(conn, reply, arrays)
+                if header.get('op') == 'shutdown':
+                    self.close()
+                    break
+        except (socket.error, OSError) as err:
+            logger.warning("dropping connection: %s", err)
+        finally:
+            conn.close()
+
+    def answer(self, header, arrays):
+        """Answer a single request.
+
+        Parameters
+        ----------
+        header : dict
+            Request header, with the operation in `op`.
+        arrays : list of numpy.ndarray
+            Request arrays.
+
+        Returns
+        -------
+        (dict, list of numpy.ndarray)
+            Reply header and arrays.
+
+        """
+        op = header.get('op')
+        if op == 'info':
+            return {'num_docs': len(self.index), 'num_features': getattr(self.index, 'num_features', None)}, ()
+        if op == 'shutdown':
+            return {}, ()
+        if op == 'vectors':
+            with self.lock:
+                blocks = index_blocks(self.index, header['blocksize'])
+                block = header['block']
+                if block < len(blocks):
+                    positions, rows = blocks[block]
+                    vectors = scipy.sparse.csr_matrix(block_vectors(rows), dtype=numpy.float32)
+                else:
+                    positions, vectors = numpy.zeros(0), scipy.sparse.csr_matrix((0, 0), dtype=numpy.float32)
+            arrays = [
+                vectors.indptr.astype(numpy.int64), vectors.indices.astype(numpy.int32), vectors.data,
+                positions.astype(numpy.int64)
+            ]
+            return {'num_blocks': len(blocks)}, arrays
+        if op != 'query':
+            raise ValueError("unknown operation %r" % (op, ))
+
+        indptr, indices, data = arrays
+        docs = [
+            list(zip(indices[start:end].tolist(), data[start:end].tolist()))
+            for start, end in zip(indptr[:-1], indptr[1:])
+        ]
+        topn = header.get('topn')
+        with self.lock:
+            num_best, self.index.num_best = self.index.num_best, topn
+            try:
+                result = self.index[docs] if docs else []
+            finally:
+                self.index.num_best = num_best
+        if topn is None:
+            sims = result.toarray() if scipy.sparse.issparse(result) else result
+            return {}, [numpy.asarray(sims, dtype=numpy.float32).reshape(len(docs), len(self.index))]
+        return {}, list(best_arrays(result, topn))
+
+    def close(self):
+        """Stop accepting new connections. Connections already open are served until the clients close them."""
+        self.closed.set()
+
+
+class ShardCoordinator(interfaces.SimilarityABC):
+    """Query the indexes hosted by several :class:`~gensim.similarities.shardserver.ShardWorker`, as if they
+    were a single index."""
+
+    def __init__(self, addresses, num_best=None, chunksize=256, timeout=None):
+        """
+
+        Parameters
+        ----------
+        addresses : list of (str, int)
+            Host and port of every worker, in the order of their documents.
+        num_best : int, optional
+            If set, return only the `num_best` most similar documents, always leaving out documents with similarity = 0.
+            Otherwise, return a full vector with one float for every document in all workers.
+        chunksize : int, optional
+            Number of queries sent to the workers at once, when the query is an entire corpus.
+        timeout : float, optional
+            Socket timeout in seconds, None waits forever.
+
+        """
+        self.num_best = num_best
+        self.chunksize = chunksize
+        self.normalize = False  # the workers' indexes normalize the queries themselves
+        self.addresses = [tuple(address) for address in addresses]
+        self.timeout = timeout
+        self.lock = threading.Lock()  # one request in flight per connection
+        self.connections = None  # connected by the first request
+        infos = [header for header, _ in self.broadcast({'op': 'info'})]
+        self.shard_sizes = numpy.array([info['num_docs'] for info in infos], dtype=numpy.int64)
+        self.offsets = numpy.concatenate(([0], numpy.cumsum(self.shard_sizes)[:-1])).astype(numpy.int64)
+        self.num_features = next((info['num_features'] for info in infos if info['num_features'] is not None), None)
+        logger.info("connected to %i workers with %i documents in total", len(self.addresses), len(self))
+
+    def __len__(self):
+        return int(self.shard_sizes.sum())
+
+    def broadcast(self, header, arrays=(), workers=None):
+        """Send a request to all workers, then collect their replies.
+
+        Parameters
+        ----------
+        header : dict
+            Request header.
+        arrays : sequence of numpy.ndarray, optional
+            Request arrays.
+        workers : list of int, optional
+            Positions of the workers to send the request to, all workers by default.
+
+        Returns
+        -------
+        list of (dict, list of numpy.ndarray)
+            Reply of every worker.
+
+        Raises
+        ------
+        RuntimeError
+            If a worker failed to answer the request.
+        EOFError, socket.error, ValueError
+            If the connection to a worker broke. All connections are then closed, and opened again by the next
+            request: replies still queued on the other connections would otherwise be read as the answers to the
+            next request.
+
+        """
+        with self.lock:
+            if self.connections is None:
+                self.connections = [
+                    _connected(socket.create_connection(address, timeout=self.timeout)) for address in self.addresses
+                ]
+            if workers is None:
+                workers = range(len(self.connections))
+            connections = [self.connections[worker] for worker in workers]
+            try:
+                # all workers compute in parallel, while the replies are read one after another
+                for conn in connections:
+                    send_message(conn, header, arrays)
+                replies = [recv_message(conn) for conn in connections]
+            except (EOFError, ValueError, socket.error, OSError) as err:
+                logger.error("lost connection to the workers, reconnecting on the next request: %s", err)
+                self.disconnect()
+                raise
+        for address, (reply, _) in zip([self.addresses[worker] for worker in workers], replies):
+            if 'error' in reply:
+                raise RuntimeError("worker %s:%i failed: %s" % (address[0], address[1], reply['error']))
+        return replies
+
+    def query_batch(self, queries, topn=None):
+        """Get the similarities of a batch of queries against all workers.
+
+        Parameters
+        ----------
+        queries : :class:`scipy.sparse.csr_matrix`
+            Queries, one per row.
+        topn : int, optional
+            Number of most similar documents to return per query. By default, return full similarity vectors.
+
+        Returns
+        -------
+        {numpy.ndarray, list of list of (int, float)}
+            Full similarity matrix if `topn` is None, otherwise the `topn` most similar documents per query.
+
+        """
+        arrays = [
+            queries.indptr.astype(numpy.int64), queries.indices.astype(numpy.int32),
+            queries.data.astype(numpy.float32)
+        ]
+        replies = self.broadcast({'op': 'query', 'topn': topn}, arrays)
+        if topn is None:
+            return numpy.hstack([reply_arrays[0] for _, reply_arrays in replies])
+
+        ids = numpy.hstack([reply_arrays[0] + offset for (_, reply_arrays), offset in zip(replies, self.offsets)])
+        sims = numpy.hstack([reply_arrays[1] for _, reply_arrays in replies])
+        best, sims = top_similarities(sims, topn)
+        ids = ids[numpy.arange(len(ids))[:, None], best]
+        return [
+            [(docid, sim) for docid, sim in zip(row_ids, row_sims) if sim != 0.0]
+            for row_ids, row_sims in zip(ids.tolist(), sims.tolist())
+        ]
+
+    def to_matrix(self, docs):
+        """Convert a list of documents in bag-of-words format to a sparse matrix of queries."""
+        return matutils.corpus2csc(docs, num_terms=self.num_features, num_docs=len(docs)).T.tocsr()
+
+    def _query(self, query):
+        """Get similarities of a document or corpus against all workers, bypassing the cache.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, scipy.sparse.csr_matrix}
+            Document in the sparse Gensim bag-of-words format, or a corpus of such documents.
+
+        Returns
+        -------
+        {numpy.ndarray, list of (int, float), list of list of (int, float)}
+            Similarities of `query` against all documents in the workers, depends on `query` and `num_best`.
+
+        """
+        return self._query_topn(query, self.num_best)
+
+    def _query_topn(self, query, topn):
+        """Get similarities of a document or corpus against all workers, keeping the `topn` most similar documents
+        (all of them if `topn` is None). `num_best` is left alone, so that concurrent queries don't interfere."""
+        if scipy.sparse.issparse(query) or isinstance(query, numpy.ndarray):
+            single = isinstance(query, numpy.ndarray) and query.ndim == 1
+            matrix = scipy.sparse.csr_matrix(numpy.atleast_2d(query) if single else query)
+            batches = [matrix[start: start + self.chunksize] for start in range(0, matrix.shape[0], self.chunksize)]
+        else:
+            is_corpus, query = utils.is_corpus(query)
+            single = not is_corpus
+            docs = query if is_corpus else [query]
+            batches = (self.to_matrix(list(chunk)) for chunk in utils.grouper(docs, self.chunksize))
+
+        results = [self.query_batch(batch, topn) for batch in batches]
+        if topn is None:
+            result = numpy.vstack(results) if results else numpy.zeros((0, len(self)), dtype=numpy.float32)
+        else:
+            result = [sims for batch in results for sims in batch]
+        return result[0] if single else result
+
+    def get_similarities(self, query):
+        """Get the full similarity vectors of `query` against all workers.
+
+        Warnings
+        --------
+        Do not use this function directly, use the `self[query]` syntax instead.
+
+        Parameters
+        ----------
+        query : {list of (int, number), iterable of list of (int, number), numpy.ndarray, scipy.sparse.csr_matrix}
+            Document or collection of documents.
+
+        Return
+        ------
+        :class:`numpy.ndarray`
+            Similarity matrix.
+
+        """
+        return self._query_topn(query, None)
+
+    def __iter__(self):
+        """For each document indexed by the workers, in order, compute its similarity against all documents.
+
+        The document vectors are fetched from one worker after another, `chunksize` documents at a time, and queried
+        as a batch. Workers must host :class:`~gensim.similarities.docsim.Similarity`,
+        :class:`~gensim.similarities.docsim.MatrixSimilarity` or
+        :class:`~gensim.similarities.docsim.SparseMatrixSimilarity` indexes.
+
+        Yields
+        ------
+        {numpy.ndarray, list of (int, float)}
+            Similarities of the current document against all documents in the workers, one per document position:
+            the similarities of a deleted document are all zeros (an empty list if `num_best` is set).
+
+        """
+        topn = self.num_best
+        for worker, size in enumerate(self.shard_sizes):
+            block, num_blocks, next_pos = 0, 1, 0
+            while block < num_blocks:
+                request = {'op': 'vectors', 'block': block, 'blocksize': self.chunksize}
+                (reply, (indptr, indices, data, positions)), = self.broadcast(request, workers=[worker])
+                num_blocks, block = reply['num_blocks'], block + 1
+                if len(positions):
+                    shape = None if self.num_features is None else (len(indptr) - 1, self.num_features)
+                    results = self.query_batch(scipy.sparse.csr_matrix((data, indices, indptr), shape=shape), topn)
+                    for pos, sims in zip(positions.tolist(), results):
+                        for _ in range(next_pos, pos):  # deleted documents of the worker
+                            yield self._no_similarities(topn)
+                        yield sims
+                        next_pos = pos + 1
+            for _ in range(next_pos, size):
+                yield self._no_similarities(topn)
+
+    def _no_similarities(self, topn):
+        """Get the similarities of a deleted document, in the format of the query results for `topn`."""
+        return numpy.zeros(len(self), dtype=numpy.float32) if topn is None else []
+
+    def shutdown_workers(self):
+        """Ask all workers to stop accepting new connections, and close the connections to them."""
+        self.broadcast({'op': 'shutdown'})
+        self.close()
+
+    def disconnect(self):
+        """Close the connections to the workers. The next request opens them again."""
+        connections, self.connections = self.connections or [], None
+        for conn in connections:
+            conn.close()
+
+    def close(self):
+        """Close the connections to the workers."""
+        self.disconnect()
+        self.connections = []
+
+    def __str__(self):
+        return "%s<%i docs in %i workers>" % (self.__class__.__name__, len(self), len(self.addresses))
+
+
+def _run_worker(fname, host, port, mmap, addresses, position):
+    """Load the index stored in `fname` and serve it, reporting the worker address into the queue `addresses`."""
+    worker = ShardWorker(utils.SaveLoad.load(fname, mmap=mmap), host=host, port=port)
+    addresses.put((position, worker.address))
+    worker.serve_forever()
+
+
+def spawn_workers(fnames, host='127.0.0.1', mmap='r'):
+    """Start one local worker process per saved index.
+
+    Parameters
+    ----------
+    fnames : list of str
+        Paths to indexes saved with :meth:`~gensim.utils.SaveLoad.save`.
+    host : str, optional
+        Address the workers listen on, each on a free port.
+    mmap : str, optional
+        Memory-map option used to load the indexes.
+
+    Returns
+    -------
+    (list of :class:`multiprocessing.Process`, list of (str, int))
+        Worker processes (daemons, terminated when the current process exits) and their addresses, in the order of
+        `fnames`, ready to be passed to :class:`~gensim.similarities.shardserver.ShardCoordinator`.
+
+    """
+    addresses = multiprocessing.Queue()
+    processes = []
+    for position, fname in enumerate(fnames):
+        process = multiprocessing.Process(target=_run_worker, args=(fname, host, 0, mmap, addresses, position))
+        process.daemon = True
+        process.start()
+        processes.append(process)
+    reported = dict(addresses.get(timeout=60) for _ in fnames)
+    return processes, [reported[position] for position in range(len(fnames))]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a saved similarity index to a ShardCoordinator.")
+    parser.add_argument("--index", help="Path to the saved index", required=True)
+    parser.add_argument("--host", help="Address to listen on (default: %(default)s)", default='127.0.0.1')
+    parser.add_argument("--port", help="Port to listen on (default: %(default)s)", default=9000, type=int)
+    parser.add_argument("--mmap", help="Memory-map the index arrays (default: %(default)s)", default='r')
+    parser.add_argument(
+        '-v', '--verbose', help='Verbose flag', action='store_const', dest="loglevel",
+        const=logging.INFO, default=logging.WARNING
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=args.loglevel)
+    logger.info("running %s", " ".join(sys.argv))
+    ShardWorker(utils.SaveLoad.load(args.index, mmap=args.mmap or None), host=args.host, port=args.port).serve_forever()
+    logger.info("finished running %s", " ".join(sys.argv))
+
+
+if __name__ == '__main__':
+    main()
@@ -280,6 +280,24 @@ class TestDoc2VecModel(unittest.TestCase):
         # make sure mmaping the arrays back works, too
         self.models_equal(model, doc2vec.Doc2Vec.load(tmpf, mmap='r'))
 
+    def test_most_similar_chunked(self):
+        """Test most_similar over chunks of mmapped docvecs gives the same results as over the normalized vectors."""
+        model = doc2vec.Doc2Vec(list(DocsLeeCorpus(True)), min_count=1, epochs=1)
+        tmpf = get_tmpfile('gensim_doc2vec.tst')
+        model.save(tmpf, sep_limit=0)
+        docvecs = doc2vec.Doc2Vec.load(tmpf, mmap='r').docvecs
+
+        for kwargs in ({}, {'topn': 50}, {'clip_start': 100, 'clip_end': 250}, {'negative': ['_*5']}):
+            chunked = docvecs.most_similar(['_*0'], chunksize=7, **kwargs)
+            self.assertIsNone(docvecs.vectors_docs_norm)  # no normalized copy of the vectors was made
+            expected = model.docvecs.most_similar(['_*0'], **kwargs)
+            self.assertEqual([tag for tag, _ in expected], [tag for tag, _ in chunked])
+            self.assertTrue(np.allclose([sim for _, sim in expected], [sim for _, sim in chunked], atol=1e-6))
+
+        expected = model.docvecs.most_similar([model.docvecs[3]], topn=None, clip_start=10, clip_end=20)
+        chunked = docvecs.most_similar([model.docvecs[3]], topn=None, clip_start=10, clip_end=20, chunksize=3)
+        self.assertTrue(np.allclose(expected, chunked, atol=1e-6))
+
     def test_int_doctags(self):
         """Test doc2vec doctag alternatives"""
         corpus = DocsLeeCorpus()
@@ -419,6 +437,26 @@ class TestDoc2VecModel(unittest.TestCase):
             model = doc2vec.Doc2Vec(corpus_file=corpus_file, vector_size=100, min_count=2, epochs=20, workers=1)
             self.model_sanity(model)
 
+    @unittest.skipIf(os.name == 'nt' and six.PY2, "corpus_file training is not supported on Windows + Py27")
+    def test_training_from_indexed_file(self):
+        """Test doc2vec training on a pre-indexed corpus_file gives the same vectors as on the text file."""
+        with temporary_file(get_tmpfile('gensim_word2vec.tst')) as corpus_file, \
+                temporary_file(get_tmpfile('gensim_word2vec.ids')) as indexed_file:
+            save_lee_corpus_as_line_sentence(corpus_file)
+            for dm in (0, 1):
+                model = doc2vec.Doc2Vec(vector_size=10, min_count=2, dm=dm, epochs=2, workers=1)
+                model.build_vocab(corpus_file=corpus_file)
+                indexed_model = doc2vec.Doc2Vec(vector_size=10, min_count=2, dm=dm, epochs=2, workers=1)
+                indexed_model.build_vocab(corpus_file=corpus_file)
+
+                doc2vec.IndexedCorpusFile.build(corpus_file, indexed_model.wv, indexed_file)
+                model.train(corpus_file=corpus_file, total_words=model.corpus_total_words, epochs=model.epochs)
+                indexed_model.train(
+                    corpus_file=indexed_file, total_words=indexed_model.corpus_total_words, epochs=indexed_model.epochs
+                )
+                self.assertTrue(np.allclose(model.docvecs.vectors_docs, indexed_model.docvecs.vectors_docs))
+                self.assertTrue(np.allclose(model.wv.vectors, indexed_model.wv.vectors))
+
     def test_dbow_hs(self):
         """Test DBOW doc2vec training."""
         model = doc2vec.Doc2Vec(list_corpus, dm=0, hs=1, negative=0, min_count=2, epochs=20)
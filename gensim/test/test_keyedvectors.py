@@ -84,6 +84,22 @@ class TestEuclideanKeyedVectors(unittest.TestCase):
             [1, 0.9348248, 0, 0.9112908], [0.9348248, 1, 0.90007025, 0], [0, 0.90007025, 1, 0],
             [0.9112908, 0, 0, 1]]))))
 
+    def test_similarity_matrix_chunked(self):
+        """Test similarity_matrix gives the same matrix regardless of chunking and number of workers."""
+        documents = [
+            ["government", "denied", "holiday"], ["government", "denied", "holiday", "slowing", "hollingworth"],
+            ["war", "conflict", "israel", "terrorism", "call", "administration"]]
+        dictionary = Dictionary(documents)
+        tfidf = TfidfModel(dictionary=dictionary)
+        for kwargs in ({}, {'nonzero_limit': 2}, {'tfidf': tfidf, 'nonzero_limit': 3, 'threshold': 0.3}):
+            expected = self.vectors.similarity_matrix(dictionary, **kwargs)
+            self.assertEqual(expected.format, 'csc')
+            self.assertTrue(np.allclose(expected.todense(), expected.T.todense()))
+            for chunksize, workers in ((1, 1), (2, 3)):
+                similarity_matrix = self.vectors.similarity_matrix(
+                    dictionary, chunksize=chunksize, workers=workers, **kwargs)
+                self.assertTrue(np.allclose(expected.todense(), similarity_matrix.todense()))
+
     def test_most_similar(self):
         """Test most_similar returns expected results."""
         expected = [
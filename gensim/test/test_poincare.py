@@ -25,8 +25,8 @@ try:
 except ImportError:
     autograd_installed = False
 
-from gensim.models.poincare import PoincareRelations, PoincareModel, PoincareKeyedVectors
-from gensim.test.utils import datapath
+from gensim.models.poincare import PoincareRelations, PoincareModel, PoincareKeyedVectors, PoincareIndexer
+from gensim.test.utils import datapath, get_tmpfile
 
 
 logger = logging.getLogger(__name__)
@@ -357,6 +357,72 @@ class TestPoincareKeyedVectors(unittest.TestCase):
         self.assertEqual(self.vectors.descendants('dog.n.01'), expected)
         self.assertEqual(self.vectors.descendants('dog.n.01', max_depth=3), expected[:3])
 
+    def test_descendants_stop_at_lowest_node(self):
+        """Test descendants stops early when the lowest level of the hierarchy is reached."""
+        self.assertEqual(self.vectors.descendants('harbor_porpoise.n.01'), [])
+
+    def test_vector_distance_matrix(self):
+        """Test vector_distance_matrix matches vector_distance_batch for each row."""
+        vectors = self.vectors.syn0[:20]
+        distances = self.vectors.vector_distance_matrix(vectors[:5], vectors)
+        self.assertEqual(distances.shape, (5, 20))
+        for vector, row in zip(vectors[:5], distances):
+            self.assertTrue(np.allclose(row, self.vectors.vector_distance_batch(vector, vectors), rtol=1e-4))
+        self.assertTrue(np.allclose(np.diag(distances), 0))
+
+    def test_most_similar_batch(self):
+        """Test most_similar_batch returns the same results as most_similar for each query."""
+        queries = ['mammal.n.01', 'dog.n.01', self.vectors.word_vec('kangaroo.n.01')]
+        for topn, restrict_vocab in ((5, None), (3, 100)):
+            batch = self.vectors.most_similar_batch(queries, topn=topn, restrict_vocab=restrict_vocab, blocksize=2)
+            for query, similar in zip(queries, batch):
+                expected = self.vectors.most_similar(query, topn=topn, restrict_vocab=restrict_vocab)
+                self.assertEqual([node for node, _ in similar], [node for node, _ in expected])
+                self.assertTrue(np.allclose([d for _, d in similar], [d for _, d in expected], rtol=1e-4))
+        batch = self.vectors.most_similar_batch(queries, topn=None)
+        self.assertEqual(len(batch[1]), len(self.vectors.vocab) - 1)
+        # the query node itself is left out, whatever its index
+        self.assertNotIn('mammal.n.01', [node for node, _ in batch[0]])
+
+    def test_closest_batch(self):
+        """Test closest_child_batch and closest_parent_batch match closest_child and closest_parent."""
+        nodes = ['dog.n.01', 'harbor_porpoise.n.01', 'mammal.n.01']
+        self.assertEqual(
+            self.vectors.closest_child_batch(nodes, blocksize=2), [self.vectors.closest_child(node) for node in nodes]
+        )
+        self.assertEqual(
+            self.vectors.closest_parent_batch(nodes), [self.vectors.closest_parent(node) for node in nodes]
+        )
+        self.assertEqual(self.vectors.closest_child_batch(nodes)[:2], ['terrier.n.01', None])
+
+    def test_indexer(self):
+        """Test searches with a PoincareIndexer return the same results as exhaustive searches."""
+        indexer = PoincareIndexer(self.vectors, num_buckets=10, num_bands=4)
+        nodes = self.vectors.index2word[:100]
+        for node in nodes:
+            expected = self.vectors.most_similar(node, topn=5)
+            predicted = self.vectors.most_similar(node, topn=5, indexer=indexer)
+            self.assertEqual([n for n, _ in predicted], [n for n, _ in expected])
+            self.assertTrue(np.allclose([d for _, d in predicted], [d for _, d in expected], rtol=1e-4))
+        self.assertEqual(
+            self.vectors.closest_child_batch(nodes, indexer=indexer), self.vectors.closest_child_batch(nodes)
+        )
+        self.assertEqual(
+            self.vectors.closest_parent_batch(nodes, indexer=indexer), self.vectors.closest_parent_batch(nodes)
+        )
+        self.assertEqual(self.vectors.descendants('dog.n.01', indexer=indexer), self.vectors.descendants('dog.n.01'))
+        self.assertEqual(self.vectors.ancestors('dog.n.01', indexer=indexer), self.vectors.ancestors('dog.n.01'))
+        with self.assertRaises(ValueError):
+            self.vectors.most_similar('dog.n.01', restrict_vocab=10, indexer=indexer)
+
+        fname = get_tmpfile('gensim_poincare_indexer.tst')
+        indexer.save(fname)
+        loaded = PoincareIndexer.load(fname)
+        self.assertEqual(
+            self.vectors.most_similar('dog.n.01', indexer=loaded),
+            self.vectors.most_similar('dog.n.01', indexer=indexer)
+        )
+
     def test_similarity(self):
         """Test similarity returns expected value for two nodes, and for identical nodes."""
         self.assertTrue(np.allclose(self.vectors.similarity('dog.n.01', 'dog.n.01'), 1))
@@ -9,6 +9,7 @@ Automated tests for similarity algorithms (the similarities package).
 """
 
 
+import itertools
 import logging
 import unittest
 import os
@@ -22,6 +23,7 @@ from gensim.models import doc2vec
 from gensim.models import KeyedVectors
 from gensim.models import TfidfModel
 from gensim import matutils, similarities
+from gensim.corpora import MmCorpus
 from gensim.models import Word2Vec, FastText
 from gensim.test.utils import (datapath, get_tmpfile,
     common_texts as texts, common_dictionary as dictionary, common_corpus as corpus)
@@ -35,6 +37,50 @@ except ImportError:
 sentences = [doc2vec.TaggedDocument(words, [i]) for i, words in enumerate(texts)]
 
 
+def assertSelfJoin(testcase, joined, sims, threshold=None, topn=None):
+    """Check the output of `self_join` against the full similarity matrix `sims`, diagonal excluded."""
+    sims = numpy.array(sims, dtype=float)
+    numpy.fill_diagonal(sims, 0.0)
+    if threshold is not None:
+        sims[sims < threshold] = 0.0
+    got = matutils.corpus2dense(joined, len(sims), len(sims)).T
+    testcase.assertEqual(len(joined), len(sims))
+    for row, expected in zip(got, sims):
+        if topn is not None:
+            kept = row != 0
+            testcase.assertEqual(kept.sum(), min(topn, numpy.count_nonzero(expected)))
+            # the kept similarities are the highest ones (up to ties)
+            if kept.any() and (~kept).any():
+                testcase.assertGreaterEqual(row[kept].min() + 1e-6, expected[~kept].max())
+            expected = numpy.where(kept, expected, 0.0)
+        numpy.testing.assert_allclose(row, expected, atol=1e-5)
+
+
+LANGS = ['en', 'de', 'en', 'en', 'de', 'en', 'de', 'en', 'fr']
+YEARS = [2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019]
+
+
+def assertSearch(testcase, index, expected, where, allowed):
+    """Check filtered queries of `index` against the full similarity matrix `expected` masked to `allowed`."""
+    expected = numpy.where(allowed, expected, 0.0)
+    num_best = index.num_best
+    index.num_best = None
+    numpy.testing.assert_allclose(index.search(corpus, where=where), expected, atol=1e-6)
+    numpy.testing.assert_allclose(index.search(corpus[0], where=where), expected[0], atol=1e-6)
+    for topn in (1, 3, 20):
+        index.num_best = topn
+        for query, sims in zip(corpus, expected):
+            got = index.search(query, where=where)
+            best = matutils.full2sparse_clipped(sims, topn)
+            testcase.assertEqual([docno for docno, _ in got], [docno for docno, _ in best])
+        got = index.search(corpus, where=where)
+        testcase.assertEqual(len(got), len(corpus))
+        for doc, sims in zip(got, expected):
+            testcase.assertTrue(all(allowed[docno] for docno, _ in doc))
+            testcase.assertEqual(len(doc), min(topn, numpy.count_nonzero(sims)))
+    index.num_best = num_best
+
+
 class _TestSimilarityABC(object):
     """
     Base class for SparseMatrixSimilarity and MatrixSimilarity unit tests.
@@ -164,6 +210,51 @@ class _TestSimilarityABC(object):
         if self.cls == similarities.Similarity:
             index.destroy()
 
+    def testQueryCache(self):
+        if self.cls == similarities.WmdSimilarity:
+            return  # queries are lists of words, never cached
+
+        index = self.factoryMethod()
+        for num_best in (None, 3):
+            index.num_best = num_best
+            expected = [index[doc] for doc in corpus]
+            cache = index.enable_cache()
+            for doc, sims in zip(corpus, expected):
+                self.assertTrue(numpy.allclose(index[doc], sims))
+            self.assertEqual(cache.stats()['misses'], len(corpus))
+            for doc, sims in zip(corpus, expected):
+                self.assertTrue(numpy.allclose(index[list(reversed(doc))], sims))  # same query, different order
+            self.assertEqual(cache.stats()['hits'], len(corpus))
+
+            # the results handed out are copies, modifying them doesn't affect the cache
+            index[corpus[0]][0] = (1000, 1000.0) if num_best else 1000.0
+            self.assertTrue(numpy.allclose(index[corpus[0]], expected[0]))
+
+        # num_best is part of the key
+        index.num_best = None
+        self.assertEqual(len(index[corpus[1]]), len(corpus))
+
+        # least recently used results are evicted first
+        cache = index.enable_cache(max_entries=2)
+        index[corpus[0]], index[corpus[1]], index[corpus[0]], index[corpus[2]]
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        index[corpus[0]]
+        self.assertEqual(cache.stats()['hits'], 2)
+        index[corpus[1]]
+        self.assertEqual(cache.stats()['misses'], 4)
+
+        # cached results are not saved, only the cache settings
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname)
+        index2 = self.cls.load(fname)
+        self.assertEqual(len(index2.query_cache), 0)
+        self.assertEqual(index2.query_cache.max_entries, 2)
+        index.disable_cache()
+        self.assertIsNone(index.query_cache)
+        if self.cls == similarities.Similarity:
+            index.destroy()
+
     def testPersistency(self):
         if self.cls == similarities.WmdSimilarity and not PYEMD_EXT:
             return
@@ -288,6 +379,142 @@ class TestMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.MatrixSimilarity
 
+    def testStorage(self):
+        """Reduced-precision storage modes approximate the float32 similarities"""
+        num_features = len(dictionary)
+        expected = self.cls(corpus, num_features=num_features)[corpus]
+        for storage, dtype in (('float16', numpy.float16), ('int8', numpy.int8)):
+            index = self.cls(corpus, num_features=num_features, storage=storage, blocksize=4)
+            self.assertEqual(index.index.dtype, dtype)
+            sims = index[corpus]
+            self.assertEqual(sims.dtype, numpy.float32)
+            numpy.testing.assert_allclose(sims, expected, atol=0.02)
+            numpy.testing.assert_allclose(index[corpus[0]], expected[0], atol=0.02)
+
+            fname = get_tmpfile('gensim_similarities.tst.pkl')
+            index.save(fname)
+            index2 = self.cls.load(fname, mmap='r')
+            self.assertTrue(isinstance(index2.index, numpy.memmap))
+            numpy.testing.assert_array_equal(index2[corpus], sims)
+
+        with self.assertRaises(ValueError):
+            self.cls(corpus, num_features=num_features, storage='int4')
+
+    def testRerank(self):
+        """Re-ranked candidates carry exact similarities"""
+        num_features = len(dictionary)
+        exact = self.cls(corpus, num_features=num_features, num_best=3)
+        index = self.cls(corpus, num_features=num_features, num_best=3, storage='int8', rerank=5)
+        for query in corpus:
+            expected, got = exact[query], index[query]
+            self.assertEqual(len(expected), len(got))
+            for (_, sim1), (_, sim2) in zip(expected, got):
+                self.assertAlmostEqual(sim1, sim2, places=5)
+
+        # the exact copy of the index stays on disk, also after saving and loading the index
+        self.assertTrue(isinstance(index.exact_index, numpy.memmap))
+        exact_fname = get_tmpfile('gensim_similarities_exact.npy')
+        index = self.cls(
+            corpus, num_features=num_features, num_best=3, storage='int8', rerank=5, exact_fname=exact_fname
+        )
+        numpy.testing.assert_array_equal(numpy.load(exact_fname), index.exact_index)
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname)
+        index2 = self.cls.load(fname, mmap='r')
+        self.assertTrue(isinstance(index2.exact_index, numpy.memmap))
+        self.assertEqual(index2[corpus[0]], index[corpus[0]])
+
+    def testSelfJoin(self):
+        index = self.cls(corpus, num_features=len(dictionary))
+        sims = index[corpus]
+        fname = get_tmpfile('gensim_similarities.tst.mm')
+        for blocksize in (1, 2, 4, 100):
+            for workers in (1, 3):
+                kwargs = dict(blocksize=blocksize, workers=workers)
+                joined = similarities.docsim.self_join(index, fname, threshold=0.2, **kwargs)
+                assertSelfJoin(self, joined, sims, threshold=0.2)
+                joined = similarities.docsim.self_join(index, fname, topn=2, **kwargs)
+                assertSelfJoin(self, joined, sims, topn=2)
+        joined = similarities.docsim.self_join(index, fname, threshold=0.3, topn=1, blocksize=4)
+        assertSelfJoin(self, joined, sims, threshold=0.3, topn=1)
+
+        joined = similarities.docsim.self_join(index, fname, threshold=0.2, include_self=True, blocksize=4)
+        for docno, doc in enumerate(joined):
+            self.assertAlmostEqual(dict(doc)[docno], 1.0, places=5)
+
+        # reduced-precision storage is dequantised on the fly
+        index = self.cls(corpus, num_features=len(dictionary), storage='int8')
+        joined = similarities.docsim.self_join(index, fname, threshold=0.2, blocksize=4)
+        got = matutils.corpus2dense(joined, len(corpus), len(corpus)).T
+        expected = numpy.where(sims >= 0.2, sims, 0.0)
+        numpy.fill_diagonal(expected, 0.0)
+        numpy.testing.assert_allclose(got, expected, atol=0.05)
+
+        with self.assertRaises(ValueError):
+            similarities.docsim.self_join(index, fname)
+
+    def testSearch(self):
+        index = self.cls(corpus, num_features=len(dictionary))
+        expected = index[corpus]
+        index.set_attribute('lang', LANGS)
+        index.set_attribute('year', YEARS)
+        langs, years = numpy.array(LANGS), numpy.array(YEARS)
+        filters = [
+            ({'lang': 'en'}, langs == 'en'),
+            ({'lang': 'fr'}, langs == 'fr'),
+            (
+                {'lang': ['de', 'fr'], 'year': {'>': 2012, '<=': 2017}},
+                (langs != 'en') & (years > 2012) & (years <= 2017)
+            ),
+            ({'lang': {'not in': ['en']}}, langs != 'en'),
+            ({'lang': 'xx'}, numpy.zeros(len(corpus), dtype=bool)),
+            (years % 2 == 0, years % 2 == 0),
+        ]
+        for where, allowed in filters:
+            assertSearch(self, index, expected, where, allowed)
+        self.assertIsNone(index.num_best)
+        numpy.testing.assert_allclose(index.search(corpus), expected)
+
+        # filtered candidates of a reduced-precision index are still re-ranked against the exact index
+        index = self.cls(corpus, num_features=len(dictionary), num_best=3, storage='int8', rerank=5)
+        index.set_attribute('lang', LANGS)
+        for lang in ('en', 'fr'):  # more, and fewer matching documents than candidates to re-rank
+            for query, sims in zip(corpus, expected):
+                got = index.search(query, where={'lang': lang})
+                exact = matutils.full2sparse_clipped(numpy.where(langs == lang, sims, 0.0), 3)
+                self.assertEqual([docno for docno, _ in got], [docno for docno, _ in exact])
+                numpy.testing.assert_allclose([sim for _, sim in got], [sim for _, sim in exact], atol=1e-5)
+
+        with self.assertRaises(ValueError):
+            index.search(corpus[0], where={'year': 2015})  # unknown attribute
+        with self.assertRaises(ValueError):
+            index.search(corpus[0], where={'lang': {'<': 'en'}})  # no order on categorical attributes
+        with self.assertRaises(ValueError):
+            index.search(corpus[0], where=numpy.ones(3, dtype=bool))
+        with self.assertRaises(ValueError):
+            self.cls(corpus, num_features=len(dictionary)).search(corpus[0], where={'lang': 'en'})
+
+    def testDocumentAttributes(self):
+        attributes = similarities.docsim.DocumentAttributes(4)
+        attributes.set('year', [2010, 2011], positions=[1, 3])
+        attributes.set('lang', ['en', 'de', 'en', 'fr'])
+        numpy.testing.assert_array_equal(attributes.mask({'year': {'!=': 2010}}), [False, False, False, True])
+        numpy.testing.assert_array_equal(attributes.mask({'lang': {'!=': 'en'}}), [False, True, False, True])
+        with numpy.errstate(invalid='raise'):  # comparing the missing values (NaN) is silent
+            numpy.testing.assert_array_equal(attributes.mask({'year': {'>=': 2011}}), [False, False, False, True])
+        mask = attributes.mask({'lang': 'en'})
+        self.assertIs(attributes.mask({'lang': 'en'}), mask)  # bitmaps are cached
+        attributes.resize(5)
+        numpy.testing.assert_array_equal(attributes.mask({'lang': 'en'}), [True, False, True, False, False])
+        self.assertRaises(ValueError, attributes.set, 'year', ['late'] * 5)
+        self.assertRaises(ValueError, attributes.set, 'year', [2012], positions=[5])
+
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        attributes.save(fname)
+        attributes2 = similarities.docsim.DocumentAttributes.load(fname)
+        self.assertEqual(attributes2.masks, {})
+        numpy.testing.assert_array_equal(attributes2.mask({'year': [2011]}), [False, False, False, True, False])
+
 
 class TestWmdSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
@@ -337,6 +564,33 @@ class TestWmdSimilarity(unittest.TestCase, _TestSimilarityABC):
         cond = sum(numpy.diff(sims2) < 0) == len(sims2) - 1
         self.assertTrue(cond)
 
+    def testPrune(self):
+        """Lower-bound pruning returns the same `num_best` documents as the exhaustive search"""
+        if not PYEMD_EXT:
+            return
+
+        exact = self.cls(texts, self.w2v_model, prune=False)
+        pruned = self.cls(texts, self.w2v_model)
+        queries = texts + [['human', 'trees', 'unknownword'], ['unknownword']]
+        for num_best in (1, 3, 20):
+            exact.num_best = pruned.num_best = num_best
+            for query in queries:
+                expected, got = exact[query], pruned[query]
+                self.assertEqual(len(expected), len(got))
+                for (_, sim1), (_, sim2) in zip(expected, got):
+                    self.assertAlmostEqual(sim1, sim2)
+
+        # both relaxations bound the real distance from below
+        wv = self.w2v_model.wv
+        pruned.init_centroids()
+        for docno, document in enumerate(texts):
+            distance = wv.wmdistance(document, texts[0])
+            qvectors, qweights = pruned.nbow(texts[0])
+            dvectors, dweights = pruned.nbow(document)
+            self.assertLessEqual(pruned.rwmd(qvectors, qweights, dvectors, dweights), distance * (1 + 1e-5))
+            wcd = numpy.linalg.norm(pruned.centroids[docno] - qweights.dot(qvectors))
+            self.assertLessEqual(wcd, distance * (1 + 1e-5))
+
     def testChunking(self):
         # Override testChunking.
 
@@ -462,6 +716,18 @@ class TestSoftCosineSimilarity(unittest.TestCase, _TestSimilarityABC):
             self.assertTrue(numpy.alltrue(sims >= 0.0))
             self.assertTrue(numpy.alltrue(sims <= 1.0))
 
+    def testSoftcossim(self):
+        """Batched similarities are the same as those computed pair by pair by softcossim"""
+        queries = corpus + [[], [(0, 2.0)]]
+        expected = numpy.array([
+            [matutils.softcossim(query, document, self.similarity_matrix) for document in corpus]
+            for query in queries
+        ])
+        for chunksize in (1, 2, 256):
+            index = self.cls(corpus, self.similarity_matrix, chunksize=chunksize)
+            numpy.testing.assert_allclose(index[queries], expected, rtol=1e-6)
+            numpy.testing.assert_allclose(index[queries[0]], expected[0], rtol=1e-6)
+
 
 class TestSparseMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
@@ -495,6 +761,36 @@ class TestSparseMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
         self.assertTrue(scipy.sparse.issparse(scipy_topn_sims))
         self.assertEqual(dense_topn_sims, [matutils.scipy2sparse(v) for v in scipy_topn_sims])
 
+    def testPrune(self):
+        """Pruned top-k queries return the same results as exhaustive evaluation"""
+        num_features = len(dictionary)
+        for num_best in (1, 3, 20):
+            exact = self.cls(corpus, num_features=num_features, num_best=num_best)
+            pruned = self.cls(corpus, num_features=num_features, num_best=num_best, prune=True)
+            for query in corpus:
+                expected, got = exact[query], pruned[query]
+                self.assertEqual([doc for doc, _ in expected], [doc for doc, _ in got])
+                numpy.testing.assert_array_almost_equal([sim for _, sim in expected], [sim for _, sim in got])
+            self.assertEqual(len(exact[corpus]), len(pruned[corpus]))
+            for expected, got in zip(exact[corpus], pruned[corpus]):
+                numpy.testing.assert_array_almost_equal(expected, got)
+
+        # negative weights fall back to exhaustive evaluation
+        query = [(0, -1.0), (1, 2.0), (5, 1.0)]
+        numpy.testing.assert_array_almost_equal(exact[query], pruned[query])
+
+        # posting lists survive a save/load round trip
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        pruned.save(fname)
+        pruned2 = self.cls.load(fname, mmap='r')
+        numpy.testing.assert_array_almost_equal(pruned[corpus[0]], pruned2[corpus[0]])
+
+    def testSelfJoin(self):
+        index = self.cls(corpus, num_features=len(dictionary))
+        fname = get_tmpfile('gensim_similarities.tst.mm')
+        joined = similarities.docsim.self_join(index, fname, threshold=0.1, topn=3, blocksize=4)
+        assertSelfJoin(self, joined, index[corpus], threshold=0.1, topn=3)
+
 
 class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
@@ -534,6 +830,472 @@ class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
         self.assertTrue(numpy.allclose(expected, sims))
         index.destroy()
 
+    def testNumBestMergesShards(self):
+        exact = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=2)
+        for num_best in [1, 3, 20]:
+            exact.num_best = index.num_best = num_best
+            for query, expected in zip(corpus, exact[corpus]):
+                sims = index[query]
+                self.assertEqual([docno for docno, _ in expected], [docno for docno, _ in sims])
+                self.assertTrue(numpy.allclose([sim for _, sim in expected], [sim for _, sim in sims]))
+            for expected, sims in zip(exact[corpus], index[corpus]):
+                self.assertEqual([docno for docno, _ in expected], [docno for docno, _ in sims])
+        index.destroy()
+
+    def testParallelQueries(self):
+        for pool_type in ('process', 'thread'):
+            serial = self.cls(None, corpus, num_features=len(dictionary), shardsize=2)
+            index = self.cls(None, corpus, num_features=len(dictionary), shardsize=2, workers=2, pool_type=pool_type)
+            self.assertTrue(numpy.allclose(serial[corpus], index[corpus]))
+            pool = index.pool
+            self.assertIsNotNone(pool)
+
+            # the pool is reused across queries, also after the last shard was reopened and grew
+            index.add_documents(corpus[:1])
+            serial.add_documents(corpus[:1])
+            index.num_best = serial.num_best = 3
+            self.assertEqual(serial[corpus[0]], index[corpus[0]])
+            self.assertIs(pool, index.pool)
+            index.num_best = serial.num_best = None
+
+            fname = get_tmpfile('gensim_similarities.tst.pkl')
+            index.save(fname)
+            self.assertIsNone(self.cls.load(fname).pool)
+
+            index.destroy()
+            self.assertIsNone(index.pool)
+            serial.destroy()
+
+    def testQueryCacheInvalidation(self):
+        index = self.cls(None, corpus[:5], num_features=len(dictionary), shardsize=2, compaction_threshold=None)
+        cache = index.enable_cache()
+        self.assertEqual(len(index[corpus[0]]), 5)
+        index.add_documents(corpus[5:])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(len(index[corpus[0]]), len(corpus))
+        self.assertAlmostEqual(index[corpus[1]][1], 1.0, places=5)
+        index.delete([1])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(index[corpus[1]][1], 0.0)
+        index.destroy()
+
+    def testDelete(self):
+        deleted = [1, 4, 5, 7]
+        expected = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))[corpus]
+        expected[:, deleted] = 0.0
+        for workers in (None, 2):
+            index = self.cls(
+                None, corpus, num_features=len(dictionary), shardsize=2, workers=workers, compaction_threshold=None
+            )
+            index.delete(deleted)
+            self.assertEqual(len(index), len(corpus))
+            for compacted in (False, True):
+                if compacted:
+                    index.compact()
+                    self.assertEqual(index.shards_to_compact(0.0), [])
+                    self.assertIsNotNone(index.shards[0].positions)
+                self.assertTrue(numpy.allclose(index[corpus], expected))
+                self.assertTrue(numpy.allclose(index[corpus[0]], expected[0]))
+                index.num_best = 3
+                for query, sims in zip(corpus, expected):
+                    self.assertEqual(
+                        [docno for docno, _ in index[query]],
+                        [docno for docno, _ in matutils.full2sparse_clipped(sims, 3)]
+                    )
+                # iteration yields one row per document position, deleted documents have no similarities
+                self.assertEqual([len(sims) for pos, sims in enumerate(index) if pos in deleted], [0] * len(deleted))
+                index.num_best = None
+                sims = numpy.array(list(index))
+                self.assertEqual(len(sims), len(corpus))
+                expected_iter = expected.copy()
+                expected_iter[deleted] = 0.0
+                self.assertTrue(numpy.allclose(sims, expected_iter))
+                self.assertRaises(ValueError, index.vector_by_id, 4)
+                vector = index.vector_by_id(0)  # from a compacted shard
+                vector = vector.toarray().ravel() if scipy.sparse.issparse(vector) else vector
+                expected_vector = matutils.unitvec(matutils.sparse2full(corpus[0], len(dictionary)))
+                self.assertTrue(numpy.allclose(vector, expected_vector))
+            index.destroy()
+
+        # files of a replaced shard are kept as long as a query reads it
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=4)
+        index.delete([0, 1, 2])
+        self.assertIsNone(index.compaction_thread)  # background compaction is opt-in
+        shards = index.acquire_shards()
+        old_fname = shards[0].fullname()
+        index.compact()
+        self.assertNotEqual(index.shards[0].fullname(), old_fname)
+        self.assertTrue(os.path.exists(old_fname))
+        self.assertEqual(len(shards[0].deleted_rows()), 3)
+        index.release_shards(shards)
+        self.assertFalse(os.path.exists(old_fname))
+        self.assertEqual(index.retired_shards, [])
+        index.destroy()
+
+        # deleting enough documents compacts the index in the background
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=4, compaction_threshold=0.25)
+        index.delete([0])
+        self.assertIsNone(index.compaction_thread)
+        index.delete([1, 2])
+        index.wait_compaction()
+        self.assertEqual(index.shards[0].num_rows(), 1)
+        self.assertIsNone(index.shards[1].positions)
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname)
+        index2 = self.cls.load(fname)
+        expected = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))[corpus]
+        expected[:, :3] = 0.0
+        self.assertTrue(numpy.allclose(index2[corpus], expected))
+        index.destroy()
+
+    def testSelfJoin(self):
+        deleted = [1, 4, 5]
+        expected = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))[corpus]
+        expected[:, deleted] = 0.0
+        expected[deleted, :] = 0.0
+        fname = get_tmpfile('gensim_similarities.tst.mm')
+        index = self.cls(None, corpus, num_features=len(dictionary), shardsize=3, compaction_threshold=None)
+        index.delete(deleted)
+        for compacted in (False, True):
+            if compacted:
+                index.compact()
+            for blocksize in (2, 100):
+                joined = similarities.docsim.self_join(index, fname, threshold=0.1, blocksize=blocksize, workers=2)
+                assertSelfJoin(self, joined, expected, threshold=0.1)
+                joined = similarities.docsim.self_join(index, fname, topn=2, blocksize=blocksize)
+                assertSelfJoin(self, joined, expected, topn=2)
+        index.destroy()
+
+    def testParallelBuild(self):
+        fname = get_tmpfile('gensim_similarities.tst.mm')
+        MmCorpus.serialize(fname, corpus)
+        mm = MmCorpus(fname)
+        # a mix of dense and sparse shards
+        dense = [matutils.sparse2full(doc, len(dictionary)) for doc in corpus]
+        for docs in (mm, corpus + dense, dense[:3] + corpus):
+            for shardsize, first in ((2, 0), (2, 3), (4, 2), (100, 0)):
+                serial = self.cls(None, corpus[:first], num_features=len(dictionary), shardsize=shardsize)
+                serial.close_shard()  # the first (incomplete) shard gets reopened and completed by the next documents
+                serial.add_documents(docs)
+                index = self.cls(None, corpus[:first], num_features=len(dictionary), shardsize=shardsize)
+                index.close_shard()
+                index.add_documents(docs, workers=3)
+
+                self.assertEqual(len(index.fresh_docs), len(serial.fresh_docs))
+                self.assertEqual(index.fresh_nnz, serial.fresh_nnz)
+                self.assertEqual(len(index.shards), len(serial.shards))
+                for shard, expected in zip(index.shards, serial.shards):
+                    self.assertEqual(
+                        (shard.cls, len(shard), shard.num_nnz), (expected.cls, len(expected), expected.num_nnz)
+                    )
+                    got, want = shard.get_index().index, expected.get_index().index
+                    if scipy.sparse.issparse(want):
+                        got, want = got.toarray(), want.toarray()
+                    numpy.testing.assert_array_equal(got, want)
+                numpy.testing.assert_array_equal(index[corpus], serial[corpus])
+                index.destroy()
+                serial.destroy()
+
+        # without random access, the shards are built serially
+        index = self.cls(None, iter(corpus), num_features=len(dictionary), shardsize=2, build_workers=3)
+        self.assertEqual(len(index), len(corpus))
+        index.destroy()
+
+    def testSearch(self):
+        expected = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))[corpus]
+        langs = numpy.array(LANGS)
+        deleted = [0, 2]
+        for workers, pool_type in ((None, 'process'), (2, 'process'), (2, 'thread')):
+            index = self.cls(
+                None, corpus[:4], num_features=len(dictionary), shardsize=2, workers=workers, pool_type=pool_type,
+                compaction_threshold=None
+            )
+            index.set_attribute('lang', LANGS[:4])
+            index.add_documents(corpus[4:], attributes={'lang': LANGS[4:], 'year': YEARS[4:]})
+            assertSearch(self, index, expected, {'lang': 'en'}, langs == 'en')
+            assertSearch(self, index, expected, {'year': {'>=': 2016}}, numpy.array(YEARS) >= 2016)
+
+            # deleted documents stay left out, also after compaction
+            index.delete(deleted)
+            allowed = langs == 'en'
+            allowed[deleted] = False
+            for compacted in (False, True):
+                if compacted:
+                    index.compact()
+                assertSearch(self, index, expected, {'lang': 'en'}, allowed)
+
+            fname = get_tmpfile('gensim_similarities.tst.pkl')
+            index.save(fname)
+            index2 = self.cls.load(fname)
+            assertSearch(self, index2, expected, {'lang': 'en'}, allowed)
+            index2.close()
+            index.destroy()
+
+
+class TestIvfSimilarity(unittest.TestCase, _TestSimilarityABC):
+    def setUp(self):
+        self.cls = similarities.IvfSimilarity
+        # unit-length dense vectors in a few clusters
+        random = numpy.random.RandomState(0)
+        centers = random.randn(20, 16)
+        vectors = centers[random.randint(20, size=2050)] + 0.3 * random.randn(2050, 16)
+        vectors = (vectors / numpy.linalg.norm(vectors, axis=1)[:, None]).astype(numpy.float32)
+        self.vectors, self.queries = vectors[:2000], vectors[2000:]
+
+    def testRecall(self):
+        exact = similarities.MatrixSimilarity(self.vectors, num_features=16, num_best=10)[self.queries]
+        index = self.cls(self.vectors, num_features=16, nlist=40, nprobe=4, num_best=10)
+        found = index[self.queries]
+        recall = numpy.mean([
+            len(set(docno for docno, _ in got) & set(docno for docno, _ in expected)) / 10.0
+            for got, expected in zip(found, exact)
+        ])
+        self.assertGreater(recall, 0.9)
+        # same results for single queries as for a batch
+        self.assertEqual([docno for docno, _ in index[self.queries[0]]], [docno for docno, _ in found[0]])
+        for docno, sim in found[0]:
+            self.assertAlmostEqual(sim, numpy.dot(self.vectors[docno], self.queries[0]), places=5)
+
+        # probing all lists is exact
+        index.nprobe = 40
+        for got, expected in zip(index[self.queries], exact):
+            self.assertEqual([docno for docno, _ in got], [docno for docno, _ in expected])
+        index.num_best = None
+        full = index[self.queries]
+        self.assertEqual(full.shape, (len(self.queries), len(self.vectors)))
+        expected = similarities.MatrixSimilarity(self.vectors, num_features=16)[self.queries]
+        self.assertTrue(numpy.allclose(full, expected, atol=1e-5))
+
+    def testQueryCacheSettings(self):
+        # the number of probed lists is part of the cache key
+        index = self.cls(self.vectors, num_features=16, nlist=40, nprobe=1)
+        cache = index.enable_cache()
+        probed = index[self.queries[0]]
+        index.nprobe = 40
+        self.assertTrue(numpy.allclose(index[self.queries[0]], index._query(self.queries[0])))
+        self.assertFalse(numpy.allclose(index[self.queries[0]], probed))
+        self.assertEqual(cache.stats()['misses'], 2)
+
+    def assertLayout(self, index):
+        # every document is stored in the used rows of its list
+        rows = index.rows[:len(index)]
+        self.assertTrue(numpy.array_equal(index.docids[rows], numpy.arange(len(index))))
+        lists = numpy.searchsorted(index.list_offsets, rows, side='right') - 1
+        self.assertTrue((rows < index.list_offsets[lists] + index.list_sizes[lists]).all())
+        self.assertEqual(index.list_sizes.sum(), len(index))
+
+    def testAddDocuments(self):
+        index = self.cls(self.vectors[:1000], num_features=16, nlist=20, nprobe=20)
+        index.add_documents(self.vectors[1000:])
+        self.assertEqual(len(index), len(self.vectors))
+        expected = similarities.MatrixSimilarity(self.vectors, num_features=16)[self.queries]
+        self.assertTrue(numpy.allclose(index[self.queries], expected, atol=1e-5))
+        self.assertLayout(index)
+
+        # small additions are written to the free rows of their lists, in place
+        index = self.cls(self.vectors[:1000], num_features=16, nlist=20, nprobe=20, storage='int8', rerank=20)
+        stored = index.index
+        for start in range(1000, 1010):
+            index.add_documents(self.vectors[start:start + 1])
+        self.assertIs(index.index, stored)
+        for start in range(1010, len(self.vectors), 100):
+            index.add_documents(self.vectors[start:start + 100])
+        self.assertLayout(index)
+        self.assertTrue(isinstance(index.exact_index, numpy.memmap))
+        self.assertTrue(numpy.allclose(index.exact_index[:len(index)], self.vectors, atol=1e-6))
+        index.num_best = 5
+        exact = similarities.MatrixSimilarity(self.vectors, num_features=16, num_best=5)[self.queries]
+        for got, expected in zip(index[self.queries], exact):
+            self.assertEqual([docno for docno, _ in got], [docno for docno, _ in expected])
+
+        # documents can be added to an index memory-mapped read-only
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname)
+        index = self.cls.load(fname, mmap='r')
+        self.assertEqual(len(index.exact_index), len(self.vectors))
+        index.add_documents(self.queries)
+        self.assertLayout(index)
+        self.assertEqual(index[self.queries[0]][0][0], len(self.vectors))
+
+    def testStorage(self):
+        exact = similarities.MatrixSimilarity(self.vectors, num_features=16, num_best=5)[self.queries]
+        index = self.cls(self.vectors, num_features=16, nlist=20, nprobe=20, num_best=5, storage='int8', rerank=20)
+        self.assertEqual(index.index.dtype, numpy.int8)
+        for got, expected in zip(index[self.queries], exact):
+            self.assertEqual([docno for docno, _ in got], [docno for docno, _ in expected])
+            self.assertTrue(numpy.allclose([sim for _, sim in got], [sim for _, sim in expected], atol=1e-5))
+
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index.save(fname, sep_limit=0)
+        index2 = self.cls.load(fname, mmap='r')
+        self.assertTrue(isinstance(index2.index, numpy.memmap))
+        self.assertEqual(index2[self.queries[0]], index[self.queries[0]])
+
+        with self.assertRaises(ValueError):
+            self.cls(self.vectors, num_features=16, storage='int4')
+
+
+class TestDistributionSimilarity(unittest.TestCase):
+    def setUp(self):
+        # sparse topic distributions, as output by LdaModel, plus an unnormalized one
+        rng = numpy.random.RandomState(0)
+        dense = rng.dirichlet(numpy.full(10, 0.3), size=40)
+        dense[dense < 0.05] = 0.0
+        dense[:-1] /= dense[:-1].sum(axis=1)[:, None]
+        self.corpus = [matutils.full2sparse(doc) for doc in dense]
+        self.dense = dense
+
+    def testDistances(self):
+        for metric, distance in [('hellinger', matutils.hellinger), ('jensen_shannon', matutils.jensen_shannon)]:
+            # tiny blocks force the blockwise code paths
+            index = similarities.DistributionSimilarity(
+                self.corpus, num_features=10, metric=metric, chunksize=7, dtype=numpy.float64, block_entries=50
+            )
+            # Jensen-Shannon is the divergence of the normalized distributions
+            dense = self.dense if metric == 'hellinger' else self.dense / self.dense.sum(axis=1)[:, None]
+            expected = numpy.array([[distance(dense[i], dense[j]) for j in range(len(dense))] for i in range(5)])
+            numpy.testing.assert_allclose(index.distances(self.corpus[:5]), expected, atol=1e-5)
+            numpy.testing.assert_allclose(index.distances(self.corpus[0]), expected[0], atol=1e-5)
+            numpy.testing.assert_allclose(index.distances(self.dense[0]), expected[0], atol=1e-5)
+            scale = 1.0 if metric == 'hellinger' else numpy.log(2.0)
+            numpy.testing.assert_allclose(index[self.corpus[:5]], 1.0 - expected / scale, atol=1e-5)
+
+    def testNumBest(self):
+        index = similarities.DistributionSimilarity(self.corpus, num_features=10, metric='jensen_shannon', num_best=3)
+        sims = index[self.corpus[2]]
+        self.assertEqual(len(sims), 3)
+        self.assertEqual(sims[0][0], 2)
+        self.assertAlmostEqual(sims[0][1], 1.0, places=5)
+        full = numpy.array([1.0 - matutils.jensen_shannon(self.dense[2], doc) / numpy.log(2.0) for doc in self.dense])
+        self.assertEqual([docno for docno, _ in sims], list(numpy.argsort(-full)[:3]))
+
+    def testIter(self):
+        index = similarities.DistributionSimilarity(self.corpus, num_features=10, chunksize=16)
+        sims = numpy.array(list(index))
+        # float32 rounding gets amplified by the square root for near-identical distributions
+        numpy.testing.assert_allclose(sims, index[self.corpus], atol=1e-3)
+        numpy.testing.assert_allclose(numpy.diag(sims), 1.0, atol=1e-3)
+
+    def testPersistency(self):
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index = similarities.DistributionSimilarity(self.corpus, num_features=10, metric='jensen_shannon')
+        index.save(fname, separately=['index'])
+        index2 = similarities.DistributionSimilarity.load(fname, mmap='r')
+        numpy.testing.assert_allclose(index2[self.corpus[:3]], index[self.corpus[:3]])
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, similarities.DistributionSimilarity, self.corpus, 10, metric='cosine')
+        index = similarities.DistributionSimilarity(self.corpus, num_features=10)
+        self.assertRaises(ValueError, index.__getitem__, [(0, -0.5)])
+
+
+class TestLshSimilarity(unittest.TestCase):
+    def setUp(self):
+        # groups of near-duplicates: random sets of 50 ids, each copied with a few ids replaced
+        rng = numpy.random.RandomState(0)
+        self.docs, self.groups = [], []
+        for group in range(50):
+            ids = rng.choice(10000, 50, replace=False)
+            for _ in range(3):
+                doc = ids.copy()
+                doc[rng.choice(50, 3, replace=False)] = rng.randint(10000, 20000, 3)
+                self.docs.append(sorted(doc.tolist()))
+                self.groups.append(group)
+        self.sets = [set(doc) for doc in self.docs]
+
+    def jaccard(self, i, j):
+        return 1.0 - matutils.jaccard_distance(self.sets[i], self.sets[j])
+
+    def testMinHash(self):
+        minhash = similarities.minhash.MinHash(num_perm=256, seed=1)
+        signatures = minhash[self.docs]
+        self.assertEqual(signatures.shape, (len(self.docs), 256))
+        self.assertEqual(signatures.dtype, numpy.uint32)
+        # bag-of-words documents, single documents and streamed corpora get the same signatures
+        bows = [[(termid, 2.0) for termid in doc] for doc in self.docs]
+        numpy.testing.assert_array_equal(minhash[bows[:10]], signatures[:10])
+        numpy.testing.assert_array_equal(minhash[bows[3]], signatures[3])
+        numpy.testing.assert_array_equal(numpy.array(list(minhash[iter(self.docs[:10])])), signatures[:10])
+        numpy.testing.assert_array_equal(minhash.signatures(self.docs[:10], blocksize=7), signatures[:10])
+        # the estimates are within a few standard errors of the exact similarities
+        for i, j in [(0, 1), (0, 2), (3, 5), (0, 3), (10, 100)]:
+            self.assertAlmostEqual(minhash.estimate(signatures[i], signatures[j]), self.jaccard(i, j), delta=0.2)
+        self.assertEqual(minhash.estimate(minhash[[]], minhash[[]]), 0.0)
+        # the weights of bag-of-words documents don't matter, ids of weight 0 are left out
+        numpy.testing.assert_array_equal(minhash[[(1, 1.0), (7, 3.0), (9, 0.0)]], minhash[[1, 7]])
+
+    def testLshParams(self):
+        for threshold in (0.3, 0.5, 0.8, 0.9):
+            bands, rows = similarities.minhash.lsh_params(128, threshold)
+            self.assertLessEqual(bands * rows, 128)
+            self.assertAlmostEqual((1.0 / bands) ** (1.0 / rows), threshold, delta=0.05)
+        self.assertRaises(ValueError, similarities.minhash.lsh_params, 128, 1.5)
+
+    def testNearDuplicates(self):
+        for exact in (False, True):
+            index = similarities.LshSimilarity(self.docs, threshold=0.5, exact=exact, chunksize=64)
+            self.assertEqual(len(index), len(self.docs))
+            candidates = index.candidates(self.docs)
+            duplicates = index.near_duplicates(self.docs, threshold=0.5)
+            for docno, (doc_candidates, doc_duplicates) in enumerate(zip(candidates, duplicates)):
+                expected = [other for other, group in enumerate(self.groups) if group == self.groups[docno]]
+                self.assertTrue(set(expected) <= set(doc_candidates))
+                self.assertEqual(sorted(other for other, _ in doc_duplicates), expected)
+                for other, sim in doc_duplicates:
+                    if exact:
+                        self.assertAlmostEqual(sim, self.jaccard(docno, other), places=6)
+                    else:
+                        self.assertAlmostEqual(sim, self.jaccard(docno, other), delta=0.2)
+            numpy.testing.assert_array_equal(index.candidates(self.docs[7]), candidates[7])
+
+    def testSimilarities(self):
+        index = similarities.LshSimilarity(self.docs, exact=True)
+        sims = index[self.docs[4]]
+        self.assertEqual(sims.shape, (len(self.docs), ))
+        for docno in range(len(self.docs)):
+            if sims[docno]:
+                self.assertAlmostEqual(sims[docno], self.jaccard(4, docno), places=6)
+        self.assertAlmostEqual(sims[4], 1.0)
+        numpy.testing.assert_array_equal(index[self.docs[:5]][4], sims)
+        numpy.testing.assert_array_equal(next(itertools.islice(index, 4, None)), sims)
+
+        index.num_best = 2
+        best = index[self.docs[4]]
+        self.assertEqual(best, matutils.full2sparse_clipped(sims, 2))
+        self.assertEqual(index[self.docs[:5]][4], best)
+        self.assertEqual(list(index)[4], best)
+        self.assertEqual(index[[]], [])
+
+    def testAddDocuments(self):
+        """Incremental adds give the same candidates as indexing everything at once"""
+        expected = similarities.LshSimilarity(self.docs, threshold=0.6)
+        index = similarities.LshSimilarity(threshold=0.6)
+        for size in (1, 2, 5, 17, 50, 75):
+            index.add_documents(self.docs[len(index): len(index) + size])
+        self.assertEqual(len(index), len(self.docs))
+        self.assertLess(len(index.runs), 6)
+        for got, want in zip(index.candidates(self.docs), expected.candidates(self.docs)):
+            numpy.testing.assert_array_equal(got, want)
+        # documents can also be added and queried by their signatures
+        index = similarities.LshSimilarity(threshold=0.6)
+        index.add_signatures(index.minhash[self.docs])
+        candidates = index.candidates(index.minhash[self.docs[9]])
+        numpy.testing.assert_array_equal(candidates, expected.candidates(self.docs[9]))
+        index.add_documents([[]])  # an empty document is never a candidate
+        self.assertEqual(len(index.candidates([])), 0)
+        self.assertNotIn(len(self.docs), index.candidates(self.docs[0]))
+
+    def testPersistence(self):
+        fname = get_tmpfile('gensim_similarities.tst.pkl')
+        index = similarities.LshSimilarity(self.docs[:100], exact=True, num_best=3)
+        index.save(fname, separately=['signatures', 'ids'])
+        index2 = similarities.LshSimilarity.load(fname, mmap='r')
+        self.assertEqual(index2[self.docs[5]], index[self.docs[5]])
+        index.add_documents(self.docs[100:])
+        index2.add_documents(self.docs[100:])
+        self.assertEqual(index2[self.docs[120]], index[self.docs[120]])
+
 
 class TestWord2VecAnnoyIndexer(unittest.TestCase):
 
@@ -690,6 +1452,279 @@ class TestDoc2VecAnnoyIndexer(unittest.TestCase):
         self.assertEqual(self.index.num_trees, self.index2.num_trees)
 
 
+class TestHnswIndexer(unittest.TestCase):
+
+    def setUp(self):
+        from gensim.similarities.hnsw import HnswIndexer
+        self.indexer = HnswIndexer
+
+    def testWord2Vec(self):
+        model = word2vec.Word2Vec(texts, min_count=1)
+        model.init_sims()
+        index = self.indexer(model, m=4)
+
+        self.assertEqual(len(index), len(model.wv.vocab))
+        vector = model.wv.vectors_norm[0]
+        word, similarity = index.most_similar(vector, 1)[0]
+        self.assertEqual(word, model.wv.index2word[0])
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+
+        approx_neighbors = model.wv.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = model.wv.most_similar(positive=[vector], topn=5)
+        self.assertEqual([w for w, _ in approx_neighbors], [w for w, _ in exact_neighbors])
+
+    def testDoc2Vec(self):
+        model = doc2vec.Doc2Vec(sentences, min_count=1)
+        index = self.indexer(model, m=4)
+        vector = model.docvecs[0]
+
+        approx_neighbors = model.docvecs.most_similar([vector], topn=5, indexer=index)
+        exact_neighbors = model.docvecs.most_similar(positive=[vector], topn=5)
+        self.assertEqual(approx_neighbors[0][0], 0)
+        self.assertEqual([d for d, _ in approx_neighbors], [d for d, _ in exact_neighbors])
+
+    def testRecall(self):
+        rng = numpy.random.RandomState(0)
+        vectors = rng.randn(1000, 20).astype(numpy.float32)
+        kv = KeyedVectors(20)
+        kv.add([str(i) for i in range(len(vectors))], vectors)
+        index = self.indexer(kv, m=8, ef_construction=50, ef=50)
+
+        kv.init_sims()
+        found = 0
+        for query in vectors[:50] + 0.1 * rng.randn(50, 20):
+            exact = set(w for w, _ in kv.most_similar([query], topn=10))
+            found += len(exact & set(w for w, _ in index.most_similar(query, 10)))
+        self.assertGreater(found / 500.0, 0.9)
+
+    def testIncrementalAdd(self):
+        rng = numpy.random.RandomState(0)
+        kv = KeyedVectors(10)
+        kv.add(['w%i' % i for i in range(100)], rng.randn(100, 10))
+        index = self.indexer(kv, m=4)
+
+        new_vector = rng.randn(10)
+        kv.add('new', new_vector)
+        word, similarity = index.most_similar(new_vector, 1)[0]
+        self.assertEqual(len(index), 101)
+        self.assertEqual(word, 'new')
+        self.assertAlmostEqual(similarity, 1.0, places=5)
+
+    def testSaveLoad(self):
+        rng = numpy.random.RandomState(0)
+        kv = KeyedVectors(10)
+        kv.add(['w%i' % i for i in range(100)], rng.randn(100, 10))
+        index = self.indexer(kv, m=4)
+        query = rng.randn(10)
+
+        fname = get_tmpfile('gensim_similarities.tst.hnsw')
+        index.save(fname, sep_limit=0)
+        index2 = self.indexer.load(fname, mmap='r')
+        self.assertIsNone(index2.model)
+        self.assertEqual(index.most_similar(query, 5), index2.most_similar(query, 5))
+
+        # inserting into a memory-mapped index works too
+        index2.model = kv
+        kv.add('new', query)
+        self.assertEqual(index2.most_similar(query, 1)[0][0], 'new')
+
+
+class TestBatchingQueryServer(unittest.TestCase):
+    def setUp(self):
+        try:
+            import asyncio
+        except ImportError:
+            raise unittest.SkipTest("asyncio is not available")
+        from gensim.similarities.queryserver import BatchingQueryServer
+        self.asyncio = asyncio
+        self.cls = BatchingQueryServer
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def testBatching(self):
+        for num_best in (None, 3):
+            index = similarities.MatrixSimilarity(corpus, num_features=len(dictionary), num_best=num_best)
+            server = self.cls(index, max_batch_size=4, max_delay=0.01, loop=self.loop)
+            futures = [server.submit(document) for document in corpus]
+            results = self.loop.run_until_complete(self.asyncio.gather(*futures))
+            for document, result in zip(corpus, results):
+                if num_best is None:
+                    self.assertTrue(numpy.allclose(index[document], result))
+                else:
+                    self.assertEqual([docno for docno, _ in index[document]], [docno for docno, _ in result])
+            stats = server.stats()
+            self.assertEqual(stats['queries'], len(corpus))
+            self.assertEqual(stats['batches'], 3)  # 4 + 4 full batches, the last one closed by the timer
+            self.assertEqual(stats['batch_size_max'], 4)
+            self.assertEqual(stats['pending'], 0)
+            self.assertTrue(stats['latency_p99'] >= stats['latency_p50'] >= 0.0)
+            server.close()
+
+    def testFailingQuery(self):
+        index = similarities.MatrixSimilarity(corpus, num_features=len(dictionary), num_best=3)
+        server = self.cls(index, max_batch_size=4, max_delay=0.01, loop=self.loop)
+        bad = [(len(dictionary), 1.0)]  # term id out of range
+        futures = [server.submit(document) for document in corpus[:2] + [bad] + corpus[2:3]]
+        results = self.loop.run_until_complete(self.asyncio.gather(*futures, return_exceptions=True))
+        self.assertTrue(isinstance(results[2], Exception))
+        for document, result in zip(corpus[:2] + [None] + corpus[2:3], results):
+            if document is not None:
+                self.assertEqual([docno for docno, _ in index[document]], [docno for docno, _ in result])
+        self.assertEqual(server.stats()['queries'], 4)
+        server.close()
+
+    def testSocket(self):
+        import json
+        import socket
+        import threading
+
+        index = similarities.MatrixSimilarity(corpus, num_features=len(dictionary), num_best=2)
+        server = self.cls(index, max_batch_size=16, max_delay=0.01, loop=self.loop)
+        listener = self.loop.run_until_complete(server.serve('127.0.0.1', 0))
+        thread = threading.Thread(target=self.loop.run_forever)
+        thread.start()
+        try:
+            client = socket.create_connection(listener.sockets[0].getsockname()[:2])
+            requests = [{'id': docno, 'query': document} for docno, document in enumerate(corpus)]
+            requests += [
+                {'id': 'bad', 'query': 'not a document'}, {'id': 'range', 'query': [[len(dictionary), 1.0]]},
+                {'id': 'stats', 'stats': True},
+            ]
+            client.sendall(b''.join(json.dumps(request).encode('utf8') + b'\n' for request in requests))
+            responses = {}
+            reader = client.makefile('rb')
+            while len(responses) < len(requests):
+                response = json.loads(reader.readline().decode('utf8'))
+                responses[response['id']] = response
+            client.close()
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            thread.join()
+        for docno, document in enumerate(corpus):
+            self.assertEqual([[int(i), float(sim)] for i, sim in index[document]], responses[docno]['result'])
+        self.assertIn('error', responses['bad'])
+        self.assertIn('out of range', responses['range']['error'])
+        self.assertIn('queries', responses['stats']['stats'])
+        listener.close()
+        self.loop.run_until_complete(listener.wait_closed())
+        server.close()
+
+
+class TestShardServer(unittest.TestCase):
+    def setUp(self):
+        from gensim.similarities import shardserver
+        self.shardserver = shardserver
+        self.index = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))
+        self.shards = [
+            similarities.MatrixSimilarity(corpus[:4], num_features=len(dictionary)),
+            similarities.MatrixSimilarity(corpus[4:], num_features=len(dictionary)),
+        ]
+
+    def assertCoordinator(self, coordinator):
+        self.assertEqual(len(coordinator), len(corpus))
+        for num_best in (None, 3):
+            coordinator.num_best = self.index.num_best = num_best
+            for query in (corpus[0], corpus, numpy.asarray(self.index.index[:2])):
+                expected, result = self.index[query], coordinator[query]
+                if num_best is None:
+                    numpy.testing.assert_allclose(result, expected, atol=1e-6)
+                else:
+                    if isinstance(query, numpy.ndarray) or query is corpus:
+                        expected, result = list(itertools.chain(*expected)), list(itertools.chain(*result))
+                    self.assertEqual([docno for docno, _ in result], [docno for docno, _ in expected])
+                    numpy.testing.assert_allclose([sim for _, sim in result], [sim for _, sim in expected], atol=1e-6)
+            expected, result = list(self.index), list(coordinator)
+            self.assertEqual(len(result), len(expected))
+            for sims, expected_sims in zip(result, expected):
+                if num_best is None:
+                    numpy.testing.assert_allclose(sims, expected_sims, atol=1e-6)
+                else:
+                    self.assertEqual([docno for docno, _ in sims], [docno for docno, _ in expected_sims])
+
+    def testMessages(self):
+        import socket
+
+        left, right = socket.socketpair()
+        arrays = [numpy.arange(12, dtype=numpy.float32).reshape(3, 4), numpy.zeros(0, dtype=numpy.int64),
+                  numpy.array([True, False])]
+        self.shardserver.send_message(left, {'op': 'test'}, arrays)
+        header, received = self.shardserver.recv_message(right)
+        self.assertEqual(header, {'op': 'test'})
+        for array, copy in zip(arrays, received):
+            self.assertEqual(array.dtype, copy.dtype)
+            numpy.testing.assert_array_equal(array, copy)
+        left.close()
+        self.assertRaises(EOFError, self.shardserver.recv_message, right)
+        right.close()
+
+    def testThreadWorkers(self):
+        workers = [self.shardserver.ShardWorker(shard).start() for shard in self.shards]
+        coordinator = self.shardserver.ShardCoordinator([worker.address for worker in workers], chunksize=3)
+        try:
+            self.assertCoordinator(coordinator)
+            self.assertRaises(RuntimeError, coordinator.broadcast, {'op': 'unknown'})
+
+            # a broken connection drops the replies queued on the other ones, instead of reading them later
+            import socket
+            left, right = socket.socketpair()
+            right.close()
+            replaced, coordinator.connections[1] = coordinator.connections[1], left
+            replaced.close()
+            self.assertRaises(socket.error, coordinator.__getitem__, corpus[0])
+            self.assertIsNone(coordinator.connections)
+            self.assertCoordinator(coordinator)
+        finally:
+            coordinator.close()
+            for worker in workers:
+                worker.close()
+
+        # sharded indexes as workers
+        shards = [
+            similarities.Similarity(None, corpus[:4], num_features=len(dictionary), shardsize=3),
+            similarities.Similarity(None, corpus[4:], num_features=len(dictionary), shardsize=3),
+        ]
+        workers = [self.shardserver.ShardWorker(shard).start() for shard in shards]
+        coordinator = self.shardserver.ShardCoordinator([worker.address for worker in workers])
+        try:
+            self.assertCoordinator(coordinator)
+
+            # deleted documents keep their position when iterating, with no similarities
+            shards[0].delete([1])
+            shards[1].delete([2])
+            deleted = [1, 6]
+            coordinator.num_best = self.index.num_best = None
+            expected = self.index[corpus]
+            expected[:, deleted] = 0.0
+            expected[deleted] = 0.0
+            numpy.testing.assert_allclose(numpy.array(list(coordinator)), expected, atol=1e-6)
+            coordinator.num_best = 3
+            self.assertEqual([len(sims) for sims in coordinator][1], 0)
+            self.assertEqual([len(sims) for sims in coordinator][6], 0)
+        finally:
+            coordinator.close()
+            for worker, shard in zip(workers, shards):
+                worker.close()
+                shard.destroy()
+
+    def testProcessWorkers(self):
+        fnames = [get_tmpfile('gensim_shardserver%i.tst' % i) for i in range(len(self.shards))]
+        for shard, fname in zip(self.shards, fnames):
+            shard.save(fname)
+        processes, addresses = self.shardserver.spawn_workers(fnames)
+        try:
+            coordinator = self.shardserver.ShardCoordinator(addresses)
+            self.assertCoordinator(coordinator)
+            coordinator.shutdown_workers()
+            for process in processes:
+                process.join(10)
+                self.assertFalse(process.is_alive())
+        finally:
+            for process in processes:
+                process.terminate()
+
+
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
     unittest.main()
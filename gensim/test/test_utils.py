@@ -12,6 +12,7 @@ import logging
 import unittest
 
 import numpy as np
+import scipy.sparse
 from six import iteritems
 
 from gensim import utils
@@ -238,6 +239,37 @@ class TestWindowing(unittest.TestCase):
         self.assertEqual(utils.flatten(not_nested), expected)
 
 
+class TestQueryResultCache(unittest.TestCase):
+    def test_make_key(self):
+        key = utils.QueryResultCache.make_key([(3, 1.0), (1, 0.5)], 10)
+        self.assertEqual(key, utils.QueryResultCache.make_key([(1, 0.5), (3, 1)], 10))
+        self.assertNotEqual(key, utils.QueryResultCache.make_key([(1, 0.5), (3, 1.0)], 5))
+        self.assertNotEqual(key, utils.QueryResultCache.make_key([(1, 0.5), (3, 2.0)], 10))
+
+        dense = np.array([0.0, 0.5, 0.0, 1.0])
+        self.assertEqual(
+            utils.QueryResultCache.make_key(dense.astype(np.float32)), utils.QueryResultCache.make_key(dense)
+        )
+        self.assertIsNotNone(utils.QueryResultCache.make_key(scipy.sparse.csr_matrix(dense)))
+
+        # corpora and matrices are not cached
+        self.assertIsNone(utils.QueryResultCache.make_key([[(1, 0.5)], [(3, 1.0)]]))
+        self.assertIsNone(utils.QueryResultCache.make_key(np.eye(3)))
+        self.assertIsNone(utils.QueryResultCache.make_key(iter([[(1, 0.5)]])))
+
+    def test_max_bytes(self):
+        cache = utils.QueryResultCache(max_entries=100, max_bytes=1000)
+        cache.put('a', np.zeros(50))
+        cache.put('b', np.zeros(50))
+        self.assertIsNotNone(cache.get('a'))
+        cache.put('c', np.zeros(50))  # evicts 'b', the least recently used
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.stats()['bytes'], 800)
+        cache.put('d', np.zeros(1000))  # larger than the whole cache, not cached
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(len(cache), 2)
+
+
 class TestSaveAsLineSentence(unittest.TestCase):
     def test_save_as_line_sentence_en(self):
         corpus_file = get_tmpfile('gensim_utils.tst')
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for the count-min sketch of word frequencies.
+"""
+
+import logging
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gensim import utils
+from gensim.models.vocab_sketch import CountMinSketch, hash_words
+from gensim.test.utils import datapath, get_tmpfile
+
+
+def lee_words():
+    with open(datapath('lee_background.cor')) as f:
+        return [word for line in f for word in utils.simple_preprocess(line)]
+
+
+class TestHashWords(unittest.TestCase):
+    def testDeterministic(self):
+        words = [u'graph', u'', u'caf\xe9', u'ab', u'ba']
+        hashes = hash_words(words)
+        self.assertEqual(hashes.dtype, np.uint64)
+        self.assertEqual(len(set(hashes.tolist())), len(words))
+        # the same words hash the same, as bytes, alone, or among words that contain the NUL separator
+        self.assertTrue(np.array_equal(hash_words([word.encode('utf8') for word in words]), hashes))
+        self.assertTrue(np.array_equal(hash_words(words[2:3]), hashes[2:3]))
+        self.assertTrue(np.array_equal(hash_words(words + [u'a\0b'])[:-1], hashes))
+        self.assertNotEqual(hash_words([u'a\0b'])[0], hash_words([u'ab'])[0])
+        self.assertFalse(np.array_equal(hash_words(words, seed=1), hashes))
+        self.assertEqual(len(hash_words([])), 0)
+
+    def testLongWords(self):
+        # words longer than the blocks of bytes hashed at once hash the same alone or among other words
+        words = [u'a' * 100000, u'', u'b', u'c' * 70000, u'ab' * 40000]
+        hashes = hash_words(words)
+        self.assertEqual(len(set(hashes.tolist())), len(words))
+        for i, word in enumerate(words):
+            self.assertEqual(hash_words([word])[0], hashes[i])
+
+
+class TestCountMinSketch(unittest.TestCase):
+    def setUp(self):
+        self.words = lee_words()
+        self.counts = Counter(self.words)
+
+    def testEstimate(self):
+        sketch = CountMinSketch(width=1024, depth=4)
+        sketch.update(self.words)
+        self.assertEqual(sketch.total, len(self.words))
+        words = list(self.counts)
+        estimates = sketch.estimate(words)
+        errors = estimates - np.array([self.counts[word] for word in words])
+        self.assertTrue((errors >= 0).all())
+        # the bound is probabilistic: most words stay within it
+        self.assertGreater(np.mean(errors <= sketch.error_bound), sketch.confidence - 0.05)
+        self.assertEqual(sketch['the'], estimates[words.index('the')])
+
+    def testExactWhenWide(self):
+        sketch = CountMinSketch(width=2 ** 20, depth=4)
+        sketch.update(self.counts.keys(), counts=list(self.counts.values()))
+        words = list(self.counts)
+        self.assertEqual(sketch.estimate(words).tolist(), [self.counts[word] for word in words])
+
+    def testMerge(self):
+        half = len(self.words) // 2
+        sketch = CountMinSketch(width=1000, depth=3)
+        sketch.update(self.words)
+        part1, part2 = CountMinSketch(width=1000, depth=3), CountMinSketch(width=1000, depth=3)
+        part1.update(self.words[:half])
+        part2.update(self.words[half:])
+        merged = part1.merge(part2)
+        self.assertEqual(merged.total, sketch.total)
+        self.assertTrue(np.array_equal(merged.table, sketch.table))
+        self.assertRaises(ValueError, sketch.merge, CountMinSketch(width=1000, depth=3, seed=2))
+        self.assertRaises(ValueError, sketch.merge, CountMinSketch(width=999, depth=3))
+
+    def testBatches(self):
+        # small batches update only the counters they touch, large ones the whole table: the counts are the same
+        sketch = CountMinSketch(width=1000, depth=3)
+        sketch.update(self.words)
+        batched = CountMinSketch(width=1000, depth=3)
+        for start in range(0, len(self.words), 500):
+            batched.update(self.words[start:start + 500])
+        self.assertEqual(batched.total, sketch.total)
+        self.assertTrue(np.array_equal(batched.table, sketch.table))
+        batched = CountMinSketch(width=1000, depth=3)
+        words = list(self.counts)
+        for start in range(0, len(words), 500):
+            batched.update(words[start:start + 500], counts=[self.counts[word] for word in words[start:start + 500]])
+        self.assertTrue(np.array_equal(batched.table, sketch.table))
+
+    def testFromError(self):
+        sketch = CountMinSketch.from_error(0.001, delta=0.01)
+        self.assertEqual((sketch.width, sketch.depth), (2719, 5))
+        sketch.update(self.words)
+        self.assertAlmostEqual(sketch.error_bound, np.e * len(self.words) / 2719)
+        self.assertRaises(ValueError, CountMinSketch.from_error, 0)
+
+    def testPersistence(self):
+        fname = get_tmpfile('gensim_vocab_sketch.tst')
+        sketch = CountMinSketch(width=100, depth=2, seed=3)
+        sketch.update(self.words)
+        sketch.save(fname)
+        loaded = CountMinSketch.load(fname)
+        self.assertTrue(np.array_equal(loaded.table, sketch.table))
+        self.assertEqual(loaded.estimate(['the']), sketch.estimate(['the']))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
@@ -20,6 +20,7 @@ import numpy as np
 
 from gensim import utils
 from gensim.models import word2vec, keyedvectors
+from gensim.models.vocab_sketch import CountMinSketch
 from gensim.test.utils import datapath, get_tmpfile, temporary_file, common_texts as sentences
 from testfixtures import log_capture
 
@@ -146,6 +147,76 @@ class TestWord2VecModel(unittest.TestCase):
         total_words = model.vocabulary.scan_vocab(sentences)[0]
         self.assertEqual(total_words, 29)
 
+    def testBuildVocabSketch(self):
+        """Test that a vocabulary scan with a count-min sketch gives the same vocabulary as the exact scan"""
+        def keep_human(word, count, min_count):
+            return utils.RULE_KEEP if word == 'human' else utils.RULE_DEFAULT
+
+        for trim_rule in (None, keep_human):
+            model = word2vec.Word2Vec(size=10, min_count=3, sample=0)
+            model.build_vocab(list_corpus, trim_rule=trim_rule, keep_raw_vocab=True)
+            # a small sketch, so that many words share counters
+            model_sketch = word2vec.Word2Vec(size=10, min_count=3, sample=0)
+            model_sketch.build_vocab(
+                list_corpus, trim_rule=trim_rule, keep_raw_vocab=True, sketch=CountMinSketch(width=4096, depth=2))
+            self.assertEqual(model_sketch.corpus_count, model.corpus_count)
+            self.assertEqual(model_sketch.corpus_total_words, model.corpus_total_words)
+            self.assertEqual(model_sketch.wv.index2word, model.wv.index2word)
+            for word, vocab in model.wv.vocab.items():
+                self.assertEqual(model_sketch.wv.vocab[word].count, vocab.count)
+            # only the candidates were counted, exactly
+            raw_vocab = model_sketch.vocabulary.raw_vocab
+            self.assertLess(len(raw_vocab), len(model.vocabulary.raw_vocab))
+            for word, count in raw_vocab.items():
+                self.assertEqual(count, model.vocabulary.raw_vocab[word])
+
+            # rarer words were not counted, lower thresholds cannot be applied
+            reports = []
+            for sketch in (None, CountMinSketch(width=4096, depth=2)):
+                vocabulary, wv = word2vec.Word2VecVocab(min_count=3), keyedvectors.Word2VecKeyedVectors(10)
+                vocabulary.scan_vocab(list_corpus, trim_rule=trim_rule, sketch=sketch)
+                reports.append(vocabulary.prepare_vocab(0, 5, wv, min_count=4, dry_run=True, trim_rule=trim_rule))
+            self.assertEqual(reports[1]['num_retained_words'], reports[0]['num_retained_words'])
+            self.assertRaises(ValueError, vocabulary.prepare_vocab, 0, 5, wv, min_count=2, dry_run=True)
+
+        # the corpus is read twice, a generator would be empty the second time
+        model = word2vec.Word2Vec(size=10, min_count=3)
+        sketch = CountMinSketch(width=4096, depth=2)
+        self.assertRaises(TypeError, model.build_vocab, (sentence for sentence in list_corpus), sketch=sketch)
+        self.assertRaises(TypeError, model.build_vocab, iter(list_corpus), sketch=sketch)
+
+    @unittest.skipIf(os.name == 'nt', "scanning with worker processes is not supported on Windows")
+    def testBuildVocabWorkers(self):
+        """Test that scanning the shards of a corpus in parallel gives the same vocabulary as a serial scan"""
+        def assert_same_vocab(model, expected):
+            self.assertEqual(model.corpus_count, expected.corpus_count)
+            self.assertEqual(model.corpus_total_words, expected.corpus_total_words)
+            self.assertEqual(model.wv.index2word, expected.wv.index2word)
+            self.assertEqual(
+                [model.wv.vocab[word].count for word in model.wv.index2word],
+                [expected.wv.vocab[word].count for word in expected.wv.index2word]
+            )
+
+        corpus = word2vec.PathLineSentences(datapath('PathLineSentences'))
+        model = word2vec.Word2Vec(size=10, min_count=1)
+        model.build_vocab(corpus)
+        model_workers = word2vec.Word2Vec(size=10, min_count=1)
+        model_workers.build_vocab(corpus, workers=2)
+        assert_same_vocab(model_workers, model)
+
+        # unpicklable trim rules and shards are fine, as are more workers than shards
+        shards = [list_corpus[:100], list_corpus[100:101], list_corpus[101:], []]
+        corpus = word2vec.ShardedSentences(shards)
+        self.assertEqual(list(corpus), list_corpus)
+        trim_rule = lambda word, count, min_count: utils.RULE_DISCARD if word == 'the' else utils.RULE_DEFAULT  # noqa
+        model = word2vec.Word2Vec(size=10, min_count=2)
+        model.build_vocab(list_corpus, trim_rule=trim_rule)
+        self.assertNotIn('the', model.wv.vocab)
+        for sketch in (None, CountMinSketch(width=4096, depth=2)):
+            model_workers = word2vec.Word2Vec(size=10, min_count=2)
+            model_workers.build_vocab(corpus, trim_rule=trim_rule, workers=5, sketch=sketch)
+            assert_same_vocab(model_workers, model)
+
     def testMaxFinalVocab(self):
         # Test for less restricting effect of max_final_vocab
         # max_final_vocab is specified but has no effect
@@ -567,6 +638,52 @@ class TestWord2VecModel(unittest.TestCase):
             sims2 = [(w, sim) for w, sim in sims2 if w != 'graph']  # ignore 'graph' itself
             self.assertEqual(sims, sims2)
 
+    @unittest.skipIf(os.name == 'nt' and six.PY2, "CythonLineSentence is not supported on Windows + Py27")
+    def testTrainingFromIndexedFile(self):
+        """Test word2vec training on a pre-indexed corpus_file gives the same vectors as on the text file."""
+        corpus_file = datapath('lee_background.cor')
+        for sg in (0, 1):
+            model = word2vec.Word2Vec(size=10, min_count=2, sg=sg, iter=2, workers=1, seed=42)
+            model.build_vocab(corpus_file=corpus_file)
+            indexed_model = word2vec.Word2Vec(size=10, min_count=2, sg=sg, iter=2, workers=1, seed=42)
+            indexed_model.build_vocab(corpus_file=corpus_file)
+
+            with temporary_file(get_tmpfile('gensim_word2vec.ids')) as tf:
+                word2vec.IndexedCorpusFile.build(corpus_file, indexed_model.wv, tf)
+                model.train(corpus_file=corpus_file, total_words=model.corpus_total_words, epochs=model.epochs)
+                indexed_model.train(
+                    corpus_file=tf, total_words=indexed_model.corpus_total_words, epochs=indexed_model.epochs
+                )
+            self.assertTrue(np.allclose(model.wv.vectors, indexed_model.wv.vectors))
+            self.assertTrue(np.allclose(model.trainables.syn1neg, indexed_model.trainables.syn1neg))
+
+    def testIndexedCorpusFile(self):
+        """Test building and reading a pre-indexed corpus."""
+        model = word2vec.Word2Vec(min_count=2)
+        model.build_vocab(sentences)
+        corpus = sentences + [[]]
+
+        with temporary_file(get_tmpfile('gensim_word2vec.ids')) as tf:
+            self.assertFalse(word2vec.IndexedCorpusFile.is_indexed(datapath('lee_background.cor')))
+            indexed = word2vec.IndexedCorpusFile.build(corpus, model.wv, tf)
+            self.assertTrue(word2vec.IndexedCorpusFile.is_indexed(tf))
+            self.assertEqual(len(indexed), len(corpus))
+            self.assertEqual(indexed.total_words, sum(len(sentence) for sentence in corpus))
+            expected = [[model.wv.vocab[word].index if word in model.wv.vocab else -1 for word in sentence]
+                        for sentence in corpus]
+            self.assertEqual([list(ids) for ids in indexed], expected)
+
+            # workers start at sentence boundaries, in order
+            offsets = indexed.worker_offsets(3)
+            self.assertEqual(offsets[0], 0)
+            self.assertEqual(offsets, sorted(offsets))
+
+            # the ids are meaningless for another vocabulary
+            indexed.check_vocab(model.wv)
+            model.build_vocab([['new', 'words']] * 2, update=True)
+            self.assertRaises(ValueError, indexed.check_vocab, model.wv)
+            del indexed
+
     def testScoring(self):
         """Test word2vec scoring."""
         model = word2vec.Word2Vec(sentences, size=2, min_count=1, hs=1, negative=0)
@@ -633,7 +750,7 @@ class TestWord2VecModel(unittest.TestCase):
             self.assertTrue(0.1 < spearman < 1.0)
             self.assertTrue(0.0 <= oov < 90.0)
 
-    def model_sanity(self, model, train=True, with_corpus_file=False):
+    def model_sanity(self, model, train=True, with_corpus_file=False, processes=False):
         """Even tiny models trained on LeeCorpus should pass these sanity checks"""
         # run extra before/after training tests if train=True
         if train:
@@ -643,9 +760,11 @@ class TestWord2VecModel(unittest.TestCase):
             if with_corpus_file:
                 tmpfile = get_tmpfile('gensim_word2vec.tst')
                 utils.save_as_line_sentence(list_corpus, tmpfile)
-                model.train(corpus_file=tmpfile, total_words=model.corpus_total_words, epochs=model.epochs)
+                model.train(
+                    corpus_file=tmpfile, total_words=model.corpus_total_words, epochs=model.epochs, processes=processes
+                )
             else:
-                model.train(list_corpus, total_examples=model.corpus_count, epochs=model.epochs)
+                model.train(list_corpus, total_examples=model.corpus_count, epochs=model.epochs, processes=processes)
             self.assertFalse((orig0 == model.wv.vectors[1]).all())  # vector should vary after training
         sims = model.wv.most_similar('war', topn=len(model.wv.index2word))
         t_rank = [word for word, score in sims].index('terrorism')
@@ -666,6 +785,37 @@ class TestWord2VecModel(unittest.TestCase):
         model = word2vec.Word2Vec(sg=1, window=4, hs=1, negative=0, min_count=5, iter=10, workers=2)
         self.model_sanity(model, with_corpus_file=True)
 
+    @unittest.skipIf(os.name == 'nt', "training with worker processes is not supported on Windows")
+    def test_sg_neg_processes(self):
+        """Test skipgram w/ negative sampling, trained by worker processes"""
+        model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, iter=10, workers=2)
+        self.model_sanity(model, processes=True)
+
+    @unittest.skipIf(os.name == 'nt', "training with worker processes is not supported on Windows")
+    def test_processes_killed_worker(self):
+        """Test that training with worker processes fails instead of hanging when a worker gets killed"""
+        import signal
+
+        class KilledWorkerWord2Vec(word2vec.Word2Vec):
+            def _worker_loop_slice(self, data_iterable, worker_id, *args, **kwargs):
+                if worker_id == 0:
+                    os.kill(os.getpid(), signal.SIGKILL)
+                return super(KilledWorkerWord2Vec, self)._worker_loop_slice(data_iterable, worker_id, *args, **kwargs)
+
+        model = KilledWorkerWord2Vec(sentences, min_count=1, workers=2)
+        self.assertRaises(
+            RuntimeError, model.train, sentences, total_examples=model.corpus_count, epochs=1, processes=True
+        )
+
+    @unittest.skipIf(os.name == 'nt', "training with worker processes is not supported on Windows")
+    def test_cbow_hs_processes_fromfile(self):
+        """Test CBOW w/ hierarchical softmax, trained by worker processes on a corpus file"""
+        model = word2vec.Word2Vec(
+            sg=0, cbow_mean=1, alpha=0.05, window=8, hs=1, negative=0,
+            min_count=5, iter=10, workers=2, batch_words=1000
+        )
+        self.model_sanity(model, with_corpus_file=True, processes=True)
+
     def test_sg_neg(self):
         """Test skipgram w/ negative sampling"""
         model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, iter=10, workers=2)
@@ -676,6 +826,48 @@ class TestWord2VecModel(unittest.TestCase):
         model = word2vec.Word2Vec(sg=1, window=4, hs=0, negative=15, min_count=5, iter=10, workers=2)
         self.model_sanity(model, with_corpus_file=True)
 
+    def test_sg_neg_shared_negatives(self):
+        """Test skipgram w/ negative sampling, with negative words shared by each window"""
+        model = word2vec.Word2Vec(
+            sg=1, window=4, hs=0, negative=15, min_count=5, iter=10, workers=2, shared_negatives=True)
+        self.model_sanity(model)
+        model.train(list_corpus, total_examples=model.corpus_count, epochs=1, compute_loss=True)
+        self.assertGreater(model.get_latest_training_loss(), 0)
+
+    @unittest.skipIf(os.name == 'nt' and six.PY2, "CythonLineSentence is not supported on Windows + Py27")
+    def test_sg_neg_shared_negatives_fromfile(self):
+        model = word2vec.Word2Vec(
+            sg=1, window=4, hs=0, negative=15, min_count=5, iter=10, workers=2, shared_negatives=True)
+        self.model_sanity(model, with_corpus_file=True)
+
+    def test_train_sg_window(self):
+        """Test the pure Python window update, with a context word repeated in the window"""
+        model = word2vec.Word2Vec(sentences, size=10, sg=1, hs=0, negative=5, min_count=1, iter=1, seed=42)
+        context = model.wv.vocab['human'].index
+        # only precomputed for pure Python training, when the C extension is not compiled
+        model.neg_labels = np.zeros(model.negative + 1)
+        model.neg_labels[0] = 1.
+
+        def update(context_indices):
+            vectors, syn1neg = model.wv.vectors.copy(), model.trainables.syn1neg.copy()
+            model.random = np.random.RandomState(1)
+            neu1e = word2vec.train_sg_window(model, 'graph', context_indices, 0.1)
+            delta = model.wv.vectors[context] - vectors[context], model.trainables.syn1neg - syn1neg
+            model.wv.vectors[:], model.trainables.syn1neg[:] = vectors, syn1neg
+            return neu1e, delta
+
+        neu1e, (vector_delta, syn1neg_delta) = update([context])
+        neu1e_twice, (vector_delta_twice, syn1neg_delta_twice) = update([context, context])
+        self.assertEqual(neu1e_twice.shape, (2, 10))
+        self.assertTrue(np.allclose(vector_delta_twice, 2 * vector_delta))
+        self.assertTrue(np.allclose(syn1neg_delta_twice, 2 * syn1neg_delta))
+        self.assertEqual(word2vec.train_sg_window(model, 'graph', [], 0.1).shape, (0, 10))
+        self.assertEqual(word2vec.train_sg_window(model, 'absent', [context], 0.1).shape, (0, 10))
+
+    def test_shared_negatives_requires_sgns(self):
+        for params in ({'sg': 0}, {'sg': 1, 'hs': 1}, {'sg': 1, 'negative': 0, 'hs': 1}):
+            self.assertRaises(ValueError, word2vec.Word2Vec, shared_negatives=True, **params)
+
     def test_cbow_hs(self):
         """Test CBOW w/ hierarchical softmax"""
         model = word2vec.Word2Vec(
@@ -1113,6 +1305,15 @@ class TestWord2VecSentenceIterators(unittest.TestCase):
             for words in sentences:
                 self.assertEqual(words, utils.to_unicode(orig.readline()).split())
 
+    def testPathLineSentencesFileList(self):
+        """Does PathLineSentences work with a list of files, and are its shards the files?"""
+        input_files = [os.path.join(datapath('PathLineSentences'), name) for name in ('2.txt.bz2', '1.txt')]
+        sentences = word2vec.PathLineSentences(input_files)
+        self.assertEqual(sentences.input_files, input_files)
+        shards = [list(word2vec.LineSentence(name)) for name in input_files]
+        self.assertEqual([list(shard) for shard in sentences.shards], shards)
+        self.assertEqual(list(sentences), shards[0] + shards[1])
+
 
 # endclass TestWord2VecSentenceIterators
 
@@ -34,6 +34,8 @@ import sys
 import subprocess
 import inspect
 import heapq
+import hashlib
+import threading
 
 import numpy as np
 import numbers
@@ -1059,6 +1061,189 @@ class SlicedCorpus(SaveLoad):
         return self.length
 
 
+class QueryResultCache(object):
+    """Least-recently-used cache of similarity query results, see
+    :meth:`~gensim.interfaces.SimilarityABC.enable_cache`.
+
+    Queries are keyed by a hash of their canonical form: the (sorted) ids and weights of their non-zero entries,
+    whether the query came as a bag-of-words document, a dense vector or a sparse vector, plus any parameters of
+    the index that affect the result (such as `num_best`). Only single documents are cached, corpora and matrices
+    are always evaluated in full.
+
+    The cache holds at most `max_entries` results, of at most `max_bytes` in total; the least recently used results
+    are evicted first. The cached results are never pickled, a loaded cache starts out empty.
+
+    """
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 ** 2):
+        """
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of cached results.
+        max_bytes : int, optional
+            Maximum (estimated) total size of the cached results, in bytes.
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.clear()
+
+    def __getstate__(self):
+        return {'max_entries': self.max_entries, 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        """Drop all cached results and reset the counters."""
+        self.entries = collections.OrderedDict()  # key => (result, size in bytes), least recently used first
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def invalidate(self):
+        """Drop all cached results, e.g. because the index changed. The counters are kept."""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    @staticmethod
+    def make_key(query, *params):
+        """Get the cache key of a query.
+
+        Parameters
+        ----------
+        query : {list of (int, number), :class:`numpy.ndarray`, :class:`scipy.sparse.spmatrix`}
+            Query document.
+        *params
+            Hashable parameters of the index that affect the result.
+
+        Returns
+        -------
+        {tuple, None}
+            Key of the query, or None if the query is not a single document and should not be cached.
+
+        """
+        if isinstance(query, np.ndarray):
+            if query.ndim != 1:
+                return None
+            kind = 'dense'
+            ids = np.flatnonzero(query)
+            weights = query[ids]
+        elif scipy.sparse.issparse(query):
+            if query.shape[0] != 1:
+                return None
+            kind = 'sparse'
+            query = query.tocsr()
+            query.sum_duplicates()  # also sorts the indices
+            ids, weights = query.indices, query.data
+        elif isinstance(query, (list, tuple)) and query:
+            kind = 'bow'
+            try:
+                if not all(len(entry) == 2 and isinstance(entry[0], (numbers.Integral, np.integer)) for entry in query):
+                    return None  # not a bag-of-words document, probably a corpus
+                ids = np.array([entry[0] for entry in query], dtype=np.int64)
+                weights = np.array([entry[1] for entry in query], dtype=np.float64)
+            except (TypeError, ValueError):
+                return None
+            order = np.argsort(ids, kind='mergesort')  # stable, for documents with repeated ids
+            ids, weights = ids[order], weights[order]
+        else:
+            return None
+        digest = hashlib.sha1(np.asarray(ids, dtype=np.int64).tobytes())
+        digest.update(np.asarray(weights, dtype=np.float64).tobytes())
+        return (kind, query.shape if kind != 'bow' else None, digest.digest()) + params
+
+    @staticmethod
+    def copy_result(result):
+        """Copy a query result, so that changes to it by the caller don't reach the cache."""
+        if isinstance(result, list):
+            return list(result)
+        if hasattr(result, 'copy'):
+            return result.copy()
+        return result
+
+    @staticmethod
+    def result_size(result):
+        """Get the (estimated) size of a query result in bytes."""
+        if isinstance(result, np.ndarray):
+            return result.nbytes
+        if scipy.sparse.issparse(result):
+            result = result.tocsr()
+            return result.data.nbytes + result.indices.nbytes + result.indptr.nbytes
+        return sys.getsizeof(result) + 100 * len(result)  # a tuple of an int and a float is ~100 bytes
+
+    def get(self, key):
+        """Get the cached result of a query, marking it as the most recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the query, see :meth:`~gensim.utils.QueryResultCache.make_key`.
+
+        Returns
+        -------
+        object
+            Copy of the cached result, or None if the query is not cached.
+
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries[key] = entry
+            self.hits += 1
+        return self.copy_result(entry[0])
+
+    def put(self, key, result):
+        """Cache the result of a query, evicting the least recently used results if the cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            Key of the query, see :meth:`~gensim.utils.QueryResultCache.make_key`.
+        result : object
+            Result of the query.
+
+        """
+        size = self.result_size(result)
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+        result = self.copy_result(result)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            while self.entries and (len(self.entries) >= self.max_entries or self.nbytes + size > self.max_bytes):
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+            self.entries[key] = (result, size)
+            self.nbytes += size
+
+    def stats(self):
+        """Get the cache statistics.
+
+        Returns
+        -------
+        dict
+            Number of cache `hits`, `misses` and `evictions` so far, and the current number of `entries` and
+            their total size in `bytes`.
+
+        """
+        return {
+            'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'entries': len(self.entries), 'bytes': self.nbytes,
+        }
+
+
 def safe_unichr(intval):
     """Create a unicode character from its integer value. In case `unichr` fails, render the character
     as an escaped `\\U<8-byte hex value of intval>` string.